@@ -33,6 +33,41 @@ const CONFIG_METADATA: Record<string, {
     description: "Number of parallel worker processes for tagging (0 = auto-detect)",
     type: "text",
   },
+  fused_head_inference: {
+    label: "Fused Head Inference",
+    description: "Run all heads of a backbone as one ONNX graph (identical results, lower CPU overhead; applies after worker restart)",
+    type: "boolean",
+  },
+  model_warmup_workers: {
+    label: "Model Warm-up Threads",
+    description: "ONNX model sessions built in parallel when a worker warms its models (0 = auto; applies after worker restart)",
+    type: "number",
+  },
+  cpu_thread_autotune: {
+    label: "CPU Thread Auto-tuning",
+    description: "Benchmark ONNX thread counts once per host and backbone on CPU-only hosts (applies after worker restart)",
+    type: "boolean",
+  },
+  store_backbone_embeddings: {
+    label: "Store Backbone Embeddings",
+    description: "Keep per-segment embeddings on disk so new or updated heads skip audio decode and backbones (about 1 MB per track and backbone; applies after restart)",
+    type: "boolean",
+  },
+  streaming_decode: {
+    label: "Streaming Decode",
+    description: "Decode audio in blocks and start inference before decoding finishes; bounds memory for long tracks (applies after restart)",
+    type: "boolean",
+  },
+  tag_write_workers: {
+    label: "Tag Write Workers",
+    description: "Number of files written concurrently when writing tags to disk (1-32)",
+    type: "number",
+  },
+  tag_write_per_device: {
+    label: "Tag Writes per Disk",
+    description: "Maximum concurrent tag writes on one storage device (1 for spinning disks, higher for SSD/NVMe)",
+    type: "number",
+  },
   calibrate_heads: {
     label: "Auto-Calibrate Heads",
     description: "Automatically calibrate tag thresholds for optimal results",
@@ -48,9 +48,11 @@ export async function getMoodDistribution(
  * Get tag correlations matrix.
  */
 export async function getTagCorrelations(
-  topN = 20
+  topN = 20,
+  libraryId?: string
 ): Promise<Record<string, unknown>> {
-  return get(`/api/web/analytics/tag-correlations?top_n=${topN}`);
+  const library = libraryId ? `&library_id=${encodeURIComponent(libraryId)}` : "";
+  return get(`/api/web/analytics/tag-correlations?top_n=${topN}${library}`);
 }
 
 export interface CoOccurrence {
@@ -191,9 +191,20 @@ export async function reconcileTags(
   return post(`/api/web/libraries/${libraryId}/reconcile-tags`);
 }
 
+export interface ReconcileProgress {
+  completed: number;
+  failed: number;
+  in_flight: number;
+  buffered: number;
+  elapsed_ms: number;
+  files_per_s: number;
+  per_device_completed: Record<string, number>;
+}
+
 export interface ReconcileStatusResult {
   pending_count: number;
   in_progress: boolean;
+  progress?: ReconcileProgress | null;
 }
 
 /**
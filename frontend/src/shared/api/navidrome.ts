@@ -290,11 +290,14 @@ export interface SyncSongsResponse {
   play_edges_upserted: number;
   orphans_removed: number;
   duration_ms: number;
+  albums_fetched: number;
+  albums_unchanged: number;
 }
 
 /**
- * Trigger a full Navidrome song sync to graph collections.
+ * Trigger a Navidrome song sync to graph collections.
+ * Only albums changed since the last sync are fetched unless `full` is set.
  */
-export async function syncNavidromeSongs(): Promise<SyncSongsResponse> {
-  return post<SyncSongsResponse>("/api/web/navidrome/sync-songs");
+export async function syncNavidromeSongs(full = false): Promise<SyncSongsResponse> {
+  return post<SyncSongsResponse>(`/api/web/navidrome/sync-songs${full ? "?full=true" : ""}`);
 }
\ No newline at end of file
@@ -44,6 +44,15 @@ export interface PlaylistMetadataResponse {
   source_url: string;
 }
 
+export interface PlaylistMatchTimingsResponse {
+  index_ms: number;
+  exact_ms: number;
+  fuzzy_ms: number;
+  total_ms: number;
+  fuzzy_tracks: number;
+  scored_pairs: number;
+}
+
 export interface ConvertPlaylistResponse {
   playlist_metadata: PlaylistMetadataResponse;
   m3u_content: string;
@@ -57,6 +66,7 @@ export interface ConvertPlaylistResponse {
   unmatched_tracks: PlaylistTrackInputResponse[];
   ambiguous_matches: MatchResultResponse[];
   all_matches: MatchResultResponse[];
+  match_timings: PlaylistMatchTimingsResponse | null;
 }
 
 // Helper to convert backend status to UI tier
@@ -7,37 +7,200 @@ are owned and initialized by the Application instance.
 Architecture:
 - Application owns: config, db, queue, services, workers, coordinator, event broker, health monitor
 - All configuration values are instance attributes (no module-level config globals)
-- Services are registered via register_service() during start()
+- Services are registered via register_service() / register_factory() during start()
 - Access services via: application.get_service("name") or application.services["name"]
 - Do NOT construct services directly outside of this class
 
+Roles (``role`` config key, ``NOMARR_ROLE``):
+- ``all`` (default): API plus processing — worker system, file watchers, GPU monitor
+- ``api``: web UI/API only; nothing processing-related is imported or started
+
+Only what the role needs at startup is built in start(). Every other service is
+registered as a factory and built on first lookup, with its module imports, so
+a role never pays for services it does not use. A StartupProfiler records
+import and construction time per service (``application.profiler``).
+
 The singleton instance is available as `application` at module level.
 """
 
 from __future__ import annotations
 
+import importlib
 import logging
 import os
 import sys
 import threading
 import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from nomarr.persistence.db import Database
-from nomarr.services.domain.analytics_svc import AnalyticsService
-from nomarr.services.domain.calibration_svc import CalibrationService
-from nomarr.services.domain.library_svc import LibraryService, LibraryServiceConfig
-from nomarr.services.domain.navidrome_svc import NavidromeService
-from nomarr.services.domain.playlist_import_svc import PlaylistImportService
-from nomarr.services.domain.tagging_svc import TaggingService, TaggingServiceConfig
 from nomarr.services.infrastructure.config_svc import ConfigService
-from nomarr.services.infrastructure.health_monitor_svc import HealthMonitorService
-from nomarr.services.infrastructure.keys_svc import KeyManagementService
-from nomarr.services.infrastructure.worker_system_svc import WorkerSystemService
+
+if TYPE_CHECKING:
+    from nomarr.services.infrastructure.health_monitor_svc import HealthMonitorService
+    from nomarr.services.infrastructure.worker_system_svc import WorkerSystemService
 
 logger = logging.getLogger(__name__)
 
+ROLE_ALL = "all"
+ROLE_API = "api"
+ROLES = (ROLE_ALL, ROLE_API)
+
+
+@dataclass
+class ServiceTiming:
+    """Import and construction time of one service, in milliseconds."""
+
+    name: str
+    import_ms: float
+    build_ms: float
+    lazy: bool  # Built on first use after start() rather than during it
+
+    @property
+    def total_ms(self) -> float:
+        return self.import_ms + self.build_ms
+
+
+class StartupProfiler:
+    """Records how long bootstrap steps and service construction take.
+
+    Import time is what importing a service's modules added (modules already
+    imported by an earlier service count there); construction time is the
+    factory call itself.
+    """
+
+    def __init__(self) -> None:
+        self._created = time.perf_counter()
+        self._lock = threading.Lock()
+        self.steps: dict[str, float] = {}
+        self.services: list[ServiceTiming] = []
+        self.ready_ms: float | None = None
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Time a bootstrap step (database connection, migrations, ...)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.steps[name] = (time.perf_counter() - started) * 1000
+
+    def build(self, name: str, modules: Sequence[str], factory: Callable[[], Any]) -> Any:
+        """Import *modules*, call *factory*, and record both durations."""
+        started = time.perf_counter()
+        for module in modules:
+            importlib.import_module(module)
+        imported = time.perf_counter()
+        service = factory()
+        built = time.perf_counter()
+        timing = ServiceTiming(
+            name=name,
+            import_ms=(imported - started) * 1000,
+            build_ms=(built - imported) * 1000,
+            lazy=self.ready_ms is not None,
+        )
+        with self._lock:
+            self.services.append(timing)
+        if timing.lazy:
+            logger.debug(
+                "[Application] Built %s on first use in %.0fms (imports %.0fms)",
+                name,
+                timing.total_ms,
+                timing.import_ms,
+            )
+        return service
+
+    def mark_ready(self) -> None:
+        """Record the time from construction of the profiler to a started application."""
+        self.ready_ms = (time.perf_counter() - self._created) * 1000
+
+    def report(self) -> str:
+        """Human-readable table of steps and services, slowest first."""
+        with self._lock:
+            steps = sorted(self.steps.items(), key=lambda item: item[1], reverse=True)
+            services = sorted(self.services, key=lambda t: t.total_ms, reverse=True)
+        lines = [f"Startup: {self.ready_ms:.0f}ms" if self.ready_ms is not None else "Startup: in progress"]
+        lines.extend(f"  step     {name:<24} {ms:8.1f}ms" for name, ms in steps)
+        lines.extend(
+            f"  service  {t.name:<24} {t.total_ms:8.1f}ms  (import {t.import_ms:.1f}ms, build {t.build_ms:.1f}ms)"
+            + ("  [lazy]" if t.lazy else "")
+            for t in services
+        )
+        return "\n".join(lines)
+
+
+class ServiceRegistry(Mapping[str, Any]):
+    """Service container whose factories run on first lookup.
+
+    Behaves like the plain dict it replaces: ``services["x"]`` and
+    ``services.get("x")`` return the service (building it if needed), ``in``
+    tests registration. Use :meth:`is_built` to check without building.
+    """
+
+    def __init__(self, profiler: StartupProfiler) -> None:
+        self._profiler = profiler
+        self._services: dict[str, Any] = {}
+        self._factories: dict[str, tuple[tuple[str, ...], Callable[[], Any]]] = {}
+        # Reentrant: factories look up the services they depend on
+        self._lock = threading.RLock()
+
+    def register(self, name: str, service: Any) -> None:
+        """Register an already built service."""
+        with self._lock:
+            self._services[name] = service
+            self._factories.pop(name, None)
+
+    def register_factory(self, name: str, factory: Callable[[], Any], modules: Sequence[str] = ()) -> None:
+        """Register a service to build on first lookup.
+
+        Args:
+            name: Service name for lookup
+            factory: Builds the service; imports what it needs locally
+            modules: Modules the factory imports, timed separately by the profiler
+
+        """
+        with self._lock:
+            self._factories[name] = (tuple(modules), factory)
+
+    def is_built(self, name: str) -> bool:
+        """Whether *name* has been built (never triggers a build)."""
+        return name in self._services
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._services:
+            return self._services[name]
+        with self._lock:
+            if name not in self._services:
+                modules, factory = self._factories[name]
+                self._services[name] = self._profiler.build(name, modules, factory)
+                del self._factories[name]
+            return self._services[name]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Service *name* (built if needed), or *default* if not registered.
+
+        Unlike ``Mapping.get``, errors raised while building propagate.
+        """
+        if name not in self:
+            return default
+        return self[name]
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter([*self._services, *self._factories])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._services) + len(self._factories)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._services or name in self._factories
+
 
 def validate_environment() -> None:
     """Validate required environment variables at startup.
@@ -67,7 +230,7 @@ class Application:
     Architecture:
     - Application owns all dependencies as instance attributes
     - All config-derived values are computed in __init__
-    - Services are registered via register_service() during start()
+    - Services are registered via register_service() / register_factory() during start()
     - Access services via: application.get_service("name") or application.services["name"]
     - Do NOT construct services directly outside of this class
 
@@ -80,14 +243,20 @@ class Application:
     The singleton instance is available as `application` at module level.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, role: str | None = None) -> None:
         """Initialize application with core dependencies.
 
         Loads configuration and creates database and queue immediately.
         Services are initialized later during start().
+
+        Args:
+            role: Overrides the ``role`` config key (``all`` or ``api``)
+
         """
+        self.profiler = StartupProfiler()
         validate_environment()
-        config_service = ConfigService()
+        with self.profiler.step("config"):
+            config_service = ConfigService()
         from nomarr.services.infrastructure.config_svc import (
             INTERNAL_HOST,
             INTERNAL_LIBRARY_SCAN_POLL_INTERVAL,
@@ -98,10 +267,15 @@ class Application:
             INTERNAL_WORKER_ENABLED,
         )
 
+        self.role: str = role or str(config_service.get("role") or ROLE_ALL)
+        if self.role not in ROLES:
+            msg = f"Unknown role '{self.role}', expected one of {', '.join(ROLES)}"
+            raise ValueError(msg)
         # Static snapshots — infrastructure values that cannot change at runtime
         self.db_path: str = str(config_service.get("db_path"))
         self.library_root: str | None = config_service.get("library_root")
         self.models_dir: str = str(config_service.get("models_dir", "/app/models"))
+        self.cache_dir: str = str(config_service.get("cache_dir", "/app/config/cache"))
         self.library_auto_tag: bool = bool(config_service.get("library_auto_tag", False))
         self.library_ignore_patterns: str = str(config_service.get("library_ignore_patterns", ""))
         self.admin_password_config: str | None = config_service.get("admin_password")
@@ -114,15 +288,12 @@ class Application:
         self.version_tag_key: str = INTERNAL_VERSION_TAG
         from nomarr.components.ml.onnx.ml_discovery_comp import compute_model_suite_hash
 
-        self.tagger_version: str = compute_model_suite_hash(self.models_dir)
+        with self.profiler.step("model_suite_hash"):
+            self.tagger_version: str = compute_model_suite_hash(self.models_dir)
         logger.debug(f"[Application] Model suite hash (tagger_version): {self.tagger_version}")
-        self._ensure_database_provisioned()
-        self.db = Database()
-        from nomarr.workflows.platform.prepare_database_wf import prepare_database_workflow
-
-        prepare_database_workflow(self.db, models_dir=self.models_dir)
+        self.db = self._connect_database()
         self._config_service = config_service
-        self.services: dict[str, Any] = {}
+        self.services = ServiceRegistry(self.profiler)
         self.worker_system: WorkerSystemService | None = None
         self.health_monitor: HealthMonitorService | None = None
         self._heartbeat_thread: threading.Thread | None = None
@@ -130,6 +301,18 @@ class Application:
         self.admin_password: str | None = None
         self._running = False
 
+    def _connect_database(self) -> Database:
+        """Provision (first run), connect, and migrate the database."""
+        with self.profiler.step("database_provision"):
+            self._ensure_database_provisioned()
+        with self.profiler.step("database_connect"):
+            db = Database()
+        from nomarr.workflows.platform.prepare_database_wf import prepare_database_workflow
+
+        with self.profiler.step("database_prepare"):
+            prepare_database_workflow(db, models_dir=self.models_dir)
+        return db
+
     def register_service(self, name: str, service: Any) -> None:
         """Register a service in the DI container.
 
@@ -138,7 +321,11 @@ class Application:
             service: Service instance
 
         """
-        self.services[name] = service
+        self.services.register(name, service)
+
+    def register_factory(self, name: str, factory: Callable[[], Any], modules: Sequence[str] = ()) -> None:
+        """Register a service built on first lookup (see ServiceRegistry.register_factory)."""
+        self.services.register_factory(name, factory, modules)
 
     def get_service(self, name: str) -> Any:
         """Get a service from the DI container.
@@ -212,110 +399,292 @@ class Application:
         logger.debug("[Application] App heartbeat started")
 
     def start(self) -> None:
-        """Start the application - initialize all services, workers, and background tasks.
+        """Start the application - initialize services, workers, and background tasks.
 
         This method:
-        1. Cleans up orphaned jobs and stuck scans from previous sessions
-        2. Initializes authentication (API keys, passwords, sessions)
-        3. Registers all services in self.services (DI container)
-        4. Starts workers, coordinator, health monitor, and event broker
-        5. Performs ML cache warmup
-
-        All dependencies are injected via constructors using instance attributes.
-        Services are registered via register_service() for access by interfaces.
+        1. Cleans up ephemeral runtime state from previous sessions
+        2. Registers all services in self.services (DI container)
+        3. Initializes authentication (API keys, passwords, sessions)
+        4. Starts the health monitor and change counters
+        5. In the ``all`` role: starts file watchers, workers and the GPU monitor
+
+        Only services the role needs now are built here; the rest are built by
+        their first lookup. All dependencies are injected via constructors using
+        instance attributes.
         """
         if self._running:
             logger.warning("[Application] Already running, ignoring start() call")
             return
-        logger.debug("[Application] Starting...")
+        logger.debug("[Application] Starting (role=%s)...", self.role)
         logger.debug("[Application] Cleaning ephemeral runtime state...")
         self.db.health.clean_all()
         self.db.health.mark_starting(component_id="app", component_type="app")
+        self._register_services()
         logger.debug("[Application] Initializing authentication...")
-        key_service = KeyManagementService(self.db)
+        key_service = self.services["keys"]
         self.api_key = key_service.get_or_create_api_key()
         self.admin_password = key_service.get_or_create_admin_password(self.admin_password_config)
         key_service.load_sessions_from_db()
-        self.register_service("keys", key_service)
-        self.register_service("config", self._config_service)
-        logger.debug("[Application] Initializing services...")
-        from nomarr.services.infrastructure.ml_svc import MLConfig, MLService
-
-        ml_cfg = MLConfig(models_dir=str(self.models_dir))
-        ml_service = MLService(db=self.db, cfg=ml_cfg)
-        self.register_service("ml", ml_service)
-        from nomarr.services.infrastructure.health_monitor_svc import HealthMonitorConfig
-
-        health_cfg = HealthMonitorConfig()
-        self.health_monitor = HealthMonitorService(cfg=health_cfg, db=self.db)
+        self.health_monitor = self.services["health_monitor"]
         self.health_monitor.start()
-        self.register_service("health_monitor", self.health_monitor)
         logger.debug("[Application] HealthMonitorService started")
-        from nomarr.services.infrastructure.background_tasks_svc import BackgroundTaskService
-
-        background_tasks = BackgroundTaskService()
-        self.register_service("background_tasks", background_tasks)
-        logger.debug("[Application] Initializing AnalyticsService...")
-        from nomarr.services.domain.analytics_svc import AnalyticsConfig
-
-        analytics_cfg = AnalyticsConfig(namespace=self.namespace)
-        analytics_service = AnalyticsService(db=self.db, cfg=analytics_cfg)
-        self.register_service("analytics", analytics_service)
-        logger.debug("[Application] Initializing CalibrationService...")
-        from nomarr.services.domain.calibration_svc import CalibrationConfig
-
-        calibration_cfg = CalibrationConfig(models_dir=str(self.models_dir), namespace=self.namespace)
-        calibration_service = CalibrationService(db=self.db, cfg=calibration_cfg, bts=background_tasks)
-        self.register_service("calibration", calibration_service)
-        logger.debug("[Application] Initializing NavidromeService...")
-        from nomarr.services.domain.navidrome_svc import NavidromeConfig
-
-        navidrome_cfg = NavidromeConfig(
-            namespace=self.namespace,
-        )
-        navidrome_service = NavidromeService(db=self.db, cfg=navidrome_cfg, config_service=self._config_service)
-        self.register_service("navidrome", navidrome_service)
-        logger.debug("[Application] Initializing PlaylistImportService...")
-        playlist_import_service = PlaylistImportService(db=self.db, config_service=self._config_service)
-        self.register_service("playlist_import", playlist_import_service)
-        from nomarr.services.infrastructure.info_svc import InfoConfig, InfoService
-
-        info_cfg = InfoConfig(
-            version="1.2",
-            namespace=self.namespace,
-            models_dir=str(self.models_dir),
-            db=self.db,
-            health_monitor=self.health_monitor,
-            db_path=self.db_path,
-            api_host=self.api_host,
-            api_port=self.api_port,
-            worker_enabled_default=self.worker_enabled_default,
-            tagger_worker_count=self._config_service.get_worker_count("tagger"),
-            poll_interval=float(self.worker_poll_interval),
+        self.services["library_changes"].start()
+        if self.role == ROLE_ALL:
+            self._start_processing()
+        else:
+            logger.info("[Application] API role: workers, file watchers and GPU monitor are not started")
+        self._running = True
+        self._start_app_heartbeat()
+        self.db.health.mark_healthy(component_id="app")
+        self.profiler.mark_ready()
+        logger.debug("[Application] Startup profile:\n%s", self.profiler.report())
+
+        # Summary log with key startup info
+        from nomarr.services.infrastructure import keys_svc
+
+        sessions = len(keys_svc._session_cache)
+        worker_count = len(self.worker_system._workers) if self.worker_system and self.worker_system._started else 0
+        logger.info(
+            "[Application] Ready in %.0fms | role %s | %d session(s) | %d worker(s) | GPU monitor: %s",
+            self.profiler.ready_ms,
+            self.role,
+            sessions,
+            worker_count,
+            "enabled" if self.role == ROLE_ALL else "disabled",
         )
-        info_service = InfoService(cfg=info_cfg, workers_coordinator=self.worker_system, ml_service=ml_service)
-        self.register_service("info", info_service)
-        if self.library_root:
-            logger.debug(f"[Application] Registering LibraryService with namespace={self.namespace}")
+        logger.debug("[Application] Started successfully")
+
+    def _register_services(self) -> None:
+        """Register a factory for every service the role can use (nothing is built here).
+
+        Each factory imports its service module locally, so a service that is
+        never looked up costs neither import nor construction time.
+        """
+        db = self.db
+        config_service = self._config_service
+        services = self.services
+        self.register_service("config", config_service)
+
+        def keys() -> Any:
+            from nomarr.services.infrastructure.keys_svc import KeyManagementService
+
+            return KeyManagementService(db)
+
+        def ml() -> Any:
+            from nomarr.services.infrastructure.ml_svc import MLConfig, MLService
+
+            return MLService(db=db, cfg=MLConfig(models_dir=str(self.models_dir)))
+
+        def health_monitor() -> Any:
+            from nomarr.services.infrastructure.health_monitor_svc import HealthMonitorConfig, HealthMonitorService
+
+            return HealthMonitorService(cfg=HealthMonitorConfig(), db=db)
+
+        def background_tasks() -> Any:
+            from nomarr.services.infrastructure.background_tasks_svc import BackgroundTaskService
+
+            return BackgroundTaskService()
+
+        def library_changes() -> Any:
+            from nomarr.services.infrastructure.library_changes_svc import LibraryChangesService
+
+            return LibraryChangesService(db=db)
+
+        def analytics() -> Any:
+            from nomarr.services.domain.analytics_svc import AnalyticsConfig, AnalyticsService
+
+            return AnalyticsService(db=db, cfg=AnalyticsConfig(namespace=self.namespace))
+
+        def calibration() -> Any:
+            from nomarr.services.domain.calibration_svc import CalibrationConfig, CalibrationService
+
+            calibration_cfg = CalibrationConfig(models_dir=str(self.models_dir), namespace=self.namespace)
+            calibration_service = CalibrationService(db=db, cfg=calibration_cfg, bts=services["background_tasks"])
+
+            def apply_calibration() -> None:
+                services["tagging"].start_apply_calibration_background()
+
+            calibration_service.set_post_generation_hook(apply_calibration)
+            logger.debug("[Application] Wired calibration post-generation hook → TaggingService")
+            return calibration_service
+
+        # Shared by navidrome and vector_search
+        def vector_index_cache() -> Any:
+            from nomarr.components.ml.vectors.ml_vector_local_index_comp import LocalVectorIndexCache
+
+            cache = LocalVectorIndexCache(cache_dir=os.path.join(self.cache_dir, "vector_index"))
+            db.add_vector_delete_hook(cache.remove_files)
+            return cache
+
+        def vector_search_params_cache() -> Any:
+            from nomarr.components.ml.vectors.ml_vector_search_params_comp import VectorSearchParamsCache
+
+            return VectorSearchParamsCache()
+
+        def navidrome() -> Any:
+            from nomarr.services.domain.navidrome_svc import NavidromeConfig, NavidromeService
+
+            return NavidromeService(
+                db=db,
+                cfg=NavidromeConfig(namespace=self.namespace),
+                config_service=config_service,
+                vector_index_cache=services["vector_index_cache"],
+                search_params_cache=services["vector_search_params_cache"],
+            )
+
+        def playlist_import() -> Any:
+            from nomarr.services.domain.playlist_import_svc import PlaylistImportService
+
+            return PlaylistImportService(db=db, config_service=config_service)
+
+        def info() -> Any:
+            from nomarr.services.infrastructure.info_svc import InfoConfig, InfoService
+
+            info_cfg = InfoConfig(
+                version="1.2",
+                namespace=self.namespace,
+                models_dir=str(self.models_dir),
+                db=db,
+                health_monitor=services["health_monitor"],
+                db_path=self.db_path,
+                api_host=self.api_host,
+                api_port=self.api_port,
+                worker_enabled_default=self.worker_enabled_default,
+                tagger_worker_count=config_service.get_worker_count("tagger"),
+                poll_interval=float(self.worker_poll_interval),
+            )
+            return InfoService(cfg=info_cfg, workers_coordinator=self.worker_system, ml_service=services["ml"])
+
+        def library() -> Any:
+            from nomarr.services.domain.library_svc import LibraryService, LibraryServiceConfig
+
+            logger.debug(f"[Application] Building LibraryService with namespace={self.namespace}")
             library_cfg = LibraryServiceConfig(
                 models_dir=str(self.models_dir),
                 namespace=self.namespace,
                 tagger_version=self.tagger_version,
-                library_root=self.library_root,
+                library_root=str(self.library_root),
             )
-            library_service = LibraryService(cfg=library_cfg, db=self.db, background_tasks=background_tasks)
-            self.register_service("library", library_service)
-            logger.debug("[Application] Initializing FileWatcherService...")
+            return LibraryService(cfg=library_cfg, db=db, background_tasks=services["background_tasks"])
+
+        def file_watcher() -> Any:
             from nomarr.services.infrastructure.file_watcher_svc import FileWatcherService
 
-            file_watcher = FileWatcherService(db=self.db, library_service=library_service, debounce_seconds=2.0)
-            self.register_service("file_watcher", file_watcher)
+            return FileWatcherService(db=db, library_service=services["library"], debounce_seconds=2.0)
+
+        def metadata() -> Any:
+            from nomarr.services.domain.metadata_svc import MetadataService
+
+            return MetadataService(db=db)
+
+        def tagging() -> Any:
+            from nomarr.services.domain.tagging_svc import TaggingService, TaggingServiceConfig
+
+            return TaggingService(
+                database=db,
+                cfg=TaggingServiceConfig(
+                    models_dir=self.models_dir,
+                    namespace=self.namespace,
+                    version_tag_key=self.version_tag_key,
+                ),
+                bts=services["background_tasks"],
+                config_service=config_service,
+                library_service=services.get("library"),
+            )
+
+        def vector_search() -> Any:
+            from nomarr.services.domain.vector_search_svc import VectorSearchService
+
+            return VectorSearchService(
+                db=db,
+                config_svc=config_service,
+                vector_index_cache=services["vector_index_cache"],
+                search_params_cache=services["vector_search_params_cache"],
+            )
+
+        def vector_maintenance() -> Any:
+            from nomarr.services.domain.vector_maintenance_svc import VectorMaintenanceService
+
+            return VectorMaintenanceService(
+                db=db,
+                models_dir=self.models_dir,
+                config_svc=config_service,
+                search_params_cache=services["vector_search_params_cache"],
+                vector_index_cache=services["vector_index_cache"],
+            )
+
+        def worker_system() -> Any:
+            from nomarr.services.infrastructure.worker_system_svc import WorkerSystemService
+            from nomarr.workflows.processing.reprocess_heads_wf import detect_head_changes_workflow
+
+            processor_config = config_service.make_processor_config()
+            detect_head_changes_workflow(
+                db,
+                str(self.models_dir),
+                reuse_embeddings=processor_config.embedding_store_dir is not None,
+            )
+            return WorkerSystemService(
+                db=db,
+                processor_config=processor_config,
+                health_monitor=services["health_monitor"],
+                worker_count=config_service.get_worker_count("tagger"),
+                default_enabled=self.worker_enabled_default,
+            )
+
+        factories: list[tuple[str, Callable[[], Any], list[str]]] = [
+            ("keys", keys, ["nomarr.services.infrastructure.keys_svc"]),
+            ("ml", ml, ["nomarr.services.infrastructure.ml_svc"]),
+            ("health_monitor", health_monitor, ["nomarr.services.infrastructure.health_monitor_svc"]),
+            ("background_tasks", background_tasks, ["nomarr.services.infrastructure.background_tasks_svc"]),
+            ("library_changes", library_changes, ["nomarr.services.infrastructure.library_changes_svc"]),
+            ("analytics", analytics, ["nomarr.services.domain.analytics_svc"]),
+            ("calibration", calibration, ["nomarr.services.domain.calibration_svc"]),
+            ("vector_index_cache", vector_index_cache, ["nomarr.components.ml.vectors.ml_vector_local_index_comp"]),
+            (
+                "vector_search_params_cache",
+                vector_search_params_cache,
+                ["nomarr.components.ml.vectors.ml_vector_search_params_comp"],
+            ),
+            ("navidrome", navidrome, ["nomarr.services.domain.navidrome_svc"]),
+            ("playlist_import", playlist_import, ["nomarr.services.domain.playlist_import_svc"]),
+            ("info", info, ["nomarr.services.infrastructure.info_svc"]),
+            ("metadata", metadata, ["nomarr.services.domain.metadata_svc"]),
+            ("tagging", tagging, ["nomarr.services.domain.tagging_svc"]),
+            ("vector_search", vector_search, ["nomarr.services.domain.vector_search_svc"]),
+            ("vector_maintenance", vector_maintenance, ["nomarr.services.domain.vector_maintenance_svc"]),
+        ]
+        if self.library_root:
+            factories += [
+                ("library", library, ["nomarr.services.domain.library_svc"]),
+                ("file_watcher", file_watcher, ["nomarr.services.infrastructure.file_watcher_svc"]),
+            ]
+        else:
+            logger.debug("[Application] No library root configured, library service not registered")
+        if self.role == ROLE_ALL:
+            factories.append(
+                (
+                    "worker_system",
+                    worker_system,
+                    [
+                        "nomarr.services.infrastructure.worker_system_svc",
+                        "nomarr.workflows.processing.reprocess_heads_wf",
+                    ],
+                )
+            )
+        for name, factory, modules in factories:
+            self.register_factory(name, factory, modules)
+
+    def _start_processing(self) -> None:
+        """Start what the ``all`` role adds: file watchers, workers and the GPU monitor."""
+        # Built before the worker system, as it always has been
+        info_service = self.services["info"]
+        if "file_watcher" in self.services:
+            logger.debug("[Application] Initializing FileWatcherService...")
+            file_watcher = self.services["file_watcher"]
 
             # Sync watchers in background - observer.start() traverses the entire
             # directory tree to register inotify watches, which blocks for large libraries.
             # Nothing downstream depends on watchers being active at startup.
-            import threading
-
             def _sync_watchers_bg() -> None:
                 try:
                     file_watcher.sync_watchers()
@@ -324,84 +693,25 @@ class Application:
                     logger.exception("[Application] Failed to sync file watchers")
 
             threading.Thread(target=_sync_watchers_bg, name="file-watcher-sync", daemon=True).start()
-        else:
-            logger.debug("[Application] No library root configured, library service not started")
-        from nomarr.services.domain.metadata_svc import MetadataService
-
-        metadata_service = MetadataService(db=self.db)
-        self.register_service("metadata", metadata_service)
-        tagging_service = TaggingService(
-            database=self.db,
-            cfg=TaggingServiceConfig(
-                models_dir=self.models_dir,
-                namespace=self.namespace,
-                version_tag_key=self.version_tag_key,
-            ),
-            bts=background_tasks,
-            config_service=self._config_service,
-            library_service=self.services.get("library"),
-        )
-        self.register_service("tagging", tagging_service)
-        calibration_service.set_post_generation_hook(tagging_service.start_apply_calibration_background)
-        logger.debug(
-            "[Application] Wired calibration post-generation hook → TaggingService.start_apply_calibration_background"
-        )
-        # Vector services (search and maintenance)
-        from nomarr.services.domain.vector_maintenance_svc import VectorMaintenanceService
-        from nomarr.services.domain.vector_search_svc import VectorSearchService
-
-        vector_search_service = VectorSearchService(db=self.db, config_svc=self._config_service)
-        self.register_service("vector_search", vector_search_service)
-
-        vector_maintenance_service = VectorMaintenanceService(
-            db=self.db,
-            models_dir=self.models_dir,
-            config_svc=self._config_service,
-        )
-        self.register_service("vector_maintenance", vector_maintenance_service)
         logger.debug("[Application] Initializing discovery-based worker system...")
-        processor_config = self._config_service.make_processor_config()
-        worker_count = self._config_service.get_worker_count("tagger")
-        self.worker_system = WorkerSystemService(
-            db=self.db,
-            processor_config=processor_config,
-            health_monitor=self.health_monitor,
-            worker_count=worker_count,
-            default_enabled=self.worker_enabled_default,
-        )
-        self.register_service("worker_system", self.worker_system)
+        self.worker_system = self.services["worker_system"]
         if self.worker_system.is_worker_system_enabled():
             self.worker_system.start_all_workers()
         else:
             logger.debug("[Application] Worker system disabled, not starting workers")
         logger.debug("[Application] Starting InfoService (GPU monitor)...")
         info_service.start()
-        self._running = True
-        self._start_app_heartbeat()
-        self.db.health.mark_healthy(component_id="app")
-
-        # Summary log with key startup info
-        from nomarr.services.infrastructure import keys_svc
-
-        sessions = len(keys_svc._session_cache) if "keys" in self.services else 0
-        worker_count = len(self.worker_system._workers) if self.worker_system and self.worker_system._started else 0
-        logger.info(
-            "[Application] Ready | %d session(s) | %d worker(s) | GPU monitor: %s",
-            sessions,
-            worker_count,
-            "enabled" if "info" in self.services else "disabled",
-        )
-        logger.debug("[Application] Started successfully")
 
     def stop(self) -> None:
         """Stop the application - clean shutdown of all services and workers.
 
         This replaces the shutdown logic that was in api_app.py:lifespan().
+        Services that were never built are left alone.
         """
         if not self._running:
             return
         logger.info("[Application] Shutting down...")
-        if "file_watcher" in self.services:
+        if self.services.is_built("file_watcher"):
             logger.info("[Application] Stopping file watchers...")
             file_watcher = self.services["file_watcher"]
             file_watcher.stop_all()
@@ -410,10 +720,12 @@ class Application:
             logger.info("[Application] Stopping worker processes...")
             self.worker_system.stop_all_workers()
             logger.info("[Application] Worker processes stopped")
-        if "info" in self.services:
+        if self.services.is_built("info"):
             logger.info("[Application] Stopping InfoService (GPU monitor)...")
             self.services["info"].stop()
             logger.info("[Application] InfoService stopped")
+        if self.services.is_built("library_changes"):
+            self.services["library_changes"].stop()
         if hasattr(self, "health_monitor") and self.health_monitor:
             logger.info("[Application] Stopping health monitor...")
             self.health_monitor.stop()
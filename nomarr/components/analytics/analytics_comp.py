@@ -21,6 +21,15 @@ import logging
 from collections import Counter, defaultdict
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
+from nomarr.components.analytics.tag_cooccurrence_comp import (
+    TagIncidenceBuilder,
+    co_occurrence_counts,
+    column_occurrences,
+    expand_columns,
+    first_seen_columns,
+)
 from nomarr.helpers.dto.analytics_dto import (
     ArtistTagProfile,
     ComputeArtistTagProfileParams,
@@ -67,6 +76,11 @@ def compute_tag_frequencies(params: ComputeTagFrequenciesParams) -> ComputeTagFr
 def compute_tag_correlation_matrix(params: ComputeTagCorrelationMatrixParams) -> TagCorrelationData:
     """Compute VALUE-based correlation matrix from raw tag data.
 
+    Mood and tier values are encoded into one files x values incidence matrix
+    (``tag_cooccurrence_comp``); mood-mood and mood-tier file counts each come
+    from a single sparse product. Each distinct mood tag value is JSON-decoded
+    once. Ties are ordered as the set-based implementation ordered them.
+
     Args:
         params: Parameters containing namespace, top_n, and tag data
 
@@ -75,64 +89,68 @@ def compute_tag_correlation_matrix(params: ComputeTagCorrelationMatrixParams) ->
 
     """
     logger.info(f"[analytics] Computing VALUE-based correlation matrix (top {params.top_n} moods)")
-    mood_counter: Counter = Counter()
-    for _file_id, tag_value in params.mood_tag_rows:
-        try:
-            moods = json.loads(tag_value)
-            if isinstance(moods, list):
-                for mood in moods:
-                    mood_counter[str(mood).strip()] += 1
-        except json.JSONDecodeError:
-            pass
-    top_moods = [mood for mood, _ in mood_counter.most_common(params.top_n)]
-    if not top_moods:
+    tier_tag_keys = list(dict.fromkeys(params.tier_tag_keys))
+    builder: TagIncidenceBuilder[tuple[str | None, Any]] = TagIncidenceBuilder()
+    builder.add_keyed(None, params.mood_tag_rows)
+    for tier_tag_key in tier_tag_keys:
+        builder.add_keyed(tier_tag_key, params.tier_tag_rows.get(tier_tag_key, []))
+    incidence = expand_columns(builder.build(), _decode_mood_column)
+
+    mood_columns = [pos for pos, (key, _) in enumerate(incidence.columns) if key is None]
+    occurrences = column_occurrences(incidence, columns=mood_columns)
+    # Counter.most_common order: count descending, first-seen breaks ties.
+    ranked = [i for i in np.argsort(-occurrences, kind="stable")[: params.top_n] if occurrences[i] > 0]
+    if not ranked:
         return TagCorrelationData(mood_correlations={}, mood_tier_correlations={})
-    mood_file_sets: dict[str, set[int]] = {mood: set() for mood in top_moods}
-    for file_id, tag_value in params.mood_tag_rows:
-        try:
-            moods = json.loads(tag_value)
-            if isinstance(moods, list):
-                for mood in moods:
-                    mood_str = str(mood).strip()
-                    if mood_str in mood_file_sets:
-                        mood_file_sets[mood_str].add(file_id)
-        except json.JSONDecodeError:
-            pass
+    top_columns = [mood_columns[i] for i in ranked]
+    top_moods = [str(incidence.columns[pos][1]) for pos in top_columns]
+
+    mood_counts = co_occurrence_counts(incidence, left=top_columns)
     mood_correlations: dict[str, dict[str, float]] = {}
-    for mood_a in top_moods:
-        files_a = mood_file_sets[mood_a]
-        if not files_a:
-            continue
-        correlations: dict[str, float] = {}
-        for mood_b in top_moods:
-            if mood_a == mood_b:
-                continue
-            files_b = mood_file_sets[mood_b]
-            intersection = len(files_a & files_b)
-            if files_a:
-                correlations[mood_b] = round(intersection / len(files_a), 3)
+    for a, mood_a in enumerate(top_moods):
+        files_a = int(mood_counts[a, a])
+        correlations = {
+            mood_b: round(int(mood_counts[a, b]) / files_a, 3) for b, mood_b in enumerate(top_moods) if b != a
+        }
         top_correlations = sorted(correlations.items(), key=lambda x: x[1], reverse=True)[:10]
         mood_correlations[mood_a] = dict(top_correlations)
-    mood_tier_correlations: dict[str, dict[str, float]] = {}
-    for mood in top_moods:
-        mood_files = mood_file_sets[mood]
-        if not mood_files:
+
+    tier_labels: dict[int, str] = {}
+    for pos, (column_key, tier_value) in enumerate(incidence.columns):
+        if column_key is None:
             continue
+        tier_name = column_key.replace(f"{params.namespace}:", "").replace("_tier", "").split("_")[-1]
+        tier_labels[pos] = f"{tier_value}_{tier_name}"
+    tier_columns = list(tier_labels)
+    tier_counts = co_occurrence_counts(incidence, left=top_columns, right=tier_columns)
+    mood_tier_correlations: dict[str, dict[str, float]] = {}
+    for a, mood in enumerate(top_moods):
+        files_a = int(mood_counts[a, a])
+        counts = {tier_columns[t]: int(tier_counts[a, t]) for t in np.flatnonzero(tier_counts[a])}
         tier_correlations: dict[str, float] = {}
-        for tier_tag_key in params.tier_tag_keys:
-            tier_name = tier_tag_key.replace(f"{params.namespace}:", "").replace("_tier", "").split("_")[-1]
-            tier_value_counts: Counter = Counter()
-            for file_id, tier_value in params.tier_tag_rows.get(tier_tag_key, []):
-                if file_id in mood_files:
-                    tier_value_counts[tier_value] += 1
-            for tier_value, count in tier_value_counts.items():
-                correlation_key = f"{tier_value}_{tier_name}"
-                tier_correlations[correlation_key] = round(count / len(mood_files), 3)
+        for tier_tag_key in tier_tag_keys:
+            # Insert in the order this mood's files first name each value, as the per-mood Counter did.
+            for pos in first_seen_columns(incidence, tier_tag_key, top_columns[a], columns=counts):
+                tier_correlations[tier_labels[pos]] = round(counts[pos] / files_a, 3)
         top_tiers = sorted(tier_correlations.items(), key=lambda x: x[1], reverse=True)[:10]
         mood_tier_correlations[mood] = dict(top_tiers)
     return TagCorrelationData(mood_correlations=mood_correlations, mood_tier_correlations=mood_tier_correlations)
 
 
+def _decode_mood_column(column: tuple[str | None, Any]) -> list[tuple[str | None, Any]]:
+    """Split a ``(None, json_array)`` mood column into one ``(None, mood)`` per entry; keep tier columns."""
+    key, value = column
+    if key is not None:
+        return [column]
+    try:
+        moods = json.loads(value)
+    except json.JSONDecodeError:
+        return []
+    if not isinstance(moods, list):
+        return []
+    return [(None, str(mood).strip()) for mood in moods]
+
+
 def compute_mood_distribution(mood_rows: Sequence[tuple[str, str]]) -> MoodDistributionData:
     """Compute mood distribution from raw mood tag data.
 
@@ -242,17 +260,15 @@ def compute_tag_co_occurrence(params: ComputeTagCoOccurrenceParams) -> TagCoOccu
 
     """
     logger.info(f"[analytics] Computing tag co-occurrence matrix: {len(params.x_tags)}x{len(params.y_tags)}")
-    matrix: list[list[int]] = []
-    for y_tag in params.y_tags:
-        row: list[int] = []
-        y_key = (y_tag.key, y_tag.value)
-        y_files = params.tag_data.get(y_key, set())
-        for x_tag in params.x_tags:
-            x_key = (x_tag.key, x_tag.value)
-            x_files = params.tag_data.get(x_key, set())
-            intersection_count = len(y_files & x_files)
-            row.append(intersection_count)
-        matrix.append(row)
+    x_keys = [(tag.key, tag.value) for tag in params.x_tags]
+    y_keys = [(tag.key, tag.value) for tag in params.y_tags]
+    tag_keys = list(dict.fromkeys(x_keys + y_keys))
+    builder = TagIncidenceBuilder(columns=tag_keys)
+    for key in tag_keys:
+        builder.add_column(key, params.tag_data.get(key, ()))
+    incidence = builder.build()
+    counts = co_occurrence_counts(incidence, left=incidence.positions(y_keys), right=incidence.positions(x_keys))
+    matrix: list[list[int]] = counts.tolist()
     return TagCoOccurrenceData(x_tags=params.x_tags, y_tags=params.y_tags, matrix=matrix)
 
 
@@ -0,0 +1,187 @@
+"""Analytics rollups - Insights data from incrementally maintained counters.
+
+``collection_overview_comp`` and ``mood_analysis_comp`` read the per-library
+counters kept by ``db.analytics_rollups`` instead of rescanning every file and
+tag edge: one lookup per dashboard section, whatever the library size.
+Libraries whose rollup has not been built yet are built on first read.
+
+:func:`check_rollup_consistency` recomputes the same figures with the
+full-scan tag queries and reports (and optionally repairs) any drift.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from typing import TYPE_CHECKING, Any
+
+from nomarr.helpers.dto.analytics_dto import RollupConsistencyReport
+
+if TYPE_CHECKING:
+    from nomarr.helpers.dto.analytics_dto import LibraryRollup
+    from nomarr.persistence.db import Database
+
+logger = logging.getLogger(__name__)
+
+MOOD_TIERS = ("strict", "regular", "loose")
+
+
+def load_library_rollup(db: Database, library_id: str | None = None) -> LibraryRollup:
+    """Return the rollup for one library (or all), building missing ones first.
+
+    Args:
+        db: Database instance.
+        library_id: Optional library _id; ``None`` sums every library.
+
+    Returns:
+        LibraryRollup with no ``missing_library_ids``.
+    """
+    rollup = db.analytics_rollups.get_rollup(library_id)
+    if not rollup.missing_library_ids:
+        return rollup
+    for missing_id in rollup.missing_library_ids:
+        db.analytics_rollups.rebuild_library(missing_id)
+    return db.analytics_rollups.get_rollup(library_id)
+
+
+def _ranked(counts: dict[Any, int], label: str) -> list[dict[str, Any]]:
+    """``[{label: value, count}]`` sorted by count descending (value breaks ties)."""
+    ordered = sorted(counts.items(), key=lambda item: (-item[1], str(item[0])))
+    return [{label: value, "count": count} for value, count in ordered]
+
+
+def rollup_library_stats(rollup: LibraryRollup) -> dict[str, Any]:
+    """Library stats in the shape of ``db.tags.get_library_stats``."""
+    file_count = rollup.file_count
+    return {
+        "file_count": file_count,
+        "total_duration_ms": math.floor(rollup.total_duration_s * 1000),
+        "total_file_size_bytes": rollup.total_file_size_bytes,
+        "avg_track_length_ms": (rollup.total_duration_s / file_count) * 1000 if file_count > 0 else 0,
+    }
+
+
+def rollup_year_distribution(rollup: LibraryRollup) -> list[dict[str, Any]]:
+    """Year distribution in the shape of ``db.tags.get_year_distribution``."""
+    return _ranked(rollup.year_counts, "year")
+
+
+def rollup_genre_distribution(rollup: LibraryRollup) -> list[dict[str, Any]]:
+    """Genre distribution in the shape of ``db.tags.get_genre_distribution``."""
+    return _ranked(rollup.genre_counts, "genre")
+
+
+def rollup_mood_coverage(rollup: LibraryRollup) -> dict[str, Any]:
+    """Mood coverage in the shape of ``db.tags.get_mood_coverage``."""
+    total_files = rollup.file_count
+    tiers: dict[str, dict[str, Any]] = {}
+    for tier in MOOD_TIERS:
+        tagged = rollup.mood_tagged.get(tier, 0) if total_files > 0 else 0
+        tiers[tier] = {
+            "tagged": tagged,
+            "percentage": round((tagged / total_files) * 100, 1) if total_files > 0 else 0.0,
+        }
+    return {"total_files": total_files, "tiers": tiers}
+
+
+def rollup_mood_balance(rollup: LibraryRollup) -> dict[str, list[dict[str, Any]]]:
+    """Mood balance in the shape of ``db.tags.get_mood_balance``."""
+    return {tier: _ranked(rollup.mood_balance.get(tier, {}), "mood") for tier in MOOD_TIERS}
+
+
+def rollup_top_mood_pairs(rollup: LibraryRollup, mood_tier: str, limit: int) -> list[dict[str, Any]]:
+    """Top mood pairs in the shape of ``db.tags.get_top_mood_pairs``."""
+    pairs = rollup.mood_pairs.get(mood_tier, {})
+    ordered = sorted(pairs.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [{"mood1": mood1, "mood2": mood2, "count": count} for (mood1, mood2), count in ordered]
+
+
+# ----------------------------------------------------------------------
+# Consistency check
+# ----------------------------------------------------------------------
+
+
+def _compare_library(db: Database, library_id: str, rollup: LibraryRollup) -> list[str]:
+    """Names of the sections where *rollup* differs from a full recompute."""
+    mismatches: list[str] = []
+
+    stats = db.tags.get_library_stats(library_id)
+    expected_stats = rollup_library_stats(rollup)
+    if (
+        stats["file_count"] != expected_stats["file_count"]
+        or stats["total_file_size_bytes"] != expected_stats["total_file_size_bytes"]
+        # Durations are float sums; allow the last millisecond to round either way.
+        or abs(stats["total_duration_ms"] - expected_stats["total_duration_ms"]) > 1
+    ):
+        mismatches.append("stats")
+
+    years = {row["year"]: row["count"] for row in db.tags.get_year_distribution(library_id)}
+    if years != rollup.year_counts:
+        mismatches.append("year")
+    genres = {row["genre"]: row["count"] for row in db.tags.get_genre_distribution(library_id, limit=None)}
+    if genres != rollup.genre_counts:
+        mismatches.append("genre")
+
+    coverage = db.tags.get_mood_coverage(library_id)
+    balance = db.tags.get_mood_balance(library_id)
+    for tier in MOOD_TIERS:
+        if coverage["tiers"][tier]["tagged"] != rollup.mood_tagged.get(tier, 0):
+            mismatches.append(f"mood_coverage:{tier}")
+        if {row["mood"]: row["count"] for row in balance.get(tier, [])} != rollup.mood_balance.get(tier, {}):
+            mismatches.append(f"mood_balance:{tier}")
+        expected_pairs = rollup.mood_pairs.get(tier, {})
+        # One row more than the rollup holds reveals pairs the rollup is missing.
+        rows = db.tags.get_top_mood_pairs(library_id, limit=len(expected_pairs) + 1, mood_tier=tier)
+        pairs = {}
+        for row in rows:
+            mood1, mood2 = sorted((str(row["mood1"]), str(row["mood2"])))
+            pairs[(mood1, mood2)] = row["count"]
+        if pairs != expected_pairs:
+            mismatches.append(f"mood_pairs:{tier}")
+    return mismatches
+
+
+def check_rollup_consistency(
+    db: Database,
+    library_id: str | None = None,
+    *,
+    repair: bool = False,
+) -> list[RollupConsistencyReport]:
+    """Compare each library's rollup with a full recompute of the same figures.
+
+    Runs every full-scan Insights query per library, so it is as expensive as
+    the dashboard used to be; intended for admin checks and tests.
+
+    Args:
+        db: Database instance.
+        library_id: Library to check; ``None`` checks every library.
+        repair: Rebuild the rollup of each library that differs (or was
+            never built).
+
+    Returns:
+        One report per checked library.
+    """
+    if library_id is not None:
+        library_ids = [library_id]
+    else:
+        library_ids = [str(lib["_id"]) for lib in db.libraries.list_libraries(enabled_only=False)]
+
+    reports: list[RollupConsistencyReport] = []
+    for lib_id in library_ids:
+        rollup = db.analytics_rollups.get_rollup(lib_id)
+        mismatches = ["missing"] if rollup.missing_library_ids else _compare_library(db, lib_id, rollup)
+        repaired = False
+        if mismatches:
+            logger.warning("[analytics-rollups] Rollup of %s differs from a full recompute: %s", lib_id, mismatches)
+            if repair:
+                db.analytics_rollups.rebuild_library(lib_id)
+                repaired = True
+        reports.append(
+            RollupConsistencyReport(
+                library_id=lib_id,
+                consistent=not mismatches,
+                mismatches=mismatches,
+                repaired=repaired,
+            )
+        )
+    return reports
@@ -4,6 +4,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from nomarr.components.analytics.analytics_rollup_comp import (
+    load_library_rollup,
+    rollup_genre_distribution,
+    rollup_library_stats,
+    rollup_year_distribution,
+)
+
 if TYPE_CHECKING:
     from nomarr.persistence.db import Database
 
@@ -14,6 +21,9 @@ def compute_collection_overview(
 ) -> dict[str, Any]:
     """Get collection overview: library stats, year/genre distributions.
 
+    Read from the library's analytics rollup (a single lookup) rather than
+    a scan of every file and tag edge.
+
     Args:
         db: Database instance.
         library_id: Optional library _id to filter by.
@@ -21,8 +31,9 @@ def compute_collection_overview(
     Returns:
         Dict with: stats, year_distribution, genre_distribution
     """
+    rollup = load_library_rollup(db, library_id)
     return {
-        "stats": db.tags.get_library_stats(library_id),
-        "year_distribution": db.tags.get_year_distribution(library_id),
-        "genre_distribution": db.tags.get_genre_distribution(library_id, limit=None),
+        "stats": rollup_library_stats(rollup),
+        "year_distribution": rollup_year_distribution(rollup),
+        "genre_distribution": rollup_genre_distribution(rollup),
     }
@@ -5,6 +5,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from nomarr.components.analytics.analytics_comp import compute_dominant_vibes
+from nomarr.components.analytics.analytics_rollup_comp import (
+    MOOD_TIERS,
+    load_library_rollup,
+    rollup_mood_balance,
+    rollup_mood_coverage,
+    rollup_top_mood_pairs,
+)
 
 if TYPE_CHECKING:
     from nomarr.persistence.db import Database
@@ -16,6 +23,8 @@ def compute_mood_analysis(
 ) -> dict[str, Any]:
     """Get mood analysis: coverage, balance, top pairs, dominant vibes.
 
+    Every figure comes from the library's analytics rollup (a single lookup).
+
     Args:
         db: Database instance.
         library_id: Optional library _id to filter by.
@@ -23,17 +32,16 @@ def compute_mood_analysis(
     Returns:
         Dict with: coverage, balance, top_pairs_by_tier, dominant_vibes
     """
+    rollup = load_library_rollup(db, library_id)
+
     # Mood coverage (% tagged per tier)
-    coverage = db.tags.get_mood_coverage(library_id)
+    coverage = rollup_mood_coverage(rollup)
 
     # Mood balance (value distribution per tier)
-    balance = db.tags.get_mood_balance(library_id)
+    balance = rollup_mood_balance(rollup)
 
     # Top mood pairs for all three tiers
-    top_pairs_by_tier = {
-        tier: db.tags.get_top_mood_pairs(library_id, mood_tier=tier, limit=50)
-        for tier in ("strict", "regular", "loose")
-    }
+    top_pairs_by_tier = {tier: rollup_top_mood_pairs(rollup, tier, limit=50) for tier in MOOD_TIERS}
 
     # Dominant vibes from balance data
     dominant_vibes = compute_dominant_vibes(balance)
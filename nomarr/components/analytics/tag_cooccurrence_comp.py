@@ -0,0 +1,385 @@
+"""Tag co-occurrence engine - files x tag-values incidence matrix.
+
+PURE LEAF-DOMAIN - operates on in-memory rows only (see ``analytics_comp``).
+
+Tag rows are encoded in one pass into a sparse CSR matrix with one row per
+file and one column per tag value. Every pairwise co-occurrence count is then
+a single sparse product ``B.T @ B`` of the binarised matrix, instead of one
+Python set intersection per pair:
+
+    counts[i, j] = number of files having both column i and column j
+
+The diagonal holds the number of files per column. Columns are any hashable
+label (the ``ColumnT`` type parameter); ``analytics_comp`` uses
+``(tag_key, value)`` tuples.
+
+File ids and labels are factorised with C-level dict lookups
+(``map(dict.setdefault, ...)``) rather than a Python loop per row, which is
+what the build time is made of on large libraries.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
+
+import numpy as np
+from scipy import sparse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+logger = logging.getLogger(__name__)
+
+ColumnT = TypeVar("ColumnT", bound=Hashable)
+ExpandedT = TypeVar("ExpandedT", bound=Hashable)
+LabelT = TypeVar("LabelT", bound=Hashable)
+
+
+@dataclass
+class TagIncidence(Generic[ColumnT]):  # noqa: UP046
+    """Sparse files x tag-values matrix.
+
+    Attributes:
+        matrix: CSR matrix (files x columns); entries count how many input
+            rows named that (file, column) pair.
+        file_ids: File id of each matrix row, in first-seen order.
+        columns: Column label of each matrix column, in first-seen order.
+        column_index: Column label -> column position.
+        segments: ``key -> (rows, columns)`` of each keyed input, in input
+            order; used by :func:`first_seen_columns`.
+    """
+
+    matrix: sparse.csr_matrix
+    file_ids: list[Hashable]
+    columns: list[ColumnT]
+    column_index: dict[ColumnT, int]
+    segments: dict[Hashable, tuple[np.ndarray, np.ndarray]] = field(default_factory=dict)
+
+    def positions(self, labels: Iterable[ColumnT]) -> list[int]:
+        """Column positions of *labels*, skipping labels never seen."""
+        index = self.column_index
+        return [index[label] for label in labels if label in index]
+
+
+def _factorize(labels: Sequence[LabelT]) -> tuple[np.ndarray, dict[LabelT, int]]:  # noqa: UP047
+    """Codes of *labels* plus ``label -> code`` in first-seen order.
+
+    Codes are unique and ascend in first-seen order but are not dense.
+    """
+    index: dict[LabelT, int] = {}
+    codes = np.fromiter(map(index.setdefault, labels, itertools.count()), dtype=np.int64, count=len(labels))
+    return codes, index
+
+
+def _split_pairs(pairs: Sequence[tuple[Hashable, LabelT]]) -> tuple[list[Hashable], list[LabelT]]:  # noqa: UP047
+    # Much faster than zip(*pairs) for millions of rows.
+    return list(map(itemgetter(0), pairs)), list(map(itemgetter(1), pairs))
+
+
+class TagIncidenceBuilder(Generic[ColumnT]):  # noqa: UP046
+    """Accumulates tag rows; :meth:`build` encodes them as a :class:`TagIncidence`."""
+
+    def __init__(self, columns: Iterable[ColumnT] = ()) -> None:
+        """Start an empty incidence.
+
+        Args:
+            columns: Labels to register up front (in this order) so they get a
+                column even when no row names them.
+        """
+        self._file_codes: dict[Hashable, int] = {}
+        self._file_counter = itertools.count()
+        self._column_index: dict[ColumnT, int] = {label: pos for pos, label in enumerate(dict.fromkeys(columns))}
+        self._rows: list[np.ndarray] = []
+        self._cols: list[np.ndarray] = []
+        self._segments: dict[Hashable, list[int]] = {}
+
+    def _file_rows(self, file_ids: Sequence[Hashable]) -> np.ndarray:
+        codes = map(self._file_codes.setdefault, file_ids, self._file_counter)
+        return np.fromiter(codes, dtype=np.int64, count=len(file_ids))
+
+    def _column_codes(self, labels: Sequence[LabelT], label_of: Callable[[LabelT], ColumnT]) -> np.ndarray:
+        codes, local = _factorize(labels)
+        lookup = np.empty(len(labels), dtype=np.int64)
+        index = self._column_index
+        for label, code in local.items():
+            column = label_of(label)
+            position = index.get(column)
+            if position is None:
+                position = index[column] = len(index)
+            lookup[code] = position
+        column_codes: np.ndarray = lookup[codes]
+        return column_codes
+
+    def _append(self, rows: np.ndarray, cols: np.ndarray) -> int:
+        self._rows.append(rows)
+        self._cols.append(cols)
+        return len(self._rows) - 1
+
+    def add_rows(self, rows: Iterable[tuple[Hashable, ColumnT]]) -> None:
+        """Add ``(file_id, column_label)`` rows; repeats are counted."""
+        pairs = list(rows)
+        if not pairs:
+            return
+        file_ids, labels = _split_pairs(pairs)
+        self._append(self._file_rows(file_ids), self._column_codes(labels, lambda label: label))
+
+    def add_keyed(self, key: Hashable, rows: Sequence[tuple[Hashable, Hashable]]) -> None:
+        """Add ``(file_id, value)`` rows as column ``(key, value)``.
+
+        The rows' input order is kept per key for :func:`first_seen_columns`.
+        Builders using it must hold ``(key, value)`` tuple columns.
+        """
+        if not rows:
+            return
+        file_ids, values = _split_pairs(rows)
+        chunk = self._append(
+            self._file_rows(file_ids), self._column_codes(values, lambda value: cast("ColumnT", (key, value)))
+        )
+        self._segments.setdefault(key, []).append(chunk)
+
+    def add_column(self, column: ColumnT, file_ids: Iterable[Hashable]) -> None:
+        """Add one row per file in *file_ids* for a single column."""
+        files = list(file_ids)
+        if not files:
+            return
+        position = self._column_codes([column], lambda label: label)[0]
+        self._append(self._file_rows(files), np.full(len(files), position, dtype=np.int64))
+
+    def build(self) -> TagIncidence[ColumnT]:
+        """Encode every added row as a CSR matrix.
+
+        Returns:
+            TagIncidence over every file added and every column registered or added.
+        """
+        codes = np.concatenate(self._rows) if self._rows else np.zeros(0, dtype=np.int64)
+        cols = np.concatenate(self._cols) if self._cols else np.zeros(0, dtype=np.int64)
+        # File codes ascend in first-seen order, so rank == row.
+        file_code_order, rows = np.unique(codes, return_inverse=True)
+        file_ids = list(self._file_codes)
+        # COO -> CSR sums repeated (row, col) entries.
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(len(file_ids), len(self._column_index)),
+        )
+
+        segments: dict[Hashable, tuple[np.ndarray, np.ndarray]] = {}
+        for key, chunks in self._segments.items():
+            segments[key] = (
+                np.searchsorted(file_code_order, np.concatenate([self._rows[c] for c in chunks])),
+                np.concatenate([self._cols[c] for c in chunks]),
+            )
+
+        return TagIncidence(
+            matrix=matrix,
+            file_ids=file_ids,
+            columns=list(self._column_index),
+            column_index=dict(self._column_index),
+            segments=segments,
+        )
+
+
+def build_tag_incidence(  # noqa: UP047
+    rows: Iterable[tuple[Hashable, ColumnT]],
+    *,
+    columns: Iterable[ColumnT] = (),
+) -> TagIncidence[ColumnT]:
+    """Encode ``(file_id, column)`` rows as a sparse incidence matrix in one pass.
+
+    Args:
+        rows: ``(file_id, column_label)`` pairs; repeats are counted.
+        columns: Labels to register up front (in this order) so they get a
+            column even when no row names them.
+
+    Returns:
+        TagIncidence over every file seen in *rows* and every column seen in
+        *columns* or *rows*.
+    """
+    builder: TagIncidenceBuilder[ColumnT] = TagIncidenceBuilder(columns)
+    builder.add_rows(rows)
+    return builder.build()
+
+
+def expand_columns(  # noqa: UP047
+    incidence: TagIncidence[ColumnT],
+    expand: Callable[[ColumnT], Iterable[ExpandedT]],
+) -> TagIncidence[ExpandedT]:
+    """Replace each column by the labels ``expand(label)`` yields.
+
+    *expand* runs once per distinct column (not per row), so e.g. an encoded
+    multi-value tag is decoded once per distinct value. Counts of columns
+    mapping to the same label add up; the expansion is a single sparse product.
+
+    Args:
+        incidence: Incidence matrix.
+        expand: Column label -> new column labels (repeats count twice).
+
+    Returns:
+        New TagIncidence over the same files; segments survive for keys whose
+        columns each expand to exactly themselves.
+    """
+    new_index: dict[ExpandedT, int] = {}
+    old_positions: list[int] = []
+    new_positions: list[int] = []
+    identity = np.full(len(incidence.columns), -1, dtype=np.int64)
+    for position, label in enumerate(incidence.columns):
+        labels = list(expand(label))
+        for new_label in labels:
+            new_position = new_index.setdefault(new_label, len(new_index))
+            old_positions.append(position)
+            new_positions.append(new_position)
+        if labels == [label]:
+            identity[position] = new_index[labels[0]]
+    expansion = sparse.csr_matrix(
+        (np.ones(len(old_positions), dtype=np.int32), (old_positions, new_positions)),
+        shape=(len(incidence.columns), len(new_index)),
+    )
+    segments = {
+        key: (rows, identity[cols])
+        for key, (rows, cols) in incidence.segments.items()
+        if len(cols) == 0 or identity[cols].min() >= 0
+    }
+    return TagIncidence[ExpandedT](
+        matrix=sparse.csr_matrix(incidence.matrix @ expansion),
+        file_ids=incidence.file_ids,
+        columns=list(new_index),
+        column_index=new_index,
+        segments=segments,
+    )
+
+
+def _select(incidence: TagIncidence[Any], cols: Sequence[int] | None) -> sparse.csr_matrix:
+    matrix = incidence.matrix
+    if cols is not None:
+        matrix = matrix[:, list(cols)]
+    return matrix
+
+
+def _binary(matrix: sparse.csr_matrix) -> sparse.csr_matrix:
+    binary = matrix.copy()
+    binary.data = np.ones_like(binary.data)
+    return binary
+
+
+def column_occurrences(
+    incidence: TagIncidence[Any],
+    *,
+    columns: Sequence[int] | None = None,
+) -> np.ndarray:
+    """Number of input rows per column (repeats included).
+
+    Args:
+        incidence: Incidence matrix.
+        columns: Column positions to return; ``None`` returns all.
+
+    Returns:
+        1-D int array aligned with *columns*.
+    """
+    matrix = _select(incidence, columns)
+    occurrences: np.ndarray = np.asarray(matrix.sum(axis=0), dtype=np.int64).ravel()
+    return occurrences
+
+
+def co_occurrence_counts(
+    incidence: TagIncidence[Any],
+    *,
+    left: Sequence[int] | None = None,
+    right: Sequence[int] | None = None,
+) -> np.ndarray:
+    """Count files having both columns, for every left x right pair.
+
+    One sparse product of the binarised matrix; a file counts once per pair
+    however many rows named it.
+
+    Args:
+        incidence: Incidence matrix.
+        left: Column positions for result rows; ``None`` uses every column.
+        right: Column positions for result columns; ``None`` reuses *left*.
+
+    Returns:
+        Dense int array of shape ``(len(left), len(right))``; for ``right is
+        None`` the diagonal is the number of files per column.
+    """
+    left_matrix = _binary(_select(incidence, left))
+    right_matrix = left_matrix if right is None else _binary(_select(incidence, right))
+    product: np.ndarray = (left_matrix.T @ right_matrix).toarray()
+    return product.astype(np.int64, copy=False)
+
+
+def first_seen_columns(
+    incidence: TagIncidence[Any],
+    key: Hashable,
+    within: int,
+    *,
+    columns: Iterable[int] | None = None,
+) -> list[int]:
+    """Columns of segment *key* in the order the input first names them for the files of column *within*.
+
+    Scans the segment's rows in input order, in growing chunks, and stops as
+    soon as every wanted column has been seen.
+
+    Args:
+        incidence: Incidence matrix.
+        key: Segment key (see :meth:`TagIncidenceBuilder.add_keyed`).
+        within: Column position; only the rows of files having it are considered.
+        columns: Columns to order; ``None`` orders every column found.
+
+    Returns:
+        Column positions in first-seen order.
+    """
+    segment = incidence.segments.get(key)
+    if segment is None:
+        return []
+    segment_rows, segment_cols = segment
+    rows = np.zeros(len(incidence.file_ids), dtype=bool)
+    rows[incidence.matrix[:, within].nonzero()[0]] = True
+    wanted = None if columns is None else set(columns)
+    order: list[int] = []
+    seen: set[int] = set()
+    start, chunk = 0, 1024
+    while start < len(segment_rows) and (wanted is None or len(seen) < len(wanted)):
+        stop = start + chunk
+        hits = segment_cols[start:stop][rows[segment_rows[start:stop]]]
+        found, first = np.unique(hits, return_index=True)
+        for column in found[np.argsort(first, kind="stable")].tolist():
+            if column not in seen and (wanted is None or column in wanted):
+                seen.add(column)
+                order.append(column)
+        start, chunk = stop, chunk * 2
+    return order
+
+
+def top_k_pairs(
+    counts: np.ndarray,
+    k: int,
+    *,
+    labels: Sequence[Hashable] | None = None,
+) -> list[tuple[Hashable, Hashable, int]]:
+    """Top *k* distinct column pairs of a symmetric co-occurrence matrix.
+
+    Args:
+        counts: Square matrix from :func:`co_occurrence_counts`.
+        k: Maximum pairs to return.
+        labels: Labels for the matrix axes; positions are returned when omitted.
+
+    Returns:
+        ``(label_a, label_b, count)`` with ``a`` before ``b`` in column order,
+        sorted by count descending then position; zero counts are dropped.
+    """
+    size = counts.shape[0]
+    if k <= 0 or size < 2:
+        return []
+    upper_rows, upper_cols = np.triu_indices(size, k=1)
+    values = counts[upper_rows, upper_cols]
+    candidates = np.flatnonzero(values > 0)
+    if len(candidates) > k:
+        # Partition on (-count) first, then order the survivors stably.
+        kth = np.partition(-values[candidates], k - 1)[k - 1]
+        candidates = candidates[-values[candidates] <= kth]
+    ordered = candidates[np.argsort(-values[candidates], kind="stable")][:k]
+    names = labels if labels is not None else range(size)
+    return [(names[upper_rows[i]], names[upper_cols[i]], int(values[i])) for i in ordered]
@@ -212,6 +212,7 @@ def bootstrap_file_state_edges(
 
         if bootstrap["type"] == "ml_tagged":
             db.file_states.set_tagged(file_id)
+            db.file_states.set_heads_current(file_id)
             count += 1
     return count
 
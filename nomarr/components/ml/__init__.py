@@ -1,30 +1,62 @@
-"""Ml package."""
+"""Ml package.
 
-from .audio.ml_audio_comp import (
-    AudioLoadCrashError,
-    AudioLoadShutdownError,
-    load_audio_mono,
-    set_stop_event,
-    should_skip_short,
-    shutdown_audio_loader,
-)
-from .calibration.ml_calibration_comp import apply_minmax_calibration, save_calibration_sidecars
-from .onnx.ml_discovery_comp import compute_model_suite_hash
-from .resources.ml_capacity_probe_comp import (
-    CapacityEstimate,
-    compute_model_set_hash,
-    get_or_run_capacity_probe,
-    invalidate_capacity_estimate,
-)
-from .resources.ml_tier_selection_comp import (
-    ExecutionTier,
-    TierConfig,
-    TierSelection,
-    select_execution_tier,
-)
-from .resources.ml_vram_probe_comp import (
-    parse_oom_requested_bytes,
-    update_model_vram_from_oom,
+Exports are resolved lazily (see ``lazy_exports``).
+"""
+
+from typing import TYPE_CHECKING
+
+from nomarr.helpers.lazy_exports_helper import lazy_exports
+
+if TYPE_CHECKING:
+    from .audio.ml_audio_comp import (
+        AudioLoadCrashError,
+        AudioLoadShutdownError,
+        load_audio_mono,
+        set_stop_event,
+        should_skip_short,
+        shutdown_audio_loader,
+    )
+    from .calibration.ml_calibration_comp import apply_minmax_calibration, save_calibration_sidecars
+    from .onnx.ml_discovery_comp import compute_model_suite_hash
+    from .resources.ml_capacity_probe_comp import (
+        CapacityEstimate,
+        compute_model_set_hash,
+        get_or_run_capacity_probe,
+        invalidate_capacity_estimate,
+    )
+    from .resources.ml_tier_selection_comp import (
+        ExecutionTier,
+        TierConfig,
+        TierSelection,
+        select_execution_tier,
+    )
+    from .resources.ml_vram_probe_comp import (
+        parse_oom_requested_bytes,
+        update_model_vram_from_oom,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".audio.ml_audio_comp": [
+            "AudioLoadCrashError",
+            "AudioLoadShutdownError",
+            "load_audio_mono",
+            "set_stop_event",
+            "should_skip_short",
+            "shutdown_audio_loader",
+        ],
+        ".calibration.ml_calibration_comp": ["apply_minmax_calibration", "save_calibration_sidecars"],
+        ".onnx.ml_discovery_comp": ["compute_model_suite_hash"],
+        ".resources.ml_capacity_probe_comp": [
+            "CapacityEstimate",
+            "compute_model_set_hash",
+            "get_or_run_capacity_probe",
+            "invalidate_capacity_estimate",
+        ],
+        ".resources.ml_tier_selection_comp": ["ExecutionTier", "TierConfig", "TierSelection", "select_execution_tier"],
+        ".resources.ml_vram_probe_comp": ["parse_oom_requested_bytes", "update_model_vram_from_oom"],
+    },
 )
 
 __all__ = [
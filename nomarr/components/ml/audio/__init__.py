@@ -3,17 +3,21 @@
 from .ml_audio_comp import (
     AudioLoadCrashError,
     AudioLoadShutdownError,
+    AudioStreamUnavailableError,
     load_audio_mono,
     set_stop_event,
     should_skip_short,
     shutdown_audio_loader,
+    stream_audio_mono,
 )
 
 __all__ = [
     "AudioLoadCrashError",
     "AudioLoadShutdownError",
+    "AudioStreamUnavailableError",
     "load_audio_mono",
     "set_stop_event",
     "should_skip_short",
     "shutdown_audio_loader",
+    "stream_audio_mono",
 ]
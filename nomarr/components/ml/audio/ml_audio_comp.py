@@ -1,8 +1,20 @@
-"""Audio validation and loading for ML processing."""
+"""Audio validation and loading for ML processing.
+
+Two decode paths:
+
+- :func:`load_audio_mono` decodes the whole file with essentia's MonoLoader.
+- :func:`stream_audio_mono` yields fixed-size resampled mono blocks from an
+  ``ffmpeg`` subprocess, so preprocessing can start before decoding finishes
+  and peak memory does not grow with track length.  ffmpeg's resampler is
+  not libsamplerate, so samples differ slightly from MonoLoader's.
+"""
 
 from __future__ import annotations
 
 import logging
+import shutil
+import subprocess
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -26,6 +38,14 @@ class AudioLoadShutdownError(Exception):
     """Audio load aborted due to worker shutdown."""
 
 
+class AudioStreamUnavailableError(Exception):
+    """Streaming decode is not possible here (no ``ffmpeg`` executable)."""
+
+
+STREAM_BLOCK_S = 5.0
+"""Seconds of audio per block yielded by :func:`stream_audio_mono`."""
+
+
 # Module-level stop event for shutdown-aware audio loading.
 # Set by the worker at startup via set_stop_event().
 _stop_event: Any = None
@@ -96,6 +116,74 @@ def load_audio_mono(path: LibraryPath | str, target_sr: int = 16000) -> LoadAudi
         raise AudioLoadCrashError(f"Failed to decode audio: {path_str}") from exc
 
 
+def stream_audio_mono(
+    path: LibraryPath | str,
+    target_sr: int = 16000,
+    block_s: float = STREAM_BLOCK_S,
+) -> Iterator[np.ndarray]:
+    """Decode an audio file as consecutive mono float32 blocks at target_sr.
+
+    ffmpeg decodes, downmixes and resamples in a subprocess while the caller
+    consumes blocks, so decoding overlaps downstream work.  Every block holds
+    ``block_s`` seconds of samples except the last.
+
+    Args:
+        path: LibraryPath (validated) or str (absolute path, validation bypassed).
+        target_sr: Target sample rate in Hz.
+        block_s: Seconds of audio per block.
+
+    Yields:
+        1-D float32 arrays in [-1, 1].
+
+    Raises:
+        ValueError: If LibraryPath is invalid.
+        AudioStreamUnavailableError: If no ``ffmpeg`` executable is found.
+        AudioLoadShutdownError: If shutdown is requested while decoding.
+        AudioLoadCrashError: If ffmpeg fails or decodes no samples.
+    """
+    if isinstance(path, str):
+        path_str = path
+    else:
+        if not path.is_valid():
+            msg = f"Cannot load audio from invalid path ({path.status}): {path.absolute} - {path.reason}"
+            raise ValueError(msg)
+        path_str = str(path.absolute)
+
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise AudioStreamUnavailableError("ffmpeg executable not found")
+    if _stop_event is not None and _stop_event.is_set():
+        raise AudioLoadShutdownError("Shutdown requested before audio load")
+
+    cmd = [ffmpeg, "-nostdin", "-v", "error", "-i", path_str, "-map", "0:a:0"]
+    cmd += ["-ac", "1", "-ar", str(int(target_sr)), "-f", "f32le", "-"]
+    block_bytes = max(1, int(block_s * target_sr)) * 4
+    # stderr is discarded: a damaged file can log an error per frame and a
+    # full stderr pipe would block ffmpeg; the exit code is enough here.
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    assert proc.stdout is not None
+    total = 0
+    try:
+        while True:
+            if _stop_event is not None and _stop_event.is_set():
+                raise AudioLoadShutdownError("Shutdown requested during audio decode")
+            data = proc.stdout.read(block_bytes)
+            usable = len(data) - len(data) % 4
+            if usable:
+                total += usable // 4
+                yield np.frombuffer(data[:usable], dtype=np.float32)
+            if len(data) < block_bytes:
+                break
+        if proc.wait() != 0 or total == 0:
+            msg = f"Failed to decode audio: {path_str} (ffmpeg exit code {proc.returncode}, {total} samples)"
+            raise AudioLoadCrashError(msg)
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+
+
 def should_skip_short(duration_s: float, min_duration_s: int, allow_short: bool) -> bool:
     """Check if audio file should be skipped due to insufficient duration.
 
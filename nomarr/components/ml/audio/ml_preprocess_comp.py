@@ -13,11 +13,16 @@ TensorflowInputVGGish.cpp upstream source:
   yamnet   SR=16000  n_mels=64  n_fft=400  hop=160  patch=96f   hop_patches=96   (VGGish-style, non-overlapping)
 
 All backbones expect float32 input; output shapes are [n_patches, patch_frames, n_mels].
+
+:class:`StreamingPatchExtractor` produces the same patches incrementally from
+consecutive waveform blocks (streaming decode), keeping only the samples and
+mel frames that later patches still need.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import NamedTuple
 
 import numpy as np
@@ -147,22 +152,12 @@ def get_params(backbone: str) -> BackbonePreprocessParams:
         raise ValueError(msg) from None
 
 
-def compute_log_mel(
-    waveform: np.ndarray,
-    params: BackbonePreprocessParams,
-) -> np.ndarray:
-    """Compute a log-mel spectrogram from a mono float32 waveform.
+def _mel_frame_fn(params: BackbonePreprocessParams) -> Callable[[np.ndarray], np.ndarray]:
+    """Build the per-frame log-mel transform (one ``n_fft`` frame \u2192 ``n_mels`` values).
 
     Uses essentia standard algorithms (Windowing \u2192 Spectrum \u2192 MelBands \u2192
     UnaryOperator) with exact parameters verified from
     TensorflowInputMusiCNN.cpp and TensorflowInputVGGish.cpp upstream source.
-
-    Args:
-        waveform: 1-D float32 array at ``params.sample_rate``.
-        params: Preprocessing parameters for the target backbone.
-
-    Returns:
-        Float32 array of shape ``[n_frames, n_mels]``.
     """
     fft_size = params.n_fft + params.zero_padding
 
@@ -193,17 +188,38 @@ def compute_log_mel(
     )
     log_compress = _estd.UnaryOperator(type=params.compression)
 
-    audio = waveform.astype(np.float32)
-    frames: list[np.ndarray] = []
-    pos = 0
-    while pos + params.n_fft <= len(audio):
-        frame = audio[pos : pos + params.n_fft]
+    def _frame(frame: np.ndarray) -> np.ndarray:
         windowed = windowing(frame)
         spec = spectrum(windowed)
         mel = mel_bands(spec)
         mel_linear = linear_compress(mel)
-        mel_log = log_compress(mel_linear)
-        frames.append(mel_log)
+        return np.asarray(log_compress(mel_linear), dtype=np.float32)
+
+    return _frame
+
+
+def compute_log_mel(
+    waveform: np.ndarray,
+    params: BackbonePreprocessParams,
+) -> np.ndarray:
+    """Compute a log-mel spectrogram from a mono float32 waveform.
+
+    Frames start every ``hop_length`` samples; a trailing partial frame is
+    dropped.  See :func:`_mel_frame_fn` for the per-frame transform.
+
+    Args:
+        waveform: 1-D float32 array at ``params.sample_rate``.
+        params: Preprocessing parameters for the target backbone.
+
+    Returns:
+        Float32 array of shape ``[n_frames, n_mels]``.
+    """
+    mel_frame = _mel_frame_fn(params)
+    audio = waveform.astype(np.float32)
+    frames: list[np.ndarray] = []
+    pos = 0
+    while pos + params.n_fft <= len(audio):
+        frames.append(mel_frame(audio[pos : pos + params.n_fft]))
         pos += params.hop_length
 
     if not frames:
@@ -278,3 +294,61 @@ def preprocess_for_backbone(
         patches.shape,
     )
     return patches
+
+
+class StreamingPatchExtractor:
+    """Incremental :func:`preprocess_for_backbone` over consecutive waveform blocks.
+
+    Feeding a waveform in blocks of any size yields, concatenated, exactly
+    the patches :func:`preprocess_for_backbone` returns for the whole
+    waveform.  Memory is bounded by one block plus one patch of mel frames,
+    independent of track length.
+
+    Example::
+
+        extractor = StreamingPatchExtractor("effnet")
+        for block in blocks:
+            patches = extractor.push(block)  # [k, patch_frames, n_mels], k >= 0
+    """
+
+    def __init__(self, backbone: str) -> None:
+        """Prepare an extractor for *backbone*.
+
+        Raises:
+            ValueError: If *backbone* is not recognised.
+        """
+        self._params = get_params(backbone)
+        self._mel_frame = _mel_frame_fn(self._params)
+        self._samples = np.empty(0, dtype=np.float32)  # from the next frame start onward
+        self._frames: list[np.ndarray] = []  # from the next patch start onward
+        self._skip_frames = 0  # frames still to drop before the next patch start
+        self.total_patches = 0
+
+    def push(self, block: np.ndarray) -> np.ndarray:
+        """Consume one waveform block and return the patches it completes.
+
+        Returns:
+            Float32 array of shape ``[k, patch_frames, n_mels]`` (``k`` may be 0).
+        """
+        params = self._params
+        samples = np.concatenate([self._samples, np.asarray(block, dtype=np.float32)])
+        pos = 0
+        while pos + params.n_fft <= len(samples):
+            frame = self._mel_frame(samples[pos : pos + params.n_fft])
+            if self._skip_frames:
+                self._skip_frames -= 1
+            else:
+                self._frames.append(frame)
+            pos += params.hop_length
+        self._samples = samples[pos:]
+
+        patches: list[np.ndarray] = []
+        while len(self._frames) >= params.patch_frames:
+            patches.append(np.asarray(self._frames[: params.patch_frames], dtype=np.float32))
+            drop = params.patch_hop
+            self._skip_frames = max(0, drop - len(self._frames))
+            del self._frames[:drop]
+        self.total_patches += len(patches)
+        if not patches:
+            return np.empty((0, params.patch_frames, params.n_mels), dtype=np.float32)
+        return np.stack(patches, axis=0)
@@ -65,6 +65,7 @@ def save_calibration_state(
         overflow_count=overflow_count,
         histogram_bins=histogram_bins,
     )
+    db.library_changes.bump_calibration()
 
 
 def load_all_calibration_states(
@@ -87,11 +88,13 @@ def get_calibration_version(db: Database) -> str | None:
 def set_calibration_version(db: Database, version_hash: str) -> None:
     """Set the global calibration version hash."""
     db.meta.set("calibration_version", version_hash)
+    db.library_changes.bump_calibration()
 
 
 def set_calibration_last_run(db: Database, timestamp: str) -> None:
     """Record the timestamp of the last calibration run."""
     db.meta.set("calibration_last_run", timestamp)
+    db.library_changes.bump_calibration()
 
 
 # ---------------------------------------------------------------------------
@@ -105,6 +108,7 @@ def update_file_calibration_hash(
 ) -> None:
     """Mark a single library file as calibrated."""
     db.file_states.set_calibrated(file_id)
+    db.library_changes.bump_calibration()
 
 
 def update_file_calibration_hashes_batch(
@@ -120,6 +124,8 @@ def update_file_calibration_hashes_batch(
     """
     for file_id in file_ids:
         db.file_states.set_calibrated(file_id)
+    if file_ids:
+        db.library_changes.bump_calibration()
 
 
 # ---------------------------------------------------------------------------
@@ -232,5 +238,6 @@ def clear_all_calibration_data(db: Database) -> dict[str, int]:
     # Mark all files as not calibrated and not vectors extracted
     files_updated = db.file_states.bulk_set_not_calibrated()
     db.file_states.bulk_set_not_vectors_extracted()
+    db.library_changes.bump_calibration()
 
     return {"files_updated": files_updated, "meta_keys_cleared": meta_keys_cleared}
@@ -2,26 +2,39 @@
 
 Runs ONNX backbone inference across all backbones, parallelising when 2+
 backbones are present (ONNX C++ kernels release the GIL).
+
+:func:`compute_backbone_embeddings_streaming` consumes decoded audio block by
+block instead: patches are extracted incrementally and each full batch is
+dispatched to its backbone while decoding continues.
 """
 
 from __future__ import annotations
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import numpy as np
 
+from nomarr.components.ml.audio.ml_preprocess_comp import StreamingPatchExtractor, preprocess_for_backbone
+from nomarr.components.ml.onnx.ml_session_comp import _BACKBONE_BATCH_SIZE
+from nomarr.helpers.dto.ml_dto import LoadAudioMonoResult
 from nomarr.helpers.time_helper import internal_ms
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from nomarr.components.ml.onnx.ml_backbone import ONNXBackboneModel
     from nomarr.components.ml.onnx.ml_cache import ONNXModelCache
     from nomarr.components.ml.onnx.ml_head import ONNXHeadModel
 
 logger = logging.getLogger(__name__)
 
 _PARALLEL_THRESHOLD = 2  # Use ThreadPoolExecutor when at least this many backbones
+_MAX_INFLIGHT_BATCHES = 2  # Streaming: queued batches per backbone before the decoder waits
+_STREAM_HEAD_S = 60  # Streaming: leading seconds of audio kept for the chromaprint
 
 
 @dataclass
@@ -44,7 +57,8 @@ class BackboneEmbeddingResult:
     """Backbones that failed; value is the error message."""
 
     timings: dict[str, float] = field(default_factory=dict)
-    """Timing entries: ``emb_wall`` (parallel only) and ``emb_<backbone>`` per backbone."""
+    """Timing entries: ``emb_wall`` (parallel only), and per backbone ``pre_<backbone>``
+    (log-mel and patch extraction) and ``emb_<backbone>`` (inference)."""
 
 
 def compute_backbone_embeddings(
@@ -73,8 +87,11 @@ def compute_backbone_embeddings(
     def _run_one(backbone: str, backbone_heads: list[ONNXHeadModel]) -> BackboneEmbedding:
         t0 = internal_ms()
         model = cache.backbones[backbone]
-        embeddings_2d = model.run(wave_f32)
-        result.timings[f"emb_{backbone}"] = internal_ms().value - t0.value
+        patches = preprocess_for_backbone(wave_f32, backbone)
+        t_infer = internal_ms()
+        result.timings[f"pre_{backbone}"] = t_infer.value - t0.value
+        embeddings_2d = model.run(patches)
+        result.timings[f"emb_{backbone}"] = internal_ms().value - t_infer.value
         return BackboneEmbedding(backbone=backbone, heads=backbone_heads, embeddings=embeddings_2d)
 
     if len(backbone_items) >= _PARALLEL_THRESHOLD:
@@ -93,7 +110,7 @@ def compute_backbone_embeddings(
                     logger.warning("[embeddings] Skipping backbone %s: %s", bb, e)
                     result.errors[bb] = str(e)
         wall_ms = internal_ms().value - t_wall.value
-        sequential_ms = sum(v for k, v in result.timings.items() if k.startswith("emb_"))
+        sequential_ms = sum(v for k, v in result.timings.items() if k.startswith(("pre_", "emb_")))
         result.timings["emb_wall"] = wall_ms
         logger.debug(
             "[embeddings] Parallel done: wall=%dms, sum=%dms, speedup=%.2fx",
@@ -110,3 +127,159 @@ def compute_backbone_embeddings(
                 result.errors[backbone] = str(e)
 
     return result
+
+
+@dataclass
+class StreamedBackboneEmbeddings:
+    """Output of compute_backbone_embeddings_streaming."""
+
+    audio: LoadAudioMonoResult
+    """Sample rate and full duration; ``waveform`` holds only the first 60 s (enough for the chromaprint)."""
+
+    result: BackboneEmbeddingResult
+    """Embeddings per backbone, identical to ``compute_backbone_embeddings`` on the same samples."""
+
+
+class _BackboneStream:
+    """Patch extraction and batch dispatch state for one backbone."""
+
+    def __init__(self, backbone: str, heads: list[ONNXHeadModel], model: ONNXBackboneModel) -> None:
+        self.backbone = backbone
+        self.heads = heads
+        self.model = model
+        self.extractor = StreamingPatchExtractor(backbone)
+        self.pending: list[np.ndarray] = []  # extracted patches not yet dispatched
+        self.inflight: deque[Future[np.ndarray]] = deque()
+        self.outputs: list[np.ndarray] = []
+        self.preprocess_ms = 0.0
+        self.infer_ms = 0.0
+        self.error: str | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"stream-{backbone}")
+
+    def push(self, block: np.ndarray) -> None:
+        if self.error is not None:
+            return
+        t0 = internal_ms()
+        patches = self.extractor.push(block)
+        self.preprocess_ms += internal_ms().value - t0.value
+        if len(patches):
+            self.pending.append(patches)
+        if sum(len(p) for p in self.pending) >= _BACKBONE_BATCH_SIZE:
+            merged = np.concatenate(self.pending)
+            n_full = len(merged) - len(merged) % _BACKBONE_BATCH_SIZE
+            for start in range(0, n_full, _BACKBONE_BATCH_SIZE):
+                self._dispatch(merged[start : start + _BACKBONE_BATCH_SIZE])
+            self.pending = [merged[n_full:]] if n_full < len(merged) else []
+        while len(self.inflight) > _MAX_INFLIGHT_BATCHES and self.error is None:
+            self._collect()
+
+    def finish(self) -> np.ndarray | None:
+        """Run the remaining patches and return all embeddings (``None`` on error)."""
+        try:
+            if self.error is None and self.pending:
+                self._dispatch(np.concatenate(self.pending))
+                self.pending = []
+            while self.inflight and self.error is None:
+                self._collect()
+            if self.error is None and self.extractor.total_patches == 0:
+                self.error = f"No patches produced for backbone {self.backbone!r} \u2014 audio may be too short"
+            return np.vstack(self.outputs) if self.error is None else None
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _dispatch(self, batch: np.ndarray) -> None:
+        self.inflight.append(self._executor.submit(self._run, batch))
+
+    def _run(self, batch: np.ndarray) -> np.ndarray:
+        t0 = internal_ms()
+        out = np.asarray(self.model.run(batch), dtype=np.float32)
+        self.infer_ms += internal_ms().value - t0.value
+        return out.reshape(1, -1) if out.ndim == 1 else out
+
+    def _collect(self) -> None:
+        try:
+            self.outputs.append(self.inflight.popleft().result())
+        except Exception as e:
+            logger.warning("[embeddings] Skipping backbone %s: %s", self.backbone, e)
+            self.error = str(e)
+
+
+def compute_backbone_embeddings_streaming(
+    cache: ONNXModelCache,
+    heads_by_backbone: dict[str, list[ONNXHeadModel]],
+    blocks: Iterable[np.ndarray],
+    sample_rate: int,
+) -> StreamedBackboneEmbeddings:
+    """Compute embeddings for all backbones while the audio is still decoding.
+
+    Every block is turned into patches for each backbone as it arrives; each
+    full batch of patches is run on the backbone's own dispatch thread, so
+    decoding, log-mel extraction and inference overlap.  Batches have the
+    same boundaries as :func:`compute_backbone_embeddings`, so the
+    embeddings are identical for identical samples.
+
+    Memory stays bounded: at most ``_MAX_INFLIGHT_BATCHES`` batches wait per
+    backbone (the decoder is paused otherwise), and only the first 60 s of
+    audio are retained.
+
+    Args:
+        cache: Warmed ONNXModelCache with loaded backbone sessions.
+        heads_by_backbone: Mapping of backbone name to its head models.
+        blocks: Consecutive mono float32 blocks at *sample_rate* (see
+            ``stream_audio_mono``).
+        sample_rate: Sample rate of *blocks* in Hz.
+
+    Returns:
+        StreamedBackboneEmbeddings with audio info and the embedding result.
+
+    Raises:
+        Exception: Errors raised by *blocks* (decode failure, shutdown)
+            propagate; per-backbone inference errors are reported in
+            ``result.errors`` like :func:`compute_backbone_embeddings`.
+
+    """
+    result = BackboneEmbeddingResult()
+    streams: list[_BackboneStream] = []
+    for backbone, backbone_heads in heads_by_backbone.items():
+        try:
+            streams.append(_BackboneStream(backbone, backbone_heads, cache.backbones[backbone]))
+        except Exception as e:
+            logger.warning("[embeddings] Skipping backbone %s: %s", backbone, e)
+            result.errors[backbone] = str(e)
+
+    head_limit = _STREAM_HEAD_S * sample_rate
+    head_blocks: list[np.ndarray] = []
+    head_samples = 0
+    total_samples = 0
+    try:
+        for block in blocks:
+            total_samples += len(block)
+            if head_samples < head_limit:
+                head_blocks.append(block[: head_limit - head_samples])
+                head_samples += len(head_blocks[-1])
+            for stream in streams:
+                stream.push(block)
+        for stream in streams:
+            embeddings = stream.finish()
+            result.timings[f"pre_{stream.backbone}"] = stream.preprocess_ms
+            result.timings[f"emb_{stream.backbone}"] = stream.infer_ms
+            if embeddings is None:
+                result.errors[stream.backbone] = stream.error or "unknown error"
+            else:
+                result.embeddings.append(
+                    BackboneEmbedding(backbone=stream.backbone, heads=stream.heads, embeddings=embeddings)
+                )
+    finally:
+        for stream in streams:
+            stream.close()
+
+    waveform = np.concatenate(head_blocks) if head_blocks else np.empty(0, dtype=np.float32)
+    audio = LoadAudioMonoResult(
+        waveform=waveform,
+        sample_rate=sample_rate,
+        duration=total_samples / float(sample_rate) if sample_rate > 0 else 0.0,
+    )
+    return StreamedBackboneEmbeddings(audio=audio, result=result)
@@ -60,40 +60,54 @@ def segment_waveform(params: SegmentWaveformParams) -> Segments:
         msg = "segment length/hop too small for given sr"
         raise ValueError(msg)
 
-    waves: list[np.ndarray] = []
-    bounds: list[tuple[float, float]] = []
-
-    num_samples = len(waveform)
-    if num_samples == 0:
-        return Segments(waves, bounds, sr)
-
-    start = 0
-    while start < num_samples:
-        end = start + seg_len
-        if end <= num_samples:
-            seg = waveform[start:end]
-        # last partial
-        elif not pad_final:
-            seg = waveform[start:num_samples]
-            if len(seg) == 0:
-                break
-        else:
-            seg = np.zeros(seg_len, dtype=np.float32)
-            remain = waveform[start:num_samples]
-            seg[: len(remain)] = remain
-            end = num_samples  # logical end at file end
+    if len(waveform) == 0:
+        return Segments([], [], sr)
+
+    frames, tail, bounds = frame_waveform(waveform, seg_len, hop_len)
+    waves = [*frames, *tail]
+    if not pad_final:
+        # Trailing partial segments keep their true length instead of zero padding
+        for idx, (start, end) in enumerate(bounds[len(frames) :].tolist(), start=len(frames)):
+            waves[idx] = waves[idx][: end - start]
 
-        t0 = start / sr
-        t1 = min(end, num_samples) / sr
-        waves.append(np.asarray(seg, dtype=np.float32))
-        bounds.append((t0, t1))
+    return Segments(waves=waves, bounds=[(t0 / sr, t1 / sr) for t0, t1 in bounds.tolist()], sr=sr)
 
-        # Advance
-        if start + hop_len >= num_samples:
-            break
-        start += hop_len
 
-    return Segments(waves=waves, bounds=bounds, sr=sr)
+def frame_waveform(waveform: np.ndarray, seg_len: int, hop_len: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Frame a mono waveform into every overlapping segment without a per-segment loop.
+
+    Segments start at every multiple of ``hop_len`` below the waveform length.
+    Segments that fit entirely are returned as a zero-copy, read-only strided
+    view of the float32 waveform; the few trailing segments that run past the
+    end are returned separately, zero-padded to ``seg_len``.
+
+    Args:
+        waveform: 1D mono waveform.
+        seg_len: Segment length in samples (> 0).
+        hop_len: Hop length in samples (> 0).
+
+    Returns:
+        ``(frames, tail, bounds)``: frames is ``(num_full, seg_len)``, tail is
+        ``(num_partial, seg_len)`` (both float32), and bounds is
+        ``(num_full + num_partial, 2)`` int64 sample offsets ``(start, end)``
+        with ``end`` clipped to the waveform length.
+
+    """
+    samples = np.asarray(waveform, dtype=np.float32)
+    num_samples = samples.shape[0]
+    starts = np.arange(0, num_samples, hop_len, dtype=np.int64)
+    bounds = np.stack([starts, np.minimum(starts + seg_len, num_samples)], axis=1)
+
+    num_full = (num_samples - seg_len) // hop_len + 1 if num_samples >= seg_len else 0
+    if num_full:
+        frames = np.lib.stride_tricks.sliding_window_view(samples, seg_len)[::hop_len][:num_full]
+    else:
+        frames = np.zeros((0, seg_len), dtype=np.float32)
+
+    tail = np.zeros((starts.size - num_full, seg_len), dtype=np.float32)
+    for row, (start, end) in zip(tail, bounds[num_full:].tolist(), strict=True):
+        row[: end - start] = samples[start:end]
+    return frames, tail, bounds
 
 
 # ----------------------------------------------------------------------
@@ -104,30 +118,27 @@ def score_segments(segments: Segments, predict_fn: Callable[[np.ndarray, int], n
     predict_fn signature: (wave_mono_float32, sr) -> 1D np.ndarray (scores/logits/probs)
     Returns a 2D array: (num_segments, dim).
     """
-    outputs: list[np.ndarray] = []
-    for seg in segments.waves:
-        out = predict_fn(seg, segments.sr)
-        out = np.asarray(out).reshape(-1).astype(np.float32, copy=False)
-        outputs.append(out)
+    outputs = [np.asarray(predict_fn(seg, segments.sr)).reshape(-1) for seg in segments.waves]
     if not outputs:
         return np.zeros((0, 0), dtype=np.float32)
-    # Validate consistent dimension
-    dim = max(output.shape[0] for output in outputs)
-    padded = []
-    for output in outputs:
-        if output.shape[0] == dim:
-            padded.append(output)
-        else:
-            # rare: if a backend returns inconsistent dims across segments, pad with NaN then handle in pooling
-            tmp = np.full((dim,), np.nan, dtype=np.float32)
-            tmp[: min(dim, output.shape[0])] = output[: min(dim, output.shape[0])]
-            padded.append(tmp)
-    return np.vstack(padded)
+    dims = np.fromiter((output.shape[0] for output in outputs), dtype=np.int64, count=len(outputs))
+    dim = int(dims.max())
+    if (dims == dim).all():
+        return np.vstack(outputs).astype(np.float32, copy=False)
+    # rare: if a backend returns inconsistent dims across segments, pad with NaN then handle in pooling
+    scores = np.full((len(outputs), dim), np.nan, dtype=np.float32)
+    for row, output in zip(scores, outputs, strict=True):
+        row[: output.shape[0]] = output
+    return scores
 
 
 # ----------------------------------------------------------------------
 # Pooling
 # ----------------------------------------------------------------------
+# Rows per block when transposing score matrices for column-wise pooling
+_TRANSPOSE_BLOCK_ROWS = 1024
+
+
 def pool_scores(
     scores: np.ndarray,
     mode: str = "mean",
@@ -186,24 +197,142 @@ def _trimmed_mean(scores: np.ndarray, trim_perc: float, axis: int = 0) -> np.nda
     if axis != 0:
         scores = np.swapaxes(scores, axis, 0)
 
-    num_rows = scores.shape[0]
-    trim_count = int(np.floor(trim_perc * num_rows))
-    if num_rows == 0:
+    if scores.shape[0] == 0:
         return np.array([], dtype=np.float32)
 
-    result = np.zeros((scores.shape[1],), dtype=np.float32)
-    for col_idx in range(scores.shape[1]):
-        col = scores[:, col_idx]
-        col = col[~np.isnan(col)]
-        if col.size == 0:
-            result[col_idx] = 0.0
-            continue
-        col.sort()
-        lo = trim_count
-        hi = max(trim_count, col.size - trim_count)
-        trimmed = col[lo:hi] if hi > lo else col
-        result[col_idx] = float(np.mean(trimmed)) if trimmed.size else 0.0
+    result = _trimmed_mean_rows(_label_major([scores]), trim_perc)
 
     if axis != 0:
         result = np.swapaxes(result, axis, 0)
     return result
+
+
+def trimmed_mean_columns(scores: np.ndarray, trim_perc: float) -> np.ndarray:
+    """Trimmed mean of every column of a 2D score matrix in one pass, ignoring NaNs.
+
+    Sorts all columns at once (NaNs sort last) and trims ``floor(trim_perc * rows)``
+    values from each tail of the valid values.  A column with too few valid values
+    to trim is averaged untrimmed; an all-NaN column pools to 0.0.
+
+    Columns that keep the same ``[lo, hi)`` span of sorted rows are reduced together
+    as one block — a single group when the matrix has no NaNs.  Each column is
+    summed as a contiguous row with the same pairwise reduction ``np.mean`` applies
+    to a 1D column, so results are bit-identical to trimming column by column.
+
+    Args:
+        scores: ``(num_segments, num_labels)`` score matrix.
+        trim_perc: Fraction to drop from each tail, in ``[0, 0.5)``.
+
+    Returns:
+        ``(num_labels,)`` float32 pooled vector.
+
+    """
+    if not (0.0 <= trim_perc < 0.5):
+        msg = "trim_perc must be in [0, 0.5)"
+        raise ValueError(msg)
+    return _trimmed_mean_rows(_label_major([scores]), trim_perc)
+
+
+def _label_major(blocks: list[np.ndarray]) -> np.ndarray:
+    """Copy ``(segments, labels)`` blocks side by side into one C-contiguous ``(labels, segments)`` matrix.
+
+    Transposes in row chunks so reads and writes stay cache-resident; a plain
+    ``ascontiguousarray(scores.T)`` strides across the whole matrix per label and
+    costs several times more on long tracks.  Always returns a fresh array, so
+    callers may sort it in place.
+    """
+    num_rows = blocks[0].shape[0]
+    out = np.empty((sum(block.shape[1] for block in blocks), num_rows), dtype=blocks[0].dtype)
+    offset = 0
+    for block in blocks:
+        width = block.shape[1]
+        for start in range(0, num_rows, _TRANSPOSE_BLOCK_ROWS):
+            stop = start + _TRANSPOSE_BLOCK_ROWS
+            out[offset : offset + width, start:stop] = block[start:stop].T
+        offset += width
+    return out
+
+
+def _trimmed_mean_rows(ordered: np.ndarray, trim_perc: float) -> np.ndarray:
+    """Sort a label-major matrix in place and return the trimmed mean of each row."""
+    num_cols, num_rows = ordered.shape
+    trim_count = int(np.floor(trim_perc * num_rows))
+    ordered.sort(axis=1)  # NaNs sort last
+    if num_rows and np.isnan(ordered[:, -1]).any():
+        valid = num_rows - np.count_nonzero(np.isnan(ordered), axis=1)
+    else:
+        valid = np.full((num_cols,), num_rows, dtype=np.int64)
+
+    hi = np.maximum(trim_count, valid - trim_count)
+    trimmed = hi > trim_count
+    lo = np.where(trimmed, trim_count, 0)
+    hi = np.where(trimmed, hi, valid)
+
+    result = np.zeros((num_cols,), dtype=np.float32)
+    if num_cols and (lo == lo[0]).all() and (hi == hi[0]).all():
+        if hi[0] > lo[0]:
+            result[:] = ordered[:, lo[0] : hi[0]].mean(axis=1)
+        return result
+    spans = np.stack([lo, hi], axis=1)
+    for span_lo, span_hi in np.unique(spans[hi > lo], axis=0):
+        cols = np.flatnonzero((lo == span_lo) & (hi == span_hi))
+        result[cols] = ordered[cols, span_lo:span_hi].mean(axis=1)
+    return result
+
+
+def pool_head_scores(
+    head_scores: dict[str, np.ndarray],
+    *,
+    trim_perc: float = 0.1,
+) -> dict[str, tuple[np.ndarray, np.ndarray | None]]:
+    """Pool the segment scores of several heads in one pass over all their labels.
+
+    Heads scored over the same embeddings share the segment axis, so their score
+    matrices are laid out side by side in one label-major buffer and reduced
+    together: one sort and one trimmed mean for every label of every head.  The
+    standard deviation stays per head because ``np.std``'s summation order depends
+    on the matrix layout, and results must match
+    ``pool_scores(mode="trimmed_mean", nan_policy="omit")`` and ``np.std(axis=0)``
+    per head bit for bit.
+
+    Args:
+        head_scores: Head name → ``(num_segments, num_labels)`` score matrix.  All
+            matrices must have the same number of segments.
+        trim_perc: Fraction to drop from each tail for the trimmed mean.
+
+    Returns:
+        Head name → ``(pooled, segment_std)``; ``segment_std`` is None for heads
+        scored over a single segment.
+
+    """
+    if not (0.0 <= trim_perc < 0.5):
+        msg = "trim_perc must be in [0, 0.5)"
+        raise ValueError(msg)
+    if not head_scores:
+        return {}
+    names = list(head_scores)
+    blocks = [np.asarray(head_scores[name]) for name in names]
+    if any(block.ndim != 2 for block in blocks) or len({block.shape[0] for block in blocks}) != 1:
+        msg = "pool_head_scores needs 2D score matrices with the same number of segments"
+        raise ValueError(msg)
+    if blocks[0].shape[0] == 0 or len({block.dtype for block in blocks}) != 1:
+        # Nothing to pool jointly, or mixed precision that must not be upcast
+        return {name: _pool_one_head(block, trim_perc) for name, block in zip(names, blocks, strict=True)}
+
+    pooled = _trimmed_mean_rows(_label_major(blocks), trim_perc)
+    multi_segment = blocks[0].shape[0] > 1
+
+    result: dict[str, tuple[np.ndarray, np.ndarray | None]] = {}
+    offset = 0
+    for name, block in zip(names, blocks, strict=True):
+        seg_std = np.std(block, axis=0).astype(np.float32, copy=False) if multi_segment else None
+        result[name] = (pooled[offset : offset + block.shape[1]], seg_std)
+        offset += block.shape[1]
+    return result
+
+
+def _pool_one_head(scores: np.ndarray, trim_perc: float) -> tuple[np.ndarray, np.ndarray | None]:
+    """Per-head pooling, as done for heads outside a joint pooling pass."""
+    pooled = pool_scores(scores, mode="trimmed_mean", trim_perc=trim_perc, nan_policy="omit")
+    seg_std = np.std(scores, axis=0).astype(np.float32, copy=False) if scores.shape[0] > 1 else None
+    return pooled, seg_std
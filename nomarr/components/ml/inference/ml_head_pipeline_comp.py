@@ -2,7 +2,8 @@
 
 Owns the reusable thread pool for parallel head predictions and exposes:
 - ``run_single_head``   — process one head prediction (thread-safe).
-- ``run_backbone_heads`` — dispatch all heads for a backbone in parallel.
+- ``run_heads``          — dispatch all heads for a backbone in parallel,
+  optionally computing scores for fused head groups in one ONNX call.
 - ``shutdown_head_pool`` — orderly pool teardown (call on worker exit).
 
 Kept separate from the workflow layer so the pool lifecycle and inference
@@ -19,13 +20,14 @@ from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
-from nomarr.components.ml.inference.ml_embed_comp import pool_scores
+from nomarr.components.ml.inference.ml_embed_comp import pool_head_scores, pool_scores
 from nomarr.components.ml.inference.ml_heads_comp import HeadSpec, run_head_decision
 from nomarr.components.tagging.mood_labels_comp import normalize_tag_label
 from nomarr.helpers.dto.ml_dto import ProcessHeadPredictionsResult, SingleHeadResult
 from nomarr.helpers.time_helper import internal_ms
 
 if TYPE_CHECKING:
+    from nomarr.components.ml.onnx.ml_fused_heads import ONNXFusedHeadsModel
     from nomarr.components.ml.onnx.ml_head import ONNXHeadModel
 
 logger = logging.getLogger(__name__)
@@ -73,9 +75,54 @@ def _make_predict(m: ONNXHeadModel, e: np.ndarray) -> Callable[[], np.ndarray]:
     return _fn
 
 
+def _precomputed(scores: np.ndarray) -> Callable[[], np.ndarray]:
+    """Predictor closure returning scores already computed by a fused head graph."""
+
+    def _fn() -> np.ndarray:
+        return scores
+
+    return _fn
+
+
+def _run_fused(
+    fused: list[ONNXFusedHeadsModel],
+    embeddings_2d: np.ndarray,
+    timings: dict[str, float],
+) -> dict[str, np.ndarray]:
+    """Run every verified fused head group once and collect per-head scores.
+
+    Groups that are unloaded, unverified or fail at run time contribute
+    nothing, so their heads fall back to per-head inference.
+    """
+    scores: dict[str, np.ndarray] = {}
+    for fm in fused:
+        if not fm.verified or fm._session is None:
+            continue
+        t_fused = internal_ms()
+        try:
+            scores.update(fm.run_split(embeddings_2d))
+        except Exception as e:
+            logger.warning(f"[processor] Fused heads {fm.name} failed, using per-head inference: {e}")
+            continue
+        timings[fm.name] = internal_ms().value - t_fused.value
+    return scores
+
+
+def _pool_fused(fused_scores: dict[str, np.ndarray]) -> dict[str, tuple[np.ndarray, np.ndarray | None]]:
+    """Pool all fused head scores in one pass; heads it cannot cover pool on their own."""
+    if not fused_scores:
+        return {}
+    try:
+        return pool_head_scores(fused_scores, trim_perc=0.1)
+    except Exception as e:
+        logger.warning(f"[processor] Joint pooling failed, pooling heads individually: {e}")
+        return {}
+
+
 def run_single_head(
     head_model: ONNXHeadModel,
     predict_fn: Callable[[], np.ndarray],
+    pooled: tuple[np.ndarray, np.ndarray | None] | None = None,
 ) -> SingleHeadResult:
     """Process a single head prediction — fully independent, no shared state mutation.
 
@@ -86,6 +133,8 @@ def run_single_head(
         head_model: ONNX head model wrapper (provides labels, sidecar, name, etc.).
         predict_fn: Pre-resolved cached predictor closure that calls head_model.run().
             Hoisting resolution to the caller avoids per-thread cache lookup + lock contention.
+        pooled: Optional ``(pooled_vec, segment_std)`` already computed for this head
+            by :func:`pool_head_scores`; skips per-head pooling.
 
     """
     head_name = head_model.name
@@ -93,10 +142,13 @@ def run_single_head(
     # Phase 1: ONNX inference (GPU/CPU, releases GIL)
     try:
         segment_scores = predict_fn()
-        pooled_vec = pool_scores(segment_scores, mode="trimmed_mean", trim_perc=0.1, nan_policy="omit")
         seg_std: np.ndarray | None = None
-        if segment_scores.ndim == 2 and segment_scores.shape[0] > 1:
-            seg_std = np.std(segment_scores, axis=0).astype(np.float32, copy=False)
+        if pooled is not None:
+            pooled_vec, seg_std = pooled
+        else:
+            pooled_vec = pool_scores(segment_scores, mode="trimmed_mean", trim_perc=0.1, nan_policy="omit")
+            if segment_scores.ndim == 2 and segment_scores.shape[0] > 1:
+                seg_std = np.std(segment_scores, axis=0).astype(np.float32, copy=False)
     except Exception as e:
         logger.error(f"[processor] Processing error for {head_name}: {e}", exc_info=True)
         return SingleHeadResult(
@@ -174,6 +226,7 @@ def run_heads(
     backbone_heads: list[ONNXHeadModel],
     embeddings_2d: np.ndarray,
     tags_accum: dict[str, Any],
+    fused: list[ONNXFusedHeadsModel] | None = None,
 ) -> ProcessHeadPredictionsResult:
     """Process all head predictions for a single backbone using cached embeddings.
 
@@ -182,29 +235,47 @@ def run_heads(
     lookup + lock contention. The dispatched threads only call predict_fn() which
     releases the GIL for real CPU parallelism.
 
+    When *fused* head groups are given, their scores are computed up front with
+    one ONNX call per batch for the whole group and pooled together in a single
+    pass over all their labels; the pool then only runs decisions for those
+    heads.  Scores and pooled vectors are bit-identical to the per-head path.
+
     Args:
         backbone_heads: List of heads for this backbone.
         embeddings_2d: Pre-computed embeddings.
         tags_accum: Accumulator dict for tags (modified in place).
+        fused: Optional fused head groups for this backbone (see
+            :class:`ONNXFusedHeadsModel`).  Unverified groups are ignored.
 
     Returns:
         ProcessHeadPredictionsResult with per-head outcomes.
 
     """
     # Pre-resolve cached predictors on the main thread (no lock contention).
-    # Each predict_fn is a lightweight closure binding the ONNX session + embeddings.
+    # Each predict_fn is a lightweight closure binding the ONNX session + embeddings,
+    # or the scores already produced by a fused head graph.
+    fused_timings: dict[str, float] = {}
+    fused_scores = _run_fused(fused, embeddings_2d, fused_timings) if fused else {}
     predict_fns: dict[str, Callable[[], np.ndarray]] = {
-        hm.name: _make_predict(hm, embeddings_2d) for hm in backbone_heads
+        hm.name: _precomputed(fused_scores[hm.name]) if hm.name in fused_scores else _make_predict(hm, embeddings_2d)
+        for hm in backbone_heads
     }
 
+    pooled = _pool_fused(fused_scores)
+
     head_results_list: list[SingleHeadResult] = []
     n_heads = len(backbone_heads)
     if n_heads > 1:
-        futures = {_HEAD_POOL.submit(run_single_head, hm, predict_fns[hm.name]): hm.name for hm in backbone_heads}
+        futures = {
+            _HEAD_POOL.submit(run_single_head, hm, predict_fns[hm.name], pooled.get(hm.name)): hm.name
+            for hm in backbone_heads
+        }
         head_results_list.extend(fut.result() for fut in as_completed(futures))
         logger.debug("[processor] Parallel heads complete (%d heads)", n_heads)
     else:
-        head_results_list.extend(run_single_head(hm, predict_fns[hm.name]) for hm in backbone_heads)
+        head_results_list.extend(
+            run_single_head(hm, predict_fns[hm.name], pooled.get(hm.name)) for hm in backbone_heads
+        )
 
     # Merge results sequentially (safe dict mutations)
     heads_succeeded = 0
@@ -212,7 +283,7 @@ def run_heads(
     regression_heads: list[tuple[Any, list[float]]] = []
     all_head_outputs: list[Any] = []
     raw_segments_per_head: dict[str, tuple[np.ndarray, list[str]]] = {}
-    per_head_timings: dict[str, float] = {}
+    per_head_timings: dict[str, float] = dict(fused_timings)
     for r in head_results_list:
         per_head_timings[r.head_name] = r.elapsed_ms
         if r.status == "success":
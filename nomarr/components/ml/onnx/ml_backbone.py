@@ -99,7 +99,9 @@ class ONNXBackboneModel(BaseONNXModel):
         recovery.  Do not call this directly.
 
         Args:
-            waveform: Mono float32 audio at 16 kHz.
+            waveform: Mono float32 audio at 16 kHz, or already extracted
+                ``[n_patches, patch_frames, n_mels]`` patches (streaming
+                decode, see :class:`StreamingPatchExtractor`).
 
         Returns:
             Float32 embedding matrix of shape ``(n_patches, embed_dim)``.
@@ -112,7 +114,7 @@ class ONNXBackboneModel(BaseONNXModel):
             msg = "ONNXBackboneModel is not loaded — call load() first"
             raise RuntimeError(msg)
 
-        patches = preprocess_for_backbone(waveform, self.backbone_name)
+        patches = waveform if waveform.ndim == 3 else preprocess_for_backbone(waveform, self.backbone_name)
         if patches.shape[0] == 0:
             msg = f"No patches produced for backbone {self.backbone_name!r} — audio may be too short"
             raise RuntimeError(msg)
@@ -10,7 +10,7 @@ from __future__ import annotations
 import logging
 import os
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 
@@ -21,6 +21,9 @@ from nomarr.components.ml.resources import ml_worker_context_comp as _worker_ctx
 if TYPE_CHECKING:
     import onnxruntime as ort
 
+    from nomarr.components.ml.onnx.ml_graph_cache_comp import SessionGraphCache
+    from nomarr.components.ml.onnx.ml_session_comp import SessionThreading
+
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,26 @@ DevicePlacement = Literal["cpu", "gpu"]
 _VRAM_META_PREFIX = "ml_model_vram:"
 
 
+def fetch_vram_limits(db: Any, paths: list[str]) -> dict[str, int | None]:
+    """Read the VRAM limits of several models in one metadata query.
+
+    Batched form of the per-model lookup in :meth:`BaseONNXModel.load`.
+
+    Args:
+        db: Application database handle.
+        paths: Absolute model paths.
+
+    Returns:
+        VRAM limit in bytes keyed by path, ``None`` where no measurement exists.
+    """
+    raw = db.meta.get_many([f"{_VRAM_META_PREFIX}{p}" for p in paths])
+    limits: dict[str, int | None] = {}
+    for p in paths:
+        value = raw.get(f"{_VRAM_META_PREFIX}{p}")
+        limits[p] = int(value) if value is not None else None
+    return limits
+
+
 class VramFitError(RuntimeError):
     """Raised by :meth:`BaseONNXModel.load` when the VRAM coordinator rejects
     the GPU placement request for this model.
@@ -63,6 +86,10 @@ class BaseONNXModel(ABC):
         self._path: str = path
         self._session: ort.InferenceSession | None = None
         self._device: DevicePlacement | None = None
+        # Optional on-disk optimized-graph cache; assigned by ONNXModelCache
+        self._graph_cache: SessionGraphCache | None = None
+        # Optional calibrated CPU thread pool; assigned by ONNXModelCache
+        self._threads: SessionThreading | None = None
 
     # ------------------------------------------------------------------
     # Session lifecycle
@@ -119,12 +146,46 @@ class BaseONNXModel(ABC):
                         f"VRAM coordinator rejected GPU placement for {self._path}: insufficient fleet headroom"
                     )
 
+        self.load_with_placement(device, vram_limit_bytes)
+
+    def load_with_placement(self, device: DevicePlacement, vram_limit_bytes: int | None = None) -> None:
+        """Create and store an ONNX session for an already-admitted placement.
+
+        Skips the metadata read and coordinator check of :meth:`load`; the
+        caller has done both (see :mod:`ml_warmup_comp`, which batches them
+        for a whole cache).  A GPU promise registered by the caller is
+        released by :meth:`unload` as usual.
+
+        Args:
+            device: Target execution device (``"cpu"`` or ``"gpu"``).
+            vram_limit_bytes: GPU memory arena cap; ignored on CPU.
+        """
         self._session = backend_onnx.create_session(
             self._path,
             device,
             vram_limit_bytes if device == "gpu" else None,
+            model_bytes=self._model_bytes(),
+            graph_cache=self._graph_cache,
+            threads=self._threads,
         )
         self._device = device
+        self._on_session_loaded()
+
+    def _on_session_loaded(self) -> None:
+        """Hook run after every session creation (default: nothing).
+
+        Subclasses resolve tensor metadata here so both :meth:`load` and
+        :meth:`load_with_placement` leave the model fully initialised.
+        """
+        return
+
+    def _model_bytes(self) -> bytes | None:
+        """Serialized model to load instead of the file at ``_path``.
+
+        ``None`` (default) loads ``_path`` from disk.  Subclasses whose graph
+        is built in memory override this.
+        """
+        return None
 
     def unload(self) -> None:
         """Release the ONNX session and free associated memory.
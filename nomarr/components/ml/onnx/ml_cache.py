@@ -13,6 +13,23 @@ discoveries models at construction time and provides two high-level controls:
   if the cache is warm, unloads and reloads them; otherwise just stores the
   device for the next warm cycle.
 
+With ``fuse_heads=True`` the cache also holds one :class:`ONNXFusedHeadsModel`
+per group of compatible heads of a backbone (see :mod:`ml_fused_heads`).
+Fused models are loaded after their heads so each load can verify parity.
+
+With a :class:`SessionGraphCache` every session is created through the
+on-disk optimized-graph cache (see :mod:`ml_graph_cache_comp`), so re-warming
+after an idle eviction or a worker restart skips graph optimization.
+
+Warming goes through :func:`warm_models` (see :mod:`ml_warmup_comp`): VRAM
+limits and promises for the whole cache are read and registered in one batch,
+and up to ``warmup_workers`` sessions are built concurrently.  The per-model
+load times of the last warm-up are kept in :attr:`last_warmup`.
+
+``session_threads`` gives backbone sessions a calibrated CPU thread pool per
+backbone (see :mod:`ml_thread_tuning_comp`); every other session keeps the
+default pool of :func:`default_session_threading`.
+
 Workers own :class:`ONNXModelCache` instances, not the service layer.  Idle
 eviction is implemented by the worker setting ``cache.warm = False``.
 """
@@ -24,19 +41,20 @@ from collections.abc import Generator
 from typing import TYPE_CHECKING
 
 from nomarr.components.ml.onnx.ml_backbone import ONNXBackboneModel
-from nomarr.components.ml.onnx.ml_base import (
-    BaseONNXModel,
-    DevicePlacement,
-    VramFitError,
-)
+from nomarr.components.ml.onnx.ml_base import BaseONNXModel, DevicePlacement
 from nomarr.components.ml.onnx.ml_discovery_comp import (
     discover_backbone_models,
     discover_head_models,
     discover_head_models_no_db,
 )
+from nomarr.components.ml.onnx.ml_fused_heads import ONNXFusedHeadsModel, is_fusion_available, plan_head_fusion
 from nomarr.components.ml.onnx.ml_head import ONNXHeadModel
+from nomarr.components.ml.onnx.ml_warmup_comp import WarmupReport, warm_models
+from nomarr.components.ml.resources.ml_timing_comp import build_warmup_summary
 
 if TYPE_CHECKING:
+    from nomarr.components.ml.onnx.ml_graph_cache_comp import SessionGraphCache
+    from nomarr.components.ml.onnx.ml_session_comp import SessionThreading
     from nomarr.persistence.db import Database
 
 logger = logging.getLogger(__name__)
@@ -69,11 +87,28 @@ class ONNXModelCache:
     heads: dict[str, list[ONNXHeadModel]]
     """Head models keyed by backbone name; each list is sorted by model name."""
 
+    fused_heads: dict[str, list[ONNXFusedHeadsModel]]
+    """Fused head groups keyed by backbone name; empty unless ``fuse_heads=True``."""
+
+    graph_cache: SessionGraphCache | None
+    """On-disk optimized-graph cache used for every session, if any."""
+
+    warmup_workers: int
+    """Sessions built concurrently by ``warm = True``."""
+
+    last_warmup: WarmupReport | None
+    """Timings of the most recent warm-up, or ``None`` before the first one."""
+
     def __init__(
         self,
         models_dir: str,
         device: DevicePlacement,
         db: Database | None = None,
+        *,
+        fuse_heads: bool = False,
+        graph_cache: SessionGraphCache | None = None,
+        warmup_workers: int = 1,
+        session_threads: dict[str, SessionThreading] | None = None,
     ) -> None:
         """Discover all ONNX models under *models_dir* and prepare them for warming.
 
@@ -85,6 +120,14 @@ class ONNXModelCache:
             device: Default execution device (``"cpu"`` or ``"gpu"``).
             db: Optional database handle; when provided, head labels and
                 release dates are sourced from the database.
+            fuse_heads: Build fused multi-head graphs for each backbone.
+                Ignored (with a warning) when the ``onnx`` package is missing.
+            graph_cache: Optional on-disk cache of optimized session graphs
+                shared by every model in this cache.
+            warmup_workers: Maximum number of sessions built concurrently when
+                the cache is warmed (CPU budget for warm-up).
+            session_threads: Optional CPU thread pools keyed by backbone name,
+                applied to the matching backbone sessions.
         """
         self._models_dir = models_dir
         self._device: DevicePlacement = device
@@ -102,6 +145,33 @@ class ONNXModelCache:
         for head in head_list:
             self.heads.setdefault(head.backbone_name, []).append(head)
 
+        self.fused_heads = {}
+        if fuse_heads and not is_fusion_available():
+            logger.warning(
+                "[cache] Fused head inference requested but 'onnx' is not installed; using per-head sessions"
+            )
+        elif fuse_heads:
+            for backbone, heads in self.heads.items():
+                groups = plan_head_fusion(heads)
+                if groups:
+                    self.fused_heads[backbone] = [ONNXFusedHeadsModel(g) for g in groups]
+                    logger.debug(
+                        "[cache] %s: fused %d of %d heads into %d graph(s)",
+                        backbone,
+                        sum(len(g) for g in groups),
+                        len(heads),
+                        len(groups),
+                    )
+
+        self.graph_cache = graph_cache
+        self.warmup_workers = max(1, warmup_workers)
+        self.last_warmup = None
+        for m in self._all_models():
+            m._graph_cache = graph_cache
+        for name, threads in (session_threads or {}).items():
+            if name in self.backbones:
+                self.backbones[name]._threads = threads
+
         logger.debug(
             "[cache] Discovered %d backbone(s), %d head(s) in %s (device=%s)",
             len(self.backbones),
@@ -119,6 +189,9 @@ class ONNXModelCache:
         yield from self.backbones.values()
         for head_list in self.heads.values():
             yield from head_list
+        # Fused groups last: their load-time parity check needs the heads loaded
+        for fused_list in self.fused_heads.values():
+            yield from fused_list
 
     # ------------------------------------------------------------------
     # warm
@@ -128,10 +201,11 @@ class ONNXModelCache:
     def warm(self) -> bool:
         """``True`` when every model in the cache has a loaded ONNX session.
 
-        Setting to ``True`` loads all unloaded sessions.  Models that are
-        rejected by the VRAM coordinator (GPU headroom exhausted) are
-        automatically retried on CPU.  Worker identity and database are
-        retrieved from the process-local registry; no arguments required.
+        Setting to ``True`` loads all unloaded sessions, up to
+        :attr:`warmup_workers` at a time.  Models that are rejected by the
+        VRAM coordinator (GPU headroom exhausted) are loaded on CPU.  Worker
+        identity and database are retrieved from the process-local registry;
+        no arguments required.
 
         Setting to ``False`` unloads all sessions immediately.
 
@@ -142,22 +216,19 @@ class ONNXModelCache:
     @warm.setter
     def warm(self, value: bool) -> None:
         if value:
-            loaded = 0
-            for m in self._all_models():
-                if m._session is not None:
-                    continue
-                try:
-                    m.device = self._device
-                except VramFitError:
-                    logger.info(
-                        "[cache] VRAM coordinator rejected GPU for %s — loaded on CPU instead",
-                        m._path,
-                    )
-                loaded += 1
+            # Fused groups in a second stage: their parity check needs the heads loaded
+            fused = {id(f) for fused_list in self.fused_heads.values() for f in fused_list}
+            pending = [m for m in self._all_models() if m._session is None]
+            stages = [[m for m in pending if id(m) not in fused], [m for m in pending if id(m) in fused]]
+            report = warm_models(stages, self._device, max_workers=self.warmup_workers)
+            self.last_warmup = report
             logger.debug(
-                "[cache] Warmed %d model(s) (preferred device=%s)",
-                loaded,
+                "[cache] Warmed %s (preferred device=%s, moved to CPU: %d, plan=%d ms, cached graphs: %s)",
+                build_warmup_summary(report.load_ms, report.wall_ms, report.workers),
                 self._device,
+                report.gpu_rejected,
+                report.plan_ms,
+                f"{self.graph_cache.hits} hit / {self.graph_cache.misses} miss" if self.graph_cache else "off",
             )
         else:
             for m in self._all_models():
@@ -18,6 +18,8 @@ import logging
 import os
 from typing import TYPE_CHECKING, Any
 
+from nomarr.helpers.dto.ml_dto import HeadSuiteDelta, ModelSuiteManifest
+
 if TYPE_CHECKING:
     from nomarr.persistence.db import Database
 
@@ -390,6 +392,60 @@ def compute_model_suite_hash(
         return "unknown"
 
 
+def compute_model_suite_manifest(models_dir: str) -> ModelSuiteManifest:
+    """List every installed ``*.onnx`` file, split into backbones and heads.
+
+    Uses the same ``(relative_path, file_size)`` signature as
+    :func:`compute_model_suite_hash`, so two manifests differ exactly when the
+    suite hashes do.
+
+    Args:
+        models_dir: Directory containing model files.
+
+    Returns:
+        ModelSuiteManifest (empty when the directory has no models).
+
+    """
+    backbones: dict[str, int] = {}
+    heads: dict[str, int] = {}
+    for root, _dirs, files in sorted(os.walk(models_dir)):
+        for filename in sorted(files):
+            if not filename.endswith(".onnx"):
+                continue
+            filepath = os.path.join(root, filename)
+            rel_path = os.path.relpath(filepath, models_dir).replace(os.sep, "/")
+            try:
+                size = os.path.getsize(filepath)
+            except OSError:
+                continue
+            parts = rel_path.split("/")
+            if len(parts) >= 4 and parts[1] == "heads":
+                heads[rel_path] = size
+            else:
+                backbones[rel_path] = size
+    return ModelSuiteManifest(backbones=backbones, heads=heads)
+
+
+def diff_head_suites(previous: ModelSuiteManifest, current: ModelSuiteManifest) -> HeadSuiteDelta | None:
+    """Compare two suite manifests for a head-only change.
+
+    Args:
+        previous: Manifest recorded when the library was last tagged.
+        current: Manifest of the installed models.
+
+    Returns:
+        The added/replaced and removed heads, or ``None`` when any backbone
+        graph differs (stored embeddings are then invalid and every file needs
+        full reprocessing).
+
+    """
+    if previous.backbones != current.backbones:
+        return None
+    changed = sorted(path for path, size in current.heads.items() if previous.heads.get(path) != size)
+    removed = sorted(path for path in previous.heads if path not in current.heads)
+    return HeadSuiteDelta(changed_heads=changed, removed_heads=removed)
+
+
 def discover_backbone_models(models_dir: str) -> list[Any]:
     """Discover backbone ONNX models and return ready-to-use ONNXBackboneModel instances.
 
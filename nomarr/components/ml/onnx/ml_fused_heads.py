@@ -0,0 +1,334 @@
+"""ONNXFusedHeadsModel: all heads of one backbone as a single multi-output graph.
+
+The per-head path runs one ONNX session per head, so every head re-reads the
+same embedding matrix and pays its own ``session.run`` overhead per batch.
+:class:`ONNXFusedHeadsModel` builds one graph locally from the existing head
+``.onnx`` files: every head subgraph is copied with a unique name prefix and
+wired to a single shared ``embeddings`` input, and each head's first output
+becomes one output of the fused graph.  One ``session.run`` per batch then
+produces the scores of every head.
+
+No operator is added, removed or rewritten, and batching matches
+:class:`ONNXHeadModel` (same batch size, same session options), so the fused
+scores are bit-for-bit equal to the per-head scores.  This is checked on every
+load: a fused model whose output differs from its heads on a probe batch is
+marked unverified and the pipeline keeps using the per-head sessions.
+
+Building the graph needs the optional ``onnx`` package; without it
+:func:`is_fusion_available` is ``False`` and callers stay on the per-head path.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from nomarr.components.ml.onnx.ml_base import BaseONNXModel
+from nomarr.components.ml.onnx.ml_head import _HEAD_BATCH_SIZE
+from nomarr.components.ml.onnx.ml_session_comp import _run_in_batches
+
+if TYPE_CHECKING:
+    from nomarr.components.ml.onnx.ml_head import ONNXHeadModel
+
+try:
+    import onnx as _onnx
+except ImportError:
+    _onnx = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+FUSED_INPUT_NAME = "embeddings"
+"""Name of the shared input tensor of a fused head graph."""
+
+_PARITY_PROBE_ROWS = 2 * _HEAD_BATCH_SIZE + 3
+"""Probe rows for the load-time parity check: two full batches plus a partial one."""
+
+
+def is_fusion_available() -> bool:
+    """Return True if the ``onnx`` package needed to build fused graphs is installed."""
+    return _onnx is not None
+
+
+# ---------------------------------------------------------------------------
+# Graph construction
+# ---------------------------------------------------------------------------
+
+
+def _graph_input(graph: Any) -> Any:
+    """Return the single non-initializer input of *graph*, or None."""
+    initializers = {init.name for init in graph.initializer}
+    inputs = [i for i in graph.input if i.name not in initializers]
+    return inputs[0] if len(inputs) == 1 else None
+
+
+def _fusion_signature(model: Any) -> tuple[Any, ...] | None:
+    """Key under which heads can share one graph, or None if *model* cannot be fused.
+
+    Heads are fusable together when they declare the same opsets (so every
+    operator keeps its exact semantics), take one float input of the same
+    width, and contain no control-flow subgraphs.
+    """
+    graph = model.graph
+    graph_input = _graph_input(graph)
+    if graph_input is None or not graph.output:
+        return None
+    if any(
+        attr.type in (_onnx.AttributeProto.GRAPH, _onnx.AttributeProto.GRAPHS)
+        for n in graph.node
+        for attr in n.attribute
+    ):
+        return None
+    tensor_type = graph_input.type.tensor_type
+    dims = tensor_type.shape.dim
+    if len(dims) != 2 or not dims[1].HasField("dim_value"):
+        return None
+    opsets = tuple(sorted((o.domain, o.version) for o in model.opset_import))
+    return (opsets, tensor_type.elem_type, dims[1].dim_value)
+
+
+def plan_head_fusion(heads: list[ONNXHeadModel]) -> list[list[ONNXHeadModel]]:
+    """Partition *heads* into groups that can each be fused into one graph.
+
+    Only groups of two or more heads are returned; heads that are alone in
+    their group, or cannot be fused at all, are left to the per-head path.
+
+    Args:
+        heads: Heads of a single backbone.
+
+    Returns:
+        Head groups in first-seen order.  Empty when ``onnx`` is unavailable.
+    """
+    if _onnx is None:
+        return []
+    groups: dict[tuple[Any, ...], list[ONNXHeadModel]] = {}
+    for head in heads:
+        try:
+            signature = _fusion_signature(_onnx.load(head._path, load_external_data=False))
+        except Exception as e:
+            logger.debug("[fused] Cannot inspect %s for fusion: %s", head._path, e)
+            continue
+        if signature is None:
+            logger.debug("[fused] %s is not fusable (inputs, shape or subgraphs)", head.name)
+            continue
+        groups.setdefault(signature, []).append(head)
+    return [group for group in groups.values() if len(group) >= 2]
+
+
+def build_fused_head_graph(head_paths: list[str]) -> bytes:
+    """Merge head models into one serialized multi-output ONNX model.
+
+    Every node, initializer and intermediate tensor of head *i* is renamed
+    with the prefix ``h{i}__``; each head's input is replaced by the shared
+    :data:`FUSED_INPUT_NAME` input, and the head's first output becomes fused
+    output ``h{i}__<name>``.
+
+    Args:
+        head_paths: Head ``.onnx`` files, all with the same fusion signature
+            (see :func:`plan_head_fusion`).
+
+    Returns:
+        Serialized ``ModelProto``.
+
+    Raises:
+        RuntimeError: If ``onnx`` is not installed.
+        ValueError: If the heads cannot share one graph.
+    """
+    if _onnx is None:
+        msg = "onnx is not installed; fused head graphs are unavailable"
+        raise RuntimeError(msg)
+    from onnx import compose, helper
+
+    models = [_onnx.load(path) for path in head_paths]
+    signatures = {_fusion_signature(m) for m in models}
+    if len(signatures) != 1 or None in signatures:
+        msg = f"Heads cannot be fused into one graph: {head_paths}"
+        raise ValueError(msg)
+
+    first_input = _graph_input(models[0].graph)
+    shared_input = helper.make_tensor_value_info(
+        FUSED_INPUT_NAME,
+        first_input.type.tensor_type.elem_type,
+        [None, first_input.type.tensor_type.shape.dim[1].dim_value],
+    )
+    nodes: list[Any] = []
+    initializers: list[Any] = []
+    value_infos: list[Any] = []
+    outputs: list[Any] = []
+    for i, model in enumerate(models):
+        prefix = f"h{i}__"
+        prefixed = compose.add_prefix(model, prefix)
+        graph = prefixed.graph
+        head_input = _graph_input(graph).name
+        for node in graph.node:
+            for j, name in enumerate(node.input):
+                if name == head_input:
+                    node.input[j] = FUSED_INPUT_NAME
+            nodes.append(node)
+        initializers.extend(graph.initializer)
+        value_infos.extend(graph.value_info)
+        outputs.append(graph.output[0])
+
+    fused_graph = helper.make_graph(
+        nodes,
+        "nomarr_fused_heads",
+        [shared_input],
+        outputs,
+        initializer=initializers,
+        value_info=value_infos,
+    )
+    fused = helper.make_model(fused_graph, opset_imports=list(models[0].opset_import))
+    fused.ir_version = max(m.ir_version for m in models)
+    _onnx.checker.check_model(fused)
+    return bytes(fused.SerializeToString())
+
+
+# ---------------------------------------------------------------------------
+# Model wrapper
+# ---------------------------------------------------------------------------
+
+
+class ONNXFusedHeadsModel(BaseONNXModel):
+    """One ONNX session computing the scores of several heads of a backbone.
+
+    The member :class:`ONNXHeadModel` instances stay authoritative for labels,
+    tag keys and decisions; this model only replaces their inference step.
+
+    Example usage::
+
+        fused = ONNXFusedHeadsModel(cache.heads["effnet"])
+        fused.load("cpu")  # builds the graph, then checks parity
+        if fused.verified:
+            scores = fused.run_split(embeddings)  # {head_name: (n, k) array}
+    """
+
+    backbone_name: str
+    """Backbone shared by all member heads."""
+
+    heads: list[ONNXHeadModel]
+    """Member heads, in fused-output order."""
+
+    verified: bool
+    """True once the loaded session matched every member head on the parity probe."""
+
+    def __init__(self, heads: list[ONNXHeadModel]) -> None:
+        """Initialise the wrapper; the graph is built on first :meth:`load`.
+
+        Args:
+            heads: Two or more heads of one backbone with the same fusion
+                signature (see :func:`plan_head_fusion`).
+        """
+        digest = hashlib.sha1("\n".join(h._path for h in heads).encode(), usedforsecurity=False).hexdigest()[:10]
+        heads_dir = os.path.dirname(os.path.dirname(heads[0]._path))
+        super().__init__(os.path.join(heads_dir, f"fused-{len(heads)}-{digest}.onnx"))
+        self.backbone_name = heads[0].backbone_name
+        self.heads = list(heads)
+        self.verified = False
+        self._graph: bytes | None = None
+        self._output_nodes: list[str] = []
+        self._offsets: list[int] = []
+
+    def _model_bytes(self) -> bytes | None:
+        if self._graph is None:
+            self._graph = build_fused_head_graph([h._path for h in self.heads])
+        return self._graph
+
+    def _on_session_loaded(self) -> None:
+        """Resolve output offsets and verify the fused session against the heads.
+
+        The graph itself is built (once) by :meth:`_model_bytes` when the
+        session is created.
+        """
+        assert self._session is not None  # set by load_with_placement()
+        self._output_nodes = [o.name for o in self._session.get_outputs()]
+        # Output widths may be symbolic in the graph; resolve them from one row.
+        dim = int(self._session.get_inputs()[0].shape[1])
+        results = self._session.run(self._output_nodes, {FUSED_INPUT_NAME: np.zeros((1, dim), dtype=np.float32)})
+        self._offsets = [0]
+        for r in results:
+            self._offsets.append(self._offsets[-1] + int(np.asarray(r).reshape(1, -1).shape[1]))
+        self.verified = self._check_parity()
+
+    def unload(self) -> None:
+        """Unload the fused session; the built graph is kept for the next load."""
+        super().unload()
+        self.verified = False
+
+    def _check_parity(self) -> bool:
+        """Compare fused and per-head scores on a fixed probe batch, bit for bit.
+
+        Heads without a loaded session cannot be compared, so the fused model
+        stays unverified until it is loaded after its heads.
+        """
+        if any(h._session is None for h in self.heads):
+            logger.debug("[fused] %s: heads not loaded, skipping parity check", self.name)
+            return False
+        assert self._session is not None
+        dim = int(self._session.get_inputs()[0].shape[1])
+        probe = np.random.default_rng(0).standard_normal((_PARITY_PROBE_ROWS, dim)).astype(np.float32)
+        try:
+            fused = self.run_split(probe)
+            mismatched = [h.name for h in self.heads if not np.array_equal(fused[h.name], h.run(probe))]
+        except Exception as e:
+            logger.warning("[fused] %s parity check failed: %s — using per-head inference", self.name, e)
+            return False
+        if mismatched:
+            logger.warning(
+                "[fused] %s differs from per-head output for %s — using per-head inference",
+                self.name,
+                ", ".join(mismatched),
+            )
+            return False
+        logger.debug("[fused] %s verified bit-exact for %d heads", self.name, len(self.heads))
+        return True
+
+    def _run(self, embeddings: np.ndarray) -> np.ndarray:
+        """Run all member heads on *embeddings* in one session call per batch.
+
+        Args:
+            embeddings: Float32 array of shape ``(n_patches, embed_dim)``.
+
+        Returns:
+            Float32 array ``(n_patches, sum(num_classes))``: member head
+            scores side by side, in :attr:`heads` order.
+
+        Raises:
+            RuntimeError: If the model has not been loaded.
+        """
+        if self._session is None:
+            msg = "ONNXFusedHeadsModel is not loaded — call load() first"
+            raise RuntimeError(msg)
+
+        session = self._session
+        output_nodes = self._output_nodes
+
+        def _session_fn(batch: np.ndarray) -> np.ndarray:
+            results = session.run(output_nodes, {FUSED_INPUT_NAME: batch.astype(np.float32)})
+            columns = [np.asarray(r, dtype=np.float32) for r in results]
+            return np.hstack([c.reshape(c.shape[0], -1) for c in columns])
+
+        return _run_in_batches(_session_fn, embeddings, _HEAD_BATCH_SIZE)
+
+    def run_split(self, embeddings: np.ndarray) -> dict[str, np.ndarray]:
+        """Run the fused graph and return each member head's score matrix.
+
+        Args:
+            embeddings: Float32 array of shape ``(n_patches, embed_dim)``.
+
+        Returns:
+            Mapping of head name to a contiguous ``(n_patches, num_classes)``
+            array, identical to what ``head.run(embeddings)`` returns.
+        """
+        scores = self.run(embeddings)
+        return {
+            head.name: np.ascontiguousarray(scores[:, self._offsets[i] : self._offsets[i + 1]])
+            for i, head in enumerate(self.heads)
+        }
+
+    @property
+    def name(self) -> str:
+        """Display name: backbone plus member count."""
+        return f"fused_{self.backbone_name}_{len(self.heads)}"
@@ -0,0 +1,200 @@
+"""On-disk cache of ONNX Runtime optimized session graphs.
+
+Creating an ``InferenceSession`` from a raw ``.onnx`` file runs the full graph
+optimizer (constant folding, node fusions, layout transforms) every time.  With
+several backbones and dozens of heads this dominates worker cold start and is
+paid again after every idle eviction of :class:`ONNXModelCache`.
+
+:class:`SessionGraphCache` stores the graph ORT produces with
+``optimized_model_filepath`` and hands it back on the next session creation,
+which then loads with optimizations disabled.  The saved graph is the exact
+graph the optimizer would build, so outputs are bit-identical.
+
+Entries are keyed by everything that shapes the optimized graph:
+
+- SHA-256 of the model file (or of the in-memory bytes for built graphs),
+- ONNX Runtime version,
+- execution providers,
+- host CPU signature (``ORT_ENABLE_ALL`` layout transforms are ISA-specific).
+
+Entries live under ``<cache_dir>/<model_suite_hash>/``.  Constructing a cache
+for a suite hash removes the directories of every other suite, so replacing or
+adding a model invalidates the whole cache on the next worker start.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import platform
+import shutil
+import threading
+import uuid
+from functools import cache
+from pathlib import Path
+
+from nomarr.components.ml.onnx.ml_session_comp import get_version
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+@cache
+def _host_signature() -> str:
+    """Short digest of the CPU architecture and instruction-set flags."""
+    flags = ""
+    try:
+        for line in Path("/proc/cpuinfo").read_text().splitlines():
+            if line.startswith(("flags", "Features")):
+                flags = line.split(":", 1)[1].strip()
+                break
+    except OSError:
+        flags = platform.processor()
+    return hashlib.sha256(f"{platform.machine()}|{flags}".encode()).hexdigest()[:12]
+
+
+class SessionGraphCache:
+    """Directory of pre-optimized ONNX graphs for one model suite.
+
+    Thread-safe: entries are written to a unique temp file and published with
+    an atomic rename, so concurrent workers sharing *cache_dir* never observe
+    a partial graph.
+
+    Attributes:
+        hits: Sessions created from a cached graph.
+        misses: Sessions optimized from the raw model (and cached).
+    """
+
+    def __init__(self, cache_dir: str, suite_hash: str) -> None:
+        """Open (and create) the cache directory for *suite_hash*.
+
+        Directories of other suite hashes under *cache_dir* are removed.
+
+        Args:
+            cache_dir: Parent directory shared by all suites.
+            suite_hash: Model suite hash (see ``compute_model_suite_hash``).
+        """
+        self._cache_dir = cache_dir
+        self._root = os.path.join(cache_dir, suite_hash)
+        self._suite_hash = suite_hash
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self._root, exist_ok=True)
+        self._prune_stale_suites()
+
+    @property
+    def root(self) -> str:
+        """Directory holding this suite's entries."""
+        return self._root
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def entry_path(self, model_path: str, model_bytes: bytes | None, providers: list[str]) -> str | None:
+        """Return the cache file for a model/provider combination.
+
+        Args:
+            model_path: Path of the ``.onnx`` file (or virtual path for built graphs).
+            model_bytes: Serialized model when the graph is built in memory.
+            providers: Execution provider names in priority order.
+
+        Returns:
+            Absolute entry path (which may not exist yet), or ``None`` when the
+            model file cannot be read.
+        """
+        try:
+            digest = (
+                hashlib.sha256(model_bytes).hexdigest() if model_bytes is not None else self._file_digest(model_path)
+            )
+        except OSError as e:
+            logger.debug("[graph-cache] Cannot hash %s: %s", model_path, e)
+            return None
+        key = hashlib.sha256(
+            f"{digest}|{get_version()}|{','.join(providers)}|{_host_signature()}".encode()
+        ).hexdigest()[:24]
+        stem = Path(model_path).stem
+        return os.path.join(self._root, f"{stem}-{key}.onnx")
+
+    def _file_digest(self, model_path: str) -> str:
+        """SHA-256 of a model file, memoized per (path, size, mtime)."""
+        st = os.stat(model_path)
+        memo_key = (model_path, st.st_size, st.st_mtime_ns)
+        with self._lock:
+            cached = self._digests.get(memo_key)
+        if cached is not None:
+            return cached
+        h = hashlib.sha256()
+        with open(model_path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_BYTES):
+                h.update(chunk)
+        digest = h.hexdigest()
+        with self._lock:
+            self._digests[memo_key] = digest
+        return digest
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    def temp_path(self, entry: str) -> str:
+        """Unique sibling path an optimized graph is written to before publishing."""
+        return f"{entry}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+
+    def commit(self, temp: str, entry: str) -> bool:
+        """Atomically publish *temp* as *entry*.
+
+        Returns:
+            ``True`` when the entry is in place, ``False`` if ORT wrote nothing
+            or the rename failed (the temp file is removed either way).
+        """
+        try:
+            if not os.path.exists(temp) or os.path.getsize(temp) == 0:
+                return False
+            os.replace(temp, entry)
+            return True
+        except OSError as e:
+            logger.debug("[graph-cache] Could not publish %s: %s", entry, e)
+            return False
+        finally:
+            _remove_quietly(temp)
+
+    def discard(self, entry: str) -> None:
+        """Remove an entry that failed to load (or a temp file that was never committed)."""
+        _remove_quietly(entry)
+
+    def record(self, *, hit: bool) -> None:
+        """Count a session creation served from (``hit``) or added to the cache."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def _prune_stale_suites(self) -> None:
+        """Remove entry directories left by other model suites."""
+        try:
+            siblings = list(os.scandir(self._cache_dir))
+        except OSError:
+            return
+        for entry in siblings:
+            if entry.is_dir(follow_symlinks=False) and entry.name != self._suite_hash:
+                shutil.rmtree(entry.path, ignore_errors=True)
+                logger.info("[graph-cache] Removed optimized graphs of stale model suite %s", entry.name)
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug("[graph-cache] Could not remove %s: %s", path, e)
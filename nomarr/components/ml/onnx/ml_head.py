@@ -10,16 +10,12 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING
 
 import numpy as np
 
 from nomarr.components.ml.onnx.ml_base import BaseONNXModel
 from nomarr.components.ml.onnx.ml_session_comp import _run_in_batches
 
-if TYPE_CHECKING:
-    from nomarr.components.ml.onnx.ml_base import DevicePlacement
-
 logger = logging.getLogger(__name__)
 
 _HEAD_BATCH_SIZE = 11
@@ -126,21 +122,13 @@ class ONNXHeadModel(BaseONNXModel):
         self.input_dim = None
         self.num_classes = None
 
-    def load(self, device: DevicePlacement) -> None:
-        """Load the ONNX session and resolve tensor metadata.
-
-        After calling :meth:`load`, ``input_node``, ``output_node``,
-        ``input_dim``, and ``num_classes`` are all populated from the session.
+    def _on_session_loaded(self) -> None:
+        """Resolve tensor metadata from the freshly loaded session.
 
-        Args:
-            request: Load parameters forwarded to :meth:`BaseONNXModel.load`.
-
-        Raises:
-            VramFitError: If ``request.device == "gpu"`` and the VRAM
-                coordinator rejects the GPU placement request.
+        After :meth:`load`, ``input_node``, ``output_node``, ``input_dim``,
+        and ``num_classes`` are all populated from the session.
         """
-        super().load(device)
-        assert self._session is not None  # guaranteed by super().load()
+        assert self._session is not None  # set by load_with_placement()
         inputs = self._session.get_inputs()
         outputs = self._session.get_outputs()
         self.input_node = inputs[0].name
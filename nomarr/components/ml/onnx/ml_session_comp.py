@@ -10,11 +10,25 @@ Each GPU session accepts an explicit ``vram_limit_bytes`` at creation time.
 The value comes from per-model VRAM probe measurements stored in meta
 (see ml_vram_probe_comp.py / Plan A).  When not provided, no explicit
 ``gpu_mem_limit`` is set and ONNX Runtime allocates as needed.
+
+Optimized-graph cache
+---------------------
+When a :class:`~nomarr.components.ml.onnx.ml_graph_cache_comp.SessionGraphCache`
+is passed, the graph ORT optimizes on first creation is saved to disk and
+later sessions load it with optimizations disabled (see ml_graph_cache_comp.py).
+
+CPU threading
+-------------
+Every session gets a small, fixed thread pool (:class:`SessionThreading`,
+default two intra-op threads).  On CPU-only hosts the backbone sessions can be
+given a calibrated pool instead (see ml_thread_tuning_comp.py).
 """
 
 from __future__ import annotations
 
 import logging
+import os
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -26,6 +40,8 @@ if TYPE_CHECKING:
 
     import onnxruntime as ort
 
+    from nomarr.components.ml.onnx.ml_graph_cache_comp import SessionGraphCache
+
 try:
     import onnxruntime as _ort
 except ImportError:
@@ -37,6 +53,35 @@ except ImportError:
 # ---------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class SessionThreading:
+    """CPU thread-pool sizes for one ONNX Runtime session.
+
+    Attributes:
+        intra_op: Threads cooperating inside one operator.
+        inter_op: Threads running independent operators.  Sessions use
+            sequential execution, so 1 is the only useful value today.
+        allow_spinning: Let idle intra-op threads busy-wait for the next
+            operator.  Cuts latency when every thread owns a core; when
+            threads outnumber cores the spinning starves the threads doing
+            real work.
+    """
+
+    intra_op: int = 2
+    inter_op: int = 1
+    allow_spinning: bool = True
+
+
+def default_session_threading() -> SessionThreading:
+    """Thread pool used when no calibrated setting applies.
+
+    Two intra-op threads per session; spinning is turned off when the host
+    has fewer CPUs than that, where it slows session creation and inference
+    by an order of magnitude.
+    """
+    return SessionThreading(intra_op=2, inter_op=1, allow_spinning=(os.cpu_count() or 1) >= 2)
+
+
 def is_available() -> bool:
     """Return True if onnxruntime is installed and importable.
 
@@ -79,6 +124,9 @@ def create_session(
     model_path: str,
     device: str = "cpu",
     vram_limit_bytes: int | None = None,
+    model_bytes: bytes | None = None,
+    graph_cache: SessionGraphCache | None = None,
+    threads: SessionThreading | None = None,
 ) -> ort.InferenceSession:
     """Create an ONNX Runtime InferenceSession for the given model file.
 
@@ -96,19 +144,27 @@ def create_session(
         vram_limit_bytes: Optional explicit GPU memory limit in bytes.  When
             provided and *device* is ``"gpu"``, applied directly as
             ``gpu_mem_limit`` in the CUDA provider options.
+        model_bytes: Optional serialized model built in memory (e.g. a fused
+            head graph).  When provided the session is created from these
+            bytes and *model_path* is only used for logging.
+        graph_cache: Optional on-disk cache of optimized graphs.  A cached
+            graph for this model, ORT version and provider list is loaded
+            instead of re-optimizing; otherwise the optimized graph is saved
+            for next time.
+        threads: CPU thread-pool sizes.  Defaults to
+            :func:`default_session_threading`.
 
     Returns:
         A ready-to-use ``onnxruntime.InferenceSession``.
 
     Raises:
         RuntimeError: If onnxruntime is not installed.
-        FileNotFoundError: If *model_path* does not exist.
+        FileNotFoundError: If *model_path* does not exist and no
+            *model_bytes* are given.
     """
     require()
 
-    import os
-
-    if not os.path.exists(model_path):
+    if model_bytes is None and not os.path.exists(model_path):
         msg = f"ONNX model file not found: {model_path}"
         raise FileNotFoundError(msg)
 
@@ -137,21 +193,18 @@ def create_session(
             )
 
     providers.append("CPUExecutionProvider")
-
-    sess_options = _ort.SessionOptions()  # type: ignore[union-attr]
-    sess_options.log_severity_level = 3  # ERROR only — suppress ONNX RT info/warnings
-    # Cap thread pools per session.  Head models are tiny (< 1MB) and gain
-    # nothing from parallelism; backbone runs on GPU so CPU threads are idle.
-    # Without limits, ORT spawns one pool per session x nproc threads, which
-    # balloons thread-stack RSS into the gigabytes (nproc x sessions).
-    sess_options.intra_op_num_threads = 2
-    sess_options.inter_op_num_threads = 1
-
-    session: ort.InferenceSession = _ort.InferenceSession(  # type: ignore[union-attr]
-        model_path,
-        sess_options=sess_options,
-        providers=providers,
-    )
+    if threads is None:
+        threads = default_session_threading()
+
+    source: str | bytes = model_bytes if model_bytes is not None else model_path
+    if graph_cache is not None:
+        session = _create_cached_session(graph_cache, model_path, model_bytes, providers, threads)
+    else:
+        session = _ort.InferenceSession(  # type: ignore[union-attr]
+            source,
+            sess_options=_build_session_options(threads),
+            providers=providers,
+        )
 
     logger.debug(
         "[onnx] Session created: %s (providers=%s)",
@@ -166,6 +219,70 @@ def create_session(
 # ---------------------------------------------------------------------------
 
 
+def _build_session_options(threads: SessionThreading) -> ort.SessionOptions:
+    """Session options shared by every nomarr session."""
+    sess_options = _ort.SessionOptions()  # type: ignore[union-attr]
+    sess_options.log_severity_level = 3  # ERROR only — suppress ONNX RT info/warnings
+    # Always cap thread pools per session.  Head models are tiny (< 1MB) and
+    # gain nothing from parallelism; backbone runs on GPU so CPU threads are idle.
+    # Without limits, ORT spawns one pool per session x nproc threads, which
+    # balloons thread-stack RSS into the gigabytes (nproc x sessions).
+    sess_options.intra_op_num_threads = threads.intra_op
+    sess_options.inter_op_num_threads = threads.inter_op
+    sess_options.add_session_config_entry("session.intra_op.allow_spinning", "1" if threads.allow_spinning else "0")
+    return sess_options
+
+
+def _create_cached_session(
+    graph_cache: SessionGraphCache,
+    model_path: str,
+    model_bytes: bytes | None,
+    providers: list[str | tuple[str, dict[str, object]]],
+    threads: SessionThreading,
+) -> ort.InferenceSession:
+    """Create a session through the optimized-graph cache.
+
+    A hit loads the saved graph with ``ORT_DISABLE_ALL`` (the graph is already
+    optimized).  A miss optimizes the raw model as usual and has ORT write the
+    result to a temp file that is then published atomically.  Unreadable
+    entries are discarded; any cache failure falls back to a plain session.
+    """
+    source: str | bytes = model_bytes if model_bytes is not None else model_path
+    provider_names = [p if isinstance(p, str) else p[0] for p in providers]
+    entry = graph_cache.entry_path(model_path, model_bytes, provider_names)
+    if entry is None:
+        return _ort.InferenceSession(source, sess_options=_build_session_options(threads), providers=providers)  # type: ignore[union-attr]
+
+    if os.path.exists(entry):
+        sess_options = _build_session_options(threads)
+        sess_options.graph_optimization_level = _ort.GraphOptimizationLevel.ORT_DISABLE_ALL  # type: ignore[union-attr]
+        try:
+            session: ort.InferenceSession = _ort.InferenceSession(  # type: ignore[union-attr]
+                entry, sess_options=sess_options, providers=providers
+            )
+        except Exception as e:
+            logger.warning("[onnx] Discarding unreadable optimized graph for %s: %s", model_path, e)
+            graph_cache.discard(entry)
+        else:
+            graph_cache.record(hit=True)
+            logger.debug("[onnx] Loaded optimized graph for %s from %s", model_path, entry)
+            return session
+
+    temp = graph_cache.temp_path(entry)
+    sess_options = _build_session_options(threads)
+    sess_options.optimized_model_filepath = temp
+    try:
+        session = _ort.InferenceSession(source, sess_options=sess_options, providers=providers)  # type: ignore[union-attr]
+    except Exception as e:
+        # Some providers cannot serialize their optimized graph; retry without saving
+        graph_cache.discard(temp)
+        logger.debug("[onnx] Could not save optimized graph for %s: %s", model_path, e)
+        return _ort.InferenceSession(source, sess_options=_build_session_options(threads), providers=providers)  # type: ignore[union-attr]
+    if graph_cache.commit(temp, entry):
+        graph_cache.record(hit=False)
+    return session
+
+
 def _build_cuda_provider_options(vram_limit_bytes: int | None) -> dict[str, object]:
     """Build CUDA provider options dict.
 
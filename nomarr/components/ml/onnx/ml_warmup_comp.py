@@ -0,0 +1,219 @@
+"""Parallel, metadata-batched warm-up of ONNX model sessions.
+
+Loading models one at a time through :meth:`BaseONNXModel.load` costs one
+metadata query per model and, on GPU, one coordinator round-trip (fresh
+``nvidia-smi`` reading plus an AQL fit-check) per model, and builds every
+session serially.  :func:`warm_models` does the same work in three steps:
+
+1. **Plan** — read every model's VRAM limit in one ``meta`` query and register
+   all GPU promises in one coordinator transaction
+   (:func:`register_vram_promises`).  Models the coordinator rejects are
+   planned on CPU, exactly as the sequential path falls back.
+2. **Build** — create sessions concurrently on a bounded thread pool.  ONNX
+   Runtime releases the GIL while it parses and optimizes a graph, so builds
+   scale with the thread budget.
+3. **Report** — per-model load times (monotonic, via :func:`internal_ms`) are
+   returned in a :class:`WarmupReport`.
+
+Models are loaded in *stages*: every stage completes before the next starts.
+:class:`ONNXModelCache` puts fused head groups in a second stage because their
+load-time parity check runs the already-loaded heads.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from nomarr.components.ml.onnx.ml_base import fetch_vram_limits
+from nomarr.components.ml.resources import ml_vram_coordinator_comp as _coordinator
+from nomarr.components.ml.resources import ml_worker_context_comp as _worker_ctx
+from nomarr.helpers.time_helper import internal_ms
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from nomarr.components.ml.onnx.ml_base import BaseONNXModel, DevicePlacement
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for the automatic build budget: beyond a few concurrent builds
+# the disk and the per-session intra-op threads saturate the CPU anyway.
+_MAX_AUTO_WARMUP_WORKERS = 4
+
+
+@dataclass
+class ModelLoadTiming:
+    """Load time of one model session."""
+
+    path: str
+    device: DevicePlacement
+    load_ms: int
+
+
+@dataclass
+class WarmupReport:
+    """Outcome of one :func:`warm_models` call.
+
+    Attributes:
+        timings: Per-model load times, in completion order.
+        wall_ms: Wall-clock time of the whole warm-up (planning included).
+        plan_ms: Time spent reading metadata and registering VRAM promises.
+        workers: Concurrent session builds allowed.
+        gpu_rejected: Models the VRAM coordinator moved from GPU to CPU.
+    """
+
+    timings: list[ModelLoadTiming] = field(default_factory=list)
+    wall_ms: int = 0
+    plan_ms: int = 0
+    workers: int = 1
+    gpu_rejected: int = 0
+
+    @property
+    def load_ms(self) -> dict[str, float]:
+        """Load time (ms) keyed by model path, for timing summaries."""
+        return {t.path: float(t.load_ms) for t in self.timings}
+
+
+def default_warmup_workers() -> int:
+    """Automatic session-build budget: half the CPUs, between 1 and 4."""
+    return max(1, min(_MAX_AUTO_WARMUP_WORKERS, (os.cpu_count() or 1) // 2))
+
+
+def plan_placements(
+    models: Sequence[BaseONNXModel],
+    device: DevicePlacement,
+) -> dict[str, tuple[DevicePlacement, int | None]]:
+    """Decide the device and VRAM cap of every model with batched DB calls.
+
+    On CPU, or when no worker context is registered (probe processes, tests),
+    no database access happens.  Otherwise all VRAM limits are read in one
+    metadata query and all promises are registered in one coordinator
+    transaction, in *models* order (the order sequential loading would use).
+
+    Args:
+        models: Models to place.
+        device: Preferred device.
+
+    Returns:
+        ``(device, vram_limit_bytes)`` keyed by model path.  Models rejected by
+        the coordinator are placed on CPU.
+    """
+    paths = [m._path for m in models]
+    if device != "gpu":
+        return dict.fromkeys(paths, (device, None))
+    ctx = _worker_ctx.get_worker_context()
+    if ctx is None:
+        return dict.fromkeys(paths, (device, None))
+
+    db, worker_id = ctx
+    limits = fetch_vram_limits(db, paths)
+    admitted = _coordinator.register_vram_promises(
+        db,
+        worker_id,
+        os.getpid(),
+        {p: _limit_mb(limits[p]) for p in paths},
+    )
+    placements: dict[str, tuple[DevicePlacement, int | None]] = {}
+    for p in paths:
+        if admitted.get(p, False):
+            placements[p] = ("gpu", limits[p])
+        else:
+            logger.info("[warmup] VRAM coordinator rejected GPU for %s — loading on CPU instead", p)
+            placements[p] = ("cpu", None)
+    return placements
+
+
+def _limit_mb(limit_bytes: int | None) -> float:
+    """VRAM promise in MB for a model's recorded limit (0 when it has none)."""
+    return limit_bytes / (1024 * 1024) if limit_bytes is not None else 0.0
+
+
+def warm_models(
+    stages: Sequence[Sequence[BaseONNXModel]],
+    device: DevicePlacement,
+    *,
+    max_workers: int = 1,
+) -> WarmupReport:
+    """Load every model in *stages* with batched placement and parallel builds.
+
+    Placement for all stages is planned up front (:func:`plan_placements`).
+    Sessions within a stage are created on up to *max_workers* threads; a stage
+    starts only after the previous one has finished.
+
+    If a session fails to build, the remaining models of that stage still
+    load, later stages are skipped, GPU promises of models left without a
+    session are released, and the first error is re-raised.
+
+    Args:
+        stages: Groups of unloaded models, loaded in order.
+        device: Preferred device for every model.
+        max_workers: Concurrent session builds (at least 1).
+
+    Returns:
+        Per-model timings and totals for the warm-up.
+
+    Raises:
+        Exception: The first session build error, after cleanup.
+    """
+    start = internal_ms().value
+    workers = max(1, max_workers)
+    report = WarmupReport(workers=workers)
+    all_models = [m for stage in stages for m in stage]
+    placements = plan_placements(all_models, device)
+    report.plan_ms = internal_ms().value - start
+    report.gpu_rejected = sum(1 for placed, _ in placements.values() if placed != device)
+
+    errors: list[BaseException] = []
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="onnx-warm") if workers > 1 else None
+    try:
+        for stage in stages:
+            if errors:
+                break
+            if pool is None:
+                outcomes = [_load_one(m, placements[m._path]) for m in stage]
+            else:
+                outcomes = list(pool.map(lambda m: _load_one(m, placements[m._path]), stage))
+            for outcome in outcomes:
+                if isinstance(outcome, ModelLoadTiming):
+                    report.timings.append(outcome)
+                else:
+                    errors.append(outcome)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    report.wall_ms = internal_ms().value - start
+    if errors:
+        _release_unloaded_promises(all_models, placements)
+        raise errors[0]
+    return report
+
+
+def _load_one(model: BaseONNXModel, placement: tuple[DevicePlacement, int | None]) -> ModelLoadTiming | BaseException:
+    """Create one session; return its timing, or the error it raised."""
+    placed, vram_limit_bytes = placement
+    start = internal_ms().value
+    try:
+        model.load_with_placement(placed, vram_limit_bytes)
+    except Exception as e:
+        logger.error("[warmup] Failed to load %s on %s: %s", model._path, placed, e)
+        return e
+    return ModelLoadTiming(path=model._path, device=placed, load_ms=internal_ms().value - start)
+
+
+def _release_unloaded_promises(
+    models: Sequence[BaseONNXModel],
+    placements: dict[str, tuple[DevicePlacement, int | None]],
+) -> None:
+    """Return the VRAM promised for GPU models that ended up without a session."""
+    ctx = _worker_ctx.get_worker_context()
+    if ctx is None:
+        return
+    db, worker_id = ctx
+    for m in models:
+        if m._session is None and placements[m._path][0] == "gpu":
+            _coordinator.release_vram_promise(db, worker_id, m._path)
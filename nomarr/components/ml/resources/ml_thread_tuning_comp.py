@@ -0,0 +1,414 @@
+"""CPU thread tuning for ONNX backbone sessions.
+
+Every session is created with a fixed pool of two intra-op threads (see
+:func:`default_session_threading`).  That is the right call on GPU, where the
+CPU pools sit idle, but on a CPU-only host it ignores how many cores there are
+and how many tagger workers share them: a 32-core box running one worker
+leaves most cores idle, while eight workers on a 4-core box oversubscribe it.
+
+This component calibrates the backbone pools per host instead:
+
+- A synthetic batch of ``_BACKBONE_BATCH_SIZE`` random mel patches (shaped
+  from the backbone's preprocessing parameters) is generated in memory.
+- For a few worker counts ``W`` (1, the configured count and powers of two
+  up to the CPU count), ``W`` sessions run that batch concurrently on ``W``
+  threads for a fixed time, once per intra-op thread count (powers of two up
+  to the per-worker CPU share, capped at one NUMA node).  Sessions release
+  the GIL while running, so the threads stand in for worker processes.
+- Spinning is enabled only while threads fit on the usable CPUs; the best
+  spinning configuration is re-measured with spinning off.
+
+Results are stored in the ``meta`` collection as JSON::
+
+    ``ml_ort_threads:{host_id}:{backbone}`` -> ThreadTuningProfile
+
+``host_id`` hashes the CPU model, usable CPU count, NUMA layout and ONNX
+Runtime version, so moving to different hardware (or a new ORT) re-tunes.
+Only one worker per host calibrates (DB lock); the others wait for it so the
+measurement runs on an otherwise idle CPU.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from nomarr.components.ml.audio.ml_preprocess_comp import get_params
+from nomarr.components.ml.onnx import ml_session_comp as backend_onnx
+from nomarr.components.ml.onnx.ml_discovery_comp import discover_backbone_models
+from nomarr.components.ml.onnx.ml_session_comp import _BACKBONE_BATCH_SIZE, SessionThreading
+from nomarr.components.platform.resource_monitor_comp import get_cpu_topology
+from nomarr.helpers.dto.ml_dto import ThreadTuningCandidate, ThreadTuningProfile
+from nomarr.helpers.time_helper import internal_ms, now_ms
+
+if TYPE_CHECKING:
+    import onnxruntime as ort
+
+    from nomarr.persistence.db import Database
+
+logger = logging.getLogger(__name__)
+
+# Meta key prefix for per-host, per-backbone tuning profiles
+_META_PREFIX = "ml_ort_threads:"
+
+# Lock held by the one worker calibrating a host
+_LOCK_TYPE = "ort_thread_tuning"
+_LOCK_TTL_S = 900
+_POLL_INTERVAL_S = 2.0
+
+# Measurement time per candidate
+_CANDIDATE_MS = 1000
+
+# Throughput within this fraction of the best counts as a tie; ties go to the
+# smaller thread pool (less RSS, less contention with decode and heads)
+_NOISE_MARGIN = 0.03
+
+# Largest tagger pool the config allows (config_svc.get_worker_count)
+_MAX_WORKERS = 8
+
+
+def host_profile_id(topology: dict[str, Any] | None = None) -> str:
+    """Identify this host's CPU layout and ONNX Runtime build.
+
+    Args:
+        topology: Output of :func:`get_cpu_topology` (read when omitted).
+
+    Returns:
+        12-character hex id.
+    """
+    topo = topology if topology is not None else get_cpu_topology()
+    raw = f"{topo['model']}|{topo['cpus']}|{topo['numa_nodes']}|{backend_onnx.get_version()}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:12]
+
+
+def candidate_grid(cpus: int, cpus_per_node: int, worker_counts: list[int]) -> list[tuple[int, SessionThreading]]:
+    """List the ``(workers, threads)`` combinations to measure.
+
+    Args:
+        cpus: Usable CPUs.
+        cpus_per_node: Usable CPUs per NUMA node; no session gets more.
+        worker_counts: Concurrent worker counts to try.
+
+    Returns:
+        Combinations in measurement order.  Each worker count includes the
+        two-thread default for comparison.
+    """
+    grid: list[tuple[int, SessionThreading]] = []
+    for workers in worker_counts:
+        share = max(1, min(cpus // workers, cpus_per_node))
+        intra_ops = sorted({2, share} | {1 << k for k in range(share.bit_length())})
+        for intra_op in intra_ops:
+            threads = SessionThreading(intra_op=intra_op, inter_op=1, allow_spinning=workers * intra_op <= cpus)
+            grid.append((workers, threads))
+        default = backend_onnx.default_session_threading()
+        if (workers, default) not in grid:
+            grid.append((workers, default))
+    return grid
+
+
+def measure_throughput(
+    model_path: str,
+    patches: np.ndarray,
+    threads: SessionThreading,
+    workers: int,
+    duration_ms: int = _CANDIDATE_MS,
+) -> float:
+    """Measure aggregate backbone throughput of *workers* concurrent sessions.
+
+    Args:
+        model_path: Backbone ``.onnx`` file.
+        patches: Input batch fed to every run.
+        threads: Thread pool of each session.
+        workers: Concurrent sessions, each run on its own thread.
+        duration_ms: Measurement time after one warm-up run per session.
+
+    Returns:
+        Patches per second over all sessions.
+    """
+    sessions = [backend_onnx.create_session(model_path, "cpu", threads=threads) for _ in range(workers)]
+    feed = {sessions[0].get_inputs()[0].name: patches}
+    for session in sessions:
+        session.run(None, feed)
+
+    runs = [0] * workers
+    start_barrier = threading.Barrier(workers + 1)
+
+    def _loop(index: int, session: ort.InferenceSession) -> None:
+        start_barrier.wait()
+        deadline = internal_ms().value + duration_ms
+        while internal_ms().value < deadline:
+            session.run(None, feed)
+            runs[index] += 1
+
+    pool = [
+        threading.Thread(target=_loop, args=(i, s), name=f"ort-tune-{i}", daemon=True) for i, s in enumerate(sessions)
+    ]
+    for t in pool:
+        t.start()
+    start_barrier.wait()
+    start = internal_ms().value
+    for t in pool:
+        t.join()
+    elapsed_ms = max(1, internal_ms().value - start)
+    return sum(runs) * patches.shape[0] * 1000 / elapsed_ms
+
+
+def calibrate_backbone(
+    model_path: str,
+    backbone: str,
+    worker_count: int,
+    topology: dict[str, Any] | None = None,
+    *,
+    duration_ms: int = _CANDIDATE_MS,
+) -> ThreadTuningProfile:
+    """Benchmark thread/worker combinations for one backbone on this host.
+
+    Args:
+        model_path: Backbone ``.onnx`` file.
+        backbone: Backbone name (selects the synthetic input shape).
+        worker_count: Configured tagger workers; always measured.
+        topology: Output of :func:`get_cpu_topology` (read when omitted).
+        duration_ms: Measurement time per combination.
+
+    Returns:
+        Profile with every measured candidate and the choice for *worker_count*.
+
+    Raises:
+        ValueError: If *backbone* has no known preprocessing parameters.
+    """
+    topo = topology if topology is not None else get_cpu_topology()
+    cpus = int(topo["cpus"])
+    patches = _synthetic_patches(backbone)
+
+    worker_counts = sorted({1, worker_count} | {1 << k for k in range(1, min(cpus, _MAX_WORKERS).bit_length())})
+    start = internal_ms().value
+    candidates: list[ThreadTuningCandidate] = []
+    for workers, threads in candidate_grid(cpus, int(topo["cpus_per_node"]), worker_counts):
+        candidates.append(_measure(model_path, patches, threads, workers, duration_ms))
+
+    # Spinning only pays off when threads never wait for a core; check the winner
+    for workers in worker_counts:
+        best = _best(candidates, workers)
+        if best.allow_spinning:
+            threads = SessionThreading(intra_op=best.intra_op, inter_op=best.inter_op, allow_spinning=False)
+            candidates.append(_measure(model_path, patches, threads, workers, duration_ms))
+
+    chosen = _best(candidates, worker_count)
+    default = backend_onnx.default_session_threading()
+    baseline = next(
+        c
+        for c in candidates
+        if c.workers == worker_count
+        and (c.intra_op, c.inter_op, c.allow_spinning) == (default.intra_op, default.inter_op, default.allow_spinning)
+    )
+    best_overall = max(candidates, key=lambda c: c.patches_per_s)
+    logger.info(
+        "[thread_tuning] %s: %d workers x %d threads%s = %.0f patches/s (default %.0f, %.2fx) "
+        "| best pool %d workers | %d candidates in %d ms",
+        backbone,
+        worker_count,
+        chosen.intra_op,
+        "" if chosen.allow_spinning else " (no spin)",
+        chosen.patches_per_s,
+        baseline.patches_per_s,
+        chosen.patches_per_s / max(baseline.patches_per_s, 1e-9),
+        best_overall.workers,
+        len(candidates),
+        internal_ms().value - start,
+    )
+    return ThreadTuningProfile(
+        backbone=backbone,
+        host_id=host_profile_id(topo),
+        cpu_model=str(topo["model"]),
+        cpus=cpus,
+        numa_nodes=int(topo["numa_nodes"]),
+        workers=worker_count,
+        intra_op=chosen.intra_op,
+        inter_op=chosen.inter_op,
+        allow_spinning=chosen.allow_spinning,
+        patches_per_s=chosen.patches_per_s,
+        default_patches_per_s=baseline.patches_per_s,
+        best_workers=best_overall.workers,
+        ort_version=backend_onnx.get_version(),
+        tuned_at=now_ms().value,
+        candidates=candidates,
+    )
+
+
+def select_threads(profile: ThreadTuningProfile, worker_count: int) -> SessionThreading | None:
+    """Pick the best measured thread pool for *worker_count* workers.
+
+    Returns:
+        The chosen pool, or ``None`` when *worker_count* was not measured.
+    """
+    if not any(c.workers == worker_count for c in profile.candidates):
+        return None
+    best = _best(profile.candidates, worker_count)
+    return SessionThreading(intra_op=best.intra_op, inter_op=best.inter_op, allow_spinning=best.allow_spinning)
+
+
+def get_or_run_thread_tuning(
+    db: Database,
+    models_dir: str,
+    worker_id: str,
+    worker_count: int,
+) -> dict[str, SessionThreading]:
+    """Get this host's tuned backbone thread pools, calibrating missing ones.
+
+    One worker per host calibrates (DB lock) while the others wait for it;
+    a worker that times out waiting keeps the defaults.  Backbones that fail
+    to calibrate keep the defaults too.
+
+    Args:
+        db: Database instance.
+        models_dir: Root directory containing backbone sub-directories.
+        worker_id: ID of the calling worker (lock holder).
+        worker_count: Configured tagger workers sharing the CPU.
+
+    Returns:
+        Thread pools keyed by backbone name, for :class:`ONNXModelCache`.
+    """
+    topology = get_cpu_topology()
+    host_id = host_profile_id(topology)
+    backbones = discover_backbone_models(models_dir)
+    profiles = _load_host_profiles(db, host_id)
+    missing = [b for b in backbones if _threads_for(profiles, b.backbone_name, worker_count) is None]
+
+    if missing and db.locks.try_acquire(_LOCK_TYPE, host_id, worker_id, _LOCK_TTL_S):
+        logger.info(
+            "[thread_tuning] Calibrating %d backbone(s) for %d worker(s) on %d CPU(s) (host=%s)",
+            len(missing),
+            worker_count,
+            topology["cpus"],
+            host_id,
+        )
+        try:
+            for model in missing:
+                try:
+                    profile = calibrate_backbone(model._path, model.backbone_name, worker_count, topology)
+                except Exception as e:
+                    logger.warning("[thread_tuning] Calibration failed for %s: %s", model.backbone_name, e)
+                    continue
+                db.meta.set(_meta_key(host_id, model.backbone_name), json.dumps(asdict(profile)))
+                profiles[model.backbone_name] = profile
+        finally:
+            db.locks.release(_LOCK_TYPE, host_id, worker_id)
+    elif missing:
+        logger.info("[thread_tuning] Another worker is calibrating host=%s, waiting...", host_id)
+        _wait_for_calibration(db, host_id)
+        profiles = _load_host_profiles(db, host_id)
+
+    result: dict[str, SessionThreading] = {}
+    for model in backbones:
+        threads = _threads_for(profiles, model.backbone_name, worker_count)
+        if threads is not None:
+            result[model.backbone_name] = threads
+    return result
+
+
+def get_thread_tuning_profiles(db: Database) -> list[ThreadTuningProfile]:
+    """Return every stored tuning profile (all hosts), sorted by host and backbone."""
+    profiles = [_decode_profile(value) for value in db.meta.get_by_prefix(_META_PREFIX).values()]
+    valid = [p for p in profiles if p is not None]
+    return sorted(valid, key=lambda p: (p.host_id, p.backbone))
+
+
+def clear_thread_tuning(db: Database) -> int:
+    """Delete all stored tuning profiles so the next worker start re-calibrates.
+
+    Returns:
+        Number of profiles deleted.
+    """
+    existing = db.meta.get_by_prefix(_META_PREFIX)
+    for key in existing:
+        db.meta.delete(key)
+    logger.info("[thread_tuning] Cleared %d tuning profile(s)", len(existing))
+    return len(existing)
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _meta_key(host_id: str, backbone: str) -> str:
+    return f"{_META_PREFIX}{host_id}:{backbone}"
+
+
+def _synthetic_patches(backbone: str) -> np.ndarray:
+    """Build one deterministic batch of random mel patches shaped for *backbone*."""
+    params = get_params(backbone)
+    shape = (_BACKBONE_BATCH_SIZE, params.patch_frames, params.n_mels)
+    return np.random.default_rng(0).standard_normal(shape).astype(np.float32)
+
+
+def _measure(
+    model_path: str,
+    patches: np.ndarray,
+    threads: SessionThreading,
+    workers: int,
+    duration_ms: int,
+) -> ThreadTuningCandidate:
+    patches_per_s = measure_throughput(model_path, patches, threads, workers, duration_ms)
+    logger.debug(
+        "[thread_tuning] %s workers=%d intra=%d spin=%s: %.0f patches/s",
+        model_path,
+        workers,
+        threads.intra_op,
+        threads.allow_spinning,
+        patches_per_s,
+    )
+    return ThreadTuningCandidate(
+        workers=workers,
+        intra_op=threads.intra_op,
+        inter_op=threads.inter_op,
+        allow_spinning=threads.allow_spinning,
+        patches_per_s=round(patches_per_s, 1),
+    )
+
+
+def _best(candidates: list[ThreadTuningCandidate], workers: int) -> ThreadTuningCandidate:
+    """Fastest candidate for *workers*; near-ties go to the smaller pool."""
+    pool = [c for c in candidates if c.workers == workers]
+    top = max(c.patches_per_s for c in pool)
+    close = [c for c in pool if c.patches_per_s >= top * (1 - _NOISE_MARGIN)]
+    return min(close, key=lambda c: (c.intra_op, -c.patches_per_s))
+
+
+def _decode_profile(value: str) -> ThreadTuningProfile | None:
+    try:
+        data = json.loads(value)
+        data["candidates"] = [ThreadTuningCandidate(**c) for c in data["candidates"]]
+        return ThreadTuningProfile(**data)
+    except (ValueError, TypeError, KeyError) as e:
+        logger.warning("[thread_tuning] Ignoring unreadable tuning profile: %s", e)
+        return None
+
+
+def _load_host_profiles(db: Database, host_id: str) -> dict[str, ThreadTuningProfile]:
+    stored = db.meta.get_by_prefix(f"{_META_PREFIX}{host_id}:")
+    profiles = {}
+    for value in stored.values():
+        profile = _decode_profile(value)
+        if profile is not None:
+            profiles[profile.backbone] = profile
+    return profiles
+
+
+def _threads_for(profiles: dict[str, ThreadTuningProfile], backbone: str, worker_count: int) -> SessionThreading | None:
+    profile = profiles.get(backbone)
+    return select_threads(profile, worker_count) if profile is not None else None
+
+
+def _wait_for_calibration(db: Database, host_id: str) -> None:
+    """Block until the calibrating worker releases the host lock (or it expires)."""
+    deadline = internal_ms().value + _LOCK_TTL_S * 1000
+    while internal_ms().value < deadline and db.locks.is_locked(_LOCK_TYPE, host_id):
+        time.sleep(_POLL_INTERVAL_S)
@@ -1,11 +1,13 @@
 """Timing summary computation for the ML processing pipeline.
 
-Builds a human-readable timing breakdown string from raw per-operation
-timings collected during audio file processing.
+Builds human-readable timing breakdown strings from raw per-operation
+timings collected during audio file processing and model-cache warm-up.
 """
 
 from __future__ import annotations
 
+from pathlib import Path
+
 
 def build_timing_summary(
     timings: dict[str, float],
@@ -17,8 +19,8 @@ def build_timing_summary(
     Args:
         timings: Per-operation durations in milliseconds, keyed by operation name.
             Expected keys: ``audio_load``, ``emb_wall`` (parallel) or
-            ``emb_<backbone>`` (sequential), ``heads_<backbone>``,
-            ``mood_aggregation``.
+            ``pre_<backbone>`` + ``emb_<backbone>`` (sequential),
+            ``heads_<backbone>``, ``mood_aggregation``.
         elapsed_ms: Total wall-clock time for the file in milliseconds.
         heads_by_backbone: Mapping of backbone name → list of head models,
             used only to count heads per backbone for the summary string.
@@ -35,7 +37,12 @@ def build_timing_summary(
     audio_load_ms = timings.get("audio_load", 0)
 
     # Embedding: use wall time if parallel, else sum of per-backbone times
-    emb_per_backbone = {k: v for k, v in timings.items() if k.startswith("emb_") and k != "emb_wall"}
+    # (preprocessing + inference)
+    emb_per_backbone: dict[str, float] = {}
+    for k, v in timings.items():
+        if k.startswith(("pre_", "emb_")) and k != "emb_wall":
+            bb_key = "emb_" + k.split("_", 1)[1]
+            emb_per_backbone[bb_key] = emb_per_backbone.get(bb_key, 0) + v
     emb_wall_ms = timings.get("emb_wall", sum(emb_per_backbone.values()))
 
     # Head: per-backbone wall times (heads_<backbone>), already wall times
@@ -60,3 +67,32 @@ def build_timing_summary(
         f"heads={heads_wall_total:.0f}({_pct(heads_wall_total)}|{head_detail}) "
         f"mood={mood_ms:.0f}({_pct(mood_ms)})"
     )
+
+
+def build_warmup_summary(
+    load_ms: dict[str, float],
+    wall_ms: float,
+    workers: int,
+    slowest: int = 3,
+) -> str:
+    """Build a compact timing summary string for one model-cache warm-up.
+
+    Args:
+        load_ms: Per-model session load durations in milliseconds, keyed by
+            model path (only the file stem is shown).
+        wall_ms: Wall-clock time of the whole warm-up in milliseconds.
+        workers: Number of sessions allowed to build concurrently.
+        slowest: How many of the slowest models to list.
+
+    Returns:
+        A compact one-line summary string, e.g.:
+        ``"12 models wall=840 load=2100(2.5x|3 workers) slowest: effnet=420 musicnn=300 vggish=280"``
+
+    """
+    total_ms = sum(load_ms.values())
+    overlap = total_ms / wall_ms if wall_ms > 0 else 0.0
+    ranked = sorted(load_ms.items(), key=lambda kv: kv[1], reverse=True)[:slowest]
+    summary = f"{len(load_ms)} models wall={wall_ms:.0f} load={total_ms:.0f}({overlap:.1f}x|{workers} workers)"
+    if ranked:
+        summary += " slowest: " + " ".join(f"{Path(path).stem}={ms:.0f}" for path, ms in ranked)
+    return summary
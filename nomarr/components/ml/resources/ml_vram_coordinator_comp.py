@@ -5,7 +5,7 @@ Before any model is loaded to GPU, the worker registers a promise here via
 an atomic AQL fit-check. Stale promises (from crashed workers) are reaped
 periodically so their reserved VRAM becomes available to other workers.
 
-All four functions are stateless: the ``db`` argument carries all state.
+All functions are stateless: the ``db`` argument carries all state.
 
 Typical call sequence (executed in ml_onnx_cache or ml_onnx_base):
     1. register_vram_promise(db, worker_id, pid, model_path, promised_mb)
@@ -13,6 +13,10 @@ Typical call sequence (executed in ml_onnx_cache or ml_onnx_base):
        -> False => fall back to CPU for this model
     2. (model is loaded and used)
     3. release_vram_promise(db, worker_id, model_path)  on unload
+
+Batched warm-up (ml_warmup_comp) replaces step 1 with a single
+register_vram_promises(db, worker_id, pid, {model_path: promised_mb, ...})
+call that decides every model's placement in one transaction.
 """
 
 from __future__ import annotations
@@ -24,6 +28,10 @@ from nomarr.components.platform import resource_monitor_comp as _resource_monito
 
 logger = logging.getLogger(__name__)
 
+# Attempts at committing a batched placement plan before falling back to
+# per-model registration (another worker changed the fleet in between).
+_BATCH_REGISTER_ATTEMPTS = 3
+
 
 def register_vram_promise(
     db: Any,
@@ -98,6 +106,95 @@ def register_vram_promise(
     return registered
 
 
+def register_vram_promises(
+    db: Any,
+    worker_id: str,
+    pid: int,
+    promises: dict[str, float],
+) -> dict[str, bool]:
+    """Register VRAM promises for a batch of models in one transaction.
+
+    Takes one fresh VRAM reading, reads the fleet headroom, and admits models
+    greedily in the order of *promises* — exactly the placements a sequence of
+    :func:`register_vram_promise` calls would make.  The admitted subset is
+    then committed with one atomic fit-check write.  If another worker
+    consumed headroom in between (the write is rejected), the plan is rebuilt
+    from a fresh reading; after a few attempts the batch falls back to
+    per-model registration.
+
+    Args:
+        db:        Application database (must have ``vram_promises`` attribute).
+        worker_id: Worker identifier (e.g., ``"nomarr-tag:0"``).
+        pid:       Worker OS PID.
+        promises:  VRAM required (MB) keyed by absolute model path, in
+                   placement priority order.
+
+    Returns:
+        Mapping of model path to ``True`` (registered, load on GPU) or
+        ``False`` (rejected, load on CPU), for every path in *promises*.
+
+    """
+    if not promises:
+        return {}
+    for attempt in range(_BATCH_REGISTER_ATTEMPTS):
+        _resource_monitor.reset_telemetry_cache()
+        vram = _resource_monitor.get_vram_usage_mb()
+        if vram.get("error"):
+            logger.warning(
+                "[vram_coordinator] nvidia-smi error for %d model(s): %s — denying GPU placement",
+                len(promises),
+                vram["error"],
+            )
+            return dict.fromkeys(promises, False)
+
+        total_mb = float(vram["total_mb"])
+        used_mb = float(vram["used_mb"])
+        headroom = float(db.vram_promises.get_headroom_mb(total_mb=total_mb, used_mb=used_mb))  # type: ignore[union-attr]
+
+        admitted: dict[str, float] = {}
+        planned = 0.0
+        for model_path, promised_mb in promises.items():
+            if planned + promised_mb <= headroom:
+                admitted[model_path] = promised_mb
+                planned += promised_mb
+
+        committed: bool = db.vram_promises.try_register_many(  # type: ignore[union-attr]
+            worker_id=worker_id,
+            pid=pid,
+            promises=admitted,
+            total_mb=total_mb,
+            used_mb=used_mb,
+        )
+        if committed:
+            logger.debug(
+                "[vram_coordinator] Registered %d/%d promise(s) in one batch: worker=%s promised=%.0f MB "
+                "(total=%.0f used=%.0f headroom=%.0f)",
+                len(admitted),
+                len(promises),
+                worker_id,
+                planned,
+                total_mb,
+                used_mb,
+                headroom,
+            )
+            return {model_path: model_path in admitted for model_path in promises}
+        logger.debug(
+            "[vram_coordinator] Batched promise rejected for worker=%s (attempt %d) — fleet changed, re-planning",
+            worker_id,
+            attempt + 1,
+        )
+
+    logger.info(
+        "[vram_coordinator] Fleet VRAM contended; registering %d promise(s) one at a time for %s",
+        len(promises),
+        worker_id,
+    )
+    return {
+        model_path: register_vram_promise(db, worker_id, pid, model_path, promised_mb)
+        for model_path, promised_mb in promises.items()
+    }
+
+
 def release_vram_promise(
     db: Any,
     worker_id: str,
@@ -22,10 +22,10 @@ import logging
 import pathlib
 import re
 import sys
+from typing import TYPE_CHECKING
 
 import numpy as np
 
-from nomarr.components.ml.onnx.ml_base import BaseONNXModel
 from nomarr.components.ml.onnx.ml_discovery_comp import discover_backbone_models, discover_head_models_no_db
 from nomarr.components.platform.resource_monitor_comp import (
     get_vram_usage_mb,
@@ -33,6 +33,10 @@ from nomarr.components.platform.resource_monitor_comp import (
 )
 from nomarr.persistence.db import Database
 
+if TYPE_CHECKING:
+    # ml_base imports resources (the VRAM coordinator); a runtime import here is circular
+    from nomarr.components.ml.onnx.ml_base import BaseONNXModel
+
 logger = logging.getLogger(__name__)
 
 # Meta key prefix for per-model VRAM measurements
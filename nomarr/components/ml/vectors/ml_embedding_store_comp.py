@@ -0,0 +1,144 @@
+"""On-disk store of per-segment backbone embeddings.
+
+``persist_backbone_vector`` keeps only the pooled track vector, which is not
+enough to run a head: heads consume the full ``[n_patches, dim]`` embedding
+matrix.  :class:`EmbeddingStore` keeps that matrix per file and backbone so a
+head added or replaced later can be applied without decoding the audio or
+running the backbone again.
+
+Matrices are stored as raw float32 ``.npy`` files, so heads see exactly the
+array the backbone produced and their scores are bit-identical to a full
+reprocessing run.
+
+Layout::
+
+    <root>/<backbone>-<fingerprint>/<shard>/<file_key>.npy
+
+The fingerprint covers the backbone's graph files (relative path and size).
+Opening a store removes the directories of every other fingerprint, so
+replacing a backbone drops its stale embeddings on the next worker start.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import uuid
+
+import numpy as np
+
+from nomarr.components.ml.onnx.ml_discovery_comp import compute_model_suite_manifest
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingStore:
+    """Per-file, per-backbone embedding matrices for one model suite.
+
+    Thread- and process-safe: entries are written to a unique temp file and
+    published with an atomic rename, so concurrent workers sharing *root*
+    never read a partial matrix.
+    """
+
+    def __init__(self, root: str, models_dir: str) -> None:
+        """Open (and create) the store for the backbones installed in *models_dir*.
+
+        Args:
+            root: Store directory shared by all workers.
+            models_dir: Models directory; backbone fingerprints are derived from it.
+
+        Raises:
+            OSError: If *root* cannot be created.
+        """
+        self._root = root
+        manifest = compute_model_suite_manifest(models_dir)
+        graphs_by_backbone: dict[str, list[str]] = {}
+        for rel_path, size in manifest.backbones.items():
+            graphs_by_backbone.setdefault(rel_path.split("/", 1)[0], []).append(f"{rel_path}:{size}")
+        self._dirs = {
+            backbone: f"{backbone}-{hashlib.sha1('|'.join(graphs).encode()).hexdigest()[:12]}"
+            for backbone, graphs in graphs_by_backbone.items()
+        }
+        os.makedirs(root, exist_ok=True)
+        self._prune_stale_backbones()
+
+    @property
+    def root(self) -> str:
+        """Directory holding all backbones' entries."""
+        return self._root
+
+    def entry_path(self, file_id: str, backbone: str) -> str | None:
+        """Return the ``.npy`` path for a file's embeddings (``None`` for unknown backbones)."""
+        backbone_dir = self._dirs.get(backbone)
+        if backbone_dir is None:
+            return None
+        file_key = file_id.rsplit("/", 1)[-1]
+        shard = hashlib.sha1(file_key.encode()).hexdigest()[:2]
+        return os.path.join(self._root, backbone_dir, shard, f"{file_key}.npy")
+
+    def save(self, file_id: str, backbone: str, embeddings: np.ndarray) -> bool:
+        """Store the ``[n_patches, dim]`` embeddings of one file and backbone.
+
+        Returns:
+            ``True`` when the entry is in place, ``False`` if it could not be
+            written (the failure is logged; processing continues without it).
+        """
+        entry = self.entry_path(file_id, backbone)
+        if entry is None:
+            return False
+        temp = f"{entry}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            with open(temp, "wb") as f:
+                np.save(f, np.ascontiguousarray(embeddings, dtype=np.float32), allow_pickle=False)
+            os.replace(temp, entry)
+            return True
+        except OSError as e:
+            logger.warning("[embedding-store] Could not store %s embeddings for %s: %s", backbone, file_id, e)
+            _remove_quietly(temp)
+            return False
+
+    def load(self, file_id: str, backbone: str) -> np.ndarray | None:
+        """Return the stored embeddings, or ``None`` when there is no readable entry."""
+        entry = self.entry_path(file_id, backbone)
+        if entry is None:
+            return None
+        try:
+            embeddings: np.ndarray = np.load(entry, allow_pickle=False)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("[embedding-store] Discarding unreadable entry %s: %s", entry, e)
+            _remove_quietly(entry)
+            return None
+        return embeddings
+
+    def delete(self, file_id: str) -> None:
+        """Remove a file's embeddings for every backbone."""
+        for backbone in self._dirs:
+            entry = self.entry_path(file_id, backbone)
+            if entry is not None:
+                _remove_quietly(entry)
+
+    def _prune_stale_backbones(self) -> None:
+        """Remove entry directories of backbones that are no longer installed as-is."""
+        current = set(self._dirs.values())
+        try:
+            siblings = list(os.scandir(self._root))
+        except OSError:
+            return
+        for entry in siblings:
+            if entry.is_dir(follow_symlinks=False) and entry.name not in current:
+                shutil.rmtree(entry.path, ignore_errors=True)
+                logger.info("[embedding-store] Removed embeddings of stale backbone %s", entry.name)
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug("[embedding-store] Could not remove %s: %s", path, e)
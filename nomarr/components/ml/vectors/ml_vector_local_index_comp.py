@@ -0,0 +1,913 @@
+"""In-process NumPy vector index for cold + hot similarity search.
+
+ArangoDB's ``APPROX_NEAR_COSINE`` only works on cold collections that have a
+vector index, so freshly processed (hot) tracks and libraries that never got
+an index are unsearchable.  This component keeps a per backbone+library copy
+of the ``vector_n`` matrix in process memory so that:
+
+- libraries without an ANN index are still searchable,
+- hot (not yet promoted) vectors are searchable as soon as they are synced,
+- ``find_similar_tracks`` avoids an ArangoDB round trip per query.
+
+Search modes:
+
+- **exact** — brute-force dot product over every row (rows are L2-normalised,
+  so this is cosine similarity).  Used below ``exact_threshold`` rows or when
+  no IVF quantizer has been trained.
+- **ivf** — inverted-file index: a spherical k-means coarse quantizer
+  partitions the base rows into lists; a query scores only the ``nprobe``
+  nearest lists exactly.
+
+Storage is split into a *base* matrix (loaded from cold, optionally
+memory-mapped from an ``.npy`` snapshot) and an in-memory *delta* that absorbs
+hot upserts.  :meth:`LocalVectorIndex.compact` folds the delta into the base.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from nomarr.helpers.time_helper import internal_ms, now_ms
+
+if TYPE_CHECKING:
+    from nomarr.persistence.db import Database
+
+logger = logging.getLogger(__name__)
+
+#: Storage dtypes accepted for the base matrix.
+_STORAGE_DTYPES: dict[str, type[np.floating[Any]]] = {"float16": np.float16, "float32": np.float32}
+
+#: Row count above which a trained IVF quantizer is used instead of brute force.
+DEFAULT_EXACT_THRESHOLD = 20_000
+
+#: Rows scored per matmul chunk (bounds float16 → float32 upcast memory).
+_SCORE_CHUNK_ROWS = 16_384
+
+#: Snapshot format version written to ``meta.json``.
+_SNAPSHOT_FORMAT = 1
+
+_IVF_MIN_LISTS = 8
+_IVF_MAX_LISTS = 4096
+_IVF_SAMPLES_PER_LIST = 48
+
+
+def _normalise(vector: np.ndarray) -> np.ndarray:
+    """Return an L2-normalised float32 copy of *vector* (zero vectors unchanged)."""
+    vec = np.asarray(vector, dtype=np.float32).reshape(-1)
+    norm = float(np.linalg.norm(vec))
+    return vec / norm if norm > 0.0 else vec.copy()
+
+
+def _normalise_rows(matrix: np.ndarray) -> np.ndarray:
+    """Return an L2-normalised float32 copy of every row in *matrix*."""
+    arr = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(arr, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    out: np.ndarray = arr / norms
+    return out
+
+
+def _score_rows(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Dot every row of *matrix* with *query*, chunked to bound memory."""
+    n = matrix.shape[0]
+    if n <= _SCORE_CHUNK_ROWS:
+        scores: np.ndarray = np.asarray(matrix, dtype=np.float32) @ query
+        return scores
+    out = np.empty(n, dtype=np.float32)
+    for start in range(0, n, _SCORE_CHUNK_ROWS):
+        stop = min(n, start + _SCORE_CHUNK_ROWS)
+        out[start:stop] = np.asarray(matrix[start:stop], dtype=np.float32) @ query
+    return out
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the *k* highest finite scores, best first."""
+    if k <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.int64)
+    k = min(k, scores.size)
+    if k < scores.size:
+        idx = np.argpartition(-scores, k - 1)[:k]
+    else:
+        idx = np.arange(scores.size)
+    idx = idx[np.argsort(-scores[idx], kind="stable")]
+    finite: np.ndarray = idx[np.isfinite(scores[idx])]
+    return finite
+
+
+class LocalVectorIndex:
+    """Cosine-similarity index over L2-normalised vectors keyed by file ID.
+
+    Thread-safe: all reads and writes take an internal re-entrant lock.
+
+    Attributes:
+        dim: Vector dimension.
+        dtype: Storage dtype of the base matrix (``"float16"`` or ``"float32"``).
+        exact_threshold: Base row count above which IVF search is used (when trained).
+        hot_watermark_ms: Newest hot ``created_at`` already applied (see
+            :func:`sync_local_index_from_hot`).
+        built_at_ms: Wall-clock time the base was loaded from cold.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        *,
+        dtype: str = "float32",
+        exact_threshold: int = DEFAULT_EXACT_THRESHOLD,
+    ) -> None:
+        """Create an empty index.
+
+        Args:
+            dim: Vector dimension.
+            dtype: Storage dtype of the base matrix.
+            exact_threshold: Base row count above which IVF search is used.
+
+        Raises:
+            ValueError: If *dim* is not positive or *dtype* is unsupported.
+        """
+        if dim <= 0:
+            raise ValueError(f"Vector dimension must be positive, got {dim}")
+        if dtype not in _STORAGE_DTYPES:
+            raise ValueError(f"Unsupported storage dtype {dtype!r} (expected one of {sorted(_STORAGE_DTYPES)})")
+
+        self.dim = dim
+        self.dtype = dtype
+        self.exact_threshold = exact_threshold
+        self.hot_watermark_ms = 0
+        self.built_at_ms = 0
+
+        self._lock = threading.RLock()
+        self._base: np.ndarray = np.empty((0, dim), dtype=_STORAGE_DTYPES[dtype])
+        self._base_ids: list[str] = []
+        self._base_rows: dict[str, int] = {}
+        self._base_alive: np.ndarray = np.ones(0, dtype=bool)
+        self._delta: dict[str, np.ndarray] = {}
+        self._delta_matrix: np.ndarray | None = None
+        self._ivf_centroids: np.ndarray | None = None
+        self._ivf_order: np.ndarray | None = None
+        self._ivf_offsets: np.ndarray | None = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_arrays(
+        cls,
+        file_ids: Sequence[str],
+        vectors: np.ndarray,
+        *,
+        dtype: str = "float32",
+        exact_threshold: int = DEFAULT_EXACT_THRESHOLD,
+    ) -> LocalVectorIndex:
+        """Build an index whose base holds *vectors* (one row per file ID).
+
+        Rows are L2-normalised on the way in.  Duplicate IDs keep the last row.
+
+        Args:
+            file_ids: File IDs, one per row of *vectors*.
+            vectors: Array of shape ``[n, dim]``.
+            dtype: Storage dtype of the base matrix.
+            exact_threshold: Base row count above which IVF search is used.
+
+        Returns:
+            New index.
+
+        Raises:
+            ValueError: If *vectors* is not 2-D or lengths disagree.
+        """
+        arr = np.asarray(vectors)
+        if arr.ndim != 2:
+            raise ValueError(f"Expected 2-D array, got shape {arr.shape}")
+        if arr.shape[0] != len(file_ids):
+            raise ValueError(f"{len(file_ids)} file IDs for {arr.shape[0]} vectors")
+
+        last_row: dict[str, int] = {fid: row for row, fid in enumerate(file_ids)}
+        keep = np.fromiter(last_row.values(), dtype=np.int64, count=len(last_row))
+
+        index = cls(arr.shape[1], dtype=dtype, exact_threshold=exact_threshold)
+        index._set_base(list(last_row), _normalise_rows(arr[keep]).astype(_STORAGE_DTYPES[dtype]))
+        return index
+
+    def _set_base(self, file_ids: list[str], matrix: np.ndarray) -> None:
+        self._base = matrix
+        self._base_ids = file_ids
+        self._base_rows = {fid: row for row, fid in enumerate(file_ids)}
+        self._base_alive = np.ones(len(file_ids), dtype=bool)
+        self._ivf_centroids = None
+        self._ivf_order = None
+        self._ivf_offsets = None
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._base_alive.sum()) + len(self._delta)
+
+    def __contains__(self, file_id: object) -> bool:
+        if not isinstance(file_id, str):
+            return False
+        with self._lock:
+            if file_id in self._delta:
+                return True
+            row = self._base_rows.get(file_id)
+            return row is not None and bool(self._base_alive[row])
+
+    @property
+    def mode(self) -> str:
+        """``"ivf"`` when queries use the trained quantizer, else ``"exact"``."""
+        with self._lock:
+            if self._ivf_centroids is not None and self._base.shape[0] > self.exact_threshold:
+                return "ivf"
+            return "exact"
+
+    @property
+    def ivf_nlists(self) -> int:
+        """Number of IVF lists (0 when untrained)."""
+        with self._lock:
+            return 0 if self._ivf_centroids is None else int(self._ivf_centroids.shape[0])
+
+    @property
+    def delta_size(self) -> int:
+        """Number of rows held in the in-memory delta."""
+        with self._lock:
+            return len(self._delta)
+
+    def get_vector(self, file_id: str) -> np.ndarray | None:
+        """Return the stored (normalised) vector for *file_id* as float32, or ``None``."""
+        with self._lock:
+            vec = self._delta.get(file_id)
+            if vec is not None:
+                return vec.copy()
+            row = self._base_rows.get(file_id)
+            if row is None or not self._base_alive[row]:
+                return None
+            return np.asarray(self._base[row], dtype=np.float32).copy()
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def upsert(self, file_id: str, vector: Sequence[float] | np.ndarray) -> None:
+        """Insert or replace the vector for *file_id* (goes to the delta).
+
+        Raises:
+            ValueError: If the vector dimension does not match the index.
+        """
+        vec = _normalise(np.asarray(vector))
+        if vec.shape[0] != self.dim:
+            raise ValueError(f"Vector dimension {vec.shape[0]} does not match index dimension {self.dim}")
+        with self._lock:
+            row = self._base_rows.get(file_id)
+            if row is not None:
+                self._base_alive[row] = False
+            self._delta[file_id] = vec
+            self._delta_matrix = None
+
+    def remove(self, file_ids: Iterable[str]) -> int:
+        """Remove *file_ids* from the index.
+
+        Returns:
+            Number of entries removed.
+        """
+        removed = 0
+        with self._lock:
+            for fid in file_ids:
+                if self._delta.pop(fid, None) is not None:
+                    removed += 1
+                    self._delta_matrix = None
+                row = self._base_rows.get(fid)
+                if row is not None and self._base_alive[row]:
+                    self._base_alive[row] = False
+                    removed += 1
+        return removed
+
+    def compact(self) -> None:
+        """Fold the delta and tombstones into a fresh in-memory base.
+
+        An existing IVF quantizer keeps its centroids; rows are reassigned.
+        """
+        with self._lock:
+            if not self._delta and bool(self._base_alive.all()):
+                return
+            alive = np.flatnonzero(self._base_alive)
+            ids = [self._base_ids[i] for i in alive] + list(self._delta)
+            parts = [np.asarray(self._base[alive], dtype=_STORAGE_DTYPES[self.dtype])]
+            if self._delta:
+                parts.append(np.stack(list(self._delta.values())).astype(_STORAGE_DTYPES[self.dtype]))
+            centroids = self._ivf_centroids
+            self._set_base(ids, np.concatenate(parts, axis=0))
+            self._delta = {}
+            self._delta_matrix = None
+            if centroids is not None and self._base.shape[0] >= centroids.shape[0]:
+                self._assign_ivf(centroids)
+
+    # ------------------------------------------------------------------
+    # IVF
+    # ------------------------------------------------------------------
+
+    def train_ivf(
+        self,
+        nlists: int | None = None,
+        *,
+        iterations: int = 8,
+        seed: int = 0,
+    ) -> int:
+        """Train the IVF coarse quantizer on the base rows (spherical k-means).
+
+        Compacts first so every live row is assigned to a list.
+
+        Args:
+            nlists: Number of lists; defaults to ``sqrt(n)`` clamped to [8, 4096].
+            iterations: k-means iterations.
+            seed: RNG seed for sampling and initialisation.
+
+        Returns:
+            Number of lists trained (0 if the base is too small).
+        """
+        with self._lock:
+            self.compact()
+            n = self._base.shape[0]
+            if nlists is None:
+                nlists = max(_IVF_MIN_LISTS, min(_IVF_MAX_LISTS, int(math.sqrt(n))))
+            nlists = min(nlists, n)
+            if nlists < 2:
+                return 0
+
+            rng = np.random.default_rng(seed)
+            sample_n = min(n, nlists * _IVF_SAMPLES_PER_LIST)
+            sample_rows = np.sort(rng.choice(n, size=sample_n, replace=False))
+            sample = np.asarray(self._base[sample_rows], dtype=np.float32)
+
+            centroids = sample[rng.choice(sample_n, size=nlists, replace=False)].copy()
+            for _ in range(iterations):
+                assign = np.argmax(sample @ centroids.T, axis=1)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, assign, sample)
+                counts = np.bincount(assign, minlength=nlists)
+                empty = np.flatnonzero(counts == 0)
+                if empty.size:
+                    sums[empty] = sample[rng.choice(sample_n, size=empty.size, replace=False)]
+                centroids = _normalise_rows(sums)
+
+            self._assign_ivf(centroids)
+            return nlists
+
+    def _assign_ivf(self, centroids: np.ndarray) -> None:
+        n = self._base.shape[0]
+        assign = np.empty(n, dtype=np.int64)
+        for start in range(0, n, _SCORE_CHUNK_ROWS):
+            stop = min(n, start + _SCORE_CHUNK_ROWS)
+            chunk = np.asarray(self._base[start:stop], dtype=np.float32)
+            assign[start:stop] = np.argmax(chunk @ centroids.T, axis=1)
+        self._ivf_centroids = centroids.astype(np.float32)
+        self._ivf_order = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=centroids.shape[0])
+        self._ivf_offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: Sequence[float] | np.ndarray,
+        k: int,
+        *,
+        nprobe: int | None = None,
+        exclude: Iterable[str] = (),
+    ) -> list[tuple[str, float]]:
+        """Return the *k* most similar file IDs to *query* with cosine scores.
+
+        Args:
+            query: Query vector (normalised internally).
+            k: Maximum number of results.
+            nprobe: IVF lists to probe; defaults to 10% of lists (at least 1).
+                Ignored in exact mode.
+            exclude: File IDs to leave out (e.g. the seed track).
+
+        Returns:
+            ``(file_id, score)`` pairs sorted by descending score.
+        """
+        q = _normalise(np.asarray(query))
+        if q.shape[0] != self.dim:
+            raise ValueError(f"Query dimension {q.shape[0]} does not match index dimension {self.dim}")
+        excluded = set(exclude)
+        fetch = k + len(excluded)
+
+        with self._lock:
+            candidates: list[tuple[str, float]] = []
+
+            if self._base.shape[0]:
+                rows, scores = self._search_base(q, fetch, nprobe)
+                candidates.extend((self._base_ids[r], float(s)) for r, s in zip(rows, scores, strict=True))
+
+            if self._delta:
+                if self._delta_matrix is None:
+                    self._delta_matrix = np.stack(list(self._delta.values()))
+                delta_ids = list(self._delta)
+                delta_scores = self._delta_matrix @ q
+                candidates.extend((delta_ids[i], float(delta_scores[i])) for i in _top_k(delta_scores, fetch))
+
+        candidates.sort(key=lambda pair: pair[1], reverse=True)
+        return [(fid, score) for fid, score in candidates if fid not in excluded][:k]
+
+    def _search_base(self, q: np.ndarray, k: int, nprobe: int | None) -> tuple[np.ndarray, np.ndarray]:
+        if self.mode == "ivf":
+            assert self._ivf_centroids is not None
+            assert self._ivf_order is not None
+            assert self._ivf_offsets is not None
+            nlists = self._ivf_centroids.shape[0]
+            probe_n = max(1, min(nlists, nprobe if nprobe is not None else nlists // 10))
+            probe = _top_k(self._ivf_centroids @ q, probe_n)
+            rows = np.sort(
+                np.concatenate([self._ivf_order[self._ivf_offsets[lst] : self._ivf_offsets[lst + 1]] for lst in probe])
+            )
+            if rows.size == 0:
+                return rows, np.empty(0, dtype=np.float32)
+            scores = _score_rows(self._base[rows], q)
+        else:
+            rows = np.arange(self._base.shape[0])
+            scores = _score_rows(self._base, q)
+
+        scores = np.where(self._base_alive[rows], scores, -np.inf)
+        best = _top_k(scores, k)
+        return rows[best], scores[best]
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def save(self, directory: str) -> None:
+        """Compact and write an ``.npy`` snapshot to *directory*.
+
+        Each file is written to a temporary name and atomically replaced;
+        ``meta.json`` is written last so a partial write is never loaded.
+        """
+        with self._lock:
+            self.compact()
+            os.makedirs(directory, exist_ok=True)
+            arrays: dict[str, np.ndarray] = {
+                "vectors.npy": np.ascontiguousarray(self._base),
+                "file_ids.npy": np.asarray(self._base_ids, dtype=np.str_),
+            }
+            if self._ivf_centroids is not None:
+                assert self._ivf_order is not None
+                assert self._ivf_offsets is not None
+                arrays["ivf_centroids.npy"] = self._ivf_centroids
+                arrays["ivf_order.npy"] = self._ivf_order
+                arrays["ivf_offsets.npy"] = self._ivf_offsets
+            for name, arr in arrays.items():
+                tmp = os.path.join(directory, f".{name}.tmp")
+                with open(tmp, "wb") as f:
+                    np.save(f, arr, allow_pickle=False)
+                os.replace(tmp, os.path.join(directory, name))
+
+            meta = {
+                "format": _SNAPSHOT_FORMAT,
+                "dim": self.dim,
+                "dtype": self.dtype,
+                "count": len(self._base_ids),
+                "ivf": self._ivf_centroids is not None,
+                "hot_watermark_ms": self.hot_watermark_ms,
+                "built_at_ms": self.built_at_ms,
+            }
+            tmp = os.path.join(directory, ".meta.json.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp, os.path.join(directory, "meta.json"))
+
+    @classmethod
+    def load(
+        cls,
+        directory: str,
+        *,
+        mmap: bool = True,
+        exact_threshold: int = DEFAULT_EXACT_THRESHOLD,
+    ) -> LocalVectorIndex | None:
+        """Load a snapshot written by :meth:`save`.
+
+        Args:
+            directory: Snapshot directory.
+            mmap: Memory-map the vector matrix read-only instead of reading it.
+            exact_threshold: Base row count above which IVF search is used.
+
+        Returns:
+            Loaded index, or ``None`` if no complete snapshot exists or its
+            format is not understood.
+        """
+        meta_path = os.path.join(directory, "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("format") != _SNAPSHOT_FORMAT:
+                return None
+            vectors = np.load(os.path.join(directory, "vectors.npy"), mmap_mode="r" if mmap else None)
+            file_ids = np.load(os.path.join(directory, "file_ids.npy"), allow_pickle=False).tolist()
+        except (OSError, ValueError):
+            logger.warning("[local index] Ignoring unreadable snapshot in %s", directory, exc_info=True)
+            return None
+
+        if vectors.shape != (meta["count"], meta["dim"]) or len(file_ids) != meta["count"]:
+            logger.warning("[local index] Snapshot in %s is inconsistent; ignoring", directory)
+            return None
+
+        index = cls(int(meta["dim"]), dtype=str(meta["dtype"]), exact_threshold=exact_threshold)
+        index._set_base(file_ids, vectors)
+        index.hot_watermark_ms = int(meta.get("hot_watermark_ms", 0))
+        index.built_at_ms = int(meta.get("built_at_ms", 0))
+        if meta.get("ivf"):
+            index._ivf_centroids = np.load(os.path.join(directory, "ivf_centroids.npy"))
+            index._ivf_order = np.load(os.path.join(directory, "ivf_order.npy"))
+            index._ivf_offsets = np.load(os.path.join(directory, "ivf_offsets.npy"))
+        return index
+
+
+# ----------------------------------------------------------------------
+# Loading from ArangoDB
+# ----------------------------------------------------------------------
+
+
+def _write_rows(matrix: np.ndarray, start: int, rows: list[list[float]]) -> np.ndarray:
+    """Normalise *rows* into ``matrix[start:]``, growing *matrix* when it is full.
+
+    Returns:
+        *matrix*, or a larger copy of it.
+    """
+    stop = start + len(rows)
+    if stop > matrix.shape[0]:
+        grown = np.empty((max(stop, matrix.shape[0] + matrix.shape[0] // 4), matrix.shape[1]), dtype=matrix.dtype)
+        grown[:start] = matrix[:start]
+        matrix = grown
+    matrix[start:stop] = _normalise_rows(np.asarray(rows, dtype=np.float32))
+    return matrix
+
+
+def build_local_index_from_cold(
+    db: Database,
+    backbone_id: str,
+    library_key: str,
+    *,
+    dtype: str = "float32",
+    exact_threshold: int = DEFAULT_EXACT_THRESHOLD,
+) -> LocalVectorIndex | None:
+    """Build a local index from every vector in the cold collection.
+
+    The base matrix is preallocated in the storage dtype from the collection
+    count and filled chunk by chunk, so peak memory is one matrix plus one
+    chunk rather than the whole collection as Python floats.  Trains an IVF
+    quantizer when the collection exceeds *exact_threshold*.
+
+    Args:
+        db: Database instance.
+        backbone_id: Backbone identifier.
+        library_key: ArangoDB ``_key`` of the library document.
+        dtype: Storage dtype of the base matrix.
+        exact_threshold: Row count above which IVF is trained and used.
+
+    Returns:
+        New index (``built_at_ms`` and ``hot_watermark_ms`` set), or ``None``
+        if the cold collection does not exist or holds no vectors.
+    """
+    cold_coll_name = f"vectors_track_cold__{backbone_id}__{library_key}"
+    if not db.db.has_collection(cold_coll_name):
+        return None
+
+    t0 = internal_ms().value
+    built_at = now_ms().value
+    cold_ops = db.get_vectors_track_cold(backbone_id, library_key)
+    # Only a sizing hint: vectors promoted mid-read grow the matrix
+    capacity = max(int(cold_ops.count()), 1)
+    matrix: np.ndarray | None = None
+    file_ids: list[str] = []
+    chunk: list[list[float]] = []
+    watermark = 0
+    for doc in cold_ops.iter_search_vectors():
+        vec = doc.get("vector_n")
+        if not vec:
+            continue
+        if matrix is None:
+            matrix = np.empty((capacity, len(vec)), dtype=_STORAGE_DTYPES[dtype])
+        elif len(vec) != matrix.shape[1]:
+            continue
+        chunk.append(vec)
+        file_ids.append(doc["file_id"])
+        watermark = max(watermark, int(doc.get("created_at") or 0))
+        if len(chunk) >= _SCORE_CHUNK_ROWS:
+            matrix = _write_rows(matrix, len(file_ids) - len(chunk), chunk)
+            chunk = []
+
+    if matrix is None:
+        return None
+    if chunk:
+        matrix = _write_rows(matrix, len(file_ids) - len(chunk), chunk)
+    if matrix.shape[0] > len(file_ids):
+        # Give back the unused tail of the preallocation without copying
+        matrix.resize((len(file_ids), matrix.shape[1]), refcheck=False)
+
+    last_row: dict[str, int] = {fid: row for row, fid in enumerate(file_ids)}
+    if len(last_row) < len(file_ids):
+        # Duplicate IDs keep the last row, as in LocalVectorIndex.from_arrays
+        matrix = matrix[np.fromiter(last_row.values(), dtype=np.int64, count=len(last_row))]
+        file_ids = list(last_row)
+
+    index = LocalVectorIndex(matrix.shape[1], dtype=dtype, exact_threshold=exact_threshold)
+    index._set_base(file_ids, matrix)
+    if len(index) > exact_threshold:
+        index.train_ivf()
+    index.built_at_ms = built_at
+    index.hot_watermark_ms = watermark
+
+    logger.info(
+        "[local index] Built %s__%s from cold: %d vectors, dim=%d, mode=%s in %dms",
+        backbone_id,
+        library_key,
+        len(index),
+        index.dim,
+        index.mode,
+        internal_ms().value - t0,
+    )
+    return index
+
+
+def sync_local_index_from_hot(
+    db: Database,
+    index: LocalVectorIndex,
+    backbone_id: str,
+    library_key: str,
+) -> int:
+    """Apply hot-collection upserts newer than the index watermark.
+
+    Args:
+        db: Database instance.
+        index: Index to update in place.
+        backbone_id: Backbone identifier.
+        library_key: ArangoDB ``_key`` of the library document.
+
+    Returns:
+        Number of vectors upserted into the index.
+    """
+    hot_coll_name = f"vectors_track_hot__{backbone_id}__{library_key}"
+    if not db.db.has_collection(hot_coll_name):
+        return 0
+
+    docs = db.register_vectors_track_backbone(backbone_id, library_key).get_vectors_since(index.hot_watermark_ms)
+    applied = 0
+    for doc in docs:
+        vec = doc.get("vector_n")
+        if not vec or len(vec) != index.dim:
+            continue
+        index.upsert(doc["file_id"], vec)
+        index.hot_watermark_ms = max(index.hot_watermark_ms, int(doc.get("created_at") or 0))
+        applied += 1
+
+    if applied:
+        logger.debug("[local index] Synced %d hot vectors into %s__%s", applied, backbone_id, library_key)
+    return applied
+
+
+# ----------------------------------------------------------------------
+# Cache
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class _CacheEntry:
+    index: LocalVectorIndex
+    last_hot_sync_ms: int
+
+
+class LocalVectorIndexCache:
+    """Per-process registry of :class:`LocalVectorIndex` keyed by backbone+library.
+
+    On first access an index is loaded from its on-disk snapshot (memory-mapped)
+    or built from the cold collection.  Subsequent accesses pull new hot vectors
+    at most every *hot_sync_interval_s* seconds, and rebuild from cold once the
+    base is older than *max_age_s* (so deletions and promotions converge).
+
+    With *background_build* (the default) builds run on a background thread:
+    :meth:`get` returns ``None`` until the first build of a key finishes, and
+    keeps serving the previous index while an expired one is rebuilt, so no
+    request waits on a full collection read.
+
+    Owned by the composition root and passed to services as a dependency.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | None = None,
+        *,
+        dtype: str = "float16",
+        exact_threshold: int = DEFAULT_EXACT_THRESHOLD,
+        hot_sync_interval_s: float = 30.0,
+        max_age_s: float = 3600.0,
+        background_build: bool = True,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for ``.npy`` snapshots; ``None`` keeps indexes
+                in memory only.
+            dtype: Storage dtype for newly built indexes.
+            exact_threshold: Row count above which IVF is trained and used.
+            hot_sync_interval_s: Minimum seconds between hot syncs per index.
+            max_age_s: Rebuild from cold once the base is older than this.
+            background_build: Build indexes on a background thread instead of
+                inside :meth:`get`.
+        """
+        self._cache_dir = cache_dir
+        self._dtype = dtype
+        self._exact_threshold = exact_threshold
+        self._hot_sync_interval_ms = int(hot_sync_interval_s * 1000)
+        self._max_age_ms = int(max_age_s * 1000)
+        self._background_build = background_build
+        self._entries: dict[tuple[str, str], _CacheEntry] = {}
+        self._locks: dict[tuple[str, str], threading.Lock] = {}
+        self._building: set[tuple[str, str]] = set()
+        # Bumped by invalidate(); builds started before a bump are discarded
+        self._generation = 0
+        self._registry_lock = threading.Lock()
+
+    def _snapshot_dir(self, backbone_id: str, library_key: str) -> str | None:
+        if self._cache_dir is None:
+            return None
+        return os.path.join(self._cache_dir, f"{backbone_id}__{library_key}")
+
+    def _key_lock(self, key: tuple[str, str]) -> threading.Lock:
+        with self._registry_lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def get(self, db: Database, backbone_id: str, library_key: str) -> LocalVectorIndex | None:
+        """Return a fresh-enough index for *backbone_id* / *library_key*.
+
+        Returns:
+            The index, or ``None`` when neither cold nor hot hold any vectors
+            or the first background build has not finished yet.
+        """
+        key = (backbone_id, library_key)
+        with self._key_lock(key):
+            entry = self._entries.get(key)
+            now = now_ms().value
+
+            if entry is None:
+                index = self._load_snapshot(backbone_id, library_key, now)
+                if index is None:
+                    if self._background_build:
+                        self._start_build(db, key)
+                        return None
+                    index = self._build(db, backbone_id, library_key, now)
+                    if index is None:
+                        return None
+                    self._save_snapshot(index, backbone_id, library_key)
+                entry = _CacheEntry(index=index, last_hot_sync_ms=0)
+                self._entries[key] = entry
+            elif now - entry.index.built_at_ms > self._max_age_ms:
+                logger.debug("[local index] %s__%s older than max age; rebuilding", backbone_id, library_key)
+                if self._background_build:
+                    self._start_build(db, key)  # Keep serving the current index meanwhile
+                else:
+                    index = self._build(db, backbone_id, library_key, now)
+                    if index is None:
+                        self._entries.pop(key, None)
+                        return None
+                    self._save_snapshot(index, backbone_id, library_key)
+                    entry = _CacheEntry(index=index, last_hot_sync_ms=0)
+                    self._entries[key] = entry
+
+            if now - entry.last_hot_sync_ms >= self._hot_sync_interval_ms:
+                try:
+                    sync_local_index_from_hot(db, entry.index, backbone_id, library_key)
+                except Exception:
+                    logger.warning("[local index] Hot sync failed for %s__%s", backbone_id, library_key, exc_info=True)
+                entry.last_hot_sync_ms = now
+
+            return entry.index
+
+    def _start_build(self, db: Database, key: tuple[str, str]) -> None:
+        with self._registry_lock:
+            if key in self._building:
+                return
+            self._building.add(key)
+            generation = self._generation
+        threading.Thread(
+            target=self._build_in_background,
+            args=(db, key, generation),
+            name=f"vector-index-{key[0]}__{key[1]}",
+            daemon=True,
+        ).start()
+
+    def _build_in_background(self, db: Database, key: tuple[str, str], generation: int) -> None:
+        index: LocalVectorIndex | None = None
+        try:
+            index = self._build(db, key[0], key[1], now_ms().value)
+            if index is not None and generation == self._generation:
+                self._save_snapshot(index, *key)
+        except Exception:
+            logger.warning("[local index] Background build failed for %s__%s", *key, exc_info=True)
+        with self._registry_lock:
+            self._building.discard(key)
+            if generation != self._generation:
+                return  # Invalidated mid-build: the next get() starts over
+            if index is None:
+                self._entries.pop(key, None)
+            else:
+                self._entries[key] = _CacheEntry(index=index, last_hot_sync_ms=0)
+
+    def _load_snapshot(self, backbone_id: str, library_key: str, now: int) -> LocalVectorIndex | None:
+        snapshot_dir = self._snapshot_dir(backbone_id, library_key)
+        if snapshot_dir is None:
+            return None
+        index = LocalVectorIndex.load(snapshot_dir, exact_threshold=self._exact_threshold)
+        if index is None or now - index.built_at_ms > self._max_age_ms:
+            return None
+        logger.debug("[local index] Loaded snapshot %s (%d vectors)", snapshot_dir, len(index))
+        return index
+
+    def _save_snapshot(self, index: LocalVectorIndex, backbone_id: str, library_key: str) -> None:
+        snapshot_dir = self._snapshot_dir(backbone_id, library_key)
+        if snapshot_dir is None:
+            return
+        try:
+            index.save(snapshot_dir)
+        except OSError:
+            logger.warning("[local index] Could not write snapshot %s", snapshot_dir, exc_info=True)
+
+    def _build(self, db: Database, backbone_id: str, library_key: str, now: int) -> LocalVectorIndex | None:
+        index = build_local_index_from_cold(
+            db,
+            backbone_id,
+            library_key,
+            dtype=self._dtype,
+            exact_threshold=self._exact_threshold,
+        )
+        if index is None:
+            # No cold vectors yet — start from hot only
+            return self._build_from_hot(db, backbone_id, library_key, now)
+        return index
+
+    def _build_from_hot(self, db: Database, backbone_id: str, library_key: str, now: int) -> LocalVectorIndex | None:
+        hot_coll_name = f"vectors_track_hot__{backbone_id}__{library_key}"
+        if not db.db.has_collection(hot_coll_name):
+            return None
+        docs = db.register_vectors_track_backbone(backbone_id, library_key).get_vectors_since(0)
+        docs = [d for d in docs if d.get("vector_n")]
+        if not docs:
+            return None
+        index = LocalVectorIndex(len(docs[0]["vector_n"]), dtype=self._dtype, exact_threshold=self._exact_threshold)
+        index.built_at_ms = now
+        for doc in docs:
+            if len(doc["vector_n"]) == index.dim:
+                index.upsert(doc["file_id"], doc["vector_n"])
+                index.hot_watermark_ms = max(index.hot_watermark_ms, int(doc.get("created_at") or 0))
+        return index
+
+    def remove_files(self, file_ids: Iterable[str]) -> None:
+        """Drop *file_ids* from every cached index (their vectors were deleted).
+
+        Registered as a :meth:`Database.add_vector_delete_hook` so deletes made
+        by this process show up in search at once; deletes made elsewhere
+        converge on the next rebuild.
+        """
+        ids = list(file_ids)
+        with self._registry_lock:
+            entries = list(self._entries.values())
+        for entry in entries:
+            entry.index.remove(ids)
+
+    def invalidate(self, backbone_id: str | None = None, library_key: str | None = None) -> None:
+        """Drop cached indexes so the next :meth:`get` reloads from cold.
+
+        Args:
+            backbone_id: Only drop entries for this backbone (all when ``None``).
+            library_key: Only drop entries for this library (all when ``None``).
+        """
+        with self._registry_lock:
+            self._generation += 1
+            dropped = {
+                key
+                for key in self._entries
+                if (backbone_id is None or key[0] == backbone_id) and (library_key is None or key[1] == library_key)
+            }
+            for key in dropped:
+                del self._entries[key]
+            if backbone_id is not None and library_key is not None:
+                dropped.add((backbone_id, library_key))  # Snapshot on disk but not loaded yet
+            for key in dropped:
+                snapshot_dir = self._snapshot_dir(*key)
+                if snapshot_dir is not None:
+                    meta_path = os.path.join(snapshot_dir, "meta.json")
+                    if os.path.exists(meta_path):
+                        os.remove(meta_path)
@@ -0,0 +1,184 @@
+"""Per-collection vector search parameters.
+
+Search paths need the cold collection's ``nLists`` to derive ``nProbe``.
+Computing it from ``count()`` costs a round trip per query and can disagree
+with the index that was actually built (per-library ``vector_group_size``).
+
+Instead, promote/rebuild workflows record the index's ``nLists`` and doc count
+in the ``meta`` collection next to the index build, and search paths read
+them through :class:`VectorSearchParamsCache`.  Collections indexed before
+this existed are backfilled once from the index definition.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+from nomarr.helpers.time_helper import internal_ms, now_ms
+from nomarr.helpers.vector_params_helper import compute_nlists, compute_nprobe
+
+if TYPE_CHECKING:
+    from nomarr.persistence.db import Database
+
+logger = logging.getLogger(__name__)
+
+_META_PREFIX = "vector_search_params:"
+
+
+@dataclass(frozen=True)
+class VectorSearchParams:
+    """Search parameters recorded when a cold vector index was built."""
+
+    nlists: int
+    doc_count: int
+    updated_at_ms: int
+
+    def nprobe(self, thoroughness_pct: int = 10) -> int:
+        """Derive ``nProbe`` for this collection at the given thoroughness."""
+        return compute_nprobe(self.nlists, thoroughness_pct)
+
+
+def _meta_key(backbone_id: str, library_key: str) -> str:
+    return f"{_META_PREFIX}{backbone_id}__{library_key}"
+
+
+def save_vector_search_params(
+    db: Database,
+    backbone_id: str,
+    library_key: str,
+    nlists: int,
+    doc_count: int,
+) -> VectorSearchParams:
+    """Record search parameters for a freshly built cold vector index.
+
+    Args:
+        db: Database instance.
+        backbone_id: Backbone identifier.
+        library_key: ArangoDB ``_key`` of the library document.
+        nlists: ``nLists`` the index was built with.
+        doc_count: Cold collection size at build time.
+
+    Returns:
+        The stored parameters.
+
+    """
+    params = VectorSearchParams(nlists=nlists, doc_count=doc_count, updated_at_ms=now_ms().value)
+    db.meta.set(_meta_key(backbone_id, library_key), json.dumps(asdict(params)))
+    return params
+
+
+def clear_vector_search_params(db: Database, backbone_id: str, library_key: str) -> None:
+    """Forget recorded search parameters (e.g. after dropping the index)."""
+    db.meta.delete(_meta_key(backbone_id, library_key))
+
+
+def load_vector_search_params(db: Database, backbone_id: str, library_key: str) -> VectorSearchParams | None:
+    """Read recorded search parameters from the ``meta`` collection.
+
+    Returns:
+        Parameters, or ``None`` if none were recorded or the entry is unreadable.
+
+    """
+    raw = db.meta.get(_meta_key(backbone_id, library_key))
+    if raw is None:
+        return None
+    try:
+        data = json.loads(raw)
+        return VectorSearchParams(
+            nlists=int(data["nlists"]),
+            doc_count=int(data["doc_count"]),
+            updated_at_ms=int(data.get("updated_at_ms", 0)),
+        )
+    except (ValueError, KeyError, TypeError):
+        logger.warning("Ignoring unreadable vector search params for %s__%s", backbone_id, library_key)
+        return None
+
+
+def get_vector_search_params(db: Database, backbone_id: str, library_key: str) -> VectorSearchParams | None:
+    """Return search parameters for a cold collection, backfilling if needed.
+
+    Reads the ``meta`` entry.  When absent but the cold collection has a
+    vector index (built before parameters were recorded), derives them from
+    the index definition plus ``count()`` and records them.
+
+    Args:
+        db: Database instance.
+        backbone_id: Backbone identifier.
+        library_key: ArangoDB ``_key`` of the library document.
+
+    Returns:
+        Parameters, or ``None`` if the cold collection has no vector index.
+
+    """
+    params = load_vector_search_params(db, backbone_id, library_key)
+    if params is not None:
+        return params
+
+    cold_name = f"vectors_track_cold__{backbone_id}__{library_key}"
+    if not db.db.has_collection(cold_name):
+        return None
+
+    vector_index = next(
+        (idx for idx in db.db.collection(cold_name).indexes() if idx.get("type") == "vector"),  # type: ignore[union-attr]
+        None,
+    )
+    if vector_index is None:
+        return None
+
+    doc_count = db.get_vectors_track_cold(backbone_id, library_key).count()
+    nlists = (vector_index.get("params") or {}).get("nLists") or compute_nlists(doc_count)
+    logger.info(
+        "Backfilling vector search params for %s (nlists=%d, docs=%d)",
+        cold_name,
+        nlists,
+        doc_count,
+    )
+    return save_vector_search_params(db, backbone_id, library_key, int(nlists), doc_count)
+
+
+class VectorSearchParamsCache:
+    """In-process cache of :class:`VectorSearchParams` per backbone+library.
+
+    Entries (including "no index") expire after *ttl_s* so that promotions run
+    by worker processes are picked up without a restart.  Owners that rebuild
+    an index in-process call :meth:`invalidate`.
+    """
+
+    def __init__(self, ttl_s: float = 300.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_s: Seconds an entry is served before re-reading ``meta``.
+        """
+        self._ttl_ms = int(ttl_s * 1000)
+        self._entries: dict[tuple[str, str], tuple[VectorSearchParams | None, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, db: Database, backbone_id: str, library_key: str) -> VectorSearchParams | None:
+        """Return cached parameters, loading them on miss or expiry.
+
+        Returns:
+            Parameters, or ``None`` if the cold collection has no vector index.
+        """
+        key = (backbone_id, library_key)
+        now = internal_ms().value
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        params = get_vector_search_params(db, backbone_id, library_key)
+        with self._lock:
+            self._entries[key] = (params, now + self._ttl_ms)
+        return params
+
+    def invalidate(self, backbone_id: str | None = None, library_key: str | None = None) -> None:
+        """Drop cached entries (all when no filter given)."""
+        with self._lock:
+            for key in list(self._entries):
+                if (backbone_id is None or key[0] == backbone_id) and (library_key is None or key[1] == library_key):
+                    del self._entries[key]
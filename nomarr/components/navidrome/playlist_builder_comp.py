@@ -1,8 +1,13 @@
 """Build personal playlist track lists from taste profiles and play history.
 
-Each public function encapsulates the domain logic for one playlist type:
-ANN search, exclusion filtering, and result assembly.  All AQL access
-goes through ``db.tags.*`` persistence methods.
+Candidate generation runs once per call: :func:`build_candidate_pool` issues a
+single over-fetched ANN query against the taste centroid and fetches the
+metadata builders need (artists, genres) for the union in one batch.  Each
+public ``build_*`` function then encapsulates the domain logic for one
+playlist type — slicing, exclusion filtering, and result assembly — on that
+shared pool.  Only genre playlists, which use per-genre centroids, issue
+their own vector queries.  All AQL access goes through ``db.tags.*`` /
+vector persistence methods.
 
 Every builder has the uniform signature::
 
@@ -18,16 +23,17 @@ from __future__ import annotations
 import logging
 import math
 import random
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 import numpy as np
 
 from nomarr.helpers.dto.navidrome_dto import (
+    NavidromeCandidatePool,
     NavidromePersonalPlaylistContext,
     NavidromePersonalPlaylistEntry,
+    PlaylistCandidate,
 )
 from nomarr.helpers.time_helper import now_ms
-from nomarr.helpers.vector_params_helper import compute_nlists, compute_nprobe
 
 if TYPE_CHECKING:
     from nomarr.persistence.db import Database
@@ -43,6 +49,96 @@ _MAX_GENRE_PLAYLISTS_CAP: int = 25
 #: Milliseconds per day — used for recency weight computation.
 _MS_PER_DAY: float = 86_400_000.0
 
+#: Per-builder over-fetch factor (x ``max_songs``) applied to the shared pool.
+#: The pool is fetched at the largest factor among enabled builders; each
+#: builder reads only its own prefix, so results match a dedicated query.
+_POOL_FETCH_FACTORS: dict[str, int] = {
+    "familiar": 5,  # most results won't be in the played set
+    "discovery": 2,
+    "hidden_gems": 3,  # compensate for artist filtering
+    "universal": 3,
+}
+
+
+# ------------------------------------------------------------------
+# Candidate generation
+# ------------------------------------------------------------------
+
+
+def build_candidate_pool(
+    db: Database,
+    *,
+    backbone_id: str,
+    library_key: str,
+    centroid: list[float],
+    nprobe: int,
+    cold_doc_count: int,
+    max_songs: int,
+    enabled_types: list[str],
+    played_file_ids: list[str],
+) -> NavidromeCandidatePool:
+    """Run the shared ANN query and metadata fetch for all enabled builders.
+
+    Args:
+        db: Database instance.
+        backbone_id: Vector backbone identifier.
+        library_key: ArangoDB ``_key`` of the library document.
+        centroid: Taste-profile centroid.
+        nprobe: Centroids to probe for the ANN query.
+        cold_doc_count: Cold collection size (0 = no index; nothing fetched).
+        max_songs: Maximum tracks per playlist.
+        enabled_types: Playlist types being generated.
+        played_file_ids: ``file_id`` values of the user's played tracks.
+
+    Returns:
+        Candidate pool; empty lists/dicts for parts no enabled builder needs.
+
+    """
+    pool = NavidromeCandidatePool(candidates=[], known_artists=[], played_genres={})
+
+    if "genre" in enabled_types and played_file_ids:
+        grouped = db.tags.get_tag_values_grouped_by_file(played_file_ids, "genre")
+        pool["played_genres"] = {fid: sorted(values) for fid, values in grouped.items()}
+
+    factor = max((_POOL_FETCH_FACTORS[t] for t in enabled_types if t in _POOL_FETCH_FACTORS), default=0)
+    if factor == 0 or cold_doc_count == 0:
+        return pool
+
+    cold_ops = db.get_vectors_track_cold(backbone_id, library_key)
+    raw_results = cold_ops.search_similar(centroid, max_songs * factor, nprobe=nprobe)
+    candidates = [
+        PlaylistCandidate(
+            file_id=r["file_id"],
+            score=float(r.get("score", 0.0)),
+            artists=[],
+        )
+        for r in raw_results
+    ]
+
+    # Artist metadata for candidates + played tracks in one round trip (Hidden Gems only)
+    if "hidden_gems" in enabled_types and candidates and played_file_ids:
+        played = set(played_file_ids)
+        lookup_ids = list(dict.fromkeys([*played_file_ids, *(c["file_id"] for c in candidates)]))
+        artists_by_file = db.tags.get_tag_values_grouped_by_file(lookup_ids, "artist")
+        for c in candidates:
+            c["artists"] = sorted(artists_by_file.get(c["file_id"], set()))
+        pool["known_artists"] = sorted({a for fid in played for a in artists_by_file.get(fid, set())})
+
+    pool["candidates"] = candidates
+    logger.debug(
+        "Candidate pool: %d candidates (fetch=%d, nprobe=%d), %d known artists",
+        len(candidates),
+        max_songs * factor,
+        nprobe,
+        len(pool["known_artists"]),
+    )
+    return pool
+
+
+def _pool_prefix(ctx: NavidromePersonalPlaylistContext, playlist_type: str) -> list[PlaylistCandidate]:
+    """Return the slice of the shared pool a dedicated query would have fetched."""
+    return ctx["pool"]["candidates"][: ctx["max_songs"] * _POOL_FETCH_FACTORS[playlist_type]]
+
 
 # ------------------------------------------------------------------
 # Public builder functions
@@ -53,10 +149,10 @@ def build_familiar_playlist(
     db: Database,
     ctx: NavidromePersonalPlaylistContext,
 ) -> list[NavidromePersonalPlaylistEntry]:
-    """Build a Familiar playlist: ANN search biased toward played tracks.
+    """Build a Familiar playlist: ANN candidates biased toward played tracks.
 
-    Uses the taste centroid for ANN search on the global cold collection,
-    then *includes only* played tracks that appear in the results.  This
+    Uses the taste-centroid candidate pool, then *includes only* played
+    tracks that appear in it.  This
     keeps the playlist sonically coherent (centroid-near) while limiting
     it to music the user already knows.
 
@@ -73,19 +169,11 @@ def build_familiar_playlist(
     if not played:
         return []
 
-    cold_ops = db.get_vectors_track_cold(ctx["backbone_id"], ctx["library_key"])
-    doc_count = cold_ops.count()
-    if doc_count == 0:
+    if ctx["cold_doc_count"] == 0:
         return []
 
-    nlists = compute_nlists(doc_count)
-    nprobe = compute_nprobe(nlists)
-    # Over-fetch: most results won't be in the played set
-    fetch_limit = ctx["max_songs"] * 5
-    raw_results = cold_ops.search_similar(ctx["centroid"], fetch_limit, nprobe=nprobe)
-
     # Keep only tracks the user has played, preserving ANN ranking
-    file_ids = [r["file_id"] for r in raw_results if r["file_id"] in played][: ctx["max_songs"]]
+    file_ids = [c["file_id"] for c in _pool_prefix(ctx, "familiar") if c["file_id"] in played][: ctx["max_songs"]]
 
     return [
         NavidromePersonalPlaylistEntry(
@@ -100,7 +188,7 @@ def build_discovery_playlist(
     db: Database,
     ctx: NavidromePersonalPlaylistContext,
 ) -> list[NavidromePersonalPlaylistEntry]:
-    """Build a Discovery playlist: ANN search excluding played tracks.
+    """Build a Discovery playlist: ANN candidates excluding played tracks.
 
     Args:
         db: Database instance.
@@ -113,18 +201,11 @@ def build_discovery_playlist(
     """
     played = set(ctx["played_file_ids"])
 
-    cold_ops = db.get_vectors_track_cold(ctx["backbone_id"], ctx["library_key"])
-    doc_count = cold_ops.count()
-    if doc_count == 0:
+    if ctx["cold_doc_count"] == 0:
         return []
 
-    nlists = compute_nlists(doc_count)
-    nprobe = compute_nprobe(nlists)
-    fetch_limit = ctx["max_songs"] * 2
-    raw_results = cold_ops.search_similar(ctx["centroid"], fetch_limit, nprobe=nprobe)
-
     # Exclude played tracks
-    file_ids = [r["file_id"] for r in raw_results if r["file_id"] not in played][: ctx["max_songs"]]
+    file_ids = [c["file_id"] for c in _pool_prefix(ctx, "discovery") if c["file_id"] not in played][: ctx["max_songs"]]
 
     return [
         NavidromePersonalPlaylistEntry(
@@ -139,7 +220,7 @@ def build_hidden_gems_playlist(
     db: Database,
     ctx: NavidromePersonalPlaylistContext,
 ) -> list[NavidromePersonalPlaylistEntry]:
-    """Build a Hidden Gems playlist: ANN search excluding known-artist tracks.
+    """Build a Hidden Gems playlist: ANN candidates excluding known-artist tracks.
 
     Filters out tracks by artists the user has already listened to,
     surfacing music from unfamiliar artists near the taste centroid.
@@ -155,32 +236,20 @@ def build_hidden_gems_playlist(
     """
     played = set(ctx["played_file_ids"])
 
-    # Collect known artist tag values via persistence
-    known_artists: set[str] = set(db.tags.get_distinct_tag_values_for_files(ctx["played_file_ids"], "artist"))
+    # Known artist tag values were collected with the candidate pool
+    known_artists = set(ctx["pool"]["known_artists"])
     if not known_artists:
         logger.debug("No known artists for hidden gems, falling back to discovery-style")
 
-    cold_ops = db.get_vectors_track_cold(ctx["backbone_id"], ctx["library_key"])
-    doc_count = cold_ops.count()
-    if doc_count == 0:
+    if ctx["cold_doc_count"] == 0:
         return []
 
-    nlists = compute_nlists(doc_count)
-    nprobe = compute_nprobe(nlists)
-    fetch_limit = ctx["max_songs"] * 3  # Over-fetch to compensate for artist filtering
-    raw_results = cold_ops.search_similar(ctx["centroid"], fetch_limit, nprobe=nprobe)
-
-    # Exclude played tracks
-    candidates: list[dict[str, Any]] = [r for r in raw_results if r["file_id"] not in played]
-
+    # Exclude played tracks, then known-artist tracks
+    candidates = [c for c in _pool_prefix(ctx, "hidden_gems") if c["file_id"] not in played]
     if known_artists:
-        # Batch-query artist tags for candidates, then exclude known-artist tracks
-        candidate_file_ids = [r["file_id"] for r in candidates]
-        candidate_artists = db.tags.get_tag_values_grouped_by_file(candidate_file_ids, "artist")
-
-        candidates = [r for r in candidates if not (candidate_artists.get(r["file_id"], set()) & known_artists)]
+        candidates = [c for c in candidates if known_artists.isdisjoint(c["artists"])]
 
-    file_ids = [r["file_id"] for r in candidates][: ctx["max_songs"]]
+    file_ids = [c["file_id"] for c in candidates][: ctx["max_songs"]]
 
     return [
         NavidromePersonalPlaylistEntry(
@@ -195,7 +264,7 @@ def build_universal_playlist(
     db: Database,
     ctx: NavidromePersonalPlaylistContext,
 ) -> list[NavidromePersonalPlaylistEntry]:
-    """Build a diversified playlist via ANN search with stride sampling.
+    """Build a diversified playlist via stride sampling of ANN candidates.
 
     Unlike other playlists, this one does not exclude played tracks \u2014 it
     spreads selections across the result set for variety.
@@ -209,15 +278,9 @@ def build_universal_playlist(
         if the cold collection is empty.
 
     """
-    cold_ops = db.get_vectors_track_cold(ctx["backbone_id"], ctx["library_key"])
-    doc_count = cold_ops.count()
-    if doc_count == 0:
+    if ctx["cold_doc_count"] == 0:
         return []
-
-    nlists = compute_nlists(doc_count)
-    nprobe = compute_nprobe(nlists)
-    fetch_limit = ctx["max_songs"] * 3
-    raw_results = cold_ops.search_similar(ctx["centroid"], fetch_limit, nprobe=nprobe)
+    raw_results = _pool_prefix(ctx, "universal")
 
     # Diversified sampling: spread across the result set instead of taking top-N
     file_ids: list[str] = []
@@ -269,10 +332,9 @@ def build_genre_playlists(
 
     played_file_ids = ctx["played_file_ids"]
 
-    cold_ops = db.get_vectors_track_cold(ctx["backbone_id"], ctx["library_key"])
-    doc_count = cold_ops.count()
-    if doc_count == 0:
+    if ctx["cold_doc_count"] == 0:
         return []
+    cold_ops = db.get_vectors_track_cold(ctx["backbone_id"], ctx["library_key"])
 
     # Fetch cold vectors for all played tracks in one batch
     vector_docs = cold_ops.get_vectors_by_file_ids(played_file_ids)
@@ -280,8 +342,8 @@ def build_genre_playlists(
     if not vector_map:
         return []
 
-    # Fetch genre tags for played tracks in one batch
-    file_genres = db.tags.get_tag_values_grouped_by_file(played_file_ids, "genre")
+    # Genre tags for played tracks were collected with the candidate pool
+    file_genres = ctx["pool"]["played_genres"]
 
     # Pre-compute recency decay constants
     now_ms_val = now_ms().value
@@ -301,7 +363,7 @@ def build_genre_playlists(
         days_since = (now_ms_val - last_ms) / _MS_PER_DAY if last_ms is not None else fallback_days
         weight = math.log(1 + play["playcount"]) * math.exp(-decay_lambda * days_since)
 
-        for genre in file_genres.get(fid, set()):
+        for genre in file_genres.get(fid, []):
             genre_data.setdefault(genre, []).append((weight, vec))
 
     if not genre_data:
@@ -326,8 +388,7 @@ def build_genre_playlists(
         genre_centroids[genre] = centroid.tolist()
 
     # ANN search per genre using its specific centroid
-    nlists = compute_nlists(doc_count)
-    nprobe = compute_nprobe(nlists)
+    nprobe = ctx["nprobe"]
     fetch_limit = ctx["max_songs"] * 3  # over-fetch to compensate for in-traversal genre filter
 
     playlists: list[NavidromePersonalPlaylistEntry] = []
@@ -2,11 +2,19 @@
 
 Walks Navidrome's album list and collects song metadata (ID, path, play
 counts) for use by the sync workflow.
+
+Album details are fetched with a bounded number of concurrent ``getAlbum``
+requests.  Each listed album gets a change marker built from its
+``getAlbumList2`` entry; given the markers recorded by a previous sync, only
+new or changed albums are fetched again.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, TypedDict
 
@@ -17,6 +25,12 @@ logger = logging.getLogger(__name__)
 
 _ALBUM_PAGE_SIZE = 500
 _PROGRESS_LOG_INTERVAL = 100
+_CRAWL_CONCURRENCY = 8  # getAlbum requests in flight; below requests' default pool of 10 connections
+
+# AlbumID3 fields that move when an album's songs or the user's plays change.
+# Navidrome suffixes coverArt with the album's update time, and bumps the
+# album's playCount/played on every scrobble of one of its songs.
+_MARKER_FIELDS = ("songCount", "duration", "created", "changed", "coverArt", "playCount", "played")
 
 
 class CrawledSong(TypedDict):
@@ -28,6 +42,106 @@ class CrawledSong(TypedDict):
     last_played_ms: int
 
 
+@dataclass
+class AlbumCrawlResult:
+    """Output of :func:`crawl_navidrome_albums`."""
+
+    markers: dict[str, str] = field(default_factory=dict)
+    """Change marker of every listed album, keyed by album ID."""
+
+    songs_by_album: dict[str, list[CrawledSong]] = field(default_factory=dict)
+    """Songs of the fetched (new or changed) albums only, in listing order."""
+
+    @property
+    def songs(self) -> list[CrawledSong]:
+        """Songs of all fetched albums, flattened in listing order."""
+        return [song for songs in self.songs_by_album.values() for song in songs]
+
+
+def album_change_marker(album: dict[str, Any]) -> str:
+    """Build the change marker of one ``getAlbumList2`` album entry.
+
+    Two syncs see the same marker only if the album's song count, duration,
+    timestamps, cover art revision and play data are unchanged.
+    """
+    return "|".join(str(album.get(name, "")) for name in _MARKER_FIELDS)
+
+
+def crawl_navidrome_albums(
+    client: SubsonicClient,
+    known_markers: Mapping[str, str] | None = None,
+    *,
+    max_workers: int = _CRAWL_CONCURRENCY,
+) -> AlbumCrawlResult:
+    """Walk all Navidrome albums and fetch the songs of new or changed ones.
+
+    Paginates through ``getAlbumList2`` (alphabetical) and submits a
+    ``getAlbum`` request for every album whose change marker differs from
+    *known_markers*; at most *max_workers* requests run at once while
+    listing continues.
+
+    Args:
+        client: Authenticated Subsonic API client.
+        known_markers: Album ID to marker from the previous sync; ``None``
+            fetches every album.
+        max_workers: Maximum concurrent ``getAlbum`` requests.
+
+    Returns:
+        AlbumCrawlResult with markers for all albums and songs for the
+        fetched ones.
+
+    Raises:
+        SubsonicApiError: If any Subsonic request fails (pending requests
+            are cancelled).
+        requests.RequestException: On HTTP or connection errors.
+
+    """
+    known = known_markers or {}
+    result = AlbumCrawlResult()
+    futures: dict[str, Future[list[CrawledSong]]] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="nd-crawl") as pool:
+        try:
+            offset = 0
+            while True:
+                albums = client.get_album_list2("alphabeticalByName", _ALBUM_PAGE_SIZE, offset)
+                if not albums:
+                    break
+                for album in albums:
+                    album_id = album.get("id", "")
+                    if not album_id or album_id in result.markers:
+                        continue
+                    marker = album_change_marker(album)
+                    result.markers[album_id] = marker
+                    if known.get(album_id) != marker:
+                        futures[album_id] = pool.submit(_fetch_album_songs, client, album_id)
+                offset += len(albums)
+
+            song_count = 0
+            for fetched, (album_id, future) in enumerate(futures.items(), start=1):
+                result.songs_by_album[album_id] = future.result()
+                song_count += len(result.songs_by_album[album_id])
+                if fetched % _PROGRESS_LOG_INTERVAL == 0:
+                    logger.info(
+                        "crawl_navidrome_albums: Fetched %d/%d albums (%d songs so far)",
+                        fetched,
+                        len(futures),
+                        song_count,
+                    )
+        except BaseException:
+            for future in futures.values():
+                future.cancel()
+            raise
+
+    logger.info(
+        "crawl_navidrome_albums: %d albums listed, %d fetched, %d unchanged",
+        len(result.markers),
+        len(futures),
+        len(result.markers) - len(futures),
+    )
+    return result
+
+
 def crawl_navidrome_songs(client: SubsonicClient) -> list[CrawledSong]:
     """Walk all Navidrome albums and collect song data.
 
@@ -42,48 +156,30 @@ def crawl_navidrome_songs(client: SubsonicClient) -> list[CrawledSong]:
         List of crawled songs with Navidrome IDs, paths, and play data.
 
     """
-    all_songs: list[CrawledSong] = []
-    offset = 0
-    album_count = 0
-
-    while True:
-        albums = client.get_album_list2("alphabeticalByName", _ALBUM_PAGE_SIZE, offset)
-        if not albums:
-            break
-
-        for album in albums:
-            album_id = album.get("id", "")
-            if not album_id:
-                continue
-
-            album_detail = client.get_album(album_id)
-            songs: list[dict[str, Any]] = album_detail.get("song", [])
-
-            for song in songs:
-                song_id = song.get("id", "")
-                song_path = song.get("path", "")
-                if song_id and song_path:
-                    all_songs.append(
-                        CrawledSong(
-                            nd_id=song_id,
-                            nd_path=song_path,
-                            play_count=song.get("playCount", 0) or 0,
-                            last_played_ms=_parse_played_to_ms(song.get("played", "")),
-                        ),
-                    )
-
-            album_count += 1
-            if album_count % _PROGRESS_LOG_INTERVAL == 0:
-                logger.info(
-                    "crawl_navidrome_songs: Processed %d albums (%d songs so far)",
-                    album_count,
-                    len(all_songs),
-                )
+    result = crawl_navidrome_albums(client)
+    all_songs = result.songs
+    logger.info("crawl_navidrome_songs: Collected %d songs from %d albums", len(all_songs), len(result.markers))
+    return all_songs
 
-        offset += len(albums)
 
-    logger.info("crawl_navidrome_songs: Collected %d songs from %d albums", len(all_songs), album_count)
-    return all_songs
+def _fetch_album_songs(client: SubsonicClient, album_id: str) -> list[CrawledSong]:
+    """Fetch one album via ``getAlbum`` and collect its songs."""
+    album_detail = client.get_album(album_id)
+    songs: list[dict[str, Any]] = album_detail.get("song", [])
+    crawled: list[CrawledSong] = []
+    for song in songs:
+        song_id = song.get("id", "")
+        song_path = song.get("path", "")
+        if song_id and song_path:
+            crawled.append(
+                CrawledSong(
+                    nd_id=song_id,
+                    nd_path=song_path,
+                    play_count=song.get("playCount", 0) or 0,
+                    last_played_ms=_parse_played_to_ms(song.get("played", "")),
+                ),
+            )
+    return crawled
 
 
 def _parse_played_to_ms(played: str) -> int:
@@ -1,15 +1,24 @@
 """Taste-profile computation from Navidrome play history.
 
-Stateless component that builds a recency-weighted centroid embedding
-representing a user's listening preferences.  Called by the playlist
-generation workflow (Part E).
+Builds a recency-weighted centroid embedding representing a user's
+listening preferences.  Called by the playlist generation workflow (Part E).
+
+Profiles are persisted per (user, backbone, library) as a decayed running
+sum (``navidrome_taste_profiles``).  The first generation seeds the sum from
+play history; afterwards each scrobble folds its track's embedding in
+server-side (:func:`record_play`), so generation reads one stored vector
+instead of re-fetching up to ``top_n`` cold vectors.
+
+Per-play weights are the marginal increase of the batch weight
+:math:`\\log(1+c)`, i.e. :math:`\\log(1+c) - \\log(c)` for the *c*-th play, so
+a track's incremental contributions sum to its seeded weight.
 """
 
 from __future__ import annotations
 
 import logging
 import math
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
@@ -37,6 +46,9 @@ def compute_taste_profile(
 ) -> TasteProfile | None:
     """Compute a taste profile for *user_id* from play-count data.
 
+    Always recomputes from play history; see :func:`get_taste_profile` for
+    the persisted, incrementally maintained variant.
+
     Steps:
     1. Fetch top-N most-played tracks via graph traversal.
     2. Filter to tracks that have both a ``file_id`` and a cold-vector embedding.
@@ -56,43 +68,8 @@ def compute_taste_profile(
         embeddings could be found.
 
     """
-    # Step 1: Fetch top plays via graph traversal
-    plays: list[TrackPlayData] = db.navidrome_playcounts.get_top_plays(user_id, top_n)
-    if not plays:
-        logger.info("No play data for user %s — cannot build taste profile", user_id)
-        return None
-
-    # Step 2: Filter to resolved tracks (file_id is not None)
-    resolved_plays = [p for p in plays if p["file_id"] is not None]
-    if not resolved_plays:
-        logger.info(
-            "User %s has %d plays but none resolved to library files",
-            user_id,
-            len(plays),
-        )
-        return None
-
-    # Step 3: Batch-fetch cold vectors for resolved file IDs
-    file_ids = [p["file_id"] for p in resolved_plays]  # all non-None after filter
-    cold_ops = db.get_vectors_track_cold(backbone_id, library_key)
-    vector_docs = cold_ops.get_vectors_by_file_ids(file_ids)  # type: ignore[arg-type]
-
-    # Build file_id → vector mapping
-    vector_map: dict[str, list[float]] = {doc["file_id"]: doc["vector"] for doc in vector_docs if "vector" in doc}
-
-    # Step 4: Pair plays with their vectors, dropping those without embeddings
-    paired: list[tuple[TrackPlayData, list[float]]] = []
-    for play in resolved_plays:
-        vec = vector_map.get(play["file_id"])  # type: ignore[arg-type]
-        if vec is not None:
-            paired.append((play, vec))
-
+    paired = _fetch_paired_vectors(db, user_id, backbone_id, library_key, top_n)
     if not paired:
-        logger.info(
-            "User %s: %d resolved tracks but none have cold-vector embeddings",
-            user_id,
-            len(resolved_plays),
-        )
         return None
 
     # Step 5: Compute recency weights and weighted centroid
@@ -124,6 +101,159 @@ def compute_taste_profile(
     }
 
 
+def seed_taste_profile(
+    db: Database,
+    user_id: str,
+    backbone_id: str,
+    library_key: str,
+    half_life_days: float = 30.0,
+    top_n: int = 200,
+) -> TasteProfile | None:
+    """Compute a taste profile from play history and persist it.
+
+    Stores the unnormalised weighted sum (decayed to now) so later plays
+    can be folded in by :func:`record_play`.  The returned centroid is
+    identical to :func:`compute_taste_profile`.
+
+    Returns:
+        The seeded profile, or ``None`` if no played track has an embedding
+        (nothing is stored in that case).
+
+    """
+    paired = _fetch_paired_vectors(db, user_id, backbone_id, library_key, top_n)
+    if not paired:
+        return None
+
+    now_val = now_ms().value
+    weights = np.asarray(_compute_recency_weights([p for p, _ in paired], now_val, half_life_days), dtype=np.float64)
+    vector_sum = weights @ np.asarray([v for _, v in paired], dtype=np.float64)
+
+    db.navidrome_taste_profiles.upsert_profile(
+        user_id,
+        backbone_id,
+        library_key,
+        vector_sum=vector_sum.tolist(),
+        weight_sum=float(weights.sum()),
+        ref_ms=now_val,
+        half_life_days=half_life_days,
+        top_n=top_n,
+        track_count=len(paired),
+    )
+    logger.info("Seeded taste profile for user %s: %d tracks, dim=%d", user_id, len(paired), vector_sum.shape[0])
+
+    return {
+        "user_id": user_id,
+        "centroid": _normalise(vector_sum),
+        "backbone_id": backbone_id,
+        "library_key": library_key,
+        "track_count": len(paired),
+        "generated_at_ms": now_val,
+    }
+
+
+def load_taste_profile(
+    doc: dict[str, Any] | None,
+    half_life_days: float,
+    top_n: int,
+) -> TasteProfile | None:
+    """Convert a stored profile document into a :class:`TasteProfile`.
+
+    Args:
+        doc: Document from ``db.navidrome_taste_profiles`` (or ``None``).
+        half_life_days: Half-life the caller expects.
+        top_n: Top-N limit the caller expects.
+
+    Returns:
+        The profile, or ``None`` if *doc* is missing, empty, or was built
+        with different settings (the caller should reseed).
+
+    """
+    if doc is None:
+        return None
+    if doc.get("half_life_days") != half_life_days or doc.get("top_n") != top_n:
+        return None
+
+    vector_sum = np.asarray(doc.get("vector_sum") or [], dtype=np.float64)
+    if vector_sum.size == 0 or not np.any(vector_sum):
+        return None
+
+    return {
+        "user_id": doc["userid"],
+        "centroid": _normalise(vector_sum),
+        "backbone_id": doc["backbone_id"],
+        "library_key": doc["library_key"],
+        "track_count": int(doc.get("track_count", 0)) + int(doc.get("play_count", 0)),
+        "generated_at_ms": int(doc.get("updated_at_ms", 0)),
+    }
+
+
+def get_taste_profile(
+    db: Database,
+    user_id: str,
+    backbone_id: str,
+    library_key: str,
+    half_life_days: float = 30.0,
+    top_n: int = 200,
+) -> TasteProfile | None:
+    """Return the persisted taste profile, seeding it on first use.
+
+    Reads one stored document; only when none exists (or settings changed)
+    does it fall back to :func:`seed_taste_profile`.
+
+    Returns:
+        A :class:`TasteProfile` dict, or ``None`` if the user has no
+        played tracks with embeddings.
+
+    """
+    doc = db.navidrome_taste_profiles.get_profile(user_id, backbone_id, library_key)
+    profile = load_taste_profile(doc, half_life_days, top_n)
+    if profile is not None:
+        return profile
+    return seed_taste_profile(db, user_id, backbone_id, library_key, half_life_days, top_n)
+
+
+def record_play(
+    db: Database,
+    user_id: str,
+    file_id: str,
+    playcount: int,
+    timestamp_ms: int,
+) -> int:
+    """Fold one play of *file_id* into every stored profile of *user_id*.
+
+    Profiles that were never seeded are left alone; they are computed from
+    play history on first generation.  Each update is a single server-side
+    AQL write, see ``NavidromeTasteProfilesOperations.apply_play``.
+
+    Args:
+        db: Database instance.
+        user_id: Navidrome user identifier.
+        file_id: ``library_files/_id`` of the played track.
+        playcount: The track's play count after this play.
+        timestamp_ms: Epoch milliseconds of the play.
+
+    Returns:
+        Number of profiles updated.
+
+    """
+    profiles = db.navidrome_taste_profiles.list_user_profiles(user_id)
+    if not profiles:
+        return 0
+
+    weight = _marginal_play_weight(playcount)
+    updated = 0
+    for profile in profiles:
+        cold_ops = db.get_vectors_track_cold(profile["backbone_id"], profile["library_key"])
+        vector_docs = cold_ops.get_vectors_by_file_ids([file_id])
+        vector = next((doc["vector"] for doc in vector_docs if "vector" in doc), None)
+        if vector is None:
+            continue
+        if db.navidrome_taste_profiles.apply_play(profile["_key"], vector, weight, timestamp_ms):
+            updated += 1
+
+    return updated
+
+
 # ---------------------------------------------------------------------------
 # Private helpers
 # ---------------------------------------------------------------------------
@@ -131,6 +261,61 @@ def compute_taste_profile(
 _MS_PER_DAY = 86_400_000
 
 
+def _fetch_paired_vectors(
+    db: Database,
+    user_id: str,
+    backbone_id: str,
+    library_key: str,
+    top_n: int,
+) -> list[tuple[TrackPlayData, list[float]]]:
+    """Fetch top plays paired with their cold-vector embeddings.
+
+    Returns:
+        ``(play, vector)`` pairs; empty when no play resolves to an embedding.
+
+    """
+    # Step 1: Fetch top plays via graph traversal
+    plays: list[TrackPlayData] = db.navidrome_playcounts.get_top_plays(user_id, top_n)
+    if not plays:
+        logger.info("No play data for user %s — cannot build taste profile", user_id)
+        return []
+
+    # Step 2: Filter to resolved tracks (file_id is not None)
+    resolved_plays = [p for p in plays if p["file_id"] is not None]
+    if not resolved_plays:
+        logger.info(
+            "User %s has %d plays but none resolved to library files",
+            user_id,
+            len(plays),
+        )
+        return []
+
+    # Step 3: Batch-fetch cold vectors for resolved file IDs
+    file_ids = [p["file_id"] for p in resolved_plays]  # all non-None after filter
+    cold_ops = db.get_vectors_track_cold(backbone_id, library_key)
+    vector_docs = cold_ops.get_vectors_by_file_ids(file_ids)  # type: ignore[arg-type]
+
+    # Build file_id → vector mapping
+    vector_map: dict[str, list[float]] = {doc["file_id"]: doc["vector"] for doc in vector_docs if "vector" in doc}
+
+    # Step 4: Pair plays with their vectors, dropping those without embeddings
+    paired: list[tuple[TrackPlayData, list[float]]] = []
+    for play in resolved_plays:
+        vec = vector_map.get(play["file_id"])  # type: ignore[arg-type]
+        if vec is not None:
+            paired.append((play, vec))
+
+    if not paired:
+        logger.info(
+            "User %s: %d resolved tracks but none have cold-vector embeddings",
+            user_id,
+            len(resolved_plays),
+        )
+        return []
+
+    return paired
+
+
 def _compute_recency_weights(
     plays: list[TrackPlayData],
     now_ms_val: int,
@@ -172,6 +357,21 @@ def _compute_recency_weights(
     return weights
 
 
+def _marginal_play_weight(playcount: int) -> float:
+    """Weight of the *playcount*-th play: :math:`\\log(1+c) - \\log(c)`."""
+    count = max(playcount, 1)
+    return math.log1p(count) - math.log(count)
+
+
+def _normalise(vector: np.ndarray) -> list[float]:
+    """L2-normalise *vector* and return it as a plain list of floats."""
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector = vector / norm
+    result: list[float] = vector.tolist()
+    return result
+
+
 def _compute_weighted_centroid(
     vectors: list[list[float]],
     weights: list[float],
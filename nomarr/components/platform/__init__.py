@@ -18,6 +18,7 @@ from .gpu_probe_comp import (
     NVIDIA_SMI_TIMEOUT_SECONDS,
     probe_gpu_availability,
 )
+from .health_history_comp import HealthHistoryWriter, HealthSnapshot
 from .resource_monitor_comp import (
     TELEMETRY_CACHE_TTL_MS,
     ResourceStatus,
@@ -38,6 +39,8 @@ __all__ = [
     "TELEMETRY_CACHE_TTL_MS",
     "USERNAME",
     "GPUHealthMonitor",
+    "HealthHistoryWriter",
+    "HealthSnapshot",
     "ResourceStatus",
     "check_nvidia_gpu_capability",
     "check_resource_headroom",
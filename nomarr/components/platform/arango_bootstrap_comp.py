@@ -145,7 +145,7 @@ def _create_collections(db: DatabaseLike) -> None:
 
 
 def _seed_file_states(db: DatabaseLike) -> None:
-    """Ensure all 16 file_states vertex documents exist (8 axes x positive + negative).
+    """Ensure all 18 file_states vertex documents exist (9 axes x positive + negative).
 
     Idempotent — inserts only if the document is missing.
     """
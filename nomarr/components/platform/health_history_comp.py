@@ -0,0 +1,149 @@
+"""Buffered health history writer.
+
+HealthMonitorService hands component snapshots to a :class:`HealthHistoryWriter`
+instead of writing one document per component per tick. The writer keeps
+only snapshots that carry new information and flushes them in one bulk
+insert into ``health_history``; retention is the collection's TTL index.
+
+History is best-effort: it is never read for liveness decisions, and a
+failed flush keeps its snapshots buffered for the next one.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from nomarr.helpers.time_helper import now_ms
+
+if TYPE_CHECKING:
+    from nomarr.helpers.time_helper import InternalSeconds
+    from nomarr.persistence.db import Database
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HealthSnapshot:
+    """A component's status as the health monitor sees it."""
+
+    component_id: str
+    status: str
+    last_heartbeat_ms: int  # Wall-clock ms of the last health frame
+    heartbeat_age_s: float  # Seconds since that frame
+    last_frame_time: InternalSeconds  # Monotonic time of that frame; identifies the heartbeat
+
+
+class HealthHistoryWriter:
+    """Buffers health snapshots and flushes them in one bulk insert.
+
+    A snapshot is buffered only when it says something new about a component:
+
+    - ``transition``: recorded from the monitor's status-change path, so
+      states shorter than a history tick are kept.
+    - ``changed``: an observed status differs from the last buffered one.
+    - ``stale``: the heartbeat is older than ``stale_heartbeat_s`` and is not
+      the heartbeat already buffered, so a silent component is recorded once
+      per missed heartbeat instead of once per tick. Heartbeats are compared
+      by their monotonic ``last_frame_time``: the wall-clock value is
+      re-derived every tick and can be off by a millisecond.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        *,
+        retention_s: int,
+        stale_heartbeat_s: float,
+        max_buffered: int = 10_000,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            db: Database with ``health_history`` operations
+            retention_s: Seconds a snapshot is kept (TTL ``expires_at``)
+            stale_heartbeat_s: Heartbeat age after which an unchanged
+                component is recorded again
+            max_buffered: Snapshots kept while the database is unavailable;
+                the oldest are dropped beyond this
+
+        """
+        self.db = db
+        self.retention_s = retention_s
+        self.stale_heartbeat_s = stale_heartbeat_s
+        self._lock = threading.Lock()
+        self._buffer: deque[dict[str, Any]] = deque(maxlen=max_buffered)
+        # component_id -> (status, last_frame_time) of its last buffered snapshot
+        self._last: dict[str, tuple[str, InternalSeconds]] = {}
+
+    def record_transition(self, snapshot: HealthSnapshot) -> None:
+        """Buffer a status transition (cheap; safe on the monitor's hot path)."""
+        with self._lock:
+            self._append(snapshot, "transition")
+
+    def observe(self, snapshots: list[HealthSnapshot]) -> int:
+        """Buffer the snapshots that changed or whose heartbeat went stale.
+
+        Returns:
+            Number of snapshots buffered
+
+        """
+        buffered = 0
+        with self._lock:
+            for snapshot in snapshots:
+                last = self._last.get(snapshot.component_id)
+                if last is None or last[0] != snapshot.status:
+                    self._append(snapshot, "changed")
+                elif snapshot.heartbeat_age_s >= self.stale_heartbeat_s and last[1] != snapshot.last_frame_time:
+                    self._append(snapshot, "stale")
+                else:
+                    continue
+                buffered += 1
+        return buffered
+
+    def forget(self, component_id: str) -> None:
+        """Drop change tracking for an unregistered component."""
+        with self._lock:
+            self._last.pop(component_id, None)
+
+    def flush(self) -> int:
+        """Write every buffered snapshot in one insert.
+
+        Returns:
+            Number of snapshots written (0 if the insert failed)
+
+        """
+        with self._lock:
+            pending = list(self._buffer)
+            self._buffer.clear()
+        if not pending:
+            return 0
+        try:
+            self.db.health_history.insert_snapshots(pending)
+        except Exception as e:
+            logger.debug("[HealthHistory] Flush of %d snapshots failed: %s", len(pending), e)
+            with self._lock:
+                # Requeue ahead of newer snapshots; the deque keeps the newest max_buffered
+                retry = pending + list(self._buffer)
+                self._buffer.clear()
+                self._buffer.extend(retry)
+            return 0
+        return len(pending)
+
+    def _append(self, snapshot: HealthSnapshot, reason: str) -> None:
+        recorded_at = now_ms().value
+        self._buffer.append(
+            {
+                "component_id": snapshot.component_id,
+                "status": snapshot.status,
+                "reason": reason,
+                "last_heartbeat": snapshot.last_heartbeat_ms,
+                "recorded_at": recorded_at,
+                # TTL index field: ArangoDB expects unix seconds
+                "expires_at": recorded_at // 1000 + self.retention_s,
+            }
+        )
+        self._last[snapshot.component_id] = (snapshot.status, snapshot.last_frame_time)
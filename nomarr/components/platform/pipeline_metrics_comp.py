@@ -0,0 +1,98 @@
+"""Metric families of the processing pipeline and how stage timings map onto them.
+
+Discovery workers record into their own :class:`MetricsRegistry` and send
+its snapshot with every health frame; the parent merges the latest snapshot
+of each worker (labelled ``worker``) and adds gauges read from the database
+at scrape time.
+
+Stage durations come from the per-file ``timings`` dict the processing
+workflows already build for the log summary (milliseconds):
+
+| Stage        | Timing keys                           |
+|--------------|---------------------------------------|
+| `decode`     | ``audio_load``                        |
+| `preprocess` | ``pre_<backbone>`` (summed)           |
+| `backbone`   | ``emb_<backbone>`` (summed)           |
+| `heads`      | ``heads`` or ``heads_<backbone>``     |
+
+With streaming decode, decoding overlaps log-mel extraction and backbone
+inference, so ``decode`` is the wall time of all three. ``persist`` and
+``claim_wait`` are timed by the worker itself.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from nomarr.helpers.metrics_helper import DEFAULT_DURATION_BUCKETS_S, MetricSpec, MetricsRegistry
+
+STAGE_SECONDS = "nomarr_pipeline_stage_seconds"
+FILE_SECONDS = "nomarr_pipeline_file_seconds"
+FILES_TOTAL = "nomarr_pipeline_files_total"
+QUEUE_DEPTH = "nomarr_pipeline_queue_depth"
+VRAM_PROMISES = "nomarr_vram_promises"
+
+PIPELINE_METRICS: tuple[MetricSpec, ...] = (
+    MetricSpec(
+        STAGE_SECONDS,
+        "histogram",
+        "Time per file spent in one pipeline stage (backbone stages summed over backbones).",
+        DEFAULT_DURATION_BUCKETS_S,
+    ),
+    MetricSpec(FILE_SECONDS, "histogram", "Wall time of the processing workflow per file.", DEFAULT_DURATION_BUCKETS_S),
+    MetricSpec(FILES_TOTAL, "counter", "Files finished by discovery workers, by outcome."),
+    MetricSpec(QUEUE_DEPTH, "gauge", "Files waiting to be processed, by queue."),
+    MetricSpec(VRAM_PROMISES, "gauge", "Active VRAM promises across the worker fleet."),
+)
+
+# Outcomes of FILES_TOTAL
+OUTCOME_TAGGED = "tagged"
+OUTCOME_HEADS_ONLY = "heads_only"
+OUTCOME_SKIPPED = "skipped"
+OUTCOME_ERROR = "error"
+OUTCOME_PERSIST_ERROR = "persist_error"
+
+
+def new_pipeline_registry() -> MetricsRegistry:
+    """Empty registry for the pipeline metric families."""
+    return MetricsRegistry(PIPELINE_METRICS)
+
+
+def stage_durations_ms(timings: Mapping[str, float]) -> dict[str, float]:
+    """Collapse a workflow ``timings`` dict into per-stage milliseconds.
+
+    Stages without any matching key are left out (e.g. ``decode`` for
+    head-only reprocessing).
+    """
+    stages: dict[str, float] = {}
+    for key, ms in timings.items():
+        if key == "audio_load":
+            stage = "decode"
+        elif key.startswith("pre_"):
+            stage = "preprocess"
+        elif key.startswith("emb_") and key != "emb_wall":
+            stage = "backbone"
+        elif key == "heads" or key.startswith("heads_"):
+            stage = "heads"
+        else:
+            continue
+        stages[stage] = stages.get(stage, 0.0) + ms
+    return stages
+
+
+def observe_stage(registry: MetricsRegistry, stage: str, ms: float) -> None:
+    """Record one duration of *stage*, given in milliseconds."""
+    registry.observe(STAGE_SECONDS, ms / 1000, {"stage": stage})
+
+
+def record_processed_file(
+    registry: MetricsRegistry,
+    timings: Mapping[str, float],
+    elapsed_ms: float,
+    outcome: str,
+) -> None:
+    """Record the stage durations, wall time and outcome of one processed file."""
+    for stage, ms in stage_durations_ms(timings).items():
+        observe_stage(registry, stage, ms)
+    registry.observe(FILE_SECONDS, elapsed_ms / 1000)
+    registry.inc(FILES_TOTAL, labels={"outcome": outcome})
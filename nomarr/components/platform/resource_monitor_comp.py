@@ -7,6 +7,7 @@ Architecture:
 - GPU Capability: Checked once at startup via nvidia-smi, cached forever
 - GPU Telemetry: VRAM usage via nvidia-smi with TTL cache (not called until capability confirmed)
 - RAM Telemetry: Process RSS via psutil with TTL cache
+- CPU Topology: Usable CPUs (affinity, cgroup quota) and NUMA layout
 
 Per GPU_REFACTOR_PLAN.md Section 5:
 - A container is GPU-capable iff nvidia-smi succeeds inside the container
@@ -17,7 +18,9 @@ from __future__ import annotations
 
 import contextlib
 import logging
+import math
 import os
+import platform
 import subprocess
 from dataclasses import dataclass
 from typing import Any
@@ -372,6 +375,81 @@ def _get_cgroup_available_mb() -> int:
     return 0  # Not in a cgroup or error reading
 
 
+def get_cpu_topology() -> dict[str, Any]:
+    """Describe the CPUs this process can actually use.
+
+    The usable count honours the scheduler affinity mask and a cgroup CPU
+    quota (Docker ``--cpus``), either of which can be far below the host's
+    core count.  NUMA nodes are read from sysfs (Linux only; 1 elsewhere).
+
+    Returns:
+        Dict with keys:
+            - cpus: int, CPUs usable by this process (at least 1)
+            - host_cpus: int, logical CPUs on the host
+            - numa_nodes: int, NUMA nodes on the host (at least 1)
+            - cpus_per_node: int, usable CPUs per NUMA node (at least 1)
+            - model: str, CPU model name ("" if unknown)
+
+    """
+    host_cpus = os.cpu_count() or 1
+    cpus = host_cpus
+    with contextlib.suppress(Exception):
+        cpus = len(os.sched_getaffinity(0))
+    quota = _get_cgroup_cpu_quota()
+    if quota > 0:
+        cpus = min(cpus, max(1, math.ceil(quota)))
+
+    numa_nodes = 1
+    with contextlib.suppress(Exception):
+        node_root = "/sys/devices/system/node"
+        if os.path.isdir(node_root):
+            numa_nodes = max(1, sum(1 for n in os.listdir(node_root) if n.startswith("node") and n[4:].isdigit()))
+
+    model = platform.processor()
+    with contextlib.suppress(Exception), open("/proc/cpuinfo") as f:
+        for line in f:
+            if line.startswith("model name"):
+                model = line.split(":", 1)[1].strip()
+                break
+
+    return {
+        "cpus": cpus,
+        "host_cpus": host_cpus,
+        "numa_nodes": numa_nodes,
+        "cpus_per_node": max(1, cpus // numa_nodes),
+        "model": model,
+    }
+
+
+def _get_cgroup_cpu_quota() -> float:
+    """Read the cgroup CPU quota in CPUs (Docker ``--cpus``).
+
+    Returns:
+        Quota in CPUs, or 0 if unlimited, not in a cgroup or unreadable
+
+    """
+    # cgroup v2: "<quota> <period>" or "max <period>"
+    with contextlib.suppress(Exception):
+        if os.path.exists("/sys/fs/cgroup/cpu.max"):
+            with open("/sys/fs/cgroup/cpu.max") as f:
+                quota_str, period_str = f.read().split()[:2]
+            if quota_str == "max":
+                return 0.0
+            return int(quota_str) / int(period_str)
+
+    # cgroup v1: quota of -1 means no limit
+    with contextlib.suppress(Exception):
+        if os.path.exists("/sys/fs/cgroup/cpu/cpu.cfs_quota_us"):
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+                quota_us = int(f.read().strip())
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+                period_us = int(f.read().strip())
+            if quota_us > 0 and period_us > 0:
+                return quota_us / period_us
+
+    return 0.0
+
+
 def check_resource_headroom(
     vram_budget_mb: int,
     ram_budget_mb: int,
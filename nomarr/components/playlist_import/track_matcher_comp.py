@@ -4,19 +4,30 @@ Implements tiered matching strategy:
 1. ISRC exact match (highest confidence)
 2. Title + Artist exact match (normalized)
 3. Fuzzy match with configurable threshold
+
+``match_tracks`` builds a :class:`TrackCandidateIndex` once per import: hash
+lookups for strategies 1-2 and character histograms that narrow the fuzzy
+strategy to the tracks that can still reach the threshold.
 """
 
 import logging
 from dataclasses import dataclass
 from typing import Any
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 
 from nomarr.components.playlist_import.metadata_normalizer_comp import (
     normalize_artist,
     normalize_title,
 )
-from nomarr.helpers.dto.playlist_import_dto import MatchedFileInfo, MatchResult, PlaylistTrackInput
+from nomarr.helpers.dto.playlist_import_dto import (
+    MatchedFileInfo,
+    MatchResult,
+    PlaylistMatchTimings,
+    PlaylistTrackInput,
+)
+from nomarr.helpers.time_helper import internal_ms
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +35,15 @@ logger = logging.getLogger(__name__)
 FUZZY_HIGH_THRESHOLD = 85  # High confidence fuzzy match
 FUZZY_LOW_THRESHOLD = 70  # Ambiguous match (needs review)
 
+# Fuzzy combined score weights
+TITLE_WEIGHT = 0.7
+ARTIST_WEIGHT = 0.3
+
+# Lowest title score that a perfect artist score can still lift to FUZZY_LOW_THRESHOLD
+_TITLE_SCORE_FLOOR = (FUZZY_LOW_THRESHOLD - 100 * ARTIST_WEIGHT) / TITLE_WEIGHT - 1e-6
+# Score-matrix cells per cdist call in unblocked batches (float64: 64 MiB)
+_CDIST_CELLS = 1 << 23
+
 
 @dataclass
 class LibraryTrack:
@@ -60,6 +80,200 @@ class LibraryTrack:
         )
 
 
+# Character buckets for TrackCandidateIndex; every other character shares the last bucket.
+_BUCKET_CHARS = " abcdefghijklmnopqrstuvwxyz0123456789"
+_BUCKETS = len(_BUCKET_CHARS) + 1
+_BUCKET_OF_CODEPOINT = np.full(128, _BUCKETS - 1, dtype=np.int64)
+_BUCKET_OF_CODEPOINT[[ord(char) for char in _BUCKET_CHARS]] = np.arange(len(_BUCKET_CHARS))
+
+
+def _char_counts(texts: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Character-bucket histograms of *texts* as token_sort_ratio sees them.
+
+    Returns:
+        ``(counts, lengths)``: counts are bucket-major (one contiguous int16 row
+        per bucket, one column per text) so a query touches only its own buckets.
+    """
+    # token_sort_ratio compares the tokens re-joined by single spaces
+    joined = [" ".join(text.split()) for text in texts]
+    lengths = np.fromiter(map(len, joined), dtype=np.int64, count=len(joined))
+    codepoints = np.frombuffer("".join(joined).encode("utf-32-le"), dtype=np.uint32)
+    buckets = _BUCKET_OF_CODEPOINT[np.minimum(codepoints, 127)]
+    buckets[codepoints > 127] = _BUCKETS - 1
+    texts_idx = np.repeat(np.arange(len(joined), dtype=np.int64), lengths)
+    counts = np.bincount(buckets * len(joined) + texts_idx, minlength=_BUCKETS * len(joined))
+    # A title would need 32k copies of one character to saturate int16
+    counts = np.minimum(counts, np.iinfo(np.int16).max).astype(np.int16).reshape(_BUCKETS, len(joined))
+    return counts, lengths.astype(np.int32)
+
+
+def _ratio_upper_bound(
+    library: tuple[np.ndarray, np.ndarray],
+    query: tuple[np.ndarray, np.ndarray],
+) -> np.ndarray:
+    """Upper bound of ``token_sort_ratio(query, track)`` for every track.
+
+    The ratio is ``200 * LCS / (len_a + len_b)`` and a common subsequence can
+    use each character at most as often as both strings contain it, so the
+    per-character minimum summed over buckets bounds the LCS from above.
+
+    Args:
+        library: ``_char_counts`` of the library texts
+        query: ``_char_counts`` of a single query text
+    """
+    library_counts, library_lengths = library
+    query_counts, query_lengths = query
+    common = np.zeros(len(library_lengths), dtype=np.int32)
+    scratch = np.empty(len(library_lengths), dtype=np.int16)
+    for bucket in np.flatnonzero(query_counts[:, 0]):
+        np.minimum(library_counts[bucket], query_counts[bucket, 0], out=scratch)
+        common += scratch
+    total = library_lengths + query_lengths[0]
+    # Two empty strings score 100
+    return np.where(total > 0, 200.0 * common / np.maximum(total, 1), 100.0)
+
+
+def _query_counts(counts: tuple[np.ndarray, np.ndarray], query: int) -> tuple[np.ndarray, np.ndarray]:
+    """The ``_char_counts`` of one text out of a batch."""
+    return counts[0][:, query : query + 1], counts[1][query : query + 1]
+
+
+class TrackCandidateIndex:
+    """Lookup structures over library tracks, built once per import session.
+
+    - ISRC and normalized (title, artist) hash maps replace the linear scans
+      of strategies 1 and 2 (first track in library order wins, as before).
+    - Character histograms of ``normalized_title`` and ``normalized_artist``
+      block the fuzzy strategy: a track is scored only if the upper bound of
+      its combined score reaches ``FUZZY_LOW_THRESHOLD``. The bound never
+      underestimates, so the fuzzy candidates (and every match decision) are
+      those of a full scan. Candidates keep library order, so ties rank as in
+      a full scan.
+    """
+
+    def __init__(self, library_tracks: list[LibraryTrack]) -> None:
+        """Index *library_tracks*.
+
+        Args:
+            library_tracks: Library tracks, in the order a full scan would visit them.
+        """
+        self.tracks = library_tracks
+        self._titles = [track.normalized_title for track in library_tracks]
+        self._artists = [track.normalized_artist for track in library_tracks]
+        self._by_isrc: dict[str, LibraryTrack] = {}
+        self._by_metadata: dict[tuple[str, str], LibraryTrack] = {}
+        for track in library_tracks:
+            if track.isrc:
+                self._by_isrc.setdefault(track.isrc.upper(), track)
+            self._by_metadata.setdefault((track.normalized_title, track.normalized_artist), track)
+        self._title_counts = _char_counts(self._titles)
+        self._artist_counts = _char_counts(self._artists)
+
+    def find_isrc(self, isrc: str) -> LibraryTrack | None:
+        """First library track with this ISRC (case-insensitive)."""
+        return self._by_isrc.get(isrc.upper())
+
+    def find_exact(self, title_norm: str, artist_norm: str) -> LibraryTrack | None:
+        """First library track with this normalized title and artist."""
+        return self._by_metadata.get((title_norm, artist_norm))
+
+    def fuzzy_candidates(self, title_norm: str, artist_norm: str) -> list[LibraryTrack]:
+        """Tracks whose combined fuzzy score can reach ``FUZZY_LOW_THRESHOLD``, in library order."""
+        return [self.tracks[i] for i in self._reachable(_char_counts([title_norm]), _char_counts([artist_norm]))]
+
+    def _reachable(
+        self, title_query: tuple[np.ndarray, np.ndarray], artist_query: tuple[np.ndarray, np.ndarray]
+    ) -> np.ndarray:
+        title_bound = _ratio_upper_bound(self._title_counts, title_query)
+        artist_bound = _ratio_upper_bound(self._artist_counts, artist_query)
+        # The margin absorbs float rounding
+        reachable = (title_bound * TITLE_WEIGHT) + (artist_bound * ARTIST_WEIGHT) >= FUZZY_LOW_THRESHOLD - 1e-6
+        return np.flatnonzero(reachable)
+
+    def fuzzy_pairs(
+        self,
+        title_norms: list[str],
+        artist_norms: list[str],
+        *,
+        blocked: bool = True,
+        workers: int = -1,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+        """Score many queries at once; keep pairs at or above ``FUZZY_LOW_THRESHOLD``.
+
+        Titles and artists are scored by rapidfuzz's multi-threaded ``cdist`` /
+        ``cpdist`` in float64, so every combined score equals the per-pair
+        ``token_sort_ratio`` arithmetic of ``_fuzzy_match``.
+
+        Args:
+            title_norms: Normalized query titles
+            artist_norms: Normalized query artists (same length)
+            blocked: Score only each query's :meth:`fuzzy_candidates`; otherwise
+                score titles against the whole library and artists for the pairs
+                whose title can still reach the threshold.
+            workers: rapidfuzz threads (-1 = all cores)
+
+        Returns:
+            ``(query, track, score, scored_pairs)``: query and track positions
+            with their combined scores, ordered by query then library order,
+            and the number of pairs whose title and artist were both scored.
+        """
+        if blocked:
+            queries, tracks = self._candidate_pairs(title_norms, artist_norms)
+            title_scores = process.cpdist(
+                [title_norms[q] for q in queries],
+                [self._titles[t] for t in tracks],
+                scorer=fuzz.token_sort_ratio,
+                dtype=np.float64,
+                workers=workers,
+            )
+        else:
+            queries, tracks, title_scores = self._title_pairs(title_norms, workers)
+        artist_scores = process.cpdist(
+            [artist_norms[q] for q in queries],
+            [self._artists[t] for t in tracks],
+            scorer=fuzz.token_sort_ratio,
+            dtype=np.float64,
+            workers=workers,
+        )
+        scores = (title_scores * TITLE_WEIGHT) + (artist_scores * ARTIST_WEIGHT)
+        keep = scores >= FUZZY_LOW_THRESHOLD
+        return queries[keep], tracks[keep], scores[keep], len(queries)
+
+    def _candidate_pairs(self, title_norms: list[str], artist_norms: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        title_counts = _char_counts(title_norms)
+        artist_counts = _char_counts(artist_norms)
+        queries: list[np.ndarray] = []
+        tracks: list[np.ndarray] = []
+        for query in range(len(title_norms)):
+            reachable = self._reachable(_query_counts(title_counts, query), _query_counts(artist_counts, query))
+            queries.append(np.full(len(reachable), query, dtype=np.int64))
+            tracks.append(reachable)
+        if not queries:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(queries), np.concatenate(tracks)
+
+    def _title_pairs(self, title_norms: list[str], workers: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        rows = max(1, _CDIST_CELLS // len(self._titles))
+        queries: list[np.ndarray] = [np.empty(0, dtype=np.int64)]
+        tracks: list[np.ndarray] = [np.empty(0, dtype=np.int64)]
+        scores: list[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        for first in range(0, len(title_norms), rows):
+            # Scores under the cutoff come back as 0
+            block = process.cdist(
+                title_norms[first : first + rows],
+                self._titles,
+                scorer=fuzz.token_sort_ratio,
+                dtype=np.float64,
+                score_cutoff=_TITLE_SCORE_FLOOR,
+                workers=workers,
+            )
+            block_queries, block_tracks = np.nonzero(block)
+            queries.append(block_queries + first)
+            tracks.append(block_tracks)
+            scores.append(block[block_queries, block_tracks])
+        return np.concatenate(queries), np.concatenate(tracks), np.concatenate(scores)
+
+
 def _to_file_info(lib_track: LibraryTrack) -> MatchedFileInfo:
     """Convert a LibraryTrack to a MatchedFileInfo for API responses."""
     return MatchedFileInfo(
@@ -74,6 +288,7 @@ def _to_file_info(lib_track: LibraryTrack) -> MatchedFileInfo:
 def match_track(
     input_track: PlaylistTrackInput,
     library_tracks: list[LibraryTrack],
+    index: TrackCandidateIndex | None = None,
 ) -> MatchResult:
     """Match a single playlist track against library tracks.
 
@@ -85,6 +300,8 @@ def match_track(
     Args:
         input_track: Track from streaming playlist to match
         library_tracks: List of library tracks to search
+        index: Optional index over ``library_tracks``; without it every
+            strategy scans the whole list.
 
     Returns:
         MatchResult with status, confidence, and matched file info
@@ -100,6 +317,9 @@ def match_track(
     input_title_norm = normalize_title(input_track.title)
     input_artist_norm = normalize_artist(input_track.artist)
 
+    if index is not None:
+        return _match_indexed(input_track, input_title_norm, input_artist_norm, index)
+
     # Strategy 1: ISRC exact match
     if input_track.isrc:
         for lib_track in library_tracks:
@@ -125,6 +345,49 @@ def match_track(
     return _fuzzy_match(input_track, input_title_norm, input_artist_norm, library_tracks)
 
 
+def _match_indexed(
+    input_track: PlaylistTrackInput,
+    input_title_norm: str,
+    input_artist_norm: str,
+    index: TrackCandidateIndex,
+) -> MatchResult:
+    """``match_track`` strategies using hash lookups and blocked fuzzy candidates."""
+    result = _match_exact(input_track, input_title_norm, input_artist_norm, index)
+    if result is not None:
+        return result
+
+    candidates = index.fuzzy_candidates(input_title_norm, input_artist_norm)
+    return _fuzzy_match(input_track, input_title_norm, input_artist_norm, candidates)
+
+
+def _match_exact(
+    input_track: PlaylistTrackInput,
+    input_title_norm: str,
+    input_artist_norm: str,
+    index: TrackCandidateIndex,
+) -> MatchResult | None:
+    """Strategies 1 and 2 (ISRC, then normalized title + artist) as index lookups."""
+    if input_track.isrc:
+        lib_track = index.find_isrc(input_track.isrc)
+        if lib_track is not None:
+            return MatchResult(
+                input_track=input_track,
+                status="exact_isrc",
+                confidence=1.0,
+                matched_file=_to_file_info(lib_track),
+            )
+
+    lib_track = index.find_exact(input_title_norm, input_artist_norm)
+    if lib_track is not None:
+        return MatchResult(
+            input_track=input_track,
+            status="exact_metadata",
+            confidence=0.95,
+            matched_file=_to_file_info(lib_track),
+        )
+    return None
+
+
 def _fuzzy_match(
     input_track: PlaylistTrackInput,
     input_title_norm: str,
@@ -155,11 +418,28 @@ def _fuzzy_match(
         artist_score = fuzz.token_sort_ratio(input_artist_norm, lib_track.normalized_artist)
 
         # Combined score: title 70%, artist 30%
-        combined_score = (title_score * 0.7) + (artist_score * 0.3)
+        combined_score = (title_score * TITLE_WEIGHT) + (artist_score * ARTIST_WEIGHT)
 
         if combined_score >= FUZZY_LOW_THRESHOLD:
             candidates.append((combined_score, lib_track))
 
+    # Sort by score descending
+    candidates.sort(key=lambda x: x[0], reverse=True)
+
+    return _fuzzy_result(input_track, candidates)
+
+
+def _fuzzy_result(input_track: PlaylistTrackInput, candidates: list[tuple[float, LibraryTrack]]) -> MatchResult:
+    """Classify fuzzy candidates into a fuzzy, ambiguous or not_found result.
+
+    Args:
+        input_track: Original input track
+        candidates: ``(combined_score, track)`` at or above ``FUZZY_LOW_THRESHOLD``,
+            best first (ties in library order). Only the first four are used.
+
+    Returns:
+        MatchResult - may be fuzzy, ambiguous, or not_found
+    """
     if not candidates:
         return MatchResult(
             input_track=input_track,
@@ -167,9 +447,6 @@ def _fuzzy_match(
             confidence=0.0,
         )
 
-    # Sort by score descending
-    candidates.sort(key=lambda x: x[0], reverse=True)
-
     best_score, best_match = candidates[0]
 
     # Check if match is ambiguous (close scores with different tracks)
@@ -212,6 +489,9 @@ def match_tracks(
 ) -> list[MatchResult]:
     """Match multiple playlist tracks against library.
 
+    Same results as calling :func:`match_track` for each track; see
+    :func:`match_tracks_batched`.
+
     Args:
         input_tracks: Tracks from streaming playlist
         library_tracks: All library tracks to search
@@ -219,4 +499,78 @@ def match_tracks(
     Returns:
         List of MatchResult in same order as input_tracks
     """
-    return [match_track(track, library_tracks) for track in input_tracks]
+    results, _timings = match_tracks_batched(input_tracks, library_tracks)
+    return results
+
+
+def match_tracks_batched(
+    input_tracks: list[PlaylistTrackInput],
+    library_tracks: list[LibraryTrack],
+    *,
+    blocked: bool = True,
+    workers: int = -1,
+) -> tuple[list[MatchResult], PlaylistMatchTimings]:
+    """Match a whole playlist with one batched fuzzy scoring pass.
+
+    Builds one :class:`TrackCandidateIndex`, resolves ISRC and exact matches
+    by lookup, then scores every remaining track in one
+    :meth:`TrackCandidateIndex.fuzzy_pairs` call instead of a Python loop per
+    pair. Scores are the same float64 values and ties keep library order, so
+    every result equals :func:`match_track`'s.
+
+    Args:
+        input_tracks: Tracks from streaming playlist
+        library_tracks: All library tracks to search
+        blocked: Score only the index's fuzzy candidates (default) rather than
+            every library track
+        workers: rapidfuzz scoring threads (-1 = all cores)
+
+    Returns:
+        Tuple of (results in input order, timings of this import)
+    """
+    start = internal_ms().value
+    if not library_tracks:
+        results = [match_track(track, library_tracks) for track in input_tracks]
+        elapsed = internal_ms().value - start
+        return results, PlaylistMatchTimings(index_ms=0, exact_ms=elapsed, fuzzy_ms=0, total_ms=elapsed)
+
+    index = TrackCandidateIndex(library_tracks)
+    indexed = internal_ms().value
+
+    results_or_pending: list[MatchResult | None] = []
+    fuzzy_positions: list[int] = []
+    title_norms: list[str] = []
+    artist_norms: list[str] = []
+    for input_track in input_tracks:
+        title_norm = normalize_title(input_track.title)
+        artist_norm = normalize_artist(input_track.artist)
+        result = _match_exact(input_track, title_norm, artist_norm, index)
+        if result is None:
+            fuzzy_positions.append(len(results_or_pending))
+            title_norms.append(title_norm)
+            artist_norms.append(artist_norm)
+        results_or_pending.append(result)
+    exact_done = internal_ms().value
+
+    queries, tracks, scores, scored_pairs = index.fuzzy_pairs(
+        title_norms, artist_norms, blocked=blocked, workers=workers
+    )
+    # Pairs are grouped by query, library order within each query
+    bounds = np.searchsorted(queries, np.arange(len(fuzzy_positions) + 1))
+    for query, position in enumerate(fuzzy_positions):
+        lo, hi = bounds[query], bounds[query + 1]
+        # Stable sort on the negated score = the descending list.sort() of _fuzzy_match
+        ranked = lo + np.argsort(-scores[lo:hi], kind="stable")[:4]
+        candidates = [(float(scores[k]), library_tracks[tracks[k]]) for k in ranked]
+        results_or_pending[position] = _fuzzy_result(input_tracks[position], candidates)
+    done = internal_ms().value
+
+    timings = PlaylistMatchTimings(
+        index_ms=indexed - start,
+        exact_ms=exact_done - indexed,
+        fuzzy_ms=done - exact_done,
+        total_ms=done - start,
+        fuzzy_tracks=len(fuzzy_positions),
+        scored_pairs=scored_pairs,
+    )
+    return [result for result in results_or_pending if result is not None], timings
@@ -8,6 +8,16 @@ Two strategies:
 1. Hardlink replacement (preferred): Uses temp folder, atomic hardlink swap
 2. Fallback replacement: Uses .tmp file, delete+rename (modifies folder mtime)
 
+Both strategies create the temp copy with a reflink (copy-on-write clone) when
+the filesystem supports it (Btrfs, XFS, bcachefs, ...), so only the metadata
+blocks rewritten by the tagger consume new I/O. Otherwise a full copy is made.
+Filesystem capabilities (hardlink, reflink) are probed once per library root
+and device and cached for the life of the process.
+
+Crash consistency: the original is only ever renamed aside (``.bak``) or
+replaced by an already-verified copy (``.tmp``). If the process dies between
+those steps, the next write to the same file restores it before continuing.
+
 Verification: After writing to the temp copy, audio properties (duration,
 sample rate, channels) are probed using mutagen (header read only, no decode)
 and compared against the original. This confirms the file is still a valid,
@@ -20,6 +30,8 @@ import contextlib
 import logging
 import os
 import shutil
+import sys
+import threading
 import uuid
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
@@ -40,6 +52,9 @@ TEMP_FOLDER_NAME = ".ignore"
 # Tolerance for duration comparison — allows for container rounding differences
 DURATION_TOLERANCE_S = 1.0
 
+# Linux FICLONE ioctl: _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
 
 @dataclass
 class SafeWriteResult:
@@ -48,6 +63,7 @@ class SafeWriteResult:
     success: bool
     error: str | None = None
     new_mtime_ms: int | None = None
+    bytes_copied: int = 0
 
 
 @dataclass
@@ -102,12 +118,52 @@ def _get_temp_folder(library_root: Path) -> Path:
     return temp_folder
 
 
-def _supports_hardlinks(source: Path, temp_folder: Path) -> bool:
-    """Check if filesystem supports hardlinks between source and temp folder."""
+@dataclass(frozen=True)
+class FsCapabilities:
+    """Filesystem features available for safe writes under one library root."""
+
+    hardlink: bool
+    reflink: bool
+
+
+_capabilities: dict[tuple[str, int], FsCapabilities] = {}
+_capabilities_lock = threading.Lock()
+
+
+def clear_fs_capability_cache() -> None:
+    """Forget probed filesystem capabilities (e.g. after remounting a library)."""
+    with _capabilities_lock:
+        _capabilities.clear()
+
+
+def _reflink_file(source: Path, dest: Path) -> bool:
+    """Clone *source* to *dest* without copying data blocks.
+
+    Returns:
+        True if the clone was created, False if the platform or filesystem
+        does not support it (``dest`` is then left absent).
+
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    try:
+        with open(source, "rb") as src, open(dest, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        with contextlib.suppress(OSError):
+            dest.unlink()
+        return False
+    return True
+
+
+def _supports_hardlinks(source_dir: Path, temp_folder: Path) -> bool:
+    """Check if filesystem supports hardlinks between source dir and temp folder."""
     test_file = temp_folder / f".hardlink_test_{uuid.uuid4().hex}"
     try:
         test_file.touch()
-        test_link = source.parent / f".hardlink_test_{uuid.uuid4().hex}"
+        test_link = source_dir / f".hardlink_test_{uuid.uuid4().hex}"
         try:
             os.link(test_file, test_link)
             test_link.unlink()
@@ -124,6 +180,79 @@ def _supports_hardlinks(source: Path, temp_folder: Path) -> bool:
             test_file.unlink()
 
 
+def _supports_reflinks(source_dir: Path, temp_folder: Path) -> bool:
+    """Check if a file in *source_dir* can be reflinked into the temp folder."""
+    test_file = source_dir / f".reflink_test_{uuid.uuid4().hex}"
+    test_clone = temp_folder / f".reflink_test_{uuid.uuid4().hex}"
+    try:
+        test_file.write_bytes(b"\0" * 4096)
+        return _reflink_file(test_file, test_clone)
+    except OSError:
+        return False
+    finally:
+        for path in (test_file, test_clone):
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+
+def get_fs_capabilities(library_root: Path, source_dir: Path, temp_folder: Path) -> FsCapabilities:
+    """Return cached filesystem capabilities for a library root.
+
+    Capabilities are keyed by library root and the device of *source_dir*, so
+    a library that spans mount points is probed once per filesystem rather
+    than once per write.
+    """
+    key = (str(library_root), os.stat(source_dir).st_dev)
+    with _capabilities_lock:
+        cached = _capabilities.get(key)
+    if cached is not None:
+        return cached
+    caps = FsCapabilities(
+        hardlink=_supports_hardlinks(source_dir, temp_folder),
+        reflink=_supports_reflinks(source_dir, temp_folder),
+    )
+    logger.debug(f"[safe_write] Filesystem capabilities for {library_root}: {caps}")
+    with _capabilities_lock:
+        _capabilities[key] = caps
+    return caps
+
+
+def _clone_or_copy(source: Path, dest: Path, caps: FsCapabilities) -> int:
+    """Create the temp copy of *source*, preferring a reflink.
+
+    Returns:
+        Number of data bytes physically copied (0 for a reflink).
+
+    """
+    if caps.reflink and _reflink_file(source, dest):
+        shutil.copystat(source, dest)
+        return 0
+    shutil.copy2(source, dest)
+    return os.stat(dest).st_size
+
+
+def _recover_interrupted_replace(original_path: Path) -> None:
+    """Restore a file left missing by a crash mid-replacement.
+
+    A ``.bak`` sibling is the untouched original (hardlink strategy); a
+    ``.tmp`` sibling only outlives the original after it passed verification
+    (fallback strategy), so completing its rename is safe. When the original
+    still exists, a leftover ``.tmp`` is an abandoned copy and is removed.
+    """
+    backup_path = original_path.with_suffix(original_path.suffix + ".bak")
+    temp_path = original_path.with_suffix(original_path.suffix + ".tmp")
+    if not original_path.exists():
+        if backup_path.exists():
+            os.rename(backup_path, original_path)
+            logger.warning(f"[safe_write] Restored {original_path.name} from interrupted write backup")
+        elif temp_path.exists():
+            os.rename(temp_path, original_path)
+            logger.warning(f"[safe_write] Completed interrupted replacement of {original_path.name}")
+    elif temp_path.exists():
+        with contextlib.suppress(OSError):
+            temp_path.unlink()
+
+
 def safe_write_tags(
     library_path: LibraryPath,
     library_root: Path,
@@ -153,6 +282,11 @@ def safe_write_tags(
     original_path = library_path.absolute
     filename = original_path.name
 
+    try:
+        _recover_interrupted_replace(original_path)
+    except OSError as e:
+        return SafeWriteResult(success=False, error=f"Failed to recover interrupted write: {e}")
+
     # Pre-flight: abort if file was modified externally since caller read it
     actual_mtime_ms = int(os.stat(original_path).st_mtime * 1000)
     if actual_mtime_ms != expected_mtime_ms:
@@ -170,11 +304,13 @@ def safe_write_tags(
 
     # Try hardlink approach first
     temp_folder = _get_temp_folder(library_root)
-    use_hardlink = _supports_hardlinks(original_path, temp_folder)
+    caps = get_fs_capabilities(library_root, original_path.parent, temp_folder)
 
-    if use_hardlink:
-        return _safe_write_hardlink(original_path, temp_folder, filename, original_props, write_fn, expected_mtime_ms)
-    return _safe_write_fallback(original_path, original_props, write_fn, expected_mtime_ms)
+    if caps.hardlink:
+        return _safe_write_hardlink(
+            original_path, temp_folder, filename, original_props, write_fn, expected_mtime_ms, caps
+        )
+    return _safe_write_fallback(original_path, original_props, write_fn, expected_mtime_ms, caps)
 
 
 def _safe_write_hardlink(
@@ -184,14 +320,15 @@ def _safe_write_hardlink(
     original_props: _AudioProperties,
     write_fn: Callable[[Path], None],
     expected_mtime_ms: int,
+    caps: FsCapabilities,
 ) -> SafeWriteResult:
     """Safe write using hardlink replacement (atomic, no folder mtime change)."""
     temp_path = temp_folder / f"{uuid.uuid4().hex}_{filename}"
 
     try:
-        # Step 1: Copy original to temp
-        shutil.copy2(original_path, temp_path)
-        logger.debug(f"[safe_write] Copied to temp: {temp_path}")
+        # Step 1: Clone (or copy) original to temp
+        bytes_copied = _clone_or_copy(original_path, temp_path, caps)
+        logger.debug(f"[safe_write] Copied to temp: {temp_path} ({bytes_copied} bytes)")
 
         # Step 2: Write tags to temp copy
         write_fn(temp_path)
@@ -220,7 +357,7 @@ def _safe_write_hardlink(
             raise RuntimeError(msg) from e
 
         new_mtime_ms = int(os.stat(original_path).st_mtime * 1000)
-        return SafeWriteResult(success=True, new_mtime_ms=new_mtime_ms)
+        return SafeWriteResult(success=True, new_mtime_ms=new_mtime_ms, bytes_copied=bytes_copied)
 
     except Exception as e:
         logger.exception(f"[safe_write] Hardlink write failed: {e}")
@@ -237,14 +374,15 @@ def _safe_write_fallback(
     original_props: _AudioProperties,
     write_fn: Callable[[Path], None],
     expected_mtime_ms: int,
+    caps: FsCapabilities,
 ) -> SafeWriteResult:
     """Safe write using .tmp file (modifies folder mtime)."""
     temp_path = original_path.with_suffix(original_path.suffix + ".tmp")
 
     try:
-        # Step 1: Copy original to .tmp
-        shutil.copy2(original_path, temp_path)
-        logger.debug(f"[safe_write] Copied to .tmp: {temp_path}")
+        # Step 1: Clone (or copy) original to .tmp
+        bytes_copied = _clone_or_copy(original_path, temp_path, caps)
+        logger.debug(f"[safe_write] Copied to .tmp: {temp_path} ({bytes_copied} bytes)")
 
         # Step 2: Write tags to .tmp copy
         write_fn(temp_path)
@@ -264,7 +402,7 @@ def _safe_write_fallback(
         logger.debug("[safe_write] Fallback replacement complete")
 
         new_mtime_ms = int(os.stat(original_path).st_mtime * 1000)
-        return SafeWriteResult(success=True, new_mtime_ms=new_mtime_ms)
+        return SafeWriteResult(success=True, new_mtime_ms=new_mtime_ms, bytes_copied=bytes_copied)
 
     except Exception as e:
         logger.exception(f"[safe_write] Fallback write failed: {e}")
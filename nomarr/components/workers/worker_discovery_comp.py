@@ -118,6 +118,35 @@ def discover_and_claim_file(
     return None
 
 
+def discover_and_claim_heads_stale_file(
+    db: Database,
+    worker_id: str,
+) -> str | None:
+    """Discover and claim the next tagged file awaiting head-only reprocessing.
+
+    Same contract as :func:`discover_and_claim_file`, for files in the
+    ``heads_stale`` state.  The claim is typed ``"heads"`` so claim cleanup
+    does not drop it for being on an already tagged file.
+
+    Args:
+        db: Database instance
+        worker_id: Worker identifier (e.g., "worker:tag:0")
+
+    Returns:
+        Claimed file _id or None if no work available or claim failed
+
+    """
+    file_doc = db.file_states.discover_next_heads_stale_file(exclude_claimed=True)
+    if not file_doc:
+        return None
+    file_id = str(file_doc["_id"])
+    if db.worker_claims.try_claim_file(file_id, worker_id, claim_type="heads"):
+        logger.debug("[Discovery] Claimed %s for head-only reprocessing by %s", file_id, worker_id)
+        return file_id
+    logger.debug("[Discovery] File %s already claimed, retrying discovery", file_id)
+    return None
+
+
 def get_active_claim_count(db: Database) -> int:
     """Get count of active claims.
 
@@ -31,7 +31,9 @@ class StaticConfig:
     models_dir: str = "/app/models"
     db_path: str = "/app/config/db/nomarr.db"
     library_root: str = "/media"
+    cache_dir: str = "/app/config/cache"
     admin_password: str | None = None
+    role: str = "all"  # "all" = API + processing workers, "api" = web UI/API only
 
 
 # ---------------------------------------------------------------------------
@@ -48,7 +50,14 @@ class DynamicConfig:
     """
 
     calibrate_heads: bool = False
+    fused_head_inference: bool = False  # One ONNX graph for all heads of a backbone
+    model_warmup_workers: int = 0  # Concurrent ONNX session builds at warm-up, 0 = auto
+    cpu_thread_autotune: bool = True  # Calibrate ONNX CPU threads per host/backbone
+    store_backbone_embeddings: bool = False  # Keep per-segment embeddings for head-only reprocessing
+    streaming_decode: bool = False  # Block-wise ffmpeg decode overlapped with inference
     tagger_worker_count: int | None = None  # 1-8, None = auto (default 1)
+    tag_write_workers: int = 4  # Concurrent file writes during tag reconcile
+    tag_write_per_device: int = 2  # Concurrent file writes per storage device
     library_auto_tag: bool = True
     library_ignore_patterns: str = ""
     spotify_client_id: str | None = None
@@ -142,6 +151,41 @@ DYNAMIC_FIELD_META: dict[str, FieldMeta] = {
         "description": "Directory path (relative to library root) where M3U playlist files are saved. Leave empty to disable M3U file output.",
         "ui_type": "text",
     },
+    "fused_head_inference": {
+        "label": "Fused Head Inference",
+        "description": "Run all heads of a backbone as one ONNX graph (one call per batch instead of one per head). Results are identical. Requires the 'onnx' package; applies when workers restart.",
+        "ui_type": "boolean",
+    },
+    "model_warmup_workers": {
+        "label": "Model Warm-up Threads",
+        "description": "Number of ONNX model sessions built in parallel when a worker warms its models (0 = auto: half the CPUs, up to 4). Applies when workers restart.",
+        "ui_type": "number",
+    },
+    "cpu_thread_autotune": {
+        "label": "CPU Thread Auto-tuning",
+        "description": "On CPU-only hosts, benchmark ONNX thread counts once per host and backbone and use the fastest for the configured worker count. Applies when workers restart.",
+        "ui_type": "boolean",
+    },
+    "store_backbone_embeddings": {
+        "label": "Store Backbone Embeddings",
+        "description": "Keep per-segment backbone embeddings on disk (about 1 MB per track and backbone) so added or updated heads are applied without decoding audio or re-running backbones. Applies after restart.",
+        "ui_type": "boolean",
+    },
+    "streaming_decode": {
+        "label": "Streaming Decode",
+        "description": "Decode audio in blocks with ffmpeg and run mel extraction and backbone inference while decoding continues. Peak memory no longer grows with track length; scores may differ in the last decimals from the default decoder. Applies after restart.",
+        "ui_type": "boolean",
+    },
+    "tag_write_workers": {
+        "label": "Tag Write Workers",
+        "description": "Number of files written concurrently when writing tags to disk (1-32).",
+        "ui_type": "number",
+    },
+    "tag_write_per_device": {
+        "label": "Tag Writes per Disk",
+        "description": "Maximum concurrent tag writes on a single storage device. Use 1 for spinning disks, higher for SSD/NVMe.",
+        "ui_type": "number",
+    },
     "vector_group_size": {
         "label": "Songs per Neighborhood",
         "description": "Target number of songs in each similarity neighborhood (5-100). Lower values create more precise groupings but may slow index rebuilds.",
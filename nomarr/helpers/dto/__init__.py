@@ -57,11 +57,13 @@ from nomarr.helpers.dto.ml_dto import (
     SingleHeadResult,
 )
 from nomarr.helpers.dto.navidrome_dto import (
+    NavidromeCandidatePool,
     NavidromeGeneratePlaylistsResult,
     NavidromePersonalPlaylistContext,
     NavidromePersonalPlaylistEntry,
     NavidromeStaticPlaylistResult,
     NdSyncResult,
+    PlaylistCandidate,
     PlaylistPreviewResult,
     SmartPlaylistFilter,
     StaticPlaylistResult,
@@ -74,6 +76,7 @@ from nomarr.helpers.dto.path_dto import LibraryPath
 from nomarr.helpers.dto.playlist_import_dto import (
     MatchResult,
     PlaylistConversionResult,
+    PlaylistMatchTimings,
     PlaylistMetadata,
     PlaylistTrackInput,
 )
@@ -109,12 +112,15 @@ __all__ = [
     "MatchResult",
     "MergeResult",
     "MoodDistributionData",
+    "NavidromeCandidatePool",
     "NavidromeGeneratePlaylistsResult",
     "NavidromePersonalPlaylistContext",
     "NavidromePersonalPlaylistEntry",
     "NavidromeStaticPlaylistResult",
     "NdSyncResult",
+    "PlaylistCandidate",
     "PlaylistConversionResult",
+    "PlaylistMatchTimings",
     "PlaylistMetadata",
     "PlaylistPreviewResult",
     "PlaylistTrackInput",
@@ -269,3 +269,37 @@ class MoodAnalysisResult:
     balance: dict[str, list[MoodBalanceItem]]
     top_pairs: list[MoodPairItem]
     dominant_vibes: list[DominantVibeItem]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Analytics Rollup DTOs
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class LibraryRollup:
+    """Collection-overview and mood counters summed over one or more libraries.
+
+    Read from the ``analytics_rollups`` documents maintained on every tag
+    write and file removal (see ``analytics_rollups_aql``).
+    """
+
+    file_count: int
+    total_duration_s: float
+    total_file_size_bytes: int
+    year_counts: dict[int | str, int]  # year tag value -> files
+    genre_counts: dict[str, int]  # genre tag value -> files
+    mood_tagged: dict[str, int]  # tier -> files with at least one mood tag
+    mood_balance: dict[str, dict[str, int]]  # tier -> mood -> count (tuple values split)
+    mood_pairs: dict[str, dict[tuple[str, str], int]]  # tier -> (mood1, mood2) -> files (cumulative tiers)
+    missing_library_ids: list[str]  # libraries in scope without a built rollup
+
+
+@dataclass
+class RollupConsistencyReport:
+    """Result of comparing one library's rollup with a full recompute."""
+
+    library_id: str
+    consistent: bool
+    mismatches: list[str]  # names of the sections that differ, e.g. "year", "mood_pairs:loose"
+    repaired: bool
@@ -136,3 +136,66 @@ class SingleHeadResult:
     segment_labels: list[str] | None = None  # labels for segment stats computation
     elapsed_ms: float = 0.0
     decisions_count: int = 0
+
+
+@dataclass
+class ThreadTuningCandidate:
+    """Throughput of one measured CPU thread/worker combination."""
+
+    workers: int  # concurrent backbone sessions (one per worker process)
+    intra_op: int
+    inter_op: int
+    allow_spinning: bool
+    patches_per_s: float  # aggregate over all workers
+
+
+@dataclass
+class ThreadTuningProfile:
+    """Calibrated ONNX Runtime threading for one backbone on one host.
+
+    The chosen values are the best measured combination for the configured
+    worker count; ``best_workers`` is the worker count with the highest
+    aggregate throughput among all candidates.
+    """
+
+    backbone: str
+    host_id: str
+    cpu_model: str
+    cpus: int
+    numa_nodes: int
+    workers: int
+    intra_op: int
+    inter_op: int
+    allow_spinning: bool
+    patches_per_s: float
+    default_patches_per_s: float  # throughput of the built-in 2-thread pool
+    best_workers: int
+    ort_version: str
+    tuned_at: int  # epoch ms
+    candidates: list[ThreadTuningCandidate]
+
+
+@dataclass
+class ModelSuiteManifest:
+    """Installed ``*.onnx`` files split into backbone graphs and heads.
+
+    Keys are paths relative to the models directory, values are file sizes
+    (the same signature :func:`compute_model_suite_hash` digests).  Files
+    under ``<backbone>/heads/`` are heads; every other graph counts as a
+    backbone, so an unknown file change always forces full reprocessing.
+    """
+
+    backbones: dict[str, int]
+    heads: dict[str, int]
+
+
+@dataclass
+class HeadSuiteDelta:
+    """Head files that differ between two suites sharing identical backbones."""
+
+    changed_heads: list[str]  # added or replaced, relative paths
+    removed_heads: list[str]
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.changed_heads and not self.removed_heads
@@ -50,6 +50,8 @@ class NdSyncResult(TypedDict):
     play_edges_upserted: int
     orphans_removed: int
     duration_ms: int
+    albums_fetched: int
+    albums_unchanged: int
 
 
 # Standard ID3/metadata tags that are NOT prefixed with "nom:"
@@ -249,7 +251,8 @@ class TasteProfile(TypedDict):
     """Per-user taste profile computed from play history.
 
     Contains a recency-weighted centroid embedding representing the user's
-    listening preferences.  Generated by ``compute_taste_profile`` component.
+    listening preferences.  Generated by ``compute_taste_profile``; persisted
+    and incrementally maintained via ``get_taste_profile``/``record_play``.
     """
 
     user_id: str
@@ -273,6 +276,35 @@ class TasteCluster(TypedDict):
     track_count: int
 
 
+class PlaylistCandidate(TypedDict):
+    """A single ANN candidate in the shared playlist candidate pool.
+
+    ``artists`` comes from ``song_has_tags`` and is only filled when a
+    builder needs it (Hidden Gems).
+    """
+
+    file_id: str
+    score: float
+    artists: list[str]
+
+
+class NavidromeCandidatePool(TypedDict):
+    """Shared candidate-generation output for personal playlist builders.
+
+    Built once per ``generate_playlists`` call from a single over-fetched ANN
+    query against the taste centroid.  Builders slice and filter
+    ``candidates`` instead of issuing their own vector queries.
+
+    ``known_artists`` holds artist values of the user's played tracks and
+    ``played_genres`` maps played ``file_id`` to genre values; each is only
+    populated when an enabled builder consumes it.
+    """
+
+    candidates: list[PlaylistCandidate]
+    known_artists: list[str]
+    played_genres: dict[str, list[str]]
+
+
 class NavidromePersonalPlaylistContext(TypedDict):
     """Input context for personal playlist builder components.
 
@@ -291,6 +323,12 @@ class NavidromePersonalPlaylistContext(TypedDict):
 
     ``half_life_days`` is the recency decay parameter used for per-genre
     centroid computation in the genre builder.
+
+    ``cold_doc_count`` and ``nprobe`` come from the cold collection's recorded
+    search parameters, resolved once by the workflow so builders never call
+    ``count()``.  ``cold_doc_count`` is 0 when the collection has no index.
+
+    ``pool`` is the shared candidate pool (see ``NavidromeCandidatePool``).
     """
 
     backbone_id: str
@@ -301,6 +339,9 @@ class NavidromePersonalPlaylistContext(TypedDict):
     played_tracks: list[TrackPlayData]
     max_genre_playlists: int
     half_life_days: float
+    cold_doc_count: int
+    nprobe: int
+    pool: NavidromeCandidatePool
 
 
 class NavidromePersonalPlaylistEntry(TypedDict):
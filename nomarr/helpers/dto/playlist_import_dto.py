@@ -56,6 +56,21 @@ class MatchResult:
     alternatives: tuple[MatchedFileInfo, ...] = field(default_factory=tuple)
 
 
+@dataclass(frozen=True)
+class PlaylistMatchTimings:
+    """Where the time of one playlist import's matching went.
+
+    Durations are wall-clock milliseconds.
+    """
+
+    index_ms: int  # Building the candidate index over the library
+    exact_ms: int  # ISRC and exact metadata lookups
+    fuzzy_ms: int  # Batched fuzzy scoring and classification
+    total_ms: int
+    fuzzy_tracks: int = 0  # Playlist tracks that needed fuzzy matching
+    scored_pairs: int = 0  # (playlist track, library track) pairs fully scored
+
+
 @dataclass(frozen=True)
 class PlaylistMetadata:
     """Metadata about the source playlist."""
@@ -87,6 +102,7 @@ class PlaylistConversionResult:
     not_found_count: int
     # Details for user review
     match_results: tuple[MatchResult, ...]
+    match_timings: PlaylistMatchTimings | None = None
 
     @property
     def match_rate(self) -> float:
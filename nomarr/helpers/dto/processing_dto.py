@@ -10,7 +10,7 @@ Rules:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal
 
 from nomarr.helpers.dto.ml_edge_dto import MLEdgeWrites
@@ -91,6 +91,27 @@ class ProcessorConfig:
     # Resource management configuration (GPU/CPU adaptive)
     resource_management: ResourceManagementConfig | None = None
 
+    # Run all heads of a backbone as one fused ONNX graph (one call per batch)
+    fused_heads: bool = False
+
+    # Directory for on-disk optimized ONNX session graphs (None disables the cache)
+    session_cache_dir: str | None = None
+
+    # ONNX sessions built concurrently when a worker warms its model cache
+    warmup_workers: int = 1
+
+    # Tagger worker processes sharing the CPU (thread tuning is per worker count)
+    worker_count: int = 1
+
+    # Calibrate ONNX CPU thread pools per host and backbone (CPU tier only)
+    thread_autotune: bool = False
+
+    # Directory for per-segment backbone embeddings (None disables head-only reprocessing)
+    embedding_store_dir: str | None = None
+
+    # Decode audio block-wise and overlap it with preprocessing and inference
+    streaming_decode: bool = False
+
 
 @dataclass
 class WorkerEnabledResult:
@@ -151,3 +172,4 @@ class ProcessFileResult:
     tags: Tags
     timing_summary: str | None = None
     deferred_writes: DeferredFileWrites | None = None
+    timings: dict[str, float] = field(default_factory=dict)  # operation_name -> duration_ms
@@ -0,0 +1,56 @@
+"""Lazy package re-exports (PEP 562).
+
+A package ``__init__`` that re-exports names from its submodules imports all
+of them as soon as any one submodule is imported. For packages whose
+submodules pull in heavy dependencies (ONNX Runtime, SciPy), that makes
+every importer pay for every sibling. Such packages declare their exports
+instead:
+
+    if TYPE_CHECKING:
+        from .analytics_svc import AnalyticsService
+
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {".analytics_svc": ["AnalyticsService"]},
+    )
+
+Each name is imported from its module on first attribute access and then
+cached in the package namespace.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, Sequence[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` for lazy re-exports.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Relative module name → names it provides
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign in the package ``__init__``
+
+    """
+    sources = {name: module for module, names in exports.items() for name in names}
+
+    def getattr_(name: str) -> Any:
+        module = sources.get(name)
+        if module is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def dir_() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(sources))
+
+    return getattr_, dir_
@@ -0,0 +1,211 @@
+"""In-process metrics: counters, gauges and histograms.
+
+A :class:`MetricsRegistry` records values for a fixed set of
+:class:`MetricSpec` families. Its :meth:`~MetricsRegistry.snapshot` is plain
+JSON-able data holding cumulative totals, so snapshots can cross process
+boundaries (worker health frames) and be merged in the parent without any
+coordination: a lost snapshot loses nothing, the next one supersedes it.
+
+Snapshot format::
+
+    {
+        "counter": {name: [[labels, value], ...]},
+        "gauge": {name: [[labels, value], ...]},
+        "histogram": {name: [[labels, bucket_counts, sum], ...]},
+    }
+
+``bucket_counts`` holds one (non-cumulative) count per bucket bound plus a
+final overflow bucket. :func:`render_exposition` turns a snapshot into the
+Prometheus text exposition format (version 0.0.4).
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Literal
+
+MetricKind = Literal["counter", "gauge", "histogram"]
+
+# Upper bounds in seconds: 5 ms claim queries up to multi-minute decodes
+DEFAULT_DURATION_BUCKETS_S: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+EXPOSITION_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_LabelKey = tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True)
+class MetricSpec:
+    """One metric family."""
+
+    name: str
+    kind: MetricKind
+    help: str
+    buckets: tuple[float, ...] = ()  # Histogram upper bounds, ascending
+
+
+def _label_key(labels: Mapping[str, str] | None) -> _LabelKey:
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+class MetricsRegistry:
+    """Thread-safe metric values for one process.
+
+    Recording is a dict lookup and an addition under a lock, cheap enough to
+    call per processed file or per claim query.
+    """
+
+    def __init__(self, specs: Iterable[MetricSpec]) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            specs: Metric families this registry accepts
+
+        """
+        self._specs = {spec.name: spec for spec in specs}
+        self._values: dict[str, dict[_LabelKey, Any]] = {name: {} for name in self._specs}
+        self._lock = threading.Lock()
+
+    def _spec(self, name: str, kind: MetricKind) -> MetricSpec:
+        spec = self._specs.get(name)
+        if spec is None or spec.kind != kind:
+            msg = f"{name!r} is not a registered {kind}"
+            raise KeyError(msg)
+        return spec
+
+    def inc(self, name: str, value: float = 1.0, labels: Mapping[str, str] | None = None) -> None:
+        """Add *value* to a counter."""
+        self._spec(name, "counter")
+        key = _label_key(labels)
+        with self._lock:
+            series = self._values[name]
+            series[key] = series.get(key, 0.0) + value
+
+    def set(self, name: str, value: float, labels: Mapping[str, str] | None = None) -> None:
+        """Set a gauge."""
+        self._spec(name, "gauge")
+        with self._lock:
+            self._values[name][_label_key(labels)] = float(value)
+
+    def observe(self, name: str, value: float, labels: Mapping[str, str] | None = None) -> None:
+        """Record one observation in a histogram."""
+        buckets = self._spec(name, "histogram").buckets
+        key = _label_key(labels)
+        index = bisect.bisect_left(buckets, value)  # First bound >= value ("le" semantics)
+        with self._lock:
+            series = self._values[name]
+            entry = series.get(key)
+            if entry is None:
+                entry = series[key] = [[0] * (len(buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def snapshot(self) -> dict[str, dict[str, list[list[Any]]]]:
+        """Copy of all values in the snapshot format (see module docstring)."""
+        out: dict[str, dict[str, list[list[Any]]]] = {"counter": {}, "gauge": {}, "histogram": {}}
+        with self._lock:
+            for name, series in self._values.items():
+                if not series:
+                    continue
+                kind = self._specs[name].kind
+                if kind == "histogram":
+                    out[kind][name] = [[dict(key), list(counts), total] for key, (counts, total) in series.items()]
+                else:
+                    out[kind][name] = [[dict(key), value] for key, value in series.items()]
+        return out
+
+
+def merge_snapshots(
+    snapshots: Iterable[tuple[Mapping[str, str], Mapping[str, Any]]],
+) -> dict[str, dict[str, list[list[Any]]]]:
+    """Combine snapshots from several sources into one.
+
+    Args:
+        snapshots: ``(extra_labels, snapshot)`` pairs; *extra_labels* (e.g.
+            ``{"worker": "worker:tag:0"}``) are added to every series of that
+            snapshot so series from different sources stay distinct
+
+    Returns:
+        One snapshot holding every series
+
+    """
+    merged: dict[str, dict[str, list[list[Any]]]] = {"counter": {}, "gauge": {}, "histogram": {}}
+    for extra, snapshot in snapshots:
+        for kind, families in merged.items():
+            for name, series in snapshot.get(kind, {}).items():
+                families.setdefault(name, []).extend([{**row[0], **extra}, *row[1:]] for row in series)
+    return merged
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Mapping[str, str]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{k}="{_escape_label_value(str(v))}"' for k, v in sorted(labels.items()))
+    return "{" + inner + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def render_exposition(specs: Iterable[MetricSpec], snapshot: Mapping[str, Any]) -> str:
+    """Render a snapshot in the Prometheus text exposition format.
+
+    Every family in *specs* gets its ``HELP``/``TYPE`` lines, even before it
+    has any series. Series in the snapshot whose family is not in *specs*
+    (e.g. sent by a newer worker) are skipped.
+
+    Args:
+        specs: Metric families to render, in output order
+        snapshot: Snapshot as returned by :meth:`MetricsRegistry.snapshot`
+            or :func:`merge_snapshots`
+
+    Returns:
+        Exposition text, newline-terminated
+
+    """
+    lines: list[str] = []
+    for spec in specs:
+        lines.append(f"# HELP {spec.name} {spec.help}")
+        lines.append(f"# TYPE {spec.name} {spec.kind}")
+        for row in snapshot.get(spec.kind, {}).get(spec.name, []):
+            labels = row[0]
+            if spec.kind != "histogram":
+                lines.append(f"{spec.name}{_format_labels(labels)} {_format_value(row[1])}")
+                continue
+            counts, total = row[1], row[2]
+            if len(counts) != len(spec.buckets) + 1:
+                continue  # Bucket layout changed between versions; drop rather than mislabel
+            cumulative = 0
+            for bound, count in zip((*spec.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                bucket_labels = {**labels, "le": _format_value(bound)}
+                lines.append(f"{spec.name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+            lines.append(f"{spec.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{spec.name}_count{_format_labels(labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
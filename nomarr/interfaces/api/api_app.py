@@ -21,6 +21,8 @@ from fastapi.staticfiles import StaticFiles
 
 import nomarr
 from nomarr.interfaces.api import web
+from nomarr.interfaces.api.executor import api_executor
+from nomarr.interfaces.api.response_cache import refresh_after_write
 from nomarr.interfaces.api.v1 import admin_if, navidrome_v1_if, public_if
 
 logger = logging.getLogger(__name__)
@@ -41,10 +43,12 @@ async def lifespan(_app_instance: FastAPI):
     finally:
         logger.info("[API] FastAPI shutting down...")
         application.stop()
+        api_executor.shutdown()
         logger.info("[API] Shutdown complete")
 
 
 api_app = FastAPI(title="Nomarr", version="1.2", lifespan=lifespan)
+api_app.middleware("http")(refresh_after_write)
 
 
 @api_app.exception_handler(Exception)
@@ -0,0 +1,205 @@
+"""Bounded executor for blocking calls made by async API handlers.
+
+Handlers are ``async def`` but the services they call run AQL queries and
+file I/O synchronously. Calling them inline blocks the event loop, so one
+slow stats query stalls every other request. Handlers route such calls
+through :func:`run_blocking` instead:
+
+    stats = await run_blocking("library.stats", library_service.get_library_stats)
+
+- One shared, bounded thread pool (``max_workers``) runs every call.
+- Each endpoint has a concurrency cap (``ENDPOINT_LIMITS``, then the
+  endpoint's domain prefix, then ``default_limit``), so an expensive
+  endpoint cannot occupy the whole pool; excess calls wait on the event
+  loop without holding a thread.
+- Per-endpoint metrics record queue time (call → start in a worker
+  thread, covering the cap and a saturated pool) and run time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import threading
+import weakref
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import ParamSpec, TypeVar, cast
+
+from nomarr.helpers.time_helper import internal_ms
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Concurrency caps for endpoints (or whole domains, by the prefix before the first ".")
+# whose calls scan large parts of the database or run for minutes
+ENDPOINT_LIMITS: dict[str, int] = {
+    "analytics": 2,
+    "library.stats": 2,
+    "library.reconcile": 1,
+    "vectors.stats": 1,
+    "vectors.promote": 1,
+    "vectors.rebuild_index": 1,
+    "admin.calibration.run": 1,
+    "playlist_import.convert": 2,
+}
+DEFAULT_ENDPOINT_LIMIT = 4
+DEFAULT_MAX_WORKERS = 16
+# Queue times above this are logged
+SLOW_QUEUE_MS = 1000
+
+
+@dataclass
+class EndpointStats:
+    """Counters for one endpoint's blocking calls (times in milliseconds)."""
+
+    limit: int
+    calls: int = 0
+    errors: int = 0
+    waiting: int = 0
+    running: int = 0
+    queue_ms_total: int = 0
+    queue_ms_max: int = 0
+    run_ms_total: int = 0
+    run_ms_max: int = 0
+
+
+class ApiExecutor:
+    """Thread pool with per-endpoint concurrency caps and queue-time metrics."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        default_limit: int = DEFAULT_ENDPOINT_LIMIT,
+        limits: Mapping[str, int] | None = None,
+    ) -> None:
+        """Initialize the executor (threads start on first use).
+
+        Args:
+            max_workers: Threads shared by all endpoints
+            default_limit: Cap for endpoints without an entry in *limits*
+            limits: Caps by endpoint name or domain prefix (default ``ENDPOINT_LIMITS``)
+
+        """
+        self.max_workers = max_workers
+        self.default_limit = default_limit
+        self.limits = dict(ENDPOINT_LIMITS if limits is None else limits)
+        self._pool: ThreadPoolExecutor | None = None  # Created on first use and again after shutdown()
+        self._lock = threading.Lock()
+        self._stats: dict[str, EndpointStats] = {}
+        # asyncio primitives belong to one event loop (tests run several)
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def limit_for(self, endpoint: str) -> int:
+        """Concurrency cap of *endpoint*: exact entry, then domain prefix, then default."""
+        if endpoint in self.limits:
+            return self.limits[endpoint]
+        return self.limits.get(endpoint.split(".", 1)[0], self.default_limit)
+
+    async def run(self, endpoint: str, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run ``fn(*args, **kwargs)`` in the pool under *endpoint*'s cap.
+
+        Exceptions propagate unchanged; context variables are copied into the
+        worker thread like ``asyncio.to_thread`` does.
+        """
+        loop = asyncio.get_running_loop()
+        stats = self._endpoint_stats(endpoint)
+        context = contextvars.copy_context()
+        queued_at = internal_ms().value
+        started_at: int | None = None  # Set by the worker thread; guarded by self._lock
+        abandoned = False
+
+        def call() -> T | None:
+            nonlocal started_at
+            with self._lock:
+                if abandoned:
+                    return None
+                started_at = internal_ms().value
+                stats.waiting -= 1
+                stats.running += 1
+            return context.run(fn, *args, **kwargs)
+
+        with self._lock:
+            stats.waiting += 1
+        failed = False
+        try:
+            async with self._semaphore(loop, endpoint):
+                return cast("T", await loop.run_in_executor(self._executor(), call))
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            finished_at = internal_ms().value
+            with self._lock:
+                if started_at is None:
+                    # Cancelled while waiting for the cap or a thread
+                    abandoned = True
+                    stats.waiting -= 1
+                    queue_ms, run_ms = finished_at - queued_at, 0
+                else:
+                    stats.running -= 1
+                    queue_ms, run_ms = started_at - queued_at, finished_at - started_at
+                stats.calls += 1
+                stats.errors += failed
+                stats.queue_ms_total += queue_ms
+                stats.queue_ms_max = max(stats.queue_ms_max, queue_ms)
+                stats.run_ms_total += run_ms
+                stats.run_ms_max = max(stats.run_ms_max, run_ms)
+            if queue_ms >= SLOW_QUEUE_MS:
+                logger.warning("[API] %s waited %dms for a worker thread (limit %d)", endpoint, queue_ms, stats.limit)
+
+    def stats(self) -> dict[str, EndpointStats]:
+        """Snapshot of every endpoint's counters."""
+        with self._lock:
+            return {endpoint: replace(stats) for endpoint, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        """Clear counters of endpoints with nothing waiting or running."""
+        with self._lock:
+            self._stats = {name: stats for name, stats in self._stats.items() if stats.waiting or stats.running}
+
+    def shutdown(self) -> None:
+        """Drop queued calls and let running ones finish.
+
+        The executor stays usable: the next call starts a new pool, so an app
+        whose lifespan is entered again (e.g. a second TestClient) keeps working.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="api-blocking")
+            return self._pool
+
+    def _endpoint_stats(self, endpoint: str) -> EndpointStats:
+        with self._lock:
+            stats = self._stats.get(endpoint)
+            if stats is None:
+                stats = self._stats[endpoint] = EndpointStats(limit=self.limit_for(endpoint))
+            return stats
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop, endpoint: str) -> asyncio.Semaphore:
+        # Only ever touched from the loop's own thread
+        semaphores = self._semaphores.setdefault(loop, {})
+        semaphore = semaphores.get(endpoint)
+        if semaphore is None:
+            semaphore = semaphores[endpoint] = asyncio.Semaphore(self.limit_for(endpoint))
+        return semaphore
+
+
+api_executor = ApiExecutor()
+
+
+async def run_blocking(endpoint: str, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:  # noqa: UP047
+    """Run a blocking call for *endpoint* on the shared :data:`api_executor`."""
+    return await api_executor.run(endpoint, fn, *args, **kwargs)
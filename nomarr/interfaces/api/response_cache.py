@@ -0,0 +1,216 @@
+"""Conditional-request caching for read-heavy web endpoints.
+
+The dashboard polls analytics, library stats, tag listings and calibration
+status far more often than their data changes. Such endpoints take a
+:func:`cached` dependency:
+
+    @router.get("/stats", dependencies=[Depends(verify_session)])
+    async def web_library_stats(
+        ...,
+        cache: CachedResponse[LibraryStatsResponse] = Depends(cached("library.stats")),
+    ) -> LibraryStatsResponse:
+        if cache.hit:
+            return cache.payload
+        ...
+        return cache.store(LibraryStatsResponse.from_dto(stats))
+
+A response is keyed by endpoint, path and query string and tagged with the
+version :class:`LibraryChangesService` reports for the request's
+``library_id`` (query or path parameter), or for everything without one.
+Versions are served from memory, so:
+
+- ``If-None-Match`` with the current ETag → 304 before the handler runs.
+- Same key and version cached → the stored payload, no service call.
+- Otherwise the handler runs and stores its payload.
+
+Non-GET requests refresh the versions when they finish
+(:func:`refresh_after_write`), so a client reading back its own write never
+gets a stale hit; writes from other processes are seen on the next poll.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from fastapi import Depends, HTTPException, Request, Response
+
+from nomarr.interfaces.api.executor import run_blocking
+from nomarr.interfaces.api.id_codec import decode_id
+from nomarr.interfaces.api.web.dependencies import get_library_changes_service
+
+if TYPE_CHECKING:
+    from nomarr.services.infrastructure.library_changes_svc import LibraryChangesService
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ENTRIES = 512
+
+
+@dataclass
+class ResponseCacheStats:
+    """Response cache counters since startup (or the last clear)."""
+
+    hits: int = 0  # Payload served from the cache
+    not_modified: int = 0  # 304 for a matching If-None-Match
+    misses: int = 0  # Handler ran (includes invalidations)
+    invalidations: int = 0  # Cached entry found with an outdated version
+    bypassed: int = 0  # Versions unavailable, handler ran uncached
+    entries: int = 0
+
+
+class CachedResponse(Generic[T]):  # noqa: UP046
+    """Per-request view of the cache handed to an endpoint.
+
+    Parametrized by the endpoint's response type, so a cached payload is
+    returned with the handler's own return type.
+    """
+
+    def __init__(self, cache: ResponseCache | None, key: str, etag: str | None, payload: T | None = None) -> None:
+        self._cache = cache
+        self._key = key
+        self.etag = etag
+        self._payload = payload
+
+    @property
+    def hit(self) -> bool:
+        """True if :attr:`payload` is a current cached response."""
+        return self._payload is not None
+
+    @property
+    def payload(self) -> T:
+        """The cached response (check :attr:`hit` first).
+
+        Raises:
+            LookupError: On a miss
+
+        """
+        if self._payload is None:
+            raise LookupError(f"No cached response for {self._key}")
+        return self._payload
+
+    def store(self, payload: T) -> T:
+        """Cache *payload* under this request's key and version, and return it."""
+        if self._cache is not None and self.etag is not None:
+            self._cache.put(self._key, self.etag, payload)
+        return payload
+
+
+class ResponseCache:
+    """LRU of endpoint responses tagged with the version they were computed at."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Responses kept; least recently used are evicted
+
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+        self._stats = ResponseCacheStats()
+        self._lock = threading.Lock()
+
+    def lookup(self, endpoint: str, request: Request, response: Response, version: str | None) -> CachedResponse[Any]:
+        """Resolve a request against the cache.
+
+        Raises:
+            HTTPException: 304 when ``If-None-Match`` carries the current ETag
+
+        """
+        key = f"{endpoint} {request.url.path}?{request.url.query}"
+        if version is None:
+            with self._lock:
+                self._stats.bypassed += 1
+            return CachedResponse(None, key, None)
+        digest = hashlib.blake2b(f"{key} {version}".encode(), digest_size=12).hexdigest()
+        etag = f'W/"{digest}"'
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+        if etag in _parse_if_none_match(request.headers.get("if-none-match")):
+            with self._lock:
+                self._stats.not_modified += 1
+            raise HTTPException(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == etag:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return CachedResponse(self, key, etag, entry[1])
+            if entry is not None:
+                del self._entries[key]
+                self._stats.invalidations += 1
+            self._stats.misses += 1
+        return CachedResponse(self, key, etag)
+
+    def put(self, key: str, etag: str, payload: Any) -> None:
+        """Store a response, evicting the least recently used beyond ``max_entries``."""
+        with self._lock:
+            self._entries[key] = (etag, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> ResponseCacheStats:
+        """Snapshot of the counters."""
+        with self._lock:
+            stats = ResponseCacheStats(**vars(self._stats))
+            stats.entries = len(self._entries)
+            return stats
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._stats = ResponseCacheStats()
+
+
+def _parse_if_none_match(header: str | None) -> set[str]:
+    if not header:
+        return set()
+    return {tag.strip() for tag in header.split(",")}
+
+
+def _request_library_id(request: Request) -> str | None:
+    library_id = request.path_params.get("library_id") or request.query_params.get("library_id")
+    if not library_id:
+        return None
+    return decode_id(library_id) if ":" in library_id else library_id
+
+
+response_cache = ResponseCache()
+
+
+def cached(endpoint: str) -> Callable[..., Awaitable[CachedResponse[Any]]]:
+    """Build the dependency that resolves *endpoint*'s requests against :data:`response_cache`."""
+
+    async def dependency(
+        request: Request,
+        response: Response,
+        changes: LibraryChangesService | None = Depends(get_library_changes_service),
+    ) -> CachedResponse[Any]:
+        version = changes.version(_request_library_id(request)) if changes is not None else None
+        return response_cache.lookup(endpoint, request, response, version)
+
+    return dependency
+
+
+async def refresh_after_write(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    """HTTP middleware: reload change counters after a successful web API write."""
+    response = await call_next(request)
+    if (
+        request.method not in ("GET", "HEAD", "OPTIONS")
+        and response.status_code < 400
+        and request.url.path.startswith("/api/web/")
+    ):
+        changes = get_library_changes_service()
+        if changes is not None:
+            await run_blocking("library_changes.refresh", changes.refresh)
+    return response
@@ -1,6 +1,7 @@
 """Admin API response models.
 
-Pydantic models for admin endpoints (job management, cache, worker operations, calibration).
+Pydantic models for admin endpoints (job management, cache, worker operations, calibration,
+CPU thread tuning).
 """
 
 from __future__ import annotations
@@ -17,6 +18,7 @@ if TYPE_CHECKING:
         RunCalibrationResult,
         WorkerOperationResult,
     )
+    from nomarr.helpers.dto.ml_dto import ThreadTuningCandidate, ThreadTuningProfile
 
 
 class JobRemovalResponse(BaseModel):
@@ -81,3 +83,86 @@ class RetagAllResponse(BaseModel):
     def from_dto(cls, dto: RetagAllResult) -> RetagAllResponse:
         """Convert DTO to Pydantic response model."""
         return cls(status=dto.status, message=dto.message, enqueued=dto.enqueued)
+
+
+class ThreadTuningCandidateResponse(BaseModel):
+    """One benchmarked thread/worker combination."""
+
+    workers: int
+    intra_op: int
+    inter_op: int
+    allow_spinning: bool
+    patches_per_s: float
+
+    @classmethod
+    def from_dto(cls, dto: ThreadTuningCandidate) -> ThreadTuningCandidateResponse:
+        """Convert DTO to Pydantic response model."""
+        return cls(
+            workers=dto.workers,
+            intra_op=dto.intra_op,
+            inter_op=dto.inter_op,
+            allow_spinning=dto.allow_spinning,
+            patches_per_s=dto.patches_per_s,
+        )
+
+
+class ThreadTuningProfileResponse(BaseModel):
+    """Calibrated CPU threading for one backbone on one host."""
+
+    backbone: str
+    host_id: str
+    cpu_model: str
+    cpus: int
+    numa_nodes: int
+    workers: int
+    intra_op: int
+    inter_op: int
+    allow_spinning: bool
+    patches_per_s: float
+    default_patches_per_s: float
+    speedup: float
+    best_workers: int
+    ort_version: str
+    tuned_at: int
+    candidates: list[ThreadTuningCandidateResponse]
+
+    @classmethod
+    def from_dto(cls, dto: ThreadTuningProfile) -> ThreadTuningProfileResponse:
+        """Convert DTO to Pydantic response model."""
+        return cls(
+            backbone=dto.backbone,
+            host_id=dto.host_id,
+            cpu_model=dto.cpu_model,
+            cpus=dto.cpus,
+            numa_nodes=dto.numa_nodes,
+            workers=dto.workers,
+            intra_op=dto.intra_op,
+            inter_op=dto.inter_op,
+            allow_spinning=dto.allow_spinning,
+            patches_per_s=dto.patches_per_s,
+            default_patches_per_s=dto.default_patches_per_s,
+            speedup=round(dto.patches_per_s / dto.default_patches_per_s, 2) if dto.default_patches_per_s else 0.0,
+            best_workers=dto.best_workers,
+            ort_version=dto.ort_version,
+            tuned_at=dto.tuned_at,
+            candidates=[ThreadTuningCandidateResponse.from_dto(c) for c in dto.candidates],
+        )
+
+
+class ThreadTuningListResponse(BaseModel):
+    """Response model for admin_get_thread_tuning."""
+
+    profiles: list[ThreadTuningProfileResponse]
+    count: int
+
+    @classmethod
+    def from_dto(cls, profiles: list[ThreadTuningProfile]) -> ThreadTuningListResponse:
+        """Convert DTOs to Pydantic response model."""
+        return cls(profiles=[ThreadTuningProfileResponse.from_dto(p) for p in profiles], count=len(profiles))
+
+
+class ThreadTuningClearResponse(BaseModel):
+    """Response model for admin_clear_thread_tuning."""
+
+    cleared: int
+    message: str
@@ -19,6 +19,7 @@ if TYPE_CHECKING:
     from nomarr.helpers.dto.analytics_dto import (
         MoodDistributionItem,
         MoodDistributionResult,
+        RollupConsistencyReport,
         TagCoOccurrenceData,
         TagCorrelationData,
         TagFrequenciesResult,
@@ -245,3 +246,33 @@ class MoodAnalysisResponse(BaseModel):
         default_factory=list,
         description="Dominant mood vibes",
     )
+
+
+class RollupConsistencyItemResponse(BaseModel):
+    """Consistency of one library's analytics rollup."""
+
+    library_id: str = Field(..., description="Library _id")
+    consistent: bool = Field(..., description="Whether the rollup matches a full recompute")
+    mismatches: list[str] = Field(default_factory=list, description="Sections that differ (e.g. 'year')")
+    repaired: bool = Field(..., description="Whether the rollup was rebuilt")
+
+    @classmethod
+    def from_dto(cls, dto: RollupConsistencyReport) -> RollupConsistencyItemResponse:
+        """Convert RollupConsistencyReport DTO to Pydantic response model."""
+        return cls(
+            library_id=dto.library_id,
+            consistent=dto.consistent,
+            mismatches=list(dto.mismatches),
+            repaired=dto.repaired,
+        )
+
+
+class RollupConsistencyResponse(BaseModel):
+    """Response for the analytics rollup consistency check."""
+
+    libraries: list[RollupConsistencyItemResponse] = Field(default_factory=list, description="One entry per library")
+
+    @classmethod
+    def from_dto(cls, reports: list[RollupConsistencyReport]) -> RollupConsistencyResponse:
+        """Convert a list of RollupConsistencyReport DTOs to Pydantic response model."""
+        return cls(libraries=[RollupConsistencyItemResponse.from_dto(report) for report in reports])
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
         SystemInfoResult,
         WorkStatusResult,
     )
+    from nomarr.interfaces.api.executor import EndpointStats
+    from nomarr.interfaces.api.response_cache import ResponseCacheStats
 
 
 class SystemInfoResponse(BaseModel):
@@ -224,3 +226,74 @@ class WorkStatusResponse(BaseModel):
             estimated_minutes_remaining=dto.estimated_minutes_remaining,
             is_busy=dto.is_busy,
         )
+
+
+# ----------------------------------------------------------------------
+#  API Executor Response Models
+# ----------------------------------------------------------------------
+
+
+class EndpointExecutionResponse(BaseModel):
+    """Blocking-call counters of one endpoint since startup (or the last reset)."""
+
+    endpoint: str = Field(..., description="Endpoint name, e.g. 'library.stats'")
+    limit: int = Field(..., description="Concurrent calls allowed")
+    calls: int = Field(..., description="Completed calls")
+    errors: int = Field(..., description="Calls that raised")
+    waiting: int = Field(..., description="Calls waiting for the cap or a worker thread")
+    running: int = Field(..., description="Calls running in a worker thread")
+    avg_queue_ms: float = Field(..., description="Mean time from call to start in a worker thread")
+    max_queue_ms: int = Field(..., description="Longest time from call to start in a worker thread")
+    avg_run_ms: float = Field(..., description="Mean time spent in a worker thread")
+    max_run_ms: int = Field(..., description="Longest time spent in a worker thread")
+
+    @classmethod
+    def from_stats(cls, endpoint: str, stats: EndpointStats) -> EndpointExecutionResponse:
+        """Convert executor counters to Pydantic response model."""
+        calls = max(stats.calls, 1)
+        return cls(
+            endpoint=endpoint,
+            limit=stats.limit,
+            calls=stats.calls,
+            errors=stats.errors,
+            waiting=stats.waiting,
+            running=stats.running,
+            avg_queue_ms=round(stats.queue_ms_total / calls, 1),
+            max_queue_ms=stats.queue_ms_max,
+            avg_run_ms=round(stats.run_ms_total / calls, 1),
+            max_run_ms=stats.run_ms_max,
+        )
+
+
+class ApiExecutorStatsResponse(BaseModel):
+    """Per-endpoint metrics of the API's blocking-call executor."""
+
+    max_workers: int = Field(..., description="Worker threads shared by all endpoints")
+    endpoints: list[EndpointExecutionResponse] = Field(..., description="Endpoints by total queue time, longest first")
+
+
+class ResponseCacheStatsResponse(BaseModel):
+    """Counters of the web API's conditional-request cache."""
+
+    hits: int = Field(..., description="Responses served from the cache")
+    not_modified: int = Field(..., description="304 responses for a current If-None-Match")
+    misses: int = Field(..., description="Requests that ran their handler (including invalidations)")
+    invalidations: int = Field(..., description="Cached responses dropped because their data changed")
+    bypassed: int = Field(..., description="Requests served uncached because change counters were unavailable")
+    entries: int = Field(..., description="Responses currently cached")
+    hit_ratio: float = Field(..., description="(hits + not_modified) / requests")
+
+    @classmethod
+    def from_stats(cls, stats: ResponseCacheStats) -> ResponseCacheStatsResponse:
+        """Convert cache counters to Pydantic response model."""
+        served = stats.hits + stats.not_modified
+        requests = served + stats.misses + stats.bypassed
+        return cls(
+            hits=stats.hits,
+            not_modified=stats.not_modified,
+            misses=stats.misses,
+            invalidations=stats.invalidations,
+            bypassed=stats.bypassed,
+            entries=stats.entries,
+            hit_ratio=round(served / requests, 3) if requests else 0.0,
+        )
@@ -418,11 +418,24 @@ class StartTagWriteResponse(BaseModel):
     task_id: str
 
 
+class ReconcileProgressResponse(BaseModel):
+    """Write-engine progress of the current (or last) reconcile batch."""
+
+    completed: int  # Files written (or failed) in this batch
+    failed: int  # Files whose write raised
+    in_flight: int  # Writes currently running
+    buffered: int  # Claimed files waiting for a device slot
+    elapsed_ms: int
+    files_per_s: float
+    per_device_completed: dict[str, int]
+
+
 class ReconcileStatusResponse(BaseModel):
     """Response for reconciliation status endpoint."""
 
     pending_count: int  # Files needing reconciliation
     in_progress: bool  # Whether reconciliation is running
+    progress: ReconcileProgressResponse | None = None
 
 
 class UpdateWriteModeResponse(BaseModel):
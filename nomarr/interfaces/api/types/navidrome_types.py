@@ -266,6 +266,8 @@ class SyncSongsResponse(BaseModel):
     play_edges_upserted: int = Field(..., description="Play count edges upserted")
     orphans_removed: int = Field(..., description="Orphan tracks removed")
     duration_ms: int = Field(..., description="Sync duration in milliseconds")
+    albums_fetched: int = Field(..., description="New or changed albums fetched from Navidrome")
+    albums_unchanged: int = Field(..., description="Albums skipped because their change marker matched")
 
 
 class PingResponse(BaseModel):
@@ -17,6 +17,7 @@ if TYPE_CHECKING:
         MatchedFileInfo,
         MatchResult,
         PlaylistConversionResult,
+        PlaylistMatchTimings,
         PlaylistMetadata,
         PlaylistTrackInput,
     )
@@ -147,6 +148,29 @@ class PlaylistMetadataResponse(BaseModel):
         )
 
 
+class PlaylistMatchTimingsResponse(BaseModel):
+    """Where the matching time of one conversion went (milliseconds)."""
+
+    index_ms: int = Field(..., description="Building the library candidate index")
+    exact_ms: int = Field(..., description="ISRC and exact metadata lookups")
+    fuzzy_ms: int = Field(..., description="Batched fuzzy scoring and classification")
+    total_ms: int = Field(..., description="Total matching time")
+    fuzzy_tracks: int = Field(..., description="Playlist tracks that needed fuzzy matching")
+    scored_pairs: int = Field(..., description="Playlist/library track pairs scored")
+
+    @classmethod
+    def from_dto(cls, dto: PlaylistMatchTimings) -> PlaylistMatchTimingsResponse:
+        """Convert DTO to response model."""
+        return cls(
+            index_ms=dto.index_ms,
+            exact_ms=dto.exact_ms,
+            fuzzy_ms=dto.fuzzy_ms,
+            total_ms=dto.total_ms,
+            fuzzy_tracks=dto.fuzzy_tracks,
+            scored_pairs=dto.scored_pairs,
+        )
+
+
 class ConvertPlaylistResponse(BaseModel):
     """Response from playlist conversion."""
 
@@ -172,6 +196,7 @@ class ConvertPlaylistResponse(BaseModel):
         default_factory=list,
         description="All track match results for interactive review",
     )
+    match_timings: PlaylistMatchTimingsResponse | None = Field(None, description="Per-import matching timings")
 
     @classmethod
     def from_dto(cls, dto: PlaylistConversionResult) -> ConvertPlaylistResponse:
@@ -189,6 +214,7 @@ class ConvertPlaylistResponse(BaseModel):
             unmatched_tracks=[PlaylistTrackInputResponse.from_dto(r.input_track) for r in dto.get_unmatched()],
             ambiguous_matches=[MatchResultResponse.from_dto(r) for r in dto.get_ambiguous()],
             all_matches=[MatchResultResponse.from_dto(r) for r in dto.match_results],
+            match_timings=(PlaylistMatchTimingsResponse.from_dto(dto.match_timings) if dto.match_timings else None),
         )
 
 
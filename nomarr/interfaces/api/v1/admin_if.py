@@ -1,5 +1,5 @@
 """Admin API endpoints for system control.
-Routes: /v1/admin/worker/*, /v1/admin/calibration/*.
+Routes: /v1/admin/worker/*, /v1/admin/calibration/*, /v1/admin/ml/*.
 
 These routes will be mounted under /api/v1/admin via the integration router.
 
@@ -16,10 +16,21 @@ from fastapi import APIRouter, Depends, HTTPException
 
 from nomarr.helpers.logging_helper import sanitize_exception_message
 from nomarr.interfaces.api.auth import verify_key
-from nomarr.interfaces.api.types.admin_types import WorkerOperationResponse
-from nomarr.interfaces.api.web.dependencies import get_calibration_service, get_config_service, get_workers_coordinator
+from nomarr.interfaces.api.executor import run_blocking
+from nomarr.interfaces.api.types.admin_types import (
+    ThreadTuningClearResponse,
+    ThreadTuningListResponse,
+    WorkerOperationResponse,
+)
+from nomarr.interfaces.api.web.dependencies import (
+    get_calibration_service,
+    get_config_service,
+    get_ml_service,
+    get_workers_coordinator,
+)
 from nomarr.services.domain.calibration_svc import CalibrationService
 from nomarr.services.infrastructure.config_svc import ConfigService
+from nomarr.services.infrastructure.ml_svc import MLService
 from nomarr.services.infrastructure.worker_system_svc import WorkerSystemService
 
 logger = logging.getLogger(__name__)
@@ -64,7 +75,7 @@ async def admin_run_calibration(
                 status_code=403,
                 detail="Calibration generation disabled. Set calibrate_heads: true in config to enable.",
             )
-        return calibration_service.generate_histogram_calibration()
+        return await run_blocking("admin.calibration.run", calibration_service.generate_histogram_calibration)
     except HTTPException:
         raise
     except Exception as e:
@@ -72,3 +83,30 @@ async def admin_run_calibration(
         raise HTTPException(
             status_code=500, detail=sanitize_exception_message(e, "Calibration generation failed")
         ) from e
+
+
+@router.get("/ml/thread-tuning", dependencies=[Depends(verify_key)])
+async def admin_get_thread_tuning(
+    ml_service: Annotated[MLService, Depends(get_ml_service)],
+) -> ThreadTuningListResponse:
+    """Show the calibrated ONNX CPU threading per host and backbone.
+
+    Each profile reports the chosen intra/inter-op threads for the worker
+    count it was tuned for, the measured throughput against the default
+    pool, and every candidate combination that was benchmarked.
+    """
+    return ThreadTuningListResponse.from_dto(
+        await run_blocking("admin.ml.thread_tuning", ml_service.get_thread_tunings)
+    )
+
+
+@router.delete("/ml/thread-tuning", dependencies=[Depends(verify_key)])
+async def admin_clear_thread_tuning(
+    ml_service: Annotated[MLService, Depends(get_ml_service)],
+) -> ThreadTuningClearResponse:
+    """Delete all thread-tuning profiles; workers re-calibrate on next start."""
+    cleared = await run_blocking("admin.ml.thread_tuning.delete", ml_service.clear_thread_tunings)
+    return ThreadTuningClearResponse(
+        cleared=cleared,
+        message=f"Cleared {cleared} profile(s); calibration re-runs when workers restart",
+    )
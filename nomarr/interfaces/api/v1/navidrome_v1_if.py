@@ -1,20 +1,22 @@
 """Navidrome v1 API endpoints for integration use.
 
-Routes: /v1/navidrome/similar-tracks, /v1/navidrome/scrobble, /v1/navidrome/generate-playlists.
+Routes: /v1/navidrome/similar-tracks, /v1/navidrome/scrobble, /v1/navidrome/generate-playlists,
+/v1/navidrome/generate-playlists/all-users.
 Auth: API key (verify_key).
 """
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel, Field
 
+from nomarr.helpers.dto import NavidromeGeneratePlaylistsResult
 from nomarr.helpers.exceptions import MisconfiguredError
 from nomarr.interfaces.api.auth import verify_key
+from nomarr.interfaces.api.executor import run_blocking
 from nomarr.interfaces.api.web.dependencies import get_navidrome_service
 from nomarr.services.domain.navidrome_svc import NavidromeService
 
@@ -64,7 +66,8 @@ async def navidrome_similar_tracks(
 ) -> SimilarTracksResponse:
     """Find tracks similar to a Navidrome song via vector ANN search."""
     try:
-        results = await asyncio.to_thread(
+        results = await run_blocking(
+            "navidrome_v1.similar_tracks",
             svc.get_similar_tracks,
             nd_song_id=body.song_id,
             count=body.count,
@@ -118,7 +121,8 @@ async def navidrome_scrobble(
 ) -> Response:
     """Ingest a real-time scrobble event from Navidrome."""
     timestamp_ms = body.timestamp * 1000
-    await asyncio.to_thread(
+    await run_blocking(
+        "navidrome_v1.scrobble",
         svc.ingest_scrobble,
         user_id=body.username,
         nd_id=body.track.id,
@@ -159,6 +163,12 @@ class GeneratePlaylistsResponse(BaseModel):
     playlists: list[PlaylistResultResponse]
 
 
+class GenerateAllUserPlaylistsResponse(BaseModel):
+    """Response for batch playlist generation, keyed by Navidrome user ID."""
+
+    users: dict[str, GeneratePlaylistsResponse]
+
+
 # ------------------------------------------------------------------
 # Playlist generation endpoint
 # ------------------------------------------------------------------
@@ -171,7 +181,8 @@ async def navidrome_generate_playlists(
 ) -> GeneratePlaylistsResponse:
     """Generate personal playlists for a Navidrome user."""
     try:
-        result = await asyncio.to_thread(
+        result = await run_blocking(
+            "navidrome_v1.generate_playlists",
             svc.generate_playlists,
             user_id=body.user_id,
             enabled_types=body.enabled_types,
@@ -200,8 +211,47 @@ async def navidrome_generate_playlists(
 
     # Resolve internal file_ids to Navidrome track IDs (external concern).
     all_file_ids = list({fid for playlist in result.playlists for fid in playlist["file_ids"]})
-    nd_map = await asyncio.to_thread(svc.resolve_files_to_nd, all_file_ids) if all_file_ids else {}
+    nd_map = (
+        await run_blocking("navidrome_v1.generate_playlists", svc.resolve_files_to_nd, all_file_ids)
+        if all_file_ids
+        else {}
+    )
+
+    return _to_playlists_response(result, nd_map)
+
 
+@router.post("/generate-playlists/all-users", dependencies=[Depends(verify_key)])
+async def navidrome_generate_all_user_playlists(
+    svc: Annotated[NavidromeService, Depends(get_navidrome_service)],
+) -> GenerateAllUserPlaylistsResponse:
+    """Regenerate personal playlists for every user with play data (scheduled runs)."""
+    try:
+        results = await run_blocking("navidrome_v1.generate_playlists.all_users", svc.generate_all_user_playlists)
+    except MisconfiguredError as exc:
+        raise HTTPException(
+            status_code=422,
+            detail={"status": "misconfigured", "message": str(exc)},
+        ) from exc
+
+    # One resolution round trip for every track across all users.
+    all_file_ids = list(
+        {fid for result in results.values() for playlist in result.playlists for fid in playlist["file_ids"]}
+    )
+    nd_map = (
+        await run_blocking("navidrome_v1.generate_playlists.all_users", svc.resolve_files_to_nd, all_file_ids)
+        if all_file_ids
+        else {}
+    )
+
+    return GenerateAllUserPlaylistsResponse(
+        users={user_id: _to_playlists_response(result, nd_map) for user_id, result in results.items()},
+    )
+
+
+def _to_playlists_response(
+    result: NavidromeGeneratePlaylistsResult, nd_map: dict[str, str]
+) -> GeneratePlaylistsResponse:
+    """Map a service result to the response model, translating file IDs to Navidrome IDs."""
     return GeneratePlaylistsResponse(
         status=result.status,
         message=result.message,
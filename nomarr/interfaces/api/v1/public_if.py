@@ -1,5 +1,5 @@
 """Public API endpoints for system information.
-Routes: /api/v1/info.
+Routes: /api/v1/info, /api/v1/metrics.
 
 ARCHITECTURE:
 - These endpoints are thin HTTP boundaries
@@ -12,7 +12,11 @@ from __future__ import annotations
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
 
+from nomarr.helpers.metrics_helper import EXPOSITION_CONTENT_TYPE
+from nomarr.interfaces.api.auth import verify_key
+from nomarr.interfaces.api.executor import run_blocking
 from nomarr.interfaces.api.types.info_types import PublicInfoResponse
 from nomarr.interfaces.api.web.dependencies import get_info_service
 from nomarr.services.infrastructure.info_svc import InfoService
@@ -31,5 +35,20 @@ async def get_info(
     """Get comprehensive system info: config, models, queue status, workers.
     Unified schema matching CLI info command.
     """
-    result = info_service.get_public_info()
+    result = await run_blocking("public.info", info_service.get_public_info)
     return PublicInfoResponse.from_dto(result)
+
+
+# ----------------------------------------------------------------------
+#  GET /metrics
+# ----------------------------------------------------------------------
+@router.get("/metrics", dependencies=[Depends(verify_key)], response_class=PlainTextResponse)
+async def get_metrics(
+    info_service: Annotated[InfoService, Depends(get_info_service)],
+) -> PlainTextResponse:
+    """Pipeline stage latencies, file outcomes, queue depth and VRAM promises.
+
+    Prometheus text exposition format; scrape with the API key as bearer token.
+    """
+    text = await run_blocking("public.metrics", info_service.get_pipeline_metrics)
+    return PlainTextResponse(text, media_type=EXPOSITION_CONTENT_TYPE)
@@ -1,6 +1,5 @@
 """Analytics endpoints for web UI."""
 
-import asyncio
 import logging
 from typing import TYPE_CHECKING, Annotated
 
@@ -8,10 +7,13 @@ from fastapi import APIRouter, Depends, HTTPException
 
 from nomarr.helpers.logging_helper import sanitize_exception_message
 from nomarr.interfaces.api.auth import verify_session
+from nomarr.interfaces.api.executor import run_blocking
+from nomarr.interfaces.api.response_cache import CachedResponse, cached
 from nomarr.interfaces.api.types.analytics_types import (
     CollectionOverviewResponse,
     MoodAnalysisResponse,
     MoodDistributionResponse,
+    RollupConsistencyResponse,
     TagCoOccurrenceRequest,
     TagCoOccurrencesResponse,
     TagCorrelationsResponse,
@@ -29,11 +31,16 @@ router = APIRouter(prefix="/analytics", tags=["Analytics"])
 async def web_analytics_tag_frequencies(
     limit: int = 50,
     analytics_service: "AnalyticsService" = Depends(get_analytics_service),
+    cache: CachedResponse[TagFrequenciesResponse] = Depends(cached("analytics.tag_frequencies")),
 ) -> TagFrequenciesResponse:
     """Get tag frequency statistics."""
+    if cache.hit:
+        return cache.payload
     try:
-        result = await asyncio.to_thread(analytics_service.get_tag_frequencies_with_result, limit=limit)
-        return TagFrequenciesResponse.from_dto(result)
+        result = await run_blocking(
+            "analytics.tag_frequencies", analytics_service.get_tag_frequencies_with_result, limit=limit
+        )
+        return cache.store(TagFrequenciesResponse.from_dto(result))
     except Exception as e:
         logger.exception("[Web API] Error getting tag frequencies")
         raise HTTPException(
@@ -46,14 +53,19 @@ async def web_analytics_tag_frequencies(
 async def web_analytics_mood_distribution(
     library_id: str | None = None,
     analytics_service: Annotated["AnalyticsService", Depends(get_analytics_service)] = None,  # type: ignore[assignment]
+    cache: CachedResponse[MoodDistributionResponse] = Depends(cached("analytics.mood_distribution")),
 ) -> MoodDistributionResponse:
     """Get mood tag distribution.
 
     Optionally filtered by library_id.
     """
+    if cache.hit:
+        return cache.payload
     try:
-        result = await asyncio.to_thread(analytics_service.get_mood_distribution_with_result, library_id=library_id)
-        return MoodDistributionResponse.from_dto(result)
+        result = await run_blocking(
+            "analytics.mood_distribution", analytics_service.get_mood_distribution_with_result, library_id=library_id
+        )
+        return cache.store(MoodDistributionResponse.from_dto(result))
     except Exception as e:
         logger.exception("[Web API] Error getting mood distribution")
         raise HTTPException(
@@ -65,15 +77,25 @@ async def web_analytics_mood_distribution(
 @router.get("/tag-correlations", dependencies=[Depends(verify_session)])
 async def web_analytics_tag_correlations(
     top_n: int = 20,
+    library_id: str | None = None,
     analytics_service: "AnalyticsService" = Depends(get_analytics_service),
+    cache: CachedResponse[TagCorrelationsResponse] = Depends(cached("analytics.tag_correlations")),
 ) -> TagCorrelationsResponse:
     """Get VALUE-based correlation matrix for mood values, genres, and attributes.
 
     Returns mood-to-mood, mood-to-genre, and mood-to-tier correlations.
+    Optionally filtered by library_id.
     """
+    if cache.hit:
+        return cache.payload
     try:
-        result_dto = await asyncio.to_thread(analytics_service.get_tag_correlation_matrix, top_n=top_n)
-        return TagCorrelationsResponse.from_dto(result_dto)
+        result_dto = await run_blocking(
+            "analytics.tag_correlations",
+            analytics_service.get_tag_correlation_matrix,
+            top_n=top_n,
+            library_id=library_id,
+        )
+        return cache.store(TagCorrelationsResponse.from_dto(result_dto))
     except Exception as e:
         logger.exception("[Web API] Error getting tag correlations")
         raise HTTPException(
@@ -104,7 +126,8 @@ async def web_analytics_tag_co_occurrences(
             )
         x_tuples = [(tag.key, tag.value) for tag in x_tags]
         y_tuples = [(tag.key, tag.value) for tag in y_tags]
-        result_dto = await asyncio.to_thread(
+        result_dto = await run_blocking(
+            "analytics.tag_co_occurrences",
             analytics_service.get_tag_co_occurrence,
             x_tags=x_tuples,
             y_tags=y_tuples,
@@ -123,18 +146,25 @@ async def web_analytics_tag_co_occurrences(
 async def web_analytics_collection_overview(
     library_id: str | None = None,
     analytics_service: Annotated["AnalyticsService", Depends(get_analytics_service)] = None,  # type: ignore[assignment]
+    cache: CachedResponse[CollectionOverviewResponse] = Depends(cached("analytics.collection_overview")),
 ) -> CollectionOverviewResponse:
     """Get collection overview statistics.
 
     Returns library stats, year/genre distributions.
     Optionally filtered by library_id.
     """
+    if cache.hit:
+        return cache.payload
     try:
-        result = await asyncio.to_thread(analytics_service.get_collection_overview, library_id=library_id)
-        return CollectionOverviewResponse(
-            stats=result["stats"],
-            year_distribution=result["year_distribution"],
-            genre_distribution=result["genre_distribution"],
+        result = await run_blocking(
+            "analytics.collection_overview", analytics_service.get_collection_overview, library_id=library_id
+        )
+        return cache.store(
+            CollectionOverviewResponse(
+                stats=result["stats"],
+                year_distribution=result["year_distribution"],
+                genre_distribution=result["genre_distribution"],
+            )
         )
     except Exception as e:
         logger.exception("[Web API] Error getting collection overview")
@@ -148,19 +178,26 @@ async def web_analytics_collection_overview(
 async def web_analytics_mood_analysis(
     library_id: str | None = None,
     analytics_service: Annotated["AnalyticsService", Depends(get_analytics_service)] = None,  # type: ignore[assignment]
+    cache: CachedResponse[MoodAnalysisResponse] = Depends(cached("analytics.mood_analysis")),
 ) -> MoodAnalysisResponse:
     """Get mood analysis statistics.
 
     Returns mood coverage, balance, top pairs by tier, and dominant vibes.
     Optionally filtered by library_id.
     """
+    if cache.hit:
+        return cache.payload
     try:
-        result = await asyncio.to_thread(analytics_service.get_mood_analysis, library_id=library_id)
-        return MoodAnalysisResponse(
-            coverage=result["coverage"],
-            balance=result["balance"],
-            top_pairs_by_tier=result["top_pairs_by_tier"],
-            dominant_vibes=result["dominant_vibes"],
+        result = await run_blocking(
+            "analytics.mood_analysis", analytics_service.get_mood_analysis, library_id=library_id
+        )
+        return cache.store(
+            MoodAnalysisResponse(
+                coverage=result["coverage"],
+                balance=result["balance"],
+                top_pairs_by_tier=result["top_pairs_by_tier"],
+                dominant_vibes=result["dominant_vibes"],
+            )
         )
     except Exception as e:
         logger.exception("[Web API] Error getting mood analysis")
@@ -168,3 +205,31 @@ async def web_analytics_mood_analysis(
             status_code=500,
             detail=sanitize_exception_message(e, "Failed to get mood analysis"),
         ) from e
+
+
+@router.post("/rollups/check", dependencies=[Depends(verify_session)])
+async def web_analytics_check_rollups(
+    library_id: str | None = None,
+    repair: bool = False,
+    analytics_service: Annotated["AnalyticsService", Depends(get_analytics_service)] = None,  # type: ignore[assignment]
+) -> RollupConsistencyResponse:
+    """Compare the analytics rollups with a full recompute.
+
+    Runs the full-scan Insights queries per library. With ``repair=true``,
+    every library whose rollup differs is rebuilt.
+    Optionally limited to library_id.
+    """
+    try:
+        reports = await run_blocking(
+            "analytics.rollups.check",
+            analytics_service.check_analytics_rollups,
+            library_id=library_id,
+            repair=repair,
+        )
+        return RollupConsistencyResponse.from_dto(reports)
+    except Exception as e:
+        logger.exception("[Web API] Error checking analytics rollups")
+        raise HTTPException(
+            status_code=500,
+            detail=sanitize_exception_message(e, "Failed to check analytics rollups"),
+        ) from e
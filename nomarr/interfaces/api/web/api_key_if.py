@@ -11,6 +11,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 
 from nomarr.interfaces.api.auth import get_key_service, verify_session
+from nomarr.interfaces.api.executor import run_blocking
 from nomarr.interfaces.api.types.api_key_types import ApiKeyResponse
 from nomarr.services.infrastructure.keys_svc import KeyManagementService
 
@@ -22,7 +23,7 @@ async def get_api_key(
     key_service: Annotated[KeyManagementService, Depends(get_key_service)],
 ) -> ApiKeyResponse:
     """Return the current API key."""
-    key = key_service.get_or_create_api_key()
+    key = await run_blocking("api_key.list", key_service.get_or_create_api_key)
     return ApiKeyResponse(api_key=key)
 
 
@@ -31,5 +32,5 @@ async def regenerate_api_key(
     key_service: Annotated[KeyManagementService, Depends(get_key_service)],
 ) -> ApiKeyResponse:
     """Regenerate the API key and return the new value."""
-    key = key_service.regenerate_api_key()
+    key = await run_blocking("api_key.regenerate", key_service.regenerate_api_key)
     return ApiKeyResponse(api_key=key)
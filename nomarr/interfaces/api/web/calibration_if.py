@@ -7,6 +7,8 @@ from fastapi import APIRouter, Depends, HTTPException
 
 from nomarr.helpers.logging_helper import sanitize_exception_message
 from nomarr.interfaces.api.auth import verify_session
+from nomarr.interfaces.api.executor import run_blocking
+from nomarr.interfaces.api.response_cache import CachedResponse, cached
 from nomarr.interfaces.api.web.dependencies import get_calibration_service, get_tagging_service
 
 logger = logging.getLogger(__name__)
@@ -31,7 +33,7 @@ async def clear_calibration(
 
     """
     try:
-        return calibration_service.clear_calibration()
+        return await run_blocking("calibration.delete", calibration_service.clear_calibration)
     except RuntimeError as e:
         raise HTTPException(status_code=409, detail=str(e)) from e
     except Exception as e:
@@ -58,7 +60,7 @@ async def start_apply_calibration(
         if tagging_service.is_apply_running():
             return {"status": "already_running", "message": "Calibration apply already in progress"}
 
-        tagging_service.start_apply_calibration_background()
+        await run_blocking("calibration.start_apply", tagging_service.start_apply_calibration_background)
         return {"status": "started", "message": "Calibration apply started in background"}
     except Exception as e:
         logger.error(f"[Web API] Failed to start calibration apply: {e}", exc_info=True)
@@ -82,7 +84,7 @@ async def get_apply_calibration_status(
         }
 
     """
-    return tagging_service.get_apply_status()
+    return await run_blocking("calibration.apply_status", tagging_service.get_apply_status)
 
 
 @router.get("/apply-progress", dependencies=[Depends(verify_session)])
@@ -100,12 +102,13 @@ async def get_apply_calibration_progress(
         }
 
     """
-    return tagging_service.get_apply_progress()
+    return await run_blocking("calibration.apply_progress", tagging_service.get_apply_progress)
 
 
 @router.get("/status", dependencies=[Depends(verify_session)])
 async def get_calibration_status(
     tagging_service: Annotated["TaggingService", Depends(get_tagging_service)],
+    cache: Annotated[CachedResponse[dict[str, Any]], Depends(cached("calibration.status"))],
 ) -> dict[str, Any]:
     """Get current calibration status with per-library breakdown.
 
@@ -126,8 +129,10 @@ async def get_calibration_status(
         }
 
     """
+    if cache.hit:
+        return cache.payload
     try:
-        return tagging_service.get_calibration_status()
+        return cache.store(await run_blocking("calibration.status", tagging_service.get_calibration_status))
     except Exception as e:
         logger.exception("[Web API] Error fetching calibration status")
         raise HTTPException(
@@ -153,7 +158,7 @@ async def start_histogram_calibration_background(
     try:
         if calibration_service.is_generation_running():
             return {"status": "already_running", "message": "Calibration generation already in progress"}
-        calibration_service.start_histogram_calibration_background()
+        await run_blocking("calibration.start_histogram", calibration_service.start_histogram_calibration_background)
         return {"status": "started", "message": "Calibration generation started in background"}
     except Exception as e:
         logger.error(f"[Web] Failed to start histogram calibration: {e}", exc_info=True)
@@ -176,7 +181,7 @@ async def get_histogram_calibration_status(
 
     """
     try:
-        return calibration_service.get_generation_status()
+        return await run_blocking("calibration.histogram_status", calibration_service.get_generation_status)
     except Exception as e:
         logger.error(f"[Web] Failed to get histogram calibration status: {e}", exc_info=True)
         raise HTTPException(
@@ -201,7 +206,7 @@ async def get_histogram_calibration_progress(
 
     """
     try:
-        return calibration_service.get_generation_progress()
+        return await run_blocking("calibration.histogram_progress", calibration_service.get_generation_progress)
     except Exception as e:
         logger.error(f"[Web] Failed to get histogram calibration progress: {e}", exc_info=True)
         raise HTTPException(
@@ -231,7 +236,7 @@ async def get_calibration_history_all(
 
     """
     try:
-        return calibration_service.get_calibration_history(limit=limit)
+        return await run_blocking("calibration.history", calibration_service.get_calibration_history, limit=limit)
     except Exception as e:
         logger.error(f"[Web] Failed to get calibration history: {e}", exc_info=True)
         raise HTTPException(
@@ -262,7 +267,12 @@ async def get_calibration_history_single(
 
     """
     try:
-        return calibration_service.get_calibration_history(calibration_key=calibration_key, limit=limit)
+        return await run_blocking(
+            "calibration.history",
+            calibration_service.get_calibration_history,
+            calibration_key=calibration_key,
+            limit=limit,
+        )
     except Exception as e:
         logger.error(f"[Web] Failed to get calibration history for {calibration_key}: {e}", exc_info=True)
         raise HTTPException(
@@ -294,7 +304,7 @@ async def get_convergence_status(
 
     """
     try:
-        return calibration_service.get_latest_convergence_status()
+        return await run_blocking("calibration.convergence", calibration_service.get_latest_convergence_status)
     except Exception as e:
         logger.error(f"[Web] Failed to get convergence status: {e}", exc_info=True)
         raise HTTPException(
@@ -330,7 +340,9 @@ async def get_histogram_for_head(
 
     """
     try:
-        return calibration_service.get_histogram_for_head(model_key, head_name, label)
+        return await run_blocking(
+            "calibration.histogram.head", calibration_service.get_histogram_for_head, model_key, head_name, label
+        )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
     except Exception as e:
@@ -366,7 +378,7 @@ async def get_all_calibration_histograms(
 
     """
     try:
-        states = calibration_service.get_all_calibration_states()
+        states = await run_blocking("calibration.histogram", calibration_service.get_all_calibration_states)
         return {"calibrations": states}
     except Exception as e:
         logger.error(f"[Web] Failed to get all calibration histograms: {e}", exc_info=True)
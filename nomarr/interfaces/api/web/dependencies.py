@@ -11,7 +11,7 @@ ARCHITECTURE:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from fastapi import HTTPException
 
@@ -26,6 +26,7 @@ if TYPE_CHECKING:
     from nomarr.services.infrastructure.config_svc import ConfigService
     from nomarr.services.infrastructure.file_watcher_svc import FileWatcherService
     from nomarr.services.infrastructure.info_svc import InfoService
+    from nomarr.services.infrastructure.library_changes_svc import LibraryChangesService
     from nomarr.services.infrastructure.worker_system_svc import WorkerSystemService
 
 
@@ -142,7 +143,14 @@ def get_file_watcher_service() -> FileWatcherService | None:
     """Get FileWatcherService instance (optional - may not be running)."""
     from nomarr.app import application
 
-    return application.services.get("file_watcher")  # type: ignore[return-value]
+    return cast("FileWatcherService | None", application.services.get("file_watcher"))
+
+
+def get_library_changes_service() -> LibraryChangesService | None:
+    """Get LibraryChangesService instance (optional - responses are not cached without it)."""
+    from nomarr.app import application
+
+    return cast("LibraryChangesService | None", application.services.get("library_changes"))
 
 
 def get_playlist_import_service() -> PlaylistImportService:
@@ -7,9 +7,14 @@ from fastapi import APIRouter, Depends, HTTPException
 
 from nomarr.helpers.logging_helper import sanitize_exception_message
 from nomarr.interfaces.api.auth import verify_session
+from nomarr.interfaces.api.executor import api_executor, run_blocking
+from nomarr.interfaces.api.response_cache import response_cache
 from nomarr.interfaces.api.types.info_types import (
+    ApiExecutorStatsResponse,
+    EndpointExecutionResponse,
     GPUHealthResponse,
     HealthStatusResponse,
+    ResponseCacheStatsResponse,
     SystemInfoResponse,
     WorkStatusResponse,
 )
@@ -24,14 +29,14 @@ router = APIRouter(prefix="", tags=["Info"])
 @router.get("/info", dependencies=[Depends(verify_session)])
 async def web_info(info_service: Annotated[Any, Depends(get_info_service)]) -> SystemInfoResponse:
     """Get system info (web UI proxy)."""
-    result = info_service.get_system_info()
+    result = await run_blocking("info.system", info_service.get_system_info)
     return SystemInfoResponse.from_dto(result)
 
 
 @router.get("/health", dependencies=[Depends(verify_session)])
 async def web_health(info_service: Annotated[Any, Depends(get_info_service)]) -> HealthStatusResponse:
     """Health check endpoint (web UI proxy)."""
-    result = info_service.get_health_status()
+    result = await run_blocking("info.health", info_service.get_health_status)
     return HealthStatusResponse.from_dto(result)
 
 
@@ -49,7 +54,7 @@ async def web_gpu_health(info_service: Annotated[Any, Depends(get_info_service)]
     not by inspecting this response.
     """
     try:
-        result = info_service.get_gpu_health()
+        result = await run_blocking("info.health.gpu", info_service.get_gpu_health)
         return GPUHealthResponse.from_dto(result)
     except RuntimeError:
         return GPUHealthResponse(available=False, error_summary="GPU monitoring not available", monitor_healthy=False)
@@ -69,8 +74,31 @@ async def web_work_status(
     Poll at 1s intervals when busy, 30s when idle.
     """
     try:
-        result = library_service.get_work_status()
+        result = await run_blocking("info.work_status", library_service.get_work_status)
         return WorkStatusResponse.from_dto(result)
     except Exception as e:
         logger.exception("[Web API] Error getting work status")
         raise HTTPException(status_code=500, detail=sanitize_exception_message(e, "Failed to get work status")) from e
+
+
+@router.get("/executor-stats", dependencies=[Depends(verify_session)])
+async def web_executor_stats() -> ApiExecutorStatsResponse:
+    """Get queue and run times of blocking calls made by API handlers.
+
+    A high ``avg_queue_ms`` means the endpoint's concurrency cap or the
+    shared worker pool is saturated.
+    """
+    stats = api_executor.stats()
+    return ApiExecutorStatsResponse(
+        max_workers=api_executor.max_workers,
+        endpoints=[
+            EndpointExecutionResponse.from_stats(endpoint, s)
+            for endpoint, s in sorted(stats.items(), key=lambda item: item[1].queue_ms_total, reverse=True)
+        ],
+    )
+
+
+@router.get("/response-cache-stats", dependencies=[Depends(verify_session)])
+async def web_response_cache_stats() -> ResponseCacheStatsResponse:
+    """Get hit, miss and invalidation counters of the conditional-request cache."""
+    return ResponseCacheStatsResponse.from_stats(response_cache.stats())
@@ -1,18 +1,20 @@
 """Library statistics and management endpoints for web UI."""
 
-import asyncio
 import logging
 import threading
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from nomarr.helpers.dto.library_dto import SearchFilesQuery
+from nomarr.helpers.dto.vector_config_dto import VectorConfigResult
 from nomarr.helpers.exceptions import LibraryAlreadyScanningError, LibraryNotFoundError
 from nomarr.helpers.logging_helper import sanitize_exception_message
 from nomarr.interfaces.api.auth import verify_session
+from nomarr.interfaces.api.executor import run_blocking
 from nomarr.interfaces.api.id_codec import decode_path_id, encode_id
+from nomarr.interfaces.api.response_cache import CachedResponse, cached
 from nomarr.interfaces.api.types.library_types import (
     CreateLibraryRequest,
     ErroredFileItemResponse,
@@ -22,6 +24,7 @@ from nomarr.interfaces.api.types.library_types import (
     LibraryStatsResponse,
     ListLibrariesResponse,
     ReconcilePathsResponse,
+    ReconcileProgressResponse,
     ReconcileStatusResponse,
     RetryErroredRequest,
     RetryErroredResponse,
@@ -92,11 +95,14 @@ class LibraryVectorStatsResponse(BaseModel):
 @router.get("/stats", dependencies=[Depends(verify_session)])
 async def web_library_stats(
     library_service: Annotated["LibraryService", Depends(get_library_service)],
+    cache: Annotated[CachedResponse[LibraryStatsResponse], Depends(cached("library.stats"))],
 ) -> LibraryStatsResponse:
     """Get library statistics (total files, artists, albums, duration)."""
+    if cache.hit:
+        return cache.payload
     try:
-        stats = library_service.get_library_stats()
-        return LibraryStatsResponse.from_dto(stats)
+        stats = await run_blocking("library.stats", library_service.get_library_stats)
+        return cache.store(LibraryStatsResponse.from_dto(stats))
     except Exception as e:
         logger.exception("[Web API] Error getting library stats")
         raise HTTPException(status_code=500, detail=sanitize_exception_message(e, "Failed to get library stats")) from e
@@ -109,7 +115,7 @@ async def list_libraries(
 ) -> ListLibrariesResponse:
     """List all configured libraries."""
     try:
-        libraries = library_service.list_libraries(enabled_only=enabled_only)
+        libraries = await run_blocking("library.list", library_service.list_libraries, enabled_only=enabled_only)
         return ListLibrariesResponse.from_dto(libraries)
     except Exception as e:
         logger.exception("[Web API] Error listing libraries")
@@ -145,7 +151,12 @@ async def web_library_recent_activity(
     """
     try:
         decoded_library_id = decode_path_id(library_id) if library_id else None
-        files = library_service.get_recently_processed(limit=limit, library_id=decoded_library_id)
+        files = await run_blocking(
+            "library.recent_activity",
+            library_service.get_recently_processed,
+            limit=limit,
+            library_id=decoded_library_id,
+        )
         return RecentFilesResponse(files=[RecentFileItem(**f) for f in files])
     except Exception as e:
         logger.exception("[Web API] Error getting recent activity")
@@ -163,7 +174,7 @@ async def get_library(
     """Get a library by ID."""
     library_id = decode_path_id(library_id)
     try:
-        library = library_service.get_library(library_id)
+        library = await run_blocking("library.get", library_service.get_library, library_id)
         return LibraryResponse.from_dto(library)
     except ValueError:
         raise HTTPException(status_code=404, detail="Library not found") from None
@@ -179,7 +190,9 @@ async def create_library(
 ) -> LibraryResponse:
     """Create a new library."""
     try:
-        library = library_service.create_library(
+        library = await run_blocking(
+            "library.create",
+            library_service.create_library,
             name=request.name,
             root_path=request.root_path,
             is_enabled=request.is_enabled,
@@ -203,7 +216,9 @@ async def update_library(
     """Update a library's properties."""
     library_id = decode_path_id(library_id)
     try:
-        library = library_service.update_library(
+        library = await run_blocking(
+            "library.update",
+            library_service.update_library,
             library_id,
             name=request.name,
             root_path=request.root_path,
@@ -236,7 +251,7 @@ async def delete_library(
         if file_watcher and library_id in file_watcher.observers:
             file_watcher.stop_watching_library(library_id)
             logger.info(f"[Web API] Stopped file watcher for library {library_id}")
-        deleted = library_service.delete_library(library_id)
+        deleted = await run_blocking("library.delete", library_service.delete_library, library_id)
         if not deleted:
             raise HTTPException(status_code=404, detail="Library not found")
         return {"status": "success", "message": f"Library {library_id} deleted"}
@@ -274,7 +289,7 @@ async def search_library_files(
             limit=limit,
             offset=offset,
         )
-        result = library_service.search_files(query)
+        result = await run_blocking("library.files.search", library_service.search_files, query)
         return SearchFilesResponse.from_dto(result)
     except Exception as e:
         logger.exception("[Web API] Error searching library files")
@@ -302,7 +317,7 @@ async def get_files_by_ids(
     """
     try:
         decoded_ids = [decode_path_id(fid) for fid in request.file_ids]
-        result = library_service.get_files_by_ids(decoded_ids)
+        result = await run_blocking("library.files.by_ids", library_service.get_files_by_ids, decoded_ids)
         return SearchFilesResponse.from_dto(result)
     except Exception as e:
         logger.exception("[Web API] Error getting files by IDs")
@@ -329,7 +344,9 @@ async def search_files_by_tag(
     For string values: Returns files with exact match on the tag value.
     """
     try:
-        result = tagging_service.search_files_by_tag(
+        result = await run_blocking(
+            "library.files.by_tag",
+            tagging_service.search_files_by_tag,
             tag_key=request.tag_key,
             target_value=request.target_value,
             limit=request.limit,
@@ -345,14 +362,19 @@ async def search_files_by_tag(
 async def get_unique_tag_keys(
     nomarr_only: Annotated[bool, Query(description="Only show Nomarr tags")] = False,
     tagging_service: "TaggingService" = Depends(get_tagging_service),
+    cache: CachedResponse[UniqueTagKeysResponse] = Depends(cached("library.files.tags.unique_keys")),
 ) -> UniqueTagKeysResponse:
     """Get list of unique tag keys for filtering.
 
     Returns all distinct tag keys found in the database.
     """
+    if cache.hit:
+        return cache.payload
     try:
-        result = tagging_service.get_unique_tag_keys(nomarr_only=nomarr_only)
-        return UniqueTagKeysResponse.from_dto(result)
+        result = await run_blocking(
+            "library.files.tags.unique_keys", tagging_service.get_unique_tag_keys, nomarr_only=nomarr_only
+        )
+        return cache.store(UniqueTagKeysResponse.from_dto(result))
     except Exception as e:
         logger.exception("[Web API] Error getting unique tag keys")
         raise HTTPException(status_code=500, detail=sanitize_exception_message(e, "Failed to get tag keys")) from e
@@ -363,14 +385,19 @@ async def get_unique_tag_values(
     tag_key: Annotated[str, Query(description="Tag key to get values for")],
     nomarr_only: Annotated[bool, Query(description="Only show Nomarr tag values")] = True,
     tagging_service: "TaggingService" = Depends(get_tagging_service),
+    cache: CachedResponse[UniqueTagKeysResponse] = Depends(cached("library.files.tags.values")),
 ) -> UniqueTagKeysResponse:
     """Get list of unique values for a specific tag key.
 
     Returns all distinct values for the given tag key.
     """
+    if cache.hit:
+        return cache.payload
     try:
-        result = tagging_service.get_unique_tag_values(tag_key=tag_key, nomarr_only=nomarr_only)
-        return UniqueTagKeysResponse.from_dto(result)
+        result = await run_blocking(
+            "library.files.tags.values", tagging_service.get_unique_tag_values, tag_key=tag_key, nomarr_only=nomarr_only
+        )
+        return cache.store(UniqueTagKeysResponse.from_dto(result))
     except Exception as e:
         logger.exception("[Web API] Error getting unique tag values")
         raise HTTPException(status_code=500, detail=sanitize_exception_message(e, "Failed to get tag values")) from e
@@ -381,6 +408,7 @@ async def get_unique_mood_values(
     mood_tier: Annotated[str, Query(description="Mood tier (mood-strict, mood-regular, mood-loose)")] = "mood-strict",
     limit: Annotated[int, Query(description="Maximum values to return")] = 100,
     tagging_service: "TaggingService" = Depends(get_tagging_service),
+    cache: CachedResponse[UniqueTagKeysResponse] = Depends(cached("library.files.tags.mood_values")),
 ) -> UniqueTagKeysResponse:
     """Get unique individual mood values from tuple string tags.
 
@@ -390,9 +418,13 @@ async def get_unique_mood_values(
     Returns:
         List of unique mood values (e.g., ["aggressive", "happy", "party-like"])
     """
+    if cache.hit:
+        return cache.payload
     try:
-        result = tagging_service.get_unique_mood_values(mood_tier=mood_tier, limit=limit)
-        return UniqueTagKeysResponse.from_dto(result)
+        result = await run_blocking(
+            "library.files.tags.mood_values", tagging_service.get_unique_mood_values, mood_tier=mood_tier, limit=limit
+        )
+        return cache.store(UniqueTagKeysResponse.from_dto(result))
     except Exception as e:
         logger.exception("[Web API] Error getting unique mood values")
         raise HTTPException(status_code=500, detail=sanitize_exception_message(e, "Failed to get mood values")) from e
@@ -418,7 +450,7 @@ async def cleanup_orphaned_tags(
 
     """
     try:
-        result = tagging_service.cleanup_orphaned_tags(dry_run=dry_run)
+        result = await run_blocking("library.cleanup_tags", tagging_service.cleanup_orphaned_tags, dry_run=dry_run)
         return TagCleanupResponse.from_dto(result)
     except Exception as e:
         logger.exception("[Web API] Error cleaning up orphaned tags")
@@ -448,7 +480,9 @@ async def cleanup_orphaned_entities(
 
     """
     try:
-        return metadata_service.cleanup_orphaned_entities(dry_run=dry_run)
+        return await run_blocking(
+            "library.cleanup_entities", metadata_service.cleanup_orphaned_entities, dry_run=dry_run
+        )
     except Exception as e:
         logger.exception("[Web API] Error cleaning up orphaned entities")
         raise HTTPException(status_code=500, detail=sanitize_exception_message(e, "Failed to clean up entities")) from e
@@ -479,7 +513,9 @@ async def get_file_tags(
     """
     file_id = decode_path_id(file_id)
     try:
-        result = tagging_service.get_file_tags(file_id=file_id, nomarr_only=nomarr_only)
+        result = await run_blocking(
+            "library.files.tags", tagging_service.get_file_tags, file_id=file_id, nomarr_only=nomarr_only
+        )
         return FileTagsResponse.from_dto(result)
     except ValueError:
         raise HTTPException(status_code=404, detail="File not found") from None
@@ -510,7 +546,7 @@ async def scan_library_quick(
     """
     library_id = decode_path_id(library_id)
     try:
-        stats = library_service.start_quick_scan(library_id=library_id)
+        stats = await run_blocking("library.scan.quick", library_service.start_quick_scan, library_id=library_id)
         return StartScanWithStatusResponse.from_dto(stats, library_id)
     except LibraryNotFoundError:
         raise HTTPException(status_code=404, detail="Library not found") from None
@@ -546,7 +582,7 @@ async def scan_library_full(
     """
     library_id = decode_path_id(library_id)
     try:
-        stats = library_service.start_full_scan(library_id=library_id)
+        stats = await run_blocking("library.scan.full", library_service.start_full_scan, library_id=library_id)
         return StartScanWithStatusResponse.from_dto(stats, library_id)
     except LibraryNotFoundError:
         raise HTTPException(status_code=404, detail="Library not found") from None
@@ -596,7 +632,9 @@ async def reconcile_library_paths(
     """
     library_id = decode_path_id(library_id)
     try:
-        stats = await asyncio.to_thread(library_service.reconcile_library_paths, policy=policy, batch_size=batch_size)
+        stats = await run_blocking(
+            "library.reconcile", library_service.reconcile_library_paths, policy=policy, batch_size=batch_size
+        )
         return ReconcilePathsResponse.from_dict(stats)
     except ValueError as e:
         error_message = str(e).lower()
@@ -643,7 +681,9 @@ async def reconcile_library_tags(
         def trigger_navidrome_rescan() -> None:
             navidrome_service.trigger_rescan()
 
-        task_id = tagging_service.start_write_tags_background(
+        task_id = await run_blocking(
+            "library.reconcile_tags",
+            tagging_service.start_write_tags_background,
             library_id,
             stop_event=stop_event,
             on_complete=trigger_navidrome_rescan,
@@ -663,8 +703,9 @@ async def get_reconcile_status(
 ) -> ReconcileStatusResponse:
     """Get tag reconciliation status for a library.
 
-    Returns the count of files needing reconciliation and whether
-    a reconciliation operation is currently in progress.
+    Returns the count of files needing reconciliation, whether
+    a reconciliation operation is currently in progress, and the
+    write-engine progress of the current/last batch.
 
     Args:
         library_id: Library ID to check
@@ -676,8 +717,15 @@ async def get_reconcile_status(
     """
     library_id = decode_path_id(library_id)
     try:
-        status = tagging_service.get_reconcile_status(library_id=library_id)
-        return ReconcileStatusResponse(pending_count=status["pending_count"], in_progress=status["in_progress"])
+        status = await run_blocking(
+            "library.reconcile_status", tagging_service.get_reconcile_status, library_id=library_id
+        )
+        progress = status.get("progress")
+        return ReconcileStatusResponse(
+            pending_count=status["pending_count"],
+            in_progress=status["in_progress"],
+            progress=ReconcileProgressResponse(**progress) if progress is not None else None,
+        )
     except ValueError:
         raise HTTPException(status_code=404, detail="Library not found") from None
     except Exception as e:
@@ -718,9 +766,13 @@ async def update_write_mode(
     if file_write_mode not in ("none", "minimal", "full"):
         raise HTTPException(status_code=400, detail="file_write_mode must be 'none', 'minimal', or 'full'")
     try:
-        library_service.update_library(library_id, file_write_mode=file_write_mode)
-        tagging_service.mark_tags_stale(library_id)
-        status = tagging_service.get_reconcile_status(library_id=library_id)
+
+        def update() -> dict[str, Any]:
+            library_service.update_library(library_id, file_write_mode=file_write_mode)
+            tagging_service.mark_tags_stale(library_id)
+            return tagging_service.get_reconcile_status(library_id=library_id)
+
+        status = await run_blocking("library.write_mode", update)
         return UpdateWriteModeResponse(
             file_write_mode=file_write_mode,
             requires_reconciliation=status["pending_count"] > 0,
@@ -756,7 +808,12 @@ async def validate_library_tags(
     """
     library_id = decode_path_id(library_id)
     try:
-        result = library_service.validate_library_tags(library_id=library_id, auto_repair=auto_repair)
+        result = await run_blocking(
+            "library.validate_tags",
+            library_service.validate_library_tags,
+            library_id=library_id,
+            auto_repair=auto_repair,
+        )
         return ValidateLibraryTagsResponse(
             files_checked=result["files_checked"],
             complete_files=result["complete_files"],
@@ -795,7 +852,9 @@ async def get_library_vector_config(
     """
     library_id = decode_path_id(library_id)
     try:
-        result = library_service.get_vector_config(library_id, config_service)
+        result = await run_blocking(
+            "library.vector_config", library_service.get_vector_config, library_id, config_service
+        )
         return VectorConfigResponse(**result)
     except ValueError:
         raise HTTPException(status_code=404, detail="Library not found") from None
@@ -825,12 +884,16 @@ async def update_library_vector_config(
     """
     library_id = decode_path_id(library_id)
     try:
-        library_service.update_vector_config(
-            library_id,
-            vector_group_size=request.vector_group_size,
-            vector_search_thoroughness=request.vector_search_thoroughness,
-        )
-        result = library_service.get_vector_config(library_id, config_service)
+
+        def update() -> VectorConfigResult:
+            library_service.update_vector_config(
+                library_id,
+                vector_group_size=request.vector_group_size,
+                vector_search_thoroughness=request.vector_search_thoroughness,
+            )
+            return library_service.get_vector_config(library_id, config_service)
+
+        result = await run_blocking("library.vector_config", update)
         return VectorConfigResponse(**result)
     except ValueError as e:
         detail = str(e)
@@ -862,7 +925,7 @@ async def get_library_vector_stats(
     """
     library_id = decode_path_id(library_id)
     try:
-        library = library_service.get_library(library_id)
+        library = await run_blocking("library.vector_stats", library_service.get_library, library_id)
     except ValueError:
         raise HTTPException(status_code=404, detail="Library not found") from None
 
@@ -870,7 +933,9 @@ async def get_library_vector_stats(
     stats: list[VectorStatsItem] = []
     for backbone_id in ml_service.list_backbones():
         try:
-            s = vector_maintenance_service.get_hot_cold_stats(backbone_id, library_key)
+            s = await run_blocking(
+                "library.vector_stats", vector_maintenance_service.get_hot_cold_stats, backbone_id, library_key
+            )
             stats.append(
                 VectorStatsItem(
                     backbone_id=backbone_id,
@@ -905,7 +970,7 @@ async def get_errored_files(
     """
     library_id = decode_path_id(library_id)
     try:
-        result = library_service.get_errored_files(library_id=library_id)
+        result = await run_blocking("library.errored_files", library_service.get_errored_files, library_id=library_id)
         return ErroredFilesResponse(
             files=[
                 ErroredFileItemResponse(
@@ -949,7 +1014,9 @@ async def retry_errored_files(
     library_id = decode_path_id(library_id)
     file_ids = [decode_path_id(fid) for fid in request.file_ids] if request and request.file_ids else None
     try:
-        result = library_service.retry_errored_files(library_id=library_id, file_ids=file_ids)
+        result = await run_blocking(
+            "library.retry_errored", library_service.retry_errored_files, library_id=library_id, file_ids=file_ids
+        )
         return RetryErroredResponse(retried=result["retried"])
     except ValueError:
         raise HTTPException(status_code=404, detail="Library not found") from None
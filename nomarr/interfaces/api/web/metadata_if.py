@@ -10,6 +10,7 @@ from typing import Annotated, Literal
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from nomarr.interfaces.api.auth import verify_session
+from nomarr.interfaces.api.executor import run_blocking
 from nomarr.interfaces.api.id_codec import decode_path_id
 from nomarr.interfaces.api.types.metadata_types import (
     EntityCountsResponse,
@@ -35,7 +36,7 @@ async def get_entity_counts(
     metadata_service: Annotated[MetadataService, Depends(get_metadata_service)],
 ) -> EntityCountsResponse:
     """Get total counts for all entity collections (artists, albums, etc.)."""
-    counts = metadata_service.get_entity_counts()
+    counts = await run_blocking("metadata.counts", metadata_service.get_entity_counts)
     return EntityCountsResponse(**counts)
 
 
@@ -51,7 +52,9 @@ async def list_entities(
     metadata_service: MetadataService = Depends(get_metadata_service),
 ) -> EntityListResponse:
     """List entities from a collection (artists, albums, labels, genres, years)."""
-    result = metadata_service.list_entities(collection, limit=limit, offset=offset, search=search)
+    result = await run_blocking(
+        "metadata.entities", metadata_service.list_entities, collection, limit=limit, offset=offset, search=search
+    )
     return EntityListResponse.from_dto(result)
 
 
@@ -70,7 +73,7 @@ async def get_entity(
     Collection parameter is informational only (entity_id already contains collection).
     """
     entity_id = decode_path_id(entity_id)
-    entity = metadata_service.get_entity(entity_id)
+    entity = await run_blocking("metadata.entity", metadata_service.get_entity, entity_id)
     if not entity:
         raise HTTPException(status_code=404, detail="Entity not found")
     return EntityResponse.from_dto(entity)
@@ -94,7 +97,9 @@ async def list_songs_for_entity(
     Returns all songs where this artist is the primary credited artist.
     """
     entity_id = decode_path_id(entity_id)
-    result = metadata_service.list_songs_for_entity(entity_id, rel, limit=limit, offset=offset)
+    result = await run_blocking(
+        "metadata.songs", metadata_service.list_songs_for_entity, entity_id, rel, limit=limit, offset=offset
+    )
     return SongListResponse.from_dto(result)
 
 
@@ -112,7 +117,9 @@ async def list_artists_for_album(
     Returns deduplicated artists sorted by display_name.
     """
     album_id = decode_path_id(album_id)
-    artists = metadata_service.list_artists_for_album(album_id, limit=limit)
+    artists = await run_blocking(
+        "metadata.albums.artists", metadata_service.list_artists_for_album, album_id, limit=limit
+    )
     return [EntityResponse.from_dto(a) for a in artists]
 
 
@@ -131,5 +138,7 @@ async def list_albums_for_artist(
     Each album includes song_count (number of songs by this artist on that album).
     """
     artist_id = decode_path_id(artist_id)
-    albums = metadata_service.list_albums_for_artist(artist_id, limit=limit)
+    albums = await run_blocking(
+        "metadata.artists.albums", metadata_service.list_albums_for_artist, artist_id, limit=limit
+    )
     return [EntityResponse.from_dto(a) for a in albums]
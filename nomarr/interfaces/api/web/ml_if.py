@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException
 
 from nomarr.helpers.logging_helper import sanitize_exception_message
 from nomarr.interfaces.api.auth import verify_session
+from nomarr.interfaces.api.executor import run_blocking
 from nomarr.interfaces.api.id_codec import decode_path_id
 from nomarr.interfaces.api.types.ml_types import (
     MarkConfiguredRequest,
@@ -29,7 +30,7 @@ async def ml_list_models(
 ) -> list[MlModelResponse]:
     """Return all registered ML model vertices with their configuration status."""
     try:
-        docs = ml_service.list_all_models()
+        docs = await run_blocking("ml.models", ml_service.list_all_models)
         return [MlModelResponse.from_doc(doc) for doc in docs]
     except Exception as e:
         logger.exception("[ml_if] Failed to list models")
@@ -47,7 +48,7 @@ async def ml_get_model_outputs(
     """Return all output activation vertices for a model."""
     decoded_model_id = decode_path_id(model_id)
     try:
-        docs = ml_service.get_model_outputs(decoded_model_id)
+        docs = await run_blocking("ml.models.outputs", ml_service.get_model_outputs, decoded_model_id)
         return [MlModelOutputResponse.from_doc(doc) for doc in docs]
     except Exception as e:
         logger.exception("[ml_if] Failed to get model outputs for %s", model_id)
@@ -68,7 +69,9 @@ async def ml_update_output_label(
     decode_path_id(model_id)  # validate format; model_id not used directly
     decoded_output_id = decode_path_id(output_id)
     try:
-        ml_service.update_output_label(output_id=decoded_output_id, label=body.label)
+        await run_blocking(
+            "ml.models.outputs.update", ml_service.update_output_label, output_id=decoded_output_id, label=body.label
+        )
         return {"status": "updated"}
     except Exception as e:
         logger.exception("[ml_if] Failed to update output label for %s", output_id)
@@ -87,7 +90,9 @@ async def ml_mark_model_configured(
     """Set the fully_configured flag on a model, enabling or disabling it for inference."""
     decoded_model_id = decode_path_id(model_id)
     try:
-        ml_service.mark_model_configured(model_id=decoded_model_id, value=body.value)
+        await run_blocking(
+            "ml.models.mark_configured", ml_service.mark_model_configured, model_id=decoded_model_id, value=body.value
+        )
         return {"status": "updated", "fully_configured": str(body.value).lower()}
     except Exception as e:
         logger.exception("[ml_if] Failed to mark model configured for %s", model_id)
@@ -107,7 +112,7 @@ async def ml_trigger_vram_probe(
     This endpoint only schedules the re-probe by clearing the existing measurements.
     """
     try:
-        ml_service.clear_vram_measurements()
+        await run_blocking("ml.vram_probe", ml_service.clear_vram_measurements)
         return {"status": "probe_scheduled"}
     except Exception as e:
         logger.exception("[ml_if] Failed to clear VRAM measurements")
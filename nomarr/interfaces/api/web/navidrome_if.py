@@ -1,14 +1,14 @@
 """Navidrome integration endpoints for web UI."""
 
-import asyncio
 import logging
 from typing import TYPE_CHECKING, Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from nomarr.helpers.exceptions import PlaylistQueryError
 from nomarr.helpers.logging_helper import sanitize_exception_message
 from nomarr.interfaces.api.auth import verify_session
+from nomarr.interfaces.api.executor import run_blocking
 from nomarr.interfaces.api.id_codec import decode_id
 from nomarr.interfaces.api.types.navidrome_types import (
     GeneratePlaylistResponse,
@@ -42,7 +42,7 @@ async def web_navidrome_preview(
 ) -> PreviewTagStatsResponse:
     """Get preview of tags for Navidrome config generation (web UI proxy)."""
     try:
-        result_dto = await asyncio.to_thread(navidrome_service.preview_tag_stats)
+        result_dto = await run_blocking("navidrome.preview", navidrome_service.preview_tag_stats)
         return PreviewTagStatsResponse.from_dto(result_dto)
     except Exception as e:
         logger.exception("[Web API] Error generating Navidrome preview")
@@ -56,7 +56,7 @@ async def web_navidrome_tag_values(
 ) -> TagValuesResponse:
     """Get distinct values for a specific tag relationship."""
     try:
-        values = await asyncio.to_thread(navidrome_service.get_tag_values, rel)
+        values = await run_blocking("navidrome.tag_values", navidrome_service.get_tag_values, rel)
         return TagValuesResponse(rel=rel, values=values)
     except Exception as e:
         logger.exception("[Web API] Error fetching tag values")
@@ -69,7 +69,7 @@ async def web_navidrome_config(
 ) -> NavidromeConfigResponse:
     """Generate Navidrome TOML configuration (web UI proxy)."""
     try:
-        toml_config = await asyncio.to_thread(navidrome_service.generate_navidrome_config)
+        toml_config = await run_blocking("navidrome.config", navidrome_service.generate_navidrome_config)
         return NavidromeConfigResponse.from_toml(toml_config)
     except Exception as e:
         logger.exception("[Web API] Error generating Navidrome config")
@@ -82,8 +82,11 @@ async def web_navidrome_playlist_preview(
 ) -> PlaylistPreviewResponse:
     """Preview Smart Playlist query results."""
     try:
-        result_dto = await asyncio.to_thread(
-            navidrome_service.preview_playlist, query=request.query, preview_limit=request.preview_limit
+        result_dto = await run_blocking(
+            "navidrome.playlists.preview",
+            navidrome_service.preview_playlist,
+            query=request.query,
+            preview_limit=request.preview_limit,
         )
         return PlaylistPreviewResponse.from_dto(result_dto)
     except PlaylistQueryError:
@@ -101,7 +104,8 @@ async def web_navidrome_playlist_generate(
 ) -> GeneratePlaylistResponse:
     """Generate Navidrome Smart Playlist (.nsp) from query."""
     try:
-        result_dto = await asyncio.to_thread(
+        result_dto = await run_blocking(
+            "navidrome.playlists.generate",
             navidrome_service.generate_playlist,
             query=request.query,
             playlist_name=request.playlist_name,
@@ -125,7 +129,7 @@ async def web_navidrome_templates_list(
 ) -> GetTemplateSummaryResponse:
     """Get list of all available playlist templates."""
     try:
-        result_dto = await asyncio.to_thread(navidrome_service.get_template_summary)
+        result_dto = await run_blocking("navidrome.templates", navidrome_service.get_template_summary)
         return GetTemplateSummaryResponse.from_dto(result_dto)
     except Exception as e:
         logger.exception("[Web API] Error listing templates")
@@ -139,7 +143,8 @@ async def web_navidrome_templates_generate(
 ) -> GenerateTemplateFilesResponse:
     """Generate all playlist templates as a batch."""
     try:
-        result_dto = await asyncio.to_thread(
+        result_dto = await run_blocking(
+            "navidrome.templates",
             navidrome_service.generate_template_files,
             template_id=request.template_id or "",
             output_dir=request.output_dir or "",
@@ -158,7 +163,8 @@ async def web_navidrome_static_playlist(
 ) -> StaticPlaylistResponse:
     """Generate a static M3U playlist from a list of file IDs."""
     try:
-        result_dto = await asyncio.to_thread(
+        result_dto = await run_blocking(
+            "navidrome.playlists.static",
             navidrome_service.generate_static_playlist,
             file_ids=[decode_id(fid) for fid in request.file_ids],
             playlist_name=request.playlist_name,
@@ -185,7 +191,8 @@ async def web_navidrome_push_playlist(
     resolution details.
     """
     try:
-        result_dto = await asyncio.to_thread(
+        result_dto = await run_blocking(
+            "navidrome.playlists.push",
             navidrome_service.push_static_playlist,
             file_ids=[decode_id(fid) for fid in request.file_ids],
             playlist_name=request.playlist_name,
@@ -203,10 +210,11 @@ async def web_navidrome_push_playlist(
 @router.post("/sync-songs", dependencies=[Depends(verify_session)])
 async def web_navidrome_sync_songs(
     navidrome_service: Annotated["NavidromeService", Depends(get_navidrome_service)],
+    full: Annotated[bool, Query(description="Fetch every album instead of only changed ones")] = False,
 ) -> SyncSongsResponse:
-    """Trigger a full Navidrome song sync to graph collections."""
+    """Trigger a Navidrome song sync to graph collections (delta unless ``full``)."""
     try:
-        result = await asyncio.to_thread(navidrome_service.sync_navidrome)
+        result = await run_blocking("navidrome.sync_songs", navidrome_service.sync_navidrome, full=full)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except Exception as e:
@@ -221,6 +229,8 @@ async def web_navidrome_sync_songs(
         play_edges_upserted=result["play_edges_upserted"],
         orphans_removed=result["orphans_removed"],
         duration_ms=result["duration_ms"],
+        albums_fetched=result["albums_fetched"],
+        albums_unchanged=result["albums_unchanged"],
     )
 
 
@@ -229,7 +239,7 @@ async def navidrome_ping(
     navidrome_service: "NavidromeService" = Depends(get_navidrome_service),
 ) -> PingResponse:
     """Test connectivity to the Navidrome server."""
-    ok, error = await asyncio.to_thread(navidrome_service.ping)
+    ok, error = await run_blocking("navidrome.ping", navidrome_service.ping)
     return PingResponse(ok=ok, error=error or None)
 
 
@@ -11,6 +11,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from nomarr.helpers.exceptions import PlaylistConversionError
 from nomarr.helpers.logging_helper import sanitize_exception_message
 from nomarr.interfaces.api.auth import verify_session
+from nomarr.interfaces.api.executor import run_blocking
 from nomarr.interfaces.api.types.playlist_import_types import (
     ConvertPlaylistRequest,
     ConvertPlaylistResponse,
@@ -42,7 +43,9 @@ async def web_convert_playlist(
     Deezer works immediately (public API).
     """
     try:
-        result_dto = playlist_service.convert_playlist(
+        result_dto = await run_blocking(
+            "playlist_import.convert",
+            playlist_service.convert_playlist,
             playlist_url=request.playlist_url,
             library_id=request.library_id,
         )
@@ -12,6 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException
 
 from nomarr.helpers.logging_helper import sanitize_exception_message
 from nomarr.interfaces.api.auth import verify_session
+from nomarr.interfaces.api.executor import run_blocking
 from nomarr.interfaces.api.web.dependencies import get_library_service
 
 logger = logging.getLogger(__name__)
@@ -31,7 +32,7 @@ async def web_processing_status(
     - needs_tagging=0: File has been processed
     """
     try:
-        stats = library_service.get_library_stats()
+        stats = await run_blocking("processing.status", library_service.get_library_stats)
         pending = stats.needs_tagging_count or 0
         processed = stats.total_files - pending
         return {"pending": pending, "processed": processed, "total": stats.total_files}
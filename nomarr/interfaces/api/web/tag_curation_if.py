@@ -1,6 +1,5 @@
 """Tag curation endpoints for web UI."""
 
-import asyncio
 import logging
 from typing import TYPE_CHECKING, Annotated, Any
 
@@ -9,7 +8,9 @@ from pydantic import BaseModel
 
 from nomarr.helpers.logging_helper import sanitize_exception_message
 from nomarr.interfaces.api.auth import verify_session
+from nomarr.interfaces.api.executor import run_blocking
 from nomarr.interfaces.api.id_codec import decode_path_id
+from nomarr.interfaces.api.response_cache import CachedResponse, cached
 from nomarr.interfaces.api.web.dependencies import get_tagging_service
 
 if TYPE_CHECKING:
@@ -62,7 +63,8 @@ async def rename_tag(
 ) -> dict[str, Any]:
     """Rename a tag to a new value."""
     try:
-        result = await asyncio.to_thread(
+        result = await run_blocking(
+            "tag_curation.rename",
             tagging_service.rename_tag,
             tag_id=request.tag_id,
             new_value=request.new_value,
@@ -85,7 +87,8 @@ async def merge_tags(
 ) -> dict[str, Any]:
     """Merge multiple tags into a canonical tag."""
     try:
-        result = await asyncio.to_thread(
+        result = await run_blocking(
+            "tag_curation.merge",
             tagging_service.merge_tags,
             source_tag_ids=request.source_tag_ids,
             canonical_tag_id=request.canonical_tag_id,
@@ -108,7 +111,8 @@ async def split_tag(
 ) -> dict[str, Any]:
     """Split selected songs from a tag into a new tag value."""
     try:
-        result = await asyncio.to_thread(
+        result = await run_blocking(
+            "tag_curation.split",
             tagging_service.split_tag,
             source_tag_id=request.source_tag_id,
             song_ids=request.song_ids,
@@ -133,21 +137,25 @@ async def split_tag(
 @router.get("/values", dependencies=[Depends(verify_session)])
 async def list_tag_values(
     tagging_service: Annotated["TaggingService", Depends(get_tagging_service)],
+    cache: Annotated[CachedResponse[dict[str, Any]], Depends(cached("tag_curation.values"))],
     rel: Annotated[str | None, Query(description="Filter by tag rel (e.g. genre)")] = None,
     prefix: Annotated[str | None, Query(description="Substring search on tag value")] = None,
     limit: Annotated[int, Query(ge=1, le=500)] = 100,
     offset: Annotated[int, Query(ge=0)] = 0,
 ) -> dict[str, Any]:
     """List tag values with optional filtering and pagination."""
+    if cache.hit:
+        return cache.payload
     try:
-        result = await asyncio.to_thread(
+        result = await run_blocking(
+            "tag_curation.values",
             tagging_service.list_tag_values,
             rel=rel,
             prefix=prefix,
             limit=limit,
             offset=offset,
         )
-        return dict(result)
+        return cache.store(dict(result))
     except Exception as e:
         logger.exception("[Web API] Error listing tag values")
         raise HTTPException(
@@ -166,7 +174,8 @@ async def get_tag_songs(
     """Get songs linked to a tag with metadata."""
     tag_id = decode_path_id(tag_id)
     try:
-        return await asyncio.to_thread(
+        return await run_blocking(
+            "tag_curation.songs",
             tagging_service.get_tag_songs,
             tag_id=tag_id,
             limit=limit,
@@ -194,7 +203,8 @@ async def commit_pending_tags(
 ) -> dict[str, Any]:
     """Commit pending tag writes to files."""
     try:
-        result = await asyncio.to_thread(
+        result = await run_blocking(
+            "tag_curation.commit",
             tagging_service.commit_pending_tags,
             library_id=request.library_id,
         )
@@ -213,7 +223,7 @@ async def get_pending_commit_count(
 ) -> dict[str, int]:
     """Get count of files with pending tag writes."""
     try:
-        count = await asyncio.to_thread(tagging_service.get_pending_commit_count)
+        count = await run_blocking("tag_curation.pending_count", tagging_service.get_pending_commit_count)
         return {"count": count}
     except Exception as e:
         logger.exception("[Web API] Error getting pending commit count")
@@ -237,7 +247,8 @@ async def update_file_tags(
     """Replace all tags for a file+rel with new values."""
     file_id = decode_path_id(file_id)
     try:
-        return await asyncio.to_thread(
+        return await run_blocking(
+            "tag_curation.files.tags.update",
             tagging_service.update_file_tags,
             file_id=file_id,
             rel=request.rel,
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException
 
 from nomarr.helpers.logging_helper import sanitize_exception_message
 from nomarr.interfaces.api.auth import verify_session
+from nomarr.interfaces.api.executor import run_blocking
 from nomarr.interfaces.api.web.dependencies import get_tagging_service
 from nomarr.services.domain.tagging_svc import TaggingService
 
@@ -21,7 +22,7 @@ async def web_show_tags(
     """Read tags from an audio file (web UI proxy)."""
     try:
         namespace = tagging_service.namespace
-        tags = tagging_service.read_file_tags(path, namespace)
+        tags = await run_blocking("tags.show_tags", tagging_service.read_file_tags, path, namespace)
         return {"path": path, "namespace": namespace, "tags": tags, "count": len(tags)}
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid file path") from None
@@ -37,7 +38,7 @@ async def web_remove_tags(
     """Remove all namespaced tags from an audio file (web UI proxy)."""
     try:
         namespace = tagging_service.namespace
-        count = tagging_service.remove_file_tags(path, namespace)
+        count = await run_blocking("tags.remove_tags.delete", tagging_service.remove_file_tags, path, namespace)
         return {"path": path, "namespace": namespace, "removed": count}
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid file path") from None
@@ -17,6 +17,7 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException
 
 from nomarr.interfaces.api.auth import verify_session
+from nomarr.interfaces.api.executor import run_blocking
 from nomarr.interfaces.api.id_codec import decode_id, decode_path_id, encode_id
 from nomarr.interfaces.api.types.vector_types import (
     VectorGetResponse,
@@ -90,7 +91,9 @@ async def search_vectors(
     """
     try:
         # Call service layer
-        results = vector_search_service.search_similar_tracks(
+        results = await run_blocking(
+            "vectors.search",
+            vector_search_service.search_similar_tracks,
             file_id=decode_id(request.file_id),
             backbone_id=request.backbone_id,
             limit=request.limit,
@@ -151,7 +154,7 @@ async def get_track_vector(
 
     """
     file_id = decode_path_id(file_id)
-    result = vector_search_service.get_track_vector(backbone_id, file_id)
+    result = await run_blocking("vectors.track", vector_search_service.get_track_vector, backbone_id, file_id)
 
     if result is None:
         raise HTTPException(
@@ -188,13 +191,9 @@ async def get_vector_stats(
         VectorStatsResponse with stats for all backbones
 
     """
-    import asyncio
-    from concurrent.futures import ThreadPoolExecutor
-
     known_backbones = ml_service.list_backbones()
 
     def _get_stats_sync() -> list[VectorHotColdStats]:
-        """Run blocking DB queries in thread pool."""
         stats_list = []
         libraries = vector_maintenance_service.db.libraries.list_libraries()
         for lib in libraries:
@@ -216,10 +215,7 @@ async def get_vector_stats(
                     continue
         return stats_list
 
-    # Run blocking DB operations in thread pool to avoid blocking event loop
-    loop = asyncio.get_running_loop()
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        stats_list = await loop.run_in_executor(executor, _get_stats_sync)
+    stats_list = await run_blocking("vectors.stats", _get_stats_sync)
 
     return VectorStatsResponse(stats=stats_list)
 
@@ -251,7 +247,9 @@ async def promote_vectors(
     """
     try:
         # Call service layer (synchronous - blocks until complete)
-        vector_maintenance_service.promote_and_rebuild(
+        await run_blocking(
+            "vectors.promote",
+            vector_maintenance_service.promote_and_rebuild,
             backbone_id=request.backbone_id,
             library_key=request.library_key,
             nlists=request.nlists,
@@ -306,7 +304,9 @@ async def rebuild_vector_index(
         504: If operation times out (>10 minutes)
     """
     try:
-        vector_maintenance_service.rebuild_index(
+        await run_blocking(
+            "vectors.rebuild_index",
+            vector_maintenance_service.rebuild_index,
             backbone_id=request.backbone_id,
             library_key=request.library_key,
             nlists=request.nlists,
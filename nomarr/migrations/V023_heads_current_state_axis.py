@@ -0,0 +1,79 @@
+"""V023: Add the heads_current / heads_stale file state axis.
+
+Seeds the two new ``file_states`` vertices and gives every existing file an
+edge on the new axis: tagged files were tagged with the heads installed at
+the time, so they start ``heads_current``; every other file starts
+``heads_stale`` like a freshly initialized file.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nomarr.persistence.arango_client import DatabaseLike
+
+logger = logging.getLogger(__name__)
+
+# Required metadata
+MIGRATION_VERSION: str = "0.2.3"
+DESCRIPTION: str = "Add heads_current/heads_stale file state axis"
+
+_HEADS_CURRENT = "file_states/heads_current"
+_HEADS_STALE = "file_states/heads_stale"
+
+
+def upgrade(db: DatabaseLike) -> None:
+    """Seed the new state vertices and one axis edge per existing file."""
+    from arango.exceptions import DocumentInsertError
+
+    if not db.has_collection("file_states"):
+        return
+    file_states_coll = db.collection("file_states")  # type: ignore[union-attr]
+    for state in ("heads_current", "heads_stale"):
+        with contextlib.suppress(DocumentInsertError):
+            file_states_coll.insert({"_key": state}, silent=True)  # type: ignore[union-attr]
+            logger.info(f"[V023] Inserted seed document file_states/{state}")
+
+    if not (db.has_collection("library_files") and db.has_collection("file_has_state")):
+        return
+
+    # Step 1: READ files without an edge on the new axis, split by tagged state
+    collect_cursor = db.aql.execute(  # type: ignore[union-attr]
+        """
+        FOR f IN library_files
+            LET has_axis = FIRST(
+                FOR e IN file_has_state
+                    FILTER e._from == f._id AND (e._to == @positive OR e._to == @negative)
+                    LIMIT 1
+                    RETURN true
+            )
+            FILTER has_axis == null
+            LET is_tagged = FIRST(
+                FOR e IN file_has_state
+                    FILTER e._from == f._id AND e._to == "file_states/tagged"
+                    LIMIT 1
+                    RETURN true
+            )
+            RETURN { file_id: f._id, tagged: is_tagged == true }
+        """,
+        bind_vars={"positive": _HEADS_CURRENT, "negative": _HEADS_STALE},
+    )
+    rows = list(collect_cursor)  # type: ignore[arg-type]
+    current_ids = [row["file_id"] for row in rows if row["tagged"]]
+    stale_ids = [row["file_id"] for row in rows if not row["tagged"]]
+
+    # Step 2: WRITE axis edges (separate AQL calls)
+    for file_ids, state in ((current_ids, _HEADS_CURRENT), (stale_ids, _HEADS_STALE)):
+        if file_ids:
+            db.aql.execute(  # type: ignore[union-attr]
+                """
+                FOR f_id IN @file_ids
+                    INSERT { _from: f_id, _to: @state }
+                    INTO file_has_state OPTIONS { ignoreErrors: true }
+                """,
+                bind_vars={"file_ids": file_ids, "state": state},
+            )
+    logger.info(f"[V023] Seeded {len(current_ids)} heads_current and {len(stale_ids)} heads_stale edges")
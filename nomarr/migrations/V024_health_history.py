@@ -0,0 +1,39 @@
+"""V024: Add the health_history collection.
+
+Component status snapshots used to be upserted into ``health`` one component
+per query. They are now appended to ``health_history`` in bulk, and a TTL
+index on ``expires_at`` (unix seconds) enforces retention.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nomarr.persistence.arango_client import DatabaseLike
+
+logger = logging.getLogger(__name__)
+
+# Required metadata
+MIGRATION_VERSION: str = "0.2.4"
+DESCRIPTION: str = "Add health_history collection with TTL retention"
+
+
+def upgrade(db: DatabaseLike) -> None:
+    """Create health_history with its TTL and per-component indexes."""
+    from arango.exceptions import CollectionCreateError, IndexCreateError
+
+    if not db.has_collection("health_history"):
+        with contextlib.suppress(CollectionCreateError):
+            db.create_collection("health_history")  # type: ignore[union-attr]
+            logger.info("[V024] Created collection health_history")
+
+    history = db.collection("health_history")  # type: ignore[union-attr]
+    with contextlib.suppress(IndexCreateError):
+        history.add_ttl_index(fields=["expires_at"], expiry_time=0)  # type: ignore[union-attr]
+    with contextlib.suppress(IndexCreateError):
+        history.add_persistent_index(fields=["component_id", "recorded_at"])  # type: ignore[union-attr]
+
+    logger.info("[V024] Ensured health_history TTL and component indexes")
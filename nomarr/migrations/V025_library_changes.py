@@ -0,0 +1,31 @@
+"""V025: Add the library_changes collection.
+
+One document per scope (library ``_key`` or ``calibration``) holding a
+counter that write paths increment. The web API compares counters to answer
+conditional requests for cached responses without re-running their queries.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nomarr.persistence.arango_client import DatabaseLike
+
+logger = logging.getLogger(__name__)
+
+# Required metadata
+MIGRATION_VERSION: str = "0.2.5"
+DESCRIPTION: str = "Add library_changes collection (per-library change counters)"
+
+
+def upgrade(db: DatabaseLike) -> None:
+    """Create library_changes (documents are keyed by scope, so no extra index)."""
+    from arango.exceptions import CollectionCreateError
+
+    if not db.has_collection("library_changes"):
+        with contextlib.suppress(CollectionCreateError):
+            db.create_collection("library_changes")  # type: ignore[union-attr]
+            logger.info("[V025] Created collection library_changes")
@@ -0,0 +1,40 @@
+"""V026: Add the navidrome_taste_profiles collection.
+
+One document per user, backbone and library holding decayed running sums of
+the embeddings the user played. Scrobbles update a profile in place instead
+of re-reading the user's whole play history.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nomarr.persistence.arango_client import DatabaseLike
+
+logger = logging.getLogger(__name__)
+
+# Required metadata
+MIGRATION_VERSION: str = "0.2.6"
+DESCRIPTION: str = "Add navidrome_taste_profiles collection (persisted per-user taste profiles)"
+
+
+def upgrade(db: DatabaseLike) -> None:
+    """Create navidrome_taste_profiles with its per-user and per-library indexes."""
+    from arango.exceptions import CollectionCreateError, IndexCreateError
+
+    if not db.has_collection("navidrome_taste_profiles"):
+        with contextlib.suppress(CollectionCreateError):
+            db.create_collection("navidrome_taste_profiles")  # type: ignore[union-attr]
+            logger.info("[V026] Created collection navidrome_taste_profiles")
+
+    profiles = db.collection("navidrome_taste_profiles")  # type: ignore[union-attr]
+    # Per-user lookup on scrobble, per-library scan for batch generation
+    with contextlib.suppress(IndexCreateError):
+        profiles.add_persistent_index(fields=["userid"])  # type: ignore[union-attr]
+    with contextlib.suppress(IndexCreateError):
+        profiles.add_persistent_index(fields=["backbone_id", "library_key"])  # type: ignore[union-attr]
+
+    logger.info("[V026] Ensured navidrome_taste_profiles indexes")
@@ -0,0 +1,37 @@
+"""V027: Add the navidrome_albums collection.
+
+One document per Navidrome album holding the change marker seen by the last
+sync and the album's song IDs, so repeat syncs fetch only changed albums.
+The array index on ``song_ids[*]`` serves the server-side orphan-track lookup.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nomarr.persistence.arango_client import DatabaseLike
+
+logger = logging.getLogger(__name__)
+
+# Required metadata
+MIGRATION_VERSION: str = "0.2.7"
+DESCRIPTION: str = "Add navidrome_albums collection (per-album change markers for delta syncs)"
+
+
+def upgrade(db: DatabaseLike) -> None:
+    """Create navidrome_albums with its ``song_ids[*]`` array index."""
+    from arango.exceptions import CollectionCreateError, IndexCreateError
+
+    if not db.has_collection("navidrome_albums"):
+        with contextlib.suppress(CollectionCreateError):
+            db.create_collection("navidrome_albums")  # type: ignore[union-attr]
+            logger.info("[V027] Created collection navidrome_albums")
+
+    albums = db.collection("navidrome_albums")  # type: ignore[union-attr]
+    with contextlib.suppress(IndexCreateError):
+        albums.add_persistent_index(fields=["song_ids[*]"])  # type: ignore[union-attr]
+
+    logger.info("[V027] Ensured navidrome_albums song_ids index")
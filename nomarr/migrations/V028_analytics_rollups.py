@@ -0,0 +1,39 @@
+"""V028: Add the analytics_rollups and analytics_rollup_files collections.
+
+``analytics_rollups`` holds one document of summed Insights counters per
+library; ``analytics_rollup_files`` holds each file's own contribution so a
+write can be applied as a delta. The ``library_id`` index serves dropping or
+rebuilding one library's contributions.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nomarr.persistence.arango_client import DatabaseLike
+
+logger = logging.getLogger(__name__)
+
+# Required metadata
+MIGRATION_VERSION: str = "0.2.8"
+DESCRIPTION: str = "Add analytics_rollups and analytics_rollup_files collections (per-library Insights counters)"
+
+
+def upgrade(db: DatabaseLike) -> None:
+    """Create both rollup collections and the per-library contribution index."""
+    from arango.exceptions import CollectionCreateError, IndexCreateError
+
+    for name in ("analytics_rollups", "analytics_rollup_files"):
+        if not db.has_collection(name):
+            with contextlib.suppress(CollectionCreateError):
+                db.create_collection(name)  # type: ignore[union-attr]
+                logger.info(f"[V028] Created collection {name}")
+
+    contributions = db.collection("analytics_rollup_files")  # type: ignore[union-attr]
+    with contextlib.suppress(IndexCreateError):
+        contributions.add_persistent_index(fields=["library_id"])  # type: ignore[union-attr]
+
+    logger.info("[V028] Ensured analytics_rollup_files library_id index")
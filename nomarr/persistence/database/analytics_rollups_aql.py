@@ -0,0 +1,494 @@
+"""Per-library analytics rollup operations for ArangoDB.
+
+The Insights dashboard (collection overview and mood analysis) used to
+rescan every file, tag and edge of the library on each load.  This module
+keeps the same aggregates as counters:
+
+- ``analytics_rollups``: one document per library with the summed counters.
+- ``analytics_rollup_files``: one document per file with that file's own
+  counters (its *contribution*), so a change can be applied as a delta.
+
+Counters are grouped in flat *sections*; every section maps a key to a
+number and zero entries are dropped:
+
+=================  ==========================================================
+Section            Keys
+=================  ==========================================================
+``totals``         ``files``, ``duration_s``, ``size``, ``tagged:<tier>``
+``year``           JSON-encoded ``year`` tag value
+``genre``          JSON-encoded ``genre`` tag value
+``mood:<tier>``    JSON-encoded mood (tuple-string values split)
+``pairs:<tier>``   JSON-encoded ``[mood1, mood2]`` (cumulative tiers)
+=================  ==========================================================
+
+The write paths call :meth:`AnalyticsRollupsOperations.refresh_files` after
+a tag or file write touching these counters and
+:meth:`~AnalyticsRollupsOperations.remove_files` before removing files
+(cascaded through ``parent_db`` like vectors and file states).  A refresh
+recomputes the contribution of each file from its current tags, diffs it with
+the stored one and applies the difference to the library document in one
+exclusive AQL update, so concurrent workers never lose an increment.
+
+A library's rollup document only exists once :meth:`rebuild_library` has
+summed every file; until then deltas for it are skipped.  Readers rebuild
+missing libraries on first use.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, cast
+
+from nomarr.helpers.dto.analytics_dto import LibraryRollup
+from nomarr.helpers.time_helper import now_ms
+from nomarr.persistence.database.tags_aql.mood import split_mood_value
+
+if TYPE_CHECKING:
+    from arango.cursor import Cursor
+
+    from nomarr.persistence.arango_client import DatabaseLike
+
+logger = logging.getLogger(__name__)
+
+MOOD_TIER_RELS: dict[str, str] = {
+    "strict": "nom:mood-strict",
+    "regular": "nom:mood-regular",
+    "loose": "nom:mood-loose",
+}
+
+# Tag rels that feed a rollup counter; writes to other rels skip the refresh.
+ROLLUP_TAG_RELS: frozenset[str] = frozenset({"year", "genre", *MOOD_TIER_RELS.values()})
+
+# Tiers are cumulative for pairs: "regular" includes strict, "loose" includes all.
+_PAIR_TIER_RELS: dict[str, tuple[str, ...]] = {
+    "strict": ("nom:mood-strict",),
+    "regular": ("nom:mood-strict", "nom:mood-regular"),
+    "loose": ("nom:mood-strict", "nom:mood-regular", "nom:mood-loose"),
+}
+
+_REBUILD_WRITE_BATCH = 5000
+
+Sections = dict[str, dict[str, float]]
+
+# Current tags and file fields of every file in @file_ids, plus its stored
+# contribution.  Files that no longer exist or belong to no library get a
+# null library_id (their contribution is withdrawn).
+_FILE_FACTS_QUERY = """
+FOR file_id IN @file_ids
+    LET file = DOCUMENT(file_id)
+    LET library_id = file == null ? null : FIRST(
+        FOR edge IN library_contains_file
+            FILTER edge._to == file_id
+            LIMIT 1
+            RETURN edge._from
+    )
+    LET tags = library_id == null ? [] : (
+        FOR edge IN song_has_tags
+            FILTER edge._from == file_id
+            LET tag = DOCUMENT(edge._to)
+            FILTER tag != null AND tag.rel IN @rels
+            RETURN [tag.rel, tag.value]
+    )
+    RETURN {
+        file_id: file_id,
+        library_id: library_id,
+        duration_s: file.duration_seconds,
+        size: file.file_size,
+        tags: tags,
+        stored: DOCUMENT("analytics_rollup_files", PARSE_IDENTIFIER(file_id).key)
+    }
+"""
+
+
+def _key(value: Any) -> str:
+    """Encode a counter key (tag values keep their JSON type)."""
+    return json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+
+def _file_sections(duration_s: Any, size: Any, tags: Iterable[list[Any]]) -> Sections:
+    """Counters contributed by one file with the given fields and rollup tags."""
+    values_by_rel: dict[str, list[Any]] = {}
+    for rel, value in tags:
+        values_by_rel.setdefault(rel, []).append(value)
+
+    totals: dict[str, float] = {"files": 1}
+    if duration_s:
+        totals["duration_s"] = float(duration_s)
+    if size:
+        totals["size"] = int(size)
+    sections: Sections = {"totals": totals}
+
+    for rel in ("year", "genre"):
+        values = values_by_rel.get(rel)
+        if values:
+            counts = sections.setdefault(rel, {})
+            for value in values:
+                counts[_key(value)] = counts.get(_key(value), 0) + 1
+
+    for tier, rel in MOOD_TIER_RELS.items():
+        values = values_by_rel.get(rel)
+        if not values:
+            continue
+        totals[f"tagged:{tier}"] = 1
+        counts = sections.setdefault(f"mood:{tier}", {})
+        for value in values:
+            for mood in split_mood_value(value):
+                counts[_key(mood)] = counts.get(_key(mood), 0) + 1
+
+    for tier, rels in _PAIR_TIER_RELS.items():
+        moods = sorted({str(v) for rel in rels for v in values_by_rel.get(rel, ()) if v is not None})
+        if len(moods) < 2:
+            continue
+        sections[f"pairs:{tier}"] = {
+            _key([moods[i], moods[j]]): 1 for i in range(len(moods) - 1) for j in range(i + 1, len(moods))
+        }
+    return sections
+
+
+def _accumulate(target: dict[str, Sections], library_id: str, sections: Sections, sign: int) -> None:
+    """Add (``sign=1``) or subtract (``sign=-1``) *sections* into ``target[library_id]``."""
+    library = target.setdefault(library_id, {})
+    for name, counters in sections.items():
+        merged = library.setdefault(name, {})
+        for key, count in counters.items():
+            merged[key] = merged.get(key, 0) + sign * count
+
+
+def _prune(sections: Sections) -> Sections:
+    """Drop zero counters and empty sections."""
+    pruned: Sections = {}
+    for name, counters in sections.items():
+        kept = {key: count for key, count in counters.items() if count != 0}
+        if kept:
+            pruned[name] = kept
+    return pruned
+
+
+def _doc_key(doc_id: str) -> str:
+    return doc_id.rsplit("/", 1)[-1]
+
+
+class AnalyticsRollupsOperations:
+    """Incrementally maintained per-library analytics counters."""
+
+    def __init__(self, db: DatabaseLike) -> None:
+        self.db = db
+
+    # ── Maintenance ──────────────────────────────────────────────────
+
+    def refresh_files(self, file_ids: Iterable[str]) -> None:
+        """Recompute the contributions of *file_ids* and apply the differences.
+
+        Called after tags in :data:`ROLLUP_TAG_RELS` or a file's size,
+        duration or library changed.  Files whose contribution is unchanged
+        cost nothing beyond the read.
+
+        Args:
+            file_ids: library_files ``_id`` values.
+
+        """
+        ids = list(dict.fromkeys(file_ids))
+        if not ids:
+            return
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                _FILE_FACTS_QUERY,
+                bind_vars=cast("dict[str, Any]", {"file_ids": ids, "rels": sorted(ROLLUP_TAG_RELS)}),
+            ),
+        )
+        deltas: dict[str, Sections] = {}
+        upserts: list[dict[str, Any]] = []
+        removals: list[str] = []
+        for row in cursor:
+            stored = row.get("stored")
+            library_id = row.get("library_id")
+            sections = (
+                _file_sections(row.get("duration_s"), row.get("size"), row.get("tags") or ()) if library_id else None
+            )
+            if stored and stored.get("library_id") == library_id and stored.get("sections") == sections:
+                continue
+            if stored and stored.get("library_id"):
+                _accumulate(deltas, stored["library_id"], stored.get("sections") or {}, -1)
+            file_key = _doc_key(row["file_id"])
+            if sections is not None and library_id:
+                _accumulate(deltas, library_id, sections, 1)
+                upserts.append({"_key": file_key, "library_id": library_id, "sections": sections})
+            elif stored:
+                removals.append(file_key)
+        cursor.close(ignore_missing=True)
+
+        self._write_contributions(upserts, removals)
+        self._apply_deltas(deltas)
+
+    def refresh_after_tag_write(self, writes: Iterable[tuple[str, str]]) -> None:
+        """Refresh the files of ``(song_id, rel)`` tag writes that touch a rollup rel.
+
+        Tag persistence calls this after every write; writes to other rels
+        (the bulk of ML output tags) return without a query.
+        """
+        self.refresh_files(song_id for song_id, rel in writes if rel in ROLLUP_TAG_RELS)
+
+    def remove_files(self, file_ids: Iterable[str]) -> None:
+        """Withdraw the contributions of files that are being deleted.
+
+        Args:
+            file_ids: library_files ``_id`` values.
+
+        """
+        keys = list(dict.fromkeys(_doc_key(file_id) for file_id in file_ids))
+        if not keys:
+            return
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+                FOR c IN analytics_rollup_files
+                    FILTER c._key IN @keys
+                    REMOVE c IN analytics_rollup_files
+                    RETURN OLD
+                """,
+                bind_vars={"keys": keys},
+            ),
+        )
+        deltas: dict[str, Sections] = {}
+        for stored in cursor:
+            if stored.get("library_id"):
+                _accumulate(deltas, stored["library_id"], stored.get("sections") or {}, -1)
+        cursor.close(ignore_missing=True)
+        self._apply_deltas(deltas)
+
+    def drop_library(self, library_id: str) -> None:
+        """Remove a library's rollup document and every file contribution in it."""
+        self.db.aql.execute(
+            """
+            FOR c IN analytics_rollup_files
+                FILTER c.library_id == @library_id
+                REMOVE c IN analytics_rollup_files
+            """,
+            bind_vars={"library_id": library_id},
+        )
+        self.db.aql.execute(
+            """
+            FOR r IN analytics_rollups
+                FILTER r._key == @key
+                REMOVE r IN analytics_rollups
+            """,
+            bind_vars={"key": _doc_key(library_id)},
+        )
+
+    def rebuild_library(self, library_id: str) -> int:
+        """Recompute every contribution of a library and replace its rollup.
+
+        Used to build a library's rollup the first time and to repair one
+        that drifted (see the consistency check in ``analytics_rollup_comp``).
+        A refresh racing with the rebuild may be lost; the next check repairs it.
+
+        Args:
+            library_id: Library ``_id``.
+
+        Returns:
+            Number of files summed.
+
+        """
+        # Contributions of files that left the library would otherwise linger.
+        self.db.aql.execute(
+            """
+            FOR c IN analytics_rollup_files
+                FILTER c.library_id == @library_id
+                REMOVE c IN analytics_rollup_files
+            """,
+            bind_vars={"library_id": library_id},
+        )
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+                FOR file IN OUTBOUND @library_id library_contains_file
+                    LET tags = (
+                        FOR edge IN song_has_tags
+                            FILTER edge._from == file._id
+                            LET tag = DOCUMENT(edge._to)
+                            FILTER tag != null AND tag.rel IN @rels
+                            RETURN [tag.rel, tag.value]
+                    )
+                    RETURN {
+                        file_id: file._id,
+                        duration_s: file.duration_seconds,
+                        size: file.file_size,
+                        tags: tags
+                    }
+                """,
+                bind_vars=cast("dict[str, Any]", {"library_id": library_id, "rels": sorted(ROLLUP_TAG_RELS)}),
+                batch_size=1000,
+                stream=True,
+            ),
+        )
+        totals: dict[str, Sections] = {}
+        pending: list[dict[str, Any]] = []
+        file_count = 0
+        for row in cursor:
+            sections = _file_sections(row.get("duration_s"), row.get("size"), row.get("tags") or ())
+            _accumulate(totals, library_id, sections, 1)
+            pending.append({"_key": _doc_key(row["file_id"]), "library_id": library_id, "sections": sections})
+            file_count += 1
+            if len(pending) >= _REBUILD_WRITE_BATCH:
+                self._write_contributions(pending, [])
+                pending = []
+        cursor.close(ignore_missing=True)
+        self._write_contributions(pending, [])
+
+        now = now_ms().value
+        self.db.aql.execute(
+            """
+            UPSERT { _key: @key }
+            INSERT { _key: @key, library_id: @library_id, sections: @sections, built_at: @now, updated_at: @now }
+            REPLACE { _key: @key, library_id: @library_id, sections: @sections, built_at: @now, updated_at: @now }
+            IN analytics_rollups
+            OPTIONS { exclusive: true }
+            """,
+            bind_vars=cast(
+                "dict[str, Any]",
+                {
+                    "key": _doc_key(library_id),
+                    "library_id": library_id,
+                    "sections": _prune(totals.get(library_id, {})),
+                    "now": now,
+                },
+            ),
+        )
+        logger.info("[analytics-rollups] Rebuilt rollup for %s from %d file(s)", library_id, file_count)
+        return file_count
+
+    # ── Read ─────────────────────────────────────────────────────────
+
+    def get_rollup(self, library_id: str | None = None) -> LibraryRollup:
+        """Return the counters of one library, or summed over every library.
+
+        One AQL query regardless of library size.  Libraries in scope
+        without a built rollup are listed in ``missing_library_ids`` and
+        contribute nothing.
+
+        Args:
+            library_id: Library ``_id``, or ``None`` for all libraries.
+
+        """
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+                FOR lib IN libraries
+                    FILTER @library_id == null OR lib._id == @library_id
+                    LET rollup = DOCUMENT("analytics_rollups", lib._key)
+                    RETURN { library_id: lib._id, sections: rollup == null ? null : rollup.sections }
+                """,
+                bind_vars={"library_id": library_id},
+            ),
+        )
+        summed: dict[str, Sections] = {}
+        missing: list[str] = []
+        for row in cursor:
+            if row.get("sections") is None:
+                missing.append(row["library_id"])
+            else:
+                _accumulate(summed, "", row["sections"], 1)
+        cursor.close(ignore_missing=True)
+        return _to_rollup(_prune(summed.get("", {})), missing)
+
+    def get_built_library_ids(self) -> list[str]:
+        """Return the ``_id`` of every library with a built rollup document."""
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute("FOR r IN analytics_rollups RETURN r.library_id"),
+        )
+        result = [str(library_id) for library_id in cursor if library_id]
+        cursor.close(ignore_missing=True)
+        return result
+
+    # ── Internal ─────────────────────────────────────────────────────
+
+    def _write_contributions(self, upserts: list[dict[str, Any]], removals: list[str]) -> None:
+        if upserts:
+            self.db.aql.execute(
+                """
+                FOR c IN @docs
+                    UPSERT { _key: c._key }
+                    INSERT c
+                    REPLACE c
+                    IN analytics_rollup_files
+                """,
+                bind_vars={"docs": upserts},
+            )
+        if removals:
+            self.db.aql.execute(
+                """
+                FOR c IN analytics_rollup_files
+                    FILTER c._key IN @keys
+                    REMOVE c IN analytics_rollup_files
+                """,
+                bind_vars={"keys": removals},
+            )
+
+    def _apply_deltas(self, deltas: dict[str, Sections]) -> None:
+        """Add each library's delta to its rollup document (skipped when not built).
+
+        Read-modify-write happens inside one AQL query holding an exclusive
+        lock on ``analytics_rollups``, so concurrent refreshes serialize.
+        """
+        docs = []
+        for library_id, sections in deltas.items():
+            pruned = _prune(sections)
+            if pruned:
+                docs.append({"key": _doc_key(library_id), "sections": pruned})
+        if not docs:
+            return
+        self.db.aql.execute(
+            """
+            FOR d IN @deltas
+                LET cur = DOCUMENT("analytics_rollups", d.key)
+                FILTER cur != null
+                LET changed = MERGE(
+                    FOR name IN ATTRIBUTES(d.sections)
+                        LET old = cur.sections[name] || {}
+                        LET summed = MERGE(old, MERGE(
+                            FOR k IN ATTRIBUTES(d.sections[name])
+                                RETURN { [k]: (old[k] || 0) + d.sections[name][k] }
+                        ))
+                        LET kept = (FOR k IN ATTRIBUTES(summed) FILTER summed[k] != 0 RETURN k)
+                        RETURN { [name]: KEEP(summed, kept) }
+                )
+                UPDATE cur WITH { sections: MERGE(cur.sections, changed), updated_at: @now }
+                IN analytics_rollups
+                OPTIONS { mergeObjects: false, exclusive: true }
+            """,
+            bind_vars=cast("dict[str, Any]", {"deltas": docs, "now": now_ms().value}),
+        )
+
+
+def _to_rollup(sections: Sections, missing: list[str]) -> LibraryRollup:
+    """Decode summed sections into a :class:`LibraryRollup`."""
+    totals = sections.get("totals", {})
+    return LibraryRollup(
+        file_count=int(totals.get("files", 0)),
+        total_duration_s=float(totals.get("duration_s", 0.0)),
+        total_file_size_bytes=int(totals.get("size", 0)),
+        year_counts={json.loads(k): int(v) for k, v in sections.get("year", {}).items()},
+        genre_counts={json.loads(k): int(v) for k, v in sections.get("genre", {}).items()},
+        mood_tagged={tier: int(totals.get(f"tagged:{tier}", 0)) for tier in MOOD_TIER_RELS},
+        mood_balance={
+            tier: {json.loads(k): int(v) for k, v in sections.get(f"mood:{tier}", {}).items()}
+            for tier in MOOD_TIER_RELS
+        },
+        mood_pairs={
+            tier: {_decode_pair(k): int(v) for k, v in sections.get(f"pairs:{tier}", {}).items()}
+            for tier in MOOD_TIER_RELS
+        },
+        missing_library_ids=missing,
+    )
+
+
+def _decode_pair(key: str) -> tuple[str, str]:
+    mood1, mood2 = json.loads(key)
+    return str(mood1), str(mood2)
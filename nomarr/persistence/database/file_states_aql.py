@@ -16,6 +16,7 @@ State axes (positive / negative):
     scanned / not_scanned         — File processed by scanner
     vectors_extracted / not_vectors_extracted — Embedding vectors exist
     errored / not_errored         — Processing error encountered
+    heads_current / heads_stale   — Head outputs match the installed heads
 
 Discovery uses INBOUND traversal on negative vertices for O(1) lookup.
 """
@@ -31,7 +32,7 @@ if TYPE_CHECKING:
 
 _EDGE_COLLECTION = "file_has_state"
 
-# -- State vertex constants (8 axes, 16 vertices) ---------------------
+# -- State vertex constants (9 axes, 18 vertices) ---------------------
 STATE_TAGGED = "file_states/tagged"
 STATE_NOT_TAGGED = "file_states/not_tagged"
 STATE_TOO_SHORT = "file_states/too_short"
@@ -48,6 +49,8 @@ STATE_VECTORS_EXTRACTED = "file_states/vectors_extracted"
 STATE_NOT_VECTORS_EXTRACTED = "file_states/not_vectors_extracted"
 STATE_ERRORED = "file_states/errored"
 STATE_NOT_ERRORED = "file_states/not_errored"
+STATE_HEADS_CURRENT = "file_states/heads_current"
+STATE_HEADS_STALE = "file_states/heads_stale"
 
 ALL_STATE_VERTICES = (
     STATE_TAGGED,
@@ -66,6 +69,8 @@ ALL_STATE_VERTICES = (
     STATE_NOT_VECTORS_EXTRACTED,
     STATE_ERRORED,
     STATE_NOT_ERRORED,
+    STATE_HEADS_CURRENT,
+    STATE_HEADS_STALE,
 )
 
 AXIS_PAIRS: dict[str, tuple[str, str]] = {
@@ -77,6 +82,7 @@ AXIS_PAIRS: dict[str, tuple[str, str]] = {
     "scanned": (STATE_SCANNED, STATE_NOT_SCANNED),
     "vectors_extracted": (STATE_VECTORS_EXTRACTED, STATE_NOT_VECTORS_EXTRACTED),
     "errored": (STATE_ERRORED, STATE_NOT_ERRORED),
+    "heads_current": (STATE_HEADS_CURRENT, STATE_HEADS_STALE),
 }
 
 
@@ -153,6 +159,9 @@ class FileStatesOperations:
     def set_errored(self, file_id: str) -> None:
         self._transition_state(file_id, "errored", to_positive=True)
 
+    def set_heads_current(self, file_id: str) -> None:
+        self._transition_state(file_id, "heads_current", to_positive=True)
+
     # ------------------------------------------------------------------
     # Negative axis setters
     # ------------------------------------------------------------------
@@ -181,6 +190,9 @@ class FileStatesOperations:
     def set_not_errored(self, file_id: str) -> None:
         self._transition_state(file_id, "errored", to_positive=False)
 
+    def set_heads_stale(self, file_id: str) -> None:
+        self._transition_state(file_id, "heads_current", to_positive=False)
+
     # ------------------------------------------------------------------
     # Bulk transitions
     # ------------------------------------------------------------------
@@ -315,6 +327,29 @@ class FileStatesOperations:
         )
         return len(list(cursor))
 
+    def bulk_set_heads_stale(self) -> int:
+        """Transition ALL files from heads_current to heads_stale."""
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(  # type: ignore[union-attr]
+                """
+                FOR e IN file_has_state
+                    FILTER e._to == @heads_current
+                    LET r = (REMOVE e._key IN file_has_state RETURN 1)
+                    INSERT { _from: e._from, _to: @heads_stale } INTO file_has_state
+                    RETURN 1
+                """,
+                bind_vars=cast(
+                    "dict[str, Any]",
+                    {
+                        "heads_current": STATE_HEADS_CURRENT,
+                        "heads_stale": STATE_HEADS_STALE,
+                    },
+                ),
+            ),
+        )
+        return len(list(cursor))
+
     # ------------------------------------------------------------------
     # Initialization
     # ------------------------------------------------------------------
@@ -417,6 +452,102 @@ class FileStatesOperations:
         results = list(cursor)
         return results[0] if results else None
 
+    def discover_next_heads_stale_file(self, exclude_claimed: bool = True) -> dict[str, Any] | None:
+        """Find next tagged file whose head outputs predate the installed heads.
+
+        Uses negative state vertex ``heads_stale`` for discovery and keeps only
+        files that are ``tagged`` (untagged files get every head from full
+        processing).  Excludes ``too_short`` and ``errored`` files.
+
+        Args:
+            exclude_claimed: If True, skip files with active worker claims.
+
+        Returns:
+            File dict or None if no work available.
+        """
+        parts = [
+            "LET too_short_ids = (FOR f IN INBOUND @too_short file_has_state RETURN f._id)",
+            "LET errored_ids = (FOR f IN INBOUND @errored file_has_state RETURN f._id)",
+            "FOR file IN INBOUND @heads_stale file_has_state",
+            "    FILTER file._id NOT IN too_short_ids",
+            "    FILTER file._id NOT IN errored_ids",
+            "    FILTER LENGTH("
+            "FOR e IN file_has_state FILTER e._from == file._id AND e._to == @tagged LIMIT 1 RETURN 1) > 0",
+        ]
+        if exclude_claimed:
+            parts.append(
+                "    FILTER LENGTH("
+                "FOR c IN worker_claims "
+                'FILTER c.file_id == file._id AND c.status == "active" '
+                "RETURN 1) == 0"
+            )
+        parts.extend(["    SORT file._key", "    LIMIT 1", "    RETURN file"])
+
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(  # type: ignore[union-attr]
+                "\n".join(parts),
+                bind_vars=cast(
+                    "dict[str, Any]",
+                    {
+                        "heads_stale": STATE_HEADS_STALE,
+                        "tagged": STATE_TAGGED,
+                        "too_short": STATE_TOO_SHORT,
+                        "errored": STATE_ERRORED,
+                    },
+                ),
+            ),
+        )
+        results = list(cursor)
+        return results[0] if results else None
+
+    def count_heads_stale_files(self) -> int:
+        """Count tagged files in the ``heads_stale`` state.
+
+        Returns:
+            Number of tagged files awaiting head-only reprocessing.
+        """
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(  # type: ignore[union-attr]
+                """
+                RETURN LENGTH(
+                    FOR f IN INBOUND @heads_stale file_has_state
+                        FILTER LENGTH(
+                            FOR e IN file_has_state FILTER e._from == f._id AND e._to == @tagged LIMIT 1 RETURN 1
+                        ) > 0
+                        RETURN 1
+                )
+                """,
+                bind_vars=cast(
+                    "dict[str, Any]",
+                    {"heads_stale": STATE_HEADS_STALE, "tagged": STATE_TAGGED},
+                ),
+            ),
+        )
+        results = list(cursor)
+        return results[0] if results else 0
+
+    def filter_heads_stale_file_ids(self, file_ids: list[str]) -> set[str]:
+        """Return the subset of *file_ids* in the ``heads_stale`` state."""
+        if not file_ids:
+            return set()
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(  # type: ignore[union-attr]
+                """
+                FOR e IN file_has_state
+                    FILTER e._to == @heads_stale AND e._from IN @file_ids
+                    RETURN e._from
+                """,
+                bind_vars=cast(
+                    "dict[str, Any]",
+                    {"heads_stale": STATE_HEADS_STALE, "file_ids": file_ids},
+                ),
+            ),
+        )
+        return set(cursor)
+
     def get_untagged_file_ids(self, library_id: str | None = None, limit: int = 100) -> list[str]:
         """Get IDs of files in the ``not_tagged`` state.
 
@@ -0,0 +1,65 @@
+"""Health history operations for ArangoDB.
+
+health_history collection stores append-only component status snapshots.
+Retention is a TTL index on ``expires_at`` (unix seconds): ArangoDB removes
+expired snapshots itself, so nothing deletes history periodically.
+"""
+
+from typing import TYPE_CHECKING, Any, cast
+
+from nomarr.persistence.arango_client import DatabaseLike
+
+if TYPE_CHECKING:
+    from arango.cursor import Cursor
+
+
+class HealthHistoryOperations:
+    """Operations for the health_history collection (status snapshots)."""
+
+    def __init__(self, db: DatabaseLike) -> None:
+        self.db = db
+        self.collection = db.collection("health_history")
+
+    def insert_snapshots(self, snapshots: list[dict[str, Any]]) -> None:
+        """Insert many snapshots in one query.
+
+        Args:
+            snapshots: Dicts with component_id, status, reason, last_heartbeat,
+                recorded_at (wall ms) and expires_at (unix seconds, TTL field)
+
+        """
+        if not snapshots:
+            return
+        self.db.aql.execute(
+            """
+            FOR snapshot IN @snapshots
+                INSERT snapshot INTO health_history
+            """,
+            bind_vars=cast("dict[str, Any]", {"snapshots": snapshots}),
+        )
+
+    def get_component_history(self, component_id: str, limit: int = 100) -> list[dict[str, Any]]:
+        """Get the most recent snapshots of a component, newest first.
+
+        Args:
+            component_id: Component identifier
+            limit: Maximum snapshots to return
+
+        Returns:
+            Snapshot dicts
+
+        """
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+            FOR snapshot IN health_history
+                FILTER snapshot.component_id == @component_id
+                SORT snapshot.recorded_at DESC
+                LIMIT @limit
+                RETURN UNSET(snapshot, "_id", "_rev")
+            """,
+                bind_vars=cast("dict[str, Any]", {"component_id": component_id, "limit": limit}),
+            ),
+        )
+        return list(cursor)
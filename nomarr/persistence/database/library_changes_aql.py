@@ -0,0 +1,132 @@
+"""Change counter operations for ArangoDB.
+
+library_changes holds one document per *scope* with a counter that only
+grows: a library ``_key`` for writes to that library's files and tags,
+:data:`CALIBRATION_SCOPE` for calibration state, or :data:`TAGS_SCOPE` for
+tag vocabulary changes no library owns (orphan cleanup).  Write paths bump it
+(cascaded through ``parent_db`` like the analytics rollups, from any
+process), and readers compare counters to tell whether a cached response is
+still current without re-running its queries.
+"""
+
+from typing import TYPE_CHECKING, Any, cast
+
+from nomarr.helpers.time_helper import now_ms
+from nomarr.persistence.arango_client import DatabaseLike
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from arango.cursor import Cursor
+
+CALIBRATION_SCOPE = "calibration"
+TAGS_SCOPE = "tags"
+
+_BUMP = """
+    UPSERT { _key: scope }
+    INSERT { _key: scope, version: 1, updated_at: @now }
+    UPDATE { version: OLD.version + 1, updated_at: @now }
+    IN library_changes
+    OPTIONS { exclusive: true }
+    RETURN [NEW._key, NEW.version]
+"""
+
+
+def scope_of(library_id: str) -> str:
+    """Scope of a library given as ``_id`` (``libraries/<key>``) or ``_key``."""
+    return library_id.rpartition("/")[2]
+
+
+class LibraryChangesOperations:
+    """Operations for the library_changes collection (per-scope change counters)."""
+
+    def __init__(self, db: DatabaseLike) -> None:
+        self.db = db
+
+    def bump(self, scopes: "Iterable[str]") -> dict[str, int]:
+        """Increment the counters of *scopes* (created at 1).
+
+        Args:
+            scopes: Library ``_id``/``_key`` values, :data:`CALIBRATION_SCOPE` or :data:`TAGS_SCOPE`
+
+        Returns:
+            New counter of each scope
+
+        """
+        keys = sorted({scope_of(scope) for scope in scopes if scope})
+        if not keys:
+            return {}
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                "FOR scope IN @scopes" + _BUMP,
+                bind_vars=cast("dict[str, Any]", {"scopes": keys, "now": now_ms().value}),
+            ),
+        )
+        return dict(cursor)
+
+    def bump_files(self, file_ids: "Iterable[str]") -> dict[str, int]:
+        """Increment the counters of the libraries owning *file_ids*.
+
+        Call before deleting files: unknown files are ignored.
+
+        Args:
+            file_ids: library_files ``_id`` values
+
+        Returns:
+            New counter of each library touched
+
+        """
+        ids = list(dict.fromkeys(file_ids))
+        if not ids:
+            return {}
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+                FOR scope IN UNIQUE(
+                    FOR file IN DOCUMENT(@file_ids)
+                        FILTER file.library_id != null
+                        RETURN PARSE_IDENTIFIER(file.library_id).key
+                )"""
+                + _BUMP,
+                bind_vars=cast("dict[str, Any]", {"file_ids": ids, "now": now_ms().value}),
+            ),
+        )
+        return dict(cursor)
+
+    def bump_all(self) -> dict[str, int]:
+        """Increment every existing counter, every library's and :data:`TAGS_SCOPE`.
+
+        For bulk clears that touch all libraries at once.
+
+        Returns:
+            New counter of each scope
+
+        """
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+                FOR scope IN UNION_DISTINCT(
+                    (FOR c IN library_changes RETURN c._key),
+                    (FOR l IN libraries RETURN l._key),
+                    [@tags_scope]
+                )"""
+                + _BUMP,
+                bind_vars=cast("dict[str, Any]", {"tags_scope": TAGS_SCOPE, "now": now_ms().value}),
+            ),
+        )
+        return dict(cursor)
+
+    def bump_calibration(self) -> None:
+        """Increment the :data:`CALIBRATION_SCOPE` counter."""
+        self.bump([CALIBRATION_SCOPE])
+
+    def get_versions(self) -> dict[str, int]:
+        """Get every scope's counter."""
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute("FOR c IN library_changes RETURN [c._key, c.version]"),
+        )
+        return dict(cursor)
@@ -139,6 +139,10 @@ class LibraryFilesCrudMixin:
             if last_tagged_at is not None:
                 self.parent_db.file_states.set_tagged(file_id)
 
+            # Size, duration or owning library may have changed
+            self.parent_db.analytics_rollups.refresh_files([file_id])
+            self.parent_db.library_changes.bump_files([file_id])
+
         return file_id
 
     def delete_library_file(self, file_id: str) -> None:
@@ -156,6 +160,11 @@ class LibraryFilesCrudMixin:
         if self.parent_db is not None:
             self.parent_db.segment_scores_stats.delete_by_file_id(file_id)
 
+        # Withdraw the file from its library's analytics rollup (and bump it while the file still exists)
+        if self.parent_db is not None:
+            self.parent_db.analytics_rollups.remove_files([file_id])
+            self.parent_db.library_changes.bump_files([file_id])
+
         # Delete entity edges (referential integrity)
         self.db.aql.execute(
             """
@@ -246,6 +255,8 @@ class LibraryFilesCrudMixin:
         # Initialize file state edges for all upserted files
         if self.parent_db is not None and result:
             self.parent_db.file_states.initialize_file_states_batch(result)
+            self.parent_db.analytics_rollups.refresh_files(result)
+            self.parent_db.library_changes.bump_files(result)
 
         return result
 
@@ -315,6 +326,10 @@ class LibraryFilesCrudMixin:
 
         self.db.aql.execute(aql, bind_vars=bind_vars)
 
+        if self.parent_db is not None:
+            self.parent_db.analytics_rollups.refresh_files([file_id])
+            self.parent_db.library_changes.bump_files([file_id])
+
     def update_file_modified_time(self, file_key: str, modified_time_ms: int) -> None:
         """Update only the modified_time of a library file after a tag write.
 
@@ -355,6 +370,8 @@ class LibraryFilesCrudMixin:
         # Delete vectors from ALL backbones (hot + cold) via centralized orchestration
         if self.parent_db is not None and file_ids:
             self.parent_db.delete_vectors_by_file_ids(file_ids)
+            self.parent_db.analytics_rollups.remove_files(file_ids)
+            self.parent_db.library_changes.bump_files(file_ids)
 
         # Delete segment_scores_stats (derived data — single-pass via collected IDs)
         if file_ids:
@@ -406,7 +423,8 @@ class LibraryFilesCrudMixin:
         Uses edge traversal via ``library_contains_file`` for library filtering.
 
         Removes, in order:
-        1. Track-level embedding vectors (all backbones, hot + cold)
+        1. Track-level embedding vectors (all backbones, hot + cold) and the
+           library's analytics rollup
         2. segment_scores_stats (per-label head stats)
         3. song_has_tags (entity edges)
         4. file_has_state (state edges)
@@ -439,6 +457,8 @@ class LibraryFilesCrudMixin:
         # Delete vectors from ALL backbones (hot + cold)
         if self.parent_db is not None:
             self.parent_db.delete_vectors_by_file_ids(file_ids)
+            self.parent_db.analytics_rollups.drop_library(library_id)
+            self.parent_db.library_changes.bump([library_id])
 
         # Delete segment_scores_stats (derived data)
         self.db.aql.execute(
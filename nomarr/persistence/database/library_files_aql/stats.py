@@ -194,18 +194,25 @@ class LibraryFilesStatsMixin:
         WARNING: This is a cross-collection operation that deletes from:
         - song_has_tags
         - library_files
+        - analytics_rollups and analytics_rollup_files
         """
         # Truncate vectors_track collections first (derived data — per-backbone)
         for coll_info in self.db.collections():  # type: ignore[union-attr]
             coll_name = coll_info["name"]
             if coll_name.startswith("vectors_track__"):
                 self.db.collection(coll_name).truncate()
+        # Truncate analytics rollups (derived data — rebuilt lazily per library)
+        for coll_name in ("analytics_rollups", "analytics_rollup_files"):
+            if self.db.has_collection(coll_name):
+                self.db.collection(coll_name).truncate()
         # Delete segment_scores_stats (derived data)
         self.db.aql.execute("FOR doc IN segment_scores_stats REMOVE doc IN segment_scores_stats")
         # Delete song_has_tags (edge collection)
         self.db.aql.execute("FOR edge IN song_has_tags REMOVE edge IN song_has_tags")
         # Delete library_files
         self.db.aql.execute("FOR file IN library_files REMOVE file IN library_files")
+        if self.parent_db is not None:
+            self.parent_db.library_changes.bump_all()
 
     def search_files_by_tag(
         self,
@@ -41,6 +41,35 @@ class MetaOperations:
         )
         return next(cursor, None)
 
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        """Get the values of several meta keys in one query.
+
+        Args:
+            keys: Configuration keys
+
+        Returns:
+            Dict mapping each key that exists to its value (missing keys are omitted)
+
+        """
+        if not keys:
+            return {}
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+            FOR meta IN meta
+                FILTER meta.key IN @keys
+                SORT meta._key
+                RETURN {key: meta.key, value: meta.value}
+            """,
+                bind_vars=cast("dict[str, Any]", {"keys": keys}),
+            ),
+        )
+        result: dict[str, str] = {}
+        for row in cursor:
+            result.setdefault(row["key"], row["value"])
+        return result
+
     def set(self, key: str, value: str) -> None:
         """Set a meta key-value pair (upsert).
 
@@ -0,0 +1,192 @@
+"""Navidrome album sync-marker operations for ArangoDB.
+
+Manages the ``navidrome_albums`` document collection: one document per
+Navidrome album recording the change marker seen by the last sync and the
+album's song IDs.  Repeat syncs fetch only albums whose marker changed, and
+orphan tracks are found server-side as tracks no album lists any more.
+
+Collection schema:
+    navidrome_albums: {_key: album_id, marker: str, song_ids: list[str],
+                       resolved: int}
+
+``marker`` is empty for albums with songs that did not resolve to library
+files, so they are fetched again until the library catches up.  A marker is
+also cleared when a song's ``has_nd_id`` target no longer exists (the file was
+removed and rescanned under a new ``_id``).  The array index on
+``song_ids[*]`` serves the orphan lookup.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
+
+from nomarr.persistence.arango_client import DatabaseLike
+
+if TYPE_CHECKING:
+    from arango.cursor import Cursor
+
+_ALBUMS = "navidrome_albums"
+_TRACKS = "navidrome_tracks"
+_HAS_ND_ID = "has_nd_id"
+
+
+class NavidromeAlbumsOperations:
+    """CRUD operations for navidrome_albums sync-marker documents."""
+
+    def __init__(self, db: DatabaseLike) -> None:
+        self.db = db
+
+    # ── Read ─────────────────────────────────────────────────────────
+
+    def get_markers(self) -> dict[str, str]:
+        """Return album ID → change marker for every recorded album."""
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+                FOR a IN @@albums
+                    RETURN [a._key, a.marker]
+                """,
+                bind_vars={"@albums": _ALBUMS},
+            ),
+        )
+        result = {str(key): str(marker or "") for key, marker in cursor}
+        cursor.close(ignore_missing=True)
+        return result
+
+    def get_totals(self) -> dict[str, int]:
+        """Return ``songs`` and ``resolved`` summed over every recorded album."""
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+                FOR a IN @@albums
+                    COLLECT AGGREGATE songs = SUM(LENGTH(a.song_ids)), resolved = SUM(a.resolved)
+                    RETURN { songs: songs, resolved: resolved }
+                """,
+                bind_vars={"@albums": _ALBUMS},
+            ),
+        )
+        row = next(cursor, None) or {}
+        cursor.close(ignore_missing=True)
+        return {"songs": int(row.get("songs") or 0), "resolved": int(row.get("resolved") or 0)}
+
+    def get_orphan_track_keys(self) -> list[str]:
+        """Return keys of navidrome_tracks that no recorded album lists.
+
+        One server-side query; each track probes the ``song_ids[*]`` array
+        index instead of shipping every track key to the client.
+        """
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+                FOR t IN @@tracks
+                    LET listed = FIRST(
+                        FOR a IN @@albums
+                            FILTER t._key IN a.song_ids[*]
+                            LIMIT 1
+                            RETURN true
+                    )
+                    FILTER listed == null
+                    RETURN t._key
+                """,
+                bind_vars={"@tracks": _TRACKS, "@albums": _ALBUMS},
+            ),
+        )
+        result: list[str] = list(cursor)  # type: ignore[arg-type]
+        cursor.close(ignore_missing=True)
+        return result
+
+    # ── Write ────────────────────────────────────────────────────────
+
+    def clear_unlinked_markers(self) -> list[str]:
+        """Clear the marker of every album with a song that has no live file link.
+
+        One server-side query: each song of an album with a marker probes the
+        ``has_nd_id`` edge index and the primary index of the linked file.
+        Cleared albums are fetched (and re-linked) by the next delta sync.
+
+        Returns:
+            IDs of the albums whose marker was cleared.
+        """
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+                FOR a IN @@albums
+                    FILTER a.marker != ""
+                    LET unlinked = FIRST(
+                        FOR nd_id IN a.song_ids
+                            LET live = FIRST(
+                                FOR link IN @@has_nd_id
+                                    FILTER link._from == CONCAT(@tracks_prefix, nd_id)
+                                    FILTER DOCUMENT(link._to) != null
+                                    LIMIT 1
+                                    RETURN true
+                            )
+                            FILTER live == null
+                            LIMIT 1
+                            RETURN true
+                    )
+                    FILTER unlinked != null
+                    UPDATE a WITH { marker: "" } IN @@albums
+                    RETURN a._key
+                """,
+                bind_vars={"@albums": _ALBUMS, "@has_nd_id": _HAS_ND_ID, "tracks_prefix": f"{_TRACKS}/"},
+            ),
+        )
+        result: list[str] = list(cursor)  # type: ignore[arg-type]
+        cursor.close(ignore_missing=True)
+        return result
+
+    def bulk_upsert_albums(self, albums: list[dict[str, Any]]) -> int:
+        """Insert or replace album documents.
+
+        Each dict must contain ``_key``, ``marker``, ``song_ids`` and
+        ``resolved``.
+
+        Returns:
+            Number of documents written.
+        """
+        if not albums:
+            return 0
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+                FOR doc IN @docs
+                    UPSERT { _key: doc._key }
+                    INSERT doc
+                    REPLACE doc
+                    IN @@albums
+                """,
+                bind_vars={"docs": albums, "@albums": _ALBUMS},  # type: ignore[dict-item]
+            ),
+        )
+        cursor.close(ignore_missing=True)
+        return len(albums)
+
+    def delete_albums(self, album_ids: list[str]) -> int:
+        """Delete the documents of albums no longer listed by Navidrome.
+
+        Returns:
+            Number of documents removed.
+        """
+        if not album_ids:
+            return 0
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+                FOR album_id IN @album_ids
+                    REMOVE { _key: album_id } IN @@albums
+                    OPTIONS { ignoreErrors: true }
+                    RETURN 1
+                """,
+                bind_vars={"album_ids": album_ids, "@albums": _ALBUMS},  # type: ignore[dict-item]
+            ),
+        )
+        count = sum(1 for _ in cursor)
+        cursor.close(ignore_missing=True)
+        return count
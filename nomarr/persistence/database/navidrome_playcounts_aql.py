@@ -107,7 +107,7 @@ class NavidromePlaycountsOperations:
         user_id: str,
         nd_id: str,
         timestamp_ms: int,
-    ) -> None:
+    ) -> int:
         """Atomically increment play count by moving edge to next bucket.
 
         Finds the current bucket for (user, track).  If found, deletes the old
@@ -118,6 +118,9 @@ class NavidromePlaycountsOperations:
             user_id: Navidrome user identifier.
             nd_id: Navidrome track identifier.
             timestamp_ms: Epoch-millisecond timestamp of the scrobble.
+
+        Returns:
+            The track's play count for *user_id* after the increment.
         """
         track_id = f"{_TRACKS}/{nd_id}"
 
@@ -164,7 +167,9 @@ class NavidromePlaycountsOperations:
                 "@has_plays": _HAS_PLAYS,
             },
         )
+        row = next(cursor, None)
         cursor.close(ignore_missing=True)
+        return int(row["new_count"]) if row else 1
 
     # ── Bulk sync operations ─────────────────────────────────────────
 
@@ -277,6 +282,101 @@ class NavidromePlaycountsOperations:
         )
         return len(edges)
 
+    def replace_plays_for_tracks(
+        self,
+        user_id: str,
+        nd_ids: list[str],
+        plays: list[dict[str, Any]],
+    ) -> int:
+        """Replace a user's play data for a subset of tracks (delta sync).
+
+        Removes the user's ``has_plays`` edges from the tracks in *nd_ids*,
+        inserts *plays* (same dict shape as :meth:`bulk_upsert_plays`), and
+        drops the user's buckets left without edges.  Play data of every
+        other track is untouched.
+
+        Args:
+            user_id: Navidrome user identifier.
+            nd_ids: Tracks whose play data is replaced.
+            plays: New play data; every ``nd_id`` must be in *nd_ids*.
+
+        Returns:
+            Number of edges inserted.
+        """
+        if not nd_ids:
+            return 0
+
+        cursor: Cursor = self.db.aql.execute(  # type: ignore[union-attr, assignment]
+            """
+            FOR nd_id IN @nd_ids
+                FOR e IN @@has_plays
+                    FILTER e._from == CONCAT(@tracks_prefix, nd_id)
+                    FILTER DOCUMENT(e._to).userid == @user_id
+                    REMOVE e IN @@has_plays
+            """,
+            bind_vars={
+                "nd_ids": nd_ids,  # type: ignore[dict-item]
+                "user_id": user_id,
+                "tracks_prefix": f"{_TRACKS}/",
+                "@has_plays": _HAS_PLAYS,
+            },
+        )
+        cursor.close(ignore_missing=True)
+
+        buckets: dict[str, dict[str, Any]] = {}
+        edges: list[dict[str, Any]] = []
+        for p in plays:
+            bkey = _bucket_key(p["playcount"], user_id)
+            buckets.setdefault(bkey, {"_key": bkey, "playcount": p["playcount"], "userid": user_id})
+            edges.append(
+                {
+                    "_from": f"{_TRACKS}/{p['nd_id']}",
+                    "_to": f"{_PLAYCOUNTS}/{bkey}",
+                    "last_played": p["last_played"],
+                }
+            )
+        if edges:
+            cursor = self.db.aql.execute(  # type: ignore[union-attr, assignment]
+                """
+                FOR b IN @buckets
+                    UPSERT { _key: b._key }
+                    INSERT b
+                    UPDATE {}
+                    IN @@playcounts
+                """,
+                bind_vars={"buckets": list(buckets.values()), "@playcounts": _PLAYCOUNTS},  # type: ignore[dict-item]
+            )
+            cursor.close(ignore_missing=True)
+            cursor = self.db.aql.execute(  # type: ignore[union-attr, assignment]
+                """
+                FOR e IN @edges
+                    INSERT e IN @@has_plays
+                """,
+                bind_vars={"edges": edges, "@has_plays": _HAS_PLAYS},  # type: ignore[dict-item]
+            )
+            cursor.close(ignore_missing=True)
+
+        # Buckets whose last track moved away
+        cursor = self.db.aql.execute(  # type: ignore[union-attr, assignment]
+            """
+            FOR bucket IN @@playcounts
+                FILTER bucket.userid == @user_id
+                LET used = FIRST(FOR e IN @@has_plays FILTER e._to == bucket._id LIMIT 1 RETURN true)
+                FILTER used == null
+                REMOVE bucket IN @@playcounts
+            """,
+            bind_vars={"user_id": user_id, "@playcounts": _PLAYCOUNTS, "@has_plays": _HAS_PLAYS},
+        )
+        cursor.close(ignore_missing=True)
+
+        logger.debug(
+            "replace_plays_for_tracks: user=%s tracks=%d edges=%d",
+            user_id,
+            len(nd_ids),
+            len(edges),
+        )
+        return len(edges)
+
     # ── Graph traversal ─────────────────────────────────────────────
 
     def get_top_plays(
@@ -336,3 +436,23 @@ class NavidromePlaycountsOperations:
         result: list[TrackPlayData] = list(cursor)  # type: ignore[arg-type]
         cursor.close(ignore_missing=True)
         return result
+
+    def list_user_ids(self) -> list[str]:
+        """List every user with play data.
+
+        Served from the ``[userid, playcount]`` index on bucket vertices.
+
+        Returns:
+            Distinct Navidrome user identifiers, sorted.
+        """
+        cursor: Cursor = self.db.aql.execute(  # type: ignore[union-attr, assignment]
+            """
+            FOR bucket IN @@playcounts
+                COLLECT user_id = bucket.userid
+                RETURN user_id
+            """,
+            bind_vars={"@playcounts": _PLAYCOUNTS},
+        )
+        result: list[str] = list(cursor)  # type: ignore[arg-type]
+        cursor.close(ignore_missing=True)
+        return result
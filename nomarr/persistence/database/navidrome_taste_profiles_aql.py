@@ -0,0 +1,239 @@
+"""Navidrome taste-profile operations for ArangoDB.
+
+Manages the ``navidrome_taste_profiles`` document collection: one persisted
+taste profile per (user, backbone, library), stored as a recency-decayed
+running sum of track embeddings so scrobbles can update it in place.
+
+Collection schema:
+    navidrome_taste_profiles: {_key: "{userid}__{backbone_id}__{library_key}",
+                               userid: str, backbone_id: str, library_key: str,
+                               vector_sum: list[float], weight_sum: float,
+                               ref_ms: int, half_life_days: float, top_n: int,
+                               track_count: int, play_count: int,
+                               seeded_at_ms: int, updated_at_ms: int}
+
+``vector_sum`` and ``weight_sum`` are decayed to ``ref_ms``.  Decay scales
+every term equally, so the profile direction is read without re-decaying.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, cast
+
+from nomarr.persistence.arango_client import DatabaseLike
+
+if TYPE_CHECKING:
+    from arango.cursor import Cursor
+
+logger = logging.getLogger(__name__)
+
+_PROFILES = "navidrome_taste_profiles"
+
+
+def _profile_key(user_id: str, backbone_id: str, library_key: str) -> str:
+    """Build the ``_key`` for a taste-profile document."""
+    return f"{user_id}__{backbone_id}__{library_key}"
+
+
+class NavidromeTasteProfilesOperations:
+    """CRUD operations for persisted navidrome_taste_profiles documents."""
+
+    def __init__(self, db: DatabaseLike) -> None:
+        self.db = db
+
+    # ── Read ─────────────────────────────────────────────────────────
+
+    def get_profile(self, user_id: str, backbone_id: str, library_key: str) -> dict[str, Any] | None:
+        """Get the stored profile for (user, backbone, library).
+
+        Args:
+            user_id: Navidrome user identifier.
+            backbone_id: Backbone identifier.
+            library_key: ArangoDB ``_key`` of the library document.
+
+        Returns:
+            Profile document, or ``None`` if none has been seeded.
+        """
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                "RETURN DOCUMENT(@@profiles, @key)",
+                bind_vars={"@profiles": _PROFILES, "key": _profile_key(user_id, backbone_id, library_key)},
+            ),
+        )
+        return cast("dict[str, Any] | None", next(cursor, None))
+
+    def get_profiles(self, backbone_id: str, library_key: str) -> dict[str, dict[str, Any]]:
+        """Get every stored profile for a backbone+library in one query.
+
+        Returns:
+            Mapping of user ID → profile document.
+        """
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+                FOR p IN @@profiles
+                    FILTER p.backbone_id == @backbone_id AND p.library_key == @library_key
+                    RETURN p
+                """,
+                bind_vars={"@profiles": _PROFILES, "backbone_id": backbone_id, "library_key": library_key},
+            ),
+        )
+        return {doc["userid"]: doc for doc in cursor}
+
+    def list_user_profiles(self, user_id: str) -> list[dict[str, Any]]:
+        """List (key, backbone, library) of every profile stored for *user_id*.
+
+        Vectors are not returned; callers only need to know which profiles
+        a scrobble should update.
+        """
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+                FOR p IN @@profiles
+                    FILTER p.userid == @user_id
+                    RETURN { _key: p._key, backbone_id: p.backbone_id, library_key: p.library_key }
+                """,
+                bind_vars={"@profiles": _PROFILES, "user_id": user_id},
+            ),
+        )
+        return list(cursor)
+
+    # ── Write ────────────────────────────────────────────────────────
+
+    def upsert_profile(
+        self,
+        user_id: str,
+        backbone_id: str,
+        library_key: str,
+        *,
+        vector_sum: list[float],
+        weight_sum: float,
+        ref_ms: int,
+        half_life_days: float,
+        top_n: int,
+        track_count: int,
+    ) -> None:
+        """Replace the stored profile with a freshly computed (seeded) one.
+
+        Args:
+            user_id: Navidrome user identifier.
+            backbone_id: Backbone identifier.
+            library_key: ArangoDB ``_key`` of the library document.
+            vector_sum: Weighted embedding sum, decayed to *ref_ms*.
+            weight_sum: Sum of weights, decayed to *ref_ms*.
+            ref_ms: Epoch-millisecond reference time of the sums.
+            half_life_days: Decay half-life the sums were built with.
+            top_n: Top-N play limit the seed was computed with.
+            track_count: Number of tracks in the seed.
+        """
+        doc = {
+            "_key": _profile_key(user_id, backbone_id, library_key),
+            "userid": user_id,
+            "backbone_id": backbone_id,
+            "library_key": library_key,
+            "vector_sum": vector_sum,
+            "weight_sum": weight_sum,
+            "ref_ms": ref_ms,
+            "half_life_days": half_life_days,
+            "top_n": top_n,
+            "track_count": track_count,
+            "play_count": 0,
+            "seeded_at_ms": ref_ms,
+            "updated_at_ms": ref_ms,
+        }
+        cursor: Cursor = self.db.aql.execute(  # type: ignore[union-attr, assignment]
+            """
+            UPSERT { _key: @doc._key }
+            INSERT @doc
+            REPLACE @doc
+            IN @@profiles
+            """,
+            bind_vars={"doc": doc, "@profiles": _PROFILES},  # type: ignore[dict-item]
+        )
+        cursor.close(ignore_missing=True)
+
+    def apply_play(self, key: str, vector: list[float], weight: float, timestamp_ms: int) -> bool:
+        """Fold one play into a stored profile atomically.
+
+        Runs server-side so the profile vector never crosses the wire and
+        concurrent scrobbles cannot lose updates::
+
+            decay      = exp(-λ · (t - ref_ms))          when t > ref_ms
+            vector_sum = vector_sum · decay + w · vector
+            weight_sum = weight_sum · decay + w
+
+        Plays older than ``ref_ms`` (out-of-order scrobbles) are decayed
+        into the existing reference time instead.  λ is derived from the
+        profile's own ``half_life_days``.
+
+        Args:
+            key: Profile ``_key``.
+            vector: Embedding of the played track.
+            weight: Undecayed weight of this play.
+            timestamp_ms: Epoch-millisecond timestamp of the play.
+
+        Returns:
+            ``True`` if a profile with matching dimension was updated.
+        """
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+                LET doc = DOCUMENT(@@profiles, @key)
+                FILTER doc != null AND LENGTH(doc.vector_sum) == LENGTH(@vector)
+                LET lambda_ms = LOG(2) / (doc.half_life_days * 86400000)
+                LET dt = @timestamp_ms - doc.ref_ms
+                LET decay = dt > 0 ? EXP(-lambda_ms * dt) : 1
+                LET w = dt > 0 ? @weight : @weight * EXP(lambda_ms * dt)
+                UPDATE doc WITH {
+                    vector_sum: (
+                        FOR i IN 0..LENGTH(@vector) - 1
+                            RETURN doc.vector_sum[i] * decay + w * @vector[i]
+                    ),
+                    weight_sum: doc.weight_sum * decay + w,
+                    ref_ms: MAX([doc.ref_ms, @timestamp_ms]),
+                    play_count: doc.play_count + 1,
+                    updated_at_ms: MAX([doc.updated_at_ms, @timestamp_ms])
+                } IN @@profiles
+                RETURN 1
+                """,
+                bind_vars=cast(
+                    "dict[str, Any]",
+                    {
+                        "@profiles": _PROFILES,
+                        "key": key,
+                        "vector": vector,
+                        "weight": weight,
+                        "timestamp_ms": timestamp_ms,
+                    },
+                ),
+            ),
+        )
+        return next(cursor, None) is not None
+
+    def delete_user_profiles(self, user_id: str) -> int:
+        """Delete every stored profile for *user_id*.
+
+        Called when a full sync rebuilds the user's play data, so the next
+        generation reseeds from the authoritative play counts.
+
+        Returns:
+            Number of profiles removed.
+        """
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(
+                """
+                FOR p IN @@profiles
+                    FILTER p.userid == @user_id
+                    REMOVE p IN @@profiles
+                    RETURN 1
+                """,
+                bind_vars={"@profiles": _PROFILES, "user_id": user_id},
+            ),
+        )
+        return len(list(cursor))
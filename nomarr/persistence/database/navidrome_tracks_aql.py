@@ -178,6 +178,33 @@ class NavidromeTracksOperations:
         cursor.close(ignore_missing=True)
         return len(mappings)
 
+    def prune_dead_file_links(self, nd_ids: list[str]) -> int:
+        """Remove *nd_ids*' edges whose ``library_files`` target no longer exists.
+
+        A removed and rescanned file gets a new ``_id``; its old edge would
+        otherwise keep resolving the track to the deleted document.
+
+        Returns:
+            Number of edges removed.
+        """
+        if not nd_ids:
+            return 0
+
+        query = """
+        FOR edge IN @@collection
+            FILTER edge._from IN @from_ids
+            FILTER DOCUMENT(edge._to) == null
+            REMOVE edge IN @@collection
+            RETURN 1
+        """
+        cursor: Cursor = self.db.aql.execute(  # type: ignore[union-attr, assignment]
+            query,
+            bind_vars={"from_ids": [f"{_TRACKS}/{nd_id}" for nd_id in nd_ids], "@collection": _HAS_ND_ID},
+        )
+        count = sum(1 for _ in cursor)
+        cursor.close(ignore_missing=True)
+        return count
+
     # ── Resolution queries ───────────────────────────────────────────
 
     def resolve_nd_to_file(self, nd_id: str) -> str | None:
@@ -42,6 +42,7 @@ if TYPE_CHECKING:
     from arango.database import StandardDatabase
 
     from nomarr.persistence.arango_client import SafeDatabase
+    from nomarr.persistence.db import Database
 
 
 class TagOperations(
@@ -55,9 +56,10 @@ class TagOperations(
 ):
     """Operations for the tags collection."""
 
-    def __init__(self, db: StandardDatabase | SafeDatabase) -> None:
+    def __init__(self, db: StandardDatabase | SafeDatabase, parent_db: Database | None = None) -> None:
         self.db = db
         self.collection = db.collection("tags")
+        self.parent_db = parent_db
 
 
 __all__ = ["TagOperations"]
@@ -5,9 +5,13 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any, cast
 
+from nomarr.persistence.database.library_changes_aql import TAGS_SCOPE
+
 if TYPE_CHECKING:
     from arango.cursor import Cursor
 
+    from nomarr.persistence.db import Database
+
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +21,7 @@ class TagCleanupMixin:
 
     db: Any
     collection: Any
+    parent_db: Database | None
 
     def cleanup_orphaned_tags(self) -> int:
         """Delete orphaned tags and their outbound edges atomically.
@@ -74,7 +79,11 @@ class TagCleanupMixin:
         """
         cursor = cast("Cursor", self.db.aql.execute(query))
         result = list(cursor)
-        return result[0] if result else 0
+        deleted = result[0] if result else 0
+        if deleted and self.parent_db is not None:
+            # Orphans belong to no library; tag listings still show them
+            self.parent_db.library_changes.bump([TAGS_SCOPE])
+        return deleted
 
     def get_orphaned_tag_count(self) -> int:
         """Count tags with no edges (for reporting before cleanup).
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Any, cast
 if TYPE_CHECKING:
     from arango.cursor import Cursor
 
+    from nomarr.persistence.db import Database
+
 from nomarr.helpers.dto.tags_dto import TagValue
 
 logger = logging.getLogger(__name__)
@@ -18,6 +20,7 @@ class TagCrudMixin:
 
     db: Any
     collection: Any
+    parent_db: Database | None
 
     def find_or_create_tag(self, rel: str, value: TagValue) -> str:
         """Find or create a tag vertex. Returns tag _id.
@@ -104,6 +107,10 @@ class TagCrudMixin:
                 bind_vars=cast("dict[str, Any]", {"song_id": song_id, "rel": rel, "values": values}),
             )
 
+        if self.parent_db is not None:
+            self.parent_db.analytics_rollups.refresh_after_tag_write([(song_id, rel)])
+            self.parent_db.library_changes.bump_files([song_id])
+
     def set_song_tags_batch(
         self,
         entries: list[dict[str, Any]],
@@ -144,9 +151,15 @@ class TagCrudMixin:
 
         # Filter to entries that have values (need vertex + edge creation)
         with_values = [e for e in bind_entries if e["values"]]
-        if not with_values:
-            return
+        if with_values:
+            self._create_song_tag_edges(with_values)
 
+        if self.parent_db is not None:
+            self.parent_db.analytics_rollups.refresh_after_tag_write((e["song_id"], e["rel"]) for e in bind_entries)
+            self.parent_db.library_changes.bump_files(e["song_id"] for e in bind_entries)
+
+    def _create_song_tag_edges(self, with_values: list[dict[str, Any]]) -> None:
+        """UPSERT tag vertices and song edges for the non-empty batch entries."""
         # 2) UPSERT tag vertices for all (rel, value) pairs
         self.db.aql.execute(
             """
@@ -247,6 +260,10 @@ class TagCrudMixin:
         """
         self.db.aql.execute(edge_query, bind_vars=cast("dict[str, Any]", {"song_id": song_id, "tag_id": tag_id}))
 
+        if self.parent_db is not None:
+            self.parent_db.analytics_rollups.refresh_after_tag_write([(song_id, rel)])
+            self.parent_db.library_changes.bump_files([song_id])
+
     def delete_song_tags(self, song_id: str) -> None:
         """Delete all tag edges for a song (on file delete).
 
@@ -260,3 +277,7 @@ class TagCrudMixin:
             REMOVE edge IN song_has_tags
         """
         self.db.aql.execute(query, bind_vars=cast("dict[str, Any]", {"song_id": song_id}))
+
+        if self.parent_db is not None:
+            self.parent_db.analytics_rollups.refresh_files([song_id])
+            self.parent_db.library_changes.bump_files([song_id])
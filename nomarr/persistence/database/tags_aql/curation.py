@@ -10,6 +10,8 @@ from nomarr.helpers.dto.tag_curation_dto import RelinkResult
 if TYPE_CHECKING:
     from arango.cursor import Cursor
 
+    from nomarr.persistence.db import Database
+
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,7 @@ class TagCurationMixin:
 
     db: Any
     collection: Any
+    parent_db: Database | None
     cleanup_orphaned_tags: Any
 
     def relink_tag_edges(
@@ -94,7 +97,8 @@ class TagCurationMixin:
         )
         RETURN {
             new_edges: SUM(moved),
-            removed_edges: LENGTH(removed)
+            removed_edges: LENGTH(removed),
+            rel: DOCUMENT(@target_tag_id).rel
         }
         """
         relink_bind: dict[str, Any] = {
@@ -109,6 +113,13 @@ class TagCurationMixin:
         moved = int(result["new_edges"])
         skipped = len(edges_to_move) - moved
 
+        # Rename/merge/split relink within one rel; counts keyed by value change.
+        if self.parent_db is not None:
+            self.parent_db.analytics_rollups.refresh_after_tag_write(
+                (e["_from"], result.get("rel")) for e in edges_to_move
+            )
+            self.parent_db.library_changes.bump_files(e["_from"] for e in edges_to_move)
+
         # Step 3: Check if source tag is orphaned and clean up
         count_query = """
         RETURN LENGTH(
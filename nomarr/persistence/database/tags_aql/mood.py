@@ -11,6 +11,21 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def split_mood_value(value: Any) -> list[str]:
+    """Return the moods of one mood tag value, splitting tuple representations.
+
+    A value such as ``"('party-like', 'relaxed')"`` yields each mood; any other
+    value is returned as a single mood string.
+    """
+    mood_value = str(value)
+    # E.g., "('party-like', 'relaxed', 'sombre')" or "('happy',)"
+    if mood_value.startswith("(") and mood_value.endswith(")"):
+        # Strip whitespace and quotes (both single and double), skip empty parts
+        parts = (part.strip().strip("'\"") for part in mood_value[1:-1].split(","))
+        return [part for part in parts if part]
+    return [mood_value]
+
+
 class TagMoodMixin:
     """Mood-specific operations for tags."""
 
@@ -21,26 +36,47 @@ class TagMoodMixin:
         """Forward declaration for cross-mixin call."""
         raise NotImplementedError("get_library_stats must be provided by TagStatsMixin")
 
-    def get_mood_and_tier_tags_for_correlation(self) -> dict[str, Any]:
+    def get_mood_and_tier_tags_for_correlation(self, library_id: str | None = None) -> dict[str, Any]:
         """Get mood and tier tag data for correlation analysis.
 
+        Args:
+            library_id: Optional library _id to filter by.
+
         Returns:
             Dict with keys: mood_tag_rows (list of tuples), tier_tag_keys (list), tier_tag_rows (dict)
 
         """
+        library_files = ""
+        library_filter = ""
+        library_vars: dict[str, Any] = {}
+        if library_id:
+            library_files = """
+            LET library_file_ids = (
+                FOR file IN OUTBOUND @library_id library_contains_file
+                    RETURN file._id
+            )
+            """
+            library_filter = "FILTER edge._from IN library_file_ids"
+            library_vars["library_id"] = library_id
+
         # Get mood tags (nom:mood-strict, nom:mood-regular, nom:mood-loose)
         mood_tag_rels = ["nom:mood-strict", "nom:mood-regular", "nom:mood-loose"]
         mood_tag_rows: list[tuple[str, Any]] = []
 
         for rel in mood_tag_rels:
-            query = """
+            query = f"""
+            {library_files}
             FOR tag IN tags
                 FILTER tag.rel == @rel
                 FOR edge IN song_has_tags
                     FILTER edge._to == tag._id
+                    {library_filter}
                     RETURN [edge._from, tag.value]
             """
-            cursor = cast("Cursor", self.db.aql.execute(query, bind_vars=cast("dict[str, Any]", {"rel": rel})))
+            cursor = cast(
+                "Cursor",
+                self.db.aql.execute(query, bind_vars=cast("dict[str, Any]", {"rel": rel, **library_vars})),
+            )
             mood_tag_rows.extend([tuple(row) for row in cursor])
 
         # Get all *_tier tag rels (nomarr only)
@@ -56,16 +92,18 @@ class TagMoodMixin:
         # Get tier tag data for each rel
         tier_tag_rows: dict[str, list[tuple[str, Any]]] = {}
         for tier_rel in tier_tag_keys:
-            query = """
+            query = f"""
+            {library_files}
             FOR tag IN tags
                 FILTER tag.rel == @tier_rel
                 FOR edge IN song_has_tags
                     FILTER edge._to == tag._id
+                    {library_filter}
                     RETURN [edge._from, tag.value]
             """
             cursor = cast(
                 "Cursor",
-                self.db.aql.execute(query, bind_vars=cast("dict[str, Any]", {"tier_rel": tier_rel})),
+                self.db.aql.execute(query, bind_vars=cast("dict[str, Any]", {"tier_rel": tier_rel, **library_vars})),
             )
             tier_tag_rows[tier_rel] = [tuple(row) for row in cursor]
 
@@ -245,23 +283,8 @@ class TagMoodMixin:
             # Collect and split multi-value tuples
             mood_counts: dict[str, int] = {}
             for row in cursor:
-                mood_value = str(row["mood"])
-
-                # Check if the mood value is a tuple representation
-                # E.g., "('party-like', 'relaxed', 'sombre')" or "('happy',)"
-                if mood_value.startswith("(") and mood_value.endswith(")"):
-                    # Parse tuple string: remove parens, split by comma, strip quotes and whitespace
-                    inner = mood_value[1:-1]  # Remove outer parens
-                    if inner:  # Non-empty tuple
-                        parts = inner.split(",")
-                        for part in parts:
-                            # Strip whitespace and quotes (both single and double)
-                            cleaned = part.strip().strip("'\"")
-                            if cleaned:  # Skip empty strings
-                                mood_counts[cleaned] = mood_counts.get(cleaned, 0) + 1
-                else:
-                    # Single value - count it directly
-                    mood_counts[mood_value] = mood_counts.get(mood_value, 0) + 1
+                for mood in split_mood_value(row["mood"]):
+                    mood_counts[mood] = mood_counts.get(mood, 0) + 1
 
             # Convert to list of dicts and sort by count descending
             result[tier_name] = [
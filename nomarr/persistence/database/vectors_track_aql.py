@@ -7,6 +7,7 @@ Documents store a pooled track-level embedding vector per file, keyed by
 
 import hashlib
 import math
+from collections.abc import Iterator
 from typing import Any, cast
 
 from nomarr.helpers.time_helper import now_ms
@@ -183,6 +184,36 @@ class VectorsTrackHotOperations:
         )
         return list(cursor)  # type: ignore[arg-type]
 
+    def get_vectors_since(self, since_ms: int) -> list[dict[str, Any]]:
+        """Get normalized vectors upserted into hot collection at or after *since_ms*.
+
+        Used by the in-process local vector index to pick up freshly processed
+        tracks without waiting for promotion.  Only the fields needed for
+        search are returned.
+
+        Args:
+            since_ms: Wall-clock epoch milliseconds watermark (inclusive).
+
+        Returns:
+            List of dicts with keys ``file_id``, ``vector_n`` and ``created_at``.
+            Documents whose file edge is missing are skipped.
+
+        """
+        cursor = self.db.aql.execute(
+            f"""
+            FOR doc IN {self.collection_name}
+                FILTER doc.created_at >= @since_ms
+                LET file_id = FIRST(
+                    FOR f IN INBOUND doc file_has_vectors
+                        RETURN f._id
+                )
+                FILTER file_id != null
+                RETURN {{ file_id: file_id, vector_n: doc.vector_n, created_at: doc.created_at }}
+            """,
+            bind_vars=cast("dict[str, Any]", {"since_ms": since_ms}),
+        )
+        return list(cursor)  # type: ignore[arg-type]
+
     # ------------------------------------------------------------------
     # Delete
     # ------------------------------------------------------------------
@@ -382,6 +413,36 @@ class VectorsTrackColdOperations:
         )
         return list(cursor)  # type: ignore[arg-type]
 
+    def iter_search_vectors(self, batch_size: int = 1000) -> Iterator[dict[str, Any]]:
+        """Stream every normalized vector in the cold collection.
+
+        Used to (re)build the in-process local vector index.  The cursor is
+        fetched in batches so the full collection is never materialized as a
+        single JSON response.
+
+        Args:
+            batch_size: Documents per cursor round trip.
+
+        Yields:
+            Dicts with keys ``file_id``, ``vector_n`` and ``created_at``.
+            Documents whose file edge is missing are skipped.
+
+        """
+        cursor = self.db.aql.execute(
+            f"""
+            FOR doc IN {self.collection_name}
+                LET file_id = FIRST(
+                    FOR f IN INBOUND doc file_has_vectors
+                        RETURN f._id
+                )
+                FILTER file_id != null
+                RETURN {{ file_id: file_id, vector_n: doc.vector_n, created_at: doc.created_at }}
+            """,
+            batch_size=batch_size,
+            stream=True,
+        )
+        yield from cursor  # type: ignore[misc]
+
     # ------------------------------------------------------------------
     # Search
     # ------------------------------------------------------------------
@@ -61,7 +61,8 @@ class VramPromisesOperations:
     Designed for fleet-wide GPU placement coordination across worker processes.
     ``try_register`` is the critical path: it atomically checks whether a new
     model fits within available VRAM headroom (accounting for all existing
-    promises) and inserts the promise only if it does.
+    promises) and inserts the promise only if it does.  ``try_register_many``
+    applies the same check to a batch of models in one statement.
 
     The AQL fit-check is a single write statement — its atomicity relies on
     ArangoDB serialising concurrent writes to the same document key. Race
@@ -150,6 +151,82 @@ class VramPromisesOperations:
         results = list(cursor)
         return len(results) > 0
 
+    def try_register_many(
+        self,
+        worker_id: str,
+        pid: int,
+        promises: dict[str, float],
+        total_mb: float,
+        used_mb: float,
+    ) -> bool:
+        """Atomically register several VRAM promises if they all fit together.
+
+        Same fit-check as :meth:`try_register`, applied to the sum of
+        *promises*: either every promise document is inserted (or replaced)
+        or none is.  Used by batched warm-up so a worker's whole GPU plan is
+        admitted in one write statement.
+
+        Args:
+            worker_id: Worker identifier (e.g., "nomarr-tag:0").
+            pid:       Worker OS PID.
+            promises:  VRAM required (MB) keyed by absolute model path.
+            total_mb:  Total GPU VRAM (MB) as observed by this worker.
+            used_mb:   In-use VRAM (MB) as observed by this worker.
+
+        Returns:
+            True if all promises were registered, False if rejected (no headroom).
+            An empty *promises* dict is trivially accepted without a query.
+
+        """
+        if not promises:
+            return True
+        ts = now_ms().value
+        docs = [
+            {
+                "_key": _promise_key(worker_id, model_path),
+                "worker_id": worker_id,
+                "pid": pid,
+                "model_path": model_path,
+                "promised_mb": promised_mb,
+                "total_mb": total_mb,
+                "used_mb": used_mb,
+                "last_seen_ms": ts,
+            }
+            for model_path, promised_mb in promises.items()
+        ]
+
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(  # type: ignore[union-attr]
+                """
+                LET sum_promised = FIRST(
+                    FOR p IN vram_promises
+                    COLLECT AGGREGATE s = SUM(TO_NUMBER(p.promised_mb))
+                    RETURN s
+                )
+                LET free_mb = @total_mb - @used_mb
+                LET headroom = free_mb - (sum_promised != null ? sum_promised : 0) - @reserve_mb
+                FILTER headroom >= @batch_mb
+                FOR doc IN @docs
+                    INSERT doc INTO vram_promises
+                    OPTIONS { overwriteMode: "replace" }
+                    RETURN true
+                """,
+                bind_vars=cast(
+                    "dict[str, Any]",
+                    {
+                        "docs": docs,
+                        "batch_mb": float(sum(promises.values())),
+                        "total_mb": total_mb,
+                        "used_mb": used_mb,
+                        "reserve_mb": float(_RESERVE_MB),
+                    },
+                ),
+            ),
+        )
+        results = list(cursor)
+        return len(results) > 0
+
     def release(self, worker_id: str, model_path: str) -> None:
         """Release the promise for a specific worker+model pair.
 
@@ -209,6 +286,50 @@ class VramPromisesOperations:
     # Read / maintenance operations
     # ------------------------------------------------------------------
 
+    def get_headroom_mb(self, total_mb: float, used_mb: float) -> float:
+        """Return the VRAM (MB) still available for new promises.
+
+        Uses the same accounting as :meth:`try_register`: free VRAM minus all
+        existing fleet promises minus the safety reserve.  The result is a
+        snapshot; callers must still register through the atomic fit-check.
+
+        Args:
+            total_mb: Total GPU VRAM (MB) as observed by this worker.
+            used_mb:  In-use VRAM (MB) as observed by this worker.
+
+        Returns:
+            Available headroom in MB (may be negative when over-committed).
+
+        """
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(  # type: ignore[union-attr]
+                """
+                FOR p IN vram_promises
+                COLLECT AGGREGATE s = SUM(TO_NUMBER(p.promised_mb))
+                RETURN s
+                """,
+            ),
+        )
+        promised = next(iter(cursor), None)
+        return total_mb - used_mb - (float(promised) if promised is not None else 0.0) - _RESERVE_MB
+
+    def count(self) -> int:
+        """Return the number of current promise documents.
+
+        Returns:
+            Number of promises held across the worker fleet.
+
+        """
+        cursor = cast(
+            "Cursor",
+            self.db.aql.execute(  # type: ignore[union-attr]
+                "RETURN LENGTH(vram_promises)",
+            ),
+        )
+        results = list(cursor)
+        return cast("int", results[0]) if results else 0
+
     def get_all(self) -> list[dict[str, Any]]:
         """Return all current promise documents.
 
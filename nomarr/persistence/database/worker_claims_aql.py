@@ -29,7 +29,7 @@ class WorkerClaimsOperations:
         self.db = db
         self.collection = db.collection("worker_claims")
 
-    def try_claim_file(self, file_id: str, worker_id: str) -> bool:
+    def try_claim_file(self, file_id: str, worker_id: str, claim_type: str | None = None) -> bool:
         """Attempt to claim a file for processing.
 
         Uses deterministic _key based on file._key to enforce uniqueness.
@@ -38,6 +38,9 @@ class WorkerClaimsOperations:
         Args:
             file_id: Full file document _id (e.g., "library_files/12345")
             worker_id: Worker identifier (e.g., "worker:tag:0")
+            claim_type: Optional claim kind stored on the document. ``"heads"``
+                claims (head-only reprocessing of tagged files) are exempt from
+                the tagged-file cleanups below.
 
         Returns:
             True if claim successful, False if file already claimed
@@ -46,16 +49,17 @@ class WorkerClaimsOperations:
         # Extract file _key from _id (e.g., "library_files/12345" -> "12345")
         file_key = file_id.split("/")[1] if "/" in file_id else file_id
         claim_key = f"claim_{file_key}"
+        doc: dict[str, Any] = {
+            "_key": claim_key,
+            "file_id": file_id,
+            "worker_id": worker_id,
+            "claimed_at": now_ms().value,
+        }
+        if claim_type is not None:
+            doc["claim_type"] = claim_type
 
         try:
-            self.collection.insert(
-                {
-                    "_key": claim_key,
-                    "file_id": file_id,
-                    "worker_id": worker_id,
-                    "claimed_at": now_ms().value,
-                },
-            )
+            self.collection.insert(doc)
             return True
         except DocumentInsertError:
             # Unique key constraint violation - file already claimed
@@ -145,7 +149,7 @@ class WorkerClaimsOperations:
             self.db.aql.execute(
                 """
                 FOR claim IN worker_claims
-                    FILTER claim.claim_type != "reconcile"  // ML claims only
+                    FILTER claim.claim_type NOT IN ["reconcile", "heads"]  // tagging claims only
                     LET file = DOCUMENT(claim.file_id)
                     LET has_tagged = LENGTH(
                         FOR edge IN file_has_state
@@ -177,7 +181,7 @@ class WorkerClaimsOperations:
             self.db.aql.execute(
                 """
                 FOR claim IN worker_claims
-                    FILTER claim.claim_type != "reconcile"  // ML claims only
+                    FILTER claim.claim_type NOT IN ["reconcile", "heads"]  // tagging claims only
                     LET file = DOCUMENT(claim.file_id)
                     LET has_tagged = LENGTH(
                         FOR edge IN file_has_state
@@ -1,6 +1,7 @@
 """Database layer for Nomarr (ArangoDB)."""
 
 import os
+from collections.abc import Callable
 from typing import Any, cast
 
 import yaml
@@ -8,11 +9,14 @@ import yaml
 from nomarr.persistence.arango_client import SafeDatabase, create_arango_client
 
 # Import operation classes (AQL versions)
+from nomarr.persistence.database.analytics_rollups_aql import AnalyticsRollupsOperations
 from nomarr.persistence.database.calibration_history_aql import CalibrationHistoryOperations
 from nomarr.persistence.database.calibration_state_aql import CalibrationStateOperations
 from nomarr.persistence.database.file_states_aql import FileStatesOperations
 from nomarr.persistence.database.health_aql import HealthOperations
+from nomarr.persistence.database.health_history_aql import HealthHistoryOperations
 from nomarr.persistence.database.libraries_aql import LibrariesOperations
+from nomarr.persistence.database.library_changes_aql import LibraryChangesOperations
 from nomarr.persistence.database.library_files_aql import LibraryFilesOperations
 from nomarr.persistence.database.library_folders_aql import LibraryFoldersOperations
 from nomarr.persistence.database.library_scans_aql import LibraryScansOperations
@@ -22,7 +26,9 @@ from nomarr.persistence.database.migrations_aql import MigrationOperations
 from nomarr.persistence.database.ml_capacity_aql import MLCapacityOperations
 from nomarr.persistence.database.ml_model_outputs_aql import MLModelOutputsOperations
 from nomarr.persistence.database.ml_models_aql import MLModelsOperations
+from nomarr.persistence.database.navidrome_albums_aql import NavidromeAlbumsOperations
 from nomarr.persistence.database.navidrome_playcounts_aql import NavidromePlaycountsOperations
+from nomarr.persistence.database.navidrome_taste_profiles_aql import NavidromeTasteProfilesOperations
 from nomarr.persistence.database.navidrome_tracks_aql import NavidromeTracksOperations
 from nomarr.persistence.database.segment_scores_stats_aql import SegmentScoresStatsOperations
 from nomarr.persistence.database.sessions_aql import SessionOperations
@@ -143,9 +149,12 @@ class Database:
         self.calibration_state = CalibrationStateOperations(self.db)
         self.calibration_history = CalibrationHistoryOperations(self.db)
         self.health = HealthOperations(self.db)
+        self.health_history = HealthHistoryOperations(self.db)
         self.worker_restart_policy = WorkerRestartPolicyOperations(self.db)
         self.navidrome_tracks = NavidromeTracksOperations(self.db)
+        self.navidrome_albums = NavidromeAlbumsOperations(self.db)
         self.navidrome_playcounts = NavidromePlaycountsOperations(self.db)
+        self.navidrome_taste_profiles = NavidromeTasteProfilesOperations(self.db)
         self.file_states = FileStatesOperations(self.db)
         self.worker_claims = WorkerClaimsOperations(self.db)
         self.vram_promises = VramPromisesOperations(self.db)
@@ -156,7 +165,11 @@ class Database:
         self.tag_model_output = TagModelOutputOperations(self.db)
         self.segment_scores_stats = SegmentScoresStatsOperations(self.db)
         # Unified tag operations (TAG_UNIFICATION_REFACTOR)
-        self.tags = TagOperations(self.db)
+        self.tags = TagOperations(self.db, parent_db=self)
+        # Per-library Insights counters, maintained by tag and file writes
+        self.analytics_rollups = AnalyticsRollupsOperations(self.db)
+        # Per-library change counters, bumped by the same write paths
+        self.library_changes = LibraryChangesOperations(self.db)
         # Migration tracking operations (database migration system)
         self.migrations = MigrationOperations(self.db)
 
@@ -166,6 +179,9 @@ class Database:
         # Cold operations cache (for read/search)
         self._vectors_track_cold: dict[str, VectorsTrackColdOperations] = {}
 
+        # Called with the file IDs of every vector delete (keeps in-process indexes in step)
+        self._vector_delete_hooks: list[Callable[[list[str]], None]] = []
+
         # Lazy import to avoid circular dependency
         # from nomarr.persistence.database.joined_queries_aql import JoinedQueryOperations
         # self.joined_queries = JoinedQueryOperations(self.db)
@@ -221,6 +237,15 @@ class Database:
             )
         return self._vectors_track_cold[cache_key]
 
+    def add_vector_delete_hook(self, hook: Callable[[list[str]], None]) -> None:
+        """Register a callback run after vectors are deleted through this instance.
+
+        Args:
+            hook: Called with the file IDs whose vectors were deleted.
+
+        """
+        self._vector_delete_hooks.append(hook)
+
     def delete_vectors_by_file_id(self, file_id: str) -> int:
         """Delete vectors for a file from ALL backbones and libraries (both hot and cold).
 
@@ -258,6 +283,8 @@ class Database:
             bind_vars={"file_id": file_id},
         )
 
+        for hook in self._vector_delete_hooks:
+            hook([file_id])
         return total_deleted
 
     def delete_vectors_by_file_ids(self, file_ids: list[str]) -> int:
@@ -299,6 +326,8 @@ class Database:
             bind_vars=cast("dict[str, Any]", {"file_ids": file_ids}),
         )
 
+        for hook in self._vector_delete_hooks:
+            hook(file_ids)
         return total_deleted
 
     def get_version(self) -> str | None:
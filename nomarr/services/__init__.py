@@ -1,56 +1,112 @@
 """Services package.
 
 Organized into domain (business logic) and infrastructure (runtime plumbing) services.
+
+Exports are resolved lazily (see ``lazy_exports``).
 """
 
-# Domain services
-from .domain import (
-    AnalyticsConfig,
-    AnalyticsService,
-    CalibrationConfig,
-    CalibrationService,
-    LibraryService,
-    LibraryServiceConfig,
-    MetadataService,
-    NavidromeConfig,
-    NavidromeService,
-    TaggingService,
-    TaggingServiceConfig,
-)
+from typing import TYPE_CHECKING
+
+from nomarr.helpers.lazy_exports_helper import lazy_exports
+
+if TYPE_CHECKING:
+    from .domain import (
+        AnalyticsConfig,
+        AnalyticsService,
+        CalibrationConfig,
+        CalibrationService,
+        LibraryService,
+        LibraryServiceConfig,
+        MetadataService,
+        NavidromeConfig,
+        NavidromeService,
+        TaggingService,
+        TaggingServiceConfig,
+    )
+    from .infrastructure import (
+        INTERNAL_ALLOW_SHORT,
+        INTERNAL_BATCH_SIZE,
+        INTERNAL_CALIBRATION_APD_THRESHOLD,
+        INTERNAL_CALIBRATION_AUTO_RUN,
+        INTERNAL_CALIBRATION_CHECK_INTERVAL,
+        INTERNAL_CALIBRATION_IQR_THRESHOLD,
+        INTERNAL_CALIBRATION_JSD_THRESHOLD,
+        INTERNAL_CALIBRATION_MEDIAN_THRESHOLD,
+        INTERNAL_CALIBRATION_MIN_FILES,
+        INTERNAL_CALIBRATION_QUALITY_THRESHOLD,
+        INTERNAL_CALIBRATION_SRD_THRESHOLD,
+        INTERNAL_HOST,
+        INTERNAL_LIBRARY_SCAN_POLL_INTERVAL,
+        INTERNAL_MIN_DURATION_S,
+        INTERNAL_NAMESPACE,
+        INTERNAL_POLL_INTERVAL,
+        INTERNAL_PORT,
+        INTERNAL_VERSION_TAG,
+        INTERNAL_WORKER_ENABLED,
+        SESSION_TIMEOUT_SECONDS,
+        ConfigService,
+        HealthMonitorConfig,
+        HealthMonitorService,
+        InfoService,
+        KeyManagementService,
+        MLConfig,
+        MLService,
+        WorkerSystemService,
+        check_missing_calibrations,
+        download_calibrations,
+        ensure_calibrations_exist,
+    )
 
-# Infrastructure services
-from .infrastructure import (
-    INTERNAL_ALLOW_SHORT,
-    INTERNAL_BATCH_SIZE,
-    INTERNAL_CALIBRATION_APD_THRESHOLD,
-    INTERNAL_CALIBRATION_AUTO_RUN,
-    INTERNAL_CALIBRATION_CHECK_INTERVAL,
-    INTERNAL_CALIBRATION_IQR_THRESHOLD,
-    INTERNAL_CALIBRATION_JSD_THRESHOLD,
-    INTERNAL_CALIBRATION_MEDIAN_THRESHOLD,
-    INTERNAL_CALIBRATION_MIN_FILES,
-    INTERNAL_CALIBRATION_QUALITY_THRESHOLD,
-    INTERNAL_CALIBRATION_SRD_THRESHOLD,
-    INTERNAL_HOST,
-    INTERNAL_LIBRARY_SCAN_POLL_INTERVAL,
-    INTERNAL_MIN_DURATION_S,
-    INTERNAL_NAMESPACE,
-    INTERNAL_POLL_INTERVAL,
-    INTERNAL_PORT,
-    INTERNAL_VERSION_TAG,
-    INTERNAL_WORKER_ENABLED,
-    SESSION_TIMEOUT_SECONDS,
-    ConfigService,
-    HealthMonitorConfig,
-    HealthMonitorService,
-    InfoService,
-    KeyManagementService,
-    MLConfig,
-    MLService,
-    WorkerSystemService,
-    check_missing_calibrations,
-    download_calibrations,
-    ensure_calibrations_exist,
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".domain": [
+            "AnalyticsConfig",
+            "AnalyticsService",
+            "CalibrationConfig",
+            "CalibrationService",
+            "LibraryService",
+            "LibraryServiceConfig",
+            "MetadataService",
+            "NavidromeConfig",
+            "NavidromeService",
+            "TaggingService",
+            "TaggingServiceConfig",
+        ],
+        ".infrastructure": [
+            "INTERNAL_ALLOW_SHORT",
+            "INTERNAL_BATCH_SIZE",
+            "INTERNAL_CALIBRATION_APD_THRESHOLD",
+            "INTERNAL_CALIBRATION_AUTO_RUN",
+            "INTERNAL_CALIBRATION_CHECK_INTERVAL",
+            "INTERNAL_CALIBRATION_IQR_THRESHOLD",
+            "INTERNAL_CALIBRATION_JSD_THRESHOLD",
+            "INTERNAL_CALIBRATION_MEDIAN_THRESHOLD",
+            "INTERNAL_CALIBRATION_MIN_FILES",
+            "INTERNAL_CALIBRATION_QUALITY_THRESHOLD",
+            "INTERNAL_CALIBRATION_SRD_THRESHOLD",
+            "INTERNAL_HOST",
+            "INTERNAL_LIBRARY_SCAN_POLL_INTERVAL",
+            "INTERNAL_MIN_DURATION_S",
+            "INTERNAL_NAMESPACE",
+            "INTERNAL_POLL_INTERVAL",
+            "INTERNAL_PORT",
+            "INTERNAL_VERSION_TAG",
+            "INTERNAL_WORKER_ENABLED",
+            "SESSION_TIMEOUT_SECONDS",
+            "ConfigService",
+            "HealthMonitorConfig",
+            "HealthMonitorService",
+            "InfoService",
+            "KeyManagementService",
+            "MLConfig",
+            "MLService",
+            "WorkerSystemService",
+            "check_missing_calibrations",
+            "download_calibrations",
+            "ensure_calibrations_exist",
+        ],
+    },
 )
 
 __all__ = [
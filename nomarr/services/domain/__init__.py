@@ -1,11 +1,31 @@
-"""Domain package."""
+"""Domain package.
 
-from .analytics_svc import AnalyticsConfig, AnalyticsService
-from .calibration_svc import CalibrationConfig, CalibrationService
-from .library_svc import LibraryService, LibraryServiceConfig
-from .metadata_svc import MetadataService
-from .navidrome_svc import NavidromeConfig, NavidromeService
-from .tagging_svc import TaggingService, TaggingServiceConfig
+Exports are resolved lazily (see ``lazy_exports``).
+"""
+
+from typing import TYPE_CHECKING
+
+from nomarr.helpers.lazy_exports_helper import lazy_exports
+
+if TYPE_CHECKING:
+    from .analytics_svc import AnalyticsConfig, AnalyticsService
+    from .calibration_svc import CalibrationConfig, CalibrationService
+    from .library_svc import LibraryService, LibraryServiceConfig
+    from .metadata_svc import MetadataService
+    from .navidrome_svc import NavidromeConfig, NavidromeService
+    from .tagging_svc import TaggingService, TaggingServiceConfig
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".analytics_svc": ["AnalyticsConfig", "AnalyticsService"],
+        ".calibration_svc": ["CalibrationConfig", "CalibrationService"],
+        ".library_svc": ["LibraryService", "LibraryServiceConfig"],
+        ".metadata_svc": ["MetadataService"],
+        ".navidrome_svc": ["NavidromeConfig", "NavidromeService"],
+        ".tagging_svc": ["TaggingService", "TaggingServiceConfig"],
+    },
+)
 
 __all__ = [
     "AnalyticsConfig",
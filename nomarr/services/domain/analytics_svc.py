@@ -20,6 +20,7 @@ from nomarr.components.analytics.analytics_comp import (
     compute_tag_correlation_matrix,
     compute_tag_frequencies,
 )
+from nomarr.components.analytics.analytics_rollup_comp import check_rollup_consistency
 from nomarr.components.analytics.collection_overview_comp import compute_collection_overview
 from nomarr.components.analytics.mood_analysis_comp import compute_mood_analysis
 from nomarr.helpers.dto import TagSpec
@@ -29,6 +30,7 @@ from nomarr.helpers.dto.analytics_dto import (
     ComputeTagFrequenciesParams,
     MoodDistributionItem,
     MoodDistributionResult,
+    RollupConsistencyReport,
     TagCoOccurrenceData,
     TagCorrelationData,
     TagFrequenciesResult,
@@ -125,17 +127,18 @@ class AnalyticsService:
         tag_frequencies = self.get_tag_frequencies(limit=limit)
         return TagFrequenciesResult(tag_frequencies=tag_frequencies)
 
-    def get_tag_correlation_matrix(self, top_n: int = 20) -> TagCorrelationData:
+    def get_tag_correlation_matrix(self, top_n: int = 20, library_id: str | None = None) -> TagCorrelationData:
         """Compute VALUE-based correlation matrix for mood tags.
 
         Args:
             top_n: Number of top moods to analyze
+            library_id: Optional library _id to filter by.
 
         Returns:
             TagCorrelationData with mood-to-mood and mood-to-tier correlations
 
         """
-        tag_data = self._db.tags.get_mood_and_tier_tags_for_correlation()
+        tag_data = self._db.tags.get_mood_and_tier_tags_for_correlation(library_id=library_id)
         data = {
             "mood_tag_rows": tag_data["mood_tag_rows"],
             "tier_tag_keys": tag_data["tier_tag_keys"],
@@ -289,3 +292,22 @@ class AnalyticsService:
 
         """
         return compute_mood_analysis(self._db, library_id=library_id)
+
+    def check_analytics_rollups(
+        self,
+        library_id: str | None = None,
+        repair: bool = False,
+    ) -> list[RollupConsistencyReport]:
+        """Compare the Insights rollups with a full recompute.
+
+        Delegates to check_rollup_consistency component.
+
+        Args:
+            library_id: Optional library _id; None checks every library.
+            repair: Rebuild rollups that differ.
+
+        Returns:
+            One RollupConsistencyReport per library.
+
+        """
+        return check_rollup_consistency(self._db, library_id=library_id, repair=repair)
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from nomarr.components.navidrome.templates_comp import generate_template_files, get_template_summary
 from nomarr.helpers.dto import NavidromeGeneratePlaylistsResult
@@ -35,8 +35,10 @@ from nomarr.workflows.navidrome.push_playlist_wf import push_playlist
 
 logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
+    from nomarr.components.ml.vectors.ml_vector_local_index_comp import LocalVectorIndexCache
+    from nomarr.components.ml.vectors.ml_vector_search_params_comp import VectorSearchParamsCache
     from nomarr.components.navidrome.subsonic_client_comp import SubsonicClient
-    from nomarr.helpers.dto.navidrome_dto import NdSyncResult, PlaylistPreviewResult
+    from nomarr.helpers.dto.navidrome_dto import NavidromePersonalPlaylistEntry, NdSyncResult, PlaylistPreviewResult
     from nomarr.persistence.db import Database
     from nomarr.services.infrastructure.config_svc import ConfigService
     from nomarr.workflows.navidrome.find_similar_tracks_wf import SimilarTrackResult
@@ -57,18 +59,31 @@ class NavidromeService:
     take effect without restarting the application.
     """
 
-    def __init__(self, db: Database, cfg: NavidromeConfig, config_service: ConfigService) -> None:
+    def __init__(
+        self,
+        db: Database,
+        cfg: NavidromeConfig,
+        config_service: ConfigService,
+        vector_index_cache: LocalVectorIndexCache | None = None,
+        search_params_cache: VectorSearchParamsCache | None = None,
+    ) -> None:
         """Initialize Navidrome service.
 
         Args:
             db: Database instance
             cfg: Navidrome configuration (static settings)
             config_service: Live configuration provider (for API credentials)
+            vector_index_cache: Optional in-process vector index cache used
+                by similar-track lookups.
+            search_params_cache: Per-collection nLists cache used by
+                similar-track lookups and playlist generation.
 
         """
         self._db = db
         self.cfg = cfg
         self._config_service = config_service
+        self._vector_index_cache = vector_index_cache
+        self._search_params_cache = search_params_cache
         self._client: SubsonicClient | None = None
         # Track credentials used for the cached client so we can invalidate
         # when the user changes them via the web UI.
@@ -382,12 +397,16 @@ class NavidromeService:
     # Song map sync
     # ------------------------------------------------------------------
 
-    def sync_navidrome(self) -> NdSyncResult:
+    def sync_navidrome(self, full: bool = False) -> NdSyncResult:
         """Sync Navidrome's song inventory to graph collections.
 
         Walks Navidrome's album inventory via the Subsonic API, matches file
         paths to Nomarr library_files, upserts track vertices + edges, and
-        captures per-user play counts.
+        captures per-user play counts.  Only albums changed since the last
+        sync are fetched unless *full* is set.
+
+        Args:
+            full: Fetch every album and rebuild the user's play data.
 
         Returns:
             NdSyncResult with sync statistics.
@@ -404,6 +423,7 @@ class NavidromeService:
             client=client,
             db=self._db,
             user_id=api_user,
+            full=full,
         )
 
     # ------------------------------------------------------------------
@@ -442,6 +462,8 @@ class NavidromeService:
             db=self._db,
             vector_group_size=group_size,
             vector_search_thoroughness=thoroughness,
+            index_cache=self._vector_index_cache,
+            params_cache=self._search_params_cache,
         )
 
     # ------------------------------------------------------------------
@@ -497,6 +519,59 @@ class NavidromeService:
         """
         from nomarr.workflows.navidrome.generate_playlists_wf import generate_playlists
 
+        settings = self._resolve_playlist_settings(
+            enabled_types=enabled_types,
+            max_songs=max_songs,
+            min_songs=min_songs,
+            max_genre_playlists=max_genre_playlists,
+        )
+        playlists = generate_playlists(
+            db=self._db,
+            user_id=user_id,
+            params_cache=self._search_params_cache,
+            **settings,
+        )
+
+        return self._playlists_result(playlists)
+
+    def generate_all_user_playlists(self) -> dict[str, NavidromeGeneratePlaylistsResult]:
+        """Regenerate personal playlists for every user with play data.
+
+        Intended for scheduled runs: stored taste profiles and search
+        parameters are loaded once for the whole batch.  Uses the same
+        ``pp_*`` config as :meth:`generate_playlists`.
+
+        Returns:
+            Mapping of Navidrome user ID → playlist generation result.
+
+        Raises:
+            MisconfiguredError: If ``library_key`` is not configured.
+
+        """
+        from nomarr.workflows.navidrome.generate_all_user_playlists_wf import generate_all_user_playlists
+
+        settings = self._resolve_playlist_settings()
+        by_user = generate_all_user_playlists(
+            db=self._db,
+            params_cache=self._search_params_cache,
+            **settings,
+        )
+        return {user_id: self._playlists_result(playlists) for user_id, playlists in by_user.items()}
+
+    def _resolve_playlist_settings(
+        self,
+        *,
+        enabled_types: list[str] | None = None,
+        max_songs: int | None = None,
+        min_songs: int | None = None,
+        max_genre_playlists: int | None = None,
+    ) -> dict[str, Any]:
+        """Resolve playlist-generation workflow kwargs from overrides and ``pp_*`` config.
+
+        Raises:
+            MisconfiguredError: If ``library_key`` is not configured.
+
+        """
         backbone_id: str = self._config_service.get("pp_backbone_id", "effnet-discogs")
         library_key: str = self._config_service.get("library_key", "")
         if not library_key:
@@ -517,20 +592,21 @@ class NavidromeService:
             25,
         )
 
-        playlists = generate_playlists(
-            db=self._db,
-            user_id=user_id,
-            backbone_id=backbone_id,
-            library_key=library_key,
-            enabled_types=resolved_enabled_types,
-            half_life_days=self._config_service.get("pp_half_life_days", 30.0),
-            top_n=self._config_service.get("pp_top_n", 200),
-            max_songs=resolved_max_songs,
-            min_play_count=self._config_service.get("pp_min_play_count", 3),
-            min_songs=resolved_min_songs,
-            max_genre_playlists=resolved_max_genre_playlists,
-        )
-
+        return {
+            "backbone_id": backbone_id,
+            "library_key": library_key,
+            "enabled_types": resolved_enabled_types,
+            "half_life_days": self._config_service.get("pp_half_life_days", 30.0),
+            "top_n": self._config_service.get("pp_top_n", 200),
+            "max_songs": resolved_max_songs,
+            "min_play_count": self._config_service.get("pp_min_play_count", 3),
+            "min_songs": resolved_min_songs,
+            "max_genre_playlists": resolved_max_genre_playlists,
+        }
+
+    @staticmethod
+    def _playlists_result(playlists: list[NavidromePersonalPlaylistEntry]) -> NavidromeGeneratePlaylistsResult:
+        """Wrap workflow output in the service result DTO."""
         if playlists:
             result = NavidromeGeneratePlaylistsResult(status="ok", message="", playlists=playlists)
         else:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import threading
 from collections.abc import Callable
 from dataclasses import asdict, dataclass
@@ -10,6 +11,11 @@ from typing import TYPE_CHECKING, Any
 
 from nomarr.components.library.file_tags_comp import get_file_tags_with_path
 from nomarr.components.library.search_files_comp import get_unique_tag_keys, get_unique_tag_values
+from nomarr.components.processing.write_engine_comp import (
+    DeviceKeyResolver,
+    ParallelWriteEngine,
+    WriteEngineProgress,
+)
 from nomarr.helpers import ManagedTask
 from nomarr.helpers.dto.calibration_dto import (
     GlobalCalibrationStatus,
@@ -40,7 +46,7 @@ from nomarr.workflows.calibration.apply_calibration_wf import apply_calibration_
 from nomarr.workflows.calibration.write_calibrated_tags_wf import write_calibrated_tags_wf
 from nomarr.workflows.library.cleanup_orphaned_tags_wf import cleanup_orphaned_tags_workflow
 from nomarr.workflows.library.file_tags_io_wf import read_file_tags_workflow, remove_file_tags_workflow
-from nomarr.workflows.processing.write_file_tags_wf import write_file_tags_workflow
+from nomarr.workflows.processing.write_file_tags_wf import WriteResult, write_file_tags_workflow
 
 if TYPE_CHECKING:
     from nomarr.persistence.db import Database
@@ -51,6 +57,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 CALIBRATION_APPLY_TASK_ID = "calibration_apply"
+MAX_TAG_WRITE_WORKERS = 32  # Upper bound of the tag_write_workers setting
 
 
 @dataclass
@@ -112,6 +119,10 @@ class TaggingService:
         self._apply_progress_lock = threading.Lock()
         self._apply_progress: dict[str, Any] = {}
 
+        # Latest write-engine progress per library (reconcile batches)
+        self._reconcile_progress_lock = threading.Lock()
+        self._reconcile_progress: dict[str, WriteEngineProgress] = {}
+
     @property
     def namespace(self) -> str:
         """Get the tag namespace from library service config."""
@@ -417,7 +428,9 @@ class TaggingService:
         """Reconcile file tags for a library based on its file_write_mode.
 
         Claims files with mismatched projection state and writes tags according
-        to the library's current mode and calibration. This handles:
+        to the library's current mode and calibration. Writes run through a
+        :class:`ParallelWriteEngine` sized by ``tag_write_workers`` and
+        ``tag_write_per_device``. This handles:
         - Mode changes (e.g., switching from "full" to "minimal")
         - Calibration updates (new mood tag values)
         - New ML results (files analyzed but never written)
@@ -452,35 +465,51 @@ class TaggingService:
         processed = 0
         failed = 0
 
-        for file_doc in claimed_files:
-            file_key = file_doc["_key"]
-            try:
-                result = write_file_tags_workflow(
-                    db=self.db,
-                    file_key=file_key,
-                    target_mode=target_mode,
-                    calibration_hash=calibration_hash,
-                    has_calibration=has_calibration,
-                    namespace=namespace,
-                )
-                if result.success:
-                    processed += 1
-                elif result.error == "file_modified_externally":
-                    # File changed on disk since DB was last scanned; release claim
-                    # so it can be retried after the scanner updates the mtime.
-                    logger.debug(f"[reconcile] Skipping {file_key}: modified externally, will retry after rescan")
-                    self.db.library_files.release_claim(file_key)
-                else:
-                    failed += 1
-                    logger.warning(f"[reconcile] Failed to write tags for {file_key}: {result.error}")
-            except Exception as e:
+        def write_one(file_doc: dict[str, Any]) -> WriteResult:
+            return write_file_tags_workflow(
+                db=self.db,
+                file_key=file_doc["_key"],
+                target_mode=target_mode,
+                calibration_hash=calibration_hash,
+                has_calibration=has_calibration,
+                namespace=namespace,
+            )
+
+        # Overlap disk writes: bounded pool, per-device caps, lazy buffering
+        library_root = str(library.get("root_path", ""))
+        device_key = DeviceKeyResolver()
+        engine = ParallelWriteEngine(
+            max_workers=min(MAX_TAG_WRITE_WORKERS, max(1, int(self._config_service.get("tag_write_workers", 4)))),
+            per_device_limit=max(1, int(self._config_service.get("tag_write_per_device", 2))),
+            on_progress=lambda progress: self._set_reconcile_progress(library_id, progress),
+        )
+        outcomes = engine.run(
+            claimed_files,
+            write_one,
+            lambda file_doc: device_key(os.path.join(library_root, str(file_doc.get("path", "")))),
+        )
+
+        for outcome in outcomes:
+            file_key = outcome.item["_key"]
+            result = outcome.result
+            if outcome.error is not None:
                 failed += 1
-                logger.exception(f"[reconcile] Error processing {file_key}: {e}")
+                logger.error(f"[reconcile] Error processing {file_key}: {outcome.error}", exc_info=outcome.error)
                 # Release claim on error
                 try:
                     self.db.library_files.release_claim(file_key)
                 except Exception as release_err:
                     logger.debug(f"[reconcile] Failed to release claim for {file_key}: {release_err}")
+            elif result is not None and result.success:
+                processed += 1
+            elif result is not None and result.error == "file_modified_externally":
+                # File changed on disk since DB was last scanned; release claim
+                # so it can be retried after the scanner updates the mtime.
+                logger.debug(f"[reconcile] Skipping {file_key}: modified externally, will retry after rescan")
+                self.db.library_files.release_claim(file_key)
+            else:
+                failed += 1
+                logger.warning(f"[reconcile] Failed to write tags for {file_key}: {result.error if result else None}")
 
         # Count remaining files needing reconciliation
         remaining = self.db.library_files.count_files_needing_reconciliation(
@@ -561,7 +590,8 @@ class TaggingService:
             library_id: Library document _id
 
         Returns:
-            Dict with pending_count and in_progress status
+            Dict with pending_count, in_progress status, and the latest
+            write-engine progress of the current/last batch (or ``None``)
 
         """
         # Get library settings
@@ -576,11 +606,20 @@ class TaggingService:
         task_status = self._bts.get_task_status(f"write_tags:{library_id}")
         in_progress = task_status is not None and task_status["status"] == "running"
 
+        with self._reconcile_progress_lock:
+            progress = self._reconcile_progress.get(library_id)
+
         return {
             "pending_count": pending_count,
             "in_progress": in_progress,
+            "progress": {**asdict(progress), "files_per_s": progress.files_per_s} if progress is not None else None,
         }
 
+    def _set_reconcile_progress(self, library_id: str, progress: WriteEngineProgress) -> None:
+        """Record the latest write-engine progress for a library's reconcile batch."""
+        with self._reconcile_progress_lock:
+            self._reconcile_progress[library_id] = progress
+
     # ── Nom-prefix guard ──────────────────────────────────────────────
 
     @staticmethod
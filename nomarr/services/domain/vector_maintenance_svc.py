@@ -6,6 +6,8 @@ import logging
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from nomarr.components.ml.vectors.ml_vector_local_index_comp import LocalVectorIndexCache
+    from nomarr.components.ml.vectors.ml_vector_search_params_comp import VectorSearchParamsCache
     from nomarr.services.infrastructure.config_svc import ConfigService
 
 from nomarr.components.ml.vectors.ml_vector_maintenance_comp import has_vector_index
@@ -27,17 +29,30 @@ class VectorMaintenanceService:
     Coordinates promote & rebuild workflow and provides stats for monitoring.
     """
 
-    def __init__(self, db: Database, models_dir: str, config_svc: ConfigService) -> None:
+    def __init__(
+        self,
+        db: Database,
+        models_dir: str,
+        config_svc: ConfigService,
+        search_params_cache: VectorSearchParamsCache | None = None,
+        vector_index_cache: LocalVectorIndexCache | None = None,
+    ) -> None:
         """Initialize vector maintenance service.
 
         Args:
             db: Database instance
             models_dir: Path to ML models directory
             config_svc: Configuration service for dynamic settings
+            search_params_cache: Search-parameter cache shared with search
+                services; invalidated after each promote/rebuild.
+            vector_index_cache: In-process vector index cache shared with
+                search services; invalidated after each promote/rebuild.
         """
         self.db = db
         self.models_dir = models_dir
         self._config_svc = config_svc
+        self._search_params_cache = search_params_cache
+        self._vector_index_cache = vector_index_cache
 
     def promote_and_rebuild(
         self,
@@ -87,6 +102,11 @@ class VectorMaintenanceService:
                 exc_info=True,
             )
             raise
+        finally:
+            if self._search_params_cache is not None:
+                self._search_params_cache.invalidate(backbone_id, library_key)
+            if self._vector_index_cache is not None:
+                self._vector_index_cache.invalidate(backbone_id, library_key)
 
     def get_hot_cold_stats(self, backbone_id: str, library_key: str) -> dict[str, int | bool]:
         """Get hot/cold statistics for a backbone+library.
@@ -191,3 +211,8 @@ class VectorMaintenanceService:
                 exc_info=True,
             )
             raise
+        finally:
+            if self._search_params_cache is not None:
+                self._search_params_cache.invalidate(backbone_id, library_key)
+            if self._vector_index_cache is not None:
+                self._vector_index_cache.invalidate(backbone_id, library_key)
@@ -1,32 +1,56 @@
 """Vector search service for similarity search on cold collections."""
 
+import heapq
 import logging
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from nomarr.components.ml.vectors.ml_vector_maintenance_comp import has_vector_index
-from nomarr.helpers.vector_params_helper import compute_nlists, compute_nprobe
+from nomarr.components.ml.vectors.ml_vector_search_params_comp import VectorSearchParamsCache
 from nomarr.persistence.db import Database
 from nomarr.services.infrastructure.config_svc import ConfigService
 
+if TYPE_CHECKING:
+    from nomarr.components.ml.vectors.ml_vector_local_index_comp import LocalVectorIndex, LocalVectorIndexCache
+
 logger = logging.getLogger(__name__)
 
+# Fan-out search: upper bound on concurrent per-library ANN queries
+_FAN_OUT_MAX_WORKERS = 8
+
 
 class VectorSearchService:
     """Service for vector similarity search operations.
 
-    Searches against cold collections only (promoted vectors with indexes).
-    Hot collections are write-only and never searched.
+    Searches against cold collections (promoted vectors with indexes).
+    Hot collections are write-only in ArangoDB; when a local vector index
+    cache is configured, single-library searches run in-process against
+    cold + synced hot vectors instead, so unindexed libraries and freshly
+    processed tracks are searchable too.
     """
 
-    def __init__(self, db: Database, config_svc: ConfigService) -> None:
+    def __init__(
+        self,
+        db: Database,
+        config_svc: ConfigService,
+        vector_index_cache: "LocalVectorIndexCache | None" = None,
+        search_params_cache: VectorSearchParamsCache | None = None,
+    ) -> None:
         """Initialize vector search service.
 
         Args:
             db: Database instance
             config_svc: Configuration service for dynamic settings
+            vector_index_cache: Optional in-process vector index cache. When
+                ``None``, every search goes to ArangoDB.
+            search_params_cache: Per-collection nLists/doc-count cache. A
+                private cache is created when ``None``.
         """
         self.db = db
         self._config_svc = config_svc
+        self._vector_index_cache = vector_index_cache
+        self._search_params = search_params_cache or VectorSearchParamsCache()
+        self._fan_out_pool = ThreadPoolExecutor(max_workers=_FAN_OUT_MAX_WORKERS, thread_name_prefix="vector-fanout")
 
     def search_similar_tracks(
         self,
@@ -80,15 +104,24 @@ class VectorSearchService:
             msg = f"File '{file_id}' not found or has no library association"
             raise ValueError(msg)
 
-        # Step 2: Get the source track's vector
-        vector_doc = get_cold_track_vector(self.db, file_id, backbone_id, library_key)
-        if vector_doc is None:
-            msg = (
-                f"No vector found for file '{file_id}' with backbone "
-                f"'{backbone_id}'. Track may not have been processed yet."
-            )
-            raise ValueError(msg)
-        vector: list[float] = vector_doc["vector_n"]
+        # Step 2: Get the source track's vector (local index also covers hot-only tracks)
+        local_index = (
+            self._vector_index_cache.get(self.db, backbone_id, library_key)
+            if self._vector_index_cache is not None
+            else None
+        )
+        local_vector = local_index.get_vector(file_id) if local_index is not None else None
+        if local_vector is not None:
+            vector: list[float] = local_vector.tolist()
+        else:
+            vector_doc = get_cold_track_vector(self.db, file_id, backbone_id, library_key)
+            if vector_doc is None:
+                msg = (
+                    f"No vector found for file '{file_id}' with backbone "
+                    f"'{backbone_id}'. Track may not have been processed yet."
+                )
+                raise ValueError(msg)
+            vector = vector_doc["vector_n"]
 
         # Step 3: Search
         if library_scope == "all":
@@ -102,8 +135,21 @@ class VectorSearchService:
 
         target_library = library_key if library_scope is None or library_scope == "own" else library_scope
 
+        if self._vector_index_cache is not None:
+            if target_library != library_key:
+                local_index = self._vector_index_cache.get(self.db, backbone_id, target_library)
+            if local_index is not None:
+                return self._search_local(local_index, vector, limit, min_score, nprobe)
+
+        # Derive nprobe from the index's recorded nLists when not explicitly provided;
+        # recorded params double as the index check
+        params = self._search_params.get(self.db, backbone_id, target_library) if nprobe is None else None
+        if params is not None:
+            thoroughness: int = self._config_svc.get("vector_search_thoroughness", 10)
+            nprobe = params.nprobe(thoroughness)
+
         # Validate vector index exists
-        if not has_vector_index(self.db.db, backbone_id, target_library):
+        if nprobe is None or (params is None and not has_vector_index(self.db.db, backbone_id, target_library)):
             msg = (
                 f"Vector search not available for backbone '{backbone_id}' "
                 f"library '{target_library}': cold collection has no vector index. "
@@ -114,14 +160,6 @@ class VectorSearchService:
         # Get cold operations and search
         cold_ops = self.db.get_vectors_track_cold(backbone_id, target_library)
 
-        # Auto-calculate nprobe from config when not explicitly provided
-        if nprobe is None:
-            doc_count = cold_ops.count()
-            group_size: int = self._config_svc.get("vector_group_size", 15)
-            thoroughness: int = self._config_svc.get("vector_search_thoroughness", 10)
-            nlists = compute_nlists(doc_count, group_size)
-            nprobe = compute_nprobe(nlists, thoroughness)
-
         try:
             raw_results = cold_ops.search_similar(vector, limit, nprobe=nprobe)
         except Exception as e:
@@ -141,6 +179,31 @@ class VectorSearchService:
 
         return filtered_results
 
+    @staticmethod
+    def _search_local(
+        index: "LocalVectorIndex",
+        vector: list[float],
+        limit: int,
+        min_score: float,
+        nprobe: int | None,
+    ) -> list[dict[str, Any]]:
+        """Search an in-process :class:`LocalVectorIndex`.
+
+        Returns results shaped like the cold collection search (``file_id``,
+        ``score``, ``vector``) so callers need not care which path ran.
+        """
+        hits = index.search(vector, limit, nprobe=nprobe)
+        results: list[dict[str, Any]] = []
+        for fid, score in hits:
+            if score < min_score:
+                continue
+            stored = index.get_vector(fid)
+            results.append({"file_id": fid, "score": score, "vector": stored.tolist() if stored is not None else []})
+        logger.debug(
+            "Local vector search: mode=%s, size=%d, limit=%d, returned=%d", index.mode, len(index), limit, len(results)
+        )
+        return results
+
     def _search_fan_out(
         self,
         backbone_id: str,
@@ -151,9 +214,10 @@ class VectorSearchService:
     ) -> list[dict[str, Any]]:
         """Search across ALL library cold collections, merge by score.
 
-        Iterates over every registered library, searches each cold collection
-        that exists, and returns the top *limit* results by descending score
-        after deduplication by ``file_id``.
+        Per-library ANN queries run concurrently on a bounded thread pool, so
+        latency tracks the slowest library rather than the sum.  Each library's
+        result list arrives score-sorted; a heap-based k-way merge produces the
+        top *limit* results, deduplicated by ``file_id``.
 
         Args:
             backbone_id: Backbone identifier.
@@ -166,58 +230,51 @@ class VectorSearchService:
         Returns:
             Merged, deduplicated, score-sorted list of results capped at *limit*.
         """
-        all_results: list[dict[str, Any]] = []
         libraries = self.db.libraries.list_libraries()
+        thoroughness: int = self._config_svc.get("vector_search_thoroughness", 10)
 
-        for lib in libraries:
-            lib_key: str = lib["_key"]
-            cold_coll_name = f"vectors_track_cold__{backbone_id}__{lib_key}"
-            if not self.db.db.has_collection(cold_coll_name):
-                continue
-
+        def search_library(lib_key: str) -> list[dict[str, Any]]:
             try:
+                params = self._search_params.get(self.db, backbone_id, lib_key)
+                if params is None or params.doc_count == 0:
+                    return []
+                effective_nprobe = nprobe if nprobe is not None else params.nprobe(thoroughness)
                 cold_ops = self.db.get_vectors_track_cold(backbone_id, lib_key)
-                doc_count = cold_ops.count()
-                if doc_count == 0:
-                    continue
-
-                effective_nprobe = nprobe
-                if effective_nprobe is None:
-                    group_size: int = self._config_svc.get("vector_group_size", 15)
-                    thoroughness: int = self._config_svc.get("vector_search_thoroughness", 10)
-                    nlists = compute_nlists(doc_count, group_size)
-                    effective_nprobe = compute_nprobe(nlists, thoroughness)
-
                 results = cold_ops.search_similar(vector, limit, nprobe=effective_nprobe)
-                all_results.extend(results)
             except Exception:
                 logger.warning(
                     "Fan-out search failed for library %s, skipping",
                     lib_key,
                     exc_info=True,
                 )
-                continue
+                self._search_params.invalidate(backbone_id, lib_key)
+                return []
+            results.sort(key=lambda r: r.get("score", 0.0), reverse=True)
+            return results
+
+        futures = [self._fan_out_pool.submit(search_library, lib["_key"]) for lib in libraries]
+        per_library = [future.result() for future in futures]
 
-        # Sort by score descending and deduplicate by file_id (keep highest score)
-        all_results.sort(key=lambda r: r.get("score", 0.0), reverse=True)
+        # k-way merge of score-sorted lists; dedup by file_id (first = highest score)
         seen: set[str] = set()
         unique: list[dict[str, Any]] = []
-        for r in all_results:
+        for r in heapq.merge(*per_library, key=lambda r: r.get("score", 0.0), reverse=True):
+            if len(unique) >= limit or r.get("score", 0.0) < min_score:
+                break
             fid: str = r.get("file_id", "")
             if fid not in seen:
                 seen.add(fid)
-                if r.get("score", 0.0) >= min_score:
-                    unique.append(r)
+                unique.append(r)
 
         logger.debug(
-            "Fan-out search: backbone=%s, libraries=%d, total_raw=%d, unique=%d, returning=%d",
+            "Fan-out search: backbone=%s, libraries=%d, with_results=%d, total_raw=%d, returning=%d",
             backbone_id,
             len(libraries),
-            len(all_results),
+            sum(1 for results in per_library if results),
+            sum(len(results) for results in per_library),
             len(unique),
-            min(limit, len(unique)),
         )
-        return unique[:limit]
+        return unique
 
     def get_track_vector(self, backbone_id: str, file_id: str) -> dict[str, Any] | None:
         """Get vector for a specific track.
@@ -1,33 +1,79 @@
-"""Infrastructure services - runtime plumbing."""
+"""Infrastructure services - runtime plumbing.
 
-from .calibration_download_svc import check_missing_calibrations, download_calibrations, ensure_calibrations_exist
-from .config_svc import (
-    INTERNAL_ALLOW_SHORT,
-    INTERNAL_BATCH_SIZE,
-    INTERNAL_CALIBRATION_APD_THRESHOLD,
-    INTERNAL_CALIBRATION_AUTO_RUN,
-    INTERNAL_CALIBRATION_CHECK_INTERVAL,
-    INTERNAL_CALIBRATION_IQR_THRESHOLD,
-    INTERNAL_CALIBRATION_JSD_THRESHOLD,
-    INTERNAL_CALIBRATION_MEDIAN_THRESHOLD,
-    INTERNAL_CALIBRATION_MIN_FILES,
-    INTERNAL_CALIBRATION_QUALITY_THRESHOLD,
-    INTERNAL_CALIBRATION_SRD_THRESHOLD,
-    INTERNAL_HOST,
-    INTERNAL_LIBRARY_SCAN_POLL_INTERVAL,
-    INTERNAL_MIN_DURATION_S,
-    INTERNAL_NAMESPACE,
-    INTERNAL_POLL_INTERVAL,
-    INTERNAL_PORT,
-    INTERNAL_VERSION_TAG,
-    INTERNAL_WORKER_ENABLED,
-    ConfigService,
+Exports are resolved lazily (see ``lazy_exports``).
+"""
+
+from typing import TYPE_CHECKING
+
+from nomarr.helpers.lazy_exports_helper import lazy_exports
+
+if TYPE_CHECKING:
+    from .calibration_download_svc import check_missing_calibrations, download_calibrations, ensure_calibrations_exist
+    from .config_svc import (
+        INTERNAL_ALLOW_SHORT,
+        INTERNAL_BATCH_SIZE,
+        INTERNAL_CALIBRATION_APD_THRESHOLD,
+        INTERNAL_CALIBRATION_AUTO_RUN,
+        INTERNAL_CALIBRATION_CHECK_INTERVAL,
+        INTERNAL_CALIBRATION_IQR_THRESHOLD,
+        INTERNAL_CALIBRATION_JSD_THRESHOLD,
+        INTERNAL_CALIBRATION_MEDIAN_THRESHOLD,
+        INTERNAL_CALIBRATION_MIN_FILES,
+        INTERNAL_CALIBRATION_QUALITY_THRESHOLD,
+        INTERNAL_CALIBRATION_SRD_THRESHOLD,
+        INTERNAL_HOST,
+        INTERNAL_LIBRARY_SCAN_POLL_INTERVAL,
+        INTERNAL_MIN_DURATION_S,
+        INTERNAL_NAMESPACE,
+        INTERNAL_POLL_INTERVAL,
+        INTERNAL_PORT,
+        INTERNAL_VERSION_TAG,
+        INTERNAL_WORKER_ENABLED,
+        ConfigService,
+    )
+    from .health_monitor_svc import HealthMonitorConfig, HealthMonitorService
+    from .info_svc import InfoService
+    from .keys_svc import SESSION_TIMEOUT_SECONDS, KeyManagementService
+    from .ml_svc import MLConfig, MLService
+    from .worker_system_svc import WorkerSystemService
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".calibration_download_svc": [
+            "check_missing_calibrations",
+            "download_calibrations",
+            "ensure_calibrations_exist",
+        ],
+        ".config_svc": [
+            "INTERNAL_ALLOW_SHORT",
+            "INTERNAL_BATCH_SIZE",
+            "INTERNAL_CALIBRATION_APD_THRESHOLD",
+            "INTERNAL_CALIBRATION_AUTO_RUN",
+            "INTERNAL_CALIBRATION_CHECK_INTERVAL",
+            "INTERNAL_CALIBRATION_IQR_THRESHOLD",
+            "INTERNAL_CALIBRATION_JSD_THRESHOLD",
+            "INTERNAL_CALIBRATION_MEDIAN_THRESHOLD",
+            "INTERNAL_CALIBRATION_MIN_FILES",
+            "INTERNAL_CALIBRATION_QUALITY_THRESHOLD",
+            "INTERNAL_CALIBRATION_SRD_THRESHOLD",
+            "INTERNAL_HOST",
+            "INTERNAL_LIBRARY_SCAN_POLL_INTERVAL",
+            "INTERNAL_MIN_DURATION_S",
+            "INTERNAL_NAMESPACE",
+            "INTERNAL_POLL_INTERVAL",
+            "INTERNAL_PORT",
+            "INTERNAL_VERSION_TAG",
+            "INTERNAL_WORKER_ENABLED",
+            "ConfigService",
+        ],
+        ".health_monitor_svc": ["HealthMonitorConfig", "HealthMonitorService"],
+        ".info_svc": ["InfoService"],
+        ".keys_svc": ["SESSION_TIMEOUT_SECONDS", "KeyManagementService"],
+        ".ml_svc": ["MLConfig", "MLService"],
+        ".worker_system_svc": ["WorkerSystemService"],
+    },
 )
-from .health_monitor_svc import HealthMonitorConfig, HealthMonitorService
-from .info_svc import InfoService
-from .keys_svc import SESSION_TIMEOUT_SECONDS, KeyManagementService
-from .ml_svc import MLConfig, MLService
-from .worker_system_svc import WorkerSystemService
 
 __all__ = [
     "INTERNAL_ALLOW_SHORT",
@@ -374,6 +374,9 @@ class ConfigService:
             ProcessorConfig instance for injection into worker spawn.
 
         """
+        # ONNX Runtime comes with this import; only processing needs it
+        from nomarr.components.ml.onnx.ml_warmup_comp import default_warmup_workers
+
         cfg = self.get_config()
         models_dir = str(cfg.config["models_dir"])
 
@@ -388,4 +391,13 @@ class ConfigService:
             namespace=INTERNAL_NAMESPACE,
             version_tag_key=INTERNAL_VERSION_TAG,
             tagger_version=tagger_version,
+            fused_heads=bool(self.get("fused_head_inference", False)),
+            session_cache_dir=os.path.join(str(self.get("cache_dir", "/app/config/cache")), "onnx_graphs"),
+            warmup_workers=int(self.get("model_warmup_workers", 0) or 0) or default_warmup_workers(),
+            worker_count=self.get_worker_count("tagger"),
+            thread_autotune=bool(self.get("cpu_thread_autotune", True)),
+            embedding_store_dir=os.path.join(str(self.get("cache_dir", "/app/config/cache")), "embeddings")
+            if self.get("store_backbone_embeddings", False)
+            else None,
+            streaming_decode=bool(self.get("streaming_decode", False)),
         )
@@ -30,6 +30,10 @@ HealthMonitor EMITS:
    health checks, callbacks, or state transitions occur.
 
 3. EOF on pipe → dead (from any state except failed).
+
+4. A frame may carry a ``metrics`` snapshot (see ``metrics_helper``); the
+   latest one per component is kept for the metrics endpoint, whatever the
+   frame's status.
 """
 
 from __future__ import annotations
@@ -43,6 +47,7 @@ from dataclasses import dataclass, field
 from multiprocessing.connection import wait
 from typing import TYPE_CHECKING, Any
 
+from nomarr.components.platform.health_history_comp import HealthHistoryWriter, HealthSnapshot
 from nomarr.helpers.dto.health_dto import (
     ComponentLifecycleHandler,
     ComponentPolicy,
@@ -65,7 +70,9 @@ class HealthMonitorConfig:
     """Configuration for HealthMonitorService."""
 
     monitor_poll_timeout_s: float = 1.0  # Timeout for pipe polling
-    history_snapshot_interval_s: int = 30  # Seconds between DB history writes
+    history_snapshot_interval_s: int = 30  # Seconds between DB history flushes
+    history_stale_heartbeat_s: int = 120  # Re-record an unchanged component once its heartbeat is this old
+    history_retention_s: int = 7 * 24 * 3600  # health_history TTL
 
 
 @dataclass
@@ -81,6 +88,7 @@ class _ComponentState:
     startup_deadline: InternalSeconds | None = None
     recovery_deadline: InternalSeconds | None = None
     reported_recover_for_s: float | None = None
+    metrics: dict[str, Any] | None = None  # Latest metrics snapshot sent with a frame
 
 
 class HealthMonitorService:
@@ -95,7 +103,9 @@ class HealthMonitorService:
     - Owns status registry; domain owns restart/backoff/failure decisions
     - Never calls Process/Thread lifecycle methods
     - Never holds Process/Thread references (tracks by component_id string)
-    - DB writes are history-only and best-effort
+    - DB writes are history-only and best-effort: a HealthHistoryWriter
+      buffers transitions and changed/stale snapshots, flushed in one bulk
+      insert per history tick
     - Calling set_failed permanently transitions the component to failed;
       no further health checks, callbacks, or state transitions occur.
     """
@@ -110,6 +120,15 @@ class HealthMonitorService:
         """
         self.cfg = cfg
         self.db = db
+        self._history = (
+            HealthHistoryWriter(
+                db,
+                retention_s=cfg.history_retention_s,
+                stale_heartbeat_s=cfg.history_stale_heartbeat_s,
+            )
+            if db
+            else None
+        )
 
         # Component state: component_id -> _ComponentState
         self._components: dict[str, _ComponentState] = {}
@@ -182,6 +201,8 @@ class HealthMonitorService:
             if state:
                 with contextlib.suppress(Exception):
                     state.pipe_conn.close()
+        if self._history:
+            self._history.forget(component_id)
 
         logger.debug("[HealthMonitor] Unregistered component: %s", component_id)
 
@@ -240,6 +261,15 @@ class HealthMonitorService:
         with self._lock:
             return {cid: state.status for cid, state in self._components.items()}
 
+    def get_metrics_snapshots(self) -> dict[str, dict[str, Any]]:
+        """Get the latest metrics snapshot of every component that sent one.
+
+        Snapshots are cumulative, so a dead component's last snapshot stays
+        valid until the component is unregistered or re-registered.
+        """
+        with self._lock:
+            return {cid: state.metrics for cid, state in self._components.items() if state.metrics is not None}
+
     # ---------------------------- Lifecycle ----------------------------------
 
     def start(self) -> None:
@@ -286,6 +316,8 @@ class HealthMonitorService:
             self._monitor_thread.join(timeout=2)
         if self._history_thread:
             self._history_thread.join(timeout=2)
+        if self._history:
+            self._history.flush()
 
         logger.info("[HealthMonitor] Stopped")
 
@@ -354,6 +386,9 @@ class HealthMonitorService:
             frame = json.loads(json_str)
             reported_status = frame.get("status")
             recover_for_s = frame.get("recover_for_s")
+            metrics = frame.get("metrics")
+            if isinstance(metrics, dict):
+                self._store_metrics(component_id, metrics)
 
             if reported_status == "healthy":
                 self._transition_to_healthy(component_id)
@@ -364,6 +399,13 @@ class HealthMonitorService:
         except json.JSONDecodeError:
             logger.warning("Dropped malformed HEALTH frame from %s", component_id)
 
+    def _store_metrics(self, component_id: str, metrics: dict[str, Any]) -> None:
+        """Keep the latest metrics snapshot of a component."""
+        with self._lock:
+            state = self._components.get(component_id)
+            if state:
+                state.metrics = metrics
+
     def _transition_to_healthy(self, component_id: str) -> None:
         """Transition component to healthy status."""
         with self._lock:
@@ -520,6 +562,9 @@ class HealthMonitorService:
         state: _ComponentState,
     ) -> None:
         """Emit status change callback to handler."""
+        if self._history:
+            self._history.record_transition(self._snapshot(component_id, new_status, state.last_frame_time))
+
         context = StatusChangeContext(
             consecutive_misses=state.consecutive_misses,
             recovery_deadline=state.recovery_deadline.value if state.recovery_deadline else None,
@@ -534,9 +579,9 @@ class HealthMonitorService:
     # ------------------------- History Writer --------------------------------
 
     def _history_write_loop(self) -> None:
-        """Periodically write status snapshots to DB for history."""
+        """Periodically buffer changed snapshots and flush them to DB for history."""
         while not self._stop_event.is_set():
-            if self.db:
+            if self._history:
                 self._write_history_snapshot()
 
             # Sleep in small intervals for faster shutdown
@@ -546,28 +591,30 @@ class HealthMonitorService:
                 time.sleep(1)
 
     def _write_history_snapshot(self) -> None:
-        """Write current statuses to DB for history/diagnostics.
+        """Flush buffered transitions plus changed or stale statuses in one insert.
 
         This is write-only and best-effort. Failures do not affect health decisions.
         """
-        if not self.db:
+        if not self._history:
             return
 
         try:
             with self._lock:
                 snapshot = [(cid, state.status, state.last_frame_time) for cid, state in self._components.items()]
 
-            for component_id, status, last_time in snapshot:
-                try:
-                    # Convert monotonic time to wall-clock for DB storage
-                    wall_ms = to_wall_ms(internal_s_to_ms(last_time))
-                    self.db.health.update_health_snapshot(
-                        component_id=component_id,
-                        status=status,
-                        timestamp=wall_ms.value,
-                    )
-                except Exception as e:
-                    logger.debug("[HealthMonitor] History write failed for %s: %s", component_id, e)
+            self._history.observe([self._snapshot(cid, status, last_time) for cid, status, last_time in snapshot])
+            self._history.flush()
 
         except Exception as e:
             logger.debug("[HealthMonitor] History snapshot failed: %s", e)
+
+    @staticmethod
+    def _snapshot(component_id: str, status: str, last_frame_time: InternalSeconds) -> HealthSnapshot:
+        # Convert monotonic time to wall-clock for DB storage
+        return HealthSnapshot(
+            component_id=component_id,
+            status=status,
+            last_heartbeat_ms=to_wall_ms(internal_s_to_ms(last_frame_time)).value,
+            heartbeat_age_s=internal_s().value - last_frame_time.value,
+            last_frame_time=last_frame_time,
+        )
@@ -19,6 +19,12 @@ from nomarr.components.platform.gpu_monitor_comp import (
     GPU_PROBE_INTERVAL_SECONDS,
     GPUHealthMonitor,
 )
+from nomarr.components.platform.pipeline_metrics_comp import (
+    PIPELINE_METRICS,
+    QUEUE_DEPTH,
+    VRAM_PROMISES,
+    new_pipeline_registry,
+)
 from nomarr.helpers.dto.health_dto import ComponentLifecycleHandler, ComponentPolicy
 from nomarr.helpers.dto.info_dto import (
     ConfigInfo,
@@ -30,6 +36,7 @@ from nomarr.helpers.dto.info_dto import (
     SystemInfoResult,
     WorkerInfo,
 )
+from nomarr.helpers.metrics_helper import merge_snapshots, render_exposition
 
 if TYPE_CHECKING:
     from nomarr.services.infrastructure.health_monitor_svc import HealthMonitorService
@@ -354,3 +361,32 @@ class InfoService:
             error_summary=resource_data.get("error_summary"),
             monitor_healthy=monitor_healthy,
         )
+
+    def get_pipeline_metrics(self) -> str:
+        """Render pipeline metrics in the Prometheus text exposition format.
+
+        Merges the latest snapshot each worker sent with its health frames
+        (labelled ``worker``) and reads queue depth and the VRAM promise
+        count from the database. A failed gauge query leaves that gauge out
+        rather than failing the scrape.
+
+        Returns:
+            Exposition text
+
+        """
+        gauges = new_pipeline_registry()
+        try:
+            gauges.set(QUEUE_DEPTH, self.cfg.db.file_states.count_untagged_files(), {"queue": "untagged"})
+            gauges.set(QUEUE_DEPTH, self.cfg.db.file_states.count_heads_stale_files(), {"queue": "heads_stale"})
+        except Exception as e:
+            logger.debug("[InfoService] Queue depth query failed: %s", e)
+        try:
+            gauges.set(VRAM_PROMISES, self.cfg.db.vram_promises.count())
+        except Exception as e:
+            logger.debug("[InfoService] VRAM promise count query failed: %s", e)
+
+        snapshots = self.cfg.health_monitor.get_metrics_snapshots() if self.cfg.health_monitor else {}
+        merged = merge_snapshots(
+            [({}, gauges.snapshot()), *(({"worker": cid}, snap) for cid, snap in sorted(snapshots.items()))]
+        )
+        return render_exposition(PIPELINE_METRICS, merged)
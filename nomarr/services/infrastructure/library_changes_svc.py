@@ -0,0 +1,114 @@
+"""In-memory mirror of the per-library change counters.
+
+Tag writes, scans and calibration bump counters in ``library_changes`` from
+whichever process makes the write (API, background tasks, discovery
+workers). This service polls all counters in one small query every
+``refresh_interval_s`` so request handlers can read a library's version from
+memory: a poll that finds nothing changed never reaches the database.
+
+Versions are opaque strings, equal exactly when no bump happened in between.
+They start with a per-process epoch (a restart may deploy code that renders
+responses differently) and are ``None`` while the mirror is stale, which
+callers treat as "do not cache".
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from nomarr.helpers.time_helper import internal_ms, now_ms
+
+if TYPE_CHECKING:
+    from nomarr.persistence.db import Database
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LibraryChangesConfig:
+    """Configuration for LibraryChangesService."""
+
+    refresh_interval_s: float = 1.0
+    # Versions are withheld (no caching) once the last good refresh is this old
+    stale_after_s: float = 10.0
+
+
+class LibraryChangesService:
+    """Polls ``library_changes`` and serves versions from memory."""
+
+    def __init__(self, db: Database, cfg: LibraryChangesConfig | None = None) -> None:
+        """Initialize the service (call :meth:`start` to begin polling).
+
+        Args:
+            db: Database instance
+            cfg: Polling configuration
+
+        """
+        self.db = db
+        self.cfg = cfg or LibraryChangesConfig()
+        self._epoch = now_ms().value
+        self._versions: dict[str, int] = {}
+        self._refreshed_at: int | None = None  # internal ms of the last good refresh
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Load the counters and start the polling thread."""
+        if self._thread is not None:
+            return
+        self.refresh()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._poll_loop, name="LibraryChanges", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the polling thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.cfg.refresh_interval_s + 1)
+            self._thread = None
+
+    def refresh(self) -> bool:
+        """Reload every counter (one query).
+
+        Returns:
+            True if the counters were loaded
+
+        """
+        try:
+            versions = self.db.library_changes.get_versions()
+        except Exception as e:
+            logger.debug("[LibraryChanges] Refresh failed: %s", e)
+            return False
+        # Replace, never mutate: readers on other threads see one consistent dict
+        self._versions = versions
+        self._refreshed_at = internal_ms().value
+        return True
+
+    def version(self, library_id: str | None = None) -> str | None:
+        """Version of one library's data, or of everything when *library_id* is None.
+
+        The global version also moves with calibration state changes.
+
+        Args:
+            library_id: Library ``_id`` or ``_key``
+
+        Returns:
+            Opaque version string, or None while the counters are stale
+
+        """
+        if self._refreshed_at is None or internal_ms().value - self._refreshed_at > self.cfg.stale_after_s * 1000:
+            return None
+        versions = self._versions
+        if library_id is not None:
+            # Counters are keyed by library _key
+            return f"{self._epoch}.{versions.get(library_id.rpartition('/')[2], 0)}"
+        # Counters only grow, so their sum moves on every bump
+        return f"{self._epoch}.{sum(versions.values())}-{len(versions)}"
+
+    def _poll_loop(self) -> None:
+        while not self._stop_event.wait(self.cfg.refresh_interval_s):
+            self.refresh()
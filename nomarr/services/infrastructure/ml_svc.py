@@ -19,6 +19,7 @@ from nomarr.persistence.db import Database
 
 if TYPE_CHECKING:
     from nomarr.components.ml.onnx.ml_discovery_comp import HeadInfo
+    from nomarr.helpers.dto.ml_dto import ThreadTuningProfile
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +98,31 @@ class MLService:
         clear_model_vram_measurements(self.db)
         logger.info("[MLService] VRAM measurements cleared — probe will re-run on next worker start")
 
+    def get_thread_tunings(self) -> list[ThreadTuningProfile]:
+        """Return the stored CPU thread-tuning profiles of every host.
+
+        Each profile holds the thread pool chosen for one backbone, its
+        measured throughput and every candidate that was benchmarked.
+        """
+        from nomarr.components.ml.resources.ml_thread_tuning_comp import get_thread_tuning_profiles
+
+        return get_thread_tuning_profiles(self.db)
+
+    def clear_thread_tunings(self) -> int:
+        """Delete all CPU thread-tuning profiles.
+
+        The next discovery worker startup on a CPU-only host re-runs the
+        calibration.
+
+        Returns:
+            Number of profiles deleted.
+        """
+        from nomarr.components.ml.resources.ml_thread_tuning_comp import clear_thread_tuning
+
+        cleared = clear_thread_tuning(self.db)
+        logger.info("[MLService] Thread tuning cleared — calibration will re-run on next worker start")
+        return cleared
+
     def list_all_models(self) -> list[dict[str, Any]]:
         """Return all registered ML model vertices.
 
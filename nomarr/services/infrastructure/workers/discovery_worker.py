@@ -3,7 +3,8 @@
 Workers query library_files directly instead of polling a queue.
 Each worker claims exactly 1 file at a time using atomic claim documents.
 
-Health telemetry is sent via pipe to parent process (not DB).
+Health telemetry is sent via pipe to parent process (not DB). Each health
+frame also carries the worker's cumulative pipeline metrics snapshot.
 """
 
 from __future__ import annotations
@@ -19,13 +20,15 @@ from concurrent.futures import Future, ThreadPoolExecutor
 from multiprocessing import Event
 from typing import TYPE_CHECKING, Any
 
-from nomarr.helpers.time_helper import internal_s
+from nomarr.helpers.time_helper import internal_ms, internal_s
 
 if TYPE_CHECKING:
     from multiprocessing.synchronize import Event as EventType
 
     from nomarr.components.ml.onnx.ml_cache import ONNXModelCache
+    from nomarr.components.ml.vectors.ml_embedding_store_comp import EmbeddingStore
     from nomarr.helpers.dto.processing_dto import DeferredFileWrites, ProcessorConfig
+    from nomarr.helpers.metrics_helper import MetricsRegistry
     from nomarr.persistence.db import Database
 
 logger = logging.getLogger(__name__)
@@ -63,6 +66,7 @@ def _execute_deferred_writes(
     db: Database,
     writes: DeferredFileWrites,
     worker_id: str,
+    metrics: MetricsRegistry | None = None,
 ) -> None:
     """Execute deferred DB writes for one file on a background thread.
 
@@ -72,13 +76,17 @@ def _execute_deferred_writes(
     Segment stats are computed here (deferred from the ML hot path) so the
     pipeline doesn't pay numpy reduction costs per head during inference.
     mark_tagged only runs if prior writes succeeded. release_claim always runs.
+    When *metrics* is given, the whole sequence is recorded as the ``persist``
+    stage and a failure is counted as a ``persist_error`` outcome.
     """
     from nomarr.components.library.file_sync_comp import save_file_tags, set_chromaprint
     from nomarr.components.ml.inference.ml_segment_stats_comp import compute_segment_stats
+    from nomarr.components.platform.pipeline_metrics_comp import FILES_TOTAL, OUTCOME_PERSIST_ERROR, observe_stage
     from nomarr.components.tagging.tag_parsing_comp import parse_tag_values
     from nomarr.components.workers.worker_discovery_comp import release_claim
 
     file_id = writes.file_id
+    t_start = internal_ms()
     try:
         # 1. Parse and write ML prediction tags with nom: prefix
         parsed_nom_tags = parse_tag_values(writes.db_tags) if writes.db_tags else {}
@@ -124,6 +132,7 @@ def _execute_deferred_writes(
 
         # 5. All writes succeeded — mark file as tagged and vectors extracted
         db.file_states.set_tagged(file_id)
+        db.file_states.set_heads_current(file_id)
         db.file_states.set_vectors_extracted(file_id)
         logger.debug("[%s] Async writes done for %s (%d tags)", worker_id, writes.path, len(writes.db_tags))
     except Exception:
@@ -132,9 +141,13 @@ def _execute_deferred_writes(
         except Exception:
             logger.debug("[%s] Failed to set errored state for %s", worker_id, file_id, exc_info=True)
         logger.exception("[%s] Async write failed for %s — file will be retried", worker_id, writes.path)
+        if metrics is not None:
+            metrics.inc(FILES_TOTAL, labels={"outcome": OUTCOME_PERSIST_ERROR})
     finally:
         # 6. Always release claim so file is re-discoverable on failure
         release_claim(db, file_id)
+        if metrics is not None:
+            observe_stage(metrics, "persist", internal_ms().value - t_start.value)
 
 
 class DiscoveryWorker(multiprocessing.Process):
@@ -185,6 +198,7 @@ class DiscoveryWorker(multiprocessing.Process):
         self._stop_event = stop_event or Event()
         self._health_pipe = health_pipe
         self._current_status: str = "pending"  # Current health status for frame emission
+        self._metrics: MetricsRegistry | None = None  # Created in run(): holds a lock, which does not pickle
         self.execution_tier = execution_tier  # GPU/CPU tier from admission control
         self.prefer_gpu = prefer_gpu  # GPU preference from tier config
 
@@ -243,12 +257,14 @@ class DiscoveryWorker(multiprocessing.Process):
         if self._health_pipe is None:
             return
 
-        frame = HEALTH_FRAME_PREFIX + json.dumps(
-            {
-                "component_id": self.worker_id,
-                "status": status,
-            },
-        )
+        payload: dict[str, Any] = {
+            "component_id": self.worker_id,
+            "status": status,
+        }
+        if self._metrics is not None:
+            # Cumulative totals: a dropped frame loses nothing
+            payload["metrics"] = self._metrics.snapshot()
+        frame = HEALTH_FRAME_PREFIX + json.dumps(payload)
         try:
             self._health_pipe.send(frame)
         except (OSError, BrokenPipeError) as e:
@@ -286,14 +302,32 @@ class DiscoveryWorker(multiprocessing.Process):
 
         # Late imports to avoid import-time issues in subprocess
         from nomarr.components.ml.onnx.ml_session_comp import is_available as ml_is_available
+        from nomarr.components.platform.pipeline_metrics_comp import (
+            FILES_TOTAL,
+            OUTCOME_ERROR,
+            OUTCOME_HEADS_ONLY,
+            OUTCOME_SKIPPED,
+            OUTCOME_TAGGED,
+            new_pipeline_registry,
+            observe_stage,
+            record_processed_file,
+        )
         from nomarr.components.platform.resource_monitor_comp import check_resource_headroom
         from nomarr.components.workers.worker_discovery_comp import (
             discover_and_claim_file,
+            discover_and_claim_heads_stale_file,
             release_claim,
         )
         from nomarr.helpers.dto.processing_dto import ProcessorConfig, ResourceManagementConfig
         from nomarr.persistence.db import Database
         from nomarr.workflows.processing.process_file_wf import process_file_workflow
+        from nomarr.workflows.processing.reprocess_heads_wf import (
+            HeadReprocessPlan,
+            load_head_reprocess_plan,
+            reprocess_heads_workflow,
+        )
+
+        metrics = self._metrics = new_pipeline_registry()
 
         # Start health writer thread FIRST (sends pending frames via pipe)
         health_thread: threading.Thread | None = None
@@ -337,6 +371,17 @@ class DiscoveryWorker(multiprocessing.Process):
         # Get resource management config (may be None if disabled)
         rm_config: ResourceManagementConfig | None = config.resource_management
 
+        # Per-segment backbone embeddings for head-only reprocessing (opt-in)
+        embedding_store: EmbeddingStore | None = None
+        if config.embedding_store_dir:
+            from nomarr.components.ml.vectors.ml_embedding_store_comp import EmbeddingStore as _EmbeddingStore
+
+            try:
+                embedding_store = _EmbeddingStore(config.embedding_store_dir, config.models_dir)
+            except OSError as e:
+                logger.warning("[%s] Embedding store unavailable: %s", self.worker_id, e)
+        reprocess_plan: HeadReprocessPlan | None = None  # Loaded on the first heads-stale file
+
         # Mark as healthy now that preflight passed
         self._current_status = "healthy"
 
@@ -381,10 +426,17 @@ class DiscoveryWorker(multiprocessing.Process):
 
                 # Discover and claim next file
                 logger.debug("[%s] Polling for work...", self.worker_id)
+                t_claim = internal_ms()
                 file_id = discover_and_claim_file(
                     db,
                     self.worker_id,
                 )
+                # Untagged files first; then tagged files whose heads changed
+                heads_only = False
+                if file_id is None and embedding_store is not None:
+                    file_id = discover_and_claim_heads_stale_file(db, self.worker_id)
+                    heads_only = file_id is not None
+                observe_stage(metrics, "claim_wait", internal_ms().value - t_claim.value)
 
                 if file_id is None:
                     idle_consecutive_polls += 1
@@ -500,10 +552,45 @@ class DiscoveryWorker(multiprocessing.Process):
                             logger.info("[%s] Running per-model VRAM probe...", self.worker_id)
                             probe_all_models(db, config.models_dir)
                         _cache_device: _DevicePlacement = "gpu" if self.prefer_gpu else "cpu"
-                        onnx_cache = _ONNXModelCache(config.models_dir, _cache_device, db=db)
+                        _graph_cache = None
+                        if config.session_cache_dir and config.tagger_version != "unknown":
+                            from nomarr.components.ml.onnx.ml_graph_cache_comp import SessionGraphCache
+
+                            try:
+                                _graph_cache = SessionGraphCache(config.session_cache_dir, config.tagger_version)
+                            except OSError as e:
+                                logger.warning("[%s] Optimized graph cache unavailable: %s", self.worker_id, e)
+                        _session_threads = None
+                        if _cache_device == "cpu" and config.thread_autotune:
+                            from nomarr.components.ml.resources.ml_thread_tuning_comp import get_or_run_thread_tuning
+
+                            _session_threads = get_or_run_thread_tuning(
+                                db, config.models_dir, self.worker_id, config.worker_count
+                            )
+                        _warm_start = internal_ms()
+                        onnx_cache = _ONNXModelCache(
+                            config.models_dir,
+                            _cache_device,
+                            db=db,
+                            fuse_heads=config.fused_heads,
+                            graph_cache=_graph_cache,
+                            warmup_workers=config.warmup_workers,
+                            session_threads=_session_threads,
+                        )
                         from nomarr.components.ml.resources import ml_vram_coordinator_comp as _coordinator
+                        from nomarr.components.ml.resources.ml_timing_comp import build_warmup_summary
 
                         onnx_cache.warm = True
+                        _warmup = onnx_cache.last_warmup
+                        logger.info(
+                            "[%s] ONNX sessions warmed in %d ms (optimized graphs: %s) | %s",
+                            self.worker_id,
+                            internal_ms().value - _warm_start.value,
+                            f"{_graph_cache.hits} cached / {_graph_cache.misses} built" if _graph_cache else "off",
+                            build_warmup_summary(_warmup.load_ms, _warmup.wall_ms, _warmup.workers)
+                            if _warmup is not None
+                            else "no models",
+                        )
                         _fleet = _coordinator.get_fleet_vram_state(db)
                         _vram = _fleet["vram"]
                         _promises = _fleet["promises"]
@@ -556,13 +643,35 @@ class DiscoveryWorker(multiprocessing.Process):
 
                     # Run the processing workflow
                     assert onnx_cache is not None, "onnx_cache must be warmed before processing"
-                    result = process_file_workflow(
-                        path=file_path,
-                        config=config,
-                        db=db,
-                        file_id=file_id,
-                        cache=onnx_cache,
-                    )
+                    if heads_only:
+                        assert embedding_store is not None
+                        if reprocess_plan is None:
+                            reprocess_plan = load_head_reprocess_plan(db, config.models_dir)
+                        heads_result = reprocess_heads_workflow(
+                            path=file_path,
+                            config=config,
+                            cache=onnx_cache,
+                            db=db,
+                            file_id=file_id,
+                            store=embedding_store,
+                            plan=reprocess_plan,
+                        )
+                        if heads_result is None:
+                            # No stored embeddings — queue the file for full reprocessing
+                            logger.debug("[%s] No stored embeddings for %s, retagging", self.worker_id, file_path)
+                            db.file_states.set_not_tagged(file_id)
+                            release_claim(db, file_id)
+                            continue
+                        result = heads_result
+                    else:
+                        result = process_file_workflow(
+                            path=file_path,
+                            config=config,
+                            db=db,
+                            file_id=file_id,
+                            cache=onnx_cache,
+                            embedding_store=embedding_store,
+                        )
                     logger.debug("[%s] Workflow returned for %s", self.worker_id, file_path)
                     # Large per-track allocations (audio waveform, mel spectrogram, backbone
                     # embeddings) are freed when process_file_workflow returns.  Trim the
@@ -584,7 +693,9 @@ class DiscoveryWorker(multiprocessing.Process):
                             file_path,
                         )
                         db.file_states.set_tagged(file_id)
+                        db.file_states.set_heads_current(file_id)
                         release_claim(db, file_id)
+                        record_processed_file(metrics, result.timings, result.elapsed * 1000, OUTCOME_SKIPPED)
                         files_processed += 1
                         consecutive_errors = 0
                     elif result.deferred_writes is not None:
@@ -594,6 +705,13 @@ class DiscoveryWorker(multiprocessing.Process):
                             db,
                             result.deferred_writes,
                             self.worker_id,
+                            metrics,
+                        )
+                        record_processed_file(
+                            metrics,
+                            result.timings,
+                            result.elapsed * 1000,
+                            OUTCOME_HEADS_ONLY if heads_only else OUTCOME_TAGGED,
                         )
                         files_processed += 1
                         consecutive_errors = 0
@@ -617,6 +735,7 @@ class DiscoveryWorker(multiprocessing.Process):
                 except Exception as e:
                     logger.exception("[%s] Error processing %s: %s", self.worker_id, file_id, e)
                     consecutive_errors += 1
+                    metrics.inc(FILES_TOTAL, labels={"outcome": OUTCOME_ERROR})
 
                     # Mark file as errored so discovery skips it on next poll
                     try:
@@ -1,9 +1,23 @@
 """Workflows package.
 
 Top-level exports of commonly used workflows.
+
+Exports are resolved lazily (see ``lazy_exports``).
 """
 
-from .processing.process_file_wf import process_file_workflow
+from typing import TYPE_CHECKING
+
+from nomarr.helpers.lazy_exports_helper import lazy_exports
+
+if TYPE_CHECKING:
+    from .processing.process_file_wf import process_file_workflow
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".processing.process_file_wf": ["process_file_workflow"],
+    },
+)
 
 __all__ = [
     "process_file_workflow",
@@ -27,6 +27,8 @@ def validate_library_tags_workflow(
     at least one tag edge for every discovered head (model_key + label) under
     the namespace.  Missing any head rel marks the file incomplete.  Auto-repair
     removes the ``tagged`` edge so the file is rediscovered for tagging.
+    Files in the ``heads_stale`` state are left alone: their missing heads are
+    applied by head-only reprocessing (see ``reprocess_heads_wf``).
     """
     heads = discover_heads(models_dir, db)
     expected_heads: list[dict[str, Any]] = []
@@ -69,8 +71,11 @@ def validate_library_tags_workflow(
     repaired = 0
     if auto_repair and incomplete:
         file_ids = [row["file_id"] for row in incomplete]
-        db.file_states.clear_tagged_batch(file_ids)
-        repaired = len(incomplete)
+        heads_pending = db.file_states.filter_heads_stale_file_ids(file_ids)
+        file_ids = [file_id for file_id in file_ids if file_id not in heads_pending]
+        if file_ids:
+            db.file_states.clear_tagged_batch(file_ids)
+        repaired = len(file_ids)
 
     return {
         "files_checked": len(results),
@@ -3,16 +3,22 @@
 Resolves a Navidrome song ID to a Nomarr file, retrieves its vector
 embedding from the cold collection, runs approximate nearest neighbor
 search, maps results back to Navidrome IDs, and enriches with metadata.
+
+When a ``LocalVectorIndexCache`` is supplied, the seed library's in-process
+index is taken from it and the seed lookup and the neighbour search run
+against that index instead of ArangoDB.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict
 
 from nomarr.helpers.vector_params_helper import compute_nlists, compute_nprobe
 
 if TYPE_CHECKING:
+    from nomarr.components.ml.vectors.ml_vector_local_index_comp import LocalVectorIndexCache
+    from nomarr.components.ml.vectors.ml_vector_search_params_comp import VectorSearchParamsCache
     from nomarr.persistence.db import Database
 
 logger = logging.getLogger(__name__)
@@ -35,6 +41,8 @@ def find_similar_tracks(
     db: Database,
     vector_group_size: int = 15,
     vector_search_thoroughness: int = 10,
+    index_cache: LocalVectorIndexCache | None = None,
+    params_cache: VectorSearchParamsCache | None = None,
 ) -> list[SimilarTrackResult]:
     """Find tracks similar to a Navidrome seed track.
 
@@ -53,6 +61,13 @@ def find_similar_tracks(
         db: Database instance for persistence access.
         vector_group_size: Songs per neighbourhood for nLists calculation.
         vector_search_thoroughness: Percentage of neighbourhoods to probe (1-100).
+        index_cache: Optional in-process index cache. When it holds an index
+            for the seed's backbone and library, that index replaces the
+            cold-collection lookup and ANN query (and also covers tracks
+            still in the hot collection).
+        params_cache: Optional per-collection search-parameter cache. When
+            given, nProbe comes from the index's recorded nLists instead of
+            a ``count()`` round trip per request.
 
     Returns:
         List of similar tracks with Navidrome IDs and metadata,
@@ -78,26 +93,38 @@ def find_similar_tracks(
 
     logger.debug("Resolved library_key=%s for file_id %s", library_key, seed_file_id)
 
-    # 2. Get seed vector from cold collection
+    # 2. Get seed vector (local index first, then cold collection)
+    local_index = index_cache.get(db, backbone_id, library_key) if index_cache is not None else None
     cold_ops = db.get_vectors_track_cold(backbone_id, library_key)
-    seed_doc = cold_ops.get_vector(seed_file_id)
-
-    if seed_doc is None:
-        msg = (
-            f"No vector embedding found for file '{seed_file_id}' "
-            f"with backbone '{backbone_id}'. Ensure ML processing has completed."
-        )
-        raise ValueError(msg)
+    local_vector = local_index.get_vector(seed_file_id) if local_index is not None else None
+    if local_vector is not None:
+        seed_vector: list[float] = local_vector.tolist()
+    else:
+        seed_doc = cold_ops.get_vector(seed_file_id)
+
+        if seed_doc is None:
+            msg = (
+                f"No vector embedding found for file '{seed_file_id}' "
+                f"with backbone '{backbone_id}'. Ensure ML processing has completed."
+            )
+            raise ValueError(msg)
 
-    seed_vector: list[float] = seed_doc["vector_n"]
+        seed_vector = seed_doc["vector_n"]
     logger.debug("Seed vector retrieved, dim=%d", len(seed_vector))
 
-    # 3. ANN search on cold collection (over-fetch to compensate for unmapped results)
+    # 3. ANN search (over-fetch to compensate for unmapped results)
     fetch_limit = count * 2 + 1  # +1 for potential self-match
-    doc_count = cold_ops.count()
-    nlists = compute_nlists(doc_count, vector_group_size)
-    nprobe = compute_nprobe(nlists, vector_search_thoroughness)
-    raw_results = cold_ops.search_similar(seed_vector, fetch_limit, nprobe=nprobe)
+    raw_results: list[dict[str, Any]]
+    if local_index is not None:
+        raw_results = [{"file_id": fid, "score": score} for fid, score in local_index.search(seed_vector, fetch_limit)]
+    else:
+        params = params_cache.get(db, backbone_id, library_key) if params_cache is not None else None
+        if params is not None:
+            nprobe = params.nprobe(vector_search_thoroughness)
+        else:
+            nlists = compute_nlists(cold_ops.count(), vector_group_size)
+            nprobe = compute_nprobe(nlists, vector_search_thoroughness)
+        raw_results = cold_ops.search_similar(seed_vector, fetch_limit, nprobe=nprobe)
 
     # Exclude the seed track itself from results
     results = [r for r in raw_results if r["file_id"] != seed_file_id]
@@ -0,0 +1,113 @@
+"""Regenerate personal playlists for every Navidrome user in one pass.
+
+Batch counterpart of :mod:`generate_playlists_wf` for scheduled runs.
+Per-library work is hoisted out of the per-user loop: stored taste
+profiles are prefetched in one query and the cold collection's search
+parameters are resolved once, so each user costs roughly one ANN query
+plus one metadata batch.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from nomarr.components.ml.vectors.ml_vector_search_params_comp import VectorSearchParamsCache
+from nomarr.components.navidrome.taste_profile_comp import load_taste_profile
+from nomarr.helpers.time_helper import internal_ms
+from nomarr.workflows.navidrome.generate_playlists_wf import generate_playlists
+
+if TYPE_CHECKING:
+    from nomarr.helpers.dto.navidrome_dto import NavidromePersonalPlaylistEntry
+    from nomarr.persistence.db import Database
+
+logger = logging.getLogger(__name__)
+
+
+def generate_all_user_playlists(
+    db: Database,
+    *,
+    backbone_id: str,
+    library_key: str,
+    enabled_types: list[str],
+    half_life_days: float,
+    top_n: int,
+    max_songs: int,
+    min_play_count: int,
+    min_songs: int,
+    max_genre_playlists: int = 5,
+    params_cache: VectorSearchParamsCache | None = None,
+) -> dict[str, list[NavidromePersonalPlaylistEntry]]:
+    """Generate personal playlists for every user with play data.
+
+    Pipeline:
+        1. List users from play-count buckets.
+        2. Prefetch stored taste profiles for the backbone+library.
+        3. Run :func:`generate_playlists` per user, reusing the prefetched
+           profile (users without one are seeded on the fly) and a shared
+           search-parameter cache.
+
+    A failure for one user is logged and does not stop the batch.
+
+    Args:
+        db: Database instance.
+        backbone_id: Vector backbone identifier.
+        library_key: ArangoDB ``_key`` of the library document.
+        enabled_types: Which playlist types to generate.
+        half_life_days: Recency half-life for taste profiles.
+        top_n: Max tracks to consider when seeding a taste profile.
+        max_songs: Maximum tracks per playlist.
+        min_play_count: Minimum plays for a track to count.
+        min_songs: Minimum tracks for a playlist to be kept.
+        max_genre_playlists: Maximum genre-specific playlists per user.
+        params_cache: Optional shared search-parameter cache; a batch-local
+            cache is used when ``None``.
+
+    Returns:
+        Mapping of user ID → generated playlists (empty list when a user has
+        no usable profile or generation failed).
+
+    """
+    start = internal_ms()
+
+    # Step 1: Users with play data
+    user_ids = db.navidrome_playcounts.list_user_ids()
+    if not user_ids:
+        logger.info("generate_all_user_playlists: no users with play data")
+        return {}
+
+    # Step 2: One query for every stored profile of this backbone+library
+    stored = db.navidrome_taste_profiles.get_profiles(backbone_id, library_key)
+    shared_params = params_cache if params_cache is not None else VectorSearchParamsCache()
+
+    # Step 3: Per-user generation
+    results: dict[str, list[NavidromePersonalPlaylistEntry]] = {}
+    for user_id in user_ids:
+        try:
+            results[user_id] = generate_playlists(
+                db,
+                user_id=user_id,
+                backbone_id=backbone_id,
+                library_key=library_key,
+                enabled_types=enabled_types,
+                half_life_days=half_life_days,
+                top_n=top_n,
+                max_songs=max_songs,
+                min_play_count=min_play_count,
+                min_songs=min_songs,
+                max_genre_playlists=max_genre_playlists,
+                params_cache=shared_params,
+                profile=load_taste_profile(stored.get(user_id), half_life_days, top_n),
+            )
+        except Exception:
+            logger.exception("generate_all_user_playlists: generation failed for user %s", user_id)
+            results[user_id] = []
+
+    logger.info(
+        "generate_all_user_playlists: %d users, %d with playlists, %d stored profiles reused in %dms",
+        len(user_ids),
+        sum(1 for playlists in results.values() if playlists),
+        len(stored),
+        internal_ms().value - start.value,
+    )
+    return results
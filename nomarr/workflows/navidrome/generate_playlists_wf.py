@@ -1,7 +1,8 @@
 """Generate personal playlists for a Navidrome user from taste profile.
 
 Produces multiple playlist types (Familiar, Discovery, Hidden Gems,
-Universal) via vector ANN search on cold collections.
+Universal) from one shared, over-fetched ANN candidate pool on the cold
+collection; genre playlists add one query per genre centroid.
 """
 
 from __future__ import annotations
@@ -9,14 +10,16 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from nomarr.components.ml.vectors.ml_vector_search_params_comp import get_vector_search_params
 from nomarr.components.navidrome.playlist_builder_comp import (
+    build_candidate_pool,
     build_discovery_playlist,
     build_familiar_playlist,
     build_genre_playlists,
     build_hidden_gems_playlist,
     build_universal_playlist,
 )
-from nomarr.components.navidrome.taste_profile_comp import compute_taste_profile
+from nomarr.components.navidrome.taste_profile_comp import get_taste_profile
 from nomarr.helpers.dto.navidrome_dto import (
     NavidromePersonalPlaylistContext,
     NavidromePersonalPlaylistEntry,
@@ -24,6 +27,8 @@ from nomarr.helpers.dto.navidrome_dto import (
 )
 
 if TYPE_CHECKING:
+    from nomarr.components.ml.vectors.ml_vector_search_params_comp import VectorSearchParamsCache
+    from nomarr.helpers.dto.navidrome_dto import TasteProfile
     from nomarr.persistence.db import Database
 
 logger = logging.getLogger(__name__)
@@ -50,15 +55,19 @@ def generate_playlists(
     min_play_count: int,
     min_songs: int,
     max_genre_playlists: int = 5,
+    params_cache: VectorSearchParamsCache | None = None,
+    profile: TasteProfile | None = None,
 ) -> list[NavidromePersonalPlaylistEntry]:
     """Generate personal playlists for *user_id*.
 
     Pipeline:
-        1. Compute taste profile (centroid) from play history.
+        1. Load the persisted taste profile (seeded from play history on first use).
         2. Fetch user's played tracks, filter by ``min_play_count``.
-        3. Build ``NavidromePersonalPlaylistContext``.
-        4. Dispatch each enabled playlist type to its component builder.
-        5. Filter out playlists below ``min_songs``.
+        3. Resolve the cold collection's recorded search parameters.
+        4. Build the shared candidate pool (one ANN query + one metadata batch).
+        5. Build ``NavidromePersonalPlaylistContext``.
+        6. Dispatch each enabled playlist type to its component builder.
+        7. Filter out playlists below ``min_songs``.
 
     Args:
         db: Database instance.
@@ -72,20 +81,25 @@ def generate_playlists(
         min_play_count: Minimum plays for a track to count.
         min_songs: Minimum tracks for a playlist to be kept.
         max_genre_playlists: Maximum genre-specific playlists to generate (hard cap: 25).
+        params_cache: Optional per-collection search-parameter cache; read
+            directly from ``meta`` when ``None``.
+        profile: Already-loaded taste profile (batch generation prefetches
+            them); loaded from the profile store when ``None``.
 
     Returns:
         List of generated playlists with ``library_files/_id`` track lists.
 
     """
-    # Step 1: Compute taste profile
-    profile = compute_taste_profile(
-        db=db,
-        user_id=user_id,
-        backbone_id=backbone_id,
-        library_key=library_key,
-        half_life_days=half_life_days,
-        top_n=top_n,
-    )
+    # Step 1: Load (or seed) the persisted taste profile
+    if profile is None:
+        profile = get_taste_profile(
+            db=db,
+            user_id=user_id,
+            backbone_id=backbone_id,
+            library_key=library_key,
+            half_life_days=half_life_days,
+            top_n=top_n,
+        )
     if profile is None:
         logger.warning(
             "No taste profile for playlist generation — returning empty",
@@ -104,7 +118,30 @@ def generate_playlists(
     ]
     played_file_ids: list[str] = [p["file_id"] for p in played_tracks if p["file_id"] is not None]
 
-    # Step 3: Build context DTO
+    # Step 3: Resolve cold search parameters once for all builders
+    params = (
+        params_cache.get(db, backbone_id, library_key)
+        if params_cache is not None
+        else get_vector_search_params(db, backbone_id, library_key)
+    )
+
+    cold_doc_count = params.doc_count if params is not None else 0
+    nprobe = params.nprobe() if params is not None else 1
+
+    # Step 4: Shared candidate generation for all builders
+    pool = build_candidate_pool(
+        db,
+        backbone_id=backbone_id,
+        library_key=library_key,
+        centroid=profile["centroid"],
+        nprobe=nprobe,
+        cold_doc_count=cold_doc_count,
+        max_songs=max_songs,
+        enabled_types=enabled_types,
+        played_file_ids=played_file_ids,
+    )
+
+    # Step 5: Build context DTO
     ctx = NavidromePersonalPlaylistContext(
         backbone_id=backbone_id,
         library_key=library_key,
@@ -114,9 +151,12 @@ def generate_playlists(
         played_tracks=played_tracks,
         max_genre_playlists=max_genre_playlists,
         half_life_days=half_life_days,
+        cold_doc_count=cold_doc_count,
+        nprobe=nprobe,
+        pool=pool,
     )
 
-    # Step 4: Dispatch enabled types to component builders
+    # Step 6: Dispatch enabled types to component builders
     playlists: list[NavidromePersonalPlaylistEntry] = []
 
     for playlist_type in enabled_types:
@@ -135,7 +175,7 @@ def generate_playlists(
             continue
         playlists.extend(builder(db, ctx))
 
-    # Step 5: Filter out playlists below min_songs
+    # Step 7: Filter out playlists below min_songs
     playlists_before_filter = len(playlists)
     playlists = [p for p in playlists if len(p["file_ids"]) >= min_songs]
 
@@ -2,7 +2,8 @@
 
 Receives a Navidrome scrobble (user + track + timestamp), deduplicates
 within a 30-second window, and atomically increments the play count.
-File resolution is attempted for observability but never blocks.
+When the track resolves to a library file, its embedding is folded into
+the user's persisted taste profiles.  Neither step blocks ingestion.
 """
 
 from __future__ import annotations
@@ -11,6 +12,8 @@ import logging
 import threading
 from typing import TYPE_CHECKING
 
+from nomarr.components.navidrome.taste_profile_comp import record_play
+
 if TYPE_CHECKING:
     from nomarr.persistence.db import Database
 
@@ -29,7 +32,8 @@ def ingest_scrobble(db: Database, user_id: str, nd_id: str, timestamp_ms: int) -
         1. Dedup check — skip if same (user, track) within 30 s.
         2. Upsert track vertex.
         3. Atomically increment play count (creates bucket vertex if needed).
-        4. Attempt file resolution (log-only, never blocks).
+        4. Attempt file resolution.
+        5. Fold the play into stored taste profiles (never blocks).
 
     Args:
         db: Database instance.
@@ -56,11 +60,20 @@ def ingest_scrobble(db: Database, user_id: str, nd_id: str, timestamp_ms: int) -
     db.navidrome_tracks.upsert_track(nd_id)
 
     # Step 3: Atomically increment play count (creates bucket if needed)
-    db.navidrome_playcounts.increment_play(user_id, nd_id, timestamp_ms)
+    playcount = db.navidrome_playcounts.increment_play(user_id, nd_id, timestamp_ms)
 
-    # Step 4: Attempt file resolution (observability only)
+    # Step 4: Attempt file resolution
     file_id = db.navidrome_tracks.resolve_nd_to_file(nd_id)
-    if file_id:
-        logger.debug("Scrobble resolved: nd_id=%s -> %s", nd_id, file_id)
-    else:
+    if not file_id:
         logger.debug("Scrobble unresolved: nd_id=%s (no has_nd_id edge yet)", nd_id)
+        return
+    logger.debug("Scrobble resolved: nd_id=%s -> %s", nd_id, file_id)
+
+    # Step 5: Incremental taste-profile update (play count is already recorded)
+    try:
+        updated = record_play(db, user_id, file_id, playcount, timestamp_ms)
+    except Exception:
+        logger.warning("Taste-profile update failed for user=%s file=%s", user_id, file_id, exc_info=True)
+        return
+    if updated:
+        logger.debug("Scrobble folded into %d taste profile(s) for user=%s", updated, user_id)
@@ -6,6 +6,12 @@ resolves Navidrome file paths to Nomarr library_files, upserts
 ``navidrome_tracks`` vertices + ``has_nd_id`` edges, captures per-user play
 counts as ``has_plays`` edges, and removes orphaned tracks no longer present
 in Navidrome.
+
+Syncs are incremental: every album's change marker is recorded in
+``navidrome_albums``, so a repeat sync for the same user fetches and writes
+only new or changed albums, and finds orphan tracks in one server-side query.
+Albums whose file links went dead on the Nomarr side (a file removed and
+rescanned under a new ``_id``) have their marker cleared and are re-linked.
 """
 
 from __future__ import annotations
@@ -13,7 +19,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from nomarr.components.navidrome.subsonic_crawl_comp import crawl_navidrome_songs
+from nomarr.components.navidrome.subsonic_crawl_comp import crawl_navidrome_albums
 from nomarr.helpers.dto.navidrome_dto import NdSyncResult
 from nomarr.helpers.time_helper import internal_ms
 
@@ -27,17 +33,26 @@ logger = logging.getLogger(__name__)
 _UPSERT_BATCH_SIZE = 500
 _PREFIX_SAMPLE_SIZE = 20
 
+SYNC_USER_META_KEY = "navidrome_sync_user"
+PATH_PREFIX_META_KEY = "navidrome_path_prefix"
+
 
-def _detect_prefix(songs: list[CrawledSong], db: Database) -> str:
+def _detect_prefix(songs: list[CrawledSong], db: Database, fallback: str | None = None) -> str:
     """Auto-detect the Navidrome path prefix from a sample of crawled songs.
 
     Tries up to ``_PREFIX_SAMPLE_SIZE`` paths against library_files until one
     matches a ``normalized_path`` suffix.  Returns the detected prefix (e.g.
     ``"/music/"``) or ``""`` if the paths already match without stripping.
 
+    Args:
+        songs: Crawled songs to sample.
+        db: Database instance.
+        fallback: Prefix detected by an earlier sync, used when no sample
+            matches (a delta sync may only see songs Nomarr has not scanned yet).
+
     Raises:
-        ValueError: If no sample path matches any Nomarr file — library may
-            not have been scanned yet.
+        ValueError: If no sample path matches any Nomarr file and there is no
+            fallback — library may not have been scanned yet.
     """
     sample = [s["nd_path"] for s in songs[:_PREFIX_SAMPLE_SIZE]]
     for nd_path in sample:
@@ -45,6 +60,8 @@ def _detect_prefix(songs: list[CrawledSong], db: Database) -> str:
         if prefix is not None:
             logger.info("sync_navidrome: auto-detected path prefix %r", prefix)
             return prefix
+    if fallback is not None:
+        return fallback
     msg = (
         "Could not detect path prefix from Navidrome paths. "
         "Ensure the Nomarr library has been scanned before syncing. "
@@ -57,91 +74,144 @@ def sync_navidrome(
     client: SubsonicClient,
     db: Database,
     user_id: str,
+    *,
+    full: bool = False,
 ) -> NdSyncResult:
     """Sync Navidrome's song inventory into graph collections.
 
-    Walks all albums via ``getAlbumList2`` (paginated), fetches each album's
-    songs via ``getAlbum``, auto-detects the path prefix, resolves Nomarr
-    file IDs via ``db.library_files.get_files_by_paths_bulk()``, and writes
-    to ``navidrome_tracks``, ``has_nd_id``, ``navidrome_playcounts``, and
-    ``has_plays`` collections.  Orphan tracks (present in DB but absent from
-    Navidrome) are cascade-deleted.
+    Walks all albums via ``getAlbumList2`` (paginated) and fetches the songs
+    of new or changed albums via concurrent ``getAlbum`` requests.  For the
+    fetched songs it auto-detects the path prefix, resolves Nomarr file IDs
+    via ``db.library_files.get_files_by_paths_bulk()``, and writes to
+    ``navidrome_tracks``, ``has_nd_id``, ``navidrome_playcounts``, and
+    ``has_plays``.  Orphan tracks (listed by no Navidrome album) are
+    cascade-deleted.
+
+    The first sync, a sync for a different user, and ``full=True`` fetch
+    every album and rebuild the user's play data; later syncs replace only
+    the play data of fetched albums.  Albums with unresolved songs, or with
+    a song whose linked library file no longer exists, are fetched again on
+    every sync until they resolve.
 
     Args:
         client: Authenticated Subsonic API client.
         db: Database instance.
         user_id: Navidrome user identifier for play count attribution.
+        full: Ignore recorded album markers and fetch every album.
 
     Returns:
-        NdSyncResult with sync statistics.
+        NdSyncResult with sync statistics; song counts cover the whole
+        inventory, write counts only the fetched albums.
 
     """
     start_time = internal_ms()
 
-    # Step 1: Crawl all albums and collect song data
-    all_songs: list[CrawledSong] = crawl_navidrome_songs(client)
-
-    # Step 2: Auto-detect path prefix and strip it from all ND paths
-    nd_prefix = _detect_prefix(all_songs, db)
-    remapped_paths = [s["nd_path"].removeprefix(nd_prefix) for s in all_songs]
-    path_to_doc = db.library_files.get_files_by_paths_bulk(remapped_paths)
+    # Step 1: Crawl albums — only new or changed ones are fetched on a delta sync
+    recorded_markers = db.navidrome_albums.get_markers()
+    delta = not full and bool(recorded_markers) and db.meta.get(SYNC_USER_META_KEY) == user_id
+    if delta:
+        # Nomarr-side changes leave Navidrome's markers untouched: re-fetch albums with dead links
+        for album_id in db.navidrome_albums.clear_unlinked_markers():
+            recorded_markers[album_id] = ""
+    crawl = crawl_navidrome_albums(client, recorded_markers if delta else None)
+    fetched_songs = crawl.songs
+
+    # Step 2: Auto-detect path prefix and strip it from fetched ND paths
+    path_to_doc: dict[str, Any] = {}
+    nd_prefix = ""
+    if fetched_songs:
+        nd_prefix = _detect_prefix(fetched_songs, db, fallback=db.meta.get(PATH_PREFIX_META_KEY) if delta else None)
+        path_to_doc = db.library_files.get_files_by_paths_bulk(
+            [s["nd_path"].removeprefix(nd_prefix) for s in fetched_songs]
+        )
 
-    # Step 3: Build resolved mappings and play edge data
+    # Step 3: Build resolved mappings, play edge data and album records
     nd_ids: list[str] = []
     file_link_mappings: list[dict[str, str]] = []
     play_edges: list[dict[str, Any]] = []
-    seen_nd_ids: set[str] = set()
-    unresolved_count = 0
-
-    for song, remapped_path in zip(all_songs, remapped_paths, strict=True):
-        nd_id: str = song["nd_id"]
-        nd_ids.append(nd_id)
-        seen_nd_ids.add(nd_id)
-
-        doc = path_to_doc.get(remapped_path)
-        if doc:
-            file_link_mappings.append({"nd_id": nd_id, "file_id": doc["_id"]})
-        else:
-            unresolved_count += 1
-
-        if song["play_count"] > 0:
-            play_edges.append(
-                {
-                    "nd_id": nd_id,
-                    "playcount": song["play_count"],
-                    "last_played": song["last_played_ms"],
-                }
-            )
-
-    # Step 4: Upsert track vertices and file link edges (batched)
+    album_docs: list[dict[str, Any]] = []
+    fetched_unresolved = 0
+
+    for album_id, album_songs in crawl.songs_by_album.items():
+        album_resolved = 0
+        for song in album_songs:
+            nd_id: str = song["nd_id"]
+            nd_ids.append(nd_id)
+
+            doc = path_to_doc.get(song["nd_path"].removeprefix(nd_prefix))
+            if doc:
+                file_link_mappings.append({"nd_id": nd_id, "file_id": doc["_id"]})
+                album_resolved += 1
+
+            if song["play_count"] > 0:
+                play_edges.append(
+                    {
+                        "nd_id": nd_id,
+                        "playcount": song["play_count"],
+                        "last_played": song["last_played_ms"],
+                    }
+                )
+        fetched_unresolved += len(album_songs) - album_resolved
+        album_docs.append(
+            {
+                "_key": album_id,
+                # An empty marker never matches, so the album is re-fetched until every song resolves
+                "marker": crawl.markers[album_id] if album_resolved == len(album_songs) else "",
+                "song_ids": [song["nd_id"] for song in album_songs],
+                "resolved": album_resolved,
+            }
+        )
+
+    # Step 4: Upsert track vertices and file link edges (batched); drop links to deleted files
     tracks_upserted = 0
     for i in range(0, len(nd_ids), _UPSERT_BATCH_SIZE):
         tracks_upserted += db.navidrome_tracks.bulk_upsert_tracks(nd_ids[i : i + _UPSERT_BATCH_SIZE])
+        db.navidrome_tracks.prune_dead_file_links(nd_ids[i : i + _UPSERT_BATCH_SIZE])
 
     for i in range(0, len(file_link_mappings), _UPSERT_BATCH_SIZE):
         db.navidrome_tracks.bulk_ensure_file_links(file_link_mappings[i : i + _UPSERT_BATCH_SIZE])
 
-    # Step 5: Upsert play count data (wipe-and-rebuild for user)
-    play_edges_upserted = db.navidrome_playcounts.bulk_upsert_plays(user_id, play_edges)
-
-    # Step 6: Orphan cleanup — remove tracks no longer in Navidrome
-    all_db_track_keys = db.navidrome_tracks.get_all_track_keys()
-    orphan_keys = [k for k in all_db_track_keys if k not in seen_nd_ids]
+    # Step 5: Upsert play count data — replace fetched tracks' plays, or wipe-and-rebuild for user
+    if delta:
+        play_edges_upserted = db.navidrome_playcounts.replace_plays_for_tracks(user_id, nd_ids, play_edges)
+    else:
+        play_edges_upserted = db.navidrome_playcounts.bulk_upsert_plays(user_id, play_edges)
+
+    # Stored taste profiles were built from the replaced play data; reseed on next generation
+    if nd_ids or not delta:
+        db.navidrome_taste_profiles.delete_user_profiles(user_id)
+
+    # Step 6: Record album markers; forget albums Navidrome no longer lists
+    for i in range(0, len(album_docs), _UPSERT_BATCH_SIZE):
+        db.navidrome_albums.bulk_upsert_albums(album_docs[i : i + _UPSERT_BATCH_SIZE])
+    removed_albums = [album_id for album_id in recorded_markers if album_id not in crawl.markers]
+    db.navidrome_albums.delete_albums(removed_albums)
+    db.meta.set(SYNC_USER_META_KEY, user_id)
+    if fetched_songs:
+        db.meta.set(PATH_PREFIX_META_KEY, nd_prefix)
+
+    # Step 7: Orphan cleanup — remove tracks no recorded album lists (server-side)
+    orphan_keys = db.navidrome_albums.get_orphan_track_keys()
     orphans_removed = db.navidrome_tracks.delete_tracks_cascade(orphan_keys) if orphan_keys else 0
     if orphans_removed:
         logger.info("sync_navidrome: Removed %d orphan tracks", orphans_removed)
 
+    totals = db.navidrome_albums.get_totals()
     duration = internal_ms().value - start_time.value
 
-    if unresolved_count > 0:
+    if fetched_unresolved > 0:
         logger.warning(
-            "sync_navidrome: %d/%d songs could not be resolved to Nomarr files",
-            unresolved_count,
-            len(all_songs),
+            "sync_navidrome: %d/%d fetched songs could not be resolved to Nomarr files",
+            fetched_unresolved,
+            len(fetched_songs),
         )
 
     logger.info(
-        "sync_navidrome: Complete. %d tracks, %d resolved, %d play edges, %d orphans removed, %dms",
+        "sync_navidrome: Complete (%s). %d/%d albums fetched, %d tracks, %d resolved, %d play edges, "
+        "%d orphans removed, %dms",
+        "delta" if delta else "full",
+        len(crawl.songs_by_album),
+        len(crawl.markers),
         tracks_upserted,
         len(file_link_mappings),
         play_edges_upserted,
@@ -150,11 +220,13 @@ def sync_navidrome(
     )
 
     return NdSyncResult(
-        total_songs=len(all_songs),
-        resolved=len(file_link_mappings),
-        unresolved=unresolved_count,
+        total_songs=totals["songs"],
+        resolved=totals["resolved"],
+        unresolved=totals["songs"] - totals["resolved"],
         tracks_upserted=tracks_upserted,
         play_edges_upserted=play_edges_upserted,
         orphans_removed=orphans_removed,
         duration_ms=duration,
+        albums_fetched=len(crawl.songs_by_album),
+        albums_unchanged=len(crawl.markers) - len(crawl.songs_by_album),
     )
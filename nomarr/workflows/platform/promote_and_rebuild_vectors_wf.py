@@ -20,6 +20,10 @@ from nomarr.components.ml.vectors.ml_vector_maintenance_comp import (
     has_vector_index,
     verify_hot_empty,
 )
+from nomarr.components.ml.vectors.ml_vector_search_params_comp import (
+    clear_vector_search_params,
+    save_vector_search_params,
+)
 
 if TYPE_CHECKING:
     from nomarr.persistence.db import Database
@@ -103,6 +107,7 @@ def promote_and_rebuild_workflow(
     if index_exists_before:
         logger.info("[promote & rebuild] Dropping existing cold vector index")
         drop_cold_vector_index(db.db, backbone_id, library_key)
+        clear_vector_search_params(db, backbone_id, library_key)
 
     # Step 4: Drain hot → cold (convergent UPSERT)
     drained_count = drain_hot_to_cold(db.db, backbone_id, library_key)
@@ -141,6 +146,10 @@ def promote_and_rebuild_workflow(
         cold_count_after,
         index_exists_after,
     )
+
+    # Step 8: Record search parameters next to the index (read by search paths instead of count())
+    save_vector_search_params(db, backbone_id, library_key, nlists, cold_count_after)
+
     logger.info(
         "[promote & rebuild] Completed successfully for %s (library=%s)",
         backbone_id,
@@ -14,6 +14,7 @@ from nomarr.components.ml.vectors.ml_vector_maintenance_comp import (
     derive_embed_dim,
     rebuild_cold_vector_index,
 )
+from nomarr.components.ml.vectors.ml_vector_search_params_comp import save_vector_search_params
 
 if TYPE_CHECKING:
     from nomarr.persistence.db import Database
@@ -58,4 +59,7 @@ def rebuild_vector_index_workflow(
 
     rebuild_cold_vector_index(db.db, backbone_id, library_key, embed_dim, nlists)
 
+    doc_count = db.get_vectors_track_cold(backbone_id, library_key).count()
+    save_vector_search_params(db, backbone_id, library_key, nlists, doc_count)
+
     logger.info("[rebuild index wf] Completed for backbone=%s library=%s", backbone_id, library_key)
@@ -24,7 +24,7 @@ from nomarr.components.playlist_import.spotify_fetcher_comp import (
 )
 from nomarr.components.playlist_import.track_matcher_comp import (
     LibraryTrack,
-    match_tracks,
+    match_tracks_batched,
 )
 from nomarr.components.playlist_import.url_parser_comp import (
     ParsedPlaylistUrl,
@@ -95,7 +95,13 @@ def convert_playlist_workflow(
         raise PlaylistConversionError("No library tracks found. Import a library first.")
 
     # Step 4: Match tracks
-    match_results = match_tracks(input_tracks, library_tracks)
+    match_results, timings = match_tracks_batched(input_tracks, library_tracks)
+
+    logger.info(
+        f"Matched {len(input_tracks)} tracks in {timings.total_ms}ms "
+        f"(index {timings.index_ms}ms, exact {timings.exact_ms}ms, fuzzy {timings.fuzzy_ms}ms: "
+        f"{timings.fuzzy_tracks} tracks, {timings.scored_pairs} pairs scored)"
+    )
 
     # Step 5: Generate output
     m3u_content = _generate_m3u(metadata, match_results)
@@ -121,6 +127,7 @@ def convert_playlist_workflow(
         ambiguous_count=ambiguous,
         not_found_count=not_found,
         match_results=tuple(match_results),
+        match_timings=timings,
     )
 
 
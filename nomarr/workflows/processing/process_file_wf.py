@@ -17,11 +17,17 @@ from nomarr.components.infrastructure.path_comp import build_library_path_from_d
 from nomarr.components.ml.audio.ml_audio_comp import (
     AudioLoadCrashError,
     AudioLoadShutdownError,
+    AudioStreamUnavailableError,
     load_audio_mono,
     should_skip_short,
+    stream_audio_mono,
 )
 from nomarr.components.ml.audio.ml_chromaprint_comp import compute_chromaprint
-from nomarr.components.ml.inference.ml_backbone_embed_comp import compute_backbone_embeddings
+from nomarr.components.ml.inference.ml_backbone_embed_comp import (
+    StreamedBackboneEmbeddings,
+    compute_backbone_embeddings,
+    compute_backbone_embeddings_streaming,
+)
 from nomarr.components.ml.inference.ml_head_pipeline_comp import run_heads
 from nomarr.components.ml.onnx.ml_cache import ONNXModelCache
 from nomarr.components.ml.onnx.ml_discovery_comp import compute_model_suite_hash
@@ -35,6 +41,7 @@ from nomarr.helpers.time_helper import internal_ms
 
 logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
+    from nomarr.components.ml.vectors.ml_embedding_store_comp import EmbeddingStore
     from nomarr.helpers.dto.path_dto import LibraryPath
     from nomarr.persistence.db import Database
 
@@ -45,6 +52,7 @@ def process_file_workflow(
     cache: ONNXModelCache,
     db: Database | None = None,
     file_id: str | None = None,
+    embedding_store: EmbeddingStore | None = None,
 ) -> ProcessFileResult:
     """Run the full ML tagging pipeline for one audio file.
 
@@ -57,6 +65,8 @@ def process_file_workflow(
         db: Optional database instance. If provided, results are persisted.
         file_id: library_files document _id. Avoids path-based lookup when provided.
         cache: Pre-warmed ONNXModelCache. Created on demand if not provided.
+        embedding_store: Optional store for the per-segment backbone embeddings,
+            used by ``reprocess_heads_wf`` when only heads change later.
 
     Returns:
         ProcessFileResult with elapsed time, head outcomes, mood aggregations, and tags.
@@ -110,8 +120,19 @@ def process_file_workflow(
     t_audio_load = internal_ms()
     first_backbone = next(iter(heads_by_backbone))
     target_sr = cache.backbones[first_backbone].preprocess_params.sample_rate
+    # Streaming decode computes the embeddings while decoding; any decode
+    # problem falls back to the whole-file loader, which is authoritative
+    # for crash handling below.
+    streamed: StreamedBackboneEmbeddings | None = None
+    if config.streaming_decode:
+        try:
+            streamed = compute_backbone_embeddings_streaming(
+                cache, heads_by_backbone, stream_audio_mono(library_path, target_sr=target_sr), target_sr
+            )
+        except (AudioStreamUnavailableError, AudioLoadCrashError) as e:
+            logger.debug(f"[processor] Streaming decode failed for {path} ({e}) - decoding whole file")
     try:
-        shared_audio = load_audio_mono(library_path, target_sr=target_sr)
+        shared_audio = streamed.audio if streamed is not None else load_audio_mono(library_path, target_sr=target_sr)
     except AudioLoadShutdownError:
         raise
     except AudioLoadCrashError as e:
@@ -119,6 +140,8 @@ def process_file_workflow(
         if db:
             db.library_files.bulk_delete_files([path])
             logger.info(f"[processor] Deleted invalid file: {path}")
+        if embedding_store is not None and file_id is not None:
+            embedding_store.delete(file_id)
         elapsed = round((internal_ms().value - start_all.value) / 1000, 2)
         return ProcessFileResult(
             file_path=path,
@@ -148,7 +171,11 @@ def process_file_workflow(
     shared_chromaprint = compute_chromaprint(shared_audio.waveform, shared_audio.sample_rate)
     timings["audio_load"] = internal_ms().value - t_audio_load.value
     duration_final = float(shared_audio.duration)
-    embed_result = compute_backbone_embeddings(cache, heads_by_backbone, shared_audio.waveform)
+    embed_result = (
+        streamed.result
+        if streamed is not None
+        else compute_backbone_embeddings(cache, heads_by_backbone, shared_audio.waveform)
+    )
     timings.update(embed_result.timings)
 
     # Mark skipped heads from failed backbones
@@ -160,7 +187,7 @@ def process_file_workflow(
     for item in embed_result.embeddings:
         backbone, backbone_heads, embeddings_2d = item.backbone, item.heads, item.embeddings
         t_heads_start = internal_ms()
-        result = run_heads(backbone_heads, embeddings_2d, tags_accum)
+        result = run_heads(backbone_heads, embeddings_2d, tags_accum, cache.fused_heads.get(backbone))
         timings[f"heads_{backbone}"] = internal_ms().value - t_heads_start.value
         # Store per-head timings
         for head_name, head_time_ms in result.per_head_timings.items():
@@ -179,6 +206,10 @@ def process_file_workflow(
             )
             if elapsed_store is not None:
                 timings[f"vector_store_{backbone}"] = elapsed_store
+        if embedding_store is not None and file_id is not None:
+            t_embed_store = internal_ms()
+            if embedding_store.save(file_id, backbone, embeddings_2d):
+                timings[f"embedding_store_{backbone}"] = internal_ms().value - t_embed_store.value
         del embeddings_2d
         logger.debug(f"[processor] Released {backbone} embeddings from memory")
     if total_heads_succeeded == 0:
@@ -257,4 +288,5 @@ def process_file_workflow(
         tags=Tags.from_dict(dict(tags_accum)),
         timing_summary=timing_summary,
         deferred_writes=deferred,
+        timings=timings,
     )
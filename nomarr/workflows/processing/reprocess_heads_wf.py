@@ -0,0 +1,310 @@
+"""Head-only reprocessing workflow.
+
+When a head is added or replaced but every backbone graph is unchanged, the
+backbone embeddings of already tagged files are still valid.  This module
+detects such head-only suite changes and re-runs just the affected heads from
+the per-segment embeddings kept by :class:`EmbeddingStore`, skipping audio
+decode, chromaprint, log-mel and backbone inference entirely.
+
+Flow:
+
+1. ``detect_head_changes_workflow`` (startup) compares the installed suite
+   manifest with the one recorded in ``meta``.  On a head-only change it
+   records the pending heads and moves every ``heads_current`` file to
+   ``heads_stale``.
+2. Workers that find no untagged file claim a ``heads_stale`` file and run
+   ``reprocess_heads_workflow``.  Outputs of unchanged heads are rebuilt from
+   stored segment statistics so mood tiers are aggregated over every head,
+   exactly as a full run would.
+3. The returned deferred writes go through the normal write path, which
+   marks the file ``heads_current``.
+
+Files without stored embeddings make the workflow return ``None``; the caller
+falls back to full reprocessing.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+from nomarr.components.ml.inference.ml_head_pipeline_comp import run_heads
+from nomarr.components.ml.onnx.ml_discovery_comp import (
+    compute_model_suite_manifest,
+    diff_head_suites,
+    discover_heads,
+)
+from nomarr.components.processing.file_write_comp import get_nomarr_tags
+from nomarr.components.tagging.tagging_aggregation_comp import add_regression_mood_tiers, aggregate_mood_tiers
+from nomarr.components.tagging.tagging_reconstruction_comp import reconstruct_head_outputs_from_stats
+from nomarr.helpers.dto.ml_dto import HeadSuiteDelta, ModelSuiteManifest
+from nomarr.helpers.dto.ml_edge_dto import MLEdgeWrites
+from nomarr.helpers.dto.processing_dto import DeferredFileWrites, ProcessFileResult, ProcessorConfig
+from nomarr.helpers.dto.tags_dto import Tags
+from nomarr.helpers.time_helper import internal_ms
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from nomarr.components.ml.onnx.ml_cache import ONNXModelCache
+    from nomarr.components.ml.onnx.ml_head import ONNXHeadModel
+    from nomarr.components.ml.vectors.ml_embedding_store_comp import EmbeddingStore
+    from nomarr.persistence.db import Database
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_META_KEY = "ml_suite_manifest"
+PENDING_HEADS_META_KEY = "ml_heads_pending"
+
+_MOOD_KEYS = ("mood-strict", "mood-regular", "mood-loose")
+
+
+@dataclass
+class HeadReprocessPlan:
+    """Heads to re-run and the metadata of every installed head.
+
+    Built once per worker (see :func:`load_head_reprocess_plan`) and shared by
+    every file it reprocesses.
+    """
+
+    pending_heads: frozenset[str]  # head paths relative to models_dir
+    head_infos: list[Any]  # HeadInfo for every installed head (reconstruction)
+
+
+# ----------------------------------------------------------------------
+# Detection (startup)
+# ----------------------------------------------------------------------
+
+
+def detect_head_changes_workflow(
+    db: Database,
+    models_dir: str,
+    *,
+    reuse_embeddings: bool,
+) -> HeadSuiteDelta | None:
+    """Record the installed suite and flag tagged files after a head-only change.
+
+    The manifest is always recorded so a later change can be classified.
+    Files are only moved to ``heads_stale`` when *reuse_embeddings* is set;
+    otherwise (or when a backbone changed) the existing full-retag path
+    applies unchanged.
+
+    Args:
+        db: Database instance.
+        models_dir: Models directory.
+        reuse_embeddings: Whether workers keep per-segment embeddings.
+
+    Returns:
+        The head delta when files were flagged, else ``None``.
+
+    """
+    current = compute_model_suite_manifest(models_dir)
+    raw_previous = db.meta.get(MANIFEST_META_KEY)
+    db.meta.set(MANIFEST_META_KEY, json.dumps(asdict(current), sort_keys=True))
+    if not raw_previous or not current.heads:
+        return None
+    try:
+        previous = ModelSuiteManifest(**json.loads(raw_previous))
+    except (TypeError, ValueError):
+        logger.warning("[head-reprocess] Ignoring unreadable stored suite manifest")
+        return None
+
+    delta = diff_head_suites(previous, current)
+    if delta is None:
+        db.meta.delete(PENDING_HEADS_META_KEY)
+        logger.info("[head-reprocess] Backbone graphs changed — files need full reprocessing")
+        return None
+    if delta.is_empty:
+        return None
+    if not reuse_embeddings:
+        logger.info(
+            "[head-reprocess] %d head(s) changed but backbone embeddings are not stored — full reprocessing applies",
+            len(delta.changed_heads) + len(delta.removed_heads),
+        )
+        return None
+
+    # Files still stale from an earlier change keep that change's heads pending.
+    pending: set[str] = set(get_pending_heads(db)) if db.file_states.count_heads_stale_files() > 0 else set()
+    pending.update(delta.changed_heads)
+    pending.difference_update(delta.removed_heads)
+    db.meta.set(PENDING_HEADS_META_KEY, json.dumps(sorted(pending)))
+    flagged = db.file_states.bulk_set_heads_stale()
+    logger.info(
+        "[head-reprocess] Head-only suite change (%d changed, %d removed): %d file(s) queued for head reprocessing",
+        len(delta.changed_heads),
+        len(delta.removed_heads),
+        flagged,
+    )
+    return delta
+
+
+def get_pending_heads(db: Database) -> list[str]:
+    """Return the head paths (relative to models_dir) awaiting reprocessing."""
+    raw = db.meta.get(PENDING_HEADS_META_KEY)
+    if not raw:
+        return []
+    try:
+        return [str(path) for path in json.loads(raw)]
+    except ValueError:
+        return []
+
+
+def load_head_reprocess_plan(db: Database, models_dir: str) -> HeadReprocessPlan:
+    """Load the pending heads and installed head metadata for reprocessing."""
+    return HeadReprocessPlan(
+        pending_heads=frozenset(get_pending_heads(db)),
+        head_infos=discover_heads(models_dir, db),
+    )
+
+
+# ----------------------------------------------------------------------
+# Reprocessing (worker)
+# ----------------------------------------------------------------------
+
+
+def _numeric_head_scores(tags: Tags, version_tag_key: str) -> dict[str, float]:
+    """Un-namespaced numeric head scores, excluding mood and version tags."""
+    scores: dict[str, float] = {}
+    for tag in tags:
+        key = tag.key.removeprefix("nom:")
+        if key in _MOOD_KEYS or key == version_tag_key or len(tag.value) != 1:
+            continue
+        value = tag.value[0]
+        if isinstance(value, int | float) and not isinstance(value, bool):
+            scores[key] = float(value)
+    return scores
+
+
+def _latest_stats_by_head(stats_docs: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """Label stats per head, keeping the most recent document when versions overlap."""
+    latest: dict[str, dict[str, Any]] = {}
+    for doc in stats_docs:
+        head_name = doc.get("head_name")
+        if not head_name or not doc.get("label_stats"):
+            continue
+        if head_name not in latest or doc.get("processed_at", 0) >= latest[head_name].get("processed_at", 0):
+            latest[head_name] = doc
+    return {name: doc["label_stats"] for name, doc in latest.items()}
+
+
+def reprocess_heads_workflow(
+    path: str,
+    config: ProcessorConfig,
+    cache: ONNXModelCache,
+    db: Database,
+    file_id: str,
+    store: EmbeddingStore,
+    plan: HeadReprocessPlan,
+) -> ProcessFileResult | None:
+    """Re-run the pending heads of one tagged file from its stored embeddings.
+
+    Args:
+        path: Library path of the file (for logging and the result).
+        config: Processing configuration.
+        cache: ONNXModelCache; warmed on demand (backbone sessions are loaded
+            but not run).
+        db: Database instance.
+        file_id: library_files document _id.
+        store: Embedding store holding the file's backbone embeddings.
+        plan: Pending heads and installed head metadata.
+
+    Returns:
+        ProcessFileResult with deferred writes for the new head outputs and
+        recomputed mood tiers, or ``None`` when an embedding needed by a
+        pending head is not stored (the caller falls back to full processing).
+
+    """
+    start_all = internal_ms()
+    if not cache.warm:
+        cache.warm = True
+    targets: dict[str, list[ONNXHeadModel]] = {}
+    for backbone, heads in cache.heads.items():
+        selected = [
+            h for h in heads if os.path.relpath(h._path, config.models_dir).replace(os.sep, "/") in plan.pending_heads
+        ]
+        if selected:
+            targets[backbone] = selected
+
+    t_load = internal_ms()
+    embeddings: dict[str, np.ndarray] = {}
+    for backbone in targets:
+        stored = store.load(file_id, backbone)
+        if stored is None:
+            logger.debug("[head-reprocess] No stored %s embeddings for %s", backbone, path)
+            return None
+        embeddings[backbone] = stored
+    load_ms = internal_ms().value - t_load.value
+
+    t_heads = internal_ms()
+    tags_accum: dict[str, Any] = {}
+    head_results: dict[str, Any] = {}
+    ran_outputs: list[Any] = []
+    regression_heads: list[tuple[Any, list[float]]] = []
+    raw_segments: dict[str, tuple[np.ndarray, list[str]]] = {}
+    heads_succeeded = 0
+    for backbone, heads in targets.items():
+        result = run_heads(heads, embeddings.pop(backbone), tags_accum)
+        heads_succeeded += result.heads_succeeded
+        head_results.update(result.head_results)
+        ran_outputs.extend(result.all_head_outputs)
+        regression_heads.extend(result.regression_heads)
+        raw_segments.update(result.raw_segments_per_head)
+    if targets and heads_succeeded == 0:
+        msg = "No pending heads produced decisions; refusing to write tags"
+        raise RuntimeError(msg)
+    ran_outputs.extend(add_regression_mood_tiers(regression_heads))
+    heads_ms = internal_ms().value - t_heads.value
+
+    # Rebuild the outputs of every other head from stored stats so mood tiers
+    # are aggregated over the whole suite.
+    t_mood = internal_ms()
+    ran_names = {h.name for heads in targets.values() for h in heads}
+    reconstructed = reconstruct_head_outputs_from_stats(
+        numeric_tags=_numeric_head_scores(get_nomarr_tags(db, file_id), config.version_tag_key),
+        segment_stats_by_head=_latest_stats_by_head(db.segment_scores_stats.get_stats_for_file(file_id)),
+        head_infos=[h for h in plan.head_infos if h.name not in ran_names],
+    )
+    mood_tags = aggregate_mood_tiers(ran_outputs + reconstructed)
+    mood_ms = internal_ms().value - t_mood.value
+    # Always write all three tiers: a tier that no longer has members is cleared.
+    for key in _MOOD_KEYS:
+        tags_accum[key] = mood_tags.get(key, [])
+
+    output_edges: dict[str, tuple[str, float]] = {}
+    if ran_outputs:
+        output_id_map = db.ml_model_outputs.get_output_id_map()
+        for ho in ran_outputs:
+            output_id = output_id_map.get(ho.head._path, {}).get(ho.label)
+            if output_id is not None:
+                output_edges[f"nom:{ho.model_key}"] = (output_id, ho.value)
+
+    tags_accum[config.version_tag_key] = config.tagger_version
+    elapsed_ms = internal_ms().value - start_all.value
+    return ProcessFileResult(
+        file_path=path,
+        elapsed=round(elapsed_ms / 1000, 2),
+        duration=None,
+        heads_processed=heads_succeeded,
+        tags_written=len(tags_accum),
+        head_results=head_results,
+        mood_aggregations={k: len(v) for k, v in mood_tags.items() if isinstance(v, dict | list)} or None,
+        tags=Tags.from_dict(dict(tags_accum)),
+        timing_summary=(
+            f"heads-only: embeddings={load_ms:.0f} heads={heads_ms:.0f}({len(ran_names)} heads) "
+            f"mood={mood_ms:.0f} total={elapsed_ms:.0f}ms"
+        ),
+        deferred_writes=DeferredFileWrites(
+            file_id=file_id,
+            path=path,
+            db_tags=dict(tags_accum),
+            namespace=config.namespace,
+            tagger_version=config.tagger_version,
+            chromaprint=None,
+            raw_segments=raw_segments,
+            ml_edges=MLEdgeWrites(output_edges=output_edges) if output_edges else None,
+        ),
+        timings={"embedding_load": load_ms, "heads": heads_ms, "mood_aggregation": mood_ms},
+    )
@@ -0,0 +1,8 @@
+"""Offline benchmark suite for the processing hot path.
+
+Runs without a database, GPU or real models: audio is synthesized, ONNX
+models are tiny random graphs with the real tensor shapes, and persistence
+goes through the real operations classes against an in-process fake
+ArangoDB.  Results are JSON, one file per run, comparable across commits.
+See ``python -m scripts.benchmarks --help``.
+"""
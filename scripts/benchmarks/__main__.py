@@ -0,0 +1,137 @@
+"""CLI entry point for the hot-path benchmark suite.
+
+Run as:
+    python -m scripts.benchmarks run [--seconds 240] [--repeat 7] [--only heads persist]
+    python -m scripts.benchmarks compare BASE.json HEAD.json [--threshold 10]
+    python -m scripts.benchmarks list
+
+``run`` writes ``scripts/benchmarks/results/<commit>[-dirty].json`` unless
+``--output`` is given.  ``compare`` prints per-case median changes and
+counter differences, and exits 1 when any case is more than ``--threshold``
+percent slower (2 on unusable input), so it can gate a CI job.
+
+Typical before/after check::
+
+    git checkout main   && python -m scripts.benchmarks run --output /tmp/base.json
+    git checkout branch && python -m scripts.benchmarks run --output /tmp/head.json
+    python -m scripts.benchmarks compare /tmp/base.json /tmp/head.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from .cases import CASES, BenchContext, run_cases  # noqa: E402
+from .fixtures import BACKBONE_SHAPES  # noqa: E402
+from .results import build_report, compare_reports, format_comparison, load_report, write_report  # noqa: E402
+
+_DEFAULT_RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m scripts.benchmarks",
+        description="Offline benchmarks for decode → preprocess → ONNX → heads → persistence.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Run the suite and write a results file")
+    run.add_argument("--seconds", type=float, default=240.0, help="Synthetic track length (default: 240)")
+    run.add_argument("--repeat", type=int, default=7, help="Timed repetitions per case (default: 7)")
+    run.add_argument("--warmup", type=int, default=1, help="Untimed repetitions per case (default: 1)")
+    run.add_argument(
+        "--backbones",
+        nargs="+",
+        default=["effnet", "musicnn"],
+        choices=sorted(BACKBONE_SHAPES),
+        help="Backbones to build (default: the two with shipped heads)",
+    )
+    run.add_argument("--only", nargs="+", default=None, help="Case name prefixes to run (e.g. heads persist.)")
+    run.add_argument("--db-latency-ms", type=float, default=0.0, help="Simulated AQL round-trip (default: 0)")
+    run.add_argument("--no-fuse", action="store_true", help="Do not build fused head graphs")
+    run.add_argument("--output", type=Path, default=None, help="Results file (default: results/<commit>.json)")
+
+    compare = sub.add_parser("compare", help="Compare two results files")
+    compare.add_argument("base", type=Path)
+    compare.add_argument("head", type=Path)
+    compare.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent")
+
+    sub.add_parser("list", help="List case groups")
+    return parser
+
+
+def _run(args: argparse.Namespace) -> int:
+    work_dir = Path(tempfile.mkdtemp(prefix="nomarr_bench_"))
+    ctx = BenchContext(
+        work_dir=work_dir,
+        seconds=args.seconds,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        backbones=args.backbones,
+        db_latency_ms=args.db_latency_ms,
+        fuse_heads=not args.no_fuse,
+    )
+    try:
+        cases = run_cases(ctx, args.only)
+    finally:
+        ctx.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    config = {
+        "seconds": args.seconds,
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "backbones": args.backbones,
+        "only": args.only,
+        "db_latency_ms": args.db_latency_ms,
+        "fuse_heads": not args.no_fuse,
+    }
+    report = build_report(config, cases)
+    output = args.output
+    if output is None:
+        name = report["commit"] or "unversioned"
+        output = _DEFAULT_RESULTS_DIR / f"{name}{'-dirty' if report['dirty'] else ''}.json"
+    print(f"\nWrote {write_report(report, output)}")
+    return 1 if any(result.status == "error" for result in cases.values()) else 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    try:
+        base, head = load_report(args.base), load_report(args.head)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+    comparisons, notes = compare_reports(base, head)
+    print(f"base {base['commit']} ({base['created_at']})  vs  head {head['commit']} ({head['created_at']})\n")
+    text, regressions = format_comparison(comparisons, notes, args.threshold)
+    print(text)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than {args.threshold:.0f}%")
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logging.getLogger("scripts.benchmarks").setLevel(logging.INFO)
+    logging.getLogger(__package__ or "benchmarks").setLevel(logging.INFO)
+    if args.command == "list":
+        print("\n".join(CASES))
+        return 0
+    if args.command == "compare":
+        return _compare(args)
+    return _run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
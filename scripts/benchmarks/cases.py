@@ -0,0 +1,373 @@
+"""Benchmark cases for the processing hot path.
+
+Each case is a generator registered with :func:`case`; it receives the shared
+:class:`BenchContext` and yields ``(name, CaseResult)`` pairs, one per
+backbone where that matters (``heads.run_heads[musicnn]``).  Cases run in
+registration order, which follows a file through the worker:
+
+decode → log-mel → patches → backbone (``_run_in_batches``) → heads →
+bind-var normalization (``_jsonify_for_arango``) → deferred writes →
+metrics recording.
+
+Cases whose dependency is missing (essentia, ffmpeg) are reported as
+skipped rather than dropped, so two result files always list the same names.
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from .fixtures import build_model_suite, fake_database, label_heads, synth_track, synthetic_log_mel, write_wav
+from .results import CaseResult, measure, skipped
+
+if TYPE_CHECKING:
+    from nomarr.components.ml.onnx.ml_cache import ONNXModelCache
+    from nomarr.helpers.dto.processing_dto import DeferredFileWrites
+
+logger = logging.getLogger(__name__)
+
+CaseFn = Callable[["BenchContext"], Iterator[tuple[str, CaseResult]]]
+CASES: dict[str, CaseFn] = {}
+
+FILE_ID = "library_files/bench"
+
+
+def case(group: str) -> Callable[[CaseFn], CaseFn]:
+    """Register a case generator under *group* (the name prefix used by ``--only``)."""
+
+    def register(fn: CaseFn) -> CaseFn:
+        CASES[group] = fn
+        return fn
+
+    return register
+
+
+@dataclass
+class BenchContext:
+    """Configuration plus fixtures built on first use and shared by every case."""
+
+    work_dir: Path
+    seconds: float
+    repeat: int
+    warmup: int
+    backbones: list[str]
+    db_latency_ms: float = 0.0
+    fuse_heads: bool = True
+    _closers: list[Callable[[], None]] = field(default_factory=list)
+
+    def time(self, fn: Callable[[], object], counters: dict[str, int | float] | None = None) -> CaseResult:
+        return measure(fn, self.repeat, self.warmup, counters)
+
+    @cached_property
+    def waveform(self) -> np.ndarray:
+        return synth_track(self.seconds)
+
+    @cached_property
+    def wav_path(self) -> Path:
+        return write_wav(self.work_dir / "audio" / "track.wav", self.waveform)
+
+    @cached_property
+    def models_dir(self) -> Path:
+        return build_model_suite(self.work_dir / "models", self.backbones)
+
+    @cached_property
+    def cache(self) -> ONNXModelCache:
+        from nomarr.components.ml.onnx.ml_cache import ONNXModelCache
+
+        cache = ONNXModelCache(str(self.models_dir), "cpu", fuse_heads=self.fuse_heads)
+        label_heads(cache)
+        cache.warm = True
+        self._closers.append(lambda: setattr(cache, "warm", False))
+        return cache
+
+    @cached_property
+    def patches(self) -> dict[str, np.ndarray]:
+        """Backbone input per backbone (from essentia log-mel when available)."""
+        from nomarr.components.ml.audio.ml_preprocess_comp import extract_patches, get_params
+
+        patches = {}
+        for backbone in self.backbones:
+            params = get_params(backbone)
+            patches[backbone] = extract_patches(self.log_mel(backbone), params.patch_frames, params.patch_hop)
+        return patches
+
+    def log_mel(self, backbone: str) -> np.ndarray:
+        if has_module("essentia"):
+            from nomarr.components.ml.audio.ml_preprocess_comp import compute_log_mel, get_params
+
+            return compute_log_mel(self.waveform, get_params(backbone))
+        return synthetic_log_mel(self.seconds, backbone)
+
+    @cached_property
+    def embeddings(self) -> dict[str, np.ndarray]:
+        return {backbone: self.cache.backbones[backbone].run(self.patches[backbone]) for backbone in self.backbones}
+
+    @cached_property
+    def deferred_writes(self) -> DeferredFileWrites:
+        """What process_file_workflow hands the write thread for this track."""
+        from nomarr.components.ml.inference.ml_head_pipeline_comp import run_heads
+        from nomarr.components.tagging.tagging_aggregation_comp import collect_mood_outputs
+        from nomarr.helpers.dto.ml_edge_dto import MLEdgeWrites
+        from nomarr.helpers.dto.processing_dto import DeferredFileWrites
+
+        tags: dict[str, Any] = {}
+        regression: list[Any] = []
+        outputs: list[Any] = []
+        raw_segments: dict[str, Any] = {}
+        for backbone, heads in self.cache.heads.items():
+            result = run_heads(heads, self.embeddings[backbone], tags, self.cache.fused_heads.get(backbone))
+            regression.extend(result.regression_heads)
+            outputs.extend(result.all_head_outputs)
+            raw_segments.update(result.raw_segments_per_head)
+        tags.update(collect_mood_outputs(regression, outputs))
+        tags["nom_version"] = "bench"
+        edges = {f"nom:{ho.model_key}": (f"ml_model_outputs/{i}", ho.value) for i, ho in enumerate(outputs)}
+        return DeferredFileWrites(
+            file_id=FILE_ID,
+            path=str(self.wav_path),
+            db_tags=tags,
+            namespace="nom",
+            tagger_version="bench",
+            chromaprint="AQAA" + "x" * 2000,
+            raw_segments=raw_segments,
+            ml_edges=MLEdgeWrites(output_edges=edges),
+        )
+
+    def close(self) -> None:
+        for closer in reversed(self._closers):
+            closer()
+
+
+def has_module(name: str) -> bool:
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    return True
+
+
+# ── decode ──────────────────────────────────────────────────────────────────
+
+
+@case("audio")
+def audio_cases(ctx: BenchContext) -> Iterator[tuple[str, CaseResult]]:
+    from nomarr.components.ml.audio.ml_audio_comp import load_audio_mono, stream_audio_mono
+
+    path = str(ctx.wav_path)
+    if has_module("essentia"):
+        yield "audio.load_audio_mono", ctx.time(lambda: load_audio_mono(path))
+    else:
+        yield "audio.load_audio_mono", skipped("essentia not installed")
+    if shutil.which("ffmpeg"):
+        yield "audio.stream_audio_mono", ctx.time(lambda: sum(len(b) for b in stream_audio_mono(path)))
+    else:
+        yield "audio.stream_audio_mono", skipped("ffmpeg not found")
+
+
+# ── preprocessing ───────────────────────────────────────────────────────────
+
+
+@case("preprocess")
+def preprocess_cases(ctx: BenchContext) -> Iterator[tuple[str, CaseResult]]:
+    from nomarr.components.ml.audio.ml_preprocess_comp import compute_log_mel, extract_patches, get_params
+
+    for backbone in ctx.backbones:
+        params = get_params(backbone)
+        if has_module("essentia"):
+            yield (
+                f"preprocess.compute_log_mel[{backbone}]",
+                ctx.time(lambda p=params: compute_log_mel(ctx.waveform, p)),
+            )
+        else:
+            yield f"preprocess.compute_log_mel[{backbone}]", skipped("essentia not installed")
+        log_mel = ctx.log_mel(backbone)
+        yield (
+            f"preprocess.extract_patches[{backbone}]",
+            ctx.time(
+                lambda m=log_mel, p=params: extract_patches(m, p.patch_frames, p.patch_hop),
+                {"frames": log_mel.shape[0], "patches": len(ctx.patches[backbone])},
+            ),
+        )
+
+
+# ── ONNX ────────────────────────────────────────────────────────────────────
+
+
+@case("onnx")
+def onnx_cases(ctx: BenchContext) -> Iterator[tuple[str, CaseResult]]:
+    from nomarr.components.ml.onnx.ml_session_comp import _BACKBONE_BATCH_SIZE, _run_in_batches
+
+    for backbone in ctx.backbones:
+        patches = ctx.patches[backbone]
+        n_batches = -(-len(patches) // _BACKBONE_BATCH_SIZE)
+        # Batching and stacking overhead alone: the "model" is a mean over time
+        yield (
+            f"onnx.run_in_batches[{backbone}]",
+            ctx.time(
+                lambda x=patches: _run_in_batches(lambda b: b.mean(axis=1), x, _BACKBONE_BATCH_SIZE),
+                {"rows": len(patches), "batches": n_batches},
+            ),
+        )
+        model = ctx.cache.backbones[backbone]
+        yield (
+            f"onnx.backbone_run[{backbone}]",
+            ctx.time(lambda m=model, x=patches: m.run(x), {"rows": len(patches), "batches": n_batches}),
+        )
+
+
+# ── heads ───────────────────────────────────────────────────────────────────
+
+
+@case("heads")
+def head_cases(ctx: BenchContext) -> Iterator[tuple[str, CaseResult]]:
+    from nomarr.components.ml.inference.ml_head_pipeline_comp import run_heads
+
+    for backbone, heads in ctx.cache.heads.items():
+        embeddings = ctx.embeddings[backbone]
+        counters = {"heads": len(heads), "rows": len(embeddings)}
+        yield f"heads.run_heads[{backbone}]", ctx.time(lambda h=heads, e=embeddings: run_heads(h, e, {}), counters)
+        fused = ctx.cache.fused_heads.get(backbone)
+        if fused:
+            yield (
+                f"heads.run_heads_fused[{backbone}]",
+                ctx.time(lambda h=heads, e=embeddings, f=fused: run_heads(h, e, {}, f), counters),
+            )
+        else:
+            yield f"heads.run_heads_fused[{backbone}]", skipped("head fusion unavailable (onnx not installed)")
+
+
+# ── persistence ─────────────────────────────────────────────────────────────
+
+
+@case("arango")
+def arango_cases(ctx: BenchContext) -> Iterator[tuple[str, CaseResult]]:
+    from nomarr.components.ml.inference.ml_segment_stats_comp import compute_segment_stats
+    from nomarr.components.tagging.tag_parsing_comp import parse_tag_values
+    from nomarr.helpers.time_helper import now_ms
+    from nomarr.persistence.arango_client import _jsonify_for_arango
+
+    writes = ctx.deferred_writes
+    # Bind vars of the two largest queries in the deferred write path
+    tag_entries = {
+        "entries": [
+            {"song_id": FILE_ID, "rel": f"nom:{rel}", "values": values}
+            for rel, values in parse_tag_values(writes.db_tags).items()
+        ],
+        "now": now_ms(),
+    }
+    stats_entries = {
+        "entries": [
+            {"file_id": FILE_ID, "head_name": name, "label_stats": compute_segment_stats(scores, labels)}
+            for name, (scores, labels) in writes.raw_segments.items()
+        ],
+        "now": now_ms(),
+    }
+    yield (
+        "arango.jsonify.tag_entries",
+        ctx.time(lambda: _jsonify_for_arango(tag_entries), {"entries": len(tag_entries["entries"])}),
+    )
+    yield (
+        "arango.jsonify.segment_stats",
+        ctx.time(lambda: _jsonify_for_arango(stats_entries), {"entries": len(stats_entries["entries"])}),
+    )
+
+
+@case("persist")
+def persist_cases(ctx: BenchContext) -> Iterator[tuple[str, CaseResult]]:
+    from nomarr.services.infrastructure.workers import discovery_worker
+
+    writes = ctx.deferred_writes
+    db, fake = fake_database(ctx.db_latency_ms)
+    # Failures are logged and swallowed by the write thread; a failing path must not be timed as a fast one
+    failures = _ErrorCounter()
+    discovery_worker.logger.addHandler(failures)
+    try:
+        discovery_worker._execute_deferred_writes(db, writes, "bench")
+        if failures.count:
+            yield "persist.deferred_writes", CaseResult(status="error", reason=failures.first)
+            return
+        counters: dict[str, int | float] = {
+            "aql_queries": fake.queries,
+            "request_bytes": fake.request_bytes,
+            "tags": len(writes.db_tags),
+        }
+        yield (
+            "persist.deferred_writes",
+            ctx.time(lambda: discovery_worker._execute_deferred_writes(db, writes, "bench"), counters),
+        )
+    finally:
+        discovery_worker.logger.removeHandler(failures)
+
+
+@case("metrics")
+def metrics_cases(ctx: BenchContext) -> Iterator[tuple[str, CaseResult]]:
+    import json
+
+    from nomarr.components.platform.pipeline_metrics_comp import (
+        OUTCOME_TAGGED,
+        new_pipeline_registry,
+        observe_stage,
+        record_processed_file,
+    )
+
+    # Keys process_file_workflow sets for a file through every configured backbone
+    timings: dict[str, float] = {"audio_load": 900.0, "mood_aggregation": 2.0}
+    for backbone in ctx.backbones:
+        timings |= {f"pre_{backbone}": 80.0, f"emb_{backbone}": 400.0, f"heads_{backbone}": 30.0}
+    registry = new_pipeline_registry()
+
+    def record_file() -> None:
+        observe_stage(registry, "claim_wait", 4.0)
+        record_processed_file(registry, timings, 1500.0, OUTCOME_TAGGED)
+        observe_stage(registry, "persist", 60.0)
+
+    yield "metrics.record_file", ctx.time(record_file)
+    # What the health writer thread pays per frame, every HEALTH_FRAME_INTERVAL_S
+    yield "metrics.health_frame_snapshot", ctx.time(lambda: json.dumps(registry.snapshot()))
+
+
+class _ErrorCounter(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__(logging.ERROR)
+        self.count = 0
+        self.first: str | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.count += 1
+        if self.first is None:
+            self.first = record.getMessage()
+            if record.exc_info and record.exc_info[1] is not None:
+                self.first += f": {record.exc_info[1]!r}"
+
+
+def run_cases(ctx: BenchContext, only: list[str] | None = None) -> dict[str, CaseResult]:
+    """Run every registered case (or those whose name starts with one of *only*)."""
+    results: dict[str, CaseResult] = {}
+    groups = {o.split(".", 1)[0] for o in only or []}
+    for group, fn in CASES.items():
+        if only and group not in groups:
+            continue
+        try:
+            for name, result in fn(ctx):
+                if only and not any(name.startswith(o) for o in only):
+                    continue
+                results[name] = result
+                logger.info("%-52s %s", name, _describe(result))
+        except Exception as e:
+            logger.exception("Case group %s failed", group)
+            results[f"{group}.*"] = CaseResult(status="error", reason=f"{type(e).__name__}: {e}")
+    return results
+
+
+def _describe(result: CaseResult) -> str:
+    if result.status != "ok":
+        return f"{result.status}: {result.reason}"
+    return f"median {result.median_ms:9.3f} ms  (min {result.min_ms:.3f}, p90 {result.p90_ms:.3f}, n={result.samples})"
@@ -0,0 +1,303 @@
+"""Generated inputs for the hot-path benchmarks: audio, models and a fake database.
+
+Everything is derived from a seed, so two runs (or two commits) see the same
+bytes:
+
+- :func:`synth_track` / :func:`write_wav` — music-like 16 kHz mono audio
+  (chord tones, a beat and noise), so spectra are neither silent nor white.
+- :func:`build_model_suite` — tiny randomly initialized ONNX models with the
+  real tensor names and shapes: each backbone takes its real mel patch and
+  returns its real embedding width, and every shipped head stem from
+  ``KNOWN_MODELS`` gets a 2-class softmax head.  Inference is cheap, so the
+  numbers track the code around the sessions rather than the network.
+- :class:`FakeArangoDatabase` / :func:`fake_database` — a real
+  :class:`~nomarr.persistence.db.Database` whose ArangoDB handle is an
+  in-process fake.  Every operations class, ``SafeDatabase`` and
+  ``_jsonify_for_arango`` run unchanged; queries are JSON-encoded like the
+  HTTP driver would, counted, and answered from registered responders.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import wave
+from collections import Counter
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import numpy as np
+
+from nomarr.components.ml.onnx.ml_known_models_comp import KNOWN_MODELS
+from nomarr.persistence.arango_client import SafeDatabase
+from nomarr.persistence.db import Database
+
+if TYPE_CHECKING:
+    from nomarr.components.ml.onnx.ml_cache import ONNXModelCache
+
+SAMPLE_RATE = 16000
+SEED = 7
+
+# backbone → (patch_frames, n_mels, embedding width), matching ml_preprocess_comp and the shipped models
+BACKBONE_SHAPES: dict[str, tuple[int, int, int]] = {
+    "effnet": (128, 96, 1280),
+    "musicnn": (187, 96, 200),
+    "vggish": (96, 64, 128),
+    "yamnet": (96, 64, 1024),
+}
+
+# ── audio ───────────────────────────────────────────────────────────────────
+
+_CHORDS = [(220.0, 277.2, 329.6), (196.0, 246.9, 293.7), (174.6, 220.0, 261.6), (196.0, 246.9, 311.1)]
+
+
+def synth_track(seconds: float, seed: int = SEED) -> np.ndarray:
+    """Music-like mono float32 waveform at 16 kHz (peak below 1.0)."""
+    rng = np.random.default_rng(seed)
+    n = int(seconds * SAMPLE_RATE)
+    t = np.arange(n, dtype=np.float64) / SAMPLE_RATE
+    out = np.zeros(n, dtype=np.float64)
+    # One chord every 2 s, three harmonics per note
+    chord_idx = (t // 2.0).astype(np.int64) % len(_CHORDS)
+    for note in range(3):
+        freqs = np.array([chord[note] for chord in _CHORDS])[chord_idx]
+        phase = 2.0 * np.pi * np.cumsum(freqs) / SAMPLE_RATE
+        for harmonic, gain in ((1, 0.2), (2, 0.08), (3, 0.04)):
+            out += gain * np.sin(harmonic * phase)
+    # Kick-like decaying 60 Hz burst at 120 BPM
+    beat_t = t % 0.5
+    out += 0.3 * np.exp(-beat_t * 30.0) * np.sin(2.0 * np.pi * 60.0 * beat_t)
+    out += 0.02 * rng.standard_normal(n)
+    return (out / max(float(np.abs(out).max()), 1e-9) * 0.9).astype(np.float32)
+
+
+def write_wav(path: Path, waveform: np.ndarray) -> Path:
+    """Write *waveform* as 16-bit PCM mono WAV at 16 kHz."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pcm = (np.clip(waveform, -1.0, 1.0) * 32767).astype("<i2")
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(pcm.tobytes())
+    return path
+
+
+def synthetic_log_mel(seconds: float, backbone: str, seed: int = SEED) -> np.ndarray:
+    """Log-mel-shaped ``[n_frames, n_mels]`` array for *seconds* of audio (no essentia needed)."""
+    from nomarr.components.ml.audio.ml_preprocess_comp import get_params
+
+    params = get_params(backbone)
+    n_frames = max(0, (int(seconds * params.sample_rate) - params.n_fft) // params.hop_length + 1)
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((n_frames, params.n_mels)).astype(np.float32)
+
+
+# ── models ──────────────────────────────────────────────────────────────────
+
+
+def head_stems() -> dict[str, list[str]]:
+    """Shipped head stems grouped by backbone (``…-msd-musicnn-1`` → ``musicnn``)."""
+    stems: dict[str, list[str]] = {}
+    for stem in KNOWN_MODELS:
+        backbone = stem.rsplit("-", 2)[1]
+        stems.setdefault(backbone, []).append(stem)
+    return stems
+
+
+def build_model_suite(root: Path, backbones: list[str], seed: int = SEED) -> Path:
+    """Write backbones and heads under ``root/<backbone>/{embeddings,heads/softmax}``.
+
+    Returns:
+        *root*, ready to pass to ``ONNXModelCache``
+
+    """
+    from onnx import TensorProto, helper, numpy_helper
+
+    rng = np.random.default_rng(seed)
+
+    def weights(*shape: int) -> np.ndarray:
+        return (rng.standard_normal(shape) * 0.1).astype(np.float32)
+
+    stems = head_stems()
+    for name in backbones:
+        frames, mels, dim = BACKBONE_SHAPES[name]
+        inits = [
+            numpy_helper.from_array(np.array([1], dtype=np.int64), "axes"),
+            numpy_helper.from_array(weights(8, 1, 3, 3), "w0"),
+            numpy_helper.from_array(weights(16, 8, 3, 3), "w1"),
+            numpy_helper.from_array(weights(16, dim), "proj"),
+        ]
+        nodes = [
+            helper.make_node("Unsqueeze", ["melspectrogram", "axes"], ["x"]),
+            helper.make_node("Conv", ["x", "w0"], ["c0"], strides=[2, 2], pads=[1, 1, 1, 1]),
+            helper.make_node("Relu", ["c0"], ["r0"]),
+            helper.make_node("Conv", ["r0", "w1"], ["c1"], strides=[2, 2], pads=[1, 1, 1, 1]),
+            helper.make_node("Relu", ["c1"], ["r1"]),
+            helper.make_node("GlobalAveragePool", ["r1"], ["pooled"]),
+            helper.make_node("Flatten", ["pooled"], ["flat"]),
+            helper.make_node("MatMul", ["flat", "proj"], ["embeddings"]),
+        ]
+        graph = helper.make_graph(
+            nodes,
+            name,
+            [helper.make_tensor_value_info("melspectrogram", TensorProto.FLOAT, [None, frames, mels])],
+            [helper.make_tensor_value_info("embeddings", TensorProto.FLOAT, [None, dim])],
+            initializer=inits,
+        )
+        _save(graph, root / name / "embeddings" / f"{name}.onnx")
+
+        for stem in stems.get(name, []):
+            head_inits = [
+                numpy_helper.from_array(weights(dim, 100), "w1"),
+                numpy_helper.from_array(weights(100), "b1"),
+                numpy_helper.from_array(weights(100, 2), "w2"),
+                numpy_helper.from_array(weights(2), "b2"),
+            ]
+            head_nodes = [
+                helper.make_node("MatMul", ["model/Placeholder", "w1"], ["h1"]),
+                helper.make_node("Add", ["h1", "b1"], ["h1b"]),
+                helper.make_node("Relu", ["h1b"], ["h1r"]),
+                helper.make_node("MatMul", ["h1r", "w2"], ["h2"]),
+                helper.make_node("Add", ["h2", "b2"], ["logits"]),
+                helper.make_node("Softmax", ["logits"], ["model/Softmax"], axis=-1),
+            ]
+            head_graph = helper.make_graph(
+                head_nodes,
+                stem,
+                [helper.make_tensor_value_info("model/Placeholder", TensorProto.FLOAT, [None, dim])],
+                [helper.make_tensor_value_info("model/Softmax", TensorProto.FLOAT, [None, 2])],
+                initializer=head_inits,
+            )
+            _save(head_graph, root / name / "heads" / "softmax" / f"{stem}.onnx")
+    return root
+
+
+def _save(graph: Any, path: Path) -> None:
+    from onnx import helper, save
+
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])
+    model.ir_version = 8
+    path.parent.mkdir(parents=True, exist_ok=True)
+    save(model, str(path))
+
+
+def label_heads(cache: ONNXModelCache) -> None:
+    """Give every head its ``KNOWN_MODELS`` labels (normally read from the database)."""
+    for heads in cache.heads.values():
+        for head in heads:
+            head.labels = [label for _, label in sorted(KNOWN_MODELS.get(head.model_name, []))]
+
+
+# ── database ────────────────────────────────────────────────────────────────
+
+Responder = Callable[[str, dict[str, Any]], list[Any]]
+
+
+class _FakeAQL:
+    def __init__(self, owner: FakeArangoDatabase) -> None:
+        self._owner = owner
+
+    def execute(self, query: str, bind_vars: dict[str, Any] | None = None, **_kwargs: Any) -> _FakeCursor:
+        return self._owner.execute(query, bind_vars or {})
+
+
+class _FakeCursor:
+    """The parts of ``arango.cursor.Cursor`` the operations classes use."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self._rows = rows
+        self._iter = iter(rows)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._iter
+
+    def __next__(self) -> Any:
+        return next(self._iter)
+
+    def next(self) -> Any:
+        return next(self._iter)
+
+    def count(self) -> int:
+        return len(self._rows)
+
+    def close(self, ignore_missing: bool = False) -> None:
+        pass
+
+
+class FakeArangoDatabase:
+    """In-process stand-in for ``arango.database.StandardDatabase``.
+
+    ``aql.execute`` serializes the query and bind vars to JSON (the cost the
+    HTTP driver pays), optionally sleeps ``latency_ms`` to model the network
+    round-trip, and returns an iterator over the first matching responder's
+    rows (empty when none matches).
+    """
+
+    def __init__(self, latency_ms: float = 0.0) -> None:
+        self.latency_ms = latency_ms
+        self.aql = _FakeAQL(self)
+        self.queries = 0
+        self.request_bytes = 0
+        self.by_query: Counter[str] = Counter()
+        self._responders: list[tuple[str, Responder]] = []
+
+    def respond(self, marker: str, responder: Responder) -> None:
+        """Answer queries containing *marker* with ``responder(query, bind_vars)``."""
+        self._responders.append((marker, responder))
+
+    def execute(self, query: str, bind_vars: dict[str, Any]) -> _FakeCursor:
+        body = json.dumps({"query": query, "bindVars": bind_vars})
+        self.queries += 1
+        self.request_bytes += len(body)
+        self.by_query[" ".join(query.split())[:60]] += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        for marker, responder in self._responders:
+            if marker in query:
+                return _FakeCursor(responder(query, bind_vars))
+        return _FakeCursor([])
+
+    def reset_counters(self) -> None:
+        self.queries = 0
+        self.request_bytes = 0
+        self.by_query.clear()
+
+    def collection(self, name: str) -> _FakeCollection:
+        return _FakeCollection(self, name)
+
+
+class _FakeCollection:
+    """Document API calls count as requests too; they return nothing."""
+
+    def __init__(self, owner: FakeArangoDatabase, name: str) -> None:
+        self._owner = owner
+        self.name = name
+
+    def __getattr__(self, method: str) -> Callable[..., None]:
+        def call(*args: Any, **kwargs: Any) -> None:
+            self._owner.queries += 1
+            self._owner.request_bytes += len(json.dumps([args, kwargs], default=str))
+            self._owner.by_query[f"{self.name}.{method}"] += 1
+
+        return call
+
+
+def _resolve_tag_ids(_query: str, bind_vars: dict[str, Any]) -> list[Any]:
+    return [{**pair, "tag_id": f"tags/{i}"} for i, pair in enumerate(bind_vars["pairs"])]
+
+
+def fake_database(latency_ms: float = 0.0) -> tuple[Database, FakeArangoDatabase]:
+    """Build a :class:`Database` wired to a :class:`FakeArangoDatabase`.
+
+    Returns:
+        ``(db, fake)`` — pass *db* to the code under test, read counters from *fake*
+
+    """
+    fake = FakeArangoDatabase(latency_ms)
+    fake.respond("tag_id: tag}", _resolve_tag_ids)
+    with patch("nomarr.persistence.db.create_arango_client", return_value=SafeDatabase(fake)):
+        db = Database(hosts="fake://", password="fake")
+    return db, fake
@@ -0,0 +1,227 @@
+"""Timing, the results file format and comparison between two runs.
+
+A run is written as one JSON document::
+
+    {
+      "schema": 1,
+      "commit": "f3e0ab3", "dirty": false, "created_at": "2026-10-18T12:00:00Z",
+      "environment": {"python": "3.11.7", "numpy": "...", "onnxruntime": "...", ...},
+      "config": {"seconds": 240.0, "repeat": 7, ...},
+      "cases": {
+        "preprocess.extract_patches[effnet]": {
+          "status": "ok", "median_ms": 3.1, "min_ms": 2.9, "p90_ms": 3.4, "mean_ms": 3.1,
+          "samples": 7, "counters": {...}
+        },
+        "preprocess.compute_log_mel[effnet]": {"status": "skipped", "reason": "essentia not installed"}
+      }
+    }
+
+Cases are compared by ``median_ms``; ``counters`` (AQL round-trips, request
+bytes, patch counts) are deterministic and compared exactly.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from nomarr.helpers.time_helper import format_wall_timestamp, now_ms
+
+SCHEMA_VERSION = 1
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass
+class CaseResult:
+    """Outcome of one benchmark case (times in milliseconds)."""
+
+    status: str  # "ok" | "skipped" | "error"
+    reason: str | None = None
+    samples: int | None = None
+    median_ms: float | None = None
+    min_ms: float | None = None
+    p90_ms: float | None = None
+    mean_ms: float | None = None
+    counters: dict[str, int | float] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {k: v for k, v in asdict(self).items() if v not in (None, {})}
+
+
+def measure(
+    fn: Callable[[], object],
+    repeat: int,
+    warmup: int = 1,
+    counters: dict[str, int | float] | None = None,
+) -> CaseResult:
+    """Time *repeat* calls of *fn* after *warmup* untimed ones."""
+    for _ in range(warmup):
+        fn()
+    samples: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return CaseResult(
+        status="ok",
+        samples=len(samples),
+        median_ms=round(statistics.median(samples), 4),
+        min_ms=round(samples[0], 4),
+        p90_ms=round(samples[min(len(samples) - 1, int(len(samples) * 0.9))], 4),
+        mean_ms=round(statistics.fmean(samples), 4),
+        counters=counters or {},
+    )
+
+
+def skipped(reason: str) -> CaseResult:
+    return CaseResult(status="skipped", reason=reason)
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=REPO_ROOT, capture_output=True, text=True, check=True, timeout=30
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def environment() -> dict[str, Any]:
+    """Versions and host facts that make two runs comparable (or not)."""
+    import os
+
+    import numpy as np
+
+    env: dict[str, Any] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+    }
+    for module in ("onnxruntime", "onnx", "essentia"):
+        try:
+            env[module] = __import__(module).__version__
+        except ImportError:
+            env[module] = None
+    return env
+
+
+def build_report(config: dict[str, Any], cases: dict[str, CaseResult]) -> dict[str, Any]:
+    return {
+        "schema": SCHEMA_VERSION,
+        "commit": _git("rev-parse", "--short", "HEAD") or None,
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "created_at": format_wall_timestamp(now_ms(), "%Y-%m-%dT%H:%M:%SZ"),
+        "environment": environment(),
+        "config": config,
+        "cases": {name: result.to_dict() for name, result in cases.items()},
+    }
+
+
+def write_report(report: dict[str, Any], path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=False) + "\n")
+    return path
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    report = json.loads(path.read_text())
+    if report.get("schema") != SCHEMA_VERSION:
+        msg = f"{path}: results schema {report.get('schema')!r}, expected {SCHEMA_VERSION}"
+        raise ValueError(msg)
+    return report
+
+
+@dataclass
+class Comparison:
+    """One case present in both runs."""
+
+    name: str
+    base_ms: float | None
+    head_ms: float | None
+    counter_changes: dict[str, tuple[Any, Any]]
+    broke: bool = False  # ok in base, error in head
+
+    @property
+    def change_pct(self) -> float | None:
+        if not self.base_ms or self.head_ms is None:
+            return None
+        return (self.head_ms - self.base_ms) / self.base_ms * 100
+
+
+def compare_reports(base: dict[str, Any], head: dict[str, Any]) -> tuple[list[Comparison], list[str]]:
+    """Pair up the cases of two runs.
+
+    Returns:
+        ``(comparisons, notes)`` — notes list cases only one run has and
+        environment differences that make timings incomparable
+
+    """
+    base_env, head_env = base["environment"], head["environment"]
+    notes = [
+        f"environment {key}: {base_env.get(key)} -> {head_env.get(key)}"
+        for key in sorted(set(base_env) | set(head_env))
+        if key != "platform" and base_env.get(key) != head_env.get(key)
+    ]
+    # --only selects cases; it does not change what a case measures
+    base_config = {k: v for k, v in base["config"].items() if k != "only"}
+    head_config = {k: v for k, v in head["config"].items() if k != "only"}
+    if base_config != head_config:
+        notes.append(f"config differs: {base_config} -> {head_config}")
+
+    comparisons: list[Comparison] = []
+    for name in sorted(set(base["cases"]) | set(head["cases"])):
+        before, after = base["cases"].get(name), head["cases"].get(name)
+        if before is None or after is None:
+            notes.append(f"{name}: only in {'head' if before is None else 'base'}")
+            continue
+        counters_before, counters_after = before.get("counters", {}), after.get("counters", {})
+        changes = {
+            key: (counters_before.get(key), counters_after.get(key))
+            for key in sorted(set(counters_before) | set(counters_after))
+            if counters_before.get(key) != counters_after.get(key)
+        }
+        broke = before["status"] == "ok" and after["status"] == "error"
+        comparisons.append(Comparison(name, before.get("median_ms"), after.get("median_ms"), changes, broke))
+    return comparisons, notes
+
+
+def format_comparison(
+    comparisons: list[Comparison], notes: list[str], threshold_pct: float
+) -> tuple[str, list[Comparison]]:
+    """Render a comparison table.
+
+    Returns:
+        ``(text, regressions)`` — cases slower than *threshold_pct* percent or newly failing
+
+    """
+    lines = [f"{'case':58s} {'base ms':>10s} {'head ms':>10s} {'change':>8s}"]
+    regressions: list[Comparison] = []
+    for c in comparisons:
+        pct = c.change_pct
+        flag = ""
+        if c.broke:
+            regressions.append(c)
+            flag = "  ERROR"
+        elif pct is not None and pct > threshold_pct:
+            regressions.append(c)
+            flag = "  SLOWER"
+        elif pct is not None and pct < -threshold_pct:
+            flag = "  faster"
+        base = f"{c.base_ms:10.3f}" if c.base_ms is not None else f"{'-':>10s}"
+        head = f"{c.head_ms:10.3f}" if c.head_ms is not None else f"{'-':>10s}"
+        change = f"{pct:+7.1f}%" if pct is not None else f"{'':>8s}"
+        lines.append(f"{c.name:58s} {base} {head} {change}{flag}")
+        lines.extend(f"    {key}: {old} -> {new}" for key, (old, new) in c.counter_changes.items())
+    if notes:
+        lines += ["", *notes]
+    return "\n".join(lines), regressions
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Head-stage latency benchmark: per-head sessions vs one fused graph per backbone.
+
+Writes --heads synthetic MLP heads (the shape of the Essentia classifier heads:
+embed_dim → hidden → classes, sigmoid/softmax/identity) into a temporary
+models directory, loads them on CPU, and times run_heads() for --files
+synthetic files of --patches embedding rows each:
+
+  1. per-head — one ONNX session call per head per batch on the head pool
+  2. fused    — one ONNXFusedHeadsModel session call per batch for all heads
+
+Reports per-file head-stage latency (median / p95 / mean) for both modes and
+checks that every head's scores are byte-identical between them.
+
+Usage:
+    .venv/Scripts/python.exe scripts/diagnostics/bench_fused_heads.py
+    .venv/Scripts/python.exe scripts/diagnostics/bench_fused_heads.py --heads 20 --dim 1280 --patches 600 --files 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import shutil
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+try:
+    import onnx
+    from onnx import TensorProto, helper, numpy_helper
+except ImportError:
+    sys.exit("This benchmark needs the 'onnx' package (pip install 'onnx>=1.16,<1.18').")
+
+from nomarr.components.ml.inference.ml_head_pipeline_comp import run_heads  # noqa: E402
+from nomarr.components.ml.onnx.ml_fused_heads import ONNXFusedHeadsModel  # noqa: E402
+from nomarr.components.ml.onnx.ml_head import ONNXHeadModel  # noqa: E402
+from nomarr.helpers.time_helper import internal_ms  # noqa: E402
+
+# ── defaults ────────────────────────────────────────────────────────────────
+
+HEAD_TYPES = [("sigmoid", "Sigmoid", 2), ("softmax", "Softmax", 10), ("identity", "Identity", 1)]
+
+# ── CLI ─────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--heads",   type=int, default=12,   help="Heads attached to the backbone")
+    p.add_argument("--dim",     type=int, default=1280, help="Backbone embedding width")
+    p.add_argument("--hidden",  type=int, default=100,  help="Hidden units per head")
+    p.add_argument("--patches", type=int, default=180,  help="Embedding rows per file (~track length)")
+    p.add_argument("--files",   type=int, default=40,   help="Files timed per mode")
+    return p.parse_args()
+
+
+# ── synthetic heads ─────────────────────────────────────────────────────────
+
+def write_head(models_dir: Path, index: int, dim: int, hidden: int) -> ONNXHeadModel:
+    head_type, op, classes = HEAD_TYPES[index % len(HEAD_TYPES)]
+    rng = np.random.default_rng(index)
+    weights = {
+        "w1": (rng.standard_normal((dim, hidden)) / np.sqrt(dim)).astype(np.float32),
+        "b1": rng.standard_normal(hidden).astype(np.float32),
+        "w2": (rng.standard_normal((hidden, classes)) / np.sqrt(hidden)).astype(np.float32),
+        "b2": rng.standard_normal(classes).astype(np.float32),
+    }
+    nodes = [
+        helper.make_node("MatMul", ["model/Placeholder", "w1"], ["h1"]),
+        helper.make_node("Add", ["h1", "b1"], ["h1b"]),
+        helper.make_node("Relu", ["h1b"], ["h1r"]),
+        helper.make_node("MatMul", ["h1r", "w2"], ["h2"]),
+        helper.make_node("Add", ["h2", "b2"], ["logits"]),
+        helper.make_node(op, ["logits"], ["model/Output"]),
+    ]
+    graph = helper.make_graph(
+        nodes,
+        f"head_{index}",
+        [helper.make_tensor_value_info("model/Placeholder", TensorProto.FLOAT, [None, dim])],
+        [helper.make_tensor_value_info("model/Output", TensorProto.FLOAT, [None, classes])],
+        initializer=[numpy_helper.from_array(v, k) for k, v in weights.items()],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])
+    model.ir_version = 8
+    path = models_dir / "bench" / "heads" / head_type / f"head_{index:02d}.onnx"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    onnx.save(model, str(path))
+    return ONNXHeadModel(str(path), labels=[f"label_{index}_{c}" for c in range(classes)])
+
+
+# ── timing ──────────────────────────────────────────────────────────────────
+
+def time_mode(heads: list[ONNXHeadModel], files: list[np.ndarray], fused: ONNXFusedHeadsModel | None) -> list[int]:
+    latencies: list[int] = []
+    for embeddings in files:
+        start = internal_ms().value
+        run_heads(heads, embeddings, {}, [fused] if fused is not None else None)
+        latencies.append(internal_ms().value - start)
+    return latencies
+
+
+def summarize(label: str, latencies: list[int]) -> str:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+    return (
+        f"  {label:9s} median={statistics.median(ordered):7.1f} ms  p95={p95:5d} ms  "
+        f"mean={statistics.fmean(ordered):7.1f} ms"
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    models_dir = Path(tempfile.mkdtemp(prefix="nomarr_fused_bench_"))
+    try:
+        heads = [write_head(models_dir, i, args.dim, args.hidden) for i in range(args.heads)]
+        for h in heads:
+            h.load("cpu")
+        fused = ONNXFusedHeadsModel(heads)
+        fused.load("cpu")
+        if not fused.verified:
+            sys.exit("Fused graph failed the load-time parity check; nothing to compare.")
+
+        rng = np.random.default_rng(1234)
+        files = [rng.standard_normal((args.patches, args.dim)).astype(np.float32) for _ in range(args.files)]
+
+        split = fused.run_split(files[0])
+        mismatched = [h.name for h in heads if split[h.name].tobytes() != h.run(files[0]).tobytes()]
+
+        # Warm both paths once so thread pools and allocators are primed
+        time_mode(heads, files[:2], None)
+        time_mode(heads, files[:2], fused)
+
+        per_head = time_mode(heads, files, None)
+        fused_lat = time_mode(heads, files, fused)
+
+        print(f"{args.heads} heads, dim={args.dim}, hidden={args.hidden}, {args.patches} patches/file, {args.files} files\n")
+        print(summarize("per-head", per_head))
+        print(summarize("fused", fused_lat))
+        print(f"\nSpeedup (median): {statistics.median(per_head) / max(statistics.median(fused_lat), 1e-9):.2f}x")
+        print(f"Bit-exact: {'yes' if not mismatched else 'NO — ' + ', '.join(mismatched)}")
+    finally:
+        shutil.rmtree(models_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Head-only reprocessing benchmark: full reprocessing vs re-running changed heads
+from stored backbone embeddings (reprocess_heads_wf).
+
+Builds the synthetic suite of bench_session_cache.py (one backbone, --heads
+heads), warms it on CPU and processes --files synthetic tracks of --seconds
+seconds each in two modes:
+
+  1. full       — backbone inference on the waveform + every head
+  2. heads-only — EmbeddingStore.load() + only the --changed heads
+
+Audio decode and chromaprint are not part of the full-mode timing, so the
+reported speedup is a lower bound for real libraries.  Without essentia the
+log-mel step is replaced by synthetic patches of the same shape, lowering the
+bound further.  Also checks that the changed heads produce identical tags in
+both modes.
+
+Usage:
+    .venv/Scripts/python.exe scripts/diagnostics/bench_head_reprocess.py
+    .venv/Scripts/python.exe scripts/diagnostics/bench_head_reprocess.py --heads 20 --changed 2 --seconds 240 --files 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import shutil
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bench_session_cache import build_suite  # noqa: E402
+
+from nomarr.components.ml.audio.ml_preprocess_comp import get_params  # noqa: E402
+from nomarr.components.ml.inference.ml_backbone_embed_comp import compute_backbone_embeddings  # noqa: E402
+from nomarr.components.ml.inference.ml_head_pipeline_comp import run_heads  # noqa: E402
+from nomarr.components.ml.onnx import ml_backbone  # noqa: E402
+from nomarr.components.ml.onnx.ml_cache import ONNXModelCache  # noqa: E402
+from nomarr.components.ml.vectors.ml_embedding_store_comp import EmbeddingStore  # noqa: E402
+from nomarr.helpers.time_helper import internal_ms  # noqa: E402
+
+# ── CLI ─────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--heads",   type=int, default=12,  help="Heads attached to the backbone")
+    p.add_argument("--changed", type=int, default=1,   help="Heads re-run in heads-only mode")
+    p.add_argument("--layers",  type=int, default=8,   help="Conv+BatchNorm+Relu blocks in the synthetic backbone")
+    p.add_argument("--seconds", type=float, default=120.0, help="Synthetic track length")
+    p.add_argument("--files",   type=int, default=10,  help="Files timed per mode")
+    return p.parse_args()
+
+
+# ── log-mel stand-in ────────────────────────────────────────────────────────
+
+def synthetic_patches(waveform: np.ndarray, backbone: str) -> np.ndarray:
+    """Patches of the shape preprocess_for_backbone() would produce for *waveform*."""
+    params = get_params(backbone)
+    frames = len(waveform) // params.hop_length
+    n_patches = max(1, (frames - params.patch_frames) // params.patch_hop + 1)
+    rng = np.random.default_rng(len(waveform))
+    return rng.standard_normal((n_patches, params.patch_frames, params.n_mels)).astype(np.float32)
+
+
+def log_mel_source() -> str:
+    try:
+        import essentia  # noqa: F401
+    except ImportError:
+        ml_backbone.preprocess_for_backbone = synthetic_patches  # type: ignore[assignment]
+        return "synthetic patches (essentia not installed)"
+    return "essentia"
+
+
+# ── modes ───────────────────────────────────────────────────────────────────
+
+def full_mode(cache: ONNXModelCache, waveform: np.ndarray) -> tuple[np.ndarray, dict[str, object]]:
+    """Backbone + all heads; returns the embeddings and the tags of every head."""
+    result = compute_backbone_embeddings(cache, cache.heads, waveform)
+    item = result.embeddings[0]
+    tags: dict[str, object] = {}
+    run_heads(item.heads, item.embeddings, tags)
+    return item.embeddings, tags
+
+
+def heads_only_mode(store: EmbeddingStore, file_id: str, backbone: str, heads: list) -> dict[str, object]:
+    embeddings = store.load(file_id, backbone)
+    assert embeddings is not None
+    tags: dict[str, object] = {}
+    run_heads(heads, embeddings, tags)
+    return tags
+
+
+def files_per_s(files: int, wall_ms: int) -> float:
+    return files * 1000.0 / max(wall_ms, 1)
+
+
+def summarize(label: str, latencies: list[int], wall_ms: int, seconds: float) -> str:
+    rate = files_per_s(len(latencies), wall_ms)
+    return (
+        f"  {label:10s} median={statistics.median(latencies):7.1f} ms/file  wall={wall_ms:6d} ms  "
+        f"throughput={rate:9.1f} files/s ({rate * seconds:9.0f}x realtime)"
+    )
+
+
+# ── main ────────────────────────────────────────────────────────────────────
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    work = Path(tempfile.mkdtemp(prefix="nomarr_head_reprocess_bench_"))
+    try:
+        mel_source = log_mel_source()
+        models_dir = work / "models"
+        build_suite(models_dir, 1, args.heads, args.layers)
+        cache = ONNXModelCache(str(models_dir), "cpu")
+        cache.warm = True
+        backbone = next(iter(cache.backbones))
+        heads = sorted(cache.heads[backbone], key=lambda h: h.name)
+        for h in heads:  # no database: give the two-class synthetic heads their labels
+            h.labels = [f"{h.name}_a", f"{h.name}_b"]
+        changed = heads[: max(1, min(args.changed, len(heads)))]
+        changed_keys = {h.name for h in changed}
+        store = EmbeddingStore(str(work / "embeddings"), str(models_dir))
+
+        sample_rate = cache.backbones[backbone].preprocess_params.sample_rate
+        rng = np.random.default_rng(7)
+        waveform = (rng.standard_normal(int(args.seconds * sample_rate)) * 0.1).astype(np.float32)
+
+        full_lat: list[int] = []
+        full_tags: list[dict[str, object]] = []
+        full_start = internal_ms().value
+        for i in range(args.files):
+            start = internal_ms().value
+            embeddings, tags = full_mode(cache, waveform)
+            full_lat.append(internal_ms().value - start)
+            full_tags.append(tags)
+            store.save(f"library_files/{i}", backbone, embeddings)
+        full_wall = internal_ms().value - full_start
+
+        heads_lat: list[int] = []
+        mismatched = 0
+        heads_start = internal_ms().value
+        for i in range(args.files):
+            start = internal_ms().value
+            tags = heads_only_mode(store, f"library_files/{i}", backbone, changed)
+            heads_lat.append(internal_ms().value - start)
+            expected = {k: v for k, v in full_tags[i].items() if k in tags}
+            mismatched += int(not tags or expected != tags)
+        heads_wall = internal_ms().value - heads_start
+
+        print(
+            f"{backbone}: {len(heads)} heads ({len(changed_keys)} changed), {args.layers} layers, "
+            f"{args.seconds:.0f}s tracks, {args.files} files, log-mel: {mel_source}\n"
+        )
+        print(summarize("full", full_lat, full_wall, args.seconds))
+        print(summarize("heads-only", heads_lat, heads_wall, args.seconds))
+        speedup = files_per_s(args.files, heads_wall) / files_per_s(args.files, full_wall)
+        print(f"\nThroughput speedup: {speedup:.1f}x")
+        print(f"Changed-head tags identical: {'yes' if mismatched == 0 else f'NO ({mismatched} files differ)'}")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
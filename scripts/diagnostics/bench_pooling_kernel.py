@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Segment pooling microbenchmark: per-column loop vs array-based kernels.
+
+For each track length in --minutes, builds synthetic segment scores for a
+backbone with --heads heads (--labels labels in total, one embedding row
+per --hop seconds) and times three ways of pooling them into the trimmed
+mean and per-label standard deviation run_heads() needs:
+
+  1. loop   — the original pool_scores() per-column trimmed mean, one head at a time
+  2. kernel — pool_scores() on each head (vectorized trimmed mean)
+  3. joint  — pool_head_scores() over all heads and labels in one pass
+
+It also times framing a 16 kHz waveform of the same length with the original
+per-segment loop vs frame_waveform(), and checks that every pooled vector is
+byte-identical to the loop.
+
+Usage:
+    .venv/Scripts/python.exe scripts/diagnostics/bench_pooling_kernel.py
+    .venv/Scripts/python.exe scripts/diagnostics/bench_pooling_kernel.py --minutes 4 60 180 600 --labels 120 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from nomarr.components.ml.inference.ml_embed_comp import (  # noqa: E402
+    frame_waveform,
+    pool_head_scores,
+    pool_scores,
+)
+from nomarr.helpers.time_helper import internal_ms  # noqa: E402
+
+# ── defaults ────────────────────────────────────────────────────────────────
+
+SAMPLE_RATE = 16000
+TRIM_PERC = 0.1
+
+# ── CLI ─────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--minutes", type=float, nargs="+", default=[4, 30, 120, 360], help="Track lengths to time")
+    p.add_argument("--heads",   type=int,   default=12,  help="Heads attached to the backbone")
+    p.add_argument("--labels",  type=int,   default=96,  help="Labels across all heads")
+    p.add_argument("--hop",     type=float, default=1.0, help="Seconds per embedding row")
+    p.add_argument("--repeat",  type=int,   default=10,  help="Timed repetitions per mode")
+    return p.parse_args()
+
+
+# ── reference loops ─────────────────────────────────────────────────────────
+
+def loop_trimmed_mean(scores: np.ndarray, trim_perc: float) -> np.ndarray:
+    trim_count = int(np.floor(trim_perc * scores.shape[0]))
+    result = np.zeros((scores.shape[1],), dtype=np.float32)
+    for col_idx in range(scores.shape[1]):
+        col = scores[:, col_idx]
+        col = col[~np.isnan(col)]
+        if col.size == 0:
+            continue
+        col.sort()
+        hi = max(trim_count, col.size - trim_count)
+        trimmed = col[trim_count:hi] if hi > trim_count else col
+        result[col_idx] = float(np.mean(trimmed)) if trimmed.size else 0.0
+    return result
+
+
+def loop_pool(scores: np.ndarray, trim_perc: float) -> np.ndarray:
+    """The original pool_scores(mode="trimmed_mean", nan_policy="omit") path."""
+    col_all_nan = np.isnan(scores).all(axis=0)
+    return np.where(col_all_nan, 0.0, loop_trimmed_mean(scores, trim_perc)).astype(np.float32, copy=False)
+
+
+def loop_frames(waveform: np.ndarray, seg_len: int, hop_len: int) -> list[np.ndarray]:
+    frames: list[np.ndarray] = []
+    num_samples = len(waveform)
+    for start in range(0, num_samples, hop_len):
+        if start + seg_len <= num_samples:
+            seg = waveform[start : start + seg_len]
+        else:
+            seg = np.zeros(seg_len, dtype=np.float32)
+            seg[: num_samples - start] = waveform[start:num_samples]
+        frames.append(np.asarray(seg, dtype=np.float32))
+    return frames
+
+
+# ── timing ──────────────────────────────────────────────────────────────────
+
+def split_labels(total: int, heads: int) -> list[int]:
+    base, extra = divmod(total, heads)
+    return [base + (1 if i < extra else 0) for i in range(heads)]
+
+
+def median_ms(fn, repeat: int) -> float:  # type: ignore[no-untyped-def]
+    samples: list[int] = []
+    for _ in range(repeat):
+        start = internal_ms().value
+        fn()
+        samples.append(internal_ms().value - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    args = parse_args()
+    rng = np.random.default_rng(42)
+    widths = [w for w in split_labels(args.labels, args.heads) if w > 0]
+
+    print(f"{len(widths)} heads, {sum(widths)} labels, {args.hop:g} s/row, median of {args.repeat} runs\n")
+    print(f"  {'minutes':>7s} {'rows':>6s}  {'loop':>9s} {'kernel':>9s} {'joint':>9s} {'speedup':>8s}  "
+          f"{'frame loop':>10s} {'frame kern':>10s}  exact")
+    for minutes in args.minutes:
+        rows = max(1, round(minutes * 60 / args.hop))
+        heads = {f"head_{i}": rng.random((rows, w), dtype=np.float32) for i, w in enumerate(widths)}
+
+        loop = median_ms(
+            lambda: [(loop_pool(s, TRIM_PERC), np.std(s, axis=0)) for s in heads.values()], args.repeat
+        )
+        kernel = median_ms(
+            lambda: [(pool_scores(s, mode="trimmed_mean", trim_perc=TRIM_PERC), np.std(s, axis=0)) for s in heads.values()],
+            args.repeat,
+        )
+        joint = median_ms(lambda: pool_head_scores(heads, trim_perc=TRIM_PERC), args.repeat)
+
+        pooled = pool_head_scores(heads, trim_perc=TRIM_PERC)
+        exact = all(pooled[n][0].tobytes() == loop_trimmed_mean(s, TRIM_PERC).tobytes() for n, s in heads.items())
+
+        waveform = rng.standard_normal(int(minutes * 60 * SAMPLE_RATE)).astype(np.float32)
+        seg_len, hop_len = 3 * SAMPLE_RATE, int(1.5 * SAMPLE_RATE)
+        frame_loop = median_ms(lambda: loop_frames(waveform, seg_len, hop_len), max(1, args.repeat // 5))
+        frame_kernel = median_ms(lambda: frame_waveform(waveform, seg_len, hop_len), max(1, args.repeat // 5))
+
+        print(
+            f"  {minutes:7g} {rows:6d}  {loop:7.1f}ms {kernel:7.1f}ms {joint:7.1f}ms "
+            f"{loop / max(joint, 0.5):7.1f}x  {frame_loop:8.1f}ms {frame_kernel:8.1f}ms  {'yes' if exact else 'NO'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
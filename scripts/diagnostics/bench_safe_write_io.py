@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Safe-write I/O volume benchmark: full copy vs reflink clone.
+
+Copies the fixture FLAC/M4A files into a temporary library under --root
+and retags every file through TagWriter.write_safe() twice:
+
+  1. copy    — reflinks disabled, every temp copy is a full shutil.copy2
+  2. reflink — reflinks enabled when the filesystem under --root supports
+               them (Btrfs, XFS with reflink=1, bcachefs, ...)
+
+For each pass it reports wall time, the bytes the safe-write path copied
+(SafeWriteResult.bytes_copied) and, on Linux, the bytes the process actually
+wrote to storage (/proc/self/io write_bytes; 0 on tmpfs or when the page
+cache absorbs the writes — point --root at a real disk for meaningful
+numbers).
+
+Usage:
+    .venv/Scripts/python.exe scripts/diagnostics/bench_safe_write_io.py
+    .venv/Scripts/python.exe scripts/diagnostics/bench_safe_write_io.py --root /mnt/btrfs/tmp --files 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from nomarr.components.tagging import safe_write_comp  # noqa: E402
+from nomarr.components.tagging.tagging_writer_comp import TagWriter  # noqa: E402
+from nomarr.helpers.dto.path_dto import LibraryPath  # noqa: E402
+from nomarr.helpers.dto.tags_dto import Tags  # noqa: E402
+from nomarr.helpers.time_helper import internal_ms  # noqa: E402
+
+# ── defaults ────────────────────────────────────────────────────────────────
+
+FIXTURES = Path(__file__).parents[2] / "tests" / "fixtures" / "library" / "good" / "AllFormats" / "SameTrack"
+SOURCE_FILES = [FIXTURES / "cooltrack.flac", FIXTURES / "cooltrack.m4a"]
+BENCH_TAGS = {"mood-strict": ["calm"], "mood-regular": ["calm", "relaxed"], "nom_version": "bench"}
+
+# ── CLI ─────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--root",  default=None, help="Parent directory for the synthetic library (default: system temp)")
+    p.add_argument("--files", type=int, default=60, help="Number of files to retag per pass")
+    return p.parse_args()
+
+
+# ── helpers ─────────────────────────────────────────────────────────────────
+
+def proc_write_bytes() -> int | None:
+    """Bytes this process has caused to be written to storage (Linux only)."""
+    try:
+        for line in Path("/proc/self/io").read_text().splitlines():
+            if line.startswith("write_bytes:"):
+                return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def build_library(parent: Path, n_files: int) -> tuple[Path, list[LibraryPath]]:
+    root = Path(tempfile.mkdtemp(prefix="nomarr_io_bench_", dir=parent))
+    paths: list[LibraryPath] = []
+    for i in range(n_files):
+        src = SOURCE_FILES[i % len(SOURCE_FILES)]
+        dst = root / f"track_{i:05d}{src.suffix}"
+        shutil.copyfile(src, dst)
+        paths.append(LibraryPath(relative=dst.name, absolute=dst, library_id="bench", status="valid"))
+    return root, paths
+
+
+def run_pass(root: Path, paths: list[LibraryPath], allow_reflink: bool) -> tuple[int, int, int, int | None]:
+    writer = TagWriter(overwrite=True, namespace="nom")
+    tags = Tags.from_dict(BENCH_TAGS)
+    safe_write_comp.clear_fs_capability_cache()
+    ok = copied = 0
+    io_before = proc_write_bytes()
+    start = internal_ms().value
+    reflink = safe_write_comp._reflink_file if allow_reflink else _no_reflink
+    with patch.object(safe_write_comp, "_reflink_file", reflink):
+        for path in paths:
+            mtime_ms = int(os.stat(path.absolute).st_mtime * 1000)
+            result = writer.write_safe(path, tags, root, mtime_ms)
+            ok += result.success
+            copied += result.bytes_copied
+        if hasattr(os, "sync"):
+            os.sync()
+    elapsed = internal_ms().value - start
+    io_after = proc_write_bytes()
+    io = io_after - io_before if io_before is not None and io_after is not None else None
+    return ok, copied, elapsed, io
+
+
+def _no_reflink(_source: Path, _dest: Path) -> bool:
+    return False
+
+
+def mib(n: int | None) -> str:
+    return "n/a" if n is None else f"{n / 1048576:.1f} MiB"
+
+
+def main() -> None:
+    args = parse_args()
+    parent = Path(args.root) if args.root else Path(tempfile.gettempdir())
+
+    root, paths = build_library(parent, args.files)
+    try:
+        library_bytes = sum(p.absolute.stat().st_size for p in paths)
+        temp_folder = safe_write_comp._get_temp_folder(root)
+        caps = safe_write_comp.get_fs_capabilities(root, root, temp_folder)
+        print(f"Library: {len(paths)} files, {mib(library_bytes)} under {root}")
+        print(f"Filesystem: hardlink={caps.hardlink} reflink={caps.reflink}\n")
+
+        for label, allow in (("copy", False), ("reflink", True)):
+            ok, copied, elapsed, io = run_pass(root, paths, allow)
+            print(
+                f"  {label:8s} {ok}/{len(paths)} ok  {elapsed:6d} ms  "
+                f"copied={mib(copied):>10s}  disk writes={mib(io):>10s}"
+            )
+        if not caps.reflink:
+            print("\nReflinks unsupported here; both passes fall back to full copies.")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Worker cold-start benchmark: ONNX session creation with and without the
+on-disk optimized-graph cache.
+
+Builds a synthetic models directory (--backbones conv-net backbones with
+--heads MLP heads each, laid out like models/<backbone>/{embeddings,heads})
+unless --models-dir points at a real one, then times what a worker does on
+start — construct ONNXModelCache and set warm = True — in a fresh child
+process per trial:
+
+  1. off   — every session optimizes its raw model (previous behaviour)
+  2. cold  — empty SessionGraphCache: optimize and save every graph
+  3. warm  — populated SessionGraphCache: load every pre-optimized graph
+
+Finally checks that sessions loaded from the cache produce byte-identical
+outputs to freshly optimized ones.
+
+Usage:
+    .venv/Scripts/python.exe scripts/diagnostics/bench_session_cache.py
+    .venv/Scripts/python.exe scripts/diagnostics/bench_session_cache.py --heads 20 --trials 7
+    .venv/Scripts/python.exe scripts/diagnostics/bench_session_cache.py --models-dir /app/models --device gpu
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from nomarr.components.ml.onnx.ml_cache import ONNXModelCache  # noqa: E402
+from nomarr.components.ml.onnx.ml_graph_cache_comp import SessionGraphCache  # noqa: E402
+from nomarr.components.ml.onnx.ml_session_comp import create_session  # noqa: E402
+from nomarr.helpers.time_helper import internal_ms  # noqa: E402
+
+# ── defaults ────────────────────────────────────────────────────────────────
+
+# backbone → (patch_frames, n_mels), matching ml_preprocess_comp
+BACKBONE_SHAPES = {"effnet": (128, 96), "musicnn": (187, 96), "vggish": (96, 64), "yamnet": (96, 64)}
+SUITE_HASH = "bench"
+
+# ── CLI ─────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--models-dir", default=None, help="Real models directory (default: synthetic suite)")
+    p.add_argument("--backbones",  type=int, default=4,  help="Synthetic backbones (max 4)")
+    p.add_argument("--heads",      type=int, default=12, help="Synthetic heads per backbone")
+    p.add_argument("--layers",     type=int, default=16, help="Conv+BatchNorm+Relu blocks per synthetic backbone")
+    p.add_argument("--trials",     type=int, default=5,  help="Child processes per mode")
+    p.add_argument("--device",     default="cpu", choices=["cpu", "gpu"])
+    p.add_argument("--child",      default=None, choices=["off", "cache"], help=argparse.SUPPRESS)
+    p.add_argument("--cache-dir",  default=None, help=argparse.SUPPRESS)
+    return p.parse_args()
+
+
+# ── synthetic suite ─────────────────────────────────────────────────────────
+
+def build_suite(root: Path, n_backbones: int, n_heads: int, layers: int) -> None:
+    import onnx
+    from onnx import TensorProto, helper, numpy_helper
+
+    rng = np.random.default_rng(0)
+    for name, (frames, mels) in list(BACKBONE_SHAPES.items())[:n_backbones]:
+        nodes = [helper.make_node("Unsqueeze", ["melspectrogram", "axes"], ["x0"])]
+        inits = [numpy_helper.from_array(np.array([1], dtype=np.int64), "axes")]
+        prev, ch = "x0", 1
+        for i in range(layers):
+            out_ch = 32
+            inits += [
+                numpy_helper.from_array((rng.standard_normal((out_ch, ch, 3, 3)) * 0.1).astype(np.float32), f"w{i}"),
+                numpy_helper.from_array(rng.standard_normal(out_ch).astype(np.float32), f"b{i}"),
+            ]
+            inits += [numpy_helper.from_array((rng.random(out_ch) + 0.5).astype(np.float32), f"{k}{i}") for k in "sbmv"]
+            nodes += [
+                helper.make_node("Conv", [prev, f"w{i}", f"b{i}"], [f"c{i}"], pads=[1, 1, 1, 1]),
+                helper.make_node("BatchNormalization", [f"c{i}", f"s{i}", f"b{i}", f"m{i}", f"v{i}"], [f"n{i}"]),
+                helper.make_node("Relu", [f"n{i}"], [f"r{i}"]),
+            ]
+            prev, ch = f"r{i}", out_ch
+        nodes += [
+            helper.make_node("GlobalAveragePool", [prev], ["pooled"]),
+            helper.make_node("Flatten", ["pooled"], ["embeddings"]),
+        ]
+        graph = helper.make_graph(
+            nodes,
+            name,
+            [helper.make_tensor_value_info("melspectrogram", TensorProto.FLOAT, [None, frames, mels])],
+            [helper.make_tensor_value_info("embeddings", TensorProto.FLOAT, [None, ch])],
+            initializer=inits,
+        )
+        save(onnx, helper, graph, root / name / "embeddings" / f"{name}.onnx")
+
+        for h in range(n_heads):
+            weights = {
+                "w1": rng.standard_normal((ch, 100)).astype(np.float32),
+                "b1": rng.standard_normal(100).astype(np.float32),
+                "w2": rng.standard_normal((100, 2)).astype(np.float32),
+                "b2": rng.standard_normal(2).astype(np.float32),
+            }
+            head_nodes = [
+                helper.make_node("MatMul", ["model/Placeholder", "w1"], ["h1"]),
+                helper.make_node("Add", ["h1", "b1"], ["h1b"]),
+                helper.make_node("Relu", ["h1b"], ["h1r"]),
+                helper.make_node("MatMul", ["h1r", "w2"], ["h2"]),
+                helper.make_node("Add", ["h2", "b2"], ["logits"]),
+                helper.make_node("Sigmoid", ["logits"], ["model/Sigmoid"]),
+            ]
+            head_graph = helper.make_graph(
+                head_nodes,
+                f"head_{h}",
+                [helper.make_tensor_value_info("model/Placeholder", TensorProto.FLOAT, [None, ch])],
+                [helper.make_tensor_value_info("model/Sigmoid", TensorProto.FLOAT, [None, 2])],
+                initializer=[numpy_helper.from_array(v, k) for k, v in weights.items()],
+            )
+            save(onnx, helper, head_graph, root / name / "heads" / "sigmoid" / f"head_{h:02d}.onnx")
+
+
+def save(onnx: object, helper: object, graph: object, path: Path) -> None:
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])  # type: ignore[attr-defined]
+    model.ir_version = 8
+    path.parent.mkdir(parents=True, exist_ok=True)
+    onnx.save(model, str(path))  # type: ignore[attr-defined]
+
+
+# ── timing ──────────────────────────────────────────────────────────────────
+
+def child(models_dir: str, cache_dir: str | None, device: str) -> None:
+    """Time one worker-style warm-up and print elapsed ms."""
+    logging.basicConfig(level=logging.ERROR)
+    start = internal_ms().value
+    graph_cache = SessionGraphCache(cache_dir, SUITE_HASH) if cache_dir else None
+    cache = ONNXModelCache(models_dir, device, graph_cache=graph_cache)  # type: ignore[arg-type]
+    cache.warm = True
+    print(internal_ms().value - start, cache.model_count)
+
+
+def run_trial(models_dir: str, cache_dir: str | None, device: str) -> tuple[int, int]:
+    cmd = [sys.executable, __file__, "--child", "cache" if cache_dir else "off", "--models-dir", models_dir]
+    cmd += ["--device", device] + (["--cache-dir", cache_dir] if cache_dir else [])
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout.split()
+    return int(out[0]), int(out[1])
+
+
+def check_parity(models_dir: str, cache_dir: str, device: str) -> list[str]:
+    graph_cache = SessionGraphCache(cache_dir, SUITE_HASH)
+    mismatched: list[str] = []
+    rng = np.random.default_rng(1)
+    for path in sorted(Path(models_dir).rglob("*.onnx")):
+        plain = create_session(str(path), device)
+        cached = create_session(str(path), device, graph_cache=graph_cache)
+        feeds = {}
+        for inp in plain.get_inputs():
+            shape = [d if isinstance(d, int) else 4 for d in inp.shape]
+            feeds[inp.name] = rng.standard_normal(shape).astype(np.float32)
+        if plain.run(None, feeds)[0].tobytes() != cached.run(None, feeds)[0].tobytes():
+            mismatched.append(path.name)
+    return mismatched
+
+
+def summarize(label: str, samples: list[int]) -> str:
+    return f"  {label:5s} median={statistics.median(samples):7.0f} ms  min={min(samples):6d} ms  max={max(samples):6d} ms"
+
+
+def main() -> None:
+    args = parse_args()
+    if args.child:
+        child(args.models_dir, args.cache_dir, args.device)
+        return
+
+    work = Path(tempfile.mkdtemp(prefix="nomarr_session_bench_"))
+    try:
+        models_dir = args.models_dir
+        if models_dir is None:
+            models_dir = str(work / "models")
+            build_suite(Path(models_dir), min(args.backbones, len(BACKBONE_SHAPES)), args.heads, args.layers)
+        cache_dir = str(work / "graphs")
+
+        off = [run_trial(models_dir, None, args.device) for _ in range(args.trials)]
+        cold = [run_trial(models_dir, cache_dir, args.device)]
+        warm = [run_trial(models_dir, cache_dir, args.device) for _ in range(args.trials)]
+
+        n_models = off[0][1]
+        cache_mb = sum(p.stat().st_size for p in Path(cache_dir).rglob("*.onnx")) / 1048576
+        print(f"{n_models} models in {models_dir} (device={args.device}), {args.trials} child processes per mode\n")
+        print(summarize("off", [ms for ms, _ in off]))
+        print(summarize("cold", [ms for ms, _ in cold]))
+        print(summarize("warm", [ms for ms, _ in warm]))
+        speedup = statistics.median(ms for ms, _ in off) / max(statistics.median(ms for ms, _ in warm), 1)
+        print(f"\nWarm-cache speedup (median): {speedup:.2f}x   cache size: {cache_mb:.1f} MiB")
+        mismatched = check_parity(models_dir, cache_dir, args.device)
+        print(f"Bit-exact: {'yes' if not mismatched else 'NO — ' + ', '.join(mismatched)}")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Streaming-decode benchmark: whole-file decode vs block-wise decode with
+incremental patch extraction (stream_audio_mono + StreamingPatchExtractor).
+
+Writes stereo 16-bit 44.1 kHz WAV files of each --minutes length (a chirp
+plus noise) and runs every mode in a fresh child process, so each mode's
+peak RSS is measured on its own:
+
+  1. whole     — decode the whole file, then log-mel and patches for all of it
+                 (MonoLoader when essentia is installed, else ffmpeg read to EOF)
+  2. streaming — ffmpeg blocks of --block-s seconds fed to StreamingPatchExtractor
+
+Reports peak RSS above the post-import baseline, time to the first patch
+(when the first backbone batch could be dispatched) and total time.  Without
+essentia the per-frame log-mel transform is replaced by a numpy stand-in of
+the same frame size, for both modes.  Requires ffmpeg on PATH.
+
+Usage:
+    .venv/Scripts/python.exe scripts/diagnostics/bench_streaming_decode.py
+    .venv/Scripts/python.exe scripts/diagnostics/bench_streaming_decode.py --minutes 10 60 180 --backbone musicnn
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from nomarr.components.ml.audio import ml_preprocess_comp  # noqa: E402
+from nomarr.components.ml.audio.ml_audio_comp import stream_audio_mono  # noqa: E402
+from nomarr.components.ml.audio.ml_preprocess_comp import (  # noqa: E402
+    StreamingPatchExtractor,
+    get_params,
+    preprocess_for_backbone,
+)
+
+SOURCE_SR = 44100
+TARGET_SR = 16000
+
+# ── CLI ─────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--minutes",  type=float, nargs="+", default=[10, 30, 60], help="Generated track lengths")
+    p.add_argument("--backbone", default="effnet", help="Backbone whose preprocessing is run")
+    p.add_argument("--block-s",  type=float, default=5.0, help="Streaming block length in seconds")
+    p.add_argument("--child",    nargs=2, metavar=("MODE", "WAV"), help=argparse.SUPPRESS)
+    return p.parse_args()
+
+
+# ── helpers ─────────────────────────────────────────────────────────────────
+
+def write_wav(path: Path, minutes: float) -> None:
+    """Write a stereo 16-bit chirp-plus-noise WAV, one minute at a time."""
+    rng = np.random.default_rng(0)
+    chunk = SOURCE_SR * 60
+    total = int(minutes * chunk)
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(SOURCE_SR)
+        for start in range(0, total, chunk):
+            t = np.arange(start, min(start + chunk, total)) / SOURCE_SR
+            tone = 0.4 * np.sin(2 * np.pi * (220 + 40 * np.sin(t / 7)) * t)
+            left = tone + 0.05 * rng.standard_normal(len(t))
+            right = 0.8 * tone + 0.05 * rng.standard_normal(len(t))
+            pcm = (np.stack([left, right], axis=1) * 32767).astype("<i2")
+            w.writeframes(pcm.tobytes())
+
+
+def have_essentia() -> bool:
+    try:
+        import essentia.standard  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def numpy_mel_frame_fn(params: ml_preprocess_comp.BackbonePreprocessParams):
+    """Stand-in for the essentia frame chain: Hann window, rFFT, banded power, log10."""
+    window = np.hanning(params.n_fft).astype(np.float32)
+    edges = np.linspace(0, params.n_fft // 2 + 1, params.n_mels + 1).astype(int)
+
+    def _frame(frame: np.ndarray) -> np.ndarray:
+        power = np.abs(np.fft.rfft(frame * window)) ** 2
+        bands = np.add.reduceat(power, edges[:-1])
+        return np.log10(params.post_scale * bands + params.post_shift).astype(np.float32)
+
+    return _frame
+
+
+def peak_rss_mb() -> float:
+    # VmHWM is this process image's own high-water mark; ru_maxrss also keeps
+    # the parent's peak across fork+exec, which would hide a child's growth.
+    status = Path("/proc/self/status")
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    # ru_maxrss is bytes on macOS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024)
+
+
+# ── child: one mode, one file ───────────────────────────────────────────────
+
+def run_child(mode: str, wav: str, backbone: str, block_s: float) -> None:
+    essentia = have_essentia()
+    if not essentia:
+        ml_preprocess_comp._mel_frame_fn = numpy_mel_frame_fn
+    baseline = peak_rss_mb()
+    t0 = time.perf_counter()
+    first_patch_s = None
+    n_patches = 0
+    if mode == "whole":
+        if essentia:
+            from nomarr.components.ml.audio.ml_audio_comp import load_audio_mono
+
+            waveform = load_audio_mono(wav, TARGET_SR).waveform
+        else:
+            waveform = np.concatenate(list(stream_audio_mono(wav, target_sr=TARGET_SR, block_s=60.0)))
+        n_patches = len(preprocess_for_backbone(waveform, backbone))
+        first_patch_s = time.perf_counter() - t0
+    else:
+        extractor = StreamingPatchExtractor(backbone)
+        for block in stream_audio_mono(wav, target_sr=TARGET_SR, block_s=block_s):
+            if len(extractor.push(block)) and first_patch_s is None:
+                first_patch_s = time.perf_counter() - t0
+        n_patches = extractor.total_patches
+    total_s = time.perf_counter() - t0
+    print(
+        json.dumps(
+            {
+                "patches": n_patches,
+                "rss_mb": peak_rss_mb() - baseline,
+                "first_patch_s": first_patch_s,
+                "total_s": total_s,
+                "essentia": essentia,
+            }
+        )
+    )
+
+
+# ── main ────────────────────────────────────────────────────────────────────
+
+def main() -> None:
+    args = parse_args()
+    get_params(args.backbone)  # fail fast on unknown backbones
+    if args.child:
+        run_child(args.child[0], args.child[1], args.backbone, args.block_s)
+        return
+    if shutil.which("ffmpeg") is None:
+        sys.exit("ffmpeg not found on PATH — streaming decode needs it")
+
+    work = Path(tempfile.mkdtemp(prefix="nomarr_stream_bench_"))
+    try:
+        print(f"backbone={args.backbone} block={args.block_s}s source={SOURCE_SR} Hz stereo WAV\n")
+        print(f"{'minutes':>7}  {'mode':<9}  {'patches':>7}  {'peak RSS':>10}  {'first patch':>11}  {'total':>8}")
+        notes = set()
+        for minutes in args.minutes:
+            wav = work / f"track_{minutes:g}min.wav"
+            write_wav(wav, minutes)
+            results = {}
+            for mode in ("whole", "streaming"):
+                cmd = [sys.executable, __file__, "--backbone", args.backbone, "--block-s", str(args.block_s)]
+                out = subprocess.run([*cmd, "--child", mode, str(wav)], capture_output=True, text=True, check=True)
+                r = results[mode] = json.loads(out.stdout.strip().splitlines()[-1])
+                if not r["essentia"]:
+                    notes.add("essentia not installed: numpy log-mel stand-in, whole mode decoded by ffmpeg")
+                first = f"{r['first_patch_s']:.2f}s" if r["first_patch_s"] is not None else "-"
+                print(
+                    f"{minutes:>7g}  {mode:<9}  {r['patches']:>7d}  {r['rss_mb']:>7.1f} MB  "
+                    f"{first:>11}  {r['total_s']:>7.2f}s"
+                )
+            whole, streamed = results["whole"], results["streaming"]
+            if whole["patches"] != streamed["patches"]:
+                print(f"  !! patch count differs ({whole['patches']} vs {streamed['patches']})")
+            print(
+                f"  → RSS {whole['rss_mb'] / max(streamed['rss_mb'], 0.1):.1f}x lower, first patch "
+                f"{(whole['first_patch_s'] or 0) / max(streamed['first_patch_s'] or 1e-3, 1e-3):.0f}x sooner\n"
+            )
+            wav.unlink()
+        for note in sorted(notes):
+            print(f"note: {note}")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
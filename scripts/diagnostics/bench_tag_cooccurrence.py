@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tag correlation benchmark: per-pair Python set intersections vs the sparse
+incidence-matrix engine (tag_cooccurrence_comp).
+
+Generates synthetic libraries (default 10k, 100k and 500k files).  Each file
+gets one JSON-array mood row per mood tier drawn from a --moods vocabulary and
+one value per *_tier key, the row shapes that
+``db.tags.get_mood_and_tier_tags_for_correlation()`` returns.  Times:
+
+  1. sets   — the previous compute_tag_correlation_matrix (kept below verbatim)
+  2. matrix — the current compute_tag_correlation_matrix
+  3. pairs  — every mood x mood count via co_occurrence_counts() + top_k_pairs()
+
+and checks both correlation results are equal.
+
+Usage:
+    .venv/Scripts/python.exe scripts/diagnostics/bench_tag_cooccurrence.py
+    .venv/Scripts/python.exe scripts/diagnostics/bench_tag_cooccurrence.py --sizes 10000 100000 --moods 120
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from nomarr.components.analytics.analytics_comp import compute_tag_correlation_matrix  # noqa: E402
+from nomarr.components.analytics.tag_cooccurrence_comp import (  # noqa: E402
+    TagIncidenceBuilder,
+    co_occurrence_counts,
+    expand_columns,
+    top_k_pairs,
+)
+from nomarr.helpers.dto.analytics_dto import ComputeTagCorrelationMatrixParams, TagCorrelationData  # noqa: E402
+from nomarr.helpers.time_helper import internal_ms  # noqa: E402
+
+MOOD_TIERS = ("strict", "regular", "loose")
+TIER_KEYS = ("nom:energy_tier", "nom:valence_tier", "nom:danceability_tier", "nom:acoustic_tier")
+TIER_VALUES = ("low", "medium", "high")
+
+# ── CLI ─────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 500_000], help="Library sizes (files)")
+    p.add_argument("--moods", type=int, default=60, help="Mood vocabulary size")
+    p.add_argument("--top-n", type=int, default=20, help="top_n passed to the correlation matrix")
+    p.add_argument("--seed",  type=int, default=7)
+    return p.parse_args()
+
+
+# ── previous implementation ────────────────────────────────────────────────
+
+def set_based_correlation_matrix(params: ComputeTagCorrelationMatrixParams) -> TagCorrelationData:
+    """compute_tag_correlation_matrix before the incidence-matrix engine."""
+    mood_counter: Counter = Counter()
+    for _file_id, tag_value in params.mood_tag_rows:
+        try:
+            moods = json.loads(tag_value)
+            if isinstance(moods, list):
+                for mood in moods:
+                    mood_counter[str(mood).strip()] += 1
+        except json.JSONDecodeError:
+            pass
+    top_moods = [mood for mood, _ in mood_counter.most_common(params.top_n)]
+    if not top_moods:
+        return TagCorrelationData(mood_correlations={}, mood_tier_correlations={})
+    mood_file_sets: dict[str, set] = {mood: set() for mood in top_moods}
+    for file_id, tag_value in params.mood_tag_rows:
+        try:
+            moods = json.loads(tag_value)
+            if isinstance(moods, list):
+                for mood in moods:
+                    mood_str = str(mood).strip()
+                    if mood_str in mood_file_sets:
+                        mood_file_sets[mood_str].add(file_id)
+        except json.JSONDecodeError:
+            pass
+    mood_correlations: dict[str, dict[str, float]] = {}
+    for mood_a in top_moods:
+        files_a = mood_file_sets[mood_a]
+        if not files_a:
+            continue
+        correlations: dict[str, float] = {}
+        for mood_b in top_moods:
+            if mood_a == mood_b:
+                continue
+            intersection = len(files_a & mood_file_sets[mood_b])
+            correlations[mood_b] = round(intersection / len(files_a), 3)
+        mood_correlations[mood_a] = dict(sorted(correlations.items(), key=lambda x: x[1], reverse=True)[:10])
+    mood_tier_correlations: dict[str, dict[str, float]] = {}
+    for mood in top_moods:
+        mood_files = mood_file_sets[mood]
+        if not mood_files:
+            continue
+        tier_correlations: dict[str, float] = {}
+        for tier_tag_key in params.tier_tag_keys:
+            tier_name = tier_tag_key.replace(f"{params.namespace}:", "").replace("_tier", "").split("_")[-1]
+            tier_value_counts: Counter = Counter()
+            for file_id, tier_value in params.tier_tag_rows.get(tier_tag_key, []):
+                if file_id in mood_files:
+                    tier_value_counts[tier_value] += 1
+            for tier_value, count in tier_value_counts.items():
+                tier_correlations[f"{tier_value}_{tier_name}"] = round(count / len(mood_files), 3)
+        mood_tier_correlations[mood] = dict(sorted(tier_correlations.items(), key=lambda x: x[1], reverse=True)[:10])
+    return TagCorrelationData(mood_correlations=mood_correlations, mood_tier_correlations=mood_tier_correlations)
+
+
+# ── synthetic library ──────────────────────────────────────────────────────
+
+def synthetic_library(files: int, moods: int, top_n: int, seed: int) -> ComputeTagCorrelationMatrixParams:
+    rng = np.random.default_rng(seed)
+    vocabulary = [f"mood{i:03d}" for i in range(moods)]
+    # Zipf-like popularity so top_n is a real selection
+    weights = 1.0 / np.arange(1, moods + 1)
+    weights /= weights.sum()
+    mood_rows: list[tuple[str, str]] = []
+    per_tier = rng.integers(0, 4, size=(files, len(MOOD_TIERS)))
+    picks = rng.choice(moods, size=(files, len(MOOD_TIERS), 3), p=weights)
+    for i in range(files):
+        file_id = f"library_files/{i}"
+        for t in range(len(MOOD_TIERS)):
+            chosen = dict.fromkeys(vocabulary[m] for m in picks[i, t, : per_tier[i, t]])
+            if chosen:
+                mood_rows.append((file_id, json.dumps(list(chosen))))
+    tier_values = rng.integers(0, len(TIER_VALUES), size=(len(TIER_KEYS), files))
+    tier_rows = {
+        key: [(f"library_files/{i}", TIER_VALUES[v]) for i, v in enumerate(tier_values[k])]
+        for k, key in enumerate(TIER_KEYS)
+    }
+    return ComputeTagCorrelationMatrixParams(
+        namespace="nom",
+        top_n=top_n,
+        mood_tag_rows=mood_rows,
+        tier_tag_keys=list(TIER_KEYS),
+        tier_tag_rows=tier_rows,
+    )
+
+
+def same_values(a: TagCorrelationData, b: TagCorrelationData) -> bool:
+    return a.mood_correlations == b.mood_correlations and a.mood_tier_correlations == b.mood_tier_correlations
+
+
+def all_mood_pairs(params: ComputeTagCorrelationMatrixParams) -> int:
+    """Every mood x mood file count in one product; returns the number of non-zero pairs."""
+    builder = TagIncidenceBuilder()
+    builder.add_keyed("mood", params.mood_tag_rows)
+    incidence = expand_columns(builder.build(), lambda column: json.loads(column[1]))
+    counts = co_occurrence_counts(incidence)
+    return len(top_k_pairs(counts, counts.size, labels=incidence.columns))
+
+
+def timed(fn, *args):  # type: ignore[no-untyped-def]
+    start = internal_ms().value
+    result = fn(*args)
+    return result, internal_ms().value - start
+
+
+# ── main ────────────────────────────────────────────────────────────────────
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    print(f"{args.moods} moods (top_n={args.top_n}), {len(TIER_KEYS)} tier keys, 3 mood tiers per file\n")
+    print(f"  {'files':>8s} {'rows':>9s} {'sets ms':>9s} {'matrix ms':>10s} {'speedup':>8s} "
+          f"{'pairs ms':>9s} {'pairs':>6s}  equal")
+    for size in args.sizes:
+        params = synthetic_library(size, args.moods, args.top_n, args.seed)
+        rows = len(params.mood_tag_rows) + sum(len(r) for r in params.tier_tag_rows.values())
+        legacy, legacy_ms = timed(set_based_correlation_matrix, params)
+        current, current_ms = timed(compute_tag_correlation_matrix, params)
+        pairs, pairs_ms = timed(all_mood_pairs, params)
+        print(
+            f"  {size:8d} {rows:9d} {legacy_ms:9d} {current_ms:10d} {legacy_ms / max(current_ms, 1):7.1f}x "
+            f"{pairs_ms:9d} {pairs:6d}  {'yes' if same_values(legacy, current) else 'NO'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Tag-write throughput benchmark: serial loop vs ParallelWriteEngine.
+
+Builds a synthetic library by copying the fixture FLAC/M4A/OGG files N times into
+one or more temporary roots (each root stands in for a storage device), then
+writes the same tag set to every file twice:
+
+  1. Serially — one TagWriter.write_safe() call after another, the way
+     reconcile_library worked before the write engine.
+  2. In parallel — through ParallelWriteEngine with --workers threads and at
+     most --per-device concurrent writes per device key.
+
+Both passes use the production safe-write path (copy/hardlink, verify,
+atomic replace), so the numbers include fsync and probe costs.
+
+Usage:
+    .venv/Scripts/python.exe scripts/diagnostics/bench_tag_write_engine.py
+    .venv/Scripts/python.exe scripts/diagnostics/bench_tag_write_engine.py --files 800 --workers 8 --per-device 4
+    .venv/Scripts/python.exe scripts/diagnostics/bench_tag_write_engine.py --roots /mnt/disk1/tmp /mnt/disk2/tmp
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from nomarr.components.processing.write_engine_comp import DeviceKeyResolver, ParallelWriteEngine  # noqa: E402
+from nomarr.components.tagging.tagging_writer_comp import TagWriter  # noqa: E402
+from nomarr.helpers.dto.path_dto import LibraryPath  # noqa: E402
+from nomarr.helpers.dto.tags_dto import Tags  # noqa: E402
+from nomarr.helpers.time_helper import internal_ms  # noqa: E402
+
+# ── defaults ────────────────────────────────────────────────────────────────
+
+FIXTURES = Path(__file__).parents[2] / "tests" / "fixtures" / "library" / "good"
+SOURCE_FILES = [
+    FIXTURES / "AllFormats" / "SameTrack" / "cooltrack.flac",
+    FIXTURES / "AllFormats" / "SameTrack" / "cooltrack.m4a",
+    FIXTURES / "AllFormats" / "SameTrack" / "cooltrack.ogg",
+]
+BENCH_TAGS = {
+    "mood-strict": ["happy", "energetic"],
+    "mood-regular": ["happy", "energetic", "party"],
+    "danceability": "0.73",
+    "nom_version": "bench",
+}
+
+# ── CLI ─────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--files",      type=int, default=200, help="Files per pass (spread across roots)")
+    p.add_argument("--workers",    type=int, default=4,   help="ParallelWriteEngine max_workers")
+    p.add_argument("--per-device", type=int, default=2,   help="ParallelWriteEngine per_device_limit")
+    p.add_argument("--roots",      nargs="*", default=None,
+                   help="Parent directories for synthetic library roots (default: one system temp dir)")
+    return p.parse_args()
+
+
+# ── synthetic library ───────────────────────────────────────────────────────
+
+def build_library(parents: list[Path], n_files: int) -> list[tuple[Path, list[Path]]]:
+    """Copy fixture audio into one temp library root per parent directory."""
+    libraries: list[tuple[Path, list[Path]]] = []
+    for parent in parents:
+        root = Path(tempfile.mkdtemp(prefix="nomarr_bench_", dir=parent))
+        libraries.append((root, []))
+    for i in range(n_files):
+        root, files = libraries[i % len(libraries)]
+        src = SOURCE_FILES[i % len(SOURCE_FILES)]
+        album = root / f"album_{i // 20:03d}"
+        album.mkdir(exist_ok=True)
+        dst = album / f"track_{i:05d}{src.suffix}"
+        shutil.copyfile(src, dst)
+        files.append(dst)
+    return libraries
+
+
+def make_jobs(libraries: list[tuple[Path, list[Path]]]) -> list[tuple[Path, LibraryPath]]:
+    jobs: list[tuple[Path, LibraryPath]] = []
+    for root, files in libraries:
+        for f in files:
+            jobs.append((root, LibraryPath(relative=str(f.relative_to(root)), absolute=f, library_id="bench", status="valid")))
+    return jobs
+
+
+# ── passes ──────────────────────────────────────────────────────────────────
+
+def write_one(writer: TagWriter, tags: Tags, job: tuple[Path, LibraryPath]) -> bool:
+    root, path = job
+    mtime_ms = int(os.stat(path.absolute).st_mtime * 1000)
+    return writer.write_safe(path, tags, root, mtime_ms).success
+
+
+def run_serial(jobs: list[tuple[Path, LibraryPath]], writer: TagWriter, tags: Tags) -> tuple[int, int]:
+    start = internal_ms().value
+    ok = sum(1 for job in jobs if write_one(writer, tags, job))
+    return ok, internal_ms().value - start
+
+
+def run_parallel(
+    jobs: list[tuple[Path, LibraryPath]], writer: TagWriter, tags: Tags, workers: int, per_device: int
+) -> tuple[int, int, dict[str, int]]:
+    resolver = DeviceKeyResolver()
+    engine = ParallelWriteEngine(max_workers=workers, per_device_limit=per_device)
+    start = internal_ms().value
+    outcomes = engine.run(jobs, lambda job: write_one(writer, tags, job), lambda job: resolver(job[1].absolute))
+    elapsed = internal_ms().value - start
+    per_device: dict[str, int] = {}
+    for o in outcomes:
+        per_device[o.device] = per_device.get(o.device, 0) + 1
+    return sum(1 for o in outcomes if o.result), elapsed, per_device
+
+
+def rate(n: int, ms: int) -> float:
+    return n * 1000.0 / ms if ms > 0 else float("inf")
+
+
+def main() -> None:
+    args = parse_args()
+    parents = [Path(r) for r in args.roots] if args.roots else [Path(tempfile.gettempdir())]
+    writer = TagWriter(overwrite=True, namespace="nom")
+    tags = Tags.from_dict(BENCH_TAGS)
+
+    print(f"Building synthetic library: {args.files} files across {len(parents)} root(s) …")
+    libraries = build_library(parents, args.files)
+    try:
+        jobs = make_jobs(libraries)
+
+        ok_serial, ms_serial = run_serial(jobs, writer, tags)
+        print(f"  serial:   {ok_serial}/{len(jobs)} ok in {ms_serial} ms  ({rate(ok_serial, ms_serial):.1f} files/s)")
+
+        ok_par, ms_par, per_device = run_parallel(jobs, writer, tags, args.workers, args.per_device)
+        print(
+            f"  parallel: {ok_par}/{len(jobs)} ok in {ms_par} ms  ({rate(ok_par, ms_par):.1f} files/s)"
+            f"  workers={args.workers} per_device={args.per_device}"
+        )
+        for device, count in sorted(per_device.items()):
+            print(f"    {device}: {count} files")
+
+        if ms_par > 0:
+            print(f"\nSpeedup: {ms_serial / ms_par:.2f}x")
+    finally:
+        for root, _ in libraries:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
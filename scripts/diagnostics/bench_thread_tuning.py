@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+CPU thread-tuning benchmark: the default two-thread ONNX session pool vs the
+calibrated pool of ml_thread_tuning_comp.
+
+Builds the synthetic backbones of bench_session_cache.py (or uses
+--models-dir) and runs calibrate_backbone() for every backbone and every
+worker count in --workers, exactly as a worker does on a CPU-only host.
+Prints every measured thread/worker combination and, per worker count, the
+chosen pool's throughput against the default pool.
+
+Throughput is aggregate patches/s of N concurrent sessions on N threads
+(ORT releases the GIL while running), one synthetic 32-patch batch per run.
+
+Usage:
+    .venv/Scripts/python.exe scripts/diagnostics/bench_thread_tuning.py
+    .venv/Scripts/python.exe scripts/diagnostics/bench_thread_tuning.py --workers 1 2 4 --duration-ms 2000
+    .venv/Scripts/python.exe scripts/diagnostics/bench_thread_tuning.py --models-dir /app/models --backbones 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bench_session_cache import BACKBONE_SHAPES, build_suite  # noqa: E402
+
+from nomarr.components.ml.onnx.ml_discovery_comp import discover_backbone_models  # noqa: E402
+from nomarr.components.ml.resources.ml_thread_tuning_comp import calibrate_backbone, host_profile_id  # noqa: E402
+from nomarr.components.platform.resource_monitor_comp import get_cpu_topology  # noqa: E402
+
+# ── CLI ─────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--models-dir",  default=None, help="Real models directory (default: synthetic suite)")
+    p.add_argument("--backbones",   type=int, default=2,  help="Backbones to calibrate (synthetic max 4)")
+    p.add_argument("--layers",      type=int, default=16, help="Conv+BatchNorm+Relu blocks per synthetic backbone")
+    p.add_argument("--workers",     type=int, nargs="+", default=[1, 2], help="Configured worker counts to tune for")
+    p.add_argument("--duration-ms", type=int, default=1000, help="Measurement time per combination")
+    return p.parse_args()
+
+
+# ── main ────────────────────────────────────────────────────────────────────
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    work = Path(tempfile.mkdtemp(prefix="nomarr_thread_bench_"))
+    try:
+        models_dir = args.models_dir
+        if models_dir is None:
+            models_dir = str(work / "models")
+            build_suite(Path(models_dir), min(args.backbones, len(BACKBONE_SHAPES)), 0, args.layers)
+
+        topology = get_cpu_topology()
+        print(
+            f"host={host_profile_id(topology)} cpus={topology['cpus']} (host {topology['host_cpus']}) "
+            f"numa_nodes={topology['numa_nodes']} model={topology['model'] or '?'}\n"
+        )
+        for model in discover_backbone_models(models_dir)[: args.backbones]:
+            for workers in args.workers:
+                profile = calibrate_backbone(
+                    model._path, model.backbone_name, workers, topology, duration_ms=args.duration_ms
+                )
+                print(f"{model.backbone_name} — tuned for {workers} worker(s):")
+                for c in sorted(profile.candidates, key=lambda c: (c.workers, c.intra_op, not c.allow_spinning)):
+                    chosen = (c.workers, c.intra_op, c.allow_spinning) == (workers, profile.intra_op, profile.allow_spinning)
+                    print(
+                        f"  {'*' if chosen else ' '} workers={c.workers}  intra={c.intra_op:2d}  "
+                        f"spin={'on ' if c.allow_spinning else 'off'}  {c.patches_per_s:9.0f} patches/s"
+                    )
+                print(
+                    f"  chosen {profile.intra_op} thread(s){'' if profile.allow_spinning else ' (no spin)'}: "
+                    f"{profile.patches_per_s:.0f} patches/s vs default {profile.default_patches_per_s:.0f} "
+                    f"({profile.patches_per_s / max(profile.default_patches_per_s, 1e-9):.2f}x); "
+                    f"best pool size {profile.best_workers} worker(s)\n"
+                )
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
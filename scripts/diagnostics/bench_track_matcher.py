@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Playlist-import matching benchmark: full library scan per playlist track vs the
+TrackCandidateIndex, per track and batched.
+
+Generates synthetic libraries (default 10k, 100k and 300k tracks) with repeated
+artists, covers and ISRCs, plus a playlist (default 500 tracks) of exact,
+remastered, featuring, misspelled, shuffled and unknown entries.  Times:
+
+  1. scan    — match_track(track, library) for --scan-sample playlist tracks,
+               extrapolated to the whole playlist
+  2. indexed — match_track(track, library, index) per track, index build included
+  3. blocked — match_tracks_batched(blocked=True): candidates scored in one cpdist call
+  4. full    — match_tracks_batched(blocked=False): titles x library in cdist calls
+
+prints the per-import timings of the blocked batch and checks that every
+mode returns the same results (the scan on its sample).
+
+Usage:
+    .venv/Scripts/python.exe scripts/diagnostics/bench_track_matcher.py
+    .venv/Scripts/python.exe scripts/diagnostics/bench_track_matcher.py --sizes 50000 --playlist 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import string
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from nomarr.components.playlist_import.track_matcher_comp import (  # noqa: E402
+    LibraryTrack,
+    TrackCandidateIndex,
+    match_track,
+    match_tracks_batched,
+)
+from nomarr.helpers.dto.playlist_import_dto import PlaylistTrackInput  # noqa: E402
+from nomarr.helpers.time_helper import internal_ms  # noqa: E402
+
+WORDS = [
+    "love", "heart", "night", "day", "fire", "rain", "dream", "time", "light", "dark", "baby", "girl", "boy",
+    "world", "life", "soul", "home", "road", "river", "sky", "star", "moon", "sun", "blue", "red", "gold",
+    "black", "white", "wild", "free", "young", "old", "lonely", "crazy", "sweet", "little", "long", "lost",
+    "dance", "run", "fall", "fly", "cry", "live", "stay", "go", "come", "back", "away", "down", "tonight",
+    "forever", "again", "never", "always", "summer", "winter", "city", "street", "highway", "ocean", "train",
+    "radio", "kiss", "touch", "hold", "feel", "know", "want", "need", "song", "money", "blood", "glass", "stone",
+    "paper", "ghost", "angel", "devil",
+]
+SYLLABLES = [
+    "ka", "ri", "lo", "ne", "ta", "mi", "so", "ra", "vel", "dor", "an", "ex", "ly", "mo", "pe", "zu", "qui",
+    "bar", "ten", "hal",
+]
+
+# ── CLI ─────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--sizes",       type=int, nargs="+", default=[10_000, 100_000, 300_000], help="Library sizes")
+    p.add_argument("--playlist",    type=int, default=500, help="Playlist length")
+    p.add_argument("--scan-sample", type=int, default=25,  help="Playlist tracks timed with the full scan")
+    p.add_argument("--workers",     type=int, default=-1,  help="rapidfuzz threads (-1 = all cores)")
+    p.add_argument("--seed",        type=int, default=7)
+    return p.parse_args()
+
+
+# ── synthetic data ─────────────────────────────────────────────────────────
+
+def _name(rng: random.Random) -> str:
+    return " ".join(
+        "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).title() for _ in range(rng.randint(1, 3))
+    )
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 5))).title()
+
+
+def _typo(rng: random.Random, text: str, edits: int) -> str:
+    chars = list(text)
+    for _ in range(edits):
+        if chars:
+            chars[rng.randrange(len(chars))] = rng.choice(string.ascii_lowercase)
+    return "".join(chars)
+
+
+def synthetic_library(size: int, rng: random.Random) -> list[LibraryTrack]:
+    artists = [_name(rng) for _ in range(max(size // 10, 1))]
+    rows: list[dict] = []
+    for i in range(size):
+        title = rng.choice(rows)["title"] if rows and rng.random() < 0.05 else _title(rng)
+        isrc = f"US{i:010d}" if rng.random() < 0.3 else None
+        rows.append({"_id": f"library_files/{i}", "path": f"/music/{i}.flac", "title": title,
+                     "artist": rng.choice(artists), "isrc": isrc})
+    return [LibraryTrack.from_db_row(row) for row in rows]
+
+
+def synthetic_playlist(library: list[LibraryTrack], length: int, rng: random.Random) -> list[PlaylistTrackInput]:
+    playlist = []
+    for position in range(length):
+        if rng.random() < 0.15:
+            playlist.append(PlaylistTrackInput(title=_title(rng), artist=_name(rng), position=position))
+            continue
+        source = rng.choice(library)
+        title, artist = source.title, source.artist
+        roll = rng.random()
+        if roll < 0.15:
+            title += " (Remastered 2011)"
+        elif roll < 0.3:
+            title += f" (feat. {_name(rng)})"
+        elif roll < 0.55:
+            title = _typo(rng, title, rng.randint(1, 3))
+        elif roll < 0.65:
+            title = " ".join(rng.sample(title.split(), len(title.split())))
+        if rng.random() < 0.25:
+            artist = _typo(rng, artist, 1)
+        isrc = source.isrc if rng.random() < 0.2 else None
+        playlist.append(PlaylistTrackInput(title=title, artist=artist, isrc=isrc, position=position))
+    return playlist
+
+
+def full_scan(playlist: list[PlaylistTrackInput], library: list[LibraryTrack]) -> list:
+    """match_tracks before the candidate index: every strategy scans the whole library."""
+    return [match_track(track, library) for track in playlist]
+
+
+def per_track(playlist: list[PlaylistTrackInput], library: list[LibraryTrack]) -> list:
+    """Indexed matching one playlist track at a time."""
+    index = TrackCandidateIndex(library)
+    return [match_track(track, library, index) for track in playlist]
+
+
+def timed(fn, *args):  # type: ignore[no-untyped-def]
+    start = internal_ms().value
+    result = fn(*args)
+    return result, internal_ms().value - start
+
+
+# ── main ────────────────────────────────────────────────────────────────────
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    rng = random.Random(args.seed)
+    print(f"{args.playlist}-track playlist, full scan timed on {args.scan_sample} tracks and extrapolated\n")
+    print(f"  {'library':>8s} {'scan ms':>9s} {'indexed ms':>11s} {'blocked ms':>11s} {'full ms':>9s}  equal  "
+          "blocked timings")
+    for size in args.sizes:
+        library = synthetic_library(size, rng)
+        playlist = synthetic_playlist(library, args.playlist, rng)
+        sample = playlist[: args.scan_sample]
+        scanned, scan_ms = timed(full_scan, sample, library)
+        scan_ms = scan_ms * len(playlist) // max(len(sample), 1)
+        indexed, indexed_ms = timed(per_track, playlist, library)
+        (blocked, timings), blocked_ms = timed(
+            lambda tracks, lib: match_tracks_batched(tracks, lib, workers=args.workers), playlist, library
+        )
+        (full, _), full_ms = timed(
+            lambda tracks, lib: match_tracks_batched(tracks, lib, blocked=False, workers=args.workers),
+            playlist,
+            library,
+        )
+        equal = indexed[: len(sample)] == scanned and indexed == blocked == full
+        print(
+            f"  {size:8d} {scan_ms:9d} {indexed_ms:11d} {blocked_ms:11d} {full_ms:9d}  {'yes' if equal else 'NO ':5s}  "
+            f"index {timings.index_ms} + exact {timings.exact_ms} + fuzzy {timings.fuzzy_ms} ms, "
+            f"{timings.fuzzy_tracks} fuzzy tracks, {timings.scored_pairs} pairs"
+        )
+
+
+if __name__ == "__main__":
+    main()
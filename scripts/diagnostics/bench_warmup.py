@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Model-cache warm-up benchmark: per-model loading vs the batched, parallel
+warm-up pipeline (ml_warmup_comp).
+
+Builds the synthetic suite of bench_session_cache.py (or uses --models-dir)
+and, in-process, times a full warm of a fresh ONNXModelCache:
+
+  1. sequential — the previous path: model.device = <device> for every model,
+                  one metadata read + one coordinator registration each
+  2. batched/N  — warm_models() with N concurrent session builds, for every
+                  N in --workers
+
+Each mode runs against a stub worker database and stub nvidia-smi that sleep
+--db-ms per round trip and --smi-ms per VRAM reading, so the coordinator
+traffic of a GPU warm-up is reproduced even on a CPU-only host (sessions
+fall back to CPUExecutionProvider when CUDA is missing).  Reports wall time,
+DB round trips, VRAM readings and the slowest models per mode.
+
+Session builds overlap only on multi-core hosts; on a single CPU the gain is
+the coordinator traffic alone.
+
+Usage:
+    .venv/Scripts/python.exe scripts/diagnostics/bench_warmup.py
+    .venv/Scripts/python.exe scripts/diagnostics/bench_warmup.py --workers 1 2 4 8 --heads 20
+    .venv/Scripts/python.exe scripts/diagnostics/bench_warmup.py --models-dir /app/models --db-ms 5 --smi-ms 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parents[2]))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bench_session_cache import BACKBONE_SHAPES, build_suite  # noqa: E402
+
+from nomarr.components.ml.onnx.ml_cache import ONNXModelCache  # noqa: E402
+from nomarr.components.ml.resources import ml_worker_context_comp  # noqa: E402
+from nomarr.components.ml.resources.ml_timing_comp import build_warmup_summary  # noqa: E402
+from nomarr.components.platform import resource_monitor_comp  # noqa: E402
+from nomarr.helpers.time_helper import internal_ms  # noqa: E402
+
+# ── CLI ─────────────────────────────────────────────────────────────────────
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--models-dir", default=None, help="Real models directory (default: synthetic suite)")
+    p.add_argument("--backbones",  type=int, default=4,  help="Synthetic backbones (max 4)")
+    p.add_argument("--heads",      type=int, default=12, help="Synthetic heads per backbone")
+    p.add_argument("--layers",     type=int, default=16, help="Conv+BatchNorm+Relu blocks per synthetic backbone")
+    p.add_argument("--workers",    type=int, nargs="+", default=[1, 2, 4], help="Build budgets to time")
+    p.add_argument("--trials",     type=int, default=3,  help="Warm-ups per mode")
+    p.add_argument("--device",     default="gpu", choices=["cpu", "gpu"], help="Preferred device (gpu exercises the coordinator)")
+    p.add_argument("--db-ms",      type=float, default=2.0,  help="Simulated latency per DB round trip")
+    p.add_argument("--smi-ms",     type=float, default=40.0, help="Simulated latency per nvidia-smi reading")
+    return p.parse_args()
+
+
+# ── stub worker database ────────────────────────────────────────────────────
+
+class StubDatabase:
+    """Worker database with just the meta and vram_promises calls warm-up makes."""
+
+    def __init__(self, latency_ms: float) -> None:
+        self.round_trips = 0
+        self._latency_s = latency_ms / 1000
+        self._lock = threading.Lock()
+        self.meta = self
+        self.vram_promises = self
+
+    def _trip(self) -> None:
+        with self._lock:
+            self.round_trips += 1
+        time.sleep(self._latency_s)
+
+    # meta
+    def get(self, key: str) -> str | None:
+        self._trip()
+        return None
+
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        self._trip()
+        return {}
+
+    # vram_promises
+    def try_register(self, **_: object) -> bool:
+        self._trip()
+        return True
+
+    def try_register_many(self, **_: object) -> bool:
+        self._trip()
+        return True
+
+    def get_headroom_mb(self, **_: object) -> float:
+        self._trip()
+        return 1e9
+
+    def release(self, **_: object) -> None:
+        self._trip()
+
+
+class StubSmi:
+    """Slow, counting stand-in for the nvidia-smi VRAM reading."""
+
+    def __init__(self, latency_ms: float) -> None:
+        self.readings = 0
+        self._latency_s = latency_ms / 1000
+
+    def __call__(self) -> dict[str, object]:
+        self.readings += 1
+        time.sleep(self._latency_s)
+        return {"total_mb": 24000, "used_mb": 1000, "error": None}
+
+
+# ── timing ──────────────────────────────────────────────────────────────────
+
+def warm_once(models_dir: str, device: str, workers: int | None, db_ms: float, smi_ms: float) -> dict[str, object]:
+    """Warm a fresh cache; ``workers=None`` uses the per-model path."""
+    db, smi = StubDatabase(db_ms), StubSmi(smi_ms)
+    ml_worker_context_comp.register_worker_context(db, "bench:0")
+    try:
+        with (
+            patch.object(resource_monitor_comp, "get_vram_usage_mb", smi),
+            patch.object(resource_monitor_comp, "reset_telemetry_cache"),
+        ):
+            cache = ONNXModelCache(models_dir, device, warmup_workers=workers or 1)  # type: ignore[arg-type]
+            start = internal_ms().value
+            if workers is None:
+                for m in cache._all_models():
+                    m.device = device  # type: ignore[assignment]
+            else:
+                cache.warm = True
+            elapsed = internal_ms().value - start
+            trips, readings = db.round_trips, smi.readings
+            report = cache.last_warmup
+            summary = build_warmup_summary(report.load_ms, report.wall_ms, report.workers) if report else ""
+            cache.warm = False
+    finally:
+        ml_worker_context_comp.clear_worker_context()
+    return {"ms": elapsed, "db": trips, "smi": readings, "models": cache.model_count, "summary": summary}
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    work = Path(tempfile.mkdtemp(prefix="nomarr_warmup_bench_"))
+    try:
+        models_dir = args.models_dir
+        if models_dir is None:
+            models_dir = str(work / "models")
+            build_suite(Path(models_dir), min(args.backbones, len(BACKBONE_SHAPES)), args.heads, args.layers)
+
+        modes: list[tuple[str, int | None]] = [("sequential", None)] + [(f"batched/{n}", n) for n in args.workers]
+        warm_once(models_dir, args.device, 1, 0.0, 0.0)  # prime the page cache and ORT's allocators
+
+        results: dict[str, list[dict[str, object]]] = {}
+        for label, workers in modes:
+            results[label] = [warm_once(models_dir, args.device, workers, args.db_ms, args.smi_ms) for _ in range(args.trials)]
+
+        first = results["sequential"][0]
+        print(
+            f"{first['models']} models (device={args.device}, {os.cpu_count()} CPUs), "
+            f"db={args.db_ms:g} ms/trip, nvidia-smi={args.smi_ms:g} ms/reading, {args.trials} trials\n"
+        )
+        base = statistics.median(int(r["ms"]) for r in results["sequential"])  # type: ignore[call-overload]
+        for label, runs in results.items():
+            median = statistics.median(int(r["ms"]) for r in runs)  # type: ignore[call-overload]
+            print(
+                f"  {label:11s} median={median:7.0f} ms  ({base / max(median, 1):4.2f}x)  "
+                f"db trips={runs[0]['db']:4d}  smi readings={runs[0]['smi']:3d}"
+            )
+        for label, runs in results.items():
+            if runs[-1]["summary"]:
+                print(f"\n  {label}: {runs[-1]['summary']}")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -115,8 +115,37 @@ class TestReconcileEndpoints:
         assert response.json() == {
             "pending_count": 3,
             "in_progress": True,
+            "progress": None,
         }
 
+    @pytest.mark.integration
+    @pytest.mark.mocked
+    def test_get_reconcile_status_includes_write_progress(
+        self,
+        client: TestClient,
+        mock_tagging_service: MagicMock,
+    ) -> None:
+        """Write-engine progress of the running batch should be passed through."""
+        progress = {
+            "completed": 40,
+            "failed": 1,
+            "in_flight": 4,
+            "buffered": 12,
+            "elapsed_ms": 2000,
+            "files_per_s": 20.0,
+            "per_device_completed": {"dev:2049": 40},
+        }
+        mock_tagging_service.get_reconcile_status.return_value = {
+            "pending_count": 60,
+            "in_progress": True,
+            "progress": progress,
+        }
+
+        response = client.get("/api/web/libraries/libraries:test_lib/reconcile-status")
+
+        assert response.status_code == 200
+        assert response.json()["progress"] == progress
+
     @pytest.mark.integration
     @pytest.mark.mocked
     def test_get_reconcile_status_returns_404_for_unknown_library(
@@ -477,11 +477,15 @@ def test_cascade_delete_calls_hot_and_cold_ops() -> None:
 
     database.vectors_track = {"effnet": hot_ops}
     database._vectors_track_cold = {"effnet": cold_ops}
+    database._vector_delete_hooks = []
     database.db = MagicMock()
+    deleted_ids: list[list[str]] = []
+    database.add_vector_delete_hook(deleted_ids.append)
 
     deleted = Database.delete_vectors_by_file_id(database, "library_files/7")
 
     assert deleted == 3
+    assert deleted_ids == [["library_files/7"]]
     hot_ops.delete_by_file_id.assert_called_once_with("library_files/7")
     cold_ops.delete_by_file_id.assert_called_once_with("library_files/7")
 
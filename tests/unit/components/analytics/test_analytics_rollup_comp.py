@@ -0,0 +1,162 @@
+"""Unit tests for analytics_rollup_comp (rollup-backed Insights and consistency check)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from nomarr.components.analytics.analytics_rollup_comp import (
+    check_rollup_consistency,
+    load_library_rollup,
+    rollup_library_stats,
+    rollup_mood_coverage,
+    rollup_top_mood_pairs,
+    rollup_year_distribution,
+)
+from nomarr.components.analytics.collection_overview_comp import compute_collection_overview
+from nomarr.components.analytics.mood_analysis_comp import compute_mood_analysis
+from nomarr.helpers.dto.analytics_dto import LibraryRollup
+
+
+def _rollup(**overrides):
+    fields = {
+        "file_count": 4,
+        "total_duration_s": 800.0,
+        "total_file_size_bytes": 4000,
+        "year_counts": {1999: 1, 2005: 3},
+        "genre_counts": {"Rock": 2, "Jazz": 2},
+        "mood_tagged": {"strict": 1, "regular": 2, "loose": 3},
+        "mood_balance": {"strict": {"happy": 1}, "regular": {"happy": 1, "calm": 2}, "loose": {"dark": 3}},
+        "mood_pairs": {"strict": {}, "regular": {("calm", "happy"): 1}, "loose": {("calm", "dark"): 2}},
+        "missing_library_ids": [],
+    }
+    fields.update(overrides)
+    return LibraryRollup(**fields)
+
+
+def _full_scan_db(rollup):
+    """Mock db whose full-scan tag queries agree with *rollup*."""
+    db = MagicMock()
+    db.analytics_rollups.get_rollup.return_value = rollup
+    db.tags.get_library_stats.return_value = rollup_library_stats(rollup)
+    db.tags.get_year_distribution.return_value = [{"year": y, "count": c} for y, c in rollup.year_counts.items()]
+    db.tags.get_genre_distribution.return_value = [{"genre": g, "count": c} for g, c in rollup.genre_counts.items()]
+    db.tags.get_mood_coverage.return_value = rollup_mood_coverage(rollup)
+    db.tags.get_mood_balance.return_value = {
+        tier: [{"mood": m, "count": c} for m, c in moods.items()] for tier, moods in rollup.mood_balance.items()
+    }
+    db.tags.get_top_mood_pairs.side_effect = lambda _library_id, limit, mood_tier: [
+        # Full scan may return either order within a pair
+        {"mood1": m2, "mood2": m1, "count": c}
+        for (m1, m2), c in rollup.mood_pairs[mood_tier].items()
+    ][:limit]
+    return db
+
+
+@pytest.mark.unit
+class TestLoadLibraryRollup:
+    def test_built_rollup_is_one_lookup(self):
+        db = MagicMock()
+        db.analytics_rollups.get_rollup.return_value = _rollup()
+
+        load_library_rollup(db, "libraries/L1")
+
+        db.analytics_rollups.get_rollup.assert_called_once_with("libraries/L1")
+        db.analytics_rollups.rebuild_library.assert_not_called()
+
+    def test_missing_libraries_are_built_first(self):
+        db = MagicMock()
+        built = _rollup()
+        db.analytics_rollups.get_rollup.side_effect = [_rollup(missing_library_ids=["libraries/L2"]), built]
+
+        assert load_library_rollup(db) is built
+        db.analytics_rollups.rebuild_library.assert_called_once_with("libraries/L2")
+
+
+@pytest.mark.unit
+class TestRollupShapes:
+    def test_stats(self):
+        assert rollup_library_stats(_rollup(total_duration_s=800.0005)) == {
+            "file_count": 4,
+            "total_duration_ms": 800000,
+            "total_file_size_bytes": 4000,
+            "avg_track_length_ms": pytest.approx(200000.125),
+        }
+
+    def test_empty_library_stats(self):
+        stats = rollup_library_stats(_rollup(file_count=0, total_duration_s=0.0, total_file_size_bytes=0))
+        assert stats["avg_track_length_ms"] == 0
+
+    def test_distribution_sorted_by_count(self):
+        assert rollup_year_distribution(_rollup()) == [{"year": 2005, "count": 3}, {"year": 1999, "count": 1}]
+
+    def test_coverage_percentages(self):
+        coverage = rollup_mood_coverage(_rollup(file_count=3))
+        assert coverage["total_files"] == 3
+        assert coverage["tiers"]["regular"] == {"tagged": 2, "percentage": 66.7}
+
+    def test_top_pairs_limit(self):
+        rollup = _rollup(mood_pairs={"loose": {("a", "b"): 1, ("a", "c"): 5, ("b", "c"): 3}})
+        assert rollup_top_mood_pairs(rollup, "loose", limit=2) == [
+            {"mood1": "a", "mood2": "c", "count": 5},
+            {"mood1": "b", "mood2": "c", "count": 3},
+        ]
+
+    def test_dashboards_read_only_the_rollup(self):
+        db = MagicMock()
+        db.analytics_rollups.get_rollup.return_value = _rollup()
+
+        overview = compute_collection_overview(db, "libraries/L1")
+        mood = compute_mood_analysis(db, "libraries/L1")
+
+        assert overview["genre_distribution"][0]["count"] == 2
+        assert mood["top_pairs_by_tier"]["loose"] == [{"mood1": "calm", "mood2": "dark", "count": 2}]
+        assert mood["dominant_vibes"]
+        assert not db.tags.method_calls
+
+
+@pytest.mark.unit
+class TestCheckRollupConsistency:
+    def test_matching_rollup_is_consistent(self):
+        db = _full_scan_db(_rollup())
+
+        (report,) = check_rollup_consistency(db, "libraries/L1")
+
+        assert report.consistent
+        assert report.mismatches == []
+        db.analytics_rollups.rebuild_library.assert_not_called()
+
+    def test_drift_is_reported_and_repaired(self):
+        rollup = _rollup()
+        db = _full_scan_db(rollup)
+        db.tags.get_genre_distribution.return_value = [{"genre": "Rock", "count": 3}, {"genre": "Jazz", "count": 2}]
+        db.tags.get_top_mood_pairs.side_effect = lambda _library_id, limit, mood_tier: (
+            [{"mood1": "calm", "mood2": "dark", "count": 2}, {"mood1": "dark", "mood2": "happy", "count": 1}][:limit]
+            if mood_tier == "loose"
+            else [{"mood1": m1, "mood2": m2, "count": c} for (m1, m2), c in rollup.mood_pairs[mood_tier].items()]
+        )
+
+        (report,) = check_rollup_consistency(db, "libraries/L1", repair=True)
+
+        assert not report.consistent
+        assert report.mismatches == ["genre", "mood_pairs:loose"]
+        assert report.repaired
+        db.analytics_rollups.rebuild_library.assert_called_once_with("libraries/L1")
+
+    def test_duration_rounding_is_tolerated(self):
+        rollup = _rollup()
+        db = _full_scan_db(rollup)
+        db.tags.get_library_stats.return_value = {**rollup_library_stats(rollup), "total_duration_ms": 799999}
+
+        (report,) = check_rollup_consistency(db, "libraries/L1")
+
+        assert report.consistent
+
+    def test_unbuilt_rollup_is_missing(self):
+        db = MagicMock()
+        db.libraries.list_libraries.return_value = [{"_id": "libraries/L1"}]
+        db.analytics_rollups.get_rollup.return_value = _rollup(missing_library_ids=["libraries/L1"])
+
+        (report,) = check_rollup_consistency(db)
+
+        assert report.mismatches == ["missing"]
+        assert not report.repaired
@@ -0,0 +1,183 @@
+"""Unit tests for tag_cooccurrence_comp and the analytics functions built on it."""
+
+import json
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from nomarr.components.analytics.analytics_comp import compute_tag_co_occurrence, compute_tag_correlation_matrix
+from nomarr.components.analytics.tag_cooccurrence_comp import (
+    TagIncidenceBuilder,
+    build_tag_incidence,
+    co_occurrence_counts,
+    column_occurrences,
+    expand_columns,
+    first_seen_columns,
+    top_k_pairs,
+)
+from nomarr.helpers.dto.analytics_dto import (
+    ComputeTagCoOccurrenceParams,
+    ComputeTagCorrelationMatrixParams,
+    TagSpec,
+)
+
+MOODS = ["happy", "sad", "calm", "dark", "party", "relaxed"]
+
+
+def _set_based_correlations(params):
+    """Reference: per-pair set intersections (the pre-matrix implementation)."""
+    counter: Counter = Counter()
+    mood_files: dict[str, set] = {}
+    for file_id, tag_value in params.mood_tag_rows:
+        try:
+            moods = json.loads(tag_value)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(moods, list):
+            for mood in moods:
+                counter[str(mood).strip()] += 1
+                mood_files.setdefault(str(mood).strip(), set()).add(file_id)
+    top = [mood for mood, _ in counter.most_common(params.top_n)]
+    mood_correlations = {
+        a: _top10({b: round(len(mood_files[a] & mood_files[b]) / len(mood_files[a]), 3) for b in top if b != a})
+        for a in top
+    }
+    mood_tier_correlations = {}
+    for mood in top:
+        tiers = {}
+        for key in params.tier_tag_keys:
+            name = key.replace(f"{params.namespace}:", "").replace("_tier", "").split("_")[-1]
+            counts = Counter(
+                value for file_id, value in params.tier_tag_rows.get(key, []) if file_id in mood_files[mood]
+            )
+            tiers.update(
+                {f"{value}_{name}": round(count / len(mood_files[mood]), 3) for value, count in counts.items()}
+            )
+        mood_tier_correlations[mood] = _top10(tiers)
+    return mood_correlations, mood_tier_correlations
+
+
+def _top10(correlations):
+    return dict(sorted(correlations.items(), key=lambda x: x[1], reverse=True)[:10])
+
+
+def _random_params(seed, files=300):
+    rng = random.Random(seed)
+    mood_rows = []
+    tier_rows: dict[str, list] = {key: [] for key in ("nom:energy_tier", "nom:valence_tier", "nom:acoustic_tier")}
+    for i in range(files):
+        file_id = f"library_files/{i}"
+        mood_rows.append((file_id, json.dumps(rng.sample(MOODS, rng.randint(0, 3)))))
+        if rng.random() < 0.2:
+            mood_rows.append((file_id, "not json"))
+        for key in tier_rows:
+            tier_rows[key].append((file_id, rng.choice(["low", "medium", "high", "peak"])))
+    return ComputeTagCorrelationMatrixParams(
+        namespace="nom",
+        top_n=len(MOODS),
+        mood_tag_rows=mood_rows,
+        tier_tag_keys=list(tier_rows),
+        tier_tag_rows=tier_rows,
+    )
+
+
+@pytest.mark.unit
+class TestIncidence:
+    def test_counts_are_files_having_both(self):
+        incidence = build_tag_incidence([("f1", "a"), ("f1", "b"), ("f2", "a"), ("f2", "a"), ("f3", "b")])
+
+        counts = co_occurrence_counts(incidence)
+
+        assert incidence.columns == ["a", "b"]
+        assert counts.tolist() == [[2, 1], [1, 2]]
+        assert column_occurrences(incidence).tolist() == [3, 2]
+
+    def test_registered_columns_exist_without_rows(self):
+        incidence = build_tag_incidence([("f1", "a")], columns=["z", "a"])
+
+        assert incidence.columns == ["z", "a"]
+        assert co_occurrence_counts(incidence).tolist() == [[0, 0], [0, 1]]
+
+    def test_expand_columns_decodes_each_column_once(self):
+        calls = []
+
+        def split(column):
+            calls.append(column)
+            return column.split("+")
+
+        incidence = expand_columns(build_tag_incidence([("f1", "a+b"), ("f2", "a+b"), ("f2", "c")]), split)
+
+        assert calls == ["a+b", "c"]
+        assert incidence.columns == ["a", "b", "c"]
+        assert co_occurrence_counts(incidence).tolist() == [[2, 2, 1], [2, 2, 1], [1, 1, 1]]
+
+    def test_first_seen_columns_follow_input_order_within_column(self):
+        builder = TagIncidenceBuilder()
+        builder.add_keyed("energy", [("f1", "low"), ("f2", "high"), ("f3", "mid"), ("f2", "low")])
+        builder.add_column("tagged", ["f2", "f3"])
+        incidence = builder.build()
+
+        columns = first_seen_columns(incidence, "energy", incidence.column_index["tagged"])
+
+        assert [incidence.columns[c] for c in columns] == [("energy", "high"), ("energy", "mid"), ("energy", "low")]
+
+    def test_top_k_pairs(self):
+        counts = np.array([[5, 3, 1, 0], [3, 4, 3, 0], [1, 3, 3, 2], [0, 0, 2, 2]])
+
+        assert top_k_pairs(counts, 3, labels=["a", "b", "c", "d"]) == [
+            ("a", "b", 3),
+            ("b", "c", 3),
+            ("c", "d", 2),
+        ]
+        assert len(top_k_pairs(counts, 10)) == 4
+
+
+@pytest.mark.unit
+class TestCorrelationMatrix:
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_set_based_counts(self, seed):
+        params = _random_params(seed)
+
+        result = compute_tag_correlation_matrix(params)
+
+        mood_correlations, mood_tier_correlations = _set_based_correlations(params)
+        # Same values, same key order (12 tier labels are cut to 10, so tie order matters too)
+        assert list(result.mood_correlations) == list(mood_correlations)
+        for mood, expected in mood_correlations.items():
+            assert list(result.mood_correlations[mood].items()) == list(expected.items())
+        for mood, expected in mood_tier_correlations.items():
+            assert list(result.mood_tier_correlations[mood].items()) == list(expected.items())
+
+    def test_no_moods(self):
+        params = ComputeTagCorrelationMatrixParams(
+            namespace="nom", top_n=5, mood_tag_rows=[("f1", "happy")], tier_tag_keys=[], tier_tag_rows={}
+        )
+
+        result = compute_tag_correlation_matrix(params)
+
+        assert result.mood_correlations == {}
+        assert result.mood_tier_correlations == {}
+
+
+@pytest.mark.unit
+class TestCoOccurrence:
+    def test_matrix_matches_set_intersections(self):
+        tag_data = {
+            ("genre", "Rock"): {"f1", "f2", "f3"},
+            ("genre", "Jazz"): {"f4"},
+            ("nom:mood-strict", "happy"): {"f1", "f4", "f5"},
+        }
+        x_tags = [TagSpec("genre", "Rock"), TagSpec("genre", "Jazz"), TagSpec("year", "1999")]
+        y_tags = [TagSpec("nom:mood-strict", "happy"), TagSpec("genre", "Rock")]
+
+        result = compute_tag_co_occurrence(
+            ComputeTagCoOccurrenceParams(x_tags=x_tags, y_tags=y_tags, tag_data=tag_data)
+        )
+
+        assert result.matrix == [
+            [len(tag_data.get((y.key, y.value), set()) & tag_data.get((x.key, x.value), set())) for x in x_tags]
+            for y in y_tags
+        ]
+        assert result.matrix == [[1, 1, 0], [3, 0, 0]]
@@ -28,6 +28,7 @@ class TestBootstrapFileStateEdges:
         result = bootstrap_file_state_edges(mock_db, bootstraps, file_id_by_path)
         assert result == 1
         mock_db.file_states.set_tagged.assert_called_once_with("library_files/abc")
+        mock_db.file_states.set_heads_current.assert_called_once_with("library_files/abc")
 
     @pytest.mark.unit
     def test_unknown_bootstrap_type_is_skipped(self) -> None:
@@ -0,0 +1,131 @@
+"""Tests for block-wise decode and incremental patch extraction.
+
+The per-frame essentia transform is replaced by a cheap deterministic numpy
+function so framing and patch bookkeeping can be checked against the
+whole-waveform path without essentia installed.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import sys
+import textwrap
+
+import numpy as np
+import pytest
+
+from nomarr.components.ml.audio import ml_audio_comp, ml_preprocess_comp
+from nomarr.components.ml.audio.ml_audio_comp import (
+    AudioLoadCrashError,
+    AudioStreamUnavailableError,
+    stream_audio_mono,
+)
+from nomarr.components.ml.audio.ml_preprocess_comp import StreamingPatchExtractor, preprocess_for_backbone
+
+_BACKBONES = ("effnet", "musicnn", "vggish", "yamnet")
+
+
+def _fake_mel_frame_fn(params: ml_preprocess_comp.BackbonePreprocessParams):
+    def _frame(frame: np.ndarray) -> np.ndarray:
+        return (frame[: params.n_mels] + float(frame.sum())).astype(np.float32)
+
+    return _frame
+
+
+@pytest.fixture
+def fake_mel(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ml_preprocess_comp, "_mel_frame_fn", _fake_mel_frame_fn)
+
+
+def _waveform(n_samples: int) -> np.ndarray:
+    return np.random.default_rng(7).uniform(-1, 1, n_samples).astype(np.float32)
+
+
+def _stream(backbone: str, waveform: np.ndarray, block: int) -> np.ndarray:
+    extractor = StreamingPatchExtractor(backbone)
+    parts = [extractor.push(waveform[i : i + block]) for i in range(0, len(waveform), block)]
+    out = np.concatenate(parts) if parts else np.empty((0,), dtype=np.float32)
+    assert extractor.total_patches == len(out)
+    return out
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("fake_mel")
+class TestStreamingPatchExtractor:
+    @pytest.mark.parametrize("backbone", _BACKBONES)
+    @pytest.mark.parametrize("block", [257, 4000, 16000 * 5, 16000 * 60])
+    def test_matches_whole_waveform(self, backbone: str, block: int) -> None:
+        waveform = _waveform(16000 * 23 + 123)
+        expected = preprocess_for_backbone(waveform, backbone)
+        streamed = _stream(backbone, waveform, block)
+        assert expected.shape[0] > 1
+        np.testing.assert_array_equal(streamed, expected)
+
+    def test_hop_larger_than_buffer_skips_frames(self) -> None:
+        # Tiny blocks: patches complete one frame at a time, so each hop has
+        # to discard frames that are computed only after the patch is emitted.
+        waveform = _waveform(16000 * 7)
+        np.testing.assert_array_equal(_stream("vggish", waveform, 160), preprocess_for_backbone(waveform, "vggish"))
+
+    def test_too_short_yields_no_patches(self) -> None:
+        extractor = StreamingPatchExtractor("musicnn")
+        out = extractor.push(_waveform(16000))
+        assert out.shape == (0, 187, 96)
+        assert extractor.total_patches == 0
+
+    def test_unknown_backbone(self) -> None:
+        with pytest.raises(ValueError, match="Unknown backbone"):
+            StreamingPatchExtractor("nope")
+
+
+# ----------------------------------------------------------------------
+# stream_audio_mono
+# ----------------------------------------------------------------------
+
+
+def _fake_ffmpeg(tmp_path, n_samples: int, exit_code: int = 0) -> str:
+    script = tmp_path / "ffmpeg"
+    script.write_text(
+        textwrap.dedent(
+            f"""\
+            #!{sys.executable}
+            import sys
+            import numpy as np
+            sys.stdout.buffer.write(np.arange({n_samples}, dtype=np.float32).tobytes())
+            sys.exit({exit_code})
+            """
+        )
+    )
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    return str(script)
+
+
+@pytest.mark.unit
+class TestStreamAudioMono:
+    def test_missing_ffmpeg(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(ml_audio_comp.shutil, "which", lambda _name: None)
+        with pytest.raises(AudioStreamUnavailableError):
+            next(stream_audio_mono("/music/a.flac"))
+
+    @pytest.mark.skipif(os.name != "posix", reason="fake ffmpeg is a shebang script")
+    def test_yields_fixed_blocks(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        ffmpeg = _fake_ffmpeg(tmp_path, 2500)
+        monkeypatch.setattr(ml_audio_comp.shutil, "which", lambda _name: ffmpeg)
+        blocks = list(stream_audio_mono("/music/a.flac", target_sr=1000, block_s=1.0))
+        assert [len(b) for b in blocks] == [1000, 1000, 500]
+        np.testing.assert_array_equal(np.concatenate(blocks), np.arange(2500, dtype=np.float32))
+
+    @pytest.mark.skipif(os.name != "posix", reason="fake ffmpeg is a shebang script")
+    def test_decoder_failure_raises_crash(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        ffmpeg = _fake_ffmpeg(tmp_path, 10, exit_code=1)
+        monkeypatch.setattr(ml_audio_comp.shutil, "which", lambda _name: ffmpeg)
+        with pytest.raises(AudioLoadCrashError):
+            list(stream_audio_mono("/music/a.flac", target_sr=1000))
+
+    @pytest.mark.skipif(os.name != "posix", reason="fake ffmpeg is a shebang script")
+    def test_no_samples_raises_crash(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        ffmpeg = _fake_ffmpeg(tmp_path, 0)
+        monkeypatch.setattr(ml_audio_comp.shutil, "which", lambda _name: ffmpeg)
+        with pytest.raises(AudioLoadCrashError):
+            list(stream_audio_mono("/music/a.flac", target_sr=1000))
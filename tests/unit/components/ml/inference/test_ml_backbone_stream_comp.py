@@ -0,0 +1,127 @@
+"""Tests for compute_backbone_embeddings_streaming batch dispatch."""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+from nomarr.components.ml.audio import ml_preprocess_comp
+from nomarr.components.ml.audio.ml_preprocess_comp import preprocess_for_backbone
+from nomarr.components.ml.inference.ml_backbone_embed_comp import (
+    compute_backbone_embeddings,
+    compute_backbone_embeddings_streaming,
+)
+from nomarr.components.ml.onnx.ml_session_comp import _BACKBONE_BATCH_SIZE
+
+_SR = 16000
+
+
+def _fake_mel_frame_fn(params: ml_preprocess_comp.BackbonePreprocessParams):
+    def _frame(frame: np.ndarray) -> np.ndarray:
+        return (frame[: params.n_mels] * 0.5 + float(frame[0])).astype(np.float32)
+
+    return _frame
+
+
+class _FakeBackbone:
+    """Records batch sizes; one embedding row per patch (patch mean and sum)."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.batch_sizes: list[int] = []
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def run(self, patches: np.ndarray) -> np.ndarray:
+        with self._lock:
+            self.batch_sizes.append(len(patches))
+        if self.fail:
+            raise RuntimeError("session exploded")
+        return np.stack([patches.mean(axis=(1, 2)), patches.sum(axis=(1, 2))], axis=1)
+
+
+class _FakeCache:
+    def __init__(self, backbones: dict[str, _FakeBackbone]) -> None:
+        self.backbones = backbones
+
+
+@pytest.fixture(autouse=True)
+def fake_mel(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ml_preprocess_comp, "_mel_frame_fn", _fake_mel_frame_fn)
+
+
+def _blocks(waveform: np.ndarray, block: int) -> list[np.ndarray]:
+    return [waveform[i : i + block] for i in range(0, len(waveform), block)]
+
+
+@pytest.mark.unit
+class TestStreamingEmbeddings:
+    def test_embeddings_and_batches_match_whole_file(self) -> None:
+        waveform = np.random.default_rng(3).uniform(-1, 1, _SR * 130).astype(np.float32)
+        backbones = {"effnet": _FakeBackbone(), "vggish": _FakeBackbone()}
+        streamed = compute_backbone_embeddings_streaming(
+            _FakeCache(backbones), {"effnet": [], "vggish": []}, _blocks(waveform, _SR * 5), _SR
+        )
+
+        assert streamed.result.errors == {}
+        by_backbone = {e.backbone: e.embeddings for e in streamed.result.embeddings}
+        for name, model in backbones.items():
+            patches = preprocess_for_backbone(waveform, name)
+            expected = np.stack([patches.mean(axis=(1, 2)), patches.sum(axis=(1, 2))], axis=1)
+            np.testing.assert_array_equal(by_backbone[name], expected)
+            n_full, rest = divmod(len(patches), _BACKBONE_BATCH_SIZE)
+            assert model.batch_sizes == [_BACKBONE_BATCH_SIZE] * n_full + ([rest] if rest else [])
+            assert f"emb_{name}" in streamed.result.timings
+            assert f"pre_{name}" in streamed.result.timings
+
+    def test_whole_file_path_times_preprocessing_separately(self) -> None:
+        waveform = np.random.default_rng(5).uniform(-1, 1, _SR * 40).astype(np.float32)
+        backbones = {"effnet": _FakeBackbone(), "vggish": _FakeBackbone()}
+
+        whole = compute_backbone_embeddings(_FakeCache(backbones), {"effnet": [], "vggish": []}, waveform)
+        streamed = compute_backbone_embeddings_streaming(
+            _FakeCache(backbones), {"effnet": [], "vggish": []}, _blocks(waveform, _SR * 5), _SR
+        )
+
+        by_backbone = {e.backbone: e.embeddings for e in streamed.result.embeddings}
+        for e in whole.embeddings:
+            np.testing.assert_array_equal(e.embeddings, by_backbone[e.backbone])
+        assert {"pre_effnet", "emb_effnet", "pre_vggish", "emb_vggish", "emb_wall"} <= set(whole.timings)
+
+    def test_audio_keeps_only_leading_minute(self) -> None:
+        waveform = np.random.default_rng(4).uniform(-1, 1, _SR * 75).astype(np.float32)
+        streamed = compute_backbone_embeddings_streaming(
+            _FakeCache({"yamnet": _FakeBackbone()}), {"yamnet": []}, _blocks(waveform, 7001), _SR
+        )
+        assert streamed.audio.duration == pytest.approx(75.0)
+        assert streamed.audio.sample_rate == _SR
+        np.testing.assert_array_equal(streamed.audio.waveform, waveform[: _SR * 60])
+
+    def test_too_short_reports_error(self) -> None:
+        streamed = compute_backbone_embeddings_streaming(
+            _FakeCache({"musicnn": _FakeBackbone()}), {"musicnn": []}, [np.zeros(_SR, dtype=np.float32)], _SR
+        )
+        assert streamed.result.embeddings == []
+        assert "too short" in streamed.result.errors["musicnn"]
+
+    def test_failing_backbone_does_not_affect_others(self) -> None:
+        waveform = np.random.default_rng(5).uniform(-1, 1, _SR * 40).astype(np.float32)
+        streamed = compute_backbone_embeddings_streaming(
+            _FakeCache({"effnet": _FakeBackbone(fail=True), "yamnet": _FakeBackbone()}),
+            {"effnet": [], "yamnet": []},
+            _blocks(waveform, _SR),
+            _SR,
+        )
+        assert streamed.result.errors == {"effnet": "session exploded"}
+        assert [e.backbone for e in streamed.result.embeddings] == ["yamnet"]
+
+    def test_decode_error_propagates(self) -> None:
+        def _blocks_then_fail():
+            yield np.zeros(_SR * 10, dtype=np.float32)
+            raise OSError("decoder died")
+
+        with pytest.raises(OSError, match="decoder died"):
+            compute_backbone_embeddings_streaming(
+                _FakeCache({"effnet": _FakeBackbone()}), {"effnet": []}, _blocks_then_fail(), _SR
+            )
@@ -0,0 +1,238 @@
+"""Golden-output tests for the array-based segmentation and pooling kernels in ml_embed_comp.
+
+The ``_legacy_*`` functions are the original per-segment / per-column loops,
+kept verbatim as the reference the vectorized kernels must reproduce bit for bit.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from nomarr.components.ml.inference.ml_embed_comp import (
+    frame_waveform,
+    pool_head_scores,
+    pool_scores,
+    score_segments,
+    segment_waveform,
+    trimmed_mean_columns,
+)
+from nomarr.helpers.dto.ml_dto import SegmentWaveformParams
+
+# ----------------------------------------------------------------------
+# Reference implementations (pre-vectorization)
+# ----------------------------------------------------------------------
+
+
+def _legacy_segment(
+    waveform: np.ndarray, sr: int, segment_s: float, hop_s: float, pad_final: bool
+) -> tuple[list[np.ndarray], list[tuple[float, float]]]:
+    seg_len = round(segment_s * sr)
+    hop_len = round(hop_s * sr)
+    waves: list[np.ndarray] = []
+    bounds: list[tuple[float, float]] = []
+    num_samples = len(waveform)
+    start = 0
+    while start < num_samples:
+        end = start + seg_len
+        if end <= num_samples:
+            seg = waveform[start:end]
+        elif not pad_final:
+            seg = waveform[start:num_samples]
+        else:
+            seg = np.zeros(seg_len, dtype=np.float32)
+            remain = waveform[start:num_samples]
+            seg[: len(remain)] = remain
+            end = num_samples
+        waves.append(np.asarray(seg, dtype=np.float32))
+        bounds.append((start / sr, min(end, num_samples) / sr))
+        if start + hop_len >= num_samples:
+            break
+        start += hop_len
+    return waves, bounds
+
+
+def _legacy_trimmed_mean(scores: np.ndarray, trim_perc: float) -> np.ndarray:
+    num_rows = scores.shape[0]
+    trim_count = int(np.floor(trim_perc * num_rows))
+    result = np.zeros((scores.shape[1],), dtype=np.float32)
+    for col_idx in range(scores.shape[1]):
+        col = scores[:, col_idx]
+        col = col[~np.isnan(col)]
+        if col.size == 0:
+            continue
+        col.sort()
+        lo = trim_count
+        hi = max(trim_count, col.size - trim_count)
+        trimmed = col[lo:hi] if hi > lo else col
+        result[col_idx] = float(np.mean(trimmed)) if trimmed.size else 0.0
+    return result
+
+
+def _scores(rows: int, cols: int, *, seed: int, nan_frac: float = 0.0, dtype: type = np.float32) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    scores = rng.random((rows, cols)).astype(dtype)
+    if nan_frac:
+        scores[rng.random((rows, cols)) < nan_frac] = np.nan
+    return scores
+
+
+# ----------------------------------------------------------------------
+# Segmentation
+# ----------------------------------------------------------------------
+
+
+class TestSegmentWaveform:
+    """The strided framing reproduces the per-segment loop exactly."""
+
+    @pytest.mark.parametrize("pad_final", [True, False])
+    @pytest.mark.parametrize(
+        ("num_samples", "segment_s", "hop_s"),
+        [(16000, 1.0, 0.5), (16001, 1.0, 0.5), (15999, 1.0, 1.0), (3000, 1.0, 0.25), (100, 0.01, 0.003), (1, 0.5, 0.5)],
+    )
+    def test_matches_legacy_loop(self, num_samples: int, segment_s: float, hop_s: float, pad_final: bool) -> None:
+        waveform = np.random.default_rng(num_samples).standard_normal(num_samples).astype(np.float32)
+        expected_waves, expected_bounds = _legacy_segment(waveform, 16000, segment_s, hop_s, pad_final)
+
+        segments = segment_waveform(SegmentWaveformParams(waveform, 16000, segment_s, hop_s, pad_final))
+
+        assert segments.bounds == expected_bounds
+        assert len(segments.waves) == len(expected_waves)
+        for got, want in zip(segments.waves, expected_waves, strict=True):
+            assert got.dtype == np.float32
+            assert got.tobytes() == want.tobytes()
+
+    def test_empty_waveform(self) -> None:
+        segments = segment_waveform(SegmentWaveformParams(np.zeros(0, dtype=np.float32), 16000, 1.0, 0.5, True))
+
+        assert segments.waves == []
+        assert segments.bounds == []
+
+    def test_frames_are_a_view_without_padding(self) -> None:
+        waveform = np.arange(12, dtype=np.float32)
+
+        frames, tail, bounds = frame_waveform(waveform, 4, 4)
+
+        assert np.shares_memory(frames, waveform)
+        assert tail.shape == (0, 4)
+        assert bounds.tolist() == [[0, 4], [4, 8], [8, 12]]
+
+    def test_partial_frames_are_zero_padded(self) -> None:
+        frames, tail, bounds = frame_waveform(np.arange(1, 11, dtype=np.float32), 5, 3)
+
+        assert frames.tolist() == [[1, 2, 3, 4, 5], [4, 5, 6, 7, 8]]
+        assert tail.tolist() == [[7, 8, 9, 10, 0], [10, 0, 0, 0, 0]]
+        assert bounds.tolist() == [[0, 5], [3, 8], [6, 10], [9, 10]]
+
+
+# ----------------------------------------------------------------------
+# Scoring
+# ----------------------------------------------------------------------
+
+
+class TestScoreSegments:
+    def test_stacks_consistent_outputs(self) -> None:
+        segments = segment_waveform(SegmentWaveformParams(np.ones(40, dtype=np.float32), 10, 1.0, 1.0, True))
+
+        scores = score_segments(segments, lambda wave, sr: np.array([wave.sum(), sr], dtype=np.float64))
+
+        assert scores.dtype == np.float32
+        assert scores.tolist() == [[10.0, 10.0]] * 4
+
+    def test_pads_inconsistent_outputs_with_nan(self) -> None:
+        segments = segment_waveform(SegmentWaveformParams(np.ones(30, dtype=np.float32), 10, 1.0, 1.0, True))
+        outputs = iter([np.array([1.0, 2.0, 3.0]), np.array([4.0]), np.array([5.0, 6.0])])
+
+        scores = score_segments(segments, lambda _wave, _sr: next(outputs))
+
+        np.testing.assert_array_equal(scores, [[1, 2, 3], [4, np.nan, np.nan], [5, 6, np.nan]])
+
+
+# ----------------------------------------------------------------------
+# Pooling
+# ----------------------------------------------------------------------
+
+
+class TestTrimmedMeanColumns:
+    """The one-pass trimmed mean is bit-identical to the per-column loop."""
+
+    @pytest.mark.parametrize("rows", [1, 2, 9, 10, 11, 180, 1800, 10800])
+    @pytest.mark.parametrize("trim_perc", [0.0, 0.1, 0.25, 0.49])
+    def test_matches_legacy_without_nan(self, rows: int, trim_perc: float) -> None:
+        scores = _scores(rows, 23, seed=rows)
+
+        assert trimmed_mean_columns(scores, trim_perc).tobytes() == _legacy_trimmed_mean(scores, trim_perc).tobytes()
+
+    @pytest.mark.parametrize("nan_frac", [0.05, 0.5, 0.95])
+    @pytest.mark.parametrize("rows", [3, 40, 999])
+    def test_matches_legacy_with_nan(self, rows: int, nan_frac: float) -> None:
+        scores = _scores(rows, 17, seed=rows, nan_frac=nan_frac)
+        scores[:, 0] = np.nan
+
+        result = trimmed_mean_columns(scores, 0.1)
+
+        assert result.tobytes() == _legacy_trimmed_mean(scores, 0.1).tobytes()
+        assert result[0] == 0.0
+
+    def test_matches_legacy_for_float64(self) -> None:
+        scores = _scores(777, 9, seed=3, nan_frac=0.1, dtype=np.float64)
+
+        assert trimmed_mean_columns(scores, 0.1).tobytes() == _legacy_trimmed_mean(scores, 0.1).tobytes()
+
+    @pytest.mark.parametrize("cols", [1, 5])
+    def test_does_not_mutate_input(self, cols: int) -> None:
+        scores = _scores(50, cols, seed=9, nan_frac=0.1)
+        before = scores.copy()
+
+        trimmed_mean_columns(scores, 0.1)
+
+        np.testing.assert_array_equal(scores, before)
+
+    def test_rejects_invalid_trim(self) -> None:
+        with pytest.raises(ValueError, match="trim_perc"):
+            pool_scores(_scores(4, 2, seed=0), mode="trimmed_mean", trim_perc=0.5)
+
+
+class TestPoolHeadScores:
+    """Joint pooling over all heads equals pooling each head on its own."""
+
+    @pytest.mark.parametrize("rows", [1, 2, 57, 3600])
+    def test_matches_per_head_pooling(self, rows: int) -> None:
+        heads = {
+            "mood_happy": _scores(rows, 2, seed=1),
+            "genre": _scores(rows, 87, seed=2, nan_frac=0.02),
+            "danceability": _scores(rows, 1, seed=3),
+        }
+
+        pooled = pool_head_scores(heads)
+
+        assert list(pooled) == list(heads)
+        for name, scores in heads.items():
+            vec, std = pooled[name]
+            expected = pool_scores(scores, mode="trimmed_mean", trim_perc=0.1, nan_policy="omit")
+            assert vec.tobytes() == _legacy_trimmed_mean(scores, 0.1).tobytes() == expected.tobytes()
+            if rows > 1:
+                assert std is not None
+                assert std.tobytes() == np.std(scores, axis=0).astype(np.float32).tobytes()
+            else:
+                assert std is None
+
+    def test_zero_segments(self) -> None:
+        heads = {"a": np.zeros((0, 3), dtype=np.float32), "b": np.zeros((0, 2), dtype=np.float32)}
+
+        pooled = pool_head_scores(heads)
+
+        assert pooled["a"][0].shape == (0, 3)
+        assert pooled["b"][1] is None
+
+    def test_mixed_precision_pools_each_head_at_its_own_dtype(self) -> None:
+        heads = {"a": _scores(99, 3, seed=1), "b": _scores(99, 4, seed=2, dtype=np.float64)}
+
+        pooled = pool_head_scores(heads)
+
+        for name, scores in heads.items():
+            assert pooled[name][0].tobytes() == _legacy_trimmed_mean(scores, 0.1).tobytes()
+
+    def test_rejects_mismatched_segment_counts(self) -> None:
+        with pytest.raises(ValueError, match="same number of segments"):
+            pool_head_scores({"a": _scores(5, 2, seed=0), "b": _scores(6, 2, seed=0)})
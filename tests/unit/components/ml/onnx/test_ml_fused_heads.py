@@ -0,0 +1,207 @@
+"""Tests for ml_fused_heads — fused multi-head ONNX graphs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+onnx = pytest.importorskip("onnx")
+from onnx import TensorProto, helper, numpy_helper  # noqa: E402
+
+from nomarr.components.ml.inference.ml_head_pipeline_comp import run_heads  # noqa: E402
+from nomarr.components.ml.onnx.ml_cache import ONNXModelCache  # noqa: E402
+from nomarr.components.ml.onnx.ml_fused_heads import (  # noqa: E402
+    ONNXFusedHeadsModel,
+    build_fused_head_graph,
+    plan_head_fusion,
+)
+from nomarr.components.ml.onnx.ml_head import ONNXHeadModel  # noqa: E402
+
+_DIM = 16
+
+
+def _write_head(
+    models_dir: Path,
+    name: str,
+    *,
+    head_type: str = "sigmoid",
+    classes: int = 2,
+    dim: int = _DIM,
+    opset: int = 17,
+    seed: int = 0,
+) -> ONNXHeadModel:
+    """Write a small two-layer MLP head to ``models/effnet/heads/<type>/<name>.onnx``."""
+    rng = np.random.default_rng(seed)
+    hidden = 8
+    weights = {
+        "w1": rng.standard_normal((dim, hidden)).astype(np.float32),
+        "b1": rng.standard_normal(hidden).astype(np.float32),
+        "w2": rng.standard_normal((hidden, classes)).astype(np.float32),
+        "b2": rng.standard_normal(classes).astype(np.float32),
+    }
+    activation = {"sigmoid": "Sigmoid", "softmax": "Softmax", "identity": "Identity"}[head_type]
+    nodes = [
+        helper.make_node("MatMul", ["model/Placeholder", "w1"], ["h1"]),
+        helper.make_node("Add", ["h1", "b1"], ["h1b"]),
+        helper.make_node("Relu", ["h1b"], ["h1r"]),
+        helper.make_node("MatMul", ["h1r", "w2"], ["h2"]),
+        helper.make_node("Add", ["h2", "b2"], ["logits"]),
+        helper.make_node(activation, ["logits"], ["model/Sigmoid"]),
+    ]
+    graph = helper.make_graph(
+        nodes,
+        name,
+        [helper.make_tensor_value_info("model/Placeholder", TensorProto.FLOAT, [None, dim])],
+        [helper.make_tensor_value_info("model/Sigmoid", TensorProto.FLOAT, [None, classes])],
+        initializer=[numpy_helper.from_array(v, k) for k, v in weights.items()],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", opset)])
+    model.ir_version = 8
+    path = models_dir / "effnet" / "heads" / head_type / f"{name}.onnx"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    onnx.save(model, str(path))
+    return ONNXHeadModel(str(path), labels=[f"{name}_{i}" for i in range(classes)])
+
+
+@pytest.fixture
+def heads(tmp_path: Path) -> list[ONNXHeadModel]:
+    models = [
+        _write_head(tmp_path, "mood_happy", seed=1),
+        _write_head(tmp_path, "mood_sad", seed=2),
+        _write_head(tmp_path, "genre", head_type="softmax", classes=5, seed=3),
+        _write_head(tmp_path, "danceability", head_type="identity", classes=1, seed=4),
+    ]
+    for m in models:
+        m.load("cpu")
+    return models
+
+
+def _embeddings(rows: int, seed: int = 7) -> np.ndarray:
+    return np.random.default_rng(seed).standard_normal((rows, _DIM)).astype(np.float32)
+
+
+class TestPlanHeadFusion:
+    """Heads are grouped only when they can share one graph."""
+
+    def test_compatible_heads_form_one_group(self, heads: list[ONNXHeadModel]) -> None:
+        groups = plan_head_fusion(heads)
+
+        assert [[h.name for h in g] for g in groups] == [["mood_happy", "mood_sad", "genre", "danceability"]]
+
+    def test_different_opset_or_width_is_split(self, tmp_path: Path) -> None:
+        models = [
+            _write_head(tmp_path, "a", opset=17),
+            _write_head(tmp_path, "b", opset=17),
+            _write_head(tmp_path, "c", opset=13),
+            _write_head(tmp_path, "d", dim=32),
+        ]
+
+        groups = plan_head_fusion(models)
+
+        assert [[h.name for h in g] for g in groups] == [["a", "b"]]
+
+    def test_heterogeneous_heads_rejected_by_builder(self, tmp_path: Path) -> None:
+        a = _write_head(tmp_path, "a")
+        b = _write_head(tmp_path, "b", dim=32)
+
+        with pytest.raises(ValueError, match="cannot be fused"):
+            build_fused_head_graph([a._path, b._path])
+
+
+class TestFusedHeadsModel:
+    """The fused session reproduces per-head scores bit for bit."""
+
+    @pytest.mark.parametrize("rows", [1, 11, 12, 57])
+    def test_bit_exact_against_per_head(self, heads: list[ONNXHeadModel], rows: int) -> None:
+        fused = ONNXFusedHeadsModel(heads)
+        fused.load("cpu")
+        embeddings = _embeddings(rows)
+
+        scores = fused.run_split(embeddings)
+
+        assert fused.verified is True
+        for head in heads:
+            expected = head.run(embeddings)
+            assert scores[head.name].shape == expected.shape
+            assert scores[head.name].tobytes() == expected.tobytes()
+
+    def test_one_session_call_per_batch(self, heads: list[ONNXHeadModel]) -> None:
+        fused = ONNXFusedHeadsModel(heads)
+        fused.load("cpu")
+        assert fused._session is not None
+
+        with patch.object(fused, "_session", wraps=fused._session) as session:
+            fused.run_split(_embeddings(23))
+
+        assert session.run.call_count == 3  # ceil(23 / 11)
+
+    def test_unverified_without_loaded_heads(self, heads: list[ONNXHeadModel]) -> None:
+        for h in heads:
+            h.unload()
+        fused = ONNXFusedHeadsModel(heads)
+
+        fused.load("cpu")
+
+        assert fused.verified is False
+
+    def test_parity_mismatch_marks_unverified(self, heads: list[ONNXHeadModel]) -> None:
+        fused = ONNXFusedHeadsModel(heads)
+        original_run = heads[0].run
+        with patch.object(heads[0], "run", side_effect=lambda e: original_run(e) + 1e-7):
+            fused.load("cpu")
+
+        assert fused.verified is False
+
+
+class TestRunHeadsFused:
+    """run_heads produces identical results with and without fusion."""
+
+    def test_fused_results_match_per_head(self, heads: list[ONNXHeadModel]) -> None:
+        fused = ONNXFusedHeadsModel(heads)
+        fused.load("cpu")
+        embeddings = _embeddings(40)
+
+        tags_plain: dict[str, object] = {}
+        tags_fused: dict[str, object] = {}
+        plain = run_heads(heads, embeddings, tags_plain)
+        with patch.object(ONNXHeadModel, "run", side_effect=AssertionError("per-head session used")):
+            result = run_heads(heads, embeddings, tags_fused, fused=[fused])
+
+        assert tags_fused == tags_plain
+        assert result.head_results == plain.head_results
+        for name, (scores, labels) in plain.raw_segments_per_head.items():
+            fused_scores, fused_labels = result.raw_segments_per_head[name]
+            assert fused_labels == labels
+            assert fused_scores.tobytes() == scores.tobytes()
+
+    def test_unverified_fused_model_is_ignored(self, heads: list[ONNXHeadModel]) -> None:
+        fused = ONNXFusedHeadsModel(heads)  # never loaded
+
+        result = run_heads(heads, _embeddings(5), {}, fused=[fused])
+
+        assert result.heads_succeeded == len(heads)
+
+
+class TestCacheFusion:
+    """ONNXModelCache builds, warms and verifies fused groups on request."""
+
+    def test_warm_cache_verifies_fused_group(self, tmp_path: Path) -> None:
+        for i, name in enumerate(["a", "b", "c"]):
+            _write_head(tmp_path, name, seed=i)
+
+        cache = ONNXModelCache(str(tmp_path), "cpu", fuse_heads=True)
+        cache.warm = True
+
+        assert [len(fm.heads) for fm in cache.fused_heads["effnet"]] == [3]
+        assert cache.fused_heads["effnet"][0].verified is True
+        cache.warm = False
+        assert cache.fused_heads["effnet"][0].verified is False
+
+    def test_fusion_off_by_default(self, tmp_path: Path) -> None:
+        _write_head(tmp_path, "a")
+        _write_head(tmp_path, "b")
+
+        assert ONNXModelCache(str(tmp_path), "cpu").fused_heads == {}
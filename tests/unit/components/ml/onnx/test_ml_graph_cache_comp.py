@@ -0,0 +1,146 @@
+"""Tests for ml_graph_cache_comp — on-disk optimized ONNX session graphs."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+onnx = pytest.importorskip("onnx")
+from onnx import TensorProto, helper, numpy_helper  # noqa: E402
+
+from nomarr.components.ml.onnx import ml_graph_cache_comp  # noqa: E402
+from nomarr.components.ml.onnx.ml_cache import ONNXModelCache  # noqa: E402
+from nomarr.components.ml.onnx.ml_graph_cache_comp import SessionGraphCache  # noqa: E402
+from nomarr.components.ml.onnx.ml_session_comp import create_session  # noqa: E402
+
+_DIM = 16
+
+
+def _write_model(path: Path, *, seed: int = 0) -> Path:
+    """Write a small MLP whose MatMul+Add pairs the optimizer fuses."""
+    rng = np.random.default_rng(seed)
+    weights = {
+        "w1": rng.standard_normal((_DIM, 32)).astype(np.float32),
+        "b1": rng.standard_normal(32).astype(np.float32),
+        "w2": rng.standard_normal((32, 3)).astype(np.float32),
+        "b2": rng.standard_normal(3).astype(np.float32),
+    }
+    nodes = [
+        helper.make_node("MatMul", ["model/Placeholder", "w1"], ["h1"]),
+        helper.make_node("Add", ["h1", "b1"], ["h1b"]),
+        helper.make_node("Relu", ["h1b"], ["h1r"]),
+        helper.make_node("MatMul", ["h1r", "w2"], ["h2"]),
+        helper.make_node("Add", ["h2", "b2"], ["logits"]),
+        helper.make_node("Sigmoid", ["logits"], ["model/Sigmoid"]),
+    ]
+    graph = helper.make_graph(
+        nodes,
+        path.stem,
+        [helper.make_tensor_value_info("model/Placeholder", TensorProto.FLOAT, [None, _DIM])],
+        [helper.make_tensor_value_info("model/Sigmoid", TensorProto.FLOAT, [None, 3])],
+        initializer=[numpy_helper.from_array(v, k) for k, v in weights.items()],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])
+    model.ir_version = 8
+    path.parent.mkdir(parents=True, exist_ok=True)
+    onnx.save(model, str(path))
+    return path
+
+
+def _run(session: object, rows: int = 9) -> np.ndarray:
+    x = np.random.default_rng(3).standard_normal((rows, _DIM)).astype(np.float32)
+    return session.run(None, {"model/Placeholder": x})[0]  # type: ignore[attr-defined]
+
+
+class TestSessionGraphCache:
+    """Optimized graphs are saved once and reused bit for bit."""
+
+    def test_miss_then_hit(self, tmp_path: Path) -> None:
+        model = _write_model(tmp_path / "models" / "head.onnx")
+        cache = SessionGraphCache(str(tmp_path / "cache"), "suite1")
+
+        plain = create_session(str(model))
+        first = create_session(str(model), graph_cache=cache)
+        second = create_session(str(model), graph_cache=cache)
+
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert len(list(Path(cache.root).glob("head-*.onnx"))) == 1
+        assert _run(first).tobytes() == _run(plain).tobytes()
+        assert _run(second).tobytes() == _run(plain).tobytes()
+
+    def test_no_temp_files_left_behind(self, tmp_path: Path) -> None:
+        model = _write_model(tmp_path / "head.onnx")
+        cache = SessionGraphCache(str(tmp_path / "cache"), "suite1")
+
+        create_session(str(model), graph_cache=cache)
+
+        assert [p.suffix for p in Path(cache.root).iterdir()] == [".onnx"]
+
+    def test_key_covers_model_content_ort_version_and_providers(self, tmp_path: Path) -> None:
+        model = _write_model(tmp_path / "head.onnx", seed=1)
+        cache = SessionGraphCache(str(tmp_path / "cache"), "suite1")
+        base = cache.entry_path(str(model), None, ["CPUExecutionProvider"])
+
+        with patch.object(ml_graph_cache_comp, "get_version", return_value="0.0.0"):
+            other_version = cache.entry_path(str(model), None, ["CPUExecutionProvider"])
+        other_provider = cache.entry_path(str(model), None, ["CUDAExecutionProvider", "CPUExecutionProvider"])
+        _write_model(model, seed=2)
+        os.utime(model, ns=(1, 1))
+        other_weights = cache.entry_path(str(model), None, ["CPUExecutionProvider"])
+
+        assert len({base, other_version, other_provider, other_weights}) == 4
+
+    def test_in_memory_graphs_keyed_by_bytes(self, tmp_path: Path) -> None:
+        model = _write_model(tmp_path / "head.onnx")
+        cache = SessionGraphCache(str(tmp_path / "cache"), "suite1")
+        data = model.read_bytes()
+
+        create_session("/virtual/fused.onnx", model_bytes=data, graph_cache=cache)
+        session = create_session("/virtual/fused.onnx", model_bytes=data, graph_cache=cache)
+
+        assert cache.hits == 1
+        assert _run(session).tobytes() == _run(create_session(str(model))).tobytes()
+
+    def test_corrupt_entry_is_rebuilt(self, tmp_path: Path) -> None:
+        model = _write_model(tmp_path / "head.onnx")
+        cache = SessionGraphCache(str(tmp_path / "cache"), "suite1")
+        entry = cache.entry_path(str(model), None, ["CPUExecutionProvider"])
+        assert entry is not None
+        Path(entry).write_bytes(b"not a model")
+
+        session = create_session(str(model), graph_cache=cache)
+
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert Path(entry).read_bytes() != b"not a model"
+        assert _run(session).tobytes() == _run(create_session(str(model))).tobytes()
+
+    def test_new_suite_hash_invalidates_old_entries(self, tmp_path: Path) -> None:
+        model = _write_model(tmp_path / "head.onnx")
+        old = SessionGraphCache(str(tmp_path / "cache"), "suite1")
+        create_session(str(model), graph_cache=old)
+
+        new = SessionGraphCache(str(tmp_path / "cache"), "suite2")
+        create_session(str(model), graph_cache=new)
+
+        assert not Path(old.root).exists()
+        assert (new.hits, new.misses) == (0, 1)
+
+
+class TestModelCacheIntegration:
+    """Re-warming an evicted ONNXModelCache loads every session from disk."""
+
+    def test_rewarm_hits_for_every_model(self, tmp_path: Path) -> None:
+        for i, name in enumerate(["a", "b", "c"]):
+            _write_model(tmp_path / "models" / "effnet" / "heads" / "sigmoid" / f"{name}.onnx", seed=i)
+        graph_cache = SessionGraphCache(str(tmp_path / "cache"), "suite1")
+        cache = ONNXModelCache(str(tmp_path / "models"), "cpu", graph_cache=graph_cache)
+
+        cache.warm = True
+        cache.warm = False
+        cache.warm = True
+
+        assert (graph_cache.hits, graph_cache.misses) == (3, 3)
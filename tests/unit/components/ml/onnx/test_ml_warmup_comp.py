@@ -0,0 +1,206 @@
+"""Tests for ml_warmup_comp — batched, parallel ONNX session warm-up."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+onnx = pytest.importorskip("onnx")
+from onnx import TensorProto, helper, numpy_helper  # noqa: E402
+
+from nomarr.components.ml.onnx import ml_warmup_comp  # noqa: E402
+from nomarr.components.ml.onnx.ml_cache import ONNXModelCache  # noqa: E402
+from nomarr.components.ml.onnx.ml_head import ONNXHeadModel  # noqa: E402
+from nomarr.components.ml.onnx.ml_warmup_comp import plan_placements, warm_models  # noqa: E402
+from nomarr.components.ml.resources import ml_worker_context_comp  # noqa: E402
+
+_DIM = 16
+
+
+def _write_head(models_dir: Path, name: str, *, seed: int = 0) -> ONNXHeadModel:
+    """Write a small sigmoid MLP head to ``models/effnet/heads/sigmoid/<name>.onnx``."""
+    rng = np.random.default_rng(seed)
+    weights = {
+        "w1": rng.standard_normal((_DIM, 8)).astype(np.float32),
+        "b1": rng.standard_normal(8).astype(np.float32),
+        "w2": rng.standard_normal((8, 2)).astype(np.float32),
+        "b2": rng.standard_normal(2).astype(np.float32),
+    }
+    nodes = [
+        helper.make_node("MatMul", ["model/Placeholder", "w1"], ["h1"]),
+        helper.make_node("Add", ["h1", "b1"], ["h1b"]),
+        helper.make_node("Relu", ["h1b"], ["h1r"]),
+        helper.make_node("MatMul", ["h1r", "w2"], ["h2"]),
+        helper.make_node("Add", ["h2", "b2"], ["logits"]),
+        helper.make_node("Sigmoid", ["logits"], ["model/Sigmoid"]),
+    ]
+    graph = helper.make_graph(
+        nodes,
+        name,
+        [helper.make_tensor_value_info("model/Placeholder", TensorProto.FLOAT, [None, _DIM])],
+        [helper.make_tensor_value_info("model/Sigmoid", TensorProto.FLOAT, [None, 2])],
+        initializer=[numpy_helper.from_array(v, k) for k, v in weights.items()],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])
+    model.ir_version = 8
+    path = models_dir / "effnet" / "heads" / "sigmoid" / f"{name}.onnx"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    onnx.save(model, str(path))
+    return ONNXHeadModel(str(path), labels=[f"{name}_0", f"{name}_1"])
+
+
+@pytest.fixture
+def worker_db():
+    """Register a mock worker database for the duration of a test."""
+    db = MagicMock()
+    ml_worker_context_comp.register_worker_context(db, "nomarr-tag:0")
+    yield db
+    ml_worker_context_comp.clear_worker_context()
+
+
+class TestWarmModels:
+    """Sessions are built concurrently and timed per model."""
+
+    def test_parallel_warm_matches_sequential_load(self, tmp_path: Path) -> None:
+        heads = [_write_head(tmp_path, f"h{i}", seed=i) for i in range(6)]
+        reference = [_write_head(tmp_path / "ref", f"h{i}", seed=i) for i in range(6)]
+        for h in reference:
+            h.load("cpu")
+
+        report = warm_models([heads], "cpu", max_workers=3)
+
+        embeddings = np.random.default_rng(0).standard_normal((5, _DIM)).astype(np.float32)
+        for h, ref in zip(heads, reference, strict=True):
+            assert h.device == "cpu"
+            assert h.num_classes == 2
+            assert h.run(embeddings).tobytes() == ref.run(embeddings).tobytes()
+        assert report.workers == 3
+        assert sorted(t.path for t in report.timings) == sorted(h._path for h in heads)
+        assert all(t.load_ms >= 0 for t in report.timings)
+        assert set(report.load_ms) == {h._path for h in heads}
+
+    def test_builds_run_on_worker_threads(self, tmp_path: Path) -> None:
+        heads = [_write_head(tmp_path, f"h{i}", seed=i) for i in range(4)]
+        seen: set[str] = set()
+        original = ONNXHeadModel.load_with_placement
+
+        def record(self, device, vram_limit_bytes=None):
+            seen.add(threading.current_thread().name)
+            original(self, device, vram_limit_bytes)
+
+        with patch.object(ONNXHeadModel, "load_with_placement", record):
+            warm_models([heads], "cpu", max_workers=2)
+
+        assert seen and all(name.startswith("onnx-warm") for name in seen)
+
+    def test_stages_load_in_order(self, tmp_path: Path) -> None:
+        first = [_write_head(tmp_path, "a"), _write_head(tmp_path, "b")]
+        second = [_write_head(tmp_path, "c")]
+        loaded_before_second: list[bool] = []
+        original = ONNXHeadModel.load_with_placement
+
+        def record(self, device, vram_limit_bytes=None):
+            if self is second[0]:
+                loaded_before_second.append(all(m._session is not None for m in first))
+            original(self, device, vram_limit_bytes)
+
+        with patch.object(ONNXHeadModel, "load_with_placement", record):
+            warm_models([first, second], "cpu", max_workers=4)
+
+        assert loaded_before_second == [True]
+
+    def test_failure_finishes_stage_releases_promises_and_raises(self, tmp_path: Path, worker_db: MagicMock) -> None:
+        heads = [_write_head(tmp_path, f"h{i}", seed=i) for i in range(3)]
+        later = [_write_head(tmp_path, "later")]
+        broken = heads[1]
+        original = ONNXHeadModel.load_with_placement
+
+        def flaky(self, device, vram_limit_bytes=None):
+            if self is broken:
+                raise RuntimeError("corrupt model")
+            original(self, "cpu", None)  # no CUDA here; the placement is what matters
+
+        worker_db.meta.get_many.return_value = {}
+        with (
+            patch.object(
+                ml_warmup_comp._coordinator,
+                "register_vram_promises",
+                side_effect=lambda _db, _w, _p, pr: dict.fromkeys(pr, True),
+            ),
+            patch.object(ml_warmup_comp._coordinator, "release_vram_promise") as release,
+            patch.object(ONNXHeadModel, "load_with_placement", flaky),
+            pytest.raises(RuntimeError, match="corrupt model"),
+        ):
+            warm_models([heads, later], "gpu", max_workers=2)
+
+        assert heads[0]._session is not None and heads[2]._session is not None
+        assert later[0]._session is None
+        released = sorted(call.args[2] for call in release.call_args_list)
+        assert released == sorted([broken._path, later[0]._path])
+
+
+class TestPlanPlacements:
+    """GPU placement uses one metadata query and one coordinator call."""
+
+    def test_cpu_needs_no_database(self, tmp_path: Path, worker_db: MagicMock) -> None:
+        heads = [_write_head(tmp_path, "a"), _write_head(tmp_path, "b")]
+
+        plan = plan_placements(heads, "cpu")
+
+        assert plan == {h._path: ("cpu", None) for h in heads}
+        worker_db.meta.get_many.assert_not_called()
+
+    def test_gpu_batches_metadata_and_promises(self, tmp_path: Path, worker_db: MagicMock) -> None:
+        heads = [_write_head(tmp_path, name) for name in ("a", "b", "c")]
+        mib = 1024 * 1024
+        worker_db.meta.get_many.return_value = {
+            f"ml_model_vram:{heads[0]._path}": str(300 * mib),
+            f"ml_model_vram:{heads[1]._path}": str(900 * mib),
+        }
+
+        with patch.object(
+            ml_warmup_comp._coordinator,
+            "register_vram_promises",
+            return_value={heads[0]._path: True, heads[1]._path: False, heads[2]._path: True},
+        ) as register:
+            plan = plan_placements(heads, "gpu")
+
+        assert worker_db.meta.get_many.call_count == 1
+        assert worker_db.meta.get.call_count == 0
+        register.assert_called_once()
+        assert register.call_args.args[3] == {heads[0]._path: 300.0, heads[1]._path: 900.0, heads[2]._path: 0.0}
+        assert plan == {
+            heads[0]._path: ("gpu", 300 * mib),
+            heads[1]._path: ("cpu", None),
+            heads[2]._path: ("gpu", None),
+        }
+
+    def test_gpu_without_worker_context_skips_coordinator(self, tmp_path: Path) -> None:
+        heads = [_write_head(tmp_path, "a")]
+
+        with patch.object(ml_warmup_comp._coordinator, "register_vram_promises") as register:
+            plan = plan_placements(heads, "gpu")
+
+        assert plan == {heads[0]._path: ("gpu", None)}
+        register.assert_not_called()
+
+
+class TestCacheWarmup:
+    """ONNXModelCache warms through the batched pipeline."""
+
+    def test_cache_records_warmup_report(self, tmp_path: Path) -> None:
+        for i in range(4):
+            _write_head(tmp_path, f"h{i}", seed=i)
+        cache = ONNXModelCache(str(tmp_path), "cpu", fuse_heads=True, warmup_workers=2)
+
+        cache.warm = True
+
+        assert cache.warm is True
+        assert cache.fused_heads["effnet"][0].verified is True
+        assert cache.last_warmup is not None
+        assert len(cache.last_warmup.timings) == 5  # four heads + one fused group
+        assert cache.last_warmup.workers == 2
@@ -0,0 +1,210 @@
+"""Tests for ml_thread_tuning_comp.py — CPU thread calibration of backbone sessions."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+onnx = pytest.importorskip("onnx")
+from onnx import TensorProto, helper, numpy_helper  # noqa: E402
+
+from nomarr.components.ml.onnx.ml_session_comp import SessionThreading, create_session  # noqa: E402
+from nomarr.components.ml.resources import ml_thread_tuning_comp  # noqa: E402
+from nomarr.components.ml.resources.ml_thread_tuning_comp import (  # noqa: E402
+    calibrate_backbone,
+    candidate_grid,
+    clear_thread_tuning,
+    get_or_run_thread_tuning,
+    select_threads,
+)
+from nomarr.helpers.dto.ml_dto import ThreadTuningCandidate, ThreadTuningProfile  # noqa: E402
+
+_TOPOLOGY = {"cpus": 2, "host_cpus": 2, "numa_nodes": 1, "cpus_per_node": 2, "model": "Test CPU"}
+
+
+def _write_backbone(models_dir: Path, name: str = "yamnet") -> Path:
+    """Write a tiny stand-in backbone (yamnet input shape) to ``models/<name>/embeddings/<name>.onnx``."""
+    weights = np.random.default_rng(0).standard_normal((64, 8)).astype(np.float32)
+    graph = helper.make_graph(
+        [
+            helper.make_node("ReduceMean", ["melspectrogram"], ["pooled"], axes=[1], keepdims=0),
+            helper.make_node("MatMul", ["pooled", "w"], ["embeddings"]),
+        ],
+        name,
+        [helper.make_tensor_value_info("melspectrogram", TensorProto.FLOAT, [None, 96, 64])],
+        [helper.make_tensor_value_info("embeddings", TensorProto.FLOAT, [None, 8])],
+        initializer=[numpy_helper.from_array(weights, "w")],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])
+    model.ir_version = 8
+    path = models_dir / name / "embeddings" / f"{name}.onnx"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    onnx.save(model, str(path))
+    return path
+
+
+def _profile(backbone: str, candidates: list[ThreadTuningCandidate], host_id: str = "host") -> ThreadTuningProfile:
+    return ThreadTuningProfile(
+        backbone=backbone,
+        host_id=host_id,
+        cpu_model="Test CPU",
+        cpus=8,
+        numa_nodes=1,
+        workers=1,
+        intra_op=4,
+        inter_op=1,
+        allow_spinning=True,
+        patches_per_s=100.0,
+        default_patches_per_s=50.0,
+        best_workers=1,
+        ort_version="1.0",
+        tuned_at=0,
+        candidates=candidates,
+    )
+
+
+class TestSessionThreading:
+    """Thread pools reach the ONNX Runtime session options."""
+
+    def test_create_session_applies_thread_counts(self, tmp_path: Path) -> None:
+        path = _write_backbone(tmp_path)
+
+        session = create_session(str(path), threads=SessionThreading(intra_op=3, inter_op=1, allow_spinning=False))
+
+        options = session.get_session_options()
+        assert options.intra_op_num_threads == 3
+        assert options.inter_op_num_threads == 1
+
+
+class TestCandidateGrid:
+    """Tests for candidate_grid()."""
+
+    def test_powers_of_two_up_to_share_and_numa_node(self) -> None:
+        grid = candidate_grid(cpus=16, cpus_per_node=4, worker_counts=[1, 8])
+
+        assert sorted({t.intra_op for w, t in grid if w == 1}) == [1, 2, 4]
+        assert sorted({t.intra_op for w, t in grid if w == 8}) == [1, 2]
+        assert (8, SessionThreading(intra_op=2, inter_op=1, allow_spinning=True)) in grid
+        assert (8, SessionThreading(intra_op=1, inter_op=1, allow_spinning=True)) in grid
+
+    def test_includes_default_pool(self) -> None:
+        default = SessionThreading(intra_op=2, inter_op=1, allow_spinning=True)
+        with patch.object(ml_thread_tuning_comp.backend_onnx, "default_session_threading", return_value=default):
+            grid = candidate_grid(cpus=1, cpus_per_node=1, worker_counts=[1])
+
+        assert (1, SessionThreading(intra_op=2, inter_op=1, allow_spinning=False)) in grid  # oversubscribed: no spin
+        assert (1, default) in grid
+        assert len(grid) == 3
+
+
+class TestSelectThreads:
+    """Tests for select_threads()."""
+
+    def test_near_tie_goes_to_smaller_pool(self) -> None:
+        profile = _profile(
+            "effnet",
+            [
+                ThreadTuningCandidate(workers=2, intra_op=2, inter_op=1, allow_spinning=True, patches_per_s=990.0),
+                ThreadTuningCandidate(workers=2, intra_op=4, inter_op=1, allow_spinning=True, patches_per_s=1000.0),
+                ThreadTuningCandidate(workers=1, intra_op=8, inter_op=1, allow_spinning=True, patches_per_s=2000.0),
+            ],
+        )
+
+        assert select_threads(profile, 2) == SessionThreading(intra_op=2, inter_op=1, allow_spinning=True)
+        assert select_threads(profile, 1) == SessionThreading(intra_op=8, inter_op=1, allow_spinning=True)
+        assert select_threads(profile, 4) is None
+
+
+class TestCalibrateBackbone:
+    """Tests for calibrate_backbone()."""
+
+    def test_measures_every_worker_count_and_baseline(self, tmp_path: Path) -> None:
+        path = _write_backbone(tmp_path)
+
+        profile = calibrate_backbone(str(path), "yamnet", 2, _TOPOLOGY, duration_ms=20)
+
+        assert {c.workers for c in profile.candidates} == {1, 2}
+        assert all(c.patches_per_s > 0 for c in profile.candidates)
+        assert profile.workers == 2
+        assert profile.default_patches_per_s > 0
+        assert select_threads(profile, 2) == SessionThreading(
+            intra_op=profile.intra_op, inter_op=profile.inter_op, allow_spinning=profile.allow_spinning
+        )
+
+
+class TestGetOrRunThreadTuning:
+    """Stored profiles are reused; missing ones are calibrated under a host lock."""
+
+    def test_stored_profile_skips_calibration(self, tmp_path: Path) -> None:
+        _write_backbone(tmp_path)
+        host_id = ml_thread_tuning_comp.host_profile_id(_TOPOLOGY)
+        stored = _profile(
+            "yamnet",
+            [ThreadTuningCandidate(workers=2, intra_op=1, inter_op=1, allow_spinning=True, patches_per_s=10.0)],
+            host_id=host_id,
+        )
+        db = MagicMock()
+        db.meta.get_by_prefix.return_value = {f"ml_ort_threads:{host_id}:yamnet": json.dumps(asdict(stored))}
+
+        with (
+            patch.object(ml_thread_tuning_comp, "get_cpu_topology", return_value=_TOPOLOGY),
+            patch.object(ml_thread_tuning_comp, "calibrate_backbone") as calibrate,
+        ):
+            result = get_or_run_thread_tuning(db, str(tmp_path), "nomarr-tag:0", 2)
+
+        assert result == {"yamnet": SessionThreading(intra_op=1, inter_op=1, allow_spinning=True)}
+        calibrate.assert_not_called()
+        db.locks.try_acquire.assert_not_called()
+
+    def test_lock_holder_calibrates_stores_and_releases(self, tmp_path: Path) -> None:
+        _write_backbone(tmp_path)
+        db = MagicMock()
+        db.meta.get_by_prefix.return_value = {}
+        db.locks.try_acquire.return_value = True
+        tuned = _profile(
+            "yamnet",
+            [ThreadTuningCandidate(workers=1, intra_op=2, inter_op=1, allow_spinning=True, patches_per_s=10.0)],
+        )
+
+        with (
+            patch.object(ml_thread_tuning_comp, "get_cpu_topology", return_value=_TOPOLOGY),
+            patch.object(ml_thread_tuning_comp, "calibrate_backbone", return_value=tuned),
+        ):
+            result = get_or_run_thread_tuning(db, str(tmp_path), "nomarr-tag:0", 1)
+
+        assert result == {"yamnet": SessionThreading(intra_op=2, inter_op=1, allow_spinning=True)}
+        key, value = db.meta.set.call_args.args
+        assert key.startswith("ml_ort_threads:") and key.endswith(":yamnet")
+        assert json.loads(value)["intra_op"] == 4
+        db.locks.release.assert_called_once()
+
+    def test_lock_loser_waits_and_rereads(self, tmp_path: Path) -> None:
+        _write_backbone(tmp_path)
+        db = MagicMock()
+        db.meta.get_by_prefix.return_value = {}
+        db.locks.try_acquire.return_value = False
+        db.locks.is_locked.return_value = False
+
+        with (
+            patch.object(ml_thread_tuning_comp, "get_cpu_topology", return_value=_TOPOLOGY),
+            patch.object(ml_thread_tuning_comp, "calibrate_backbone") as calibrate,
+        ):
+            result = get_or_run_thread_tuning(db, str(tmp_path), "nomarr-tag:1", 1)
+
+        assert result == {}
+        calibrate.assert_not_called()
+        db.locks.is_locked.assert_called()
+        assert db.meta.get_by_prefix.call_count == 2
+
+
+def test_clear_thread_tuning_deletes_every_profile() -> None:
+    db = MagicMock()
+    db.meta.get_by_prefix.return_value = {"ml_ort_threads:a:effnet": "{}", "ml_ort_threads:b:effnet": "{}"}
+
+    assert clear_thread_tuning(db) == 2
+    assert db.meta.delete.call_count == 2
@@ -0,0 +1,81 @@
+"""Tests for ml_vram_coordinator_comp.py batched promise registration."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from nomarr.components.ml.resources import ml_vram_coordinator_comp
+from nomarr.components.ml.resources.ml_vram_coordinator_comp import register_vram_promises
+
+
+@pytest.fixture
+def vram_reading():
+    """Pin the nvidia-smi reading to 8000 MB total, 1000 MB used."""
+    with (
+        patch.object(ml_vram_coordinator_comp._resource_monitor, "reset_telemetry_cache"),
+        patch.object(
+            ml_vram_coordinator_comp._resource_monitor,
+            "get_vram_usage_mb",
+            return_value={"total_mb": 8000, "used_mb": 1000, "error": None},
+        ) as reading,
+    ):
+        yield reading
+
+
+class TestRegisterVramPromises:
+    """Tests for register_vram_promises()."""
+
+    def test_greedy_plan_committed_in_one_write(self, vram_reading):
+        """Models are admitted in order while they fit, like sequential registration."""
+        db = MagicMock()
+        db.vram_promises.get_headroom_mb.return_value = 1000.0
+        db.vram_promises.try_register_many.return_value = True
+
+        result = register_vram_promises(db, "nomarr-tag:0", 42, {"/m/a": 600.0, "/m/b": 500.0, "/m/c": 300.0})
+
+        assert result == {"/m/a": True, "/m/b": False, "/m/c": True}
+        db.vram_promises.try_register_many.assert_called_once_with(
+            worker_id="nomarr-tag:0",
+            pid=42,
+            promises={"/m/a": 600.0, "/m/c": 300.0},
+            total_mb=8000.0,
+            used_mb=1000.0,
+        )
+        db.vram_promises.try_register.assert_not_called()
+
+    def test_contention_replans_then_falls_back_to_single_registration(self, vram_reading):
+        """A batch rejected on every attempt is registered model by model."""
+        db = MagicMock()
+        db.vram_promises.get_headroom_mb.return_value = 5000.0
+        db.vram_promises.try_register_many.return_value = False
+        db.vram_promises.try_register.side_effect = [True, False]
+
+        result = register_vram_promises(db, "nomarr-tag:0", 42, {"/m/a": 100.0, "/m/b": 100.0})
+
+        assert result == {"/m/a": True, "/m/b": False}
+        assert db.vram_promises.try_register_many.call_count == ml_vram_coordinator_comp._BATCH_REGISTER_ATTEMPTS
+        assert db.vram_promises.try_register.call_count == 2
+
+    def test_nvidia_smi_error_denies_all(self):
+        """No GPU reading means no GPU placement for any model."""
+        db = MagicMock()
+        with (
+            patch.object(ml_vram_coordinator_comp._resource_monitor, "reset_telemetry_cache"),
+            patch.object(
+                ml_vram_coordinator_comp._resource_monitor,
+                "get_vram_usage_mb",
+                return_value={"error": "nvidia-smi not found"},
+            ),
+        ):
+            result = register_vram_promises(db, "nomarr-tag:0", 42, {"/m/a": 100.0})
+
+        assert result == {"/m/a": False}
+        db.vram_promises.try_register_many.assert_not_called()
+
+    def test_empty_batch_touches_nothing(self, vram_reading):
+        db = MagicMock()
+
+        assert register_vram_promises(db, "nomarr-tag:0", 42, {}) == {}
+        vram_reading.assert_not_called()
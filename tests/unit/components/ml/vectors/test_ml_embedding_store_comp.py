@@ -0,0 +1,108 @@
+"""Tests for ml_embedding_store_comp — stored per-segment backbone embeddings."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+from nomarr.components.ml.onnx.ml_discovery_comp import compute_model_suite_manifest, diff_head_suites
+from nomarr.components.ml.vectors.ml_embedding_store_comp import EmbeddingStore
+
+
+def _write(models_dir: Path, rel_path: str, size: int) -> None:
+    path = models_dir / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"\0" * size)
+
+
+def _suite(models_dir: Path) -> None:
+    _write(models_dir, "effnet/embeddings/effnet.onnx", 100)
+    _write(models_dir, "effnet/heads/classifier/mood_happy.onnx", 10)
+    _write(models_dir, "effnet/heads/classifier/mood_sad.onnx", 10)
+
+
+class TestSuiteManifest:
+    """compute_model_suite_manifest() / diff_head_suites()."""
+
+    def test_splits_backbones_and_heads(self, tmp_path: Path) -> None:
+        _suite(tmp_path)
+
+        manifest = compute_model_suite_manifest(str(tmp_path))
+
+        assert manifest.backbones == {"effnet/embeddings/effnet.onnx": 100}
+        assert set(manifest.heads) == {
+            "effnet/heads/classifier/mood_happy.onnx",
+            "effnet/heads/classifier/mood_sad.onnx",
+        }
+
+    def test_head_only_change_reports_changed_and_removed(self, tmp_path: Path) -> None:
+        _suite(tmp_path)
+        before = compute_model_suite_manifest(str(tmp_path))
+        _write(tmp_path, "effnet/heads/classifier/mood_happy.onnx", 12)
+        _write(tmp_path, "effnet/heads/classifier/genre.onnx", 10)
+        os.remove(tmp_path / "effnet/heads/classifier/mood_sad.onnx")
+
+        delta = diff_head_suites(before, compute_model_suite_manifest(str(tmp_path)))
+
+        assert delta is not None
+        assert delta.changed_heads == ["effnet/heads/classifier/genre.onnx", "effnet/heads/classifier/mood_happy.onnx"]
+        assert delta.removed_heads == ["effnet/heads/classifier/mood_sad.onnx"]
+
+    def test_backbone_change_is_not_head_only(self, tmp_path: Path) -> None:
+        _suite(tmp_path)
+        before = compute_model_suite_manifest(str(tmp_path))
+        _write(tmp_path, "effnet/embeddings/effnet.onnx", 101)
+
+        assert diff_head_suites(before, compute_model_suite_manifest(str(tmp_path))) is None
+
+
+class TestEmbeddingStore:
+    """Entries round-trip exactly and follow the installed backbone graphs."""
+
+    def test_round_trip_is_bit_identical(self, tmp_path: Path) -> None:
+        models = tmp_path / "models"
+        _suite(models)
+        store = EmbeddingStore(str(tmp_path / "store"), str(models))
+        embeddings = np.random.default_rng(0).standard_normal((7, 1280)).astype(np.float32)
+
+        assert store.save("library_files/abc", "effnet", embeddings)
+        loaded = store.load("library_files/abc", "effnet")
+
+        assert loaded is not None
+        assert loaded.dtype == np.float32
+        assert np.array_equal(loaded, embeddings)
+
+    def test_missing_or_unknown_entries_return_none(self, tmp_path: Path) -> None:
+        models = tmp_path / "models"
+        _suite(models)
+        store = EmbeddingStore(str(tmp_path / "store"), str(models))
+
+        assert store.load("library_files/missing", "effnet") is None
+        assert store.load("library_files/abc", "musicnn") is None
+        assert not store.save("library_files/abc", "musicnn", np.zeros((1, 4), dtype=np.float32))
+
+    def test_delete_removes_entry(self, tmp_path: Path) -> None:
+        models = tmp_path / "models"
+        _suite(models)
+        store = EmbeddingStore(str(tmp_path / "store"), str(models))
+        store.save("library_files/abc", "effnet", np.ones((2, 4), dtype=np.float32))
+
+        store.delete("library_files/abc")
+
+        assert store.load("library_files/abc", "effnet") is None
+
+    def test_replaced_backbone_drops_stale_entries(self, tmp_path: Path) -> None:
+        models = tmp_path / "models"
+        _suite(models)
+        root = str(tmp_path / "store")
+        EmbeddingStore(root, str(models)).save("library_files/abc", "effnet", np.ones((2, 4), dtype=np.float32))
+
+        _write(models, "effnet/heads/classifier/mood_sad.onnx", 11)  # head change: entries stay valid
+        assert EmbeddingStore(root, str(models)).load("library_files/abc", "effnet") is not None
+
+        _write(models, "effnet/embeddings/effnet.onnx", 101)  # backbone change: entries dropped
+        store = EmbeddingStore(root, str(models))
+        assert store.load("library_files/abc", "effnet") is None
+        assert len(os.listdir(root)) == 0
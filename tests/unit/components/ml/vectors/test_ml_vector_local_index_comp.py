@@ -0,0 +1,272 @@
+"""Unit tests for ml_vector_local_index_comp."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from nomarr.components.ml.vectors.ml_vector_local_index_comp import (
+    LocalVectorIndex,
+    LocalVectorIndexCache,
+    build_local_index_from_cold,
+    sync_local_index_from_hot,
+)
+
+
+def _random_unit_rows(n: int, dim: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    rows = rng.standard_normal((n, dim)).astype(np.float32)
+    return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+def _brute_force(rows: np.ndarray, ids: list[str], query: np.ndarray, k: int) -> list[str]:
+    scores = rows @ (query / np.linalg.norm(query))
+    return [ids[i] for i in np.argsort(-scores)[:k]]
+
+
+def _make_db(cold_docs: list[dict], hot_docs: list[dict]) -> MagicMock:
+    db = MagicMock()
+    db.db.has_collection.return_value = True
+    db.get_vectors_track_cold.return_value.iter_search_vectors.return_value = iter(cold_docs)
+    db.get_vectors_track_cold.return_value.count.return_value = len(cold_docs)
+    db.register_vectors_track_backbone.return_value.get_vectors_since.side_effect = lambda since: [
+        d for d in hot_docs if d["created_at"] >= since
+    ]
+    return db
+
+
+@pytest.mark.unit
+class TestLocalVectorIndexSearch:
+    """Tests for exact and IVF search."""
+
+    def test_exact_matches_brute_force(self) -> None:
+        rows = _random_unit_rows(500, 16)
+        ids = [f"library_files/{i}" for i in range(500)]
+        index = LocalVectorIndex.from_arrays(ids, rows)
+
+        query = rows[7] + 0.1 * rows[8]
+        hits = index.search(query, 10)
+
+        assert index.mode == "exact"
+        assert [fid for fid, _ in hits] == _brute_force(rows, ids, query, 10)
+        assert hits[0][1] >= hits[-1][1]
+
+    def test_exclude_drops_seed(self) -> None:
+        rows = _random_unit_rows(50, 8)
+        ids = [str(i) for i in range(50)]
+        index = LocalVectorIndex.from_arrays(ids, rows)
+
+        hits = index.search(rows[3], 5, exclude=["3"])
+
+        assert "3" not in [fid for fid, _ in hits]
+        assert len(hits) == 5
+
+    def test_float16_storage_keeps_ranking(self) -> None:
+        rows = _random_unit_rows(300, 32, seed=1)
+        ids = [str(i) for i in range(300)]
+        index = LocalVectorIndex.from_arrays(ids, rows, dtype="float16")
+
+        hits = index.search(rows[42], 1)
+
+        assert hits[0][0] == "42"
+        assert hits[0][1] == pytest.approx(1.0, abs=1e-2)
+
+    def test_ivf_recall(self) -> None:
+        rows = _random_unit_rows(4000, 16, seed=2)
+        ids = [str(i) for i in range(4000)]
+        index = LocalVectorIndex.from_arrays(ids, rows, exact_threshold=1000)
+        nlists = index.train_ivf(nlists=32)
+
+        assert nlists == 32
+        assert index.mode == "ivf"
+
+        recalled = 0
+        for q in range(20):
+            expected = set(_brute_force(rows, ids, rows[q], 10))
+            got = {fid for fid, _ in index.search(rows[q], 10, nprobe=8)}
+            recalled += len(expected & got)
+        assert recalled / 200 >= 0.8
+
+    def test_dimension_mismatch_raises(self) -> None:
+        index = LocalVectorIndex(4)
+        with pytest.raises(ValueError, match="dimension"):
+            index.upsert("a", [1.0, 0.0])
+
+
+@pytest.mark.unit
+class TestLocalVectorIndexMutation:
+    """Tests for upsert/remove/compact."""
+
+    def test_upsert_replaces_base_row(self) -> None:
+        index = LocalVectorIndex.from_arrays(["a", "b"], np.eye(2, dtype=np.float32))
+
+        index.upsert("a", [0.0, 1.0])
+
+        assert len(index) == 2
+        assert index.delta_size == 1
+        assert index.get_vector("a") == pytest.approx([0.0, 1.0])
+        assert {fid for fid, _ in index.search([0.0, 1.0], 2)} == {"a", "b"}
+
+    def test_remove_hides_entries(self) -> None:
+        index = LocalVectorIndex.from_arrays(["a", "b"], np.eye(2, dtype=np.float32))
+        index.upsert("c", [1.0, 1.0])
+
+        removed = index.remove(["a", "c", "missing"])
+
+        assert removed == 2
+        assert "a" not in index
+        assert [fid for fid, _ in index.search([1.0, 0.0], 5)] == ["b"]
+
+    def test_compact_folds_delta_and_keeps_ivf(self) -> None:
+        rows = _random_unit_rows(200, 8, seed=3)
+        ids = [str(i) for i in range(200)]
+        index = LocalVectorIndex.from_arrays(ids, rows, exact_threshold=50)
+        index.train_ivf(nlists=8)
+        index.upsert("new", rows[0])
+        index.remove(["1"])
+
+        index.compact()
+
+        assert index.delta_size == 0
+        assert len(index) == 200
+        assert index.ivf_nlists == 8
+        assert index.search(rows[0], 2, nprobe=8)[0][1] == pytest.approx(1.0, abs=1e-5)
+
+
+@pytest.mark.unit
+class TestLocalVectorIndexSnapshot:
+    """Tests for save/load."""
+
+    def test_roundtrip_mmap(self, tmp_path: Path) -> None:
+        rows = _random_unit_rows(300, 8, seed=4)
+        ids = [f"library_files/{i}" for i in range(300)]
+        index = LocalVectorIndex.from_arrays(ids, rows, dtype="float16", exact_threshold=100)
+        index.train_ivf(nlists=10)
+        index.hot_watermark_ms = 1234
+        index.save(str(tmp_path))
+
+        loaded = LocalVectorIndex.load(str(tmp_path), exact_threshold=100)
+
+        assert loaded is not None
+        assert isinstance(loaded._base, np.memmap)
+        assert loaded.dtype == "float16"
+        assert loaded.hot_watermark_ms == 1234
+        assert loaded.ivf_nlists == 10
+        assert loaded.search(rows[5], 3, nprobe=10) == index.search(rows[5], 3, nprobe=10)
+
+    def test_upsert_on_loaded_snapshot(self, tmp_path: Path) -> None:
+        LocalVectorIndex.from_arrays(["a"], np.array([[1.0, 0.0]])).save(str(tmp_path))
+        loaded = LocalVectorIndex.load(str(tmp_path))
+        assert loaded is not None
+
+        loaded.upsert("a", [0.0, 1.0])
+
+        assert loaded.search([0.0, 1.0], 1)[0][0] == "a"
+
+    def test_missing_snapshot_returns_none(self, tmp_path: Path) -> None:
+        assert LocalVectorIndex.load(str(tmp_path)) is None
+
+
+@pytest.mark.unit
+class TestLoadFromDatabase:
+    """Tests for cold build, hot sync and the cache."""
+
+    def test_build_from_cold_and_sync_hot(self) -> None:
+        cold = [
+            {"file_id": "library_files/1", "vector_n": [1.0, 0.0], "created_at": 100},
+            {"file_id": "library_files/2", "vector_n": [0.0, 1.0], "created_at": 200},
+        ]
+        hot = [
+            {"file_id": "library_files/3", "vector_n": [0.6, 0.8], "created_at": 300},
+            {"file_id": "library_files/1", "vector_n": [0.8, 0.6], "created_at": 150},
+        ]
+        db = _make_db(cold, hot)
+
+        index = build_local_index_from_cold(db, "effnet", "lib1")
+        assert index is not None
+        assert index.hot_watermark_ms == 200
+
+        applied = sync_local_index_from_hot(db, index, "effnet", "lib1")
+
+        # Only the hot doc newer than the cold watermark is applied
+        assert applied == 1
+        assert index.hot_watermark_ms == 300
+        assert "library_files/3" in index
+        assert sync_local_index_from_hot(db, index, "effnet", "lib1") == 1  # >= watermark is inclusive
+
+    def test_build_grows_past_stale_count_and_keeps_last_duplicate(self) -> None:
+        cold = [{"file_id": f"library_files/{i}", "vector_n": [float(i), 1.0], "created_at": i} for i in range(5)]
+        cold.append({"file_id": "library_files/0", "vector_n": [0.0, 2.0], "created_at": 9})
+        db = _make_db(cold, [])
+        db.get_vectors_track_cold.return_value.count.return_value = 2  # Promoted mid-read
+
+        index = build_local_index_from_cold(db, "effnet", "lib1")
+
+        assert index is not None
+        assert len(index) == 5
+        assert index.hot_watermark_ms == 9
+        stored = index.get_vector("library_files/0")
+        assert stored is not None
+        np.testing.assert_allclose(stored, [0.0, 1.0])
+
+    def test_build_without_collection(self) -> None:
+        db = MagicMock()
+        db.db.has_collection.return_value = False
+
+        assert build_local_index_from_cold(db, "effnet", "lib1") is None
+
+    def test_cache_builds_once_and_snapshots(self, tmp_path: Path) -> None:
+        cold = [{"file_id": "library_files/1", "vector_n": [1.0, 0.0], "created_at": 100}]
+        db = _make_db(cold, [])
+        cache = LocalVectorIndexCache(cache_dir=str(tmp_path), background_build=False)
+
+        first = cache.get(db, "effnet", "lib1")
+        second = cache.get(db, "effnet", "lib1")
+
+        assert first is second
+        assert db.get_vectors_track_cold.return_value.iter_search_vectors.call_count == 1
+        assert (tmp_path / "effnet__lib1" / "meta.json").exists()
+
+        cache.invalidate("effnet")
+        assert not (tmp_path / "effnet__lib1" / "meta.json").exists()
+
+    def test_cache_hot_only_library(self) -> None:
+        db = _make_db([], [{"file_id": "library_files/9", "vector_n": [0.0, 1.0], "created_at": 5}])
+        cache = LocalVectorIndexCache(cache_dir=None, background_build=False)
+
+        index = cache.get(db, "effnet", "lib1")
+
+        assert index is not None
+        assert index.search([0.0, 1.0], 1)[0][0] == "library_files/9"
+
+    def test_cache_builds_in_background(self) -> None:
+        cold = [{"file_id": "library_files/1", "vector_n": [1.0, 0.0], "created_at": 100}]
+        db = _make_db(cold, [])
+        cache = LocalVectorIndexCache(cache_dir=None)
+
+        assert cache.get(db, "effnet", "lib1") is None
+        for thread in threading.enumerate():
+            if thread.name == "vector-index-effnet__lib1":
+                thread.join(timeout=5)
+
+        index = cache.get(db, "effnet", "lib1")
+        assert index is not None
+        assert "library_files/1" in index
+
+    def test_remove_files_drops_from_cached_indexes(self) -> None:
+        cold = [
+            {"file_id": "library_files/1", "vector_n": [1.0, 0.0], "created_at": 100},
+            {"file_id": "library_files/2", "vector_n": [0.0, 1.0], "created_at": 100},
+        ]
+        cache = LocalVectorIndexCache(cache_dir=None, background_build=False)
+        index = cache.get(_make_db(cold, []), "effnet", "lib1")
+        assert index is not None
+
+        cache.remove_files(["library_files/1"])
+
+        assert "library_files/1" not in index
+        assert "library_files/2" in index
@@ -0,0 +1,90 @@
+"""Unit tests for ml_vector_search_params_comp."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from nomarr.components.ml.vectors.ml_vector_search_params_comp import (
+    VectorSearchParams,
+    VectorSearchParamsCache,
+    get_vector_search_params,
+    load_vector_search_params,
+    save_vector_search_params,
+)
+
+
+def _make_db(meta: dict[str, str] | None = None, indexes: list[dict] | None = None, cold_count: int = 0) -> MagicMock:
+    store: dict[str, str] = dict(meta or {})
+    db = MagicMock()
+    db.meta.get.side_effect = store.get
+    db.meta.set.side_effect = store.__setitem__
+    db.db.has_collection.return_value = indexes is not None
+    db.db.collection.return_value.indexes.return_value = indexes or []
+    db.get_vectors_track_cold.return_value.count.return_value = cold_count
+    return db
+
+
+@pytest.mark.unit
+class TestVectorSearchParams:
+    """Tests for save/load and backfill."""
+
+    def test_save_then_load_roundtrip(self) -> None:
+        db = _make_db()
+
+        saved = save_vector_search_params(db, "effnet", "lib1", nlists=200, doc_count=3000)
+        loaded = load_vector_search_params(db, "effnet", "lib1")
+
+        assert loaded == saved
+        assert loaded is not None
+        assert loaded.nprobe(10) == 20
+
+    def test_unreadable_entry_is_ignored(self) -> None:
+        db = _make_db({"vector_search_params:effnet__lib1": "not json"})
+
+        assert load_vector_search_params(db, "effnet", "lib1") is None
+
+    def test_backfills_from_index_definition(self) -> None:
+        db = _make_db(indexes=[{"type": "persistent"}, {"type": "vector", "params": {"nLists": 64}}], cold_count=900)
+
+        params = get_vector_search_params(db, "effnet", "lib1")
+
+        assert params is not None
+        assert (params.nlists, params.doc_count) == (64, 900)
+        stored = json.loads(db.meta.set.call_args.args[1])
+        assert stored["nlists"] == 64
+
+    def test_no_index_returns_none(self) -> None:
+        db = _make_db(indexes=[{"type": "persistent"}])
+
+        assert get_vector_search_params(db, "effnet", "lib1") is None
+        db.get_vectors_track_cold.return_value.count.assert_not_called()
+
+
+@pytest.mark.unit
+class TestVectorSearchParamsCache:
+    """Tests for VectorSearchParamsCache."""
+
+    def test_serves_from_memory_until_invalidated(self) -> None:
+        params = VectorSearchParams(nlists=40, doc_count=600, updated_at_ms=1)
+        db = _make_db({"vector_search_params:effnet__lib1": json.dumps(params.__dict__)})
+        cache = VectorSearchParamsCache()
+
+        assert cache.get(db, "effnet", "lib1") == params
+        assert cache.get(db, "effnet", "lib1") == params
+        assert db.meta.get.call_count == 1
+
+        cache.invalidate("effnet", "lib1")
+        cache.get(db, "effnet", "lib1")
+        assert db.meta.get.call_count == 2
+
+    def test_expired_entry_is_reloaded(self) -> None:
+        db = _make_db()
+        cache = VectorSearchParamsCache(ttl_s=0)
+
+        cache.get(db, "effnet", "lib1")
+        cache.get(db, "effnet", "lib1")
+
+        assert db.meta.get.call_count == 2
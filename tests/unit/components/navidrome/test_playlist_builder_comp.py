@@ -0,0 +1,154 @@
+"""Unit tests for ``playlist_builder_comp`` shared candidate pool."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from nomarr.components.navidrome.playlist_builder_comp import (
+    build_candidate_pool,
+    build_discovery_playlist,
+    build_familiar_playlist,
+    build_hidden_gems_playlist,
+    build_universal_playlist,
+)
+from nomarr.helpers.dto.navidrome_dto import NavidromeCandidatePool, NavidromePersonalPlaylistContext
+
+_ALL_TYPES = ["familiar", "discovery", "hidden_gems", "universal"]
+
+
+def _ranked(n: int) -> list[dict[str, object]]:
+    """ANN results best-first: f0 (score 1.0) ... f{n-1}."""
+    return [{"file_id": f"library_files/f{i}", "score": 1.0 - i / 1000, "genres": ["Rock"]} for i in range(n)]
+
+
+def _make_db(corpus_size: int = 100, artists: dict[str, set[str]] | None = None) -> MagicMock:
+    corpus = _ranked(corpus_size)
+    db = MagicMock()
+    cold_ops = db.get_vectors_track_cold.return_value
+    cold_ops.search_similar.side_effect = lambda _vec, limit, **_kw: [dict(r) for r in corpus[:limit]]
+    db.tags.get_tag_values_grouped_by_file.side_effect = lambda ids, _rel: {
+        fid: vals for fid, vals in (artists or {}).items() if fid in ids
+    }
+    return db
+
+
+def _ctx(pool: NavidromeCandidatePool, played: list[str], max_songs: int = 4) -> NavidromePersonalPlaylistContext:
+    return NavidromePersonalPlaylistContext(
+        backbone_id="effnet",
+        library_key="lib1",
+        centroid=[1.0, 0.0],
+        max_songs=max_songs,
+        played_file_ids=played,
+        played_tracks=[],
+        max_genre_playlists=5,
+        half_life_days=30.0,
+        cold_doc_count=100,
+        nprobe=3,
+        pool=pool,
+    )
+
+
+def _pool(db: MagicMock, played: list[str], enabled: list[str], max_songs: int = 4) -> NavidromeCandidatePool:
+    return build_candidate_pool(
+        db,
+        backbone_id="effnet",
+        library_key="lib1",
+        centroid=[1.0, 0.0],
+        nprobe=3,
+        cold_doc_count=100,
+        max_songs=max_songs,
+        enabled_types=enabled,
+        played_file_ids=played,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.mocked
+class TestBuildCandidatePool:
+    """Tests for ``build_candidate_pool``."""
+
+    def test_single_ann_query_at_largest_factor(self) -> None:
+        db = _make_db()
+
+        pool = _pool(db, played=[], enabled=_ALL_TYPES)
+
+        db.get_vectors_track_cold.return_value.search_similar.assert_called_once()
+        assert len(pool["candidates"]) == 4 * 5
+
+    def test_no_query_without_index(self) -> None:
+        db = _make_db()
+
+        pool = build_candidate_pool(
+            db,
+            backbone_id="effnet",
+            library_key="lib1",
+            centroid=[1.0],
+            nprobe=1,
+            cold_doc_count=0,
+            max_songs=4,
+            enabled_types=_ALL_TYPES,
+            played_file_ids=["library_files/f0"],
+        )
+
+        assert pool["candidates"] == []
+        db.get_vectors_track_cold.assert_not_called()
+
+    def test_artist_metadata_fetched_once_for_union(self) -> None:
+        db = _make_db(
+            artists={
+                "library_files/played": {"Known"},
+                "library_files/f1": {"Known"},
+                "library_files/f2": {"Other"},
+            }
+        )
+
+        pool = _pool(db, played=["library_files/played"], enabled=_ALL_TYPES)
+
+        db.tags.get_tag_values_grouped_by_file.assert_called_once()
+        assert pool["known_artists"] == ["Known"]
+        assert pool["candidates"][2]["artists"] == ["Other"]
+
+
+@pytest.mark.unit
+@pytest.mark.mocked
+class TestBuildersMatchDedicatedQueries:
+    """Builders on the shared pool return what a dedicated ANN query returned."""
+
+    def test_discovery_uses_its_own_prefix(self) -> None:
+        played = ["library_files/f0", "library_files/f2"]
+        db = _make_db()
+        ctx = _ctx(_pool(db, played, _ALL_TYPES), played)
+
+        entry = build_discovery_playlist(db, ctx)[0]
+
+        # Dedicated query fetched max_songs * 2 = 8 → f0..f7 minus played
+        assert entry["file_ids"] == ["library_files/f1", "library_files/f3", "library_files/f4", "library_files/f5"]
+
+    def test_familiar_limited_to_five_x_prefix(self) -> None:
+        played = ["library_files/f3", "library_files/f19", "library_files/f20"]
+        db = _make_db()
+        ctx = _ctx(_pool(db, played, ["familiar"]), played)
+
+        entry = build_familiar_playlist(db, ctx)[0]
+
+        assert entry["file_ids"] == ["library_files/f3", "library_files/f19"]
+
+    def test_hidden_gems_excludes_known_artists(self) -> None:
+        played = ["library_files/f0"]
+        db = _make_db(artists={"library_files/f0": {"Known"}, "library_files/f1": {"Known"}})
+        ctx = _ctx(_pool(db, played, _ALL_TYPES), played)
+
+        entry = build_hidden_gems_playlist(db, ctx)[0]
+
+        assert entry["file_ids"] == ["library_files/f2", "library_files/f3", "library_files/f4", "library_files/f5"]
+
+    def test_universal_samples_from_three_x_prefix(self) -> None:
+        db = _make_db()
+        ctx = _ctx(_pool(db, [], _ALL_TYPES), [])
+
+        entry = build_universal_playlist(db, ctx)[0]
+
+        # Stride 3 over the first 12 candidates → f0, f3, f6, f9 (shuffled)
+        assert sorted(entry["file_ids"]) == sorted(f"library_files/f{i}" for i in (0, 3, 6, 9))
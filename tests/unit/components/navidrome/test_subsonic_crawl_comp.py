@@ -1,13 +1,25 @@
-"""Unit tests for subsonic_crawl_comp: crawl_navidrome_songs."""
+"""Unit tests for subsonic_crawl_comp: crawl_navidrome_songs and the delta album crawl."""
 
 from __future__ import annotations
 
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
 from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 
-from nomarr.components.navidrome.subsonic_crawl_comp import crawl_navidrome_songs
+from nomarr.components.navidrome.subsonic_client_comp import SubsonicClient
+from nomarr.components.navidrome.subsonic_crawl_comp import (
+    album_change_marker,
+    crawl_navidrome_albums,
+    crawl_navidrome_songs,
+)
+from nomarr.helpers.exceptions import SubsonicApiError
 
 # ---------------------------------------------------------------------------
 # crawl_navidrome_songs
@@ -95,3 +107,172 @@ class TestCrawlNavidromeSongs:
         assert len(result) == 3
         # Called twice: once with data, once empty
         assert client.get_album_list2.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# crawl_navidrome_albums against a local fake Subsonic server
+# ---------------------------------------------------------------------------
+
+
+class _FakeSubsonic:
+    """Minimal Subsonic server: getAlbumList2 + getAlbum over real HTTP.
+
+    ``getAlbum`` sleeps briefly so concurrent requests overlap; the peak
+    number of requests in flight is recorded.
+    """
+
+    def __init__(self, n_albums: int, songs_per_album: int = 3) -> None:
+        self.albums: dict[str, dict[str, Any]] = {}
+        for i in range(n_albums):
+            album_id = f"al-{i:04d}"
+            self.albums[album_id] = {
+                "album": {"id": album_id, "name": album_id, "songCount": songs_per_album, "playCount": 0},
+                "songs": [
+                    {"id": f"{album_id}-s{j}", "path": f"/music/{album_id}/{j}.flac", "playCount": 0}
+                    for j in range(songs_per_album)
+                ],
+            }
+        self.get_album_calls: list[str] = []
+        self.list_calls = 0
+        self.inflight = 0
+        self.peak_inflight = 0
+        self._lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                body = fake.handle(url.path.rsplit("/", 1)[-1], query)
+                payload = json.dumps({"subsonic-response": {"status": "ok", "version": "1.16.1", **body}}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def handle(self, endpoint: str, query: dict[str, str]) -> dict[str, Any]:
+        if endpoint == "getAlbumList2.view":
+            with self._lock:
+                self.list_calls += 1
+            ordered = [self.albums[k]["album"] for k in sorted(self.albums)]
+            offset, size = int(query["offset"]), int(query["size"])
+            return {"albumList2": {"album": ordered[offset : offset + size]}}
+        if endpoint == "getAlbum.view":
+            with self._lock:
+                self.get_album_calls.append(query["id"])
+                self.inflight += 1
+                self.peak_inflight = max(self.peak_inflight, self.inflight)
+            try:
+                time.sleep(0.02)
+                entry = self.albums[query["id"]]
+                return {"album": {**entry["album"], "song": entry["songs"]}}
+            finally:
+                with self._lock:
+                    self.inflight -= 1
+        return {}
+
+    def play(self, album_id: str, song_index: int) -> None:
+        """Simulate a scrobble: bumps the song's and the album's play data."""
+        entry = self.albums[album_id]
+        entry["songs"][song_index]["playCount"] += 1
+        entry["songs"][song_index]["played"] = "2026-01-01T10:00:00Z"
+        entry["album"]["playCount"] += 1
+        entry["album"]["played"] = "2026-01-01T10:00:00Z"
+
+    def __enter__(self) -> _FakeSubsonic:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def fake_server() -> Iterator[_FakeSubsonic]:
+    with _FakeSubsonic(n_albums=40) as server:
+        yield server
+
+
+@pytest.fixture
+def subsonic(fake_server: _FakeSubsonic) -> Iterator[SubsonicClient]:
+    client = SubsonicClient(fake_server.url, "admin", "secret")
+    yield client
+    client.close()
+
+
+@pytest.mark.unit
+class TestCrawlNavidromeAlbumsHttp:
+    """Delta crawl over real HTTP against a fake Subsonic server."""
+
+    def test_first_crawl_fetches_every_album_concurrently(
+        self, fake_server: _FakeSubsonic, subsonic: SubsonicClient
+    ) -> None:
+        result = crawl_navidrome_albums(subsonic, max_workers=4)
+
+        assert sorted(fake_server.get_album_calls) == sorted(fake_server.albums)
+        assert 1 < fake_server.peak_inflight <= 4
+        assert list(result.songs_by_album) == sorted(fake_server.albums)
+        assert len(result.songs) == 40 * 3
+        assert set(result.markers) == set(fake_server.albums)
+
+    def test_repeat_crawl_fetches_only_changed_albums(
+        self, fake_server: _FakeSubsonic, subsonic: SubsonicClient
+    ) -> None:
+        first = crawl_navidrome_albums(subsonic)
+        fake_server.get_album_calls.clear()
+
+        unchanged = crawl_navidrome_albums(subsonic, first.markers)
+        assert fake_server.get_album_calls == []
+        assert unchanged.songs_by_album == {}
+        assert unchanged.markers == first.markers
+
+        fake_server.play("al-0007", 1)
+        fake_server.albums["al-0020"]["album"]["songCount"] = 4
+        fake_server.albums["al-0020"]["songs"].append({"id": "al-0020-s3", "path": "/music/al-0020/3.flac"})
+        changed = crawl_navidrome_albums(subsonic, first.markers)
+
+        assert sorted(fake_server.get_album_calls) == ["al-0007", "al-0020"]
+        assert changed.songs_by_album["al-0007"][1]["play_count"] == 1
+        assert len(changed.songs_by_album["al-0020"]) == 4
+
+    def test_removed_album_drops_out_of_markers(self, fake_server: _FakeSubsonic, subsonic: SubsonicClient) -> None:
+        first = crawl_navidrome_albums(subsonic)
+        del fake_server.albums["al-0003"]
+
+        result = crawl_navidrome_albums(subsonic, first.markers)
+
+        assert "al-0003" not in result.markers
+        assert result.songs_by_album == {}
+
+    def test_api_error_propagates(self, fake_server: _FakeSubsonic, subsonic: SubsonicClient) -> None:
+        def failing(endpoint: str, query: dict[str, str]) -> dict[str, Any]:
+            if endpoint == "getAlbum.view" and query["id"] == "al-0011":
+                return {"status": "failed", "error": {"code": 70, "message": "Album not found"}}
+            return original(endpoint, query)
+
+        original = fake_server.handle
+        fake_server.handle = failing  # type: ignore[method-assign]
+
+        with pytest.raises(SubsonicApiError, match="Album not found"):
+            crawl_navidrome_albums(subsonic)
+
+
+@pytest.mark.unit
+class TestAlbumChangeMarker:
+    def test_marker_ignores_unrelated_fields(self) -> None:
+        album = {"id": "a", "name": "X", "songCount": 3, "playCount": 2, "played": "2026-01-01T00:00:00Z"}
+        assert album_change_marker(album) == album_change_marker({**album, "name": "Y", "year": 1999})
+
+    @pytest.mark.parametrize("field", ["songCount", "playCount", "played", "changed", "coverArt", "duration"])
+    def test_marker_tracks_change_fields(self, field: str) -> None:
+        album = {"id": "a", "songCount": 3, "playCount": 2}
+        assert album_change_marker(album) != album_change_marker({**album, field: "new"})
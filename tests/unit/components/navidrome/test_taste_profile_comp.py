@@ -0,0 +1,159 @@
+"""Unit tests for the persisted taste-profile store in ``taste_profile_comp``."""
+
+from __future__ import annotations
+
+import math
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from nomarr.components.navidrome.taste_profile_comp import (
+    _marginal_play_weight,
+    compute_taste_profile,
+    get_taste_profile,
+    load_taste_profile,
+    record_play,
+    seed_taste_profile,
+)
+
+_NOW = 1_700_000_000_000
+_DAY = 86_400_000
+
+
+def _make_db(plays: list[dict[str, object]], vectors: dict[str, list[float]]) -> MagicMock:
+    db = MagicMock()
+    db.navidrome_playcounts.get_top_plays.return_value = plays
+    db.get_vectors_track_cold.return_value.get_vectors_by_file_ids.side_effect = lambda ids: [
+        {"file_id": fid, "vector": vectors[fid]} for fid in ids if fid in vectors
+    ]
+    db.navidrome_taste_profiles.get_profile.return_value = None
+    return db
+
+
+def _plays() -> list[dict[str, object]]:
+    return [
+        {"nd_id": "a", "file_id": "library_files/a", "playcount": 9, "last_played": _NOW - 2 * _DAY},
+        {"nd_id": "b", "file_id": "library_files/b", "playcount": 2, "last_played": _NOW - 40 * _DAY},
+        {"nd_id": "c", "file_id": None, "playcount": 5, "last_played": _NOW},
+    ]
+
+
+_VECTORS = {"library_files/a": [1.0, 0.0, 0.0], "library_files/b": [0.0, 1.0, 0.0]}
+
+
+def _stored(vector_sum: list[float], **overrides: object) -> dict[str, object]:
+    doc: dict[str, object] = {
+        "_key": "u1__effnet__lib1",
+        "userid": "u1",
+        "backbone_id": "effnet",
+        "library_key": "lib1",
+        "vector_sum": vector_sum,
+        "weight_sum": 1.0,
+        "half_life_days": 30.0,
+        "top_n": 200,
+        "track_count": 2,
+        "play_count": 3,
+        "updated_at_ms": _NOW,
+    }
+    doc.update(overrides)
+    return doc
+
+
+@pytest.mark.unit
+@pytest.mark.mocked
+class TestSeedAndLoad:
+    """Seeding persists a sum whose direction equals the batch centroid."""
+
+    def test_seed_matches_compute(self) -> None:
+        db = _make_db(_plays(), _VECTORS)
+
+        with patch("nomarr.components.navidrome.taste_profile_comp.now_ms") as clock:
+            clock.return_value.value = _NOW
+            computed = compute_taste_profile(db, "u1", "effnet", "lib1")
+            seeded = seed_taste_profile(db, "u1", "effnet", "lib1")
+
+        assert computed is not None
+        assert seeded is not None
+        np.testing.assert_allclose(seeded["centroid"], computed["centroid"])
+        stored = db.navidrome_taste_profiles.upsert_profile.call_args.kwargs
+        np.testing.assert_allclose(stored["vector_sum"] / np.linalg.norm(stored["vector_sum"]), computed["centroid"])
+        assert stored["ref_ms"] == _NOW
+        assert stored["track_count"] == 2
+
+    def test_seed_without_embeddings_stores_nothing(self) -> None:
+        db = _make_db(_plays(), {})
+
+        assert seed_taste_profile(db, "u1", "effnet", "lib1") is None
+        db.navidrome_taste_profiles.upsert_profile.assert_not_called()
+
+    def test_load_normalises_stored_sum(self) -> None:
+        profile = load_taste_profile(_stored([3.0, 4.0, 0.0]), 30.0, 200)
+
+        assert profile is not None
+        assert profile["centroid"] == pytest.approx([0.6, 0.8, 0.0])
+        assert profile["track_count"] == 5
+
+    @pytest.mark.parametrize(
+        ("vector_sum", "overrides"),
+        [([1.0, 0.0], {"half_life_days": 14.0}), ([1.0, 0.0], {"top_n": 50}), ([0.0, 0.0], {})],
+    )
+    def test_load_rejects_stale_or_empty(self, vector_sum: list[float], overrides: dict[str, object]) -> None:
+        assert load_taste_profile(_stored(vector_sum, **overrides), 30.0, 200) is None
+
+    def test_get_reads_store_without_play_history(self) -> None:
+        db = _make_db(_plays(), _VECTORS)
+        db.navidrome_taste_profiles.get_profile.return_value = _stored([0.0, 2.0, 0.0])
+
+        profile = get_taste_profile(db, "u1", "effnet", "lib1")
+
+        assert profile is not None
+        assert profile["centroid"] == [0.0, 1.0, 0.0]
+        db.navidrome_playcounts.get_top_plays.assert_not_called()
+        db.get_vectors_track_cold.assert_not_called()
+
+    def test_get_seeds_on_miss(self) -> None:
+        db = _make_db(_plays(), _VECTORS)
+
+        assert get_taste_profile(db, "u1", "effnet", "lib1") is not None
+        db.navidrome_taste_profiles.upsert_profile.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.mocked
+class TestRecordPlay:
+    """Incremental updates from scrobbles."""
+
+    def test_marginal_weights_sum_to_batch_weight(self) -> None:
+        assert sum(_marginal_play_weight(c) for c in range(1, 10)) == pytest.approx(math.log(10))
+
+    def test_updates_each_seeded_profile_with_track_vector(self) -> None:
+        db = _make_db([], _VECTORS)
+        db.navidrome_taste_profiles.list_user_profiles.return_value = [
+            {"_key": "u1__effnet__lib1", "backbone_id": "effnet", "library_key": "lib1"},
+            {"_key": "u1__musicnn__lib1", "backbone_id": "musicnn", "library_key": "lib1"},
+        ]
+        db.navidrome_taste_profiles.apply_play.return_value = True
+
+        updated = record_play(db, "u1", "library_files/a", playcount=3, timestamp_ms=_NOW)
+
+        assert updated == 2
+        key, vector, weight, ts = db.navidrome_taste_profiles.apply_play.call_args.args
+        assert (key, vector, ts) == ("u1__musicnn__lib1", [1.0, 0.0, 0.0], _NOW)
+        assert weight == pytest.approx(math.log(4) - math.log(3))
+
+    def test_unseeded_user_is_skipped(self) -> None:
+        db = _make_db([], _VECTORS)
+        db.navidrome_taste_profiles.list_user_profiles.return_value = []
+
+        assert record_play(db, "u1", "library_files/a", playcount=1, timestamp_ms=_NOW) == 0
+        db.get_vectors_track_cold.assert_not_called()
+
+    def test_track_without_embedding_is_skipped(self) -> None:
+        db = _make_db([], {})
+        db.navidrome_taste_profiles.list_user_profiles.return_value = [
+            {"_key": "u1__effnet__lib1", "backbone_id": "effnet", "library_key": "lib1"},
+        ]
+
+        assert record_play(db, "u1", "library_files/a", playcount=1, timestamp_ms=_NOW) == 0
+        db.navidrome_taste_profiles.apply_play.assert_not_called()
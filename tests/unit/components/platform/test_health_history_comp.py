@@ -0,0 +1,120 @@
+"""Unit tests for health_history_comp (buffered, coalesced history writes)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from nomarr.components.platform.health_history_comp import HealthHistoryWriter, HealthSnapshot
+from nomarr.helpers.time_helper import InternalSeconds
+
+
+def _writer(**overrides):
+    db = MagicMock()
+    kwargs = {"retention_s": 3600, "stale_heartbeat_s": 60.0}
+    kwargs.update(overrides)
+    return HealthHistoryWriter(db, **kwargs), db
+
+
+def _snap(component_id="worker:tag:0", status="healthy", last_heartbeat_ms=1_000, age_s=1.0, frame_s=1):
+    return HealthSnapshot(component_id, status, last_heartbeat_ms, age_s, InternalSeconds(frame_s))
+
+
+def _inserted(db):
+    return [call.args[0] for call in db.health_history.insert_snapshots.call_args_list]
+
+
+@pytest.mark.unit
+class TestObserve:
+    def test_unchanged_fresh_components_are_not_rewritten(self):
+        writer, db = _writer()
+
+        assert writer.observe([_snap(), _snap("worker:tag:1")]) == 2
+        writer.flush()
+        assert writer.observe([_snap(last_heartbeat_ms=2_000), _snap("worker:tag:1", last_heartbeat_ms=2_000)]) == 0
+        assert writer.flush() == 0
+
+        (batch,) = _inserted(db)
+        assert [(s["component_id"], s["reason"]) for s in batch] == [
+            ("worker:tag:0", "changed"),
+            ("worker:tag:1", "changed"),
+        ]
+
+    def test_status_change_is_buffered(self):
+        writer, _db = _writer()
+        writer.observe([_snap()])
+
+        assert writer.observe([_snap(status="unhealthy")]) == 1
+
+    def test_stale_heartbeat_is_recorded_once(self):
+        writer, db = _writer()
+        writer.observe([_snap()])
+
+        assert writer.observe([_snap(age_s=90.0, last_heartbeat_ms=5_000, frame_s=5)]) == 1
+        assert writer.observe([_snap(age_s=120.0, last_heartbeat_ms=5_000, frame_s=5)]) == 0
+        writer.flush()
+
+        assert [s["reason"] for s in _inserted(db)[0]] == ["changed", "stale"]
+
+    def test_stale_heartbeat_ignores_wall_clock_jitter(self):
+        writer, _db = _writer()
+        writer.observe([_snap(age_s=90.0, last_heartbeat_ms=5_000, frame_s=5)])
+
+        # Same frame; its wall-clock conversion landed a millisecond later
+        assert writer.observe([_snap(age_s=120.0, last_heartbeat_ms=5_001, frame_s=5)]) == 0
+
+    def test_transitions_are_always_buffered(self):
+        writer, _db = _writer()
+        writer.record_transition(_snap(status="unhealthy"))
+        writer.record_transition(_snap(status="healthy"))
+
+        # The observed status equals the last transition: nothing new
+        assert writer.observe([_snap(status="healthy")]) == 0
+        assert writer.flush() == 2
+
+    def test_forget_restarts_tracking(self):
+        writer, _db = _writer()
+        writer.observe([_snap()])
+        writer.forget("worker:tag:0")
+
+        assert writer.observe([_snap()]) == 1
+
+
+@pytest.mark.unit
+class TestFlush:
+    def test_one_bulk_insert_with_ttl_field(self):
+        writer, db = _writer(retention_s=600)
+        writer.observe([_snap(), _snap("worker:tag:1"), _snap("app")])
+
+        assert writer.flush() == 3
+
+        db.health_history.insert_snapshots.assert_called_once()
+        (batch,) = _inserted(db)
+        for snapshot in batch:
+            assert snapshot["expires_at"] == snapshot["recorded_at"] // 1000 + 600
+            assert snapshot["last_heartbeat"] == 1_000
+
+    def test_failed_flush_keeps_snapshots_for_the_next_one(self):
+        writer, db = _writer()
+        db.health_history.insert_snapshots.side_effect = [RuntimeError("db down"), None]
+        writer.observe([_snap()])
+
+        assert writer.flush() == 0
+        writer.observe([_snap("worker:tag:1")])
+        assert writer.flush() == 2
+
+        assert [s["component_id"] for s in _inserted(db)[1]] == ["worker:tag:0", "worker:tag:1"]
+
+    def test_buffer_is_bounded(self):
+        writer, db = _writer(max_buffered=2)
+        for i in range(3):
+            writer.record_transition(_snap(f"worker:tag:{i}"))
+
+        writer.flush()
+
+        assert [s["component_id"] for s in _inserted(db)[0]] == ["worker:tag:1", "worker:tag:2"]
+
+    def test_empty_buffer_skips_the_database(self):
+        writer, db = _writer()
+
+        assert writer.flush() == 0
+        db.health_history.insert_snapshots.assert_not_called()
@@ -0,0 +1,82 @@
+"""Unit tests for nomarr.components.platform.pipeline_metrics_comp."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from nomarr.components.platform.pipeline_metrics_comp import (
+    FILE_SECONDS,
+    FILES_TOTAL,
+    OUTCOME_TAGGED,
+    STAGE_SECONDS,
+    new_pipeline_registry,
+    record_processed_file,
+    stage_durations_ms,
+)
+
+# Keys process_file_workflow sets for a two-backbone file
+FILE_TIMINGS = {
+    "model_discovery": 1.0,
+    "audio_load": 400.0,
+    "pre_effnet": 30.0,
+    "pre_musicnn": 20.0,
+    "emb_effnet": 300.0,
+    "emb_musicnn": 100.0,
+    "emb_wall": 380.0,
+    "heads_effnet": 40.0,
+    "heads_musicnn": 10.0,
+    "head_mood_happy": 5.0,
+    "vector_store_effnet": 8.0,
+    "mood_aggregation": 2.0,
+}
+
+
+class TestStageDurations:
+    """Tests for stage_durations_ms."""
+
+    @pytest.mark.unit
+    def test_maps_workflow_timings_to_stages(self) -> None:
+        assert stage_durations_ms(FILE_TIMINGS) == {
+            "decode": 400.0,
+            "preprocess": 50.0,
+            "backbone": 400.0,
+            "heads": 50.0,
+        }
+
+    @pytest.mark.unit
+    def test_heads_only_reprocessing(self) -> None:
+        timings = {"embedding_load": 3.0, "heads": 25.0, "mood_aggregation": 1.0}
+
+        assert stage_durations_ms(timings) == {"heads": 25.0}
+
+
+class TestRecordProcessedFile:
+    """Tests for record_processed_file."""
+
+    @pytest.mark.unit
+    def test_records_stages_wall_time_and_outcome(self) -> None:
+        registry = new_pipeline_registry()
+
+        record_processed_file(registry, FILE_TIMINGS, 1200.0, OUTCOME_TAGGED)
+
+        snapshot = registry.snapshot()
+        stages = {row[0]["stage"]: row[2] for row in snapshot["histogram"][STAGE_SECONDS]}
+        assert stages == pytest.approx({"decode": 0.4, "preprocess": 0.05, "backbone": 0.4, "heads": 0.05})
+        assert snapshot["histogram"][FILE_SECONDS][0][2] == pytest.approx(1.2)
+        assert snapshot["counter"][FILES_TOTAL] == [[{"outcome": "tagged"}, 1.0]]
+
+    @pytest.mark.unit
+    def test_cost_is_far_below_one_percent_of_a_file(self) -> None:
+        """Recording must stay negligible next to a file (seconds of work each)."""
+        registry = new_pipeline_registry()
+        rounds = 2000
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            record_processed_file(registry, FILE_TIMINGS, 1200.0, OUTCOME_TAGGED)
+        per_file_s = (time.perf_counter() - started) / rounds
+
+        # 1% of a 100 ms file, itself an order of magnitude faster than real files
+        assert per_file_s < 0.001
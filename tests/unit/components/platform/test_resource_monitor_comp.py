@@ -10,6 +10,7 @@ import pytest
 from nomarr.components.platform.resource_monitor_comp import (
     check_nvidia_gpu_capability,
     check_resource_headroom,
+    get_cpu_topology,
     get_ram_usage_mb,
     get_vram_usage_for_pid_mb,
     get_vram_usage_mb,
@@ -208,3 +209,35 @@ class TestCheckResourceHeadroom:
 
         # 14000 + 4096 = 18096 > 16384
         assert result.ram_ok is False
+
+
+class TestGetCpuTopology:
+    """Tests for get_cpu_topology()."""
+
+    def test_cgroup_quota_caps_affinity(self):
+        """A Docker --cpus quota below the affinity mask wins, rounded up."""
+        with (
+            patch("os.sched_getaffinity", return_value=set(range(8)), create=True),
+            patch(
+                "nomarr.components.platform.resource_monitor_comp._get_cgroup_cpu_quota",
+                return_value=2.5,
+            ),
+        ):
+            result = get_cpu_topology()
+
+        assert result["cpus"] == 3
+        assert result["numa_nodes"] >= 1
+        assert result["cpus_per_node"] >= 1
+
+    def test_no_quota_uses_affinity(self):
+        """Without a quota the affinity mask is the usable CPU count."""
+        with (
+            patch("os.sched_getaffinity", return_value={0, 1, 2, 3}, create=True),
+            patch(
+                "nomarr.components.platform.resource_monitor_comp._get_cgroup_cpu_quota",
+                return_value=0.0,
+            ),
+        ):
+            result = get_cpu_topology()
+
+        assert result["cpus"] == 4
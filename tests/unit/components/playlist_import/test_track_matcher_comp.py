@@ -0,0 +1,173 @@
+"""Unit tests for track_matcher_comp (indexed matching vs full scan)."""
+
+import random
+import string
+
+import pytest
+
+from nomarr.components.playlist_import.track_matcher_comp import (
+    LibraryTrack,
+    TrackCandidateIndex,
+    match_track,
+    match_tracks,
+    match_tracks_batched,
+)
+from nomarr.helpers.dto.playlist_import_dto import PlaylistTrackInput
+
+SYLLABLES = ("ka", "ri", "lo", "ne", "ta", "mi", "so", "ra", "vel", "dor", "an", "ex", "mo", "zu")
+WORDS = [a + b for a in SYLLABLES for b in SYLLABLES]
+FIRST_NAMES = WORDS[:16]
+LAST_NAMES = WORDS[-16:]
+BAND_WORDS = WORDS[90:100]
+
+
+def _artist(rng):
+    if rng.random() < 0.5:
+        return f"{rng.choice(FIRST_NAMES).title()} {rng.choice(LAST_NAMES).title()}"
+    return "The " + " ".join(word.title() for word in rng.sample(BAND_WORDS, rng.randint(1, 2)))
+
+
+def _title(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 5))).title()
+
+
+def _typo(rng, text, edits):
+    chars = list(text)
+    for _ in range(edits):
+        if not chars:
+            break
+        i = rng.randrange(len(chars))
+        roll = rng.random()
+        if roll < 0.33:
+            chars.pop(i)
+        elif roll < 0.66:
+            chars.insert(i, rng.choice(string.ascii_lowercase))
+        else:
+            chars[i] = rng.choice(string.ascii_lowercase)
+    return "".join(chars)
+
+
+def _golden_set(seed, library_size=1500, playlist_size=150):
+    """Library with covers/duplicates plus a playlist of edited, misspelled and unknown tracks."""
+    rng = random.Random(seed)
+    artists = [_artist(rng) for _ in range(library_size // 12)]
+    rows = []
+    for i in range(library_size):
+        title = rng.choice(rows)["title"] if rows and rng.random() < 0.05 else _title(rng)
+        rows.append(
+            {
+                "_id": f"library_files/{i}",
+                "path": f"/music/{i}.flac",
+                "title": title,
+                "artist": rng.choice(artists),
+                "album": None,
+                "isrc": f"US{i:010d}" if rng.random() < 0.3 else None,
+            }
+        )
+    playlist = []
+    for position in range(playlist_size):
+        if rng.random() < 0.15:
+            playlist.append(PlaylistTrackInput(title=_title(rng), artist=_artist(rng), position=position))
+            continue
+        source = rng.choice(rows)
+        title, artist = source["title"], source["artist"]
+        roll = rng.random()
+        if roll < 0.15:
+            title += " (Remastered 2011)"
+        elif roll < 0.3:
+            title += f" (feat. {_artist(rng)})"
+        elif roll < 0.55:
+            title = _typo(rng, title, rng.randint(1, 4))
+        elif roll < 0.65:
+            title = " ".join(rng.sample(title.split(), len(title.split())))
+        elif roll < 0.75:
+            title += f" {rng.choice(WORDS)}"
+        if rng.random() < 0.3:
+            artist = _typo(rng, artist, rng.randint(1, 3))
+        if rng.random() < 0.1:
+            artist = _artist(rng)
+        isrc = source["isrc"] if rng.random() < 0.2 else None
+        playlist.append(PlaylistTrackInput(title=title, artist=artist, isrc=isrc, position=position))
+    return [LibraryTrack.from_db_row(row) for row in rows], playlist
+
+
+def _track(i, title, artist, isrc=None):
+    return LibraryTrack.from_db_row(
+        {"_id": f"library_files/{i}", "path": f"/music/{i}.flac", "title": title, "artist": artist, "isrc": isrc}
+    )
+
+
+@pytest.mark.unit
+class TestIndexedMatching:
+    @pytest.mark.parametrize("seed", [0, 1, 2, 3])
+    def test_golden_set_decisions_match_full_scan(self, seed):
+        library, playlist = _golden_set(seed)
+
+        indexed = match_tracks(playlist, library)
+
+        assert indexed == [match_track(track, library) for track in playlist]
+
+    def test_golden_set_covers_every_status(self):
+        library, playlist = _golden_set(0)
+
+        statuses = {result.status for result in match_tracks(playlist, library)}
+
+        assert statuses == {"exact_isrc", "exact_metadata", "fuzzy", "ambiguous", "not_found"}
+
+    def test_exact_lookups_return_first_track_in_library_order(self):
+        library = [
+            _track(0, "Hero", "Kate Wilson", isrc="usabc"),
+            _track(1, "Hero", "Kate Wilson", isrc="USABC"),
+        ]
+        index = TrackCandidateIndex(library)
+
+        assert index.find_isrc("UsAbC") is library[0]
+        assert index.find_exact("hero", "kate wilson") is library[0]
+
+    def test_candidates_exclude_unreachable_tracks(self):
+        library = [_track(0, "Hero", "Kate Wilson"), _track(1, "Quixotic Jazz", "Zz Top"), _track(2, "Heros", "")]
+        index = TrackCandidateIndex(library)
+
+        candidates = index.fuzzy_candidates("hero", "kate wilsen")
+
+        assert candidates == [library[0]]
+
+    def test_empty_strings_stay_candidates(self):
+        library = [_track(0, "", ""), _track(1, "Hero", "Kate Wilson")]
+
+        assert TrackCandidateIndex(library).fuzzy_candidates("", "") == [library[0]]
+
+
+@pytest.mark.unit
+class TestBatchedMatching:
+    @pytest.mark.parametrize("blocked", [True, False])
+    @pytest.mark.parametrize("seed", [4, 5])
+    def test_results_are_byte_identical_to_per_track_matching(self, seed, blocked):
+        library, playlist = _golden_set(seed)
+
+        results, _timings = match_tracks_batched(playlist, library, blocked=blocked)
+
+        expected = [match_track(track, library) for track in playlist]
+        assert results == expected
+        assert [repr(result) for result in results] == [repr(result) for result in expected]
+
+    def test_timings_count_fuzzy_work(self):
+        library = [_track(0, "Hero", "Kate Wilson", isrc="USABC"), _track(1, "Heroes", "Kate Wilson")]
+        playlist = [
+            PlaylistTrackInput(title="Anything", artist="Anyone", isrc="USABC"),
+            PlaylistTrackInput(title="Hero", artist="Kate Wilson", position=1),
+            PlaylistTrackInput(title="Heroe", artist="Kate Wilson", position=2),
+        ]
+
+        results, timings = match_tracks_batched(playlist, library)
+
+        assert [result.status for result in results] == ["exact_isrc", "exact_metadata", "ambiguous"]
+        assert timings.fuzzy_tracks == 1
+        assert timings.scored_pairs == 2
+        assert timings.total_ms >= timings.index_ms + timings.exact_ms + timings.fuzzy_ms - 1
+
+    def test_empty_library(self):
+        results, timings = match_tracks_batched([PlaylistTrackInput(title="Hero", artist="Kate Wilson")], [])
+
+        assert results[0].status == "not_found"
+        assert timings.scored_pairs == 0
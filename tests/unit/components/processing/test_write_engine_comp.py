@@ -0,0 +1,161 @@
+"""Unit tests for ``write_engine_comp`` bounded parallel writes."""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+from nomarr.components.processing.write_engine_comp import (
+    DEFAULT_DEVICE_KEY,
+    DeviceKeyResolver,
+    ParallelWriteEngine,
+    WriteEngineProgress,
+)
+
+
+class _ConcurrencyProbe:
+    """Write function that records peak concurrency overall and per device."""
+
+    def __init__(self, hold: threading.Event | None = None) -> None:
+        self.lock = threading.Lock()
+        self.active: dict[str, int] = defaultdict(int)
+        self.peak: dict[str, int] = defaultdict(int)
+        self.total = 0
+        self.peak_total = 0
+        self.hold = hold
+
+    def __call__(self, item: tuple[str, int]) -> int:
+        device, value = item
+        with self.lock:
+            self.active[device] += 1
+            self.total += 1
+            self.peak[device] = max(self.peak[device], self.active[device])
+            self.peak_total = max(self.peak_total, self.total)
+        if self.hold is not None:
+            self.hold.wait(0.02)
+        with self.lock:
+            self.active[device] -= 1
+            self.total -= 1
+        return value * 2
+
+
+@pytest.mark.unit
+class TestParallelWriteEngine:
+    """Tests for ``ParallelWriteEngine.run``."""
+
+    def test_writes_every_item(self) -> None:
+        engine = ParallelWriteEngine(max_workers=3, per_device_limit=2)
+        items = [("a", i) for i in range(20)]
+
+        outcomes = engine.run(items, lambda item: item[1] * 2, lambda item: item[0])
+
+        assert sorted(o.result for o in outcomes if o.result is not None) == [i * 2 for i in range(20)]
+        assert all(o.error is None for o in outcomes)
+
+    def test_respects_global_and_per_device_limits(self) -> None:
+        probe = _ConcurrencyProbe(hold=threading.Event())
+        engine = ParallelWriteEngine(max_workers=4, per_device_limit=2)
+        items = [(device, i) for i in range(12) for device in ("sda", "sdb", "nvme")]
+
+        engine.run(items, probe, lambda item: item[0])
+
+        assert probe.peak_total <= 4
+        assert max(probe.peak.values()) <= 2
+        # Several devices were written concurrently, not one after another
+        assert probe.peak_total > 2
+
+    def test_single_device_is_capped(self) -> None:
+        probe = _ConcurrencyProbe(hold=threading.Event())
+        engine = ParallelWriteEngine(max_workers=8, per_device_limit=1)
+
+        engine.run([("hdd", i) for i in range(6)], probe, lambda item: item[0])
+
+        assert probe.peak["hdd"] == 1
+
+    def test_backpressure_bounds_items_pulled_ahead(self) -> None:
+        pulled = 0
+        max_ahead = 0
+        done = 0
+        lock = threading.Lock()
+
+        def source():
+            nonlocal pulled, max_ahead
+            for i in range(50):
+                with lock:
+                    pulled += 1
+                    max_ahead = max(max_ahead, pulled - done)
+                yield ("a", i)
+
+        def write(item: tuple[str, int]) -> int:
+            nonlocal done
+            with lock:
+                done += 1
+            return item[1]
+
+        engine = ParallelWriteEngine(max_workers=2, per_device_limit=2, max_pending=5)
+        outcomes = engine.run(source(), write, lambda item: item[0])
+
+        assert len(outcomes) == 50
+        assert max_ahead <= 5
+
+    def test_zero_latency_writes_do_not_stall(self) -> None:
+        """Futures finishing before the engine waits on them must not hang it."""
+        engine = ParallelWriteEngine(max_workers=1, per_device_limit=1, max_pending=1)
+        result: list[int] = []
+
+        runner = threading.Thread(
+            target=lambda: result.extend(o.result for o in engine.run(range(200), lambda x: x, lambda _: "d")),
+            daemon=True,
+        )
+        runner.start()
+        runner.join(timeout=10)
+
+        assert not runner.is_alive()
+        assert sorted(result) == list(range(200))
+
+    def test_errors_are_captured_per_item(self) -> None:
+        def write(item: tuple[str, int]) -> int:
+            if item[1] == 3:
+                raise OSError("disk full")
+            return item[1]
+
+        engine = ParallelWriteEngine(max_workers=2)
+        outcomes = engine.run([("a", i) for i in range(5)], write, lambda item: item[0])
+
+        failed = [o for o in outcomes if o.error is not None]
+        assert [o.item for o in failed] == [("a", 3)]
+        assert isinstance(failed[0].error, OSError)
+        assert len(outcomes) == 5
+
+    def test_progress_reported_per_completion(self) -> None:
+        snapshots: list[WriteEngineProgress] = []
+        engine = ParallelWriteEngine(max_workers=2, on_progress=snapshots.append)
+
+        engine.run([("a", 1), ("b", 2), ("b", 3)], lambda item: item[1], lambda item: item[0])
+
+        assert len(snapshots) == 3
+        final = max(snapshots, key=lambda p: p.completed)
+        assert final.completed == 3
+        assert final.per_device_completed == {"a": 1, "b": 2}
+
+    def test_rejects_invalid_limits(self) -> None:
+        with pytest.raises(ValueError, match="must be >= 1"):
+            ParallelWriteEngine(max_workers=0)
+
+
+@pytest.mark.unit
+class TestDeviceKeyResolver:
+    """Tests for ``DeviceKeyResolver``."""
+
+    def test_same_filesystem_shares_key(self, tmp_path: Path) -> None:
+        (tmp_path / "x").mkdir()
+        resolver = DeviceKeyResolver()
+
+        assert resolver(tmp_path / "a.flac") == resolver(tmp_path / "x" / "b.flac")
+        assert resolver(tmp_path / "a.flac").startswith("dev:")
+
+    def test_missing_directory_uses_default(self, tmp_path: Path) -> None:
+        assert DeviceKeyResolver()(tmp_path / "missing" / "a.flac") == DEFAULT_DEVICE_KEY
@@ -1,11 +1,20 @@
 """Tests for safe_write_comp - atomic tag writing with audio sanity verification."""
 
+import os
+import subprocess
+import sys
+import textwrap
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
+from nomarr.components.tagging import safe_write_comp
 from nomarr.components.tagging.safe_write_comp import (
+    FsCapabilities,
     SafeWriteResult,
     _AudioProperties,
+    get_fs_capabilities,
     safe_write_tags,
 )
 from nomarr.helpers.dto.path_dto import LibraryPath
@@ -130,3 +139,209 @@ class TestSafeWriteResult:
         result = SafeWriteResult(success=False, error="Something went wrong")
         assert result.success is False
         assert result.error == "Something went wrong"
+
+
+def _library_file(tmp_path: Path, content: bytes = b"original audio") -> LibraryPath:
+    album = tmp_path / "album"
+    album.mkdir(exist_ok=True)
+    test_file = album / "track.flac"
+    test_file.write_bytes(content)
+    return LibraryPath(relative="album/track.flac", absolute=test_file, library_id="test_lib", status="valid")
+
+
+def _append_tag(temp_path: Path) -> None:
+    with open(temp_path, "ab") as f:
+        f.write(b"+tags")
+
+
+def _mtime_ms(path: Path) -> int:
+    return int(path.stat().st_mtime * 1000)
+
+
+class TestFsCapabilityCache:
+    """Filesystem capabilities are probed once per library root."""
+
+    def test_probed_once_per_root(self, tmp_path: Path) -> None:
+        """Repeated writes under one root reuse the cached probe."""
+        library_path = _library_file(tmp_path)
+
+        with (
+            patch(f"{safe_write_comp.__name__}._probe_audio_properties", return_value=_GOOD_PROPS),
+            patch(f"{safe_write_comp.__name__}._supports_hardlinks", return_value=True) as hardlinks,
+            patch(f"{safe_write_comp.__name__}._supports_reflinks", return_value=False) as reflinks,
+        ):
+            for _ in range(3):
+                result = safe_write_tags(library_path, tmp_path, _append_tag, _mtime_ms(library_path.absolute))
+                assert result.success is True
+
+        assert hardlinks.call_count == 1
+        assert reflinks.call_count == 1
+
+    def test_probe_leaves_no_artifacts(self, tmp_path: Path) -> None:
+        """Capability probes clean up their test files."""
+        temp_folder = tmp_path / ".ignore"
+        temp_folder.mkdir()
+
+        caps = get_fs_capabilities(tmp_path, tmp_path, temp_folder)
+
+        assert caps.hardlink is True
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".ignore"]
+        assert list(temp_folder.iterdir()) == []
+
+
+class TestLowCopyClone:
+    """Temp copies use reflinks when available and fall back to a full copy."""
+
+    def test_reflink_avoids_data_copy(self, tmp_path: Path) -> None:
+        """A successful reflink reports zero bytes copied."""
+        library_path = _library_file(tmp_path, b"x" * 1000)
+
+        def fake_reflink(source: Path, dest: Path) -> bool:
+            dest.write_bytes(source.read_bytes())
+            return True
+
+        with (
+            patch(f"{safe_write_comp.__name__}._probe_audio_properties", return_value=_GOOD_PROPS),
+            patch(
+                f"{safe_write_comp.__name__}.get_fs_capabilities",
+                return_value=FsCapabilities(hardlink=True, reflink=True),
+            ),
+            patch(f"{safe_write_comp.__name__}._reflink_file", side_effect=fake_reflink) as reflink,
+        ):
+            result = safe_write_tags(library_path, tmp_path, _append_tag, _mtime_ms(library_path.absolute))
+
+        assert result.success is True
+        assert result.bytes_copied == 0
+        reflink.assert_called_once()
+        assert library_path.absolute.read_bytes() == b"x" * 1000 + b"+tags"
+
+    def test_failed_reflink_falls_back_to_copy(self, tmp_path: Path) -> None:
+        """If the clone fails at write time the file is copied in full."""
+        library_path = _library_file(tmp_path, b"x" * 1000)
+
+        with (
+            patch(f"{safe_write_comp.__name__}._probe_audio_properties", return_value=_GOOD_PROPS),
+            patch(
+                f"{safe_write_comp.__name__}.get_fs_capabilities",
+                return_value=FsCapabilities(hardlink=False, reflink=True),
+            ),
+            patch(f"{safe_write_comp.__name__}._reflink_file", return_value=False),
+        ):
+            result = safe_write_tags(library_path, tmp_path, _append_tag, _mtime_ms(library_path.absolute))
+
+        assert result.success is True
+        assert result.bytes_copied == 1000
+        assert library_path.absolute.read_bytes() == b"x" * 1000 + b"+tags"
+
+
+class TestCrashConsistency:
+    """The original is intact or fully replaced after any failure or crash."""
+
+    @pytest.mark.parametrize("hardlink", [True, False])
+    def test_write_fn_failure_keeps_original(self, tmp_path: Path, hardlink: bool) -> None:
+        """A tagger exception leaves the original untouched and no temp files."""
+        library_path = _library_file(tmp_path)
+
+        def failing_write(temp_path: Path) -> None:
+            temp_path.write_bytes(b"half-written")
+            raise OSError("disk full")
+
+        with (
+            patch(f"{safe_write_comp.__name__}._probe_audio_properties", return_value=_GOOD_PROPS),
+            patch(
+                f"{safe_write_comp.__name__}.get_fs_capabilities",
+                return_value=FsCapabilities(hardlink=hardlink, reflink=False),
+            ),
+        ):
+            result = safe_write_tags(library_path, tmp_path, failing_write, _mtime_ms(library_path.absolute))
+
+        assert result.success is False
+        assert library_path.absolute.read_bytes() == b"original audio"
+        assert sorted(p.name for p in library_path.absolute.parent.iterdir()) == ["track.flac"]
+        assert list((tmp_path / ".ignore").iterdir()) == []
+
+    def test_link_failure_restores_backup(self, tmp_path: Path) -> None:
+        """If the hardlink swap fails after renaming, the backup is restored."""
+        library_path = _library_file(tmp_path)
+
+        with (
+            patch(f"{safe_write_comp.__name__}._probe_audio_properties", return_value=_GOOD_PROPS),
+            patch(
+                f"{safe_write_comp.__name__}.get_fs_capabilities",
+                return_value=FsCapabilities(hardlink=True, reflink=False),
+            ),
+            patch(f"{safe_write_comp.__name__}.os.link", side_effect=OSError("EXDEV")),
+        ):
+            result = safe_write_tags(library_path, tmp_path, _append_tag, _mtime_ms(library_path.absolute))
+
+        assert result.success is False
+        assert library_path.absolute.read_bytes() == b"original audio"
+
+    @pytest.mark.parametrize(
+        ("hardlink", "crash_on", "expected"),
+        [
+            (True, "write", b"original audio"),
+            (True, "link", b"original audio"),
+            (False, "write", b"original audio"),
+            (False, "rename", b"original audio+tags"),
+        ],
+    )
+    def test_process_crash_is_recovered_on_next_write(
+        self, tmp_path: Path, hardlink: bool, crash_on: str, expected: bytes
+    ) -> None:
+        """A process killed mid-write leaves a state the next write repairs."""
+        library_path = _library_file(tmp_path)
+        script = textwrap.dedent(
+            f"""
+            import contextlib
+            import os
+            from pathlib import Path
+            from unittest.mock import patch
+
+            from nomarr.components.tagging import safe_write_comp as sw
+            from nomarr.helpers.dto.path_dto import LibraryPath
+
+            target = Path({str(library_path.absolute)!r})
+            root = Path({str(tmp_path)!r})
+            props = sw._AudioProperties(duration=1.0, sample_rate=44100, channels=2)
+
+            def die(*_args, **_kwargs):
+                os._exit(17)
+
+            def write_fn(temp_path):
+                with open(temp_path, "ab") as f:
+                    f.write(b"+tags")
+                if {crash_on!r} == "write":
+                    die()
+
+            with contextlib.ExitStack() as stack:
+                stack.enter_context(patch.object(sw, "_probe_audio_properties", return_value=props))
+                caps = sw.FsCapabilities(hardlink={hardlink}, reflink=False)
+                stack.enter_context(patch.object(sw, "get_fs_capabilities", return_value=caps))
+                if {crash_on!r} in ("link", "rename"):
+                    stack.enter_context(patch.object(sw.os, {crash_on!r}, die))
+                path = LibraryPath("album/track.flac", target, "test_lib", "valid")
+                sw.safe_write_tags(path, root, write_fn, int(target.stat().st_mtime * 1000))
+            """
+        )
+        env = {**os.environ, "PYTHONPATH": str(Path(safe_write_comp.__file__).parents[3])}
+        proc = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, check=False)
+        assert proc.returncode == 17, proc.stderr.decode()
+
+        safe_write_comp._recover_interrupted_replace(library_path.absolute)
+
+        assert library_path.absolute.read_bytes() == expected
+        assert sorted(p.name for p in library_path.absolute.parent.iterdir()) == ["track.flac"]
+
+    def test_write_recovers_missing_original_from_backup(self, tmp_path: Path) -> None:
+        """safe_write_tags restores a crash-time ``.bak`` before writing."""
+        library_path = _library_file(tmp_path)
+        mtime_ms = _mtime_ms(library_path.absolute)
+        os.rename(library_path.absolute, library_path.absolute.with_suffix(".flac.bak"))
+
+        with patch(f"{safe_write_comp.__name__}._probe_audio_properties", return_value=_GOOD_PROPS):
+            result = safe_write_tags(library_path, tmp_path, _append_tag, mtime_ms)
+
+        assert result.success is True
+        assert library_path.absolute.read_bytes() == b"original audio+tags"
+        assert sorted(p.name for p in library_path.absolute.parent.iterdir()) == ["track.flac"]
@@ -0,0 +1,118 @@
+"""Unit tests for nomarr.helpers.metrics_helper."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from nomarr.helpers.metrics_helper import MetricSpec, MetricsRegistry, merge_snapshots, render_exposition
+
+SPECS = (
+    MetricSpec("stage_seconds", "histogram", "Stage time.", (0.1, 1.0)),
+    MetricSpec("files_total", "counter", "Files."),
+    MetricSpec("queue_depth", "gauge", "Queue."),
+)
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry(SPECS)
+
+
+class TestMetricsRegistry:
+    """Tests for recording and snapshots."""
+
+    @pytest.mark.unit
+    def test_histogram_buckets_use_le_semantics(self, registry: MetricsRegistry) -> None:
+        for value in (0.05, 0.1, 0.5, 3.0):
+            registry.observe("stage_seconds", value, {"stage": "decode"})
+
+        [(labels, counts, total)] = registry.snapshot()["histogram"]["stage_seconds"]
+        assert labels == {"stage": "decode"}
+        assert counts == [2, 1, 1]  # <= 0.1, <= 1.0, overflow
+        assert total == pytest.approx(3.65)
+
+    @pytest.mark.unit
+    def test_counters_and_gauges(self, registry: MetricsRegistry) -> None:
+        registry.inc("files_total", labels={"outcome": "tagged"})
+        registry.inc("files_total", 2, {"outcome": "tagged"})
+        registry.set("queue_depth", 5)
+        registry.set("queue_depth", 4)
+
+        snapshot = registry.snapshot()
+        assert snapshot["counter"]["files_total"] == [[{"outcome": "tagged"}, 3.0]]
+        assert snapshot["gauge"]["queue_depth"] == [[{}, 4.0]]
+
+    @pytest.mark.unit
+    def test_snapshot_is_json_and_detached(self, registry: MetricsRegistry) -> None:
+        registry.observe("stage_seconds", 0.2)
+        snapshot = registry.snapshot()
+        registry.observe("stage_seconds", 0.2)
+
+        assert json.loads(json.dumps(snapshot)) == snapshot
+        assert sum(snapshot["histogram"]["stage_seconds"][0][1]) == 1
+
+    @pytest.mark.unit
+    def test_rejects_unknown_or_mismatched_metric(self, registry: MetricsRegistry) -> None:
+        with pytest.raises(KeyError):
+            registry.inc("missing_total")
+        with pytest.raises(KeyError):
+            registry.observe("files_total", 1.0)
+
+
+class TestMergeSnapshots:
+    """Tests for merge_snapshots."""
+
+    @pytest.mark.unit
+    def test_extra_labels_keep_sources_apart(self, registry: MetricsRegistry) -> None:
+        registry.inc("files_total", labels={"outcome": "tagged"})
+        other = MetricsRegistry(SPECS)
+        other.inc("files_total", 4, {"outcome": "tagged"})
+
+        merged = merge_snapshots([({"worker": "w0"}, registry.snapshot()), ({"worker": "w1"}, other.snapshot())])
+
+        assert merged["counter"]["files_total"] == [
+            [{"outcome": "tagged", "worker": "w0"}, 1.0],
+            [{"outcome": "tagged", "worker": "w1"}, 4.0],
+        ]
+
+
+class TestRenderExposition:
+    """Tests for the text exposition format."""
+
+    @pytest.mark.unit
+    def test_histogram_lines_are_cumulative(self, registry: MetricsRegistry) -> None:
+        registry.observe("stage_seconds", 0.05, {"stage": "decode"})
+        registry.observe("stage_seconds", 2.0, {"stage": "decode"})
+
+        text = render_exposition(SPECS[:1], registry.snapshot())
+
+        assert text.splitlines() == [
+            "# HELP stage_seconds Stage time.",
+            "# TYPE stage_seconds histogram",
+            'stage_seconds_bucket{le="0.1",stage="decode"} 1',
+            'stage_seconds_bucket{le="1.0",stage="decode"} 1',
+            'stage_seconds_bucket{le="+Inf",stage="decode"} 2',
+            'stage_seconds_sum{stage="decode"} 2.05',
+            'stage_seconds_count{stage="decode"} 2',
+        ]
+
+    @pytest.mark.unit
+    def test_empty_families_still_declared(self) -> None:
+        text = render_exposition(SPECS, MetricsRegistry(SPECS).snapshot())
+
+        assert "# TYPE files_total counter\n# HELP queue_depth Queue.\n# TYPE queue_depth gauge\n" in text
+        assert text.endswith("\n")
+
+    @pytest.mark.unit
+    def test_escapes_label_values(self, registry: MetricsRegistry) -> None:
+        registry.set("queue_depth", 1, {"queue": 'a"b\\c'})
+
+        assert 'queue_depth{queue="a\\"b\\\\c"} 1.0' in render_exposition(SPECS, registry.snapshot())
+
+    @pytest.mark.unit
+    def test_skips_histograms_with_other_bucket_layout(self) -> None:
+        snapshot = {"histogram": {"stage_seconds": [[{}, [1, 2], 0.5]]}}
+
+        assert "stage_seconds_count" not in render_exposition(SPECS, snapshot)
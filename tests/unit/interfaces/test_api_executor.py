@@ -0,0 +1,224 @@
+"""Tests for the API executor and the non-blocking behaviour it gives handlers."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from nomarr.helpers.dto.library_dto import LibraryStatsResult
+from nomarr.interfaces.api.auth import verify_session
+from nomarr.interfaces.api.executor import ApiExecutor, api_executor
+from nomarr.interfaces.api.web.dependencies import get_library_changes_service, get_library_service
+from nomarr.interfaces.api.web.library_if import router as library_router
+
+STATS = LibraryStatsResult(
+    total_files=10,
+    total_artists=2,
+    total_albums=3,
+    total_duration=600.0,
+    total_size=1000,
+    needs_tagging_count=0,
+)
+
+
+class Gate:
+    """Holds blocking calls in their worker thread until released."""
+
+    def __init__(self) -> None:
+        self.entered = threading.Semaphore(0)
+        self.release = threading.Event()
+
+    def block(self, result: object = None) -> object:
+        self.entered.release()
+        assert self.release.wait(5), "gate never released"
+        return result
+
+    async def wait_entered(self, count: int = 1) -> None:
+        for _ in range(count):
+            assert await asyncio.to_thread(self.entered.acquire, True, 5), "blocking call never started"
+
+
+@pytest.fixture
+def executor() -> Iterator[ApiExecutor]:
+    pool = ApiExecutor(max_workers=4, default_limit=2, limits={"slow": 1, "library.stats": 3})
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.unit
+class TestApiExecutor:
+    def test_limit_lookup(self, executor: ApiExecutor) -> None:
+        assert executor.limit_for("library.stats") == 3
+        assert executor.limit_for("slow.report") == 1  # domain prefix
+        assert executor.limit_for("library.list") == 2  # default
+
+    async def test_returns_result_and_records_call(self, executor: ApiExecutor) -> None:
+        assert await executor.run("add", lambda a, b=0: a + b, 1, b=2) == 3
+
+        stats = executor.stats()["add"]
+        assert (stats.calls, stats.errors, stats.waiting, stats.running) == (1, 0, 0, 0)
+
+    async def test_runs_off_the_event_loop_with_context(self, executor: ApiExecutor) -> None:
+        var: contextvars.ContextVar[str] = contextvars.ContextVar("var")
+        var.set("request-1")
+
+        thread, value = await executor.run("ctx", lambda: (threading.current_thread(), var.get()))
+
+        assert thread is not threading.current_thread()
+        assert thread.name.startswith("api-blocking")
+        assert value == "request-1"
+
+    async def test_exceptions_propagate_and_count_as_errors(self, executor: ApiExecutor) -> None:
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await executor.run("fail", fail)
+
+        assert executor.stats()["fail"].errors == 1
+
+    async def test_cap_queues_excess_calls(self, executor: ApiExecutor) -> None:
+        gate = Gate()
+        first = asyncio.create_task(executor.run("slow.report", gate.block, "a"))
+        await gate.wait_entered()
+        second = asyncio.create_task(executor.run("slow.report", gate.block, "b"))
+        await asyncio.sleep(0.1)
+
+        # The second call waits on the loop, not in a worker thread
+        stats = executor.stats()["slow.report"]
+        assert (stats.running, stats.waiting) == (1, 1)
+
+        gate.release.set()
+        assert await asyncio.gather(first, second) == ["a", "b"]
+        stats = executor.stats()["slow.report"]
+        assert (stats.calls, stats.running, stats.waiting) == (2, 0, 0)
+        assert stats.queue_ms_max >= 80
+        assert stats.run_ms_max >= 80
+
+    async def test_cancel_while_queued_never_runs(self, executor: ApiExecutor) -> None:
+        gate = Gate()
+        ran = threading.Event()
+        first = asyncio.create_task(executor.run("slow", gate.block))
+        await gate.wait_entered()
+        queued = asyncio.create_task(executor.run("slow", ran.set))
+        await asyncio.sleep(0.05)
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        gate.release.set()
+        await first
+
+        assert not ran.is_set()
+        stats = executor.stats()["slow"]
+        assert (stats.calls, stats.errors, stats.waiting, stats.running) == (2, 1, 0, 0)
+
+    async def test_reset_keeps_in_flight_endpoints(self, executor: ApiExecutor) -> None:
+        gate = Gate()
+        await executor.run("done", lambda: None)
+        busy = asyncio.create_task(executor.run("busy", gate.block))
+        await gate.wait_entered()
+
+        executor.reset_stats()
+
+        assert set(executor.stats()) == {"busy"}
+        gate.release.set()
+        await busy
+
+    async def test_usable_again_after_shutdown(self, executor: ApiExecutor) -> None:
+        assert await executor.run("add", lambda: 1) == 1
+        executor.shutdown()
+
+        assert await executor.run("add", lambda: 2) == 2
+        assert executor.stats()["add"].calls == 2
+
+
+@pytest.fixture
+def library_service() -> MagicMock:
+    service = MagicMock()
+    service.list_libraries.return_value = []
+    return service
+
+
+@pytest.fixture
+def app(library_service: MagicMock) -> Iterator[FastAPI]:
+    test_app = FastAPI()
+    test_app.include_router(library_router, prefix="/api/web")
+    test_app.dependency_overrides[verify_session] = lambda: None
+    test_app.dependency_overrides[get_library_service] = lambda: library_service
+    test_app.dependency_overrides[get_library_changes_service] = lambda: None  # every call reaches the service
+    api_executor.reset_stats()
+    yield test_app
+    test_app.dependency_overrides.clear()
+
+
+@pytest.mark.integration
+@pytest.mark.mocked
+class TestLoadIsolation:
+    async def test_unrelated_endpoints_keep_latency_during_slow_stats(
+        self, app: FastAPI, library_service: MagicMock
+    ) -> None:
+        gate = Gate()
+        library_service.get_library_stats.side_effect = lambda: gate.block(STATS)
+        limit = api_executor.limit_for("library.stats")
+        transport = httpx.ASGITransport(app=app)
+
+        async def timed_get(client: httpx.AsyncClient, path: str) -> tuple[int, float]:
+            start = time.perf_counter()
+            response = await client.get(path)
+            return response.status_code, time.perf_counter() - start
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            # One more stats call than the cap allows: `limit` run, one queues
+            stats_calls = [asyncio.create_task(client.get("/api/web/libraries/stats")) for _ in range(limit + 1)]
+            await gate.wait_entered(limit)
+
+            fast = await asyncio.wait_for(
+                asyncio.gather(*(timed_get(client, "/api/web/libraries") for _ in range(50))),
+                timeout=10,
+            )
+
+            # Every list call finished while all stats calls were still in flight
+            assert not any(task.done() for task in stats_calls)
+            assert all(status == 200 for status, _ in fast)
+            assert max(latency for _, latency in fast) < 1.0
+            in_flight = api_executor.stats()["library.stats"]
+            assert (in_flight.running, in_flight.waiting) == (limit, 1)
+
+            await asyncio.sleep(0.1)
+            gate.release.set()
+            await gate.wait_entered()  # the queued call starts once a slot frees up
+            responses = await asyncio.gather(*stats_calls)
+
+        assert all(response.json()["total_files"] == 10 for response in responses)
+        stats = api_executor.stats()
+        assert stats["library.stats"].calls == limit + 1
+        assert stats["library.stats"].queue_ms_max >= 80
+        assert stats["library.list"].calls == 50
+
+    def test_lifespan_can_be_entered_again(self, library_service: MagicMock) -> None:
+        """The shared executor is shut down on every lifespan exit, as api_app's lifespan does."""
+
+        @asynccontextmanager
+        async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+            yield
+            api_executor.shutdown()
+
+        test_app = FastAPI(lifespan=lifespan)
+        test_app.include_router(library_router, prefix="/api/web")
+        test_app.dependency_overrides[verify_session] = lambda: None
+        test_app.dependency_overrides[get_library_service] = lambda: library_service
+
+        for _ in range(2):
+            with TestClient(test_app) as client:
+                assert client.get("/api/web/libraries").status_code == 200
@@ -0,0 +1,202 @@
+"""Tests for conditional-request caching of read-heavy web endpoints."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from nomarr.helpers.dto.library_dto import LibraryStatsResult
+from nomarr.interfaces.api import response_cache as response_cache_module
+from nomarr.interfaces.api.auth import verify_session
+from nomarr.interfaces.api.response_cache import CachedResponse, cached, refresh_after_write, response_cache
+from nomarr.interfaces.api.web.dependencies import get_library_changes_service, get_library_service
+from nomarr.interfaces.api.web.info_if import router as info_router
+from nomarr.interfaces.api.web.library_if import router as library_router
+
+STATS = LibraryStatsResult(
+    total_files=10,
+    total_artists=2,
+    total_albums=3,
+    total_duration=600.0,
+    total_size=1000,
+    needs_tagging_count=0,
+)
+
+
+class FakeChanges:
+    """Stands in for LibraryChangesService with settable versions."""
+
+    def __init__(self) -> None:
+        self.versions: dict[str | None, str | None] = {None: "1.0"}
+        self.requested: list[str | None] = []
+        self.refresh = MagicMock(return_value=True)
+
+    def version(self, library_id: str | None = None) -> str | None:
+        self.requested.append(library_id)
+        return self.versions.get(library_id, "1.0")
+
+
+@pytest.fixture
+def changes() -> FakeChanges:
+    return FakeChanges()
+
+
+@pytest.fixture
+def library_service() -> MagicMock:
+    service = MagicMock()
+    service.get_library_stats.return_value = STATS
+    return service
+
+
+@pytest.fixture
+def client(changes: FakeChanges, library_service: MagicMock) -> Iterator[TestClient]:
+    app = FastAPI()
+    app.include_router(library_router, prefix="/api/web")
+    app.include_router(info_router, prefix="/api/web")
+
+    @app.get("/api/web/items")
+    async def items(library_id: str | None = None, cache: CachedResponse = Depends(cached("test.items"))) -> dict:
+        if cache.hit:
+            return cache.payload
+        library_service.list_items(library_id)
+        return cache.store({"library_id": library_id})
+
+    app.dependency_overrides[verify_session] = lambda: None
+    app.dependency_overrides[get_library_service] = lambda: library_service
+    app.dependency_overrides[get_library_changes_service] = lambda: changes
+    response_cache.clear()
+    yield TestClient(app)
+    response_cache.clear()
+
+
+@pytest.mark.integration
+@pytest.mark.mocked
+class TestConditionalRequests:
+    def test_repeat_poll_is_served_from_cache(self, client: TestClient, library_service: MagicMock) -> None:
+        first = client.get("/api/web/libraries/stats")
+        second = client.get("/api/web/libraries/stats")
+
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert first.json()["total_files"] == 10
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.headers["etag"].startswith('W/"')
+        assert library_service.get_library_stats.call_count == 1
+        stats = response_cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+    def test_matching_if_none_match_returns_304(self, client: TestClient, library_service: MagicMock) -> None:
+        etag = client.get("/api/web/libraries/stats").headers["etag"]
+
+        response = client.get("/api/web/libraries/stats", headers={"If-None-Match": f'W/"other", {etag}'})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert library_service.get_library_stats.call_count == 1
+        assert response_cache.stats().not_modified == 1
+
+    def test_version_change_invalidates(
+        self, client: TestClient, changes: FakeChanges, library_service: MagicMock
+    ) -> None:
+        etag = client.get("/api/web/libraries/stats").headers["etag"]
+        changes.versions[None] = "1.1"
+
+        response = client.get("/api/web/libraries/stats", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert library_service.get_library_stats.call_count == 2
+        stats = response_cache.stats()
+        assert (stats.invalidations, stats.misses, stats.entries) == (1, 2, 1)
+
+    def test_library_scoped_requests_follow_that_library(
+        self, client: TestClient, changes: FakeChanges, library_service: MagicMock
+    ) -> None:
+        client.get("/api/web/items", params={"library_id": "libraries:123"})
+        client.get("/api/web/items", params={"library_id": "libraries:456"})
+        changes.versions["libraries/456"] = "1.1"
+        client.get("/api/web/items", params={"library_id": "libraries:123"})
+        client.get("/api/web/items", params={"library_id": "libraries:456"})
+
+        assert changes.requested == ["libraries/123", "libraries/456"] * 2
+        assert [c.args for c in library_service.list_items.call_args_list] == [
+            ("libraries:123",),
+            ("libraries:456",),
+            ("libraries:456",),
+        ]
+
+    def test_unavailable_versions_bypass_the_cache(
+        self, client: TestClient, changes: FakeChanges, library_service: MagicMock
+    ) -> None:
+        changes.versions[None] = None
+
+        responses = [client.get("/api/web/libraries/stats") for _ in range(2)]
+
+        assert all(r.status_code == 200 and "etag" not in r.headers for r in responses)
+        assert library_service.get_library_stats.call_count == 2
+        stats = response_cache.stats()
+        assert (stats.bypassed, stats.hits, stats.entries) == (2, 0, 0)
+
+    def test_stats_endpoint(self, client: TestClient) -> None:
+        etag = client.get("/api/web/libraries/stats").headers["etag"]
+        client.get("/api/web/libraries/stats")
+        client.get("/api/web/libraries/stats", headers={"If-None-Match": etag})
+
+        body = client.get("/api/web/response-cache-stats").json()
+
+        assert body["hits"] == body["not_modified"] == body["misses"] == 1
+        assert body["hit_ratio"] == pytest.approx(0.667)
+
+
+@pytest.mark.unit
+def test_lru_eviction() -> None:
+    cache = response_cache_module.ResponseCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, "etag", key)
+
+    assert cache.stats().entries == 2
+    assert set(cache._entries) == {"b", "c"}
+
+
+@pytest.mark.integration
+@pytest.mark.mocked
+class TestRefreshAfterWrite:
+    @pytest.fixture
+    def app(self, changes: FakeChanges, monkeypatch: pytest.MonkeyPatch) -> FastAPI:
+        monkeypatch.setattr(response_cache_module, "get_library_changes_service", lambda: changes)
+        app = FastAPI()
+        app.middleware("http")(refresh_after_write)
+
+        @app.post("/api/web/write")
+        async def write() -> dict:
+            return {}
+
+        @app.post("/api/web/fail", status_code=400)
+        async def fail() -> dict:
+            return {}
+
+        @app.get("/api/web/read")
+        async def read() -> dict:
+            return {}
+
+        @app.post("/api/v1/write")
+        async def integration_write() -> dict:
+            return {}
+
+        return app
+
+    def test_successful_web_writes_refresh_versions(self, app: FastAPI, changes: FakeChanges) -> None:
+        client = TestClient(app)
+
+        client.post("/api/web/write")
+        assert changes.refresh.call_count == 1
+
+        client.post("/api/web/fail")
+        client.get("/api/web/read")
+        client.post("/api/v1/write")
+        assert changes.refresh.call_count == 1
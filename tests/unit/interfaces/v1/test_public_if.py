@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from nomarr.interfaces.api.auth import verify_key
+from nomarr.interfaces.api.v1.public_if import router as public_router
+from nomarr.interfaces.api.web.dependencies import get_info_service
+
+
+@pytest.fixture
+def mock_info_service() -> MagicMock:
+    service = MagicMock()
+    service.get_pipeline_metrics.return_value = "# TYPE nomarr_vram_promises gauge\nnomarr_vram_promises 2.0\n"
+    return service
+
+
+@pytest.fixture
+def app(mock_info_service: MagicMock) -> Iterator[FastAPI]:
+    test_app = FastAPI()
+    test_app.include_router(public_router, prefix="/api")
+
+    async def allow_key() -> None:
+        return None
+
+    test_app.dependency_overrides[verify_key] = allow_key
+    test_app.dependency_overrides[get_info_service] = lambda: mock_info_service
+
+    yield test_app
+
+    test_app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client(app: FastAPI) -> Iterator[TestClient]:
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.mark.integration
+@pytest.mark.mocked
+class TestMetricsEndpoint:
+    def test_serves_exposition_text(self, client: TestClient) -> None:
+        response = client.get("/api/v1/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
+        assert response.text == "# TYPE nomarr_vram_promises gauge\nnomarr_vram_promises 2.0\n"
+
+    def test_requires_api_key(self, app: FastAPI, client: TestClient) -> None:
+        async def reject_key() -> None:
+            raise HTTPException(status_code=401, detail="invalid api key")
+
+        app.dependency_overrides[verify_key] = reject_key
+
+        assert client.get("/api/v1/metrics").status_code == 401
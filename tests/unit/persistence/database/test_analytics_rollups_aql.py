@@ -0,0 +1,264 @@
+"""Unit tests for AnalyticsRollupsOperations (analytics_rollups_aql.py)."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from nomarr.persistence.database.analytics_rollups_aql import (
+    AnalyticsRollupsOperations,
+    _file_sections,
+)
+
+
+def _cursor(rows):
+    cursor = MagicMock()
+    cursor.__iter__.return_value = iter(rows)
+    return cursor
+
+
+@pytest.fixture
+def mock_db():
+    """Provide mock ArangoDB."""
+    db = MagicMock()
+    db.name = "test_db"
+    return db
+
+
+@pytest.fixture
+def ops(mock_db):
+    """Provide AnalyticsRollupsOperations instance."""
+    return AnalyticsRollupsOperations(mock_db)
+
+
+def _queries(mock_db):
+    return [(c.args[0], c.kwargs.get("bind_vars", {})) for c in mock_db.aql.execute.call_args_list]
+
+
+@pytest.mark.unit
+class TestFileSections:
+    """Test the per-file contribution."""
+
+    def test_totals_years_and_genres(self):
+        sections = _file_sections(200.5, 4096, [["year", 1999], ["genre", "Rock"], ["genre", "Pop"]])
+
+        assert sections["totals"] == {"files": 1, "duration_s": 200.5, "size": 4096}
+        assert sections["year"] == {json.dumps(1999): 1}
+        assert sections["genre"] == {json.dumps("Rock"): 1, json.dumps("Pop"): 1}
+
+    def test_missing_duration_and_size_are_omitted(self):
+        assert _file_sections(None, None, []) == {"totals": {"files": 1}}
+
+    def test_mood_balance_splits_tuple_values(self):
+        sections = _file_sections(1.0, 1, [["nom:mood-strict", "('happy', 'party-like')"]])
+
+        assert sections["totals"]["tagged:strict"] == 1
+        assert sections["mood:strict"] == {json.dumps("happy"): 1, json.dumps("party-like"): 1}
+
+    def test_pairs_are_cumulative_across_tiers(self):
+        sections = _file_sections(
+            1.0,
+            1,
+            [["nom:mood-strict", "happy"], ["nom:mood-regular", "calm"], ["nom:mood-loose", "dark"]],
+        )
+
+        assert "pairs:strict" not in sections
+        assert sections["pairs:regular"] == {json.dumps(["calm", "happy"]): 1}
+        assert set(sections["pairs:loose"]) == {
+            json.dumps(["calm", "dark"]),
+            json.dumps(["calm", "happy"]),
+            json.dumps(["dark", "happy"]),
+        }
+
+    def test_duplicate_mood_across_tiers_counts_once_per_pair(self):
+        sections = _file_sections(
+            1.0,
+            1,
+            [["nom:mood-strict", "happy"], ["nom:mood-regular", "happy"], ["nom:mood-regular", "calm"]],
+        )
+
+        assert sections["pairs:regular"] == {json.dumps(["calm", "happy"]): 1}
+
+
+@pytest.mark.unit
+class TestRefreshFiles:
+    """Test refresh_files() delta computation."""
+
+    def test_new_file_adds_contribution_and_delta(self, ops, mock_db):
+        mock_db.aql.execute.side_effect = [
+            _cursor(
+                [
+                    {
+                        "file_id": "library_files/f1",
+                        "library_id": "libraries/L1",
+                        "duration_s": 10.0,
+                        "size": 100,
+                        "tags": [["genre", "Rock"]],
+                        "stored": None,
+                    }
+                ]
+            ),
+            None,
+            None,
+        ]
+
+        ops.refresh_files(["library_files/f1"])
+
+        queries = _queries(mock_db)
+        assert len(queries) == 3
+        contributions = queries[1][1]["docs"]
+        assert contributions == [
+            {
+                "_key": "f1",
+                "library_id": "libraries/L1",
+                "sections": {"totals": {"files": 1, "duration_s": 10.0, "size": 100}, "genre": {'"Rock"': 1}},
+            }
+        ]
+        deltas = queries[2][1]["deltas"]
+        assert deltas == [
+            {"key": "L1", "sections": {"totals": {"files": 1, "duration_s": 10.0, "size": 100}, "genre": {'"Rock"': 1}}}
+        ]
+        assert "exclusive: true" in queries[2][0]
+
+    def test_changed_tags_apply_only_the_difference(self, ops, mock_db):
+        stored_sections = {"totals": {"files": 1, "size": 100}, "genre": {'"Rock"': 1}}
+        mock_db.aql.execute.side_effect = [
+            _cursor(
+                [
+                    {
+                        "file_id": "library_files/f1",
+                        "library_id": "libraries/L1",
+                        "duration_s": None,
+                        "size": 100,
+                        "tags": [["genre", "Jazz"]],
+                        "stored": {"library_id": "libraries/L1", "sections": stored_sections},
+                    }
+                ]
+            ),
+            None,
+            None,
+        ]
+
+        ops.refresh_files(["library_files/f1"])
+
+        deltas = _queries(mock_db)[2][1]["deltas"]
+        assert deltas == [{"key": "L1", "sections": {"genre": {'"Rock"': -1, '"Jazz"': 1}}}]
+
+    def test_unchanged_contribution_skips_writes(self, ops, mock_db):
+        sections = _file_sections(None, 100, [["genre", "Rock"]])
+        mock_db.aql.execute.return_value = _cursor(
+            [
+                {
+                    "file_id": "library_files/f1",
+                    "library_id": "libraries/L1",
+                    "duration_s": None,
+                    "size": 100,
+                    "tags": [["genre", "Rock"]],
+                    "stored": {"library_id": "libraries/L1", "sections": json.loads(json.dumps(sections))},
+                }
+            ]
+        )
+
+        ops.refresh_files(["library_files/f1"])
+
+        assert mock_db.aql.execute.call_count == 1
+
+    def test_file_without_library_withdraws_contribution(self, ops, mock_db):
+        stored_sections = {"totals": {"files": 1, "size": 100}}
+        mock_db.aql.execute.side_effect = [
+            _cursor(
+                [
+                    {
+                        "file_id": "library_files/f1",
+                        "library_id": None,
+                        "duration_s": None,
+                        "size": None,
+                        "tags": [],
+                        "stored": {"library_id": "libraries/L1", "sections": stored_sections},
+                    }
+                ]
+            ),
+            None,
+            None,
+        ]
+
+        ops.refresh_files(["library_files/f1"])
+
+        queries = _queries(mock_db)
+        assert queries[1][1] == {"keys": ["f1"]}
+        assert queries[2][1]["deltas"] == [{"key": "L1", "sections": {"totals": {"files": -1, "size": -100}}}]
+
+    def test_empty_input_skips_query(self, ops, mock_db):
+        ops.refresh_files([])
+        mock_db.aql.execute.assert_not_called()
+
+
+@pytest.mark.unit
+class TestRefreshAfterTagWrite:
+    """Test refresh_after_tag_write() rel filtering."""
+
+    def test_only_rollup_rels_trigger_a_refresh(self, ops, mock_db):
+        ops.refresh_after_tag_write([("library_files/f1", "nom:happy_score"), ("library_files/f2", "artist")])
+        mock_db.aql.execute.assert_not_called()
+
+    def test_rollup_rel_refreshes_file(self, ops, mock_db):
+        mock_db.aql.execute.return_value = _cursor([])
+
+        ops.refresh_after_tag_write([("library_files/f1", "nom:mood-loose"), ("library_files/f2", "artist")])
+
+        assert _queries(mock_db)[0][1]["file_ids"] == ["library_files/f1"]
+
+
+@pytest.mark.unit
+class TestRemoveFiles:
+    """Test remove_files()."""
+
+    def test_subtracts_stored_contributions(self, ops, mock_db):
+        mock_db.aql.execute.side_effect = [
+            _cursor(
+                [
+                    {"library_id": "libraries/L1", "sections": {"totals": {"files": 1}, "year": {"2001": 1}}},
+                    {"library_id": "libraries/L1", "sections": {"totals": {"files": 1}, "year": {"2001": 1}}},
+                ]
+            ),
+            None,
+        ]
+
+        ops.remove_files(["library_files/a", "library_files/b"])
+
+        queries = _queries(mock_db)
+        assert queries[0][1] == {"keys": ["a", "b"]}
+        assert queries[1][1]["deltas"] == [{"key": "L1", "sections": {"totals": {"files": -2}, "year": {"2001": -2}}}]
+
+
+@pytest.mark.unit
+class TestGetRollup:
+    """Test get_rollup() summing and decoding."""
+
+    def test_sums_libraries_and_reports_missing(self, ops, mock_db):
+        mock_db.aql.execute.return_value = _cursor(
+            [
+                {
+                    "library_id": "libraries/L1",
+                    "sections": {
+                        "totals": {"files": 2, "duration_s": 5.0, "size": 10, "tagged:strict": 1},
+                        "year": {"1999": 2},
+                        "mood:strict": {'"happy"': 1},
+                        "pairs:loose": {'["calm", "happy"]': 1},
+                    },
+                },
+                {"library_id": "libraries/L2", "sections": {"totals": {"files": 1}, "year": {"1999": 1}}},
+                {"library_id": "libraries/L3", "sections": None},
+            ]
+        )
+
+        rollup = ops.get_rollup()
+
+        assert rollup.file_count == 3
+        assert rollup.total_duration_s == 5.0
+        assert rollup.total_file_size_bytes == 10
+        assert rollup.year_counts == {1999: 3}
+        assert rollup.mood_tagged == {"strict": 1, "regular": 0, "loose": 0}
+        assert rollup.mood_balance["strict"] == {"happy": 1}
+        assert rollup.mood_pairs["loose"] == {("calm", "happy"): 1}
+        assert rollup.missing_library_ids == ["libraries/L3"]
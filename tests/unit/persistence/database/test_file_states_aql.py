@@ -336,6 +336,51 @@ class TestGetStaleFileIds:
         assert "INBOUND @tags_stale file_has_state" in query
 
 
+# ==================================================================
+# Heads axis (head-only reprocessing)
+# ==================================================================
+
+
+class TestHeadsAxis:
+    """Test heads_current / heads_stale transitions and queries."""
+
+    @pytest.mark.unit
+    def test_set_heads_current_transitions_state(self, ops, mock_db):
+        """Executes a transition to the heads_current vertex."""
+        ops.set_heads_current("library_files/abc")
+        bind_vars = mock_db.aql.execute.call_args[1]["bind_vars"]
+
+        assert bind_vars["file_id"] == "library_files/abc"
+        assert bind_vars["new_state"] == "file_states/heads_current"
+
+    @pytest.mark.unit
+    def test_bulk_set_heads_stale_returns_moved_count(self, ops, mock_db):
+        """Moves every heads_current edge to heads_stale."""
+        mock_db.aql.execute.return_value = iter([1, 1, 1])
+        assert ops.bulk_set_heads_stale() == 3
+        bind_vars = mock_db.aql.execute.call_args[1]["bind_vars"]
+        assert bind_vars["heads_current"] == "file_states/heads_current"
+        assert bind_vars["heads_stale"] == "file_states/heads_stale"
+
+    @pytest.mark.unit
+    def test_discover_next_heads_stale_file_requires_tagged(self, ops, mock_db):
+        """Only tagged, heads_stale, unclaimed files are discovered."""
+        mock_db.aql.execute.return_value = iter([{"_id": "library_files/1"}])
+        result = ops.discover_next_heads_stale_file()
+        query = mock_db.aql.execute.call_args[0][0]
+
+        assert result == {"_id": "library_files/1"}
+        assert "INBOUND @heads_stale file_has_state" in query
+        assert "@tagged" in query
+        assert "worker_claims" in query
+
+    @pytest.mark.unit
+    def test_filter_heads_stale_file_ids_skips_query_for_empty_input(self, ops, mock_db):
+        """Empty input returns an empty set without querying."""
+        assert ops.filter_heads_stale_file_ids([]) == set()
+        mock_db.aql.execute.assert_not_called()
+
+
 # ==================================================================
 # Cross-state utilities
 # ==================================================================
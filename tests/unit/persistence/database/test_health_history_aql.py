@@ -0,0 +1,40 @@
+"""Unit tests for HealthHistoryOperations (health_history_aql.py)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from nomarr.persistence.database.health_history_aql import HealthHistoryOperations
+
+
+@pytest.fixture
+def mock_db():
+    """Provide mock ArangoDB."""
+    db = MagicMock()
+    db.name = "test_db"
+    return db
+
+
+@pytest.fixture
+def ops(mock_db):
+    """Provide HealthHistoryOperations instance."""
+    return HealthHistoryOperations(mock_db)
+
+
+@pytest.mark.unit
+class TestInsertSnapshots:
+    """Test insert_snapshots() bulk insert."""
+
+    def test_all_snapshots_in_one_query(self, ops, mock_db):
+        snapshots = [{"component_id": "app", "status": "healthy"}, {"component_id": "worker:tag:0", "status": "dead"}]
+
+        ops.insert_snapshots(snapshots)
+
+        mock_db.aql.execute.assert_called_once()
+        query = mock_db.aql.execute.call_args.args[0]
+        assert "INSERT snapshot INTO health_history" in query
+        assert mock_db.aql.execute.call_args.kwargs["bind_vars"] == {"snapshots": snapshots}
+
+    def test_empty_input_skips_query(self, ops, mock_db):
+        ops.insert_snapshots([])
+        mock_db.aql.execute.assert_not_called()
@@ -0,0 +1,85 @@
+"""Unit tests for LibraryChangesOperations (library_changes_aql.py)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from nomarr.persistence.database.library_changes_aql import (
+    CALIBRATION_SCOPE,
+    TAGS_SCOPE,
+    LibraryChangesOperations,
+    scope_of,
+)
+
+
+@pytest.fixture
+def mock_db():
+    """Provide mock ArangoDB."""
+    db = MagicMock()
+    db.name = "test_db"
+    return db
+
+
+@pytest.fixture
+def ops(mock_db):
+    """Provide LibraryChangesOperations instance."""
+    return LibraryChangesOperations(mock_db)
+
+
+@pytest.mark.unit
+class TestBump:
+    """Test bump() and its variants."""
+
+    def test_scope_of_accepts_id_or_key(self):
+        assert scope_of("libraries/123") == "123"
+        assert scope_of("123") == "123"
+
+    def test_bumps_unique_scopes_in_one_query(self, ops, mock_db):
+        mock_db.aql.execute.return_value = iter([["123", 4], ["456", 1]])
+
+        result = ops.bump(["libraries/456", "123", "libraries/123", ""])
+
+        assert result == {"123": 4, "456": 1}
+        mock_db.aql.execute.assert_called_once()
+        query = mock_db.aql.execute.call_args.args[0]
+        assert "UPSERT { _key: scope }" in query
+        assert "version: OLD.version + 1" in query
+        assert mock_db.aql.execute.call_args.kwargs["bind_vars"]["scopes"] == ["123", "456"]
+
+    def test_bump_files_resolves_libraries_in_the_query(self, ops, mock_db):
+        mock_db.aql.execute.return_value = iter([["123", 2]])
+
+        assert ops.bump_files(f for f in ["library_files/a", "library_files/b", "library_files/a"]) == {"123": 2}
+
+        query = mock_db.aql.execute.call_args.args[0]
+        assert "DOCUMENT(@file_ids)" in query
+        assert mock_db.aql.execute.call_args.kwargs["bind_vars"]["file_ids"] == ["library_files/a", "library_files/b"]
+
+    def test_bump_calibration(self, ops, mock_db):
+        mock_db.aql.execute.return_value = iter([[CALIBRATION_SCOPE, 1]])
+
+        ops.bump_calibration()
+
+        assert mock_db.aql.execute.call_args.kwargs["bind_vars"]["scopes"] == [CALIBRATION_SCOPE]
+
+    def test_bump_all_covers_existing_scopes_libraries_and_tags(self, ops, mock_db):
+        mock_db.aql.execute.return_value = iter([["123", 5], [TAGS_SCOPE, 2]])
+
+        assert ops.bump_all() == {"123": 5, TAGS_SCOPE: 2}
+
+        query = mock_db.aql.execute.call_args.args[0]
+        assert "FOR c IN library_changes RETURN c._key" in query
+        assert "FOR l IN libraries RETURN l._key" in query
+        assert mock_db.aql.execute.call_args.kwargs["bind_vars"]["tags_scope"] == TAGS_SCOPE
+
+    def test_empty_input_skips_query(self, ops, mock_db):
+        assert ops.bump([]) == {}
+        assert ops.bump_files([]) == {}
+        mock_db.aql.execute.assert_not_called()
+
+
+@pytest.mark.unit
+def test_get_versions(ops, mock_db):
+    mock_db.aql.execute.return_value = iter([["123", 4], [CALIBRATION_SCOPE, 2]])
+
+    assert ops.get_versions() == {"123": 4, CALIBRATION_SCOPE: 2}
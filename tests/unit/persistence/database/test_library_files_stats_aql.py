@@ -0,0 +1,46 @@
+"""Unit tests for LibraryFilesStatsMixin (library_files_aql/stats.py)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from nomarr.persistence.database.library_files_aql import LibraryFilesOperations
+
+
+@pytest.fixture
+def mock_db():
+    """Provide mock ArangoDB."""
+    db = MagicMock()
+    db.name = "test_db"
+    db.collections.return_value = [{"name": "vectors_track__effnet"}, {"name": "library_files"}]
+    db.has_collection.return_value = True
+    return db
+
+
+@pytest.fixture
+def ops(mock_db):
+    """Provide LibraryFilesOperations instance."""
+    return LibraryFilesOperations(mock_db)
+
+
+@pytest.mark.unit
+class TestClearLibraryData:
+    """Test the cross-collection clear."""
+
+    def test_truncates_derived_collections(self, ops, mock_db):
+        ops.clear_library_data()
+
+        truncated = [c.args[0] for c in mock_db.collection.call_args_list if c.args[0] != "library_files"]
+        assert truncated == ["vectors_track__effnet", "analytics_rollups", "analytics_rollup_files"]
+        assert mock_db.collection.return_value.truncate.call_count == 3
+        queries = " ".join(c.args[0] for c in mock_db.aql.execute.call_args_list)
+        assert "REMOVE file IN library_files" in queries
+        assert "REMOVE edge IN song_has_tags" in queries
+
+    def test_bumps_every_change_scope(self, mock_db):
+        parent_db = MagicMock()
+        ops = LibraryFilesOperations(mock_db, parent_db=parent_db)
+
+        ops.clear_library_data()
+
+        parent_db.library_changes.bump_all.assert_called_once_with()
@@ -0,0 +1,45 @@
+"""Unit tests for TagMoodMixin (tags_aql/mood.py)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from nomarr.persistence.database.tags_aql import TagOperations
+
+
+@pytest.fixture
+def mock_db():
+    """Provide mock ArangoDB whose tier query finds one tier rel."""
+    db = MagicMock()
+
+    def execute(query, bind_vars=None):
+        if "COLLECT tier_rel" in query:
+            return iter(["nom:energy_tier"])
+        return iter([["library_files/1", "value"]])
+
+    db.aql.execute.side_effect = execute
+    return db
+
+
+@pytest.mark.unit
+class TestMoodAndTierTagsForCorrelation:
+    """Test the library filter of the correlation rows."""
+
+    def test_library_filter_is_applied_in_every_row_query(self, mock_db):
+        result = TagOperations(mock_db).get_mood_and_tier_tags_for_correlation(library_id="libraries/1")
+
+        row_calls = [c for c in mock_db.aql.execute.call_args_list if "RETURN [edge._from, tag.value]" in c.args[0]]
+        assert len(row_calls) == 4  # three mood rels + one tier rel
+        for call in row_calls:
+            assert "OUTBOUND @library_id library_contains_file" in call.args[0]
+            assert "FILTER edge._from IN library_file_ids" in call.args[0]
+            assert call.kwargs["bind_vars"]["library_id"] == "libraries/1"
+        assert set(result) == {"mood_tag_rows", "tier_tag_keys", "tier_tag_rows"}
+        assert result["tier_tag_rows"] == {"nom:energy_tier": [("library_files/1", "value")]}
+
+    def test_no_library_filter_without_library_id(self, mock_db):
+        TagOperations(mock_db).get_mood_and_tier_tags_for_correlation()
+
+        for call in mock_db.aql.execute.call_args_list:
+            assert "library_contains_file" not in call.args[0]
+            assert "library_id" not in (call.kwargs.get("bind_vars") or {})
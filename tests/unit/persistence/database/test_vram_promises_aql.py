@@ -0,0 +1,83 @@
+"""Unit tests for VramPromisesOperations batch methods (vram_promises_aql.py)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from nomarr.persistence.database.vram_promises_aql import VramPromisesOperations, _promise_key
+
+
+@pytest.fixture
+def mock_db():
+    """Provide mock ArangoDB."""
+    db = MagicMock()
+    db.name = "test_db"
+    return db
+
+
+@pytest.fixture
+def ops(mock_db):
+    """Provide VramPromisesOperations instance."""
+    return VramPromisesOperations(mock_db)
+
+
+class TestTryRegisterMany:
+    """Test try_register_many() method."""
+
+    def test_all_promises_in_one_statement(self, ops, mock_db):
+        """One AQL statement checks the batch total and inserts every document."""
+        mock_db.aql.execute.return_value = iter([True, True])
+
+        ok = ops.try_register_many("worker_0", 7, {"/m/a.onnx": 300.0, "/m/b.onnx": 200.0}, 8000.0, 1000.0)
+
+        assert ok is True
+        assert mock_db.aql.execute.call_count == 1
+        query = mock_db.aql.execute.call_args[0][0]
+        bind_vars = mock_db.aql.execute.call_args[1]["bind_vars"]
+        assert "FILTER headroom >= @batch_mb" in query
+        assert "FOR doc IN @docs" in query
+        assert bind_vars["batch_mb"] == 500.0
+        assert [d["_key"] for d in bind_vars["docs"]] == [
+            _promise_key("worker_0", "/m/a.onnx"),
+            _promise_key("worker_0", "/m/b.onnx"),
+        ]
+        assert all(d["pid"] == 7 and d["worker_id"] == "worker_0" for d in bind_vars["docs"])
+
+    def test_rejected_batch(self, ops, mock_db):
+        """No returned rows means the fit-check filtered the batch out."""
+        mock_db.aql.execute.return_value = iter([])
+
+        assert ops.try_register_many("worker_0", 7, {"/m/a.onnx": 300.0}, 8000.0, 1000.0) is False
+
+    def test_empty_batch_skips_query(self, ops, mock_db):
+        assert ops.try_register_many("worker_0", 7, {}, 8000.0, 1000.0) is True
+        mock_db.aql.execute.assert_not_called()
+
+
+class TestGetHeadroomMb:
+    """Test get_headroom_mb() method."""
+
+    def test_subtracts_promises_and_reserve(self, ops, mock_db):
+        mock_db.aql.execute.return_value = iter([1500])
+
+        assert ops.get_headroom_mb(8000.0, 1000.0) == 8000.0 - 1000.0 - 1500.0 - 256
+
+    def test_no_promises(self, ops, mock_db):
+        mock_db.aql.execute.return_value = iter([None])
+
+        assert ops.get_headroom_mb(8000.0, 1000.0) == 8000.0 - 1000.0 - 256
+
+
+class TestCount:
+    """Test count() method."""
+
+    def test_counts_in_one_query(self, ops, mock_db):
+        mock_db.aql.execute.return_value = iter([3])
+
+        assert ops.count() == 3
+        assert "LENGTH(vram_promises)" in mock_db.aql.execute.call_args[0][0]
+
+    def test_empty_result(self, ops, mock_db):
+        mock_db.aql.execute.return_value = iter([])
+
+        assert ops.count() == 0
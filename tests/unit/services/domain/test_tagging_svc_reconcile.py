@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import threading
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
@@ -129,7 +130,7 @@ class TestGetReconcileStatus:
 
         result = service.get_reconcile_status("lib1")
 
-        assert result == {"pending_count": 4, "in_progress": True}
+        assert result == {"pending_count": 4, "in_progress": True, "progress": None}
         mock_bts.get_task_status.assert_called_once_with("write_tags:lib1")
 
     @pytest.mark.unit
@@ -145,7 +146,7 @@ class TestGetReconcileStatus:
 
         result = service.get_reconcile_status("lib1")
 
-        assert result == {"pending_count": 2, "in_progress": False}
+        assert result == {"pending_count": 2, "in_progress": False, "progress": None}
         mock_bts.get_task_status.assert_called_once_with("write_tags:lib1")
 
     @pytest.mark.unit
@@ -161,3 +162,41 @@ class TestGetReconcileStatus:
             service.get_reconcile_status("lib1")
 
         mock_bts.get_task_status.assert_not_called()
+
+
+class TestReconcileLibraryParallel:
+    """Tests for write-engine-backed ``reconcile_library``."""
+
+    @pytest.mark.unit
+    @pytest.mark.mocked
+    def test_outcomes_mapped_to_counts_and_progress(self, tmp_path: Path) -> None:
+        """Successes, external modifications and failures are tallied as in the serial path."""
+        from nomarr.workflows.processing.write_file_tags_wf import WriteResult
+
+        mock_db = MagicMock()
+        mock_db.libraries.get_library.return_value = {"_id": "lib1", "root_path": str(tmp_path)}
+        mock_db.meta.get.return_value = "cal-hash"
+        mock_db.library_files.claim_files_for_reconciliation.return_value = [
+            {"_key": key, "path": f"{key}.flac"} for key in ("ok1", "ok2", "moved", "bad")
+        ]
+        mock_db.library_files.count_files_needing_reconciliation.return_value = 0
+        config_service = MagicMock()
+        config_service.get.side_effect = lambda _key, default=None: default
+        service = _make_service(db=mock_db)
+        service._config_service = config_service
+
+        def fake_write(**kwargs: object) -> WriteResult:
+            key = str(kwargs["file_key"])
+            if key == "moved":
+                return WriteResult(key, 0, 0, success=False, error="file_modified_externally")
+            if key == "bad":
+                return WriteResult(key, 0, 0, success=False, error="Safe write failed: boom")
+            return WriteResult(key, 3, 0, success=True)
+
+        with patch("nomarr.services.domain.tagging_svc.write_file_tags_workflow", side_effect=fake_write):
+            result = service.reconcile_library("lib1")
+
+        assert (result.processed, result.failed, result.remaining) == (2, 1, 0)
+        mock_db.library_files.release_claim.assert_called_once_with("moved")
+        progress = service.get_reconcile_status("lib1")["progress"]
+        assert progress["completed"] == 4
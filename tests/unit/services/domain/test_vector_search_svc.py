@@ -0,0 +1,112 @@
+"""Tests for ``nomarr.services.domain.vector_search_svc`` fan-out search."""
+
+from __future__ import annotations
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from nomarr.services.domain.vector_search_svc import VectorSearchService
+
+
+def _make_service(results_by_lib: dict[str, list[dict] | Exception]) -> tuple[VectorSearchService, MagicMock]:
+    """Build a VectorSearchService whose cold collections return canned results."""
+    db = MagicMock()
+    db.libraries.list_libraries.return_value = [{"_key": key} for key in [*results_by_lib, "empty", "missing"]]
+    db.db.has_collection.side_effect = lambda name: not name.endswith("__missing")
+    db.db.collection.return_value.indexes.return_value = []
+    recorded = {
+        f"vector_search_params:effnet__{key}": json.dumps(
+            {"nlists": 33, "doc_count": 0 if key == "empty" else 500, "updated_at_ms": 1}
+        )
+        for key in [*results_by_lib, "empty"]
+    }
+    db.meta.get.side_effect = recorded.get
+
+    cold_by_lib: dict[str, MagicMock] = {}
+    for key in [*results_by_lib, "empty"]:
+        ops = MagicMock()
+        ops.count.return_value = 0 if key == "empty" else 500
+        outcome = results_by_lib.get(key, [])
+        if isinstance(outcome, Exception):
+            ops.search_similar.side_effect = outcome
+        else:
+            ops.search_similar.side_effect = lambda *_a, _r=outcome, **_k: list(_r)
+        cold_by_lib[key] = ops
+    db.get_vectors_track_cold.side_effect = lambda _backbone, lib: cold_by_lib[lib]
+
+    config_svc = MagicMock()
+    config_svc.get.side_effect = lambda _key, default=None: default
+    return VectorSearchService(db=db, config_svc=config_svc), db
+
+
+@pytest.mark.unit
+@pytest.mark.mocked
+class TestVectorSearchFanOut:
+    """Tests for ``VectorSearchService._search_fan_out``."""
+
+    def test_merges_by_score_and_dedups(self) -> None:
+        service, _ = _make_service(
+            {
+                "a": [{"file_id": "f1", "score": 0.9}, {"file_id": "f3", "score": 0.5}],
+                "b": [
+                    {"file_id": "f2", "score": 0.8},
+                    {"file_id": "f1", "score": 0.7},
+                    {"file_id": "f4", "score": 0.1},
+                ],
+            }
+        )
+
+        results = service._search_fan_out("effnet", [1.0, 0.0], limit=10, min_score=0.2)
+
+        assert [(r["file_id"], r["score"]) for r in results] == [("f1", 0.9), ("f2", 0.8), ("f3", 0.5)]
+
+    def test_respects_limit(self) -> None:
+        service, _ = _make_service(
+            {
+                "a": [{"file_id": f"a{i}", "score": 1.0 - i / 10} for i in range(5)],
+                "b": [{"file_id": f"b{i}", "score": 0.95 - i / 10} for i in range(5)],
+            }
+        )
+
+        results = service._search_fan_out("effnet", [1.0], limit=3)
+
+        assert [r["file_id"] for r in results] == ["a0", "b0", "a1"]
+
+    def test_failed_library_is_skipped(self) -> None:
+        service, _ = _make_service({"a": RuntimeError("boom"), "b": [{"file_id": "f2", "score": 0.8}]})
+
+        results = service._search_fan_out("effnet", [1.0], limit=5)
+
+        assert [r["file_id"] for r in results] == ["f2"]
+
+    def test_uses_recorded_params_without_count(self) -> None:
+        service, db = _make_service({"a": [{"file_id": "f1", "score": 0.9}]})
+
+        service._search_fan_out("effnet", [1.0], limit=5)
+        service._search_fan_out("effnet", [1.0], limit=5)
+
+        cold_a = db.get_vectors_track_cold(None, "a")
+        cold_a.count.assert_not_called()
+        assert cold_a.search_similar.call_count == 2
+        assert cold_a.search_similar.call_args.kwargs["nprobe"] == 3  # 10% of 33 lists
+        # One meta read per library; the second call is served from the cache
+        assert db.meta.get.call_count == 3
+        db.get_vectors_track_cold(None, "empty").search_similar.assert_not_called()
+
+    def test_libraries_searched_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_then_return(*_args: object, **_kwargs: object) -> list[dict]:
+            barrier.wait()  # deadlocks (BrokenBarrierError) if searches are serial
+            return [{"file_id": threading.current_thread().name, "score": 0.5}]
+
+        service, db = _make_service({"a": [], "b": []})
+        for lib in ("a", "b"):
+            db.get_vectors_track_cold(None, lib).search_similar.side_effect = wait_then_return
+
+        results = service._search_fan_out("effnet", [1.0], limit=5)
+
+        assert len(results) == 2
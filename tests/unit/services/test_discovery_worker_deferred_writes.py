@@ -148,3 +148,59 @@ class TestExecuteDeferredWritesFailure:
         _execute_deferred_writes(mock_db, minimal_writes, "worker:tag:0")
 
         mock_release.assert_called_once_with(mock_db, "library_files/abc")
+
+
+class TestExecuteDeferredWritesMetrics:
+    """Tests for the persist metrics recorded by _execute_deferred_writes."""
+
+    @pytest.mark.unit
+    @patch(f"{_PATCH_PREFIX_WORKER}.release_claim")
+    @patch(f"{_PATCH_PREFIX_PARSE}.parse_tag_values")
+    @patch(f"{_PATCH_PREFIX_SYNC}.save_file_tags")
+    def test_records_persist_stage(
+        self,
+        mock_save_tags: MagicMock,
+        mock_parse: MagicMock,
+        mock_release: MagicMock,
+        mock_db: MagicMock,
+        minimal_writes: DeferredFileWrites,
+    ) -> None:
+        from nomarr.components.platform.pipeline_metrics_comp import STAGE_SECONDS, new_pipeline_registry
+        from nomarr.services.infrastructure.workers.discovery_worker import (
+            _execute_deferred_writes,
+        )
+
+        mock_parse.return_value = {}
+        metrics = new_pipeline_registry()
+
+        _execute_deferred_writes(mock_db, minimal_writes, "worker:tag:0", metrics)
+
+        snapshot = metrics.snapshot()
+        [(labels, counts, _total)] = snapshot["histogram"][STAGE_SECONDS]
+        assert labels == {"stage": "persist"}
+        assert sum(counts) == 1
+        assert snapshot["counter"] == {}
+
+    @pytest.mark.unit
+    @patch(f"{_PATCH_PREFIX_WORKER}.release_claim")
+    @patch(f"{_PATCH_PREFIX_PARSE}.parse_tag_values")
+    @patch(f"{_PATCH_PREFIX_SYNC}.save_file_tags")
+    def test_counts_persist_error(
+        self,
+        mock_save_tags: MagicMock,
+        mock_parse: MagicMock,
+        mock_release: MagicMock,
+        mock_db: MagicMock,
+        minimal_writes: DeferredFileWrites,
+    ) -> None:
+        from nomarr.components.platform.pipeline_metrics_comp import FILES_TOTAL, new_pipeline_registry
+        from nomarr.services.infrastructure.workers.discovery_worker import (
+            _execute_deferred_writes,
+        )
+
+        mock_parse.side_effect = RuntimeError("parse failed")
+        metrics = new_pipeline_registry()
+
+        _execute_deferred_writes(mock_db, minimal_writes, "worker:tag:0", metrics)
+
+        assert metrics.snapshot()["counter"][FILES_TOTAL] == [[{"outcome": "persist_error"}, 1.0]]
@@ -0,0 +1,90 @@
+"""Unit tests for HealthMonitorService history writes."""
+
+from __future__ import annotations
+
+import itertools
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from nomarr.helpers.dto.health_dto import ComponentPolicy
+from nomarr.helpers.time_helper import Milliseconds
+from nomarr.services.infrastructure.health_monitor_svc import HealthMonitorConfig, HealthMonitorService
+
+HEALTH_FRAME_PREFIX = "HEALTH|"
+
+
+def _monitor(components: int, cfg: HealthMonitorConfig | None = None) -> tuple[HealthMonitorService, MagicMock]:
+    db = MagicMock()
+    monitor = HealthMonitorService(cfg=cfg or HealthMonitorConfig(), db=db)
+    for i in range(components):
+        monitor.register_component(f"worker:tag:{i}", MagicMock(), MagicMock(), ComponentPolicy())
+    return monitor, db
+
+
+def _batches(db: MagicMock) -> list[list[dict]]:
+    return [call.args[0] for call in db.health_history.insert_snapshots.call_args_list]
+
+
+@pytest.mark.unit
+def test_history_tick_is_one_bulk_insert() -> None:
+    monitor, db = _monitor(components=5)
+
+    monitor._write_history_snapshot()
+
+    (batch,) = _batches(db)
+    assert len(batch) == 5
+    db.health.update_health_snapshot.assert_not_called()
+
+
+@pytest.mark.unit
+def test_unchanged_tick_writes_nothing() -> None:
+    monitor, db = _monitor(components=5)
+    monitor._write_history_snapshot()
+
+    monitor._write_history_snapshot()
+
+    assert len(_batches(db)) == 1
+
+
+@pytest.mark.unit
+def test_stale_component_is_not_rerecorded_on_wall_clock_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    monitor, db = _monitor(components=2, cfg=HealthMonitorConfig(history_stale_heartbeat_s=0))
+    # Every conversion of the same monotonic frame time lands on a new millisecond
+    wall_ms = itertools.count(1_000)
+    monkeypatch.setattr(
+        "nomarr.services.infrastructure.health_monitor_svc.to_wall_ms", lambda _: Milliseconds(next(wall_ms))
+    )
+    monitor._write_history_snapshot()
+
+    monitor._write_history_snapshot()
+
+    (batch,) = _batches(db)
+    assert [s["reason"] for s in batch] == ["changed", "changed"]
+
+
+@pytest.mark.unit
+def test_transitions_between_ticks_are_flushed_together() -> None:
+    monitor, db = _monitor(components=3)
+    monitor._write_history_snapshot()
+    frame = HEALTH_FRAME_PREFIX + json.dumps({"status": "healthy"})
+
+    monitor._handle_frame("worker:tag:0", frame)
+    monitor._handle_frame("worker:tag:1", frame)
+    # Hot path only buffers
+    assert len(_batches(db)) == 1
+    monitor._write_history_snapshot()
+
+    batch = _batches(db)[1]
+    assert [(s["component_id"], s["status"], s["reason"]) for s in batch] == [
+        ("worker:tag:0", "healthy", "transition"),
+        ("worker:tag:1", "healthy", "transition"),
+    ]
+
+
+@pytest.mark.unit
+def test_without_db_history_is_disabled() -> None:
+    monitor = HealthMonitorService(cfg=HealthMonitorConfig(), db=None)
+
+    monitor._write_history_snapshot()
@@ -185,3 +185,31 @@ class TestHandleFrameParsing:
         monitor._handle_frame("gpu_monitor", frame)
 
         assert monitor.get_status("gpu_monitor") == "healthy"
+
+    @pytest.mark.unit
+    def test_keeps_latest_metrics_snapshot(self, monitor_with_component: tuple) -> None:
+        """A metrics snapshot in a frame replaces the previous one of that component."""
+        monitor, _mock_handler = monitor_with_component
+
+        for total in (1.0, 2.0):
+            snapshot = {"counter": {"nomarr_pipeline_files_total": [[{"outcome": "tagged"}, total]]}}
+            frame = HEALTH_FRAME_PREFIX + json.dumps(
+                {"component_id": "test:component:0", "status": "healthy", "metrics": snapshot},
+            )
+            monitor._handle_frame("test:component:0", frame)
+
+        assert monitor.get_metrics_snapshots() == {"test:component:0": snapshot}
+        assert monitor.get_status("test:component:0") == "healthy"
+
+    @pytest.mark.unit
+    def test_ignores_malformed_metrics(self, monitor_with_component: tuple) -> None:
+        """A metrics value that is not an object is dropped; the status still applies."""
+        monitor, _mock_handler = monitor_with_component
+
+        frame = HEALTH_FRAME_PREFIX + json.dumps(
+            {"component_id": "test:component:0", "status": "healthy", "metrics": [1, 2]},
+        )
+        monitor._handle_frame("test:component:0", frame)
+
+        assert monitor.get_metrics_snapshots() == {}
+        assert monitor.get_status("test:component:0") == "healthy"
@@ -453,3 +453,27 @@ class TestHealthFrameEmission:
 
         # Should not raise
         worker._send_health_frame("healthy")
+
+    def test_send_health_frame_carries_metrics_snapshot(self) -> None:
+        """Once run() created the registry, every frame carries its snapshot."""
+        from nomarr.components.platform.pipeline_metrics_comp import new_pipeline_registry, observe_stage
+        from nomarr.services.infrastructure.workers.discovery_worker import (
+            HEALTH_FRAME_PREFIX,
+            DiscoveryWorker,
+        )
+
+        worker = DiscoveryWorker(
+            worker_id="worker:tag:0",
+            db_hosts="http://localhost:8529",
+            db_password="test",
+            processor_config_dict={},
+            health_pipe=MagicMock(),
+        )
+        worker._metrics = new_pipeline_registry()
+        observe_stage(worker._metrics, "claim_wait", 12.0)
+
+        worker._send_health_frame("healthy")
+
+        data = json.loads(worker._health_pipe.send.call_args[0][0][len(HEALTH_FRAME_PREFIX) :])
+        assert data["status"] == "healthy"
+        assert data["metrics"] == worker._metrics.snapshot()
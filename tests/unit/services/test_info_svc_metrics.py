@@ -0,0 +1,57 @@
+"""Unit tests for InfoService.get_pipeline_metrics."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from nomarr.components.platform.pipeline_metrics_comp import (
+    OUTCOME_TAGGED,
+    new_pipeline_registry,
+    record_processed_file,
+)
+
+
+@pytest.fixture
+def db() -> MagicMock:
+    db = MagicMock()
+    db.file_states.count_untagged_files.return_value = 120
+    db.file_states.count_heads_stale_files.return_value = 7
+    db.vram_promises.count.return_value = 3
+    return db
+
+
+def _info_service(db: MagicMock, health_monitor: MagicMock | None) -> object:
+    from nomarr.services.infrastructure.info_svc import InfoConfig, InfoService
+
+    cfg = InfoConfig(version="test", namespace="nom", models_dir="/models", db=db, health_monitor=health_monitor)
+    return InfoService(cfg=cfg)
+
+
+@pytest.mark.unit
+def test_merges_worker_snapshots_and_db_gauges(db: MagicMock) -> None:
+    worker = new_pipeline_registry()
+    record_processed_file(worker, {"audio_load": 300.0, "emb_effnet": 200.0}, 600.0, OUTCOME_TAGGED)
+    health_monitor = MagicMock()
+    health_monitor.get_metrics_snapshots.return_value = {"worker:tag:0": worker.snapshot()}
+
+    text = _info_service(db, health_monitor).get_pipeline_metrics()
+
+    assert 'nomarr_pipeline_queue_depth{queue="untagged"} 120.0' in text
+    assert 'nomarr_pipeline_queue_depth{queue="heads_stale"} 7.0' in text
+    assert "nomarr_vram_promises 3.0" in text
+    assert 'nomarr_pipeline_files_total{outcome="tagged",worker="worker:tag:0"} 1.0' in text
+    assert 'nomarr_pipeline_stage_seconds_count{stage="decode",worker="worker:tag:0"} 1' in text
+    assert 'nomarr_pipeline_stage_seconds_sum{stage="backbone",worker="worker:tag:0"} 0.2' in text
+
+
+@pytest.mark.unit
+def test_failed_gauge_query_does_not_fail_scrape(db: MagicMock) -> None:
+    db.file_states.count_untagged_files.side_effect = RuntimeError("db down")
+
+    text = _info_service(db, None).get_pipeline_metrics()
+
+    assert "nomarr_pipeline_queue_depth{" not in text
+    assert "# TYPE nomarr_pipeline_queue_depth gauge" in text
+    assert "nomarr_vram_promises 3.0" in text
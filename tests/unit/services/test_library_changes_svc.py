@@ -0,0 +1,91 @@
+"""Tests for LibraryChangesService (in-memory change counter mirror)."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from nomarr.services.infrastructure.library_changes_svc import LibraryChangesConfig, LibraryChangesService
+
+
+@pytest.fixture
+def db() -> MagicMock:
+    db = MagicMock()
+    db.library_changes.get_versions.return_value = {"123": 3, "456": 1, "calibration": 2}
+    return db
+
+
+@pytest.fixture
+def service(db: MagicMock) -> LibraryChangesService:
+    svc = LibraryChangesService(db=db, cfg=LibraryChangesConfig(refresh_interval_s=60))
+    assert svc.refresh()
+    return svc
+
+
+@pytest.mark.unit
+class TestVersion:
+    def test_library_version_follows_its_counter_only(self, service: LibraryChangesService, db: MagicMock) -> None:
+        before = service.version("libraries/123")
+        assert service.version("123") == before
+
+        db.library_changes.get_versions.return_value = {"123": 3, "456": 2, "calibration": 2}
+        service.refresh()
+        assert service.version("libraries/123") == before
+
+        db.library_changes.get_versions.return_value = {"123": 4, "456": 2, "calibration": 2}
+        service.refresh()
+        assert service.version("libraries/123") != before
+
+    def test_unknown_library_has_a_version(self, service: LibraryChangesService) -> None:
+        assert service.version("libraries/999") is not None
+
+    def test_global_version_moves_with_any_scope(self, service: LibraryChangesService, db: MagicMock) -> None:
+        before = service.version()
+
+        db.library_changes.get_versions.return_value = {"123": 3, "456": 1, "calibration": 3}
+        service.refresh()
+        after_calibration = service.version()
+        assert after_calibration != before
+
+        # A scope's first bump adds a counter of 1
+        db.library_changes.get_versions.return_value = {"123": 3, "456": 1, "calibration": 2, "789": 1}
+        service.refresh()
+        assert service.version() not in (before, after_calibration)
+
+    def test_versions_differ_across_restarts(self, db: MagicMock, service: LibraryChangesService) -> None:
+        other = LibraryChangesService(db=db)
+        other._epoch = service._epoch + 1
+        other.refresh()
+        assert other.version("123") != service.version("123")
+
+
+@pytest.mark.unit
+class TestStaleness:
+    def test_no_version_before_first_refresh(self, db: MagicMock) -> None:
+        assert LibraryChangesService(db=db).version() is None
+
+    def test_failed_refresh_keeps_versions_until_stale(self, service: LibraryChangesService, db: MagicMock) -> None:
+        version = service.version("123")
+        db.library_changes.get_versions.side_effect = RuntimeError("db down")
+
+        assert not service.refresh()
+        assert service.version("123") == version
+
+        assert service._refreshed_at is not None
+        service._refreshed_at -= int(service.cfg.stale_after_s * 1000) + 1
+        assert service.version("123") is None
+        assert service.version() is None
+
+
+@pytest.mark.unit
+def test_start_polls_until_stopped(db: MagicMock) -> None:
+    service = LibraryChangesService(db=db, cfg=LibraryChangesConfig(refresh_interval_s=0.01))
+    service.start()
+    try:
+        assert service.version() is not None
+    finally:
+        service.stop()
+
+    assert db.library_changes.get_versions.call_count >= 1
+    assert service._thread is None
@@ -0,0 +1,212 @@
+"""Tests for the Application service registry, startup profiler and startup budget."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+import pytest
+
+if TYPE_CHECKING:
+    from nomarr.app import ServiceRegistry, StartupProfiler
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BUDGET_PATH = PROJECT_ROOT / "tests" / "fixtures" / "startup_budget.json"
+
+
+@pytest.fixture
+def profiler() -> StartupProfiler:
+    # Imported here: importing nomarr.app outside a running test builds the singleton
+    from nomarr.app import StartupProfiler
+
+    return StartupProfiler()
+
+
+@pytest.fixture
+def registry(profiler: StartupProfiler) -> ServiceRegistry:
+    from nomarr.app import ServiceRegistry
+
+    return ServiceRegistry(profiler)
+
+
+@pytest.mark.unit
+class TestServiceRegistry:
+    def test_factory_runs_once_on_first_lookup(self, registry: ServiceRegistry) -> None:
+        factory = MagicMock(return_value="svc")
+        registry.register_factory("svc", factory)
+
+        assert "svc" in registry
+        assert not registry.is_built("svc")
+        factory.assert_not_called()
+
+        assert registry["svc"] == "svc"
+        assert registry.get("svc") == "svc"
+        factory.assert_called_once()
+        assert registry.is_built("svc")
+
+    def test_behaves_like_the_dict_it_replaces(self, registry: ServiceRegistry) -> None:
+        registry.register("config", "cfg")
+        registry.register_factory("lazy", lambda: "built")
+
+        assert registry.get("missing") is None
+        with pytest.raises(KeyError):
+            registry["missing"]
+        assert sorted(registry) == ["config", "lazy"]
+        assert len(registry) == 2
+        assert not registry.is_built("lazy")  # iteration does not build
+
+    def test_factories_can_look_up_dependencies(self, registry: ServiceRegistry) -> None:
+        registry.register_factory("a", lambda: "a")
+        registry.register_factory("b", lambda: registry["a"] + "b")
+
+        assert registry["b"] == "ab"
+        assert registry.is_built("a")
+
+    def test_build_errors_propagate_and_allow_retry(self, registry: ServiceRegistry) -> None:
+        factory = MagicMock(side_effect=[KeyError("namespace"), "svc"])
+        registry.register_factory("svc", factory)
+
+        with pytest.raises(KeyError):
+            registry.get("svc")
+        assert registry.get("svc") == "svc"
+
+    def test_concurrent_lookups_build_once(self, registry: ServiceRegistry) -> None:
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def factory() -> object:
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return object()
+
+        registry.register_factory("svc", factory)
+        results: list[object] = []
+        threads = [threading.Thread(target=lambda: results.append(registry["svc"])) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        assert started.wait(5)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(calls) == 1
+        assert len(results) == 4
+        assert all(result is results[0] for result in results)
+
+
+@pytest.mark.unit
+class TestStartupProfiler:
+    def test_records_imports_and_construction_per_service(
+        self, registry: ServiceRegistry, profiler: StartupProfiler
+    ) -> None:
+        registry.register_factory("eager", object, modules=["json"])
+        registry.register_factory("lazy", object)
+        with profiler.step("database_connect"):
+            registry["eager"]
+        profiler.mark_ready()
+        registry["lazy"]
+
+        timings = {t.name: t for t in profiler.services}
+        assert not timings["eager"].lazy
+        assert timings["lazy"].lazy
+        assert all(t.import_ms >= 0 and t.build_ms >= 0 for t in timings.values())
+        assert "database_connect" in profiler.steps
+        report = profiler.report()
+        assert report.startswith("Startup: ")
+        assert "eager" in report
+        assert "[lazy]" in report
+
+
+STARTUP_PROBE = """
+import json
+import sys
+import time
+from unittest.mock import MagicMock
+
+started = time.perf_counter()
+from nomarr.app import Application
+
+
+class OfflineApplication(Application):
+    def _connect_database(self):
+        return MagicMock()
+
+    def _start_app_heartbeat(self):
+        pass
+
+
+app = OfflineApplication(role="api")
+app.start()
+total_ms = (time.perf_counter() - started) * 1000
+result = {
+    "total_ms": total_ms,
+    "modules": sorted(sys.modules),
+    "eager_services": sorted(t.name for t in app.profiler.services),
+    "report": app.profiler.report(),
+}
+app.stop()
+print(json.dumps(result))
+"""
+
+
+@pytest.fixture(scope="module")
+def api_budget() -> dict[str, Any]:
+    return json.loads(BUDGET_PATH.read_text())["api"]
+
+
+@pytest.fixture(scope="module")
+def api_startup() -> dict[str, Any]:
+    """Cold start of the API role in a fresh interpreter (database mocked)."""
+    env = {
+        **os.environ,
+        "ARANGO_HOST": "http://localhost:1",
+        "PYTEST_CURRENT_TEST": "startup-budget",  # No module-level singleton
+        "PYTHONPATH": str(PROJECT_ROOT),
+    }
+    completed = subprocess.run(
+        [sys.executable, "-c", STARTUP_PROBE],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=PROJECT_ROOT,
+        timeout=60,
+        check=False,
+    )
+    assert completed.returncode == 0, completed.stderr
+    result: dict[str, Any] = json.loads(completed.stdout.strip().splitlines()[-1])
+    return result
+
+
+@pytest.mark.integration
+@pytest.mark.mocked
+def test_cold_api_role_startup_stays_within_budget(api_budget: dict[str, Any], api_startup: dict[str, Any]) -> None:
+    """The API role imports and builds only what the budget allows.
+
+    Update tests/fixtures/startup_budget.json deliberately when a change
+    legitimately needs more; the recorded numbers are for reference.
+    """
+    heavy = sorted(set(api_budget["forbidden_modules"]) & set(api_startup["modules"]))
+    assert not heavy, f"API role imported {heavy}\n{api_startup['report']}"
+    assert api_startup["eager_services"] == api_budget["eager_services"], api_startup["report"]
+    assert len(api_startup["modules"]) <= api_budget["max_modules"], (
+        f"API role imported {len(api_startup['modules'])} modules (budget {api_budget['max_modules']})"
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.mocked
+@pytest.mark.container_only  # Wall-clock budget: shared CI runners are too noisy
+def test_cold_api_role_startup_time_within_budget(api_budget: dict[str, Any], api_startup: dict[str, Any]) -> None:
+    """Cold start of the API role finishes within the recorded time budget."""
+    assert api_startup["total_ms"] <= api_budget["max_total_ms"], (
+        f"API role cold start took {api_startup['total_ms']:.0f}ms (budget {api_budget['max_total_ms']}ms)\n"
+        f"{api_startup['report']}"
+    )
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from nomarr.workflows.navidrome.find_similar_tracks_wf import find_similar_tracks
@@ -261,3 +262,43 @@ class TestFindSimilarTracksEdgeCases:
         find_similar_tracks("nd-seed", count=5, backbone_id="custom-backbone", db=db)
 
         db.get_vectors_track_cold.assert_called_once_with("custom-backbone", "test_lib")
+
+    @pytest.mark.unit
+    def test_params_cache_replaces_count(self) -> None:
+        """Recorded search params supply nprobe without a count() round trip."""
+        from nomarr.components.ml.vectors.ml_vector_search_params_comp import VectorSearchParams
+
+        db = _make_db(ann_results=[])
+        params_cache = MagicMock()
+        params_cache.get.return_value = VectorSearchParams(nlists=80, doc_count=1200, updated_at_ms=1)
+
+        find_similar_tracks(
+            "nd-seed",
+            count=5,
+            backbone_id="effnet",
+            db=db,
+            vector_search_thoroughness=25,
+            params_cache=params_cache,
+        )
+
+        db.get_vectors_track_cold.return_value.count.assert_not_called()
+        assert db.get_vectors_track_cold.return_value.search_similar.call_args.kwargs["nprobe"] == 20
+
+    @pytest.mark.unit
+    def test_index_cache_replaces_cold_lookup_and_search(self) -> None:
+        """The seed's library index is picked after the workflow's own seed resolution."""
+        db = _make_db(nd_bulk_map={"library_files/match-1": "nd-id-1"})
+        local_index = MagicMock()
+        local_index.get_vector.return_value = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+        local_index.search.return_value = [("library_files/seed-file", 1.0), ("library_files/match-1", 0.9)]
+        index_cache = MagicMock()
+        index_cache.get.return_value = local_index
+
+        results = find_similar_tracks("nd-seed", count=5, backbone_id="effnet", db=db, index_cache=index_cache)
+
+        assert [r["nd_id"] for r in results] == ["nd-id-1"]
+        index_cache.get.assert_called_once_with(db, "effnet", "test_lib")
+        db.navidrome_tracks.resolve_nd_to_file.assert_called_once_with("nd-seed")
+        cold_ops = db.get_vectors_track_cold.return_value
+        cold_ops.get_vector.assert_not_called()
+        cold_ops.search_similar.assert_not_called()
@@ -0,0 +1,82 @@
+"""Unit tests for ``generate_all_user_playlists_wf``."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from nomarr.workflows.navidrome.generate_all_user_playlists_wf import generate_all_user_playlists
+
+_WF = "nomarr.workflows.navidrome.generate_all_user_playlists_wf"
+
+
+def _stored(user_id: str) -> dict[str, object]:
+    return {
+        "userid": user_id,
+        "backbone_id": "effnet",
+        "library_key": "lib1",
+        "vector_sum": [2.0, 0.0],
+        "half_life_days": 30.0,
+        "top_n": 200,
+        "track_count": 4,
+        "play_count": 0,
+        "updated_at_ms": 1,
+    }
+
+
+def _run(db: MagicMock) -> dict[str, list]:
+    return generate_all_user_playlists(
+        db,
+        backbone_id="effnet",
+        library_key="lib1",
+        enabled_types=["familiar"],
+        half_life_days=30.0,
+        top_n=200,
+        max_songs=50,
+        min_play_count=3,
+        min_songs=10,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.mocked
+class TestGenerateAllUserPlaylists:
+    """Tests for the batch playlist workflow."""
+
+    def test_prefetched_profiles_and_shared_params(self) -> None:
+        db = MagicMock()
+        db.navidrome_playcounts.list_user_ids.return_value = ["u1", "u2"]
+        db.navidrome_taste_profiles.get_profiles.return_value = {"u1": _stored("u1")}
+
+        with patch(f"{_WF}.generate_playlists", return_value=[{"file_ids": ["x"]}]) as gen:
+            results = _run(db)
+
+        assert set(results) == {"u1", "u2"}
+        db.navidrome_taste_profiles.get_profiles.assert_called_once_with("effnet", "lib1")
+        by_user = {call.kwargs["user_id"]: call.kwargs for call in gen.call_args_list}
+        assert by_user["u1"]["profile"]["centroid"] == [1.0, 0.0]
+        assert by_user["u2"]["profile"] is None  # seeded inside generate_playlists
+        assert by_user["u1"]["params_cache"] is by_user["u2"]["params_cache"]
+
+    def test_failed_user_does_not_stop_batch(self) -> None:
+        db = MagicMock()
+        db.navidrome_playcounts.list_user_ids.return_value = ["bad", "good"]
+        db.navidrome_taste_profiles.get_profiles.return_value = {}
+
+        def fake_generate(_db: object, **kwargs: object) -> list[dict[str, object]]:
+            if kwargs["user_id"] == "bad":
+                raise RuntimeError("boom")
+            return [{"file_ids": ["x"]}]
+
+        with patch(f"{_WF}.generate_playlists", side_effect=fake_generate):
+            results = _run(db)
+
+        assert results == {"bad": [], "good": [{"file_ids": ["x"]}]}
+
+    def test_no_users(self) -> None:
+        db = MagicMock()
+        db.navidrome_playcounts.list_user_ids.return_value = []
+
+        assert _run(db) == {}
+        db.navidrome_taste_profiles.get_profiles.assert_not_called()
@@ -53,7 +53,7 @@ class TestGeneratePlaylistsWorkflow:
         try:
             with (
                 patch(
-                    "nomarr.workflows.navidrome.generate_playlists_wf.compute_taste_profile",
+                    "nomarr.workflows.navidrome.generate_playlists_wf.get_taste_profile",
                     return_value=None,
                 ),
                 caplog.at_level(logging.WARNING, logger="nomarr.workflows.navidrome.generate_playlists_wf"),
@@ -101,7 +101,7 @@ class TestGeneratePlaylistsWorkflow:
         try:
             with (
                 patch(
-                    "nomarr.workflows.navidrome.generate_playlists_wf.compute_taste_profile",
+                    "nomarr.workflows.navidrome.generate_playlists_wf.get_taste_profile",
                     return_value=_profile(),
                 ),
                 patch.dict(
@@ -142,7 +142,7 @@ class TestGeneratePlaylistsWorkflow:
         db = _make_db()
 
         with patch(
-            "nomarr.workflows.navidrome.generate_playlists_wf.compute_taste_profile",
+            "nomarr.workflows.navidrome.generate_playlists_wf.get_taste_profile",
             return_value=None,
         ):
             result = generate_playlists(
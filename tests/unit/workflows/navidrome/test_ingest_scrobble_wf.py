@@ -0,0 +1,49 @@
+"""Unit tests for ``ingest_scrobble_wf``."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from nomarr.workflows.navidrome.ingest_scrobble_wf import ingest_scrobble
+
+_WF = "nomarr.workflows.navidrome.ingest_scrobble_wf"
+
+
+def _make_db(file_id: str | None) -> MagicMock:
+    db = MagicMock()
+    db.navidrome_playcounts.increment_play.return_value = 4
+    db.navidrome_tracks.resolve_nd_to_file.return_value = file_id
+    return db
+
+
+@pytest.mark.unit
+@pytest.mark.mocked
+class TestIngestScrobbleTasteProfile:
+    """Scrobbles fold into stored taste profiles."""
+
+    def test_resolved_play_updates_profiles(self) -> None:
+        db = _make_db("library_files/f1")
+
+        with patch(f"{_WF}.record_play", return_value=1) as record:
+            ingest_scrobble(db, "tp-user-1", "nd-1", 1_000_000)
+
+        record.assert_called_once_with(db, "tp-user-1", "library_files/f1", 4, 1_000_000)
+
+    def test_unresolved_play_skips_profiles(self) -> None:
+        db = _make_db(None)
+
+        with patch(f"{_WF}.record_play") as record:
+            ingest_scrobble(db, "tp-user-2", "nd-1", 1_000_000)
+
+        db.navidrome_playcounts.increment_play.assert_called_once()
+        record.assert_not_called()
+
+    def test_profile_failure_does_not_fail_ingest(self) -> None:
+        db = _make_db("library_files/f1")
+
+        with patch(f"{_WF}.record_play", side_effect=RuntimeError("no cold collection")):
+            ingest_scrobble(db, "tp-user-3", "nd-1", 1_000_000)
+
+        db.navidrome_playcounts.increment_play.assert_called_once()
@@ -7,8 +7,13 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from nomarr.components.navidrome.subsonic_crawl_comp import CrawledSong
-from nomarr.workflows.navidrome.sync_navidrome_wf import sync_navidrome
+from nomarr.components.navidrome.subsonic_crawl_comp import AlbumCrawlResult, CrawledSong
+from nomarr.workflows.navidrome.sync_navidrome_wf import (
+    PATH_PREFIX_META_KEY,
+    SYNC_USER_META_KEY,
+    _detect_prefix,
+    sync_navidrome,
+)
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -17,16 +22,26 @@ from nomarr.workflows.navidrome.sync_navidrome_wf import sync_navidrome
 
 def _make_db(
     path_map: dict[str, dict[str, str]] | None = None,
-    existing_track_keys: list[str] | None = None,
+    recorded_markers: dict[str, str] | None = None,
+    orphan_keys: list[str] | None = None,
+    unlinked_albums: list[str] | None = None,
+    meta: dict[str, str] | None = None,
+    totals: dict[str, int] | None = None,
 ) -> MagicMock:
-    """Create a mock Database with navidrome_tracks and navidrome_playcounts."""
+    """Create a mock Database with the Navidrome collections."""
     db = MagicMock()
     db.library_files.get_files_by_paths_bulk.return_value = path_map or {}
-    db.navidrome_tracks.bulk_upsert_tracks.return_value = 0
+    db.navidrome_tracks.bulk_upsert_tracks.side_effect = len
     db.navidrome_tracks.bulk_ensure_file_links.return_value = None
-    db.navidrome_tracks.get_all_track_keys.return_value = existing_track_keys or []
-    db.navidrome_tracks.delete_tracks_cascade.return_value = 0
-    db.navidrome_playcounts.bulk_upsert_plays.return_value = 0
+    db.navidrome_tracks.delete_tracks_cascade.side_effect = len
+    db.navidrome_playcounts.bulk_upsert_plays.side_effect = lambda _user, plays: len(plays)
+    db.navidrome_playcounts.replace_plays_for_tracks.side_effect = lambda _user, _ids, plays: len(plays)
+    db.navidrome_albums.get_markers.return_value = recorded_markers or {}
+    db.navidrome_albums.get_orphan_track_keys.return_value = orphan_keys or []
+    db.navidrome_albums.clear_unlinked_markers.return_value = unlinked_albums or []
+    db.navidrome_albums.get_totals.return_value = totals or {"songs": 0, "resolved": 0}
+    stored_meta = dict(meta or {})
+    db.meta.get.side_effect = stored_meta.get
     return db
 
 
@@ -40,10 +55,20 @@ def _song(nd_id: str, path: str, play_count: int = 0, last_played_ms: int = 0) -
     )
 
 
-_CRAWL_PATH = "nomarr.workflows.navidrome.sync_navidrome_wf.crawl_navidrome_songs"
+def _crawl(fetched: dict[str, list[CrawledSong]], unchanged: list[str] | None = None) -> AlbumCrawlResult:
+    """Crawl result with *fetched* albums (marker ``m-<id>``) and *unchanged* album IDs."""
+    markers = {album_id: f"m-{album_id}" for album_id in [*fetched, *(unchanged or [])]}
+    return AlbumCrawlResult(markers=markers, songs_by_album=fetched)
+
+
+_CRAWL_PATH = "nomarr.workflows.navidrome.sync_navidrome_wf.crawl_navidrome_albums"
 _DETECT_PREFIX = "nomarr.workflows.navidrome.sync_navidrome_wf._detect_prefix"
 
 
+def _album_docs(db: MagicMock) -> dict[str, dict[str, Any]]:
+    return {doc["_key"]: doc for call in db.navidrome_albums.bulk_upsert_albums.call_args_list for doc in call.args[0]}
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -51,28 +76,29 @@ _DETECT_PREFIX = "nomarr.workflows.navidrome.sync_navidrome_wf._detect_prefix"
 
 @pytest.mark.unit
 class TestSyncNavidrome:
-    """Tests for the sync_navidrome workflow."""
+    """Tests for the sync_navidrome workflow (first / full sync)."""
 
     def test_full_sync_with_play_counts(self) -> None:
         """All songs resolve, play counts are captured."""
-        songs = [
-            _song("nd-1", "/nd/t1.mp3", play_count=5, last_played_ms=1000),
-            _song("nd-2", "/nd/t2.mp3", play_count=0),
-        ]
+        crawl = _crawl(
+            {
+                "al-1": [
+                    _song("nd-1", "/nd/t1.mp3", play_count=5, last_played_ms=1000),
+                    _song("nd-2", "/nd/t2.mp3", play_count=0),
+                ]
+            }
+        )
         db = _make_db(
             path_map={
                 "/t1.mp3": {"_id": "library_files/f1"},
                 "/t2.mp3": {"_id": "library_files/f2"},
             },
-            existing_track_keys=["nd-1", "nd-2"],
+            totals={"songs": 2, "resolved": 2},
         )
-        db.navidrome_tracks.bulk_upsert_tracks.return_value = 2
-        db.navidrome_playcounts.bulk_upsert_plays.return_value = 1
-
         client = MagicMock()
 
         with (
-            patch(_CRAWL_PATH, return_value=songs),
+            patch(_CRAWL_PATH, return_value=crawl) as crawl_mock,
             patch(_DETECT_PREFIX, return_value="/nd"),
         ):
             result = sync_navidrome(client, db, "user-1")
@@ -84,44 +110,52 @@ class TestSyncNavidrome:
         assert result["tracks_upserted"] == 2
         assert result["play_edges_upserted"] == 1
         assert result["orphans_removed"] == 0
+        assert result["albums_fetched"] == 1
+        assert result["albums_unchanged"] == 0
         assert result["duration_ms"] >= 0
 
+        assert crawl_mock.call_args.args[1] is None  # nothing recorded: fetch every album
         db.navidrome_playcounts.bulk_upsert_plays.assert_called_once()
-
-    def test_unresolved_songs_counted(self) -> None:
-        """Songs that don't resolve to Nomarr files are counted."""
-        songs = [
-            _song("nd-1", "/nd/t1.mp3"),
-            _song("nd-2", "/nd/unknown.mp3"),
-        ]
-        db = _make_db(
-            path_map={"/t1.mp3": {"_id": "library_files/f1"}},
-            existing_track_keys=[],
-        )
-        db.navidrome_tracks.bulk_upsert_tracks.return_value = 2
-        client = MagicMock()
+        db.navidrome_playcounts.replace_plays_for_tracks.assert_not_called()
+        db.navidrome_taste_profiles.delete_user_profiles.assert_called_once_with("user-1")
+        assert _album_docs(db)["al-1"] == {
+            "_key": "al-1",
+            "marker": "m-al-1",
+            "song_ids": ["nd-1", "nd-2"],
+            "resolved": 2,
+        }
+        db.meta.set.assert_any_call(SYNC_USER_META_KEY, "user-1")
+        db.meta.set.assert_any_call(PATH_PREFIX_META_KEY, "/nd")
+
+    def test_unresolved_album_keeps_empty_marker(self) -> None:
+        """Albums with unresolved songs are recorded with an empty marker so they are re-fetched."""
+        crawl = _crawl({"al-1": [_song("nd-1", "/nd/t1.mp3"), _song("nd-2", "/nd/unknown.mp3")]})
+        db = _make_db(path_map={"/t1.mp3": {"_id": "library_files/f1"}}, totals={"songs": 2, "resolved": 1})
 
         with (
-            patch(_CRAWL_PATH, return_value=songs),
+            patch(_CRAWL_PATH, return_value=crawl),
             patch(_DETECT_PREFIX, return_value="/nd"),
         ):
-            result = sync_navidrome(client, db, "user-1")
+            result = sync_navidrome(MagicMock(), db, "user-1")
 
         assert result["total_songs"] == 2
         assert result["resolved"] == 1
         assert result["unresolved"] == 1
+        doc = _album_docs(db)["al-1"]
+        assert doc["marker"] == ""
+        assert doc["resolved"] == 1
 
     def test_empty_library(self) -> None:
-        """No songs returns zero-filled result."""
-        db = _make_db(existing_track_keys=[])
-        client = MagicMock()
+        """No songs returns zero-filled result without prefix detection."""
+        db = _make_db()
 
         with (
-            patch(_CRAWL_PATH, return_value=[]),
-            patch(_DETECT_PREFIX, return_value=""),
+            patch(_CRAWL_PATH, return_value=_crawl({})),
+            patch(_DETECT_PREFIX) as detect,
         ):
-            result = sync_navidrome(client, db, "user-1")
+            result = sync_navidrome(MagicMock(), db, "user-1")
 
+        detect.assert_not_called()
         assert result["total_songs"] == 0
         assert result["resolved"] == 0
         assert result["tracks_upserted"] == 0
@@ -129,73 +163,199 @@ class TestSyncNavidrome:
         assert result["orphans_removed"] == 0
 
     def test_orphan_cleanup(self) -> None:
-        """Tracks in DB but not in Navidrome are removed."""
-        songs = [_song("nd-1", "/nd/t1.mp3")]
+        """Tracks no recorded album lists are removed."""
         db = _make_db(
             path_map={"/t1.mp3": {"_id": "library_files/f1"}},
-            existing_track_keys=["nd-1", "nd-orphan-1", "nd-orphan-2"],
+            orphan_keys=["nd-orphan-1", "nd-orphan-2"],
         )
-        db.navidrome_tracks.bulk_upsert_tracks.return_value = 1
-        db.navidrome_tracks.delete_tracks_cascade.return_value = 2
-        client = MagicMock()
 
         with (
-            patch(_CRAWL_PATH, return_value=songs),
+            patch(_CRAWL_PATH, return_value=_crawl({"al-1": [_song("nd-1", "/nd/t1.mp3")]})),
             patch(_DETECT_PREFIX, return_value="/nd"),
         ):
-            result = sync_navidrome(client, db, "user-1")
+            result = sync_navidrome(MagicMock(), db, "user-1")
 
         assert result["orphans_removed"] == 2
-        db.navidrome_tracks.delete_tracks_cascade.assert_called_once_with(
-            ["nd-orphan-1", "nd-orphan-2"],
-        )
+        db.navidrome_tracks.delete_tracks_cascade.assert_called_once_with(["nd-orphan-1", "nd-orphan-2"])
+        db.navidrome_tracks.get_all_track_keys.assert_not_called()
 
     def test_no_orphan_deletion_when_empty(self) -> None:
         """delete_tracks_cascade is not called when there are no orphans."""
-        songs = [_song("nd-1", "/nd/t1.mp3")]
-        db = _make_db(
-            path_map={"/t1.mp3": {"_id": "library_files/f1"}},
-            existing_track_keys=["nd-1"],
-        )
-        db.navidrome_tracks.bulk_upsert_tracks.return_value = 1
-        client = MagicMock()
+        db = _make_db(path_map={"/t1.mp3": {"_id": "library_files/f1"}})
 
         with (
-            patch(_CRAWL_PATH, return_value=songs),
+            patch(_CRAWL_PATH, return_value=_crawl({"al-1": [_song("nd-1", "/nd/t1.mp3")]})),
             patch(_DETECT_PREFIX, return_value="/nd"),
         ):
-            result = sync_navidrome(client, db, "user-1")
+            result = sync_navidrome(MagicMock(), db, "user-1")
 
         assert result["orphans_removed"] == 0
         db.navidrome_tracks.delete_tracks_cascade.assert_not_called()
 
     def test_play_edges_only_for_nonzero_counts(self) -> None:
         """Only songs with play_count > 0 produce play edges."""
-        songs = [
-            _song("nd-1", "/nd/t1.mp3", play_count=3, last_played_ms=9000),
-            _song("nd-2", "/nd/t2.mp3", play_count=0),
-            _song("nd-3", "/nd/t3.mp3", play_count=1, last_played_ms=5000),
-        ]
+        crawl = _crawl(
+            {
+                "al-1": [
+                    _song("nd-1", "/nd/t1.mp3", play_count=3, last_played_ms=9000),
+                    _song("nd-2", "/nd/t2.mp3", play_count=0),
+                ],
+                "al-2": [_song("nd-3", "/nd/t3.mp3", play_count=1, last_played_ms=5000)],
+            }
+        )
         db = _make_db(
             path_map={
                 "/t1.mp3": {"_id": "library_files/f1"},
                 "/t2.mp3": {"_id": "library_files/f2"},
                 "/t3.mp3": {"_id": "library_files/f3"},
             },
-            existing_track_keys=[],
         )
-        db.navidrome_tracks.bulk_upsert_tracks.return_value = 3
-        db.navidrome_playcounts.bulk_upsert_plays.return_value = 2
-        client = MagicMock()
 
         with (
-            patch(_CRAWL_PATH, return_value=songs),
+            patch(_CRAWL_PATH, return_value=crawl),
             patch(_DETECT_PREFIX, return_value="/nd"),
         ):
-            result = sync_navidrome(client, db, "user-1")
+            result = sync_navidrome(MagicMock(), db, "user-1")
 
         assert result["play_edges_upserted"] == 2
         # bulk_upsert_plays(user_id, plays) — plays is the second positional arg
         call_args: list[dict[str, Any]] = db.navidrome_playcounts.bulk_upsert_plays.call_args[0][1]
         nd_ids_with_plays = [e["nd_id"] for e in call_args]
         assert nd_ids_with_plays == ["nd-1", "nd-3"]
+
+
+@pytest.mark.unit
+class TestDeltaSync:
+    """Repeat syncs touch only new or changed albums."""
+
+    def test_unchanged_library_writes_nothing(self) -> None:
+        db = _make_db(
+            recorded_markers={"al-1": "m-al-1", "al-2": "m-al-2"},
+            meta={SYNC_USER_META_KEY: "user-1"},
+            totals={"songs": 20, "resolved": 20},
+        )
+
+        with (
+            patch(_CRAWL_PATH, return_value=_crawl({}, unchanged=["al-1", "al-2"])) as crawl_mock,
+            patch(_DETECT_PREFIX) as detect,
+        ):
+            result = sync_navidrome(MagicMock(), db, "user-1")
+
+        assert crawl_mock.call_args.args[1] == {"al-1": "m-al-1", "al-2": "m-al-2"}
+        detect.assert_not_called()
+        db.navidrome_tracks.bulk_upsert_tracks.assert_not_called()
+        db.navidrome_playcounts.bulk_upsert_plays.assert_not_called()
+        db.navidrome_taste_profiles.delete_user_profiles.assert_not_called()
+        db.navidrome_albums.bulk_upsert_albums.assert_not_called()
+        assert result["albums_fetched"] == 0
+        assert result["albums_unchanged"] == 2
+        assert result["total_songs"] == 20
+        assert result["resolved"] == 20
+
+    def test_changed_album_replaces_only_its_plays(self) -> None:
+        crawl = _crawl({"al-2": [_song("nd-5", "/nd/t5.mp3", play_count=4, last_played_ms=7)]}, unchanged=["al-1"])
+        db = _make_db(
+            path_map={"/t5.mp3": {"_id": "library_files/f5"}},
+            recorded_markers={"al-1": "m-al-1", "al-2": "old"},
+            meta={SYNC_USER_META_KEY: "user-1"},
+        )
+
+        with (
+            patch(_CRAWL_PATH, return_value=crawl),
+            patch(_DETECT_PREFIX, return_value="/nd"),
+        ):
+            result = sync_navidrome(MagicMock(), db, "user-1")
+
+        db.navidrome_playcounts.bulk_upsert_plays.assert_not_called()
+        db.navidrome_playcounts.replace_plays_for_tracks.assert_called_once_with(
+            "user-1", ["nd-5"], [{"nd_id": "nd-5", "playcount": 4, "last_played": 7}]
+        )
+        db.navidrome_tracks.bulk_upsert_tracks.assert_called_once_with(["nd-5"])
+        db.navidrome_taste_profiles.delete_user_profiles.assert_called_once_with("user-1")
+        assert list(_album_docs(db)) == ["al-2"]
+        assert result["albums_fetched"] == 1
+        assert result["albums_unchanged"] == 1
+
+    def test_removed_album_record_is_deleted(self) -> None:
+        db = _make_db(
+            recorded_markers={"al-1": "m-al-1", "al-gone": "m-al-gone"},
+            meta={SYNC_USER_META_KEY: "user-1"},
+            orphan_keys=["nd-9"],
+        )
+
+        with patch(_CRAWL_PATH, return_value=_crawl({}, unchanged=["al-1"])):
+            result = sync_navidrome(MagicMock(), db, "user-1")
+
+        db.navidrome_albums.delete_albums.assert_called_once_with(["al-gone"])
+        db.navidrome_tracks.delete_tracks_cascade.assert_called_once_with(["nd-9"])
+        assert result["orphans_removed"] == 1
+
+    def test_rescanned_file_is_relinked(self) -> None:
+        """A linked file removed and rescanned under a new _id is re-linked by the next delta sync."""
+        album = {"al-1": [_song("nd-1", "/nd/t1.mp3")]}
+
+        def crawl(_client: object, recorded: dict[str, str] | None) -> AlbumCrawlResult:
+            # Navidrome's marker never changes; only a cleared recorded marker triggers a fetch
+            if recorded is not None and recorded.get("al-1") == "m-al-1":
+                return _crawl({}, unchanged=["al-1"])
+            return _crawl(album)
+
+        first = _make_db(path_map={"/t1.mp3": {"_id": "library_files/f1"}})
+        with patch(_CRAWL_PATH, side_effect=crawl), patch(_DETECT_PREFIX, return_value="/nd"):
+            sync_navidrome(MagicMock(), first, "user-1")
+        recorded = {key: doc["marker"] for key, doc in _album_docs(first).items()}
+        assert recorded == {"al-1": "m-al-1"}
+
+        # The file was deleted and rescanned: its has_nd_id target is gone
+        db = _make_db(
+            path_map={"/t1.mp3": {"_id": "library_files/f1-rescanned"}},
+            recorded_markers=recorded,
+            unlinked_albums=["al-1"],
+            meta={SYNC_USER_META_KEY: "user-1"},
+        )
+        with patch(_CRAWL_PATH, side_effect=crawl) as crawl_mock, patch(_DETECT_PREFIX, return_value="/nd"):
+            result = sync_navidrome(MagicMock(), db, "user-1")
+
+        db.navidrome_albums.clear_unlinked_markers.assert_called_once_with()
+        assert crawl_mock.call_args.args[1] == {"al-1": ""}
+        db.navidrome_tracks.prune_dead_file_links.assert_called_once_with(["nd-1"])
+        db.navidrome_tracks.bulk_ensure_file_links.assert_called_once_with(
+            [{"nd_id": "nd-1", "file_id": "library_files/f1-rescanned"}]
+        )
+        assert _album_docs(db)["al-1"]["marker"] == "m-al-1"
+        assert result["albums_fetched"] == 1
+
+    def test_full_sync_skips_unlinked_check(self) -> None:
+        db = _make_db(recorded_markers={"al-1": "m-al-1"}, meta={SYNC_USER_META_KEY: "user-1"})
+
+        with patch(_CRAWL_PATH, return_value=_crawl({})):
+            sync_navidrome(MagicMock(), db, "user-1", full=True)
+
+        db.navidrome_albums.clear_unlinked_markers.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("meta", "full"),
+        [({SYNC_USER_META_KEY: "someone-else"}, False), ({SYNC_USER_META_KEY: "user-1"}, True)],
+    )
+    def test_other_user_or_full_fetches_everything(self, meta: dict[str, str], full: bool) -> None:
+        db = _make_db(recorded_markers={"al-1": "m-al-1"}, meta=meta)
+
+        with patch(_CRAWL_PATH, return_value=_crawl({})) as crawl_mock:
+            sync_navidrome(MagicMock(), db, "user-1", full=full)
+
+        assert crawl_mock.call_args.args[1] is None
+        db.navidrome_taste_profiles.delete_user_profiles.assert_called_once_with("user-1")
+
+
+@pytest.mark.unit
+class TestDetectPrefix:
+    def test_falls_back_to_recorded_prefix(self) -> None:
+        db = MagicMock()
+        db.library_files.detect_nd_path_prefix.return_value = None
+        assert _detect_prefix([_song("nd-1", "/music/new.flac")], db, fallback="/music") == "/music"
+
+    def test_raises_without_fallback(self) -> None:
+        db = MagicMock()
+        db.library_files.detect_nd_path_prefix.return_value = None
+        with pytest.raises(ValueError, match="Could not detect path prefix"):
+            _detect_prefix([_song("nd-1", "/music/new.flac")], db)
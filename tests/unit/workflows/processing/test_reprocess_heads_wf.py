@@ -0,0 +1,94 @@
+"""Unit tests for reprocess_heads_wf — head-only suite change detection."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from nomarr.workflows.processing.reprocess_heads_wf import (
+    PENDING_HEADS_META_KEY,
+    detect_head_changes_workflow,
+)
+
+_HEAD = "effnet/heads/classifier/mood_happy.onnx"
+
+
+def _write(models_dir: Path, rel_path: str, size: int) -> None:
+    path = models_dir / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"\0" * size)
+
+
+def _db(stale_files: int = 0) -> MagicMock:
+    """Mock database whose ``meta`` behaves like a key-value store."""
+    store: dict[str, str] = {}
+    db = MagicMock()
+    db.meta.get.side_effect = store.get
+    db.meta.set.side_effect = store.__setitem__
+    db.meta.delete.side_effect = lambda key: store.pop(key, None)
+    db.file_states.count_heads_stale_files.return_value = stale_files
+    db.file_states.bulk_set_heads_stale.return_value = 5
+    db.store = store
+    return db
+
+
+@pytest.fixture
+def models_dir(tmp_path: Path) -> Path:
+    _write(tmp_path, "effnet/embeddings/effnet.onnx", 100)
+    _write(tmp_path, _HEAD, 10)
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestDetectHeadChangesWorkflow:
+    """Tests for detect_head_changes_workflow()."""
+
+    def test_first_run_only_records_manifest(self, models_dir: Path) -> None:
+        db = _db()
+
+        assert detect_head_changes_workflow(db, str(models_dir), reuse_embeddings=True) is None
+        db.file_states.bulk_set_heads_stale.assert_not_called()
+        assert "ml_suite_manifest" in db.store
+
+    def test_head_change_flags_files(self, models_dir: Path) -> None:
+        db = _db()
+        detect_head_changes_workflow(db, str(models_dir), reuse_embeddings=True)
+        _write(models_dir, "effnet/heads/classifier/genre.onnx", 10)
+
+        delta = detect_head_changes_workflow(db, str(models_dir), reuse_embeddings=True)
+
+        assert delta is not None
+        assert delta.changed_heads == ["effnet/heads/classifier/genre.onnx"]
+        assert json.loads(db.store[PENDING_HEADS_META_KEY]) == ["effnet/heads/classifier/genre.onnx"]
+        db.file_states.bulk_set_heads_stale.assert_called_once()
+
+    def test_pending_heads_accumulate_while_files_are_stale(self, models_dir: Path) -> None:
+        db = _db(stale_files=3)
+        detect_head_changes_workflow(db, str(models_dir), reuse_embeddings=True)
+        db.store[PENDING_HEADS_META_KEY] = json.dumps(["effnet/heads/classifier/genre.onnx"])
+        _write(models_dir, _HEAD, 11)
+
+        detect_head_changes_workflow(db, str(models_dir), reuse_embeddings=True)
+
+        assert json.loads(db.store[PENDING_HEADS_META_KEY]) == ["effnet/heads/classifier/genre.onnx", _HEAD]
+
+    def test_without_stored_embeddings_files_are_not_flagged(self, models_dir: Path) -> None:
+        db = _db()
+        detect_head_changes_workflow(db, str(models_dir), reuse_embeddings=False)
+        _write(models_dir, _HEAD, 11)
+
+        assert detect_head_changes_workflow(db, str(models_dir), reuse_embeddings=False) is None
+        db.file_states.bulk_set_heads_stale.assert_not_called()
+
+    def test_backbone_change_clears_pending_heads(self, models_dir: Path) -> None:
+        db = _db()
+        detect_head_changes_workflow(db, str(models_dir), reuse_embeddings=True)
+        db.store[PENDING_HEADS_META_KEY] = json.dumps([_HEAD])
+        _write(models_dir, "effnet/embeddings/effnet.onnx", 101)
+
+        assert detect_head_changes_workflow(db, str(models_dir), reuse_embeddings=True) is None
+        assert PENDING_HEADS_META_KEY not in db.store
+        db.file_states.bulk_set_heads_stale.assert_not_called()